@@ -82,6 +82,7 @@ FEATURE_FLAGS: dict[str, bool] = {
     "mesh_converter_adaptive_tolerance": True,
     "detailed_boolean_history": True,
     "helix_fitting_enabled": True,
+    "cosmetic_threads": True,  # Gewinde als Annotation, echte Geometrie erst beim Export
 
     # ========================================================================
     # Solver Configuration
@@ -123,6 +124,7 @@ FEATURE_SETTINGS: dict[str, Any] = {
     "solver_backend": "staged",
     "sketch_solver_throttle_ms": 16,
     "preview_debounce_ms": 150,
+    "boolean_result_cache_mb": 128,  # Boolean-Ergebnis-Memo, 0 = aus
 }
 
 
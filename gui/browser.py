@@ -5,6 +5,9 @@ Collapsible tree with Origin planes, Components, Sketches, Bodies
 Phase 3 Assembly: Unterstützt hierarchische Component-Struktur
 """
 
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple, Optional
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QTreeWidget, QTreeWidgetItem, QMenu, QSizePolicy,
@@ -174,6 +177,36 @@ def _format_feature_status_tooltip(status_msg: str, status: str = "", status_det
     return "\n".join(lines)
 
 
+def _is_problem_feature(feature) -> bool:
+    """Feature hat ERROR/WARNING-Status oder eine Problem-Klasse im Error-Envelope."""
+    status = str(getattr(feature, 'status', 'OK') or 'OK')
+    details = _safe_details(getattr(feature, 'status_details', None))
+    status_class = str(details.get('status_class', '') or '')
+    severity = str(details.get('severity', '') or '')
+
+    return status in ('ERROR', 'WARNING') or \
+           status_class in ('ERROR', 'WARNING_RECOVERABLE', 'BLOCKED', 'CRITICAL') or \
+           severity in ('error', 'warning', 'blocked', 'critical')
+
+
+# Item-Rollen für den inkrementellen Tree-Abgleich (Qt.UserRole trägt die Nutzdaten)
+_ROW_STATE_ROLE = Qt.UserRole + 1  # (key, signatur)
+
+
+class _BrowserRow(NamedTuple):
+    """Soll-Zustand einer Tree-Zeile; `key` identifiziert das Item über Refreshes."""
+    key: tuple
+    text: str
+    color: str
+    data: object = None
+    children: tuple = ()
+    bold: bool = False
+    strike: bool = False
+    tooltip: str = ""
+    expanded: Optional[bool] = None
+    problem: bool = False
+
+
 class DraggableTreeWidget(QTreeWidget):
     """
     QTreeWidget mit Drag & Drop Support für Bodies/Sketches zwischen Components.
@@ -222,8 +255,35 @@ class DraggableTreeWidget(QTreeWidget):
         self._visible_items = []  # Cache für sichtbare Items (für Navigation)
         self._current_visible_index = -1
 
-        # W21: Status-Badges für Problemfeatures
-        self._problem_items_cache = {}  # item -> status_class
+        # Item-Index (vom ProjectBrowser nach jedem Abgleich gesetzt):
+        # Pre-Order-Position aller Items + Problem-Items in Baum-Reihenfolge
+        self._item_order = None
+        self._problem_items = []
+        self._problem_positions = []
+
+    def clear(self):
+        self._item_order = None
+        self._problem_items = []
+        self._problem_positions = []
+        super().clear()
+
+    def set_item_index(self, order: list, problems: list):
+        """
+        Setzt den Item-Index für O(1)/O(log n) Problem-Navigation.
+
+        Args:
+            order: Alle Items in Baum-Reihenfolge (Pre-Order)
+            problems: Problem-Items in Baum-Reihenfolge
+        """
+        self._item_order = {item: pos for pos, item in enumerate(order)}
+        self._problem_items = list(problems)
+        self._problem_positions = [self._item_order[item] for item in self._problem_items]
+
+    def _ensure_item_index(self):
+        """Baut den Index per Tree-Walk, falls die Items nicht vom Browser stammen."""
+        if self._item_order is None:
+            items = self._get_all_items()
+            self.set_item_index(items, [item for item in items if self._is_problem_item(item)])
 
     def set_filter_mode(self, mode: str):
         """
@@ -349,54 +409,30 @@ class DraggableTreeWidget(QTreeWidget):
 
     def navigate_to_next_problem(self):
         """W21: Navigiert zum nächsten Problem-Item."""
-        items = self._get_all_items()
-        current = self.currentItem()
-        found_current = False
-
-        for item in items:
-            if item.isHidden():
-                continue
-            if found_current:
-                if self._is_problem_item(item):
-                    self.setCurrentItem(item)
-                    self.scrollToItem(item)
-                    return
-            elif item == current:
-                found_current = True
-
-        # Wrap around - von vorne beginnen
-        for item in items:
-            if item.isHidden():
-                continue
-            if self._is_problem_item(item):
-                self.setCurrentItem(item)
-                self.scrollToItem(item)
-                return
+        self._step_problem(1)
 
     def navigate_to_prev_problem(self):
         """W21: Navigiert zum vorherigen Problem-Item."""
-        items = self._get_all_items()
-        current = self.currentItem()
-        found_current = False
-        prev_problem = None
+        self._step_problem(-1)
 
-        for item in reversed(items):
-            if item.isHidden():
-                continue
-            if item == current:
-                found_current = True
-                if prev_problem:
-                    self.setCurrentItem(prev_problem)
-                    self.scrollToItem(prev_problem)
-                    return
-            elif not found_current and self._is_problem_item(item):
-                prev_problem = item
-
-        # Wrap around
-        for item in reversed(items):
-            if item.isHidden():
-                continue
-            if self._is_problem_item(item):
+    def _step_problem(self, step: int):
+        """Nächstes/vorheriges sichtbares Problem-Item ab currentItem (mit Wrap-around)."""
+        self._ensure_item_index()
+        problems = self._problem_items
+        if not problems:
+            return
+
+        pos = self._item_order.get(self.currentItem())
+        if pos is None:
+            start = 0 if step > 0 else len(problems) - 1
+        elif step > 0:
+            start = bisect_right(self._problem_positions, pos)
+        else:
+            start = bisect_left(self._problem_positions, pos) - 1
+
+        for k in range(len(problems)):
+            item = problems[(start + k * step) % len(problems)]
+            if not item.isHidden():
                 self.setCurrentItem(item)
                 self.scrollToItem(item)
                 return
@@ -427,21 +463,8 @@ class DraggableTreeWidget(QTreeWidget):
         if not data or len(data) < 2:
             return False
 
-        item_type = data[0]
-
         # Nur Features haben Status
-        if item_type == 'feature':
-            feature = data[1]
-            status = str(getattr(feature, 'status', 'OK') or 'OK')
-            details = _safe_details(getattr(feature, 'status_details', None))
-            status_class = str(details.get('status_class', '') or '')
-            severity = str(details.get('severity', '') or '')
-
-            return status in ('ERROR', 'WARNING') or \
-                   status_class in ('ERROR', 'WARNING_RECOVERABLE', 'BLOCKED', 'CRITICAL') or \
-                   severity in ('error', 'warning', 'blocked', 'critical')
-
-        return False
+        return data[0] == 'feature' and _is_problem_feature(data[1])
 
     def _get_problem_priority(self, item: QTreeWidgetItem) -> int:
         """
@@ -477,82 +500,48 @@ class DraggableTreeWidget(QTreeWidget):
         else:
             return 4
 
-    def navigate_to_next_critical_problem(self):
-        """W26: Navigiert zum nächsten kritischen Problem (CRITICAL > BLOCKED > ERROR > WARNING)."""
-        items = self._get_all_items()
-        current = self.currentItem()
-        found_current = False
-
-        # Sammle alle Problem-Items mit ihrer Priorität
+    def _visible_problems_by_priority(self) -> list:
+        """Sichtbare Problem-Items, stabil nach Priorität sortiert (Baum-Reihenfolge je Stufe)."""
+        self._ensure_item_index()
         problem_items = []
-        for item in items:
+        for item in self._problem_items:
             if item.isHidden():
                 continue
             priority = self._get_problem_priority(item)
             if priority < 999:
                 problem_items.append((item, priority))
+        problem_items.sort(key=lambda x: x[1])
+        return [item for item, _ in problem_items]
 
+    def _step_critical_problem(self, step: int):
+        problem_items = self._visible_problems_by_priority()
         if not problem_items:
             return
 
-        # Sortiere nach Priorität (niedrigste zuerst)
-        problem_items.sort(key=lambda x: x[1])
-
-        # Finde aktuelle Position
+        current = self.currentItem()
         current_idx = -1
-        for idx, (item, _) in enumerate(problem_items):
+        for idx, item in enumerate(problem_items):
             if item == current:
                 current_idx = idx
                 break
 
-        # Nächstes Item (Wrap-around)
-        next_idx = (current_idx + 1) % len(problem_items)
-        next_item = problem_items[next_idx][0]
+        # Wrap-around
+        target = problem_items[(current_idx + step) % len(problem_items)]
+        self.setCurrentItem(target)
+        self.scrollToItem(target)
 
-        self.setCurrentItem(next_item)
-        self.scrollToItem(next_item)
+    def navigate_to_next_critical_problem(self):
+        """W26: Navigiert zum nächsten kritischen Problem (CRITICAL > BLOCKED > ERROR > WARNING)."""
+        self._step_critical_problem(1)
 
     def navigate_to_prev_critical_problem(self):
         """W26: Navigiert zum vorherigen kritischen Problem."""
-        items = self._get_all_items()
-        current = self.currentItem()
-
-        problem_items = []
-        for item in items:
-            if item.isHidden():
-                continue
-            priority = self._get_problem_priority(item)
-            if priority < 999:
-                problem_items.append((item, priority))
-
-        if not problem_items:
-            return
-
-        # Sortiere nach Priorität
-        problem_items.sort(key=lambda x: x[1])
-
-        # Finde aktuelle Position
-        current_idx = -1
-        for idx, (item, _) in enumerate(problem_items):
-            if item == current:
-                current_idx = idx
-                break
-
-        # Vorheriges Item (Wrap-around)
-        prev_idx = (current_idx - 1) % len(problem_items)
-        prev_item = problem_items[prev_idx][0]
-
-        self.setCurrentItem(prev_item)
-        self.scrollToItem(prev_item)
+        self._step_critical_problem(-1)
 
     def select_all_problem_items(self):
         """W26: Selektiert alle Problem-Features (Multi-Select)."""
-        items = self._get_all_items()
-        problem_items = []
-
-        for item in items:
-            if not item.isHidden() and self._is_problem_item(item):
-                problem_items.append(item)
+        self._ensure_item_index()
+        problem_items = [item for item in self._problem_items if not item.isHidden()]
 
         if problem_items:
             self.clearSelection()
@@ -975,74 +964,104 @@ class ProjectBrowser(QFrame):
                     self.body_visibility[b.id] = True
         self.refresh()
     
-    def refresh(self):
-        self.tree.clear()
-        if not self.document:
-            return
-        
-        # Root: Document
-        root = QTreeWidgetItem(self.tree, [f"{self.document.name}"])
-        root.setExpanded(True)
-        root.setForeground(0, QColor("#ddd"))
-        
-        # Origin (Standard-Ebenen) - eingeklappt
-        origin = QTreeWidgetItem(root, ["◎ Origin"])
-        origin.setExpanded(False)
-        origin.setForeground(0, QColor("#666"))
-        
-        planes = [
-            ("XY Plane (Top)", "xy", "#5588dd"),
-            ("XZ Plane (Front)", "xz", "#55dd88"),
-            ("YZ Plane (Right)", "yz", "#dd8855"),
+    def _sync_rows(self, parent: QTreeWidgetItem, rows, order: list, problems: list):
+        """
+        Gleicht die Kinder von `parent` inkrementell mit `rows` ab.
+
+        Items werden über ihren Row-Key wiederverwendet; nur neue Zeilen
+        werden eingefügt, entfernte gelöscht und geänderte neu gestylt.
+        Selektion, Aufklapp-Zustand und Scroll-Position bleiben dabei erhalten.
+        `order`/`problems` sammeln den Item-Index (Pre-Order) für die Navigation.
+        """
+        wanted = {row.key for row in rows}
+        for i in reversed(range(parent.childCount())):
+            if parent.child(i).data(0, _ROW_STATE_ROLE)[0] not in wanted:
+                parent.takeChild(i)
+
+        for pos, row in enumerate(rows):
+            item = parent.child(pos) if pos < parent.childCount() else None
+            state = item.data(0, _ROW_STATE_ROLE) if item is not None else None
+            if state is None or state[0] != row.key:
+                item = state = None
+                for i in range(pos + 1, parent.childCount()):
+                    if parent.child(i).data(0, _ROW_STATE_ROLE)[0] == row.key:
+                        item = parent.takeChild(i)
+                        parent.insertChild(pos, item)
+                        state = item.data(0, _ROW_STATE_ROLE)
+                        break
+            if item is None:
+                if pos == parent.childCount():
+                    item = QTreeWidgetItem(parent, [row.text])
+                else:
+                    item = QTreeWidgetItem([row.text])
+                    parent.insertChild(pos, item)
+                if row.data is not None:
+                    item.setData(0, Qt.UserRole, row.data)
+                if row.expanded is not None:
+                    item.setExpanded(row.expanded)
+
+            sig = (row.text, row.color, row.bold, row.strike, row.tooltip)
+            old_sig = state[1] if state is not None else None
+            if old_sig != sig:
+                if old_sig is not None and old_sig[0] != row.text:
+                    item.setText(0, row.text)
+                item.setForeground(0, QColor(row.color))
+                if row.bold or row.strike or (old_sig and (old_sig[2] or old_sig[3])):
+                    font = item.font(0)
+                    font.setBold(row.bold)
+                    font.setStrikeOut(row.strike)
+                    item.setFont(0, font)
+                if row.tooltip or (old_sig and old_sig[4]):
+                    item.setToolTip(0, row.tooltip)
+                # Key + Signatur in einer Rolle: jedes eigene Item hat sie gesetzt,
+                # data() wird nie auf leere Rollen aufgerufen (liefert sonst None)
+                item.setData(0, _ROW_STATE_ROLE, (row.key, sig))
+
+            order.append(item)
+            if row.problem:
+                problems.append(item)
+            if row.children or item.childCount():
+                self._sync_rows(item, row.children, order, problems)
+
+    def _origin_rows(self) -> tuple:
+        """Standard-Ebenen, Achsen und Construction Planes unter 'Origin'."""
+        rows = [
+            _BrowserRow(('plane', plane_id), f"▬ {name}", color, ('plane', plane_id))
+            for name, plane_id, color in (
+                ("XY Plane (Top)", "xy", "#5588dd"),
+                ("XZ Plane (Front)", "xz", "#55dd88"),
+                ("YZ Plane (Right)", "yz", "#dd8855"),
+            )
+        ]
+        rows += [
+            _BrowserRow(('axis', axis_id), f"→ {name}", color, ('axis', axis_id))
+            for name, axis_id, color in (
+                ("X Axis", "x", "#dd5555"), ("Y Axis", "y", "#55dd55"), ("Z Axis", "z", "#5555dd"),
+            )
         ]
-        for name, plane_id, color in planes:
-            item = QTreeWidgetItem(origin, [f"▬ {name}"])
-            item.setData(0, Qt.UserRole, ('plane', plane_id))
-            item.setForeground(0, QColor(color))
-        
-        axes = [("X Axis", "x", "#dd5555"), ("Y Axis", "y", "#55dd55"), ("Z Axis", "z", "#5555dd")]
-        for name, axis_id, color in axes:
-            item = QTreeWidgetItem(origin, [f"→ {name}"])
-            item.setData(0, Qt.UserRole, ('axis', axis_id))
-            item.setForeground(0, QColor(color))
 
         # Construction Planes (Offset Planes)
         if hasattr(self.document, 'planes') and self.document.planes:
             for cp in self.document.planes:
                 vis = self.plane_visibility.get(cp.id, True)
                 icon = "●" if vis else "○"
-                item = QTreeWidgetItem(origin, [f"{icon} ▬ {cp.name}"])
-                item.setData(0, Qt.UserRole, ('construction_plane', cp))
-                item.setForeground(0, QColor("#bb88dd" if vis else "#555"))
+                rows.append(_BrowserRow(
+                    ('construction_plane', id(cp)), f"{icon} ▬ {cp.name}",
+                    "#bb88dd" if vis else "#555", ('construction_plane', cp),
+                ))
+        return tuple(rows)
+
+    def _sketch_rows(self, sketches) -> list:
+        rows = []
+        for s in sketches:
+            vis = self.sketch_visibility.get(s.id, True)
+            icon = "●" if vis else "○"
+            rows.append(_BrowserRow(('sketch', id(s)), f"{icon} {s.name}", "#7cb3f7" if vis else "#555", ('sketch', s)))
+        return rows
 
-        # =========================================================================
-        # Phase 3 Assembly: Component-Hierarchie oder Legacy-Modus
-        # =========================================================================
-        if self._assembly_enabled and hasattr(self.document, 'root_component') and self.document.root_component:
-            # Assembly-Modus: Component-Hierarchie anzeigen
-            self._add_component_to_tree(root, self.document.root_component)
-        else:
-            # Legacy-Modus: Flache Struktur wie bisher
-            if self.document.bodies or self.document.sketches:
-                comp = QTreeWidgetItem(root, ["⊞ Component1"])
-                comp.setExpanded(True)
-                comp.setForeground(0, QColor("#b8b8b8"))
-                comp.setData(0, Qt.UserRole, ('component', None))
-
-                # Sketches unter Component
-                for s in self.document.sketches:
-                    vis = self.sketch_visibility.get(s.id, True)
-                    icon = "●" if vis else "○"
-                    item = QTreeWidgetItem(comp, [f"{icon} {s.name}"])
-                    item.setData(0, Qt.UserRole, ('sketch', s))
-                    item.setForeground(0, QColor("#7cb3f7" if vis else "#555"))
-
-                # Bodies unter Component
-                self._add_bodies_to_tree(comp, self.document.bodies)
-
-    def _add_component_to_tree(self, parent_item: QTreeWidgetItem, component):
+    def _component_row(self, component) -> _BrowserRow:
         """
-        Fügt Component rekursiv zum Tree hinzu.
+        Zeile einer Component inkl. Kindern (rekursiv).
 
         Phase 3 Assembly: Hierarchische Darstellung von Components.
         """
@@ -1062,104 +1081,94 @@ class ProjectBrowser(QFrame):
             icon = "⊞"
             color = "#b8b8b8"
 
-        # Component-Item erstellen
-        comp_item = QTreeWidgetItem(parent_item, [f"{icon} {component.name}"])
-        comp_item.setExpanded(component.expanded)
-        comp_item.setForeground(0, QColor(color))
-        comp_item.setData(0, Qt.UserRole, ('component', component))
+        # Sketches, Bodies, dann Sub-Components rekursiv
+        children = self._sketch_rows(component.sketches)
+        children += self._body_rows(component.bodies)
+        children += [self._component_row(sub) for sub in component.sub_components]
+
+        return _BrowserRow(
+            ('component', id(component)), f"{icon} {component.name}", color,
+            ('component', component), tuple(children),
+            bold=is_active,
+            strike=not vis,  # Durchgestrichen wenn unsichtbar
+            expanded=component.expanded,
+        )
 
-        # Font-Styling basierend auf Status
-        font = comp_item.font(0)
-        if is_active:
-            font.setBold(True)
-        if not vis:
-            font.setStrikeOut(True)  # Durchgestrichen wenn unsichtbar
-        comp_item.setFont(0, font)
-
-        # Sketches dieser Component
-        for s in component.sketches:
-            s_vis = self.sketch_visibility.get(s.id, True)
-            s_icon = "●" if s_vis else "○"
-            item = QTreeWidgetItem(comp_item, [f"{s_icon} {s.name}"])
-            item.setData(0, Qt.UserRole, ('sketch', s))
-            item.setForeground(0, QColor("#7cb3f7" if s_vis else "#555"))
-
-        # Bodies dieser Component
-        self._add_bodies_to_tree(comp_item, component.bodies)
-
-        # Sub-Components rekursiv
-        for sub in component.sub_components:
-            self._add_component_to_tree(comp_item, sub)
-
-    def _add_bodies_to_tree(self, parent_item: QTreeWidgetItem, bodies: list):
-        """Fügt Bodies zum Tree hinzu (wiederverwendbar für Legacy und Assembly)."""
+    def _body_rows(self, bodies: list) -> list:
+        """Zeilen für Bodies mit Features (wiederverwendbar für Legacy und Assembly)."""
+        rows = []
         for b in bodies:
             vis = self.body_visibility.get(b.id, True)
             icon = "●" if vis else "○"
-            bi = QTreeWidgetItem(parent_item, [f"{icon} {b.name}"])
-            bi.setData(0, Qt.UserRole, ('body', b))
-            bi.setExpanded(True)
-            bi.setForeground(0, QColor("#a8d4a8" if vis else "#555"))
-
+            features = ()
             if hasattr(b, 'features'):
                 rb_idx = b.rollback_index if b.rollback_index is not None else len(b.features)
-                for fi_idx, f in enumerate(b.features):
-                    rolled_back = fi_idx >= rb_idx
-                    prefix = "↳" if not rolled_back else "⊘"
-                    color = "#777" if not rolled_back else "#444"
-                    if hasattr(f, 'status') and f.status == "ERROR":
-                        # W7: PAKET C - Color basierend auf status_class (Error-Envelope v2)
-                        details = _safe_details(getattr(f, "status_details", None))
-                        status_class = details.get("status_class", "")
-                        severity = details.get("severity", "")
-
-                        # Priority 1: status_class mapping
-                        if status_class == "WARNING_RECOVERABLE" or severity == "warning":
-                            color = "#e0a030"  # Orange for recoverable warnings
-                        elif status_class == "BLOCKED" or severity == "blocked":
-                            color = "#aa5500"  # Dark orange for blocked
-                        elif status_class == "CRITICAL" or severity == "critical":
-                            color = "#ff0000"  # Bright red for critical
-                        elif status_class == "ERROR" or severity == "error":
-                            color = "#cc5555"  # Red for standard errors
-                        else:
-                            # Fallback: W5 code-basierte Erkennung
-                            tnp = details.get("tnp_failure", {})
-                            if details.get("code") == "tnp_ref_drift" or tnp.get("category") == "drift":
-                                color = "#e0a030"  # Orange for drift/recoverable
-                            else:
-                                color = "#cc5555"  # Red for hard errors
-
-                    # Geometry Badge: zeigt Volume-Delta und Edge-Erfolgsrate
-                    badge = ""
-                    gd = getattr(f, '_geometry_delta', None)
-                    if isinstance(gd, dict) and not rolled_back:
-                        vol_pct = _safe_float(gd.get("volume_pct", 0))
-                        if vol_pct != 0:
-                            sign = "+" if vol_pct > 0 else ""
-                            badge = f"  Vol{sign}{vol_pct:.1f}%"
-                        else:
-                            fd = _safe_int(gd.get("faces_delta", 0))
-                            if fd != 0:
-                                badge = f"  {'+' if fd > 0 else ''}{fd}F"
-                        edges_ok = _safe_int(gd.get("edges_ok"), -1)
-                        edges_total = _safe_int(gd.get("edges_total"), 0)
-                        if edges_total > 0 and edges_ok >= 0 and edges_ok < edges_total:
-                            badge = f"  ⚠ {edges_ok}/{edges_total}{badge}"
-
-                    fi = QTreeWidgetItem(bi, [f"{prefix} {f.name}{badge}"])
-                    fi.setData(0, Qt.UserRole, ('feature', f, b))
-                    fi.setForeground(0, QColor(color))
-                    status_msg = getattr(f, "status_message", "")
-                    status_details = _safe_details(getattr(f, "status_details", None))
-                    if status_msg or status_details:
-                        tooltip = _format_feature_status_tooltip(
-                            status_msg,
-                            getattr(f, "status", ""),
-                            status_details,
-                        )
-                        if tooltip:
-                            fi.setToolTip(0, tooltip)
+                features = tuple(
+                    self._feature_row(f, b, fi_idx >= rb_idx) for fi_idx, f in enumerate(b.features)
+                )
+            rows.append(_BrowserRow(
+                ('body', id(b)), f"{icon} {b.name}", "#a8d4a8" if vis else "#555",
+                ('body', b), features, expanded=True,
+            ))
+        return rows
+
+    def _feature_row(self, f, b, rolled_back: bool) -> _BrowserRow:
+        prefix = "↳" if not rolled_back else "⊘"
+        color = "#777" if not rolled_back else "#444"
+        if hasattr(f, 'status') and f.status == "ERROR":
+            # W7: PAKET C - Color basierend auf status_class (Error-Envelope v2)
+            details = _safe_details(getattr(f, "status_details", None))
+            status_class = details.get("status_class", "")
+            severity = details.get("severity", "")
+
+            # Priority 1: status_class mapping
+            if status_class == "WARNING_RECOVERABLE" or severity == "warning":
+                color = "#e0a030"  # Orange for recoverable warnings
+            elif status_class == "BLOCKED" or severity == "blocked":
+                color = "#aa5500"  # Dark orange for blocked
+            elif status_class == "CRITICAL" or severity == "critical":
+                color = "#ff0000"  # Bright red for critical
+            elif status_class == "ERROR" or severity == "error":
+                color = "#cc5555"  # Red for standard errors
+            else:
+                # Fallback: W5 code-basierte Erkennung
+                tnp = details.get("tnp_failure", {})
+                if details.get("code") == "tnp_ref_drift" or tnp.get("category") == "drift":
+                    color = "#e0a030"  # Orange for drift/recoverable
+                else:
+                    color = "#cc5555"  # Red for hard errors
+
+        # Geometry Badge: zeigt Volume-Delta und Edge-Erfolgsrate
+        badge = ""
+        gd = getattr(f, '_geometry_delta', None)
+        if isinstance(gd, dict) and not rolled_back:
+            vol_pct = _safe_float(gd.get("volume_pct", 0))
+            if vol_pct != 0:
+                sign = "+" if vol_pct > 0 else ""
+                badge = f"  Vol{sign}{vol_pct:.1f}%"
+            else:
+                fd = _safe_int(gd.get("faces_delta", 0))
+                if fd != 0:
+                    badge = f"  {'+' if fd > 0 else ''}{fd}F"
+            edges_ok = _safe_int(gd.get("edges_ok"), -1)
+            edges_total = _safe_int(gd.get("edges_total"), 0)
+            if edges_total > 0 and edges_ok >= 0 and edges_ok < edges_total:
+                badge = f"  ⚠ {edges_ok}/{edges_total}{badge}"
+
+        tooltip = ""
+        status_msg = getattr(f, "status_message", "")
+        status_details = _safe_details(getattr(f, "status_details", None))
+        if status_msg or status_details:
+            tooltip = _format_feature_status_tooltip(
+                status_msg,
+                getattr(f, "status", ""),
+                status_details,
+            ) or ""
+
+        return _BrowserRow(
+            ('feature', id(f), id(b)), f"{prefix} {f.name}{badge}", color,
+            ('feature', f, b), tooltip=tooltip, problem=_is_problem_feature(f),
+        )
 
     def _is_component_visible(self, component) -> bool:
         """Prüft ob Component und alle Parent-Components sichtbar sind."""
@@ -2326,8 +2335,9 @@ class ProjectBrowser(QFrame):
         try:
             self._do_tree_build()
         finally:
-            # W26: Filter nach dem Build erneut anwenden
-            if hasattr(self.tree, '_filter_mode'):
+            # W26: Filter nach dem Build erneut anwenden (im Modus 'all' ist
+            # nichts versteckt, neue Items sind sichtbar -> kein Tree-Walk nötig)
+            if getattr(self.tree, '_filter_mode', 'all') != 'all':
                 self.tree._apply_filter()
             # W26: Scroll-Position wiederherstellen
             if self.tree.verticalScrollBar():
@@ -2338,70 +2348,35 @@ class ProjectBrowser(QFrame):
         self._update_problem_badge()
 
     def _do_tree_build(self):
-        """Interne Methode für den Tree-Aufbau (von refresh() aufgerufen)."""
-        self.tree.clear()
+        """
+        Gleicht den Tree inkrementell mit dem Dokument ab (von refresh() aufgerufen).
+
+        Statt clear() + Neuaufbau werden nur geänderte Zeilen angefasst,
+        danach wird der Item-Index für die Problem-Navigation gesetzt.
+        """
         if not self.document:
+            self.tree.clear()
             return
 
-        # Root: Document
-        root = QTreeWidgetItem(self.tree, [f"{self.document.name}"])
-        root.setExpanded(True)
-        root.setForeground(0, QColor("#ddd"))
-
-        # Origin (Standard-Ebenen) - eingeklappt
-        origin = QTreeWidgetItem(root, ["◎ Origin"])
-        origin.setExpanded(False)
-        origin.setForeground(0, QColor("#666"))
-
-        planes = [
-            ("XY Plane (Top)", "xy", "#5588dd"),
-            ("XZ Plane (Front)", "xz", "#55dd88"),
-            ("YZ Plane (Right)", "yz", "#dd8855"),
-        ]
-        for name, plane_id, color in planes:
-            item = QTreeWidgetItem(origin, [f"▬ {name}"])
-            item.setData(0, Qt.UserRole, ('plane', plane_id))
-            item.setForeground(0, QColor(color))
-
-        axes = [("X Axis", "x", "#dd5555"), ("Y Axis", "y", "#55dd55"), ("Z Axis", "z", "#5555dd")]
-        for name, axis_id, color in axes:
-            item = QTreeWidgetItem(origin, [f"→ {name}"])
-            item.setData(0, Qt.UserRole, ('axis', axis_id))
-            item.setForeground(0, QColor(color))
-
-        # Construction Planes (Offset Planes)
-        if hasattr(self.document, 'planes') and self.document.planes:
-            for cp in self.document.planes:
-                vis = self.plane_visibility.get(cp.id, True)
-                icon = "●" if vis else "○"
-                item = QTreeWidgetItem(origin, [f"{icon} ▬ {cp.name}"])
-                item.setData(0, Qt.UserRole, ('construction_plane', cp))
-                item.setForeground(0, QColor("#bb88dd" if vis else "#555"))
-
         # =========================================================================
         # Phase 3 Assembly: Component-Hierarchie oder Legacy-Modus
         # =========================================================================
+        children = [_BrowserRow(('origin',), "◎ Origin", "#666", children=self._origin_rows(), expanded=False)]
         if self._assembly_enabled and hasattr(self.document, 'root_component') and self.document.root_component:
             # Assembly-Modus: Component-Hierarchie anzeigen
-            self._add_component_to_tree(root, self.document.root_component)
-        else:
-            # Legacy-Modus: Flache Struktur wie bisher
-            if self.document.bodies or self.document.sketches:
-                comp = QTreeWidgetItem(root, ["⊞ Component1"])
-                comp.setExpanded(True)
-                comp.setForeground(0, QColor("#b8b8b8"))
-                comp.setData(0, Qt.UserRole, ('component', None))
-
-                # Sketches unter Component
-                for s in self.document.sketches:
-                    vis = self.sketch_visibility.get(s.id, True)
-                    icon = "●" if vis else "○"
-                    item = QTreeWidgetItem(comp, [f"{icon} {s.name}"])
-                    item.setData(0, Qt.UserRole, ('sketch', s))
-                    item.setForeground(0, QColor("#7cb3f7" if vis else "#555"))
-
-                # Bodies unter Component
-                self._add_bodies_to_tree(comp, self.document.bodies)
+            children.append(self._component_row(self.document.root_component))
+        elif self.document.bodies or self.document.sketches:
+            # Legacy-Modus: Flache Struktur (Sketches, dann Bodies unter Component1)
+            legacy = self._sketch_rows(self.document.sketches) + self._body_rows(self.document.bodies)
+            children.append(_BrowserRow(
+                ('component', None), "⊞ Component1", "#b8b8b8", ('component', None),
+                tuple(legacy), expanded=True,
+            ))
+
+        root = _BrowserRow(('document',), f"{self.document.name}", "#ddd", children=tuple(children), expanded=True)
+        order, problems = [], []
+        self._sync_rows(self.tree.invisibleRootItem(), (root,), order, problems)
+        self.tree.set_item_index(order, problems)
 
     def _on_next_problem(self):
         """W21: Handler für Ctrl+Down - Nächstes Problem-Item."""
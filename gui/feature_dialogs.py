@@ -145,11 +145,47 @@ class FeatureDialogsMixin:
         """Handler fÃ¼r Live-Preview wenn Parameter geÃ¤ndert werden."""
         self._update_pattern_preview(params)
 
+    def _pattern_feature_from_params(self, body, params: dict):
+        """Baut ein PatternFeature aus den Panel-Parametern (Body-Pattern, kein Seed)."""
+        from modeling import PatternFeature
+
+        axis = {"X": (1, 0, 0), "Y": (0, 1, 0), "Z": (0, 0, 1)}.get(params.get('axis', 'X'), (1, 0, 0))
+        count = int(params.get('count', 3))
+
+        if params.get('type', 'linear') == 'circular':
+            center = params.get('center')
+            if center is None:
+                center = self._get_body_center(body)
+            return PatternFeature(
+                pattern_type="Circular",
+                count=count,
+                angle=float(params.get('angle', 360.0)),
+                axis_origin=tuple(center),
+                axis_direction=axis,
+            )
+        return PatternFeature(
+            pattern_type="Linear",
+            count=count,
+            spacing=float(params.get('spacing', 10.0)),
+            direction_1=axis,
+        )
+
     def _update_pattern_preview(self, params: dict):
         """Generiert/aktualisiert Pattern-Preview."""
         if not self._pattern_target_body:
             return
-        # Preview handled by viewport
+        if not hasattr(self.viewport_3d, 'show_pattern_preview'):
+            return
+        from modeling.pattern_engine import pattern_matrices
+
+        try:
+            feature = self._pattern_feature_from_params(self._pattern_target_body, params)
+            matrices = pattern_matrices(feature)
+        except ValueError as e:
+            logger.debug(f"Pattern Preview: {e}")
+            self._clear_pattern_preview()
+            return
+        self.viewport_3d.show_pattern_preview(self._pattern_target_body.id, matrices)
 
     def _clear_pattern_preview(self):
         """Entfernt Pattern-Preview."""
@@ -194,27 +230,17 @@ class FeatureDialogsMixin:
         self.statusBar().showMessage(f"Zentrum gesetzt auf ({point[0]:.1f}, {point[1]:.1f}, {point[2]:.1f})")
 
     def _execute_pattern(self, body, params: dict):
-        """FÃ¼hrt Pattern aus und erstellt die Bodies."""
-        from modeling import PatternFeature
+        """FÃ¼hrt Pattern aus (ein instanzierter Boolean im Rebuild)."""
         from gui.commands.feature_commands import AddFeatureCommand
         
-        pattern_type = params.get('type', 'linear')
-        count = params.get('count', 3)
-        spacing = params.get('spacing', 10.0)
+        feature = self._pattern_feature_from_params(body, params)
         
-        feature = PatternFeature(
-            pattern_type=pattern_type,
-            count=count,
-            spacing=spacing,
-            **params
-        )
-        
-        cmd = AddFeatureCommand(body, feature, self, description=f"Pattern {pattern_type}")
+        cmd = AddFeatureCommand(body, feature, self, description=f"Pattern {feature.pattern_type}")
         self.undo_stack.push(cmd)
         
         self.browser.refresh()
         self._update_viewport_all()
-        logger.success(f"Pattern erstellt: {count} Kopien")
+        logger.success(f"Pattern erstellt: {feature.get_total_instances()} Kopien")
 
     def _stop_pattern_mode(self):
         """Beendet den Pattern-Modus."""
@@ -1564,7 +1590,7 @@ class FeatureDialogsMixin:
             return
         
         try:
-            from build123d import Plane as B123Plane, mirror as b123d_mirror
+            from modeling import TransformFeature
             from modeling.cad_tessellator import CADTessellator
             
             if not hasattr(body, '_build123d_solid') or not body._build123d_solid:
@@ -1573,10 +1599,9 @@ class FeatureDialogsMixin:
             
             CADTessellator.notify_body_changed()
             
-            plane_map = {"XY": B123Plane.XY, "XZ": B123Plane.XZ, "YZ": B123Plane.YZ}
-            mirror_plane = plane_map.get(plane.upper(), B123Plane.XY)
-            
-            body._build123d_solid = b123d_mirror(body._build123d_solid, about=mirror_plane)
+            # Über _apply_transform_feature: Tessellator platziert das gespiegelte Mesh
+            mirror = TransformFeature(mode="mirror", data={"plane": plane.upper()})
+            body._build123d_solid = body._apply_transform_feature(body._build123d_solid, mirror)
             logger.success(f"Mirror ({plane}) auf {body.name}")
             
             self._update_body_from_build123d(body, body._build123d_solid)
@@ -4,8 +4,8 @@ Face and Edge detection for 3D viewport
 """
 
 import numpy as np
-import math
 from dataclasses import dataclass, field
+from functools import partial
 from typing import List, Optional, Tuple, Dict, Any
 from loguru import logger
 from config.tolerances import Tolerances  # Phase 5: Zentralisierte Toleranzen
@@ -48,7 +48,9 @@ class SelectionFace:
     plane_y: Tuple[float, float, float] = (0,1,0)
 
     pick_priority: int = 0
-    display_mesh: Any = None
+    # Anzeige-Mesh; Body-Faces bekommen stattdessen einen Loader (Sub-Mesh erst bei Hover/Highlight)
+    _display_mesh: Any = field(default=None, repr=False)
+    _mesh_loader: Any = field(default=None, repr=False)
 
     # WICHTIG: sample_point = tatsächlicher Punkt auf der Fläche (nicht Zentroid!)
     # Bei Ring-Flächen liegt plane_origin im Loch, sample_point liegt auf der Fläche
@@ -68,6 +70,18 @@ class SelectionFace:
         if self.sample_point is None:
             self.sample_point = self.plane_origin
 
+    @property
+    def display_mesh(self):
+        if self._display_mesh is None and self._mesh_loader is not None:
+            self._display_mesh = self._mesh_loader()
+            self._mesh_loader = None
+        return self._display_mesh
+
+    @display_mesh.setter
+    def display_mesh(self, mesh):
+        self._display_mesh = mesh
+        self._mesh_loader = None
+
 
 class GeometryDetector:
     class SelectionFilter:
@@ -88,17 +102,25 @@ class GeometryDetector:
         self._counter = 0
         # Per-body face cache: body_id → (mesh_id, [SelectionFace, ...])
         self._body_face_cache: Dict[str, Tuple[int, List[SelectionFace]]] = {}
+        # Body-Meshes mit cell_data["face_id"] für Picking per einzelnem Ray-Cast
+        self._body_meshes: Dict[str, Any] = {}
+        self._body_locators: Dict[str, Any] = {}
+        # Inkrementelle Regionserkennung pro Sketch (überlebt clear(), Schlüssel ist der Geometrie-Inhalt)
+        self._sketch_regions: Dict[str, Any] = {}
 
     def clear(self):
         self.selection_faces.clear()
         self._counter = 0
         # FIX: Cache auch leeren, sonst werden stale Faces zurückgegeben!
         self._body_face_cache.clear()
+        self._body_meshes.clear()
+        self._body_locators.clear()
 
     def clear_full(self):
         """Vollständiger Reset inkl. Cache."""
         self.clear()
         self._body_face_cache.clear()
+        self._sketch_regions.clear()
         
         
     
@@ -106,11 +128,13 @@ class GeometryDetector:
         """
         Analysiert Sketch-Linien und erkennt verschachtelte Regionen (Inseln).
         Löst das Problem: Kreis im Hexagon -> Erkennt Ring und Kern separat.
+
+        Die Regionserkennung läuft inkrementell über einen SketchRegionIndex pro
+        Sketch: nur Regionen, die geänderte Entities berühren, werden neu berechnet.
         """
         if not HAS_SHAPELY: return
 
-        from shapely.geometry import LineString, Polygon
-        from shapely.ops import unary_union, polygonize
+        from sketcher.regions import SketchRegionIndex
 
         plane_normal, plane_x_dir, plane_y_dir = normalize_plane_axes(
             plane_normal,
@@ -118,465 +142,39 @@ class GeometryDetector:
             plane_y_dir,
         )
 
-        # 1. Linien in Shapely konvertieren mit Welding
-        lines = []
-        standalone_circles = []  # Kreise die eigenständig sind
-
-        # Welding-System (wie in sketch_editor.py) für DXF-Kompatibilität
-        WELD_GRID = 0.5  # 0.5mm Toleranz
-        welded_points = {}
-
-        def get_welded_pt(x, y):
-            """Verschweißt nahe Punkte zu einem gemeinsamen Punkt"""
-            ix = int(round(x / WELD_GRID))
-            iy = int(round(y / WELD_GRID))
-            key = (ix, iy)
-
-            if key in welded_points:
-                return welded_points[key]
-
-            # Suche in Nachbarzellen
-            for dx in [-2, -1, 0, 1, 2]:
-                for dy in [-2, -1, 0, 1, 2]:
-                    if dx == 0 and dy == 0: continue
-                    neighbor_key = (ix + dx, iy + dy)
-                    if neighbor_key in welded_points:
-                        nx, ny = welded_points[neighbor_key]
-                        if (x - nx)**2 + (y - ny)**2 < WELD_GRID**2:
-                            return (nx, ny)
-
-            welded_points[key] = (x, y)
-            return (x, y)
-
-        def rnd(val): return round(val, 5)  # Für Kreise weiterhin nutzen
-
-        # Lines - mit Welding für bessere DXF-Kompatibilität
-        for l in getattr(sketch, 'lines', []):
-            if not l.construction:
-                p1 = get_welded_pt(l.start.x, l.start.y)
-                p2 = get_welded_pt(l.end.x, l.end.y)
-                if p1 != p2:  # Keine Zero-Length Linien
-                    lines.append(LineString([p1, p2]))
-        
-        # Circles - Mit Überlappungs-Detection (wie in sketch_editor.py)
-        circles = [c for c in getattr(sketch, 'circles', []) if not c.construction]
-
-        if circles:
-            # Kreis-Überlappungs-Erkennung (gleiche Logik wie sketch_editor.py)
-            from sketcher.geometry import get_circle_circle_intersection, circle_line_intersection
-
-            # Finde alle Schnittpunkte für jeden Kreis
-            circle_intersections = {i: [] for i in range(len(circles))}
-            overlapping_circles = set()
-
-            # 1. Kreis-Kreis Schnittpunkte
-            for i in range(len(circles)):
-                for j in range(i + 1, len(circles)):
-                    c1, c2 = circles[i], circles[j]
-                    pts = get_circle_circle_intersection(c1, c2)
-
-                    if len(pts) >= 1:
-                        overlapping_circles.add(i)
-                        overlapping_circles.add(j)
-
-                        for pt in pts:
-                            angle1 = math.atan2(pt.y - c1.center.y, pt.x - c1.center.x)
-                            circle_intersections[i].append((angle1, pt))
-
-                            angle2 = math.atan2(pt.y - c2.center.y, pt.x - c2.center.x)
-                            circle_intersections[j].append((angle2, pt))
-
-            # 2. Kreis-Linie Schnittpunkte
-            sketch_lines = [l for l in getattr(sketch, 'lines', []) if not l.construction]
-            for idx, circle in enumerate(circles):
-                for line in sketch_lines:
-                    try:
-                        pts = circle_line_intersection(circle, line)
-                        if pts:
-                            overlapping_circles.add(idx)
-                            for pt in pts:
-                                angle = math.atan2(pt.y - circle.center.y, pt.x - circle.center.x)
-                                circle_intersections[idx].append((angle, pt))
-                    except Exception:
-                        pass
-
-            # Verarbeite Kreise
-            for idx, circle in enumerate(circles):
-                cx, cy, r = circle.center.x, circle.center.y, circle.radius
-
-                if idx in overlapping_circles and circle_intersections[idx]:
-                    # Überlappender Kreis: Teile in Arcs
-                    intersections = circle_intersections[idx]
-                    intersections.sort(key=lambda x: x[0])
-
-                    # Erstelle Arcs zwischen Schnittpunkten
-                    for seg_idx in range(len(intersections)):
-                        start_angle = intersections[seg_idx][0]
-                        end_angle = intersections[(seg_idx + 1) % len(intersections)][0]
-
-                        # Handle Wrap-Around
-                        if end_angle <= start_angle:
-                            end_angle += 2 * math.pi
-
-                        # Erstelle Arc als LineString
-                        arc_pts = []
-                        sweep = end_angle - start_angle
-                        steps = max(16, int(sweep / 0.1))
-
-                        for step in range(steps + 1):
-                            t = step / steps
-                            a = start_angle + sweep * t
-                            px = cx + r * math.cos(a)
-                            py = cy + r * math.sin(a)
-                            arc_pts.append(get_welded_pt(px, py))
-
-                        if len(arc_pts) >= 2:
-                            lines.append(LineString(arc_pts))
-                else:
-                    # Nicht-überlappender Kreis: Als geschlossenes LineString
-                    num_segments = 128
-                    pts = []
-                    for i in range(num_segments + 1):
-                        angle = i * 2 * math.pi / num_segments
-                        pts.append((rnd(cx + r * math.cos(angle)), rnd(cy + r * math.sin(angle))))
-                    lines.append(LineString(pts))
-                    standalone_circles.append(Polygon(pts[:-1]))
-
-        # Arcs - mit Welding für Start/End-Punkte
-        for a in getattr(sketch, 'arcs', []):
-            if not a.construction:
-                # Arc-Winkel berechnen
-                start_angle = getattr(a, 'start_angle', 0)
-                end_angle = getattr(a, 'end_angle', 360)
-
-                # Falls arc_size statt end_angle
-                if hasattr(a, 'arc_size'):
-                    end_angle = start_angle + a.arc_size
-
-                # Normalisiere Winkel
-                if end_angle < start_angle:
-                    end_angle += 360
-
-                num_segments = max(32, int(abs(end_angle - start_angle) / 3))
-
-                # Start-Punkt mit Welding
-                start_rad = math.radians(start_angle)
-                start_p = get_welded_pt(
-                    a.center.x + a.radius * math.cos(start_rad),
-                    a.center.y + a.radius * math.sin(start_rad)
-                )
-
-                pts = [start_p]
-                for i in range(1, num_segments):
-                    angle = math.radians(start_angle + (end_angle - start_angle) * i / num_segments)
-                    # Zwischenpunkte auch welded für bessere Konsistenz
-                    pts.append(get_welded_pt(
-                        a.center.x + a.radius * math.cos(angle),
-                        a.center.y + a.radius * math.sin(angle)
-                    ))
-
-                # End-Punkt mit Welding
-                end_rad = math.radians(end_angle)
-                end_p = get_welded_pt(
-                    a.center.x + a.radius * math.cos(end_rad),
-                    a.center.y + a.radius * math.sin(end_rad)
-                )
-                pts.append(end_p)
-
-                if len(pts) >= 2:
-                    lines.append(LineString(pts))
-        
-        # Splines - mit Welding für Endpunkte
-        for s in getattr(sketch, 'splines', []):
-            if not s.construction and hasattr(s, 'points') and len(s.points) >= 2:
-                pts = [get_welded_pt(p.x, p.y) for p in s.points]
-                if len(pts) >= 2:
-                    lines.append(LineString(pts))
-        
-        # Polygons (falls vorhanden) - mit Welding
-        for p in getattr(sketch, 'polygons', []):
-            if not p.construction and hasattr(p, 'points') and len(p.points) >= 3:
-                pts = [get_welded_pt(pt.x, pt.y) for pt in p.points]
-                pts.append(pts[0])  # Schließen
-                lines.append(LineString(pts))
-
-        if not lines and not standalone_circles: 
-            return
-
-        # 2. Polygonize -> Findet alle geschlossenen Loops
-        raw_polys = []
-        try:
-            if lines:
-                merged = unary_union(lines)
-
-                # Gap Closing (wie in sketch_editor.py) - verbindet nahe Endpunkte
-                if hasattr(merged, 'geoms'):
-                    endpoints = []
-                    for geom in merged.geoms:
-                        if hasattr(geom, 'coords'):
-                            coords = list(geom.coords)
-                            if len(coords) >= 2:
-                                endpoints.append(coords[0])
-                                endpoints.append(coords[-1])
-
-                    GAP_TOLERANCE = 1.0  # 1mm
-                    additional_lines = []
-                    used = set()
-                    for i, p1 in enumerate(endpoints):
-                        if i in used:
-                            continue
-                        for j, p2 in enumerate(endpoints):
-                            if j <= i or j in used:
-                                continue
-                            dist = math.hypot(p1[0] - p2[0], p1[1] - p2[1])
-                            if 0 < dist < GAP_TOLERANCE:
-                                additional_lines.append(LineString([p1, p2]))
-                                used.add(i)
-                                used.add(j)
-                                break
-
-                    if additional_lines:
-                        logger.debug(f"Gap closing: {len(additional_lines)} kleine Lücken geschlossen")
-                        merged = unary_union([merged] + additional_lines)
-
-                raw_polys = list(polygonize(merged))
-        except Exception as e:
-            logger.debug(f"Polygonize failed: {e}")
-        
-        # WICHTIG: Wenn polygonize keine Ergebnisse liefert aber wir eigenständige Kreise haben
-        if not raw_polys and standalone_circles:
-            raw_polys = standalone_circles
-        elif standalone_circles:
-            # Füge Kreise hinzu die nicht in raw_polys sind
-            for circle in standalone_circles:
-                already_found = False
-                for poly in raw_polys:
-                    # Prüfe ob der Kreis bereits als Polygon existiert (ähnliche Fläche)
-                    if abs(poly.area - circle.area) < circle.area * 0.1:
-                        already_found = True
-                        break
-                if not already_found:
-                    raw_polys.append(circle)
-        
-        if not raw_polys:
-            return
+        self.selection_faces = [f for f in self.selection_faces if f.owner_id != sketch.id] # Alte löschen
 
-        # 3. Containment Analyse (Wer liegt in wem?)
-        # Wir sortieren nach Fläche (groß zuerst), um Parents vor Children zu finden
-        raw_polys.sort(key=lambda p: p.area, reverse=True)
-        
-        # Struktur: poly_info = { index: {'poly': p, 'children': [], 'parent': None} }
-        poly_info = {i: {'poly': p, 'children': [], 'parent': None} for i, p in enumerate(raw_polys)}
-
-        for i in range(len(raw_polys)):
-            parent = raw_polys[i]
-            for j in range(len(raw_polys)):
-                if i == j: continue
-                child = raw_polys[j]
-                
-                # Wenn Child im Parent liegt
-                if parent.contains(child):
-                    # Checken ob es ein direkter Parent ist (kein anderer Parent dazwischen)
-                    # Wir weisen es erstmal zu, und verfeinern später oder nutzen einfache Logik:
-                    # Da wir sortiert haben, ist der erste Container der größte.
-                    # Bessere Logik: Das kleinste Polygon, das mich enthält, ist mein Parent.
-                    pass
-
-        # Einfachere, robuste Methode für "Hexagon mit Kreis":
-        # Wir erzeugen SelectionFaces für die "Differenz".
-        
-        processed_indices = set()
-        
-        # A. Finde Polygone, die andere enthalten (Parents)
-        for i, parent in enumerate(raw_polys):
-            if i in processed_indices: continue
-            
-            # Suche direkte Löcher (Polygone die IN diesem Parent liegen)
-            holes = []
-            for j, child in enumerate(raw_polys):
-                if i == j: continue
-                # Ein echtes geometrisches Loch
-                if parent.contains(child):
-                    # Prüfen ob dieses Child nicht schon in einem Loch dieses Parents liegt (Nested Holes)
-                    # Für einfache CAD-Fälle (Level 1 Nesting) reicht dies:
-                    is_nested = False
-                    for existing_hole in holes:
-                        if existing_hole.contains(child):
-                            is_nested = True; break
-                    if not is_nested:
-                        holes.append(child)
-
-            # B. Erzeuge die "Ring"-Fläche (Parent minus alle direkten Holes)
-            shell_poly = parent
-            logger.debug(f"Parent Polygon {i}: area={parent.area:.1f}, holes_found={len(holes)}")
-
-            for h in holes:
-                logger.debug(f"  Subtrahiere Loch: area={h.area:.1f}")
-                shell_poly = shell_poly.difference(h)
-
-            # FIX: difference() kann MultiPolygon zurückgeben
-            from shapely.geometry import MultiPolygon
-
-            # DEBUG: Prüfen ob Interiors erstellt wurden
-            if isinstance(shell_poly, MultiPolygon):
-                n_interiors = sum(len(list(p.interiors)) for p in shell_poly.geoms)
-                logger.info(f"  → Shell nach difference: MultiPolygon mit {len(shell_poly.geoms)} Teilen, area={shell_poly.area:.1f}, total_interiors={n_interiors}")
-            elif hasattr(shell_poly, 'interiors'):
-                n_interiors = len(list(shell_poly.interiors))
-                logger.info(f"  → Shell nach difference: area={shell_poly.area:.1f}, interiors={n_interiors}")
-                if n_interiors > 0:
-                    for idx, interior in enumerate(shell_poly.interiors):
-                        logger.debug(f"    Interior {idx}: {len(list(interior.coords))} Punkte")
-            else:
-                logger.info(f"  → Shell nach difference: area={shell_poly.area:.1f}")
-
-            # Erzeuge SelectionFace(s) für den Ring
-            # FIX: Bei MultiPolygon mehrere Faces erstellen
-            polys_to_add = []
-            if isinstance(shell_poly, MultiPolygon):
-                polys_to_add = list(shell_poly.geoms)
-            elif not shell_poly.is_empty:
-                polys_to_add = [shell_poly]
-
-            for sub_poly in polys_to_add:
-                if sub_poly.area > 0.01:  # Minimale Fläche
-                    self.selection_faces.append(
-                        self._create_selection_face(
-                            owner_id=sketch.id,
-                            domain_type="sketch_profile",
-                            poly=sub_poly,
-                            plane_origin=plane_origin,
-                            plane_normal=plane_normal,
-                            plane_x=plane_x_dir,
-                            plane_y=plane_y_dir,
-                            priority=10
-                        )
-                    )
-            
-            # C. Erzeuge SelectionFaces für die Löcher selbst (damit man den Kreis wieder füllen kann)
-            # Das ist wichtig: Das Loch ist jetzt eine eigenständige, klickbare Fläche
-            for h in holes:
-                self.selection_faces.append(
-                    self._create_selection_face(
-                        owner_id=sketch.id,
-                        domain_type="sketch_profile",
-                        poly=h,
-                        plane_origin=plane_origin,
-                        plane_normal=plane_normal,
-                        plane_x=plane_x_dir,
-                        plane_y=plane_y_dir,
-                        priority=20 # Höhere Prio für innere Teile
-                    )
+        index = self._sketch_regions.get(sketch.id)
+        if index is None:
+            index = self._sketch_regions[sketch.id] = SketchRegionIndex()
+        regions = index.update(sketch)
+
+        plane_key = tuple(tuple(float(v) for v in vec)
+                          for vec in (plane_origin, plane_normal, plane_x_dir, plane_y_dir))
+
+        # Ein Profil ist immer: Polygon minus seine direkten Kinder (Ring oder Kreis ohne Kinder)
+        for region in regions:
+            build_mesh = partial(self._shapely_to_pv_mesh, region.poly, plane_origin,
+                                 plane_normal, plane_x_dir, plane_y_dir)
+            self.selection_faces.append(
+                self._create_selection_face(
+                    owner_id=sketch.id,
+                    domain_type="sketch_profile",
+                    poly=region.poly,
+                    plane_origin=plane_origin,
+                    plane_normal=plane_normal,
+                    plane_x=plane_x_dir,
+                    plane_y=plane_y_dir,
+                    priority=10 + region.children,  # Ringe bevorzugen
+                    mesh_loader=partial(region.mesh_for_plane, plane_key, build_mesh),
                 )
-                
-            # Alle verarbeiteten markieren (eigentlich müssten wir holes markieren, aber 
-            # durch die Logik oben werden Löcher auch als Parents geprüft. 
-            # Da sie niemanden enthalten, fallen sie durch und werden im nächsten Loop als "Solid" erzeugt.
-            # Um Duplikate zu vermeiden, müssen wir aufpassen.
-            # FIX: Wenn wir Holes als Faces erzeugen, dürfen sie im Hauptloop nicht nochmal als Parent erzeugt werden?
-            # Doch, wenn das Loch selbst wieder etwas enthält. 
-            # Aber Shapely 'polygonize' liefert atomare Teile.
-            # KORREKTUR: polygonize liefert NICHT atomare Teile bei Verschachtelung, es liefert "Filled" Polygons.
-            
-            # Daher: Wir müssen `holes` aus dem Hauptloop entfernen?
-            # Nein, die einfache Logik ist: 
-            # Wenn ein Polygon im Detector angelegt wird, ist es klickbar.
-            # Wir haben oben Shell und Holes angelegt. 
-            # Die Holes sind ja auch in `raw_polys`. Wenn der Loop bei einem Hole ankommt (als `parent`), 
-            # findet er keine Kinder. Er würde das Hole nochmal als Shell anlegen. 
-            # Das ist OK, solange wir Duplikate vermeiden.
-            
-            # Optimierung: Wir merken uns, welche `raw_polys` als Holes verwendet wurden
-            # und überspringen diese im Hauptloop NICHT, sondern lassen sie durchlaufen,
-            # ABER wir müssen verhindern, dass wir die Fläche doppelt addieren.
-            
-            # Da `shell_poly` (Ring) geometrisch neu ist, ist es ok.
-            # Das `hole` (Kreis) ist identisch mit `raw_polys[j]`.
-            
-        # Um es simpel und stabil zu halten (Dein Wunsch):
-        # Wir löschen die Faces vorher (in clear) und bauen sie hier auf.
-        # Wir nutzen eine Hilfsliste, um Überlappung zu vermeiden.
-        
-        # RESET: Neue Logik, ganz sauber.
-        # 1. Wir berechnen für jedes Polygon seinen "Level" der Verschachtelung.
-        #    Level 0: Außen. Level 1: Im Außen (Loch). Level 2: Im Loch (Insel).
-        # 2. Wir erzeugen Faces immer als (Poly - Direkte Kinder).
-        
-        pass # Der Code oben war "Denkprozess". Hier ist die Implementierung:
-        
-        # --- IMPLEMENTIERUNG ---
-        self.selection_faces = [f for f in self.selection_faces if f.owner_id != sketch.id] # Alte löschen
+            )
 
-        # Hierarchy Building
-        # hierarchy[i] = [list of indices that are strictly inside i]
-        hierarchy = {i: [] for i in range(len(raw_polys))}
-        for i, p_out in enumerate(raw_polys):
-            for j, p_in in enumerate(raw_polys):
-                if i == j: continue
-                if p_out.contains(p_in):
-                    hierarchy[i].append(j)
-        
-        # Bestimme direkte Kinder (Direct Children)
-        # Ein Kind K ist direktes Kind von P, wenn es keinen Zwischen-Parent Z gibt, der in P liegt und K enthält.
-        direct_children = {i: [] for i in range(len(raw_polys))}
-        
-        for parent_idx, all_children in hierarchy.items():
-            for child_idx in all_children:
-                is_direct = True
-                for other_child in all_children:
-                    if child_idx == other_child: continue
-                    if raw_polys[other_child].contains(raw_polys[child_idx]):
-                        is_direct = False
-                        break
-                if is_direct:
-                    direct_children[parent_idx].append(child_idx)
-
-        # Nun erzeugen wir die "Ringe" (Profile)
-        # Ein Profil ist immer: Polygon minus seine direkten Kinder.
-        processed_indices = set()
-        
-        from shapely.geometry import MultiPolygon
-
-        for i in range(len(raw_polys)):
-            poly = raw_polys[i]
-            children_indices = direct_children[i]
-
-            # Subtrahiere alle direkten Kinder
-            display_poly = poly
-            for child_idx in children_indices:
-                display_poly = display_poly.difference(raw_polys[child_idx])
-
-            # FIX: difference() kann MultiPolygon zurückgeben
-            polys_to_add = []
-            if isinstance(display_poly, MultiPolygon):
-                polys_to_add = list(display_poly.geoms)
-            elif not display_poly.is_empty:
-                polys_to_add = [display_poly]
-
-            for sub_poly in polys_to_add:
-                if sub_poly.area > 0.0001:
-                    self.selection_faces.append(
-                        self._create_selection_face(
-                            owner_id=sketch.id,
-                            domain_type="sketch_profile",
-                            poly=sub_poly,  # Das ist der Ring (oder der Kreis, wenn er keine Kinder hat)
-                            plane_origin=plane_origin,
-                            plane_normal=plane_normal,
-                            plane_x=plane_x_dir,
-                            plane_y=plane_y_dir,
-                            priority=10 + len(children_indices)  # Ringe bevorzugen
-                        )
-                    )
-
-    def _create_selection_face(self, owner_id, domain_type, poly, plane_origin, plane_normal, plane_x, plane_y, priority):
-        # FIX: Hier fehlte die Weitergabe von plane_y an _shapely_to_pv_mesh
-        display_mesh = self._shapely_to_pv_mesh(
-            poly, 
-            plane_origin, 
-            plane_normal, 
-            plane_x, 
-            plane_y # <--- Neu übergeben
-        )
+    def _create_selection_face(self, owner_id, domain_type, poly, plane_origin, plane_normal, plane_x, plane_y,
+                               priority, mesh_loader=None):
+        # Anzeige-Mesh erst bei Bedarf (Hover/Highlight) triangulieren
+        if mesh_loader is None:
+            mesh_loader = partial(self._shapely_to_pv_mesh, poly, plane_origin, plane_normal, plane_x, plane_y)
 
         face = SelectionFace(
             id=self._counter,
@@ -588,13 +186,15 @@ class GeometryDetector:
             plane_x=plane_x,
             plane_y=plane_y,
             pick_priority=priority,
-            display_mesh=display_mesh
+            _mesh_loader=mesh_loader
         )
         self._counter += 1
         return face
     
     def pick(self, ray_origin, ray_dir, selection_filter=SelectionFilter.ALL):
         hits = []
+        # Exakte Body-Faces: ein Ray-Cast pro Body-Mesh, Zuordnung über face_id
+        exact_faces: Dict[str, Dict[int, SelectionFace]] = {}
         logger.debug(f"Pick Ray: {ray_origin} -> {ray_dir}")
         logger.debug(f"Active Filter: {selection_filter}")
         for face in self.selection_faces:
@@ -625,6 +225,9 @@ class GeometryDetector:
 
             # Body-Faces → Mesh-Ray
             elif face.domain_type == "body_face":
+                if face.ocp_face_id is not None and face.owner_id in self._body_meshes:
+                    exact_faces.setdefault(face.owner_id, {})[face.ocp_face_id] = face
+                    continue
                 mesh = face.display_mesh
                 pts, _ = mesh.ray_trace(
                     ray_origin,
@@ -634,6 +237,9 @@ class GeometryDetector:
                     dist = np.linalg.norm(pts[0] - ray_origin)
                     hits.append((face.pick_priority, dist, face.id))
 
+        for body_id, faces_by_ocp_id in exact_faces.items():
+            hits.extend(self._ray_hits_on_body(body_id, faces_by_ocp_id, ray_origin, ray_dir))
+
         if not hits:
             return -1
 
@@ -641,6 +247,38 @@ class GeometryDetector:
         return hits[0][2]
 
 
+    def _ray_hits_on_body(self, body_id, faces_by_ocp_id, ray_origin, ray_dir):
+        """Ein Ray-Cast auf das Body-Mesh → nächster Treffer pro Face als (Prio, Distanz, ID)."""
+        mesh = self._body_meshes[body_id]
+        locator = self._body_locators.get(body_id)
+        if locator is None:
+            # Locator einmal pro Body-Mesh (mesh.ray_trace baut bei jedem Aufruf einen OBB-Baum)
+            locator = vtk.vtkStaticCellLocator()
+            locator.SetDataSet(mesh)
+            locator.BuildLocator()
+            self._body_locators[body_id] = locator
+
+        ray_start = np.asarray(ray_origin, dtype=np.float64)
+        ray_end = ray_start + np.asarray(ray_dir, dtype=np.float64) * 10000
+        points, cells = vtk.vtkPoints(), vtk.vtkIdList()
+        locator.IntersectWithLine(ray_start, ray_end, 0.0, points, cells)
+        if points.GetNumberOfPoints() == 0:
+            return []
+
+        cell_face_ids = mesh.cell_data["face_id"]
+        nearest: Dict[int, float] = {}
+        for i in range(points.GetNumberOfPoints()):
+            pt = np.asarray(points.GetPoint(i))
+            ocp_face_id = int(cell_face_ids[cells.GetId(i)])
+            if ocp_face_id not in faces_by_ocp_id:
+                continue
+            dist = float(np.linalg.norm(pt - ray_start))
+            if dist < nearest.get(ocp_face_id, float('inf')):
+                nearest[ocp_face_id] = dist
+
+        return [(faces_by_ocp_id[fid].pick_priority, dist, faces_by_ocp_id[fid].id)
+                for fid, dist in nearest.items()]
+
     def _calculate_plane_axes(self, plane_normal):
         """
         Erzeugt ein stabiles, rechtshändiges Koordinatensystem
@@ -750,9 +388,13 @@ class GeometryDetector:
 
         # === METHODE 1: EXAKT mit face_id aus cell_data ===
         if "face_id" in vtk_mesh.cell_data:
+            self._body_meshes[body_id] = vtk_mesh
+            self._body_locators.pop(body_id, None)
             self._process_body_mesh_exact(body_id, vtk_mesh)
         else:
             # === METHODE 2: FALLBACK - Gruppierung nach Normalen ===
+            self._body_meshes.pop(body_id, None)
+            self._body_locators.pop(body_id, None)
             self._process_body_mesh_heuristic(body_id, vtk_mesh)
 
         # Cache speichern - NUR wenn KEINE face_info vorhanden ist
@@ -766,59 +408,66 @@ class GeometryDetector:
             logger.trace(f"Body {body_id}: {len(new_faces)} Faces (mit B-Rep Normalen, nicht gecacht)")
 
     def _process_body_mesh_exact(self, body_id, vtk_mesh):
-        """Exakte Face-Erkennung über OCP face_id in cell_data."""
-        face_ids = vtk_mesh.cell_data["face_id"]
-        cell_normals = vtk_mesh.cell_data['Normals']
-        all_cell_centers = vtk_mesh.cell_centers().points
+        """
+        Exakte Face-Erkennung über OCP face_id in cell_data.
 
-        unique_face_ids = np.unique(face_ids)
-        face_info = getattr(self, '_current_face_info', None)
-        logger.debug(f"Body {body_id}: {len(unique_face_ids)} unique face_ids (EXAKT via face_id)")
+        PERFORMANCE: Ein stabiler argsort nach face_id liefert CSR-Offsets
+        (Zellen jeder Face liegen zusammenhängend). Zentren und Mesh-Normalen
+        kommen aus np.add.reduceat - O(cells log cells) statt einer Maske pro
+        Face. Sub-Meshes werden erst bei Hover/Highlight gebaut.
+        """
+        face_ids = np.asarray(vtk_mesh.cell_data["face_id"])
+        if face_ids.size == 0:
+            return
+        cell_normals = np.asarray(vtk_mesh.cell_data['Normals'])
+        all_cell_centers = np.asarray(vtk_mesh.cell_centers().points)
 
-        for ocp_face_id in unique_face_ids:
-            cell_mask = (face_ids == ocp_face_id)
-            cell_ids = np.where(cell_mask)[0]
+        order = np.argsort(face_ids, kind='stable')
+        sorted_ids = face_ids[order]
+        offsets = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+        counts = np.diff(np.r_[offsets, sorted_ids.size])
+        unique_face_ids = sorted_ids[offsets]
 
-            if len(cell_ids) < 1:
-                continue
+        centers = np.add.reduceat(all_cell_centers[order], offsets, axis=0) / counts[:, None]
+        mesh_normals = np.add.reduceat(cell_normals[order], offsets, axis=0) / counts[:, None]
+        # Stabiler Sort: erste Zelle jeder Gruppe = kleinste Cell-ID (wie bisher)
+        sample_points = all_cell_centers[order[offsets]]
 
-            # DEBUG: Zylinder-Face-Info loggen
-            surface_type = "unknown"
-            if face_info and int(ocp_face_id) in face_info:
-                surface_type = face_info[int(ocp_face_id)].get("surface_type", "unknown")
+        face_info = getattr(self, '_current_face_info', None)
+        logger.debug(f"Body {body_id}: {len(unique_face_ids)} unique face_ids (EXAKT via face_id)")
 
-            logger.debug(f"  Face {ocp_face_id}: {len(cell_ids)} triangles, surface={surface_type}")
+        for group, ocp_face_id in enumerate(unique_face_ids):
+            ocp_face_id = int(ocp_face_id)
+            brep_info = face_info.get(ocp_face_id) if face_info else None
 
             # === FIX: B-Rep Normale aus face_info verwenden wenn verfügbar ===
             # Die Mesh-Normale kann invertiert sein (VTK Tessellation Bug)
-            if face_info and int(ocp_face_id) in face_info:
-                brep_info = face_info[int(ocp_face_id)]
+            if brep_info is not None:
                 final_normal = np.array(brep_info.get("normal", (0, 0, 1)))
-                # Normalisieren (sollte schon normalisiert sein, aber sicher ist sicher)
-                norm_len = np.linalg.norm(final_normal)
-                if norm_len > 0.001:
-                    final_normal = final_normal / norm_len
-                logger.trace(f"Face {ocp_face_id}: Using B-Rep normal {tuple(final_normal)}")
             else:
                 # Fallback: Durchschnittliche Mesh-Normale
-                group_normals = cell_normals[cell_mask]
-                final_normal = np.mean(group_normals, axis=0)
-                norm_len = np.linalg.norm(final_normal)
-                if norm_len > 0.001:
-                    final_normal = final_normal / norm_len
-                logger.trace(f"Face {ocp_face_id}: Using MESH normal (fallback) {tuple(final_normal)}")
-
-            group_centers = all_cell_centers[cell_mask]
-            center = np.mean(group_centers, axis=0)
-            sample_point = group_centers[0]
+                final_normal = mesh_normals[group]
+            # Normalisieren (B-Rep Normale sollte schon normalisiert sein, aber sicher ist sicher)
+            norm_len = np.linalg.norm(final_normal)
+            if norm_len > 0.001:
+                final_normal = final_normal / norm_len
 
-            # Sub-Mesh für Display extrahieren
-            group_mesh = vtk_mesh.extract_cells(cell_ids).extract_surface(algorithm='dataset_surface')
+            logger.trace(f"  Face {ocp_face_id}: {counts[group]} triangles, "
+                         f"surface={(brep_info or {}).get('surface_type', 'unknown')}")
 
+            cell_ids = order[offsets[group]:offsets[group] + counts[group]]
             self._add_body_face_with_ocp_id(
-                body_id, center, final_normal, group_mesh, sample_point, int(ocp_face_id)
+                body_id, centers[group], final_normal, None, sample_points[group], ocp_face_id,
+                mesh_loader=self._face_mesh_loader(vtk_mesh, cell_ids),
             )
 
+    @staticmethod
+    def _face_mesh_loader(vtk_mesh, cell_ids):
+        """Sub-Mesh einer Face erst bei Bedarf extrahieren (Hover/Highlight/Extrude-Preview)."""
+        def load():
+            return vtk_mesh.extract_cells(cell_ids).extract_surface(algorithm='dataset_surface')
+        return load
+
     def _process_body_mesh_heuristic(self, body_id, vtk_mesh):
         """Fallback: Gruppierung nach gerundeten Normalen."""
         normals = np.round(vtk_mesh.cell_data['Normals'], 1)
@@ -890,13 +539,14 @@ class GeometryDetector:
         """Fügt Body-Face ohne OCP-ID hinzu (Heuristik-Modus)."""
         self._add_body_face_with_ocp_id(body_id, center, normal, mesh, sample_point, None)
 
-    def _add_body_face_with_ocp_id(self, body_id, center, normal, mesh, sample_point=None, ocp_face_id=None):
-        """Fügt Body-Face mit optionaler OCP Face-ID hinzu."""
+    def _add_body_face_with_ocp_id(self, body_id, center, normal, mesh, sample_point=None, ocp_face_id=None,
+                                   mesh_loader=None):
+        """Fügt Body-Face mit optionaler OCP Face-ID hinzu (mesh oder lazy mesh_loader)."""
         extrude_mode = getattr(self, '_current_extrude_mode', False)
         face_priority = 50 if extrude_mode else 5
 
         if sample_point is None:
-            sample_point = mesh.points[0] if mesh.n_points > 0 else center
+            sample_point = mesh.points[0] if mesh is not None and mesh.n_points > 0 else center
 
         face = SelectionFace(
             id=self._counter,
@@ -905,7 +555,8 @@ class GeometryDetector:
             plane_origin=tuple(center),
             plane_normal=tuple(normal),
             pick_priority=face_priority,
-            display_mesh=mesh,
+            _display_mesh=mesh,
+            _mesh_loader=mesh_loader,
             sample_point=tuple(sample_point),
             ocp_face_id=ocp_face_id  # EXAKTE OCP FACE-ID!
         )
@@ -970,14 +621,14 @@ class GeometryDetector:
              x_vec = np.array(x_dir)
              y_vec = np.array(plane_y_dir)
 
-        import shapely.ops
+        import shapely
         try:
             # FIX 1: Polygon bereinigen (Selbstüberschneidungen reparieren)
             if not poly.is_valid:
                 poly = poly.buffer(0)
 
-            # Triangulierung im 2D Raum
-            tris = shapely.ops.triangulate(poly)
+            # Triangulierung im 2D Raum (als Array, ohne Python-Objekt pro Dreieck)
+            tris = shapely.get_parts(shapely.delaunay_triangles(poly))
             
             # FIX 2: Robustere Prüfung für Kreise/Rundungen
             # Wir nutzen einen minimalen Puffer, um Rundungsfehler
@@ -1004,54 +655,43 @@ class GeometryDetector:
                     if hole_poly.is_valid and not hole_poly.is_empty:
                         hole_polys.append(hole_poly)
 
-            valid_tris = []
-            for t in tris:
-                centroid = t.centroid
-
-                # Prüfen ob Zentroid in einem Hole liegt -> SKIP
-                in_hole = False
-                for hole in hole_polys:
-                    if hole.contains(centroid):
-                        in_hole = True
-                        break
-
-                if in_hole:
-                    continue  # Dreieck liegt im Hole, nicht hinzufügen
-
-                # Prüfen, ob der Schwerpunkt im (gepufferten) Polygon liegt
-                if buffered_poly.contains(centroid):
-                    valid_tris.append(t)
-                # Fallback: Wenn Schwerpunkt knapp draußen, aber Dreieck schneidet
-                # (Wichtig für schmale Randstücke bei Kreisen)
-                elif buffered_poly.intersects(t):
-                    valid_tris.append(t)
-            
+            if len(tris) == 0:
+                return None
+
+            # Filter vektorisiert über alle Dreiecke (Zentroid = Mittel der 3 Eckpunkte)
+            corners = shapely.get_coordinates(tris).reshape(len(tris), 4, 2)[:, :3]
+            cx, cy = corners[:, :, 0].mean(axis=1), corners[:, :, 1].mean(axis=1)
+
+            # Prüfen ob Zentroid in einem Hole liegt -> SKIP
+            in_hole = np.zeros(len(tris), dtype=bool)
+            if hole_polys:
+                holes = shapely.multipolygons(shapely.get_parts(hole_polys))
+                shapely.prepare(holes)
+                in_hole = shapely.contains_xy(holes, cx, cy)
+
+            # Prüfen, ob der Schwerpunkt im (gepufferten) Polygon liegt
+            shapely.prepare(buffered_poly)
+            keep = ~in_hole & shapely.contains_xy(buffered_poly, cx, cy)
+            # Fallback: Wenn Schwerpunkt knapp draußen, aber Dreieck schneidet
+            # (Wichtig für schmale Randstücke bei Kreisen)
+            rest = np.flatnonzero(~in_hole & ~keep)
+            if len(rest):
+                keep[rest] = shapely.intersects(buffered_poly, tris[rest])
+
             # Notfall-Fallback: Wenn Filterung alles gelöscht hat (z.B. bei sehr kleinen Kreisen),
             # aber Dreiecke da waren, nehmen wir alle.
-            if not valid_tris and len(tris) > 0 and poly.area > 0:
-                 valid_tris = tris
-            
-            if not valid_tris:
-                return None
-            
-            points = []
-            faces = []
-            c = 0
-            
-            for t in valid_tris:
-                # 2D Koordinaten des Dreiecks holen
-                xx, yy = t.exterior.coords.xy
-                
-                # Die ersten 3 Punkte des Dreiecks transformieren
-                p1 = self._transform_2d_3d(xx[0], yy[0], o, x_vec, y_vec)
-                p2 = self._transform_2d_3d(xx[1], yy[1], o, x_vec, y_vec)
-                p3 = self._transform_2d_3d(xx[2], yy[2], o, x_vec, y_vec)
-                
-                points.extend([p1, p2, p3])
-                # PyVista Face Format: [AnzahlPunkte, id1, id2, id3]
-                faces.extend([3, c, c+1, c+2])
-                c += 3
-            
+            if not keep.any():
+                if poly.area <= 0:
+                    return None
+                keep[:] = True
+
+            # 2D -> 3D: P_global = Origin + x * BasisX + y * BasisY
+            uv = corners[keep].reshape(-1, 2)
+            points = np.asarray(o, dtype=np.float64) + uv[:, :1] * x_vec + uv[:, 1:] * y_vec
+            # PyVista Face Format: [AnzahlPunkte, id1, id2, id3]
+            ids = np.arange(len(points), dtype=np.int64).reshape(-1, 3)
+            faces = np.hstack([np.full((len(ids), 1), 3, dtype=np.int64), ids]).ravel()
+
             # Mesh erstellen
             mesh = pv.PolyData(points, faces)
             return mesh
@@ -1081,8 +721,8 @@ class GeometryDetector:
 
         import shapely.ops
         try:
-            # Triangulierung im 2D Raum
-            tris = shapely.ops.triangulate(poly)
+            # Triangulierung im 2D Raum (als Array, ohne Python-Objekt pro Dreieck)
+            tris = shapely.get_parts(shapely.delaunay_triangles(poly))
             # Nur Dreiecke behalten, die wirklich im Polygon liegen
             valid_tris = [t for t in tris if poly.contains(t.centroid)]
             
@@ -1,18 +1,170 @@
 import datetime
+import threading
+from collections import Counter, deque
+from typing import NamedTuple
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QListView,
     QLabel, QPushButton, QFrame, QToolButton, QLineEdit
 )
-from PySide6.QtCore import Qt, QSize, QTimer
+from PySide6.QtCore import (
+    Qt, QSize, QTimer, Signal, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+)
 from PySide6.QtGui import QColor, QIcon, QFont
 from i18n import tr
 
 MAX_LOG_ENTRIES = 200
+FLUSH_INTERVAL_MS = 16  # höchstens ein View-Update pro Frame
 SUPPRESSED_PREFIXES = (
     "SectionCache", "Actor", "♻", "⏭", "🆕", "Edge actor",
     "TNP", "Mesh unchanged", "Cache", "[i18n]", "PERFORMANCE",
 )
 
+_LEVEL_ICONS = {"info": "\u2139", "success": "\u2713", "warning": "\u26A0", "error": "\u2715"}
+_LEVEL_COLORS = {"error": "#ff8888", "warning": "#e0b020", "success": "#70c070"}
+
+LEVEL_ROLE = Qt.UserRole
+MESSAGE_ROLE = Qt.UserRole + 1
+
+
+class LogEntry(NamedTuple):
+    level: str
+    message: str
+    display: str
+
+
+class LogListModel(QAbstractListModel):
+    """
+    Ring-Buffer der Log-Einträge als Qt-Model.
+
+    append() ist thread-sicher und sammelt nur in einer Pending-Queue;
+    die Übernahme ins Model (flush) passiert gebündelt im GUI-Thread,
+    höchstens einmal pro FLUSH_INTERVAL_MS. Zähler pro Level werden
+    beim Einfügen/Verdrängen inkrementell gepflegt.
+    """
+
+    flushed = Signal()           # nach jeder Übernahme von Pending-Einträgen
+    _flush_requested = Signal()  # Thread-übergreifend (queued) -> Timer-Start
+
+    def __init__(self, capacity: int = MAX_LOG_ENTRIES, parent=None):
+        super().__init__(parent)
+        self._capacity = capacity
+        self._entries = deque()
+        self._counts = Counter()
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+
+        self._font = QFont("Consolas", 9)
+        self._colors = {level: QColor(c) for level, c in _LEVEL_COLORS.items()}
+        self._default_color = QColor("#aaa")
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+        self._flush_requested.connect(self._flush_timer.start)
+
+    def append(self, level: str, message: str, display: str):
+        """Reiht einen Eintrag ein (aus beliebigem Thread)."""
+        with self._lock:
+            self._pending.append(LogEntry(level, message, display))
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self._flush_requested.emit()
+
+    def flush(self) -> int:
+        """Übernimmt alle Pending-Einträge in einem Schritt (GUI-Thread)."""
+        with self._lock:
+            batch = list(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+        if not batch:
+            return 0
+        batch = batch[-self._capacity:]
+
+        overflow = len(self._entries) + len(batch) - self._capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._counts[self._entries.popleft().level] -= 1
+            self.endRemoveRows()
+
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self._entries.extend(batch)
+        self._counts.update(entry.level for entry in batch)
+        self.endInsertRows()
+
+        self.flushed.emit()
+        return len(batch)
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+        self.beginResetModel()
+        self._entries.clear()
+        self._counts.clear()
+        self.endResetModel()
+        self.flushed.emit()
+
+    def level_count(self, level: str) -> int:
+        return self._counts[level]
+
+    def entry(self, row: int) -> LogEntry:
+        return self._entries[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            return entry.display
+        if role == Qt.ForegroundRole:
+            return self._colors.get(entry.level, self._default_color)
+        if role == Qt.FontRole:
+            return self._font
+        if role == LEVEL_ROLE:
+            return entry.level
+        if role == MESSAGE_ROLE:
+            return entry.message
+        return None
+
+
+class LogFilterProxyModel(QSortFilterProxyModel):
+    """Level-Filter + Volltextsuche über dem LogListModel (statt Items zu verstecken)."""
+
+    def __init__(self, filters: dict, parent=None):
+        super().__init__(parent)
+        self.filters = filters
+        self.search_text = ""
+
+    def set_search_text(self, text: str):
+        self._change_filter(lambda: setattr(self, 'search_text', text.lower()))
+
+    def set_level_enabled(self, level: str, enabled: bool):
+        self._change_filter(lambda: self.filters.__setitem__(level, enabled))
+
+    def _change_filter(self, apply):
+        # Qt >= 6.10: begin/endFilterChange, invalidateFilter ist dort deprecated
+        if hasattr(self, 'beginFilterChange'):
+            self.beginFilterChange()
+            apply()
+            self.endFilterChange()
+        else:
+            apply()
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        entry = self.sourceModel().entry(source_row)
+        if not self.filters.get(entry.level, True):
+            return False
+        return not self.search_text or self.search_text in entry.message.lower()
+
 
 class LogPanel(QFrame):
     """
@@ -23,12 +175,12 @@ class LogPanel(QFrame):
         super().__init__(parent)
         self.setStyleSheet("""
             QFrame { background: #1e1e1e; border-top: 1px solid #333; }
-            QListWidget {
+            QListView {
                 background: #1e1e1e; border: none;
                 font-family: Consolas, monospace; font-size: 10px;
             }
-            QListWidget::item { padding: 1px 0px; border-bottom: 1px solid #222; }
-            QListWidget::item:selected { background: #094771; }
+            QListView::item { padding: 1px 0px; border-bottom: 1px solid #222; }
+            QListView::item:selected { background: #094771; }
             QLabel { color: #888; font-weight: bold; font-size: 10px; }
             QToolButton {
                 background: transparent; border: 1px solid #333; border-radius: 2px; color: #888;
@@ -43,9 +195,12 @@ class LogPanel(QFrame):
             QLineEdit:focus { border-color: #0078d4; }
         """)
 
-        self._search_text = ""
-        self._setup_ui()
         self.filters = {"info": True, "success": True, "warning": True, "error": True}
+        self.model = LogListModel(MAX_LOG_ENTRIES, self)
+        self.proxy = LogFilterProxyModel(self.filters, self)
+        self.proxy.setSourceModel(self.model)
+        self.model.flushed.connect(self._on_flushed)
+        self._setup_ui()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -92,11 +247,12 @@ class LogPanel(QFrame):
         self._search.textChanged.connect(self._on_search_changed)
         layout.addWidget(self._search)
 
-        # --- List Widget ---
-        self.list_widget = QListWidget()
-        self.list_widget.setVerticalScrollMode(QListWidget.ScrollPerPixel)
-        self.list_widget.setUniformItemSizes(True)
-        layout.addWidget(self.list_widget)
+        # --- List View (Model/View, gefiltert über Proxy) ---
+        self.list_view = QListView()
+        self.list_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setModel(self.proxy)
+        layout.addWidget(self.list_view)
 
         # --- Counter Label ---
         self._counter = QLabel("")
@@ -117,33 +273,15 @@ class LogPanel(QFrame):
         return btn
 
     def _toggle_filter(self, level):
-        self.filters[level] = not self.filters[level]
-        self._refresh_visibility()
+        self.proxy.set_level_enabled(level, not self.filters[level])
+        self._update_counter()
 
     def _on_search_changed(self, text):
-        self._search_text = text.lower()
-        self._refresh_visibility()
-
-    def _refresh_visibility(self):
-        visible = 0
-        total = self.list_widget.count()
-        for i in range(total):
-            item = self.list_widget.item(i)
-            lvl = item.data(Qt.UserRole)
-            msg = item.data(Qt.UserRole + 1) or ""
-
-            level_ok = self.filters.get(lvl, True)
-            search_ok = not self._search_text or self._search_text in msg.lower()
-            show = level_ok and search_ok
-
-            item.setHidden(not show)
-            if show:
-                visible += 1
-
-        self._counter.setText(f"{visible}/{total}")
+        self.proxy.set_search_text(text)
+        self._update_counter()
 
     def add_message(self, level, message):
-        """Fügt eine Nachricht hinzu. Filtert debug-Spam."""
+        """Fügt eine Nachricht hinzu (thread-sicher, gebündelte Anzeige). Filtert debug-Spam."""
         if level in ["critical", "fatal"]:
             level = "error"
 
@@ -154,49 +292,27 @@ class LogPanel(QFrame):
             return
 
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-
-        colors = {
-            "info": "#0078d4",
-            "success": "#107c10",
-            "warning": "#ffb900",
-            "error": "#d13438"
-        }
-        color = colors.get(level, "#888")
-        icons = {"info": "\u2139", "success": "\u2713", "warning": "\u26A0", "error": "\u2715"}
-        icon_text = icons.get(level, "\u2022")
+        icon_text = _LEVEL_ICONS.get(level, "\u2022")
 
         # Kompakte einzeilige Darstellung statt Custom Widget
-        display = f"{timestamp}  {icon_text}  {message}"
-        item = QListWidgetItem(display)
-        item.setData(Qt.UserRole, level)
-        item.setData(Qt.UserRole + 1, message)
-
-        if level == "error":
-            item.setForeground(QColor("#ff8888"))
-        elif level == "warning":
-            item.setForeground(QColor("#e0b020"))
-        elif level == "success":
-            item.setForeground(QColor("#70c070"))
-        else:
-            item.setForeground(QColor("#aaa"))
+        self.model.append(level, message, f"{timestamp}  {icon_text}  {message}")
 
-        item.setFont(QFont("Consolas", 9))
+    def flush(self):
+        """Übernimmt wartende Nachrichten sofort (statt beim nächsten Frame)."""
+        self.model.flush()
 
-        self.list_widget.addItem(item)
-        item.setHidden(not self.filters.get(level, True))
-
-        # Limit
-        while self.list_widget.count() > MAX_LOG_ENTRIES:
-            self.list_widget.takeItem(0)
-
-        self.list_widget.scrollToBottom()
+    def _on_flushed(self):
+        self.list_view.scrollToBottom()
         self._update_counter()
 
     def _update_counter(self):
-        total = self.list_widget.count()
-        visible = sum(1 for i in range(total) if not self.list_widget.item(i).isHidden())
+        total = self.model.rowCount()
+        if self.proxy.search_text:
+            visible = self.proxy.rowCount()
+        else:
+            visible = sum(self.model.level_count(lvl) for lvl, on in self.filters.items() if on)
+            visible += total - sum(self.model.level_count(lvl) for lvl in self.filters)
         self._counter.setText(f"{visible}/{total}")
 
     def clear_log(self):
-        self.list_widget.clear()
-        self._update_counter()
+        self.model.clear()
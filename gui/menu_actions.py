@@ -310,8 +310,9 @@ class MenuActionsMixin:
                 if mesh_to_add is None and HAS_BUILD123D and hasattr(body, '_build123d_solid') and body._build123d_solid:
                     try:
                         from modeling.cad_tessellator import CADTessellator
+                        from modeling.export_kernel import export_solid
                         verts, faces_tris = CADTessellator.tessellate_for_export(
-                            body._build123d_solid,
+                            export_solid(body),
                             linear_deflection=linear_defl,
                             angular_tolerance=angular_tol
                         )
@@ -65,17 +65,6 @@ except ImportError:
         SmartSnapper = None
 
 
-try:
-    from gui.quadtree import QuadTree
-    logger.success("QuadTree Module loaded.")
-except ImportError:
-    # Fallback class if file is missing to prevent crash
-    class QuadTree:
-        def __init__(self, *args): pass
-        def insert(self, *args): pass
-        def query(self, *args): return []
-        def clear(self, *args): pass
-    logger.warning("QuadTree Module NOT found. Falling back to linear search.")
 
 
 _project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -84,6 +73,7 @@ if _project_root not in sys.path:
 
 from i18n import tr
 from sketcher import Sketch, Point2D, Line2D, Circle2D, Arc2D, Ellipse2D, Polygon2D, Constraint, ConstraintType
+from sketcher.spatial_index import KINDS_CURVES
 try:
     from gui.sketch_feedback import format_solver_failure_message
 except ImportError:
@@ -1262,147 +1252,18 @@ class SketchEditor(QWidget, SketchHandlersMixin, SketchRendererMixin):
 
     def _rebuild_spatial_index(self):
         """
-        Final Defensive Version: Audits geometry first, then rebuilds with strict casting.
-        """
-        import numpy as np
-        
-
-        # --- INTERNAL AUDIT FUNCTION ---
-        def audit_geometry(sketch):
-            """Checks for numpy types in geometry."""
-            problems = []
-            
-            def check(val, name):
-                if isinstance(val, (np.bool_, np.int64, np.float64, np.float32)):
-                    return f"{name}={val} ({type(val)})"
-                return None
-
-            for i, l in enumerate(sketch.lines):
-                err = check(l.start.x, f"L{i}.start.x")
-                if err: problems.append(err)
-                err = check(l.start.y, f"L{i}.start.y")
-                if err: problems.append(err)
-                err = check(l.end.x, f"L{i}.end.x")
-                if err: problems.append(err)
-                err = check(l.end.y, f"L{i}.end.y")
-                if err: problems.append(err)
-
-            return problems
-
-        # 1. RUN AUDIT
-        # If this logs errors, we know the source data is 'infected' with numpy types
-        #problems = audit_geometry(self.sketch)
-        #if problems:
-            #logger.warning(f"âš ï¸ Geometry contains NumPy types! First 3 issues: {problems[:3]}")
-            # We don't abort, because the casting below should handle it, but it's good to know.
-
-        # 2. STANDARD CHECKS
-        has_geo = (len(self.sketch.lines) > 0 or len(self.sketch.circles) > 0 or 
-                   len(self.sketch.arcs) > 0 or len(self.sketch.splines) > 0 or
-                   len(getattr(self.sketch, 'ellipses', [])) > 0)
-        
-        if not has_geo:
-            self.spatial_index = None
-            self.index_dirty = False
-            return
-
-        # 3. HELPER FOR CASTING
-        def to_float(v):
-            try:
-                if hasattr(v, 'item'): return self._safe_float(v.item())
-                return self._safe_float(v)
-            except Exception as e:
-                logger.debug(f"Float-Konvertierung fehlgeschlagen: {e}")
-                return 0.0
-
-        # 4. CALCULATE BOUNDS
-        min_x, min_y = self._safe_float('inf'), self._safe_float('inf')
-        max_x, max_y = self._safe_float('-inf'), self._safe_float('-inf')
-
-        for l in self.sketch.lines:
-            x1, y1 = to_float(l.start.x), to_float(l.start.y)
-            x2, y2 = to_float(l.end.x), to_float(l.end.y)
-            min_x = min(min_x, x1, x2); max_x = max(max_x, x1, x2)
-            min_y = min(min_y, y1, y2); max_y = max(max_y, y1, y2)
-            
-        for c in self.sketch.circles + self.sketch.arcs:
-            r = to_float(c.radius)
-            cx, cy = to_float(c.center.x), to_float(c.center.y)
-            min_x = min(min_x, cx - r); max_x = max(max_x, cx + r)
-            min_y = min(min_y, cy - r); max_y = max(max_y, cy + r)
-        
-        # Ellipsen Bounding Box (approximiert als max radius)
-        for e in getattr(self.sketch, 'ellipses', []):
-            rx = to_float(e.radius_x)
-            ry = to_float(e.radius_y)
-            r_max = max(rx, ry)
-            cx, cy = to_float(e.center.x), to_float(e.center.y)
-            min_x = min(min_x, cx - r_max); max_x = max(max_x, cx + r_max)
-            min_y = min(min_y, cy - r_max); max_y = max(max_y, cy + r_max)
-
-        for s in self.sketch.splines:
-             for cp in getattr(s, 'control_points', []):
-                 px, py = to_float(cp.point.x), to_float(cp.point.y)
-                 min_x = min(min_x, px); max_x = max(max_x, px)
-                 min_y = min(min_y, py); max_y = max(max_y, py)
-
-        if min_x == self._safe_float('inf'): min_x, max_x, min_y, max_y = -100.0, 100.0, -100.0, 100.0
-        
-        pad = 100.0
-        try:
-            # FORCE NATIVE FLOATS FOR QRECT
-            x1 = self._safe_float(min_x - pad)
-            y1 = self._safe_float(min_y - pad)
-            w = self._safe_float(max_x - min_x + 2*pad)
-            h = self._safe_float(max_y - min_y + 2*pad)
-            assert isinstance(x1, float) and not isinstance(x1, np.floating), \
-    f"x1 ist {type(x1)}, nicht Python float!"
-            root_rect = QRectF(x1, y1, w, h)
-            self.spatial_index = QuadTree(root_rect)
-        except Exception as e:
-            logger.critical(f"âŒ QuadTree init crashed: {e}")
-            return
-
-        # 5. INSERT GEOMETRY
-        for l in self.sketch.lines:
-            x1, y1 = to_float(l.start.x), to_float(l.start.y)
-            x2, y2 = to_float(l.end.x), to_float(l.end.y)
-            
-            # Manual Rect construction (safest)
-            lx = min(x1, x2) - 2.0
-            ly = min(y1, y2) - 2.0
-            lw = abs(x2 - x1) + 4.0
-            lh = abs(y2 - y1) + 4.0
-            
-            self.spatial_index.insert(l, QRectF(self._safe_float(lx), self._safe_float(ly), self._safe_float(lw), self._safe_float(lh)))
-
-        for c in self.sketch.circles + self.sketch.arcs:
-            cx, cy = to_float(c.center.x), to_float(c.center.y)
-            r = to_float(c.radius)
-            self.spatial_index.insert(c, QRectF(self._safe_float(cx-r), self._safe_float(cy-r), self._safe_float(2*r), self._safe_float(2*r)))
-        
-        # Ellipsen in Spatial Index
-        for e in getattr(self.sketch, 'ellipses', []):
-            cx, cy = to_float(e.center.x), to_float(e.center.y)
-            rx = to_float(e.radius_x)
-            ry = to_float(e.radius_y)
-            r_max = max(rx, ry)
-            self.spatial_index.insert(e, QRectF(self._safe_float(cx-r_max), self._safe_float(cy-r_max), self._safe_float(2*r_max), self._safe_float(2*r_max)))
-
-        for s in self.sketch.splines:
-             cps = getattr(s, 'control_points', [])
-             if not cps: continue
-             sx_min = min((to_float(cp.point.x) for cp in cps), default=0.0)
-             sx_max = max((to_float(cp.point.x) for cp in cps), default=0.0)
-             sy_min = min((to_float(cp.point.y) for cp in cps), default=0.0)
-             sy_max = max((to_float(cp.point.y) for cp in cps), default=0.0)
-             w = max(sx_max - sx_min, 0.1)
-             h = max(sy_max - sy_min, 0.1)
-             self.spatial_index.insert(s, QRectF(self._safe_float(sx_min), self._safe_float(sy_min), self._safe_float(w), self._safe_float(h)))
+        Holt den inkrementellen Spatial-Index des Sketches.
 
+        Der Index lebt am Sketch-Modell und wird nur für geänderte Entities
+        angepasst; nach direkten Koordinaten-Änderungen (Drag, index_dirty)
+        wird er einmal abgeglichen statt komplett neu gebaut.
+        """
+        if self.index_dirty:
+            self.spatial_index = self.sketch.refresh_spatial_index()
+        else:
+            self.spatial_index = self.sketch.spatial_index
         self.index_dirty = False
-       
-          
+
     def handle_option_changed(self, option: str, value):
         """Reagiert auf Ã„nderungen aus dem ToolPanel (Checkboxen)"""
         if option == "construction":
@@ -2099,6 +1960,7 @@ class SketchEditor(QWidget, SketchHandlersMixin, SketchRendererMixin):
         import numpy as np
 
         self.closed_profiles.clear()
+        self.sketch.mark_modified()
 
         # --- PHASE 1: Fast Welding (Coordinate Hashing) ---
         # ErhÃ¼ht auf 0.5mm fÃ¼r bessere DXF-KompatibilitÃ„t (Fusion nutzt Ã„hnliche Werte)
@@ -2895,7 +2757,7 @@ class SketchEditor(QWidget, SketchHandlersMixin, SketchRendererMixin):
             return w, SnapType.NONE, None  # <--- Drittes Element: Entity
 
         if self.snapper:
-            if self.index_dirty: self._rebuild_spatial_index()
+            self._rebuild_spatial_index()
             screen_pos = self.world_to_screen(w)
             res = self.snapper.snap(screen_pos)
             self.last_snap_diagnostic = getattr(res, "diagnostic", "") or ""
@@ -2995,6 +2857,8 @@ class SketchEditor(QWidget, SketchHandlersMixin, SketchRendererMixin):
         self.undo_stack.append(state)
         self.redo_stack.clear()
         if len(self.undo_stack) > self.max_undo: self.undo_stack.pop(0)
+        # Render-Cache: jede Undo-Aktion leitet eine Geometrie-Änderung ein
+        self.sketch.mark_modified()
 
         # Performance Optimization 1.6: Invalidiere Intersection Cache bei Geometrie-Ã„nderungen
         if self.snapper and hasattr(self.snapper, 'invalidate_intersection_cache'):
@@ -8769,14 +8633,13 @@ class SketchEditor(QWidget, SketchHandlersMixin, SketchRendererMixin):
         """
         Liefert alle treffenden Entitaeten an Position `pos`, sortiert nach Distanz + Prioritaet.
         """
-        if self.index_dirty:
-            self._rebuild_spatial_index()
+        self._rebuild_spatial_index()
 
         r_world = self.snap_radius / self.view_scale
         query_rect = QRectF(pos.x() - r_world, pos.y() - r_world, r_world * 2, r_world * 2)
 
         if self.spatial_index:
-            broad_candidates = list(self.spatial_index.query(query_rect))
+            broad_candidates = self.spatial_index.query(query_rect, kinds=KINDS_CURVES)
         else:
             ellipses = list(getattr(self.sketch, 'ellipses', []))
             broad_candidates = list(self.sketch.lines) + list(self.sketch.circles) + list(self.sketch.arcs) + ellipses + list(self.sketch.splines)
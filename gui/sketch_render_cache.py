@@ -0,0 +1,373 @@
+"""
+MashCad - Sketch Render Cache
+=============================
+
+Retained-Mode Cache für die 2D-Sketch-Geometrie.
+
+Problem: `_draw_geometry` hat bei jedem Paint-Event alle QPainterPaths in
+Bildschirm-Koordinaten neu aufgebaut (inkl. Arc-Sampling und Listen-Suche
+für die Selektion), `_draw_constraints` und `_draw_open_ends` haben alle
+Anker bzw. offenen Enden pro Frame neu berechnet - Pan/Zoom großer Sketches
+ruckelt.
+
+Lösung:
+- Statische Geometrie liegt pro Layer (normal/construction/fixed) als
+  QPainterPath in Welt-Koordinaten
+- Invalidierung über die Sketch-Revision (+ Entity-Anzahlen als Netz für
+  direkte Listen-Änderungen)
+- Beim Zeichnen wird nur die View-Matrix gesetzt; kosmetische Pens halten
+  die Linienbreite in Pixeln
+- Endpunkt-Marker liegen als QPolygonF vor und werden per drawPoints mit
+  rundem Pen gezeichnet - konstante Pixelgröße ohne Neuaufbau
+- Selektion/Hover/Highlight sind kleine Overlay-Layer pro Frame
+
+Verwendung:
+    key = render_cache_key(sketch)
+    if layers is None or layers.key != key:
+        layers = build_geometry_layers(sketch, key)
+    p.setTransform(view_transform(scale, offset, rotation))
+    p.drawPath(layers.normal)
+"""
+
+import math
+from typing import Hashable, List, Optional, Tuple
+
+from loguru import logger
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QPainterPath, QPen, QPolygonF, QTransform
+
+from sketcher import ConstraintType
+from sketcher.open_contours import OpenContourAnalysis
+
+
+ARC_STEP_DEG = 3.0           # ~3° pro Segment für glatte Bögen
+ELLIPSE_MIN_STEPS = 64
+ELLIPSE_MAX_STEPS = 256
+
+
+def render_cache_key(sketch) -> Hashable:
+    """Cache-Key eines Sketches: Identität, Revision und Entity-Anzahlen."""
+    return (
+        id(sketch),
+        getattr(sketch, 'revision', 0),
+        len(sketch.lines),
+        len(sketch.circles),
+        len(sketch.arcs),
+        len(getattr(sketch, 'ellipses', ())),
+        len(sketch.points),
+        len(sketch.splines),
+        len(getattr(sketch, 'native_splines', ())),
+        len(sketch.constraints),
+    )
+
+
+def view_transform(scale: float, offset: QPointF, rotation: int = 0) -> QTransform:
+    """
+    Welt -> Bildschirm als QTransform, identisch zu `world_to_screen`.
+
+    Rotation in 90°-Schritten wird vor Scale/Y-Flip/Offset angewendet.
+    """
+    s = float(scale)
+    # QTransform: x' = m11*x + m21*y + dx, y' = m12*x + m22*y + dy
+    if rotation == 90:
+        m11, m12, m21, m22 = 0.0, s, s, 0.0
+    elif rotation == 180:
+        m11, m12, m21, m22 = -s, 0.0, 0.0, s
+    elif rotation == 270:
+        m11, m12, m21, m22 = 0.0, -s, -s, 0.0
+    else:
+        m11, m12, m21, m22 = s, 0.0, 0.0, -s
+    return QTransform(m11, m12, m21, m22, float(offset.x()), float(offset.y()))
+
+
+def cosmetic(pen: QPen) -> QPen:
+    """Kopie des Pens, deren Breite unabhängig von der View-Matrix in Pixeln bleibt."""
+    pen = QPen(pen)
+    pen.setCosmetic(True)
+    return pen
+
+
+def arc_world_path(arc) -> Tuple[QPainterPath, QPointF, QPointF]:
+    """Arc als Polyline in Welt-Koordinaten, plus Start- und Endpunkt."""
+    sweep = arc.end_angle - arc.start_angle
+    while sweep < 0:
+        sweep += 360
+    while sweep > 360:
+        sweep -= 360
+    if sweep < 0.1:
+        sweep = 360  # Fast geschlossener Bogen
+
+    steps = max(16, int(sweep / ARC_STEP_DEG))
+    cx, cy, r = arc.center.x, arc.center.y, arc.radius
+
+    path = QPainterPath()
+    first = last = None
+    for i in range(steps + 1):
+        angle_rad = math.radians(arc.start_angle + sweep * i / steps)
+        last = QPointF(cx + r * math.cos(angle_rad), cy + r * math.sin(angle_rad))
+        if i == 0:
+            path.moveTo(last)
+            first = last
+        else:
+            path.lineTo(last)
+    return path, first, last
+
+
+def ellipse_world_path(ellipse) -> QPainterPath:
+    """Ellipse als geschlossene Polyline in Welt-Koordinaten (~1mm pro Segment)."""
+    circumference = 2 * math.pi * math.sqrt((ellipse.radius_x ** 2 + ellipse.radius_y ** 2) / 2)
+    steps = min(ELLIPSE_MAX_STEPS, max(ELLIPSE_MIN_STEPS, int(circumference)))
+
+    path = QPainterPath()
+    for i, (wx, wy) in enumerate(ellipse.get_curve_points(steps)):
+        if i == 0:
+            path.moveTo(wx, wy)
+        else:
+            path.lineTo(wx, wy)
+    path.closeSubpath()
+    return path
+
+
+def entity_world_path(entity) -> Optional[QPainterPath]:
+    """Welt-Path einer einzelnen Linie/Kreis/Arc/Ellipse (für Overlays), sonst None."""
+    path = QPainterPath()
+    if hasattr(entity, 'start') and hasattr(entity, 'end'):
+        path.moveTo(entity.start.x, entity.start.y)
+        path.lineTo(entity.end.x, entity.end.y)
+    elif hasattr(entity, 'radius_x') and hasattr(entity, 'get_curve_points'):
+        return ellipse_world_path(entity)
+    elif hasattr(entity, 'start_angle') and hasattr(entity, 'radius'):
+        return arc_world_path(entity)[0]
+    elif hasattr(entity, 'center') and hasattr(entity, 'radius'):
+        path.addEllipse(QPointF(entity.center.x, entity.center.y), entity.radius, entity.radius)
+    else:
+        return None
+    return path
+
+
+def spline_line_ids(sketch) -> set:
+    """ids der Linien, die Teil eines Splines sind (der Spline wird selbst gezeichnet)."""
+    ids = set()
+    for s in sketch.splines:
+        for line in getattr(s, '_lines', ()):
+            ids.add(id(line))
+    return ids
+
+
+class SketchGeometryLayers:
+    """Statische Layer eines Sketches in Welt-Koordinaten."""
+
+    def __init__(self, key: Hashable = None):
+        self.key = key
+        self.normal = QPainterPath()
+        self.construction = QPainterPath()
+        self.fixed = QPainterPath()
+        self.endpoints = QPolygonF()          # Linien-Endpunkte (r=2px)
+        self.arc_endpoints = QPolygonF()      # Arc-Endpunkte (r=3px)
+        self.fixed_points = QPolygonF()       # Fixierte Punkte (r=4px)
+        self.standalone_points: List = []
+        self.ellipse_handles: List = []
+        self.splines: List[Tuple[object, QPainterPath]] = []
+        self.native_splines: List[QPainterPath] = []
+        self.hidden_line_ids: set = set()
+
+
+def _layer_for(layers: SketchGeometryLayers, entity) -> QPainterPath:
+    if entity.construction:
+        return layers.construction
+    if getattr(entity, 'fixed', False):
+        return layers.fixed
+    return layers.normal
+
+
+def build_geometry_layers(sketch, key: Hashable = None) -> SketchGeometryLayers:
+    """Baut alle statischen Layer eines Sketches (einmal pro Revision)."""
+    layers = SketchGeometryLayers(key)
+    layers.hidden_line_ids = spline_line_ids(sketch)
+
+    for line in sketch.lines:
+        if id(line) in layers.hidden_line_ids:
+            continue
+        path = _layer_for(layers, line)
+        path.moveTo(line.start.x, line.start.y)
+        path.lineTo(line.end.x, line.end.y)
+
+        if getattr(line, '_suppress_endpoint_markers', False):
+            continue
+        for pt in (line.start, line.end):
+            target = layers.fixed_points if getattr(pt, 'fixed', False) else layers.endpoints
+            target.append(QPointF(pt.x, pt.y))
+
+    for c in sketch.circles:
+        _layer_for(layers, c).addEllipse(QPointF(c.center.x, c.center.y), c.radius, c.radius)
+
+    for arc in sketch.arcs:
+        path, first, last = arc_world_path(arc)
+        _layer_for(layers, arc).addPath(path)
+        layers.arc_endpoints.append(first)
+        layers.arc_endpoints.append(last)
+
+    for ellipse in getattr(sketch, 'ellipses', ()) or ():
+        _layer_for(layers, ellipse).addPath(ellipse_world_path(ellipse))
+
+    for pt in sketch.points:
+        if getattr(pt, 'standalone', False):
+            layers.standalone_points.append(pt)
+        if getattr(pt, '_ellipse_handle', None):
+            layers.ellipse_handles.append(pt)
+
+    for spline in sketch.splines:
+        lines = spline.to_lines(segments_per_span=10) if hasattr(spline, 'to_lines') else []
+        if not lines:
+            continue
+        path = QPainterPath()
+        path.moveTo(lines[0].start.x, lines[0].start.y)
+        for line in lines:
+            path.lineTo(line.end.x, line.end.y)
+        layers.splines.append((spline, path))
+
+    for spline in getattr(sketch, 'native_splines', ()) or ():
+        if spline.construction:
+            continue
+        try:
+            lines = spline.to_lines(segments=50)
+        except Exception as e:
+            logger.debug(f"Native Spline Rendering fehlgeschlagen: {e}")
+            continue
+        if not lines:
+            continue
+        path = QPainterPath()
+        path.moveTo(lines[0].start.x, lines[0].start.y)
+        for line in lines:
+            path.lineTo(line.end.x, line.end.y)
+        layers.native_splines.append(path)
+
+    return layers
+
+
+def find_open_ends(sketch, cached: bool = True) -> List[QPointF]:
+    """
+    Endpunkte von Linien/Bögen, die nicht geschlossen sind (Welt-Koordinaten).
+
+    Ein Punkt gilt als geschlossen, wenn er mit einem anderen Endpunkt
+    übereinstimmt, auf einem Kreis liegt oder auf einer Linie (T-Kreuzung).
+    Die Analyse liegt pro Revision am Sketch (`Sketch.open_contours`);
+    `cached=False` rechnet neu (z.B. während eines Drags ohne Revision).
+    """
+    if cached and hasattr(sketch, 'open_contours'):
+        analysis = sketch.open_contours
+    else:
+        analysis = OpenContourAnalysis(sketch)
+    return [QPointF(float(x), float(y)) for x, y in analysis.open_ends]
+
+
+# Constraint-Typen mit Symbol an der Linienmitte (Typ -> Anzahl Linien)
+_LINE_ICON_TYPES = {
+    ConstraintType.HORIZONTAL: 1,
+    ConstraintType.VERTICAL: 1,
+    ConstraintType.PARALLEL: 2,
+    ConstraintType.PERPENDICULAR: 2,
+    ConstraintType.EQUAL_LENGTH: 2,
+}
+
+
+def _visibility_probe(entity) -> Optional[Tuple[QPointF, float]]:
+    """(Welt-Punkt, Radius) für den Viewport-Test einer Entity; Radius 0 = reiner Punkt-Test."""
+    if hasattr(entity, 'start') and hasattr(entity, 'end'):  # Line
+        mid = entity.midpoint
+        return QPointF(mid.x, mid.y), 0.0
+    if hasattr(entity, 'center'):  # Circle/Arc
+        return QPointF(entity.center.x, entity.center.y), float(getattr(entity, 'radius', 0) or 0)
+    if hasattr(entity, 'x') and hasattr(entity, 'y'):  # Point2D
+        x, y = (entity.x(), entity.y()) if callable(entity.x) else (entity.x, entity.y)
+        return QPointF(x, y), 0.0
+    return None
+
+
+def _tangent_anchor(entities) -> Optional[QPointF]:
+    """Berührpunkt eines TANGENT-Constraints (Line-Circle oder Kreis-Kreis)."""
+    line_entity = None
+    circle_entity = None
+    for e in entities[:2]:
+        if hasattr(e, 'start') and hasattr(e, 'end'):
+            line_entity = e
+        elif hasattr(e, 'center') and hasattr(e, 'radius'):
+            circle_entity = e
+
+    if line_entity and circle_entity:
+        # Nächster Punkt auf der Linie zum Kreismittelpunkt
+        cx, cy = circle_entity.center.x, circle_entity.center.y
+        x1, y1 = line_entity.start.x, line_entity.start.y
+        dx, dy = line_entity.end.x - x1, line_entity.end.y - y1
+        line_len_sq = dx * dx + dy * dy
+        if line_len_sq > 1e-10:
+            t = max(0, min(1, ((cx - x1) * dx + (cy - y1) * dy) / line_len_sq))
+            return QPointF(x1 + t * dx, y1 + t * dy)
+        return QPointF(x1, y1)
+    if circle_entity:
+        return QPointF(circle_entity.center.x, circle_entity.center.y)
+    return None
+
+
+def build_constraint_anchors(constraints) -> List[Tuple]:
+    """
+    Welt-Anker aller Constraint-Symbole (einmal pro Revision).
+
+    Returns:
+        Liste von (constraint, probes, anchors, extra):
+        probes = [(QPointF, radius)] für den Viewport-Test,
+        anchors = [(line_id | None, QPointF)] Symbol-Positionen,
+        extra = Typ-spezifische Daten (z.B. Radius und Anzeigewert)
+    """
+    entries = []
+    for c in constraints:
+        if not c.entities:
+            continue
+        try:
+            probes = [probe for probe in map(_visibility_probe, c.entities) if probe is not None]
+            anchors = []
+            extra = None
+
+            n_lines = _LINE_ICON_TYPES.get(c.type)
+            if n_lines is not None:
+                if len(c.entities) < n_lines:
+                    continue
+                for line in c.entities[:n_lines]:
+                    mid = line.midpoint
+                    anchors.append((line.id, QPointF(mid.x, mid.y)))
+
+            elif c.type == ConstraintType.TANGENT and len(c.entities) >= 2:
+                anchor = _tangent_anchor(c.entities)
+                if anchor is None:
+                    continue
+                anchors.append((None, anchor))
+
+            elif c.type == ConstraintType.LENGTH:
+                if not c.value:
+                    continue
+                line = c.entities[0]
+                anchors.append((None, QPointF(line.start.x, line.start.y)))
+                anchors.append((None, QPointF(line.end.x, line.end.y)))
+
+            elif c.type == ConstraintType.RADIUS:
+                circle = c.entities[0]
+                if c.value is None or c.value == 0:
+                    logger.warning(f"[Constraints] RADIUS constraint has no value: {c}")
+                display_value = c.value if (c.value is not None and c.value != 0) else getattr(circle, 'radius', None)
+                if display_value is None:
+                    continue
+                anchors.append((None, QPointF(circle.center.x, circle.center.y)))
+                extra = (circle.radius, display_value)
+
+            elif c.type == ConstraintType.CONCENTRIC and len(c.entities) >= 2:
+                for circ in c.entities[:2]:
+                    if hasattr(circ, 'center'):
+                        anchors.append((None, QPointF(circ.center.x, circ.center.y)))
+
+            else:
+                continue
+
+            entries.append((c, probes, anchors, extra))
+        except Exception:
+            pass  # Ungültige Constraints werden nicht gezeichnet
+    return entries
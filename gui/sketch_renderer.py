@@ -6,6 +6,7 @@ Extracted from sketch_editor.py for better maintainability
 
 import math
 import time
+from itertools import chain
 from loguru import logger
 from PySide6.QtCore import QPointF, Qt, QRectF
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QPainterPath, QFont, QPolygonF, QFontMetrics
@@ -35,6 +36,16 @@ try:
 except ImportError:
     from design_tokens import DesignTokens
 
+from gui.sketch_render_cache import (
+    build_constraint_anchors,
+    build_geometry_layers,
+    cosmetic,
+    entity_world_path,
+    find_open_ends,
+    render_cache_key,
+    view_transform,
+)
+
 class SketchRendererMixin:
     """Mixin containing all drawing methods for SketchEditor"""
     def _is_item_visible(self, item_rect, update_rect):
@@ -498,397 +509,177 @@ class SketchRendererMixin:
         p.setPen(DesignTokens.COLOR_AXIS_Y)
         p.drawText(indicator_x - 60, indicator_y + 25, f"Sketch oben  → Welt {y_world}")
 
-    def _draw_open_ends(self, p):
+    def _render_cache_key(self):
         """
-        Zeichnet rote Markierungen an Punkten, die nicht geschlossen sind.
-        Hilft dem User zu erkennen, warum eine Fläche nicht gefüllt wird.
+        Cache-Key der statischen Layer oder None während eines Drags.
 
-        Ein Punkt gilt als "geschlossen" wenn:
-        - Er mit mindestens einem anderen Endpunkt übereinstimmt (Count >= 2)
-        - ODER er auf einem Kreis liegt (Toleranz-basiert)
-        - ODER er auf einer Linie liegt (T-Kreuzung)
+        Beim Drag ändern sich Koordinaten ohne Revisions-Sprung - dann wird
+        pro Frame neu gebaut (wie vor dem Cache).
         """
-        import math
-
-        TOLERANCE = 0.5  # 0.5mm Toleranz für Punkt-auf-Geometrie
-
-        # Alle Endpunkte von Linien und Bögen sammeln
-        endpoints = []
-        for l in self.sketch.lines:
-            if not l.construction and not bool(getattr(l, "_suppress_endpoint_markers", False)):
-                endpoints.append(l.start)
-                endpoints.append(l.end)
-        for a in self.sketch.arcs:
-            if not a.construction:
-                endpoints.append(a.start_point)
-                endpoints.append(a.end_point)
-
-        # Dictionary um zu zählen wie oft ein Punkt vorkommt
-        coord_counts = {}
-        ENDPOINT_TOLERANCE_DECIMALS = 1  # 0.1mm für Endpunkt-Matching
-
-        for pt in endpoints:
-            key = (round(pt.x, ENDPOINT_TOLERANCE_DECIMALS), round(pt.y, ENDPOINT_TOLERANCE_DECIMALS))
-            coord_counts[key] = coord_counts.get(key, 0) + 1
-
-        def point_on_circle(pt, circle, tol):
-            """Prüft ob Punkt auf Kreisumfang liegt."""
-            dist = math.hypot(pt.x - circle.center.x, pt.y - circle.center.y)
-            return abs(dist - circle.radius) < tol
-
-        def point_on_line(pt, line, tol):
-            """Prüft ob Punkt auf Linie liegt (nicht nur Endpunkte)."""
-            # Distanz Punkt zu Liniensegment
-            x1, y1 = line.start.x, line.start.y
-            x2, y2 = line.end.x, line.end.y
-            px, py = pt.x, pt.y
-
-            dx, dy = x2 - x1, y2 - y1
-            length_sq = dx*dx + dy*dy
-            if length_sq < 1e-10:
-                return False
-
-            t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / length_sq))
-            closest_x = x1 + t * dx
-            closest_y = y1 + t * dy
-            dist = math.hypot(px - closest_x, py - closest_y)
-
-            # Nur als "auf Linie" zählen wenn NICHT an den Endpunkten
-            if t > 0.01 and t < 0.99 and dist < tol:
-                return True
-            return False
-
-        # Zeichne rote Punkte für "einsame" Enden
-        p.setPen(Qt.NoPen)
-        p.setBrush(QBrush(QColor(255, 0, 50, 180)))
-
-        for pt in endpoints:
-            key = (round(pt.x, ENDPOINT_TOLERANCE_DECIMALS), round(pt.y, ENDPOINT_TOLERANCE_DECIMALS))
+        if getattr(self, '_direct_edit_dragging', False) or getattr(self, 'spline_dragging', False):
+            return None
+        return render_cache_key(self.sketch)
 
-            # Bereits verbunden durch anderen Endpunkt?
-            if coord_counts[key] >= 2:
-                continue
+    def _view_transform(self):
+        """Aktuelle View-Matrix (Welt -> Bildschirm) als QTransform."""
+        return view_transform(self.view_scale, self.view_offset, getattr(self, 'view_rotation', 0))
 
-            # Liegt auf einem Kreis?
-            on_circle = False
-            for circle in self.sketch.circles:
-                if not circle.construction and point_on_circle(pt, circle, TOLERANCE):
-                    on_circle = True
-                    break
+    def _geometry_layers(self):
+        """Statische Welt-Layer, neu gebaut nur bei geänderter Sketch-Revision."""
+        key = self._render_cache_key()
+        layers = getattr(self, '_geometry_layer_cache', None)
+        if key is None or layers is None or layers.key != key:
+            layers = build_geometry_layers(self.sketch, key)
+            self._geometry_layer_cache = layers
+        return layers
 
-            if on_circle:
-                continue
+    def _draw_open_ends(self, p):
+        """
+        Zeichnet rote Markierungen an Punkten, die nicht geschlossen sind.
+        Hilft dem User zu erkennen, warum eine Fläche nicht gefüllt wird.
 
-            # Liegt auf einer Linie (T-Kreuzung)?
-            on_line = False
-            for line in self.sketch.lines:
-                if not line.construction and not bool(getattr(line, "_suppress_endpoint_markers", False)):
-                    # Nicht die eigene Linie prüfen
-                    if pt != line.start and pt != line.end:
-                        if point_on_line(pt, line, TOLERANCE):
-                            on_line = True
-                            break
-
-            if on_line:
-                continue
+        Die offenen Enden kommen pro Sketch-Revision aus `Sketch.open_contours`
+        (geteilt mit dem Profil-Detektor), pro Frame werden nur die Marker
+        transformiert. Während eines Drags wird ungecacht neu berechnet.
+        """
+        key = self._render_cache_key()
+        cached = getattr(self, '_open_ends_cache', None)
+        if key is None or cached is None or cached[0] != key:
+            cached = (key, find_open_ends(self.sketch, cached=key is not None))
+            self._open_ends_cache = cached
+
+        open_ends = cached[1]
+        if not open_ends:
+            return
 
-            # Wirklich ein offenes Ende!
-            screen_pos = self.world_to_screen(QPointF(pt.x, pt.y))
+        xf = self._view_transform()
+        fill = QBrush(QColor(255, 0, 50, 180))
+        ring = QPen(QColor(255, 0, 0), 1)
+        for world_pt in open_ends:
+            screen_pos = xf.map(world_pt)
+            p.setPen(Qt.NoPen)
+            p.setBrush(fill)
             p.drawEllipse(screen_pos, 5, 5)
-            p.setPen(QPen(QColor(255, 0, 0), 1))
+            p.setPen(ring)
             p.setBrush(Qt.NoBrush)
             p.drawEllipse(screen_pos, 10, 10)
-            p.setPen(Qt.NoPen)
-            p.setBrush(QBrush(QColor(255, 0, 50, 180)))
-                
+
+    def _draw_point_markers(self, p, points, radius, outline, fill=None):
+        """
+        Runde Marker konstanter Pixelgröße an Welt-Punkten.
+
+        Läuft unter der View-Matrix: ein kosmetischer Pen mit RoundCap macht
+        aus drawPoints einen Kreis mit Durchmesser = Pen-Breite.
+        """
+        if points.isEmpty():
+            return
+        pen = QPen(outline, 2 * radius + 1, Qt.SolidLine, Qt.RoundCap)
+        pen.setCosmetic(True)
+        p.setPen(pen)
+        p.drawPoints(points)
+        if fill is not None:
+            pen = QPen(fill, 2 * radius - 1, Qt.SolidLine, Qt.RoundCap)
+            pen.setCosmetic(True)
+            p.setPen(pen)
+            p.drawPoints(points)
+
     def _draw_geometry(self, p, update_rect=None):
         """
-        Ultimate Performance Render:
-        1. Culling: Ignoriert alles außerhalb von update_rect.
-        2. Batching: Sammelt Geometrie in QPainterPaths.
+        Retained-Mode Render:
+        1. Statische Layer (normal/construction/fixed) kommen gecacht in
+           Welt-Koordinaten, gezeichnet unter der View-Matrix (Pan/Zoom baut
+           keinen Path neu).
+        2. Selektion, Hover und Constraint-Highlight sind kleine Overlays
+           über den statischen Layern.
+        Culling übernimmt das Clip-Rect des Painters.
         """
-        
-        # --- 0. Vorbereitung ---
-        path_normal = QPainterPath()
-        path_construction = QPainterPath()
-        path_fixed = QPainterPath()
-        path_selected = QPainterPath()
-        path_hover = QPainterPath()
-        path_glow = QPainterPath()
-        path_endpoints = QPainterPath()
-        path_fixed_points = QPainterPath()
-        path_constraint_highlight = QPainterPath()  # Für 2-Entity Constraint Auswahl
+        layers = self._geometry_layers()
+        xf = self._view_transform()
 
-        # Constraint Highlight Entity (falls aktiv)
+        # --- 1. Overlays (nur selektierte/gehoverte Entities) ---
         highlight_entity = getattr(self, '_constraint_highlighted_entity', None)
+        hovered = self.hovered_entity
+        hidden = layers.hidden_line_ids
 
-        def is_visible(bounds):
-            if update_rect is None: return True
-            return update_rect.intersects(bounds)
-
-        # Spline-Linien sammeln, um sie NICHT doppelt zu zeichnen (verhindert "schwarze Fläche")
-        spline_lines_ids = set()
-        for s in self.sketch.splines:
-            if hasattr(s, '_lines'):
-                for l in s._lines: spline_lines_ids.add(id(l))
-
-        # --- 1. Linien sammeln ---
-        for line in self.sketch.lines:
-            # Überspringe Linien, die Teil eines Splines sind (wir zeichnen den Spline selbst)
-            if id(line) in spline_lines_ids: 
-                continue
-
-            bounds = self._get_line_bounds(line)
-            if not is_visible(bounds): continue
-
-            p1 = self.world_to_screen(line.start)
-            p2 = self.world_to_screen(line.end)
-            
-            is_sel = line in self.selected_lines
-            is_hov = self.hovered_entity == line
-            is_fixed = getattr(line, 'fixed', False)
-            is_constraint_highlight = (highlight_entity is not None and line is highlight_entity)
-
-            if is_constraint_highlight:
-                path_constraint_highlight.moveTo(p1)
-                path_constraint_highlight.lineTo(p2)
-            elif is_sel:
-                path_selected.moveTo(p1)
-                path_selected.lineTo(p2)
-                path_glow.moveTo(p1)
-                path_glow.lineTo(p2)
-            elif is_hov:
-                path_hover.moveTo(p1)
-                path_hover.lineTo(p2)
-            elif line.construction:
-                path_construction.moveTo(p1)
-                path_construction.lineTo(p2)
-            elif is_fixed:
-                path_fixed.moveTo(p1)
-                path_fixed.lineTo(p2)
-            else:
-                path_normal.moveTo(p1)
-                path_normal.lineTo(p2)
+        path_selected = QPainterPath()
+        path_hover = QPainterPath()
+        path_constraint_highlight = QPainterPath()  # Für 2-Entity Constraint Auswahl
 
-            if bool(getattr(line, "_suppress_endpoint_markers", False)):
+        selected_ids = set()
+        for entity in chain(self.selected_lines, self.selected_circles, self.selected_arcs,
+                            getattr(self, 'selected_ellipses', ()) or ()):
+            if id(entity) in hidden or id(entity) in selected_ids or entity is highlight_entity:
                 continue
+            selected_ids.add(id(entity))
+            path = entity_world_path(entity)
+            if path is not None:
+                path_selected.addPath(path)
+
+        if hovered is not None and id(hovered) not in selected_ids and id(hovered) not in hidden \
+                and hovered is not highlight_entity:
+            path = entity_world_path(hovered)
+            if path is not None:
+                path_hover.addPath(path)
+
+        if highlight_entity is not None and id(highlight_entity) not in hidden:
+            path = entity_world_path(highlight_entity)
+            if path is not None:
+                path_constraint_highlight.addPath(path)
+
+        # --- 2. ZEICHNEN (Welt-Koordinaten, kosmetische Pens) ---
+        p.save()
+        p.setTransform(xf, True)
+        p.setBrush(Qt.NoBrush)
 
-            for pt, screen_pt in [(line.start, p1), (line.end, p2)]:
-                if hasattr(pt, 'fixed') and pt.fixed:
-                    path_fixed_points.addEllipse(screen_pt, 4, 4)
-                else:
-                    path_endpoints.addEllipse(screen_pt, 2, 2)
-
-        # --- 2. Kreise sammeln ---
-        for c in self.sketch.circles:
-            bounds = self._get_circle_bounds(c)
-            if not is_visible(bounds): continue
-
-            ctr = self.world_to_screen(c.center)
-            r = c.radius * self.view_scale
-            
-            is_sel = c in self.selected_circles
-            is_hov = self.hovered_entity == c
-            is_fixed = getattr(c, 'fixed', False)
-            is_constraint_highlight = (highlight_entity is not None and c is highlight_entity)
-
-            if is_constraint_highlight:
-                path_constraint_highlight.addEllipse(ctr, r, r)
-            elif is_sel:
-                path_selected.addEllipse(ctr, r, r)
-                path_glow.addEllipse(ctr, r, r)
-            elif is_hov:
-                path_hover.addEllipse(ctr, r, r)
-            elif c.construction:
-                path_construction.addEllipse(ctr, r, r)
-            elif is_fixed:
-                path_fixed.addEllipse(ctr, r, r)
-            else:
-                path_normal.addEllipse(ctr, r, r)
-
-        # --- 3. Arcs sammeln (Point-Based Method - keine Winkel-Mathe-Probleme) ---
-        for arc in self.sketch.arcs:
-            bounds = self._get_arc_bounds(arc)
-            if not is_visible(bounds): continue
-
-            # Point-based Ansatz: Arc als Polyline durch gesampelte Punkte
-            # Das vermeidet alle Winkel-Konvertierungsprobleme mit Qt
-            sweep = arc.end_angle - arc.start_angle
-            # Normalisiere auf positive Werte für korrekten Bogen
-            while sweep < 0:
-                sweep += 360
-            while sweep > 360:
-                sweep -= 360
-            if sweep < 0.1:
-                sweep = 360  # Fast geschlossener Bogen
-
-            # Anzahl Segmente basierend auf Sweep (mehr = glatter)
-            steps = max(16, int(sweep / 3))  # ~3° pro Segment für glatten Bogen
-
-            temp_path = QPainterPath()
-            first_point = None
-            last_point = None
-
-            for i in range(steps + 1):
-                t = i / steps
-                angle_rad = math.radians(arc.start_angle + sweep * t)
-                world_pt = QPointF(
-                    arc.center.x + arc.radius * math.cos(angle_rad),
-                    arc.center.y + arc.radius * math.sin(angle_rad)
-                )
-                screen_pt = self.world_to_screen(world_pt)
-
-                if i == 0:
-                    temp_path.moveTo(screen_pt)
-                    first_point = screen_pt
-                else:
-                    temp_path.lineTo(screen_pt)
-                last_point = screen_pt
-
-            # --- Zuweisung zu Styles ---
-            is_sel = arc in self.selected_arcs
-            is_hov = self.hovered_entity == arc
-            is_fixed = getattr(arc, 'fixed', False)
-            is_constraint_highlight = (highlight_entity is not None and arc is highlight_entity)
-
-            if is_constraint_highlight:
-                path_constraint_highlight.addPath(temp_path)
-            elif is_sel:
-                path_selected.addPath(temp_path)
-                path_glow.addPath(temp_path)
-            elif is_hov:
-                path_hover.addPath(temp_path)
-            elif arc.construction:
-                path_construction.addPath(temp_path)
-            elif is_fixed:
-                path_fixed.addPath(temp_path)
-            else:
-                path_normal.addPath(temp_path)
-
-            # Endpunkte zeichnen
-            if first_point:
-                path_endpoints.addEllipse(first_point, 3, 3)
-            if last_point:
-                path_endpoints.addEllipse(last_point, 3, 3)
-
-        # --- 3b. Ellipsen sammeln (Native Ellipse2D - glatte Kurven) ---
-        if hasattr(self.sketch, 'ellipses') and self.sketch.ellipses:
-            for ellipse in self.sketch.ellipses:
-                # Bounding box für culling (approximiert als Rechteck)
-                max_r = max(ellipse.radius_x, ellipse.radius_y)
-                c = self.world_to_screen(QPointF(ellipse.center.x, ellipse.center.y))
-                r_screen = max_r * self.view_scale
-                bounds = QRectF(c.x() - r_screen, c.y() - r_screen, 2*r_screen, 2*r_screen).adjusted(-10, -10, 10, 10)
-                if not is_visible(bounds): 
-                    continue
-
-                # Ellipse als Polyline für glatte Darstellung
-                # Mehr Segmente für sehr flache Ellipsen
-                circumference_approx = 2 * math.pi * math.sqrt((ellipse.radius_x**2 + ellipse.radius_y**2) / 2)
-                steps = max(64, int(circumference_approx * self.view_scale / 5))  # ~5px pro Segment
-                steps = min(steps, 256)  # Cap bei 256 für Performance
+        if not layers.construction.isEmpty():
+            p.setPen(cosmetic(DesignTokens.pen_geo_construction()))
+            p.drawPath(layers.construction)
 
-                temp_path = QPainterPath()
-                curve_points = ellipse.get_curve_points(steps)
-                
-                for i, (wx, wy) in enumerate(curve_points):
-                    screen_pt = self.world_to_screen(QPointF(wx, wy))
-                    if i == 0:
-                        temp_path.moveTo(screen_pt)
-                    else:
-                        temp_path.lineTo(screen_pt)
-                # Schließen
-                temp_path.closeSubpath()
-
-                # Style zuweisen
-                is_sel = getattr(self, 'selected_ellipses', set()) and ellipse in self.selected_ellipses
-                is_hov = self.hovered_entity == ellipse
-                is_fixed = getattr(ellipse, 'fixed', False)
-                is_constraint_highlight = (highlight_entity is not None and ellipse is highlight_entity)
-
-                if is_constraint_highlight:
-                    path_constraint_highlight.addPath(temp_path)
-                elif is_sel:
-                    path_selected.addPath(temp_path)
-                    path_glow.addPath(temp_path)
-                elif is_hov:
-                    path_hover.addPath(temp_path)
-                elif ellipse.construction:
-                    path_construction.addPath(temp_path)
-                elif is_fixed:
-                    path_fixed.addPath(temp_path)
-                else:
-                    path_normal.addPath(temp_path)
+        if not layers.fixed.isEmpty():
+            p.setPen(cosmetic(QPen(DesignTokens.COLOR_GEO_FIXED, 1.5)))
+            p.drawPath(layers.fixed)
 
-        # --- 4. ZEICHNEN ---
+        if not layers.normal.isEmpty():
+            p.setPen(cosmetic(DesignTokens.pen_geo_normal()))
+            p.drawPath(layers.normal)
 
-        if not path_glow.isEmpty():
+        if not path_selected.isEmpty():
             glow_color = QColor(DesignTokens.COLOR_GEO_SELECTED)
             glow_color.setAlpha(60)
-            glow_pen = QPen(glow_color, 6, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-            p.setPen(glow_pen)
-            p.setBrush(Qt.NoBrush)
-            p.drawPath(path_glow)
-
-        if not path_construction.isEmpty():
-            p.setPen(DesignTokens.pen_geo_construction())
-            p.setBrush(Qt.NoBrush)
-            p.drawPath(path_construction)
-            
-        if not path_fixed.isEmpty():
-            pen = QPen(DesignTokens.COLOR_GEO_FIXED, 1.5)
-            p.setPen(pen)
-            p.setBrush(Qt.NoBrush)
-            p.drawPath(path_fixed)
-
-        if not path_normal.isEmpty():
-            p.setPen(DesignTokens.pen_geo_normal())
-            p.setBrush(Qt.NoBrush)
-            p.drawPath(path_normal)
+            p.setPen(cosmetic(QPen(glow_color, 6, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)))
+            p.drawPath(path_selected)
 
         if not path_hover.isEmpty():
-            pen = QPen(DesignTokens.COLOR_GEO_HOVER, 2.5)
-            p.setPen(pen)
-            p.setBrush(Qt.NoBrush)
+            p.setPen(cosmetic(QPen(DesignTokens.COLOR_GEO_HOVER, 2.5)))
             p.drawPath(path_hover)
 
         # Constraint Highlight (Cyan, dick, für 2-Entity Constraint Auswahl)
         if not path_constraint_highlight.isEmpty():
             highlight_color = getattr(self, '_constraint_highlight_color', QColor(0, 255, 255))
-            pen = QPen(highlight_color, 3.5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-            p.setPen(pen)
-            p.setBrush(Qt.NoBrush)
+            p.setPen(cosmetic(QPen(highlight_color, 3.5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)))
             p.drawPath(path_constraint_highlight)
             # Glow-Effekt für bessere Sichtbarkeit
             glow_color = QColor(highlight_color)
             glow_color.setAlpha(80)
-            p.setPen(QPen(glow_color, 8, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+            p.setPen(cosmetic(QPen(glow_color, 8, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)))
             p.drawPath(path_constraint_highlight)
 
         if not path_selected.isEmpty():
-            p.setPen(DesignTokens.pen_geo_selected())
-            p.setBrush(Qt.NoBrush)
+            p.setPen(cosmetic(DesignTokens.pen_geo_selected()))
             p.drawPath(path_selected)
 
-        if not path_endpoints.isEmpty():
-            p.setPen(QPen(DesignTokens.COLOR_GEO_BODY, 1)) 
-            p.setBrush(DesignTokens.COLOR_BG_CANVAS)
-            p.drawPath(path_endpoints)
-            
-        if not path_fixed_points.isEmpty():
-            p.setPen(QPen(DesignTokens.COLOR_GEO_FIXED, 2))
-            p.setBrush(DesignTokens.COLOR_GEO_FIXED)
-            p.drawPath(path_fixed_points)
-
-        # --- 4b. Standalone Punkte zeichnen (Point Tool) ---
-        for pt in self.sketch.points:
-            # Nur standalone Punkte (nicht Linien-Endpunkte)
-            if not getattr(pt, 'standalone', False):
-                continue
+        # Endpunkte (konstante Pixelgröße, gecachte Welt-Punkte)
+        self._draw_point_markers(p, layers.endpoints, 2, DesignTokens.COLOR_GEO_BODY, DesignTokens.COLOR_BG_CANVAS)
+        self._draw_point_markers(p, layers.arc_endpoints, 3, DesignTokens.COLOR_GEO_BODY, DesignTokens.COLOR_BG_CANVAS)
+        self._draw_point_markers(p, layers.fixed_points, 4, DesignTokens.COLOR_GEO_FIXED)
+        p.restore()
 
-            screen_pt = self.world_to_screen(QPointF(pt.x, pt.y))
-            is_sel = pt in self.selected_points
-            is_hov = self.hovered_entity == pt
+        # --- 2b. Standalone Punkte zeichnen (Point Tool) ---
+        selected_points = {id(pt) for pt in self.selected_points}
+        for pt in layers.standalone_points:
+            screen_pt = xf.map(QPointF(pt.x, pt.y))
+            is_sel = id(pt) in selected_points
+            is_hov = hovered is pt
 
             # Farbe basierend auf Zustand
             if is_sel:
@@ -916,14 +707,11 @@ class SketchRendererMixin:
             p.drawLine(QPointF(screen_pt.x() + size, screen_pt.y() - size),
                        QPointF(screen_pt.x() - size, screen_pt.y() + size))
 
-        # --- 4c. Ellipse Handle-Punkte (Achsen-Endpunkte) ---
+        # --- 2c. Ellipse Handle-Punkte (Achsen-Endpunkte) ---
         # Diese Punkte sind Teil von Linien aber müssen als Handles sichtbar sein
-        for pt in self.sketch.points:
-            if not getattr(pt, '_ellipse_handle', None):
-                continue
-            
-            screen_pt = self.world_to_screen(QPointF(pt.x, pt.y))
-            is_hov = self.hovered_entity == pt
+        for pt in layers.ellipse_handles:
+            screen_pt = xf.map(QPointF(pt.x, pt.y))
+            is_hov = hovered is pt
             handle_type = pt._ellipse_handle
             
             # Größere, farbige Handles für bessere Sichtbarkeit
@@ -946,51 +734,36 @@ class SketchRendererMixin:
                 size = 7 if is_hov else 6
                 p.drawEllipse(screen_pt, size, size)
 
-        # --- 5. Splines (Separat & Korrigiert) ---
-        for spline in self.sketch.splines:
-            if update_rect:
-                # Grober Bounding Box Check für Spline
-                cps = spline.control_points
-                if not cps: continue
-                # ... (hier vereinfacht, im Zweifel zeichnen) ...
+        # --- 3. Splines (gecachter Welt-Path, Stil pro Frame) ---
+        selected_splines = {id(s) for s in self.selected_splines}
+        for spline, spline_path in layers.splines:
+            is_selected = id(spline) in selected_splines
+            is_dragging = (spline is self.spline_drag_spline)
 
-            is_selected = spline in self.selected_splines
-            is_dragging = (spline == self.spline_drag_spline)
-            
             col = DesignTokens.COLOR_GEO_CONSTRUCTION if spline.construction else DesignTokens.COLOR_GEO_BODY
             width = 2
             if is_selected: 
                 col = DesignTokens.COLOR_GEO_SELECTED
                 width = 3
-            
-            lines_to_draw = []
-            if is_dragging and hasattr(spline, '_preview_lines'):
-                lines_to_draw = spline._preview_lines
-            elif hasattr(spline, 'to_lines'):
-                lines_to_draw = spline.to_lines(segments_per_span=10)
-            
-            if not lines_to_draw: continue
 
-            spline_path = QPainterPath()
-            first = lines_to_draw[0]
-            spline_path.moveTo(self.world_to_screen(first.start))
-            for l in lines_to_draw:
-                spline_path.lineTo(self.world_to_screen(l.end))
-            
+            preview = getattr(spline, '_preview_lines', None) if is_dragging else None
+            if preview:
+                spline_path = QPainterPath()
+                spline_path.moveTo(preview[0].start.x, preview[0].start.y)
+                for l in preview:
+                    spline_path.lineTo(l.end.x, l.end.y)
+
+            p.save()
+            p.setTransform(xf, True)
+            p.setBrush(Qt.NoBrush)
             if is_selected:
-                glow_pen = QPen(QColor(DesignTokens.COLOR_GEO_SELECTED), 8)
-                # FIX: .getColor() existiert nicht. Korrekte PySide6 Syntax:
-                c = glow_pen.color()
-                c.setAlpha(100)
-                glow_pen.setColor(c)
-                
-                p.setPen(glow_pen)
-                p.setBrush(Qt.NoBrush)
+                glow_color = QColor(DesignTokens.COLOR_GEO_SELECTED)
+                glow_color.setAlpha(100)
+                p.setPen(cosmetic(QPen(glow_color, 8)))
                 p.drawPath(spline_path)
-                
-            p.setPen(QPen(col, width))
-            p.setBrush(Qt.NoBrush)
+            p.setPen(cosmetic(QPen(col, width)))
             p.drawPath(spline_path)
+            p.restore()
             
             # Zeichne Curvature Comb (falls aktiviert)
             if getattr(spline, 'show_curvature', False):
@@ -1054,350 +827,198 @@ class SketchRendererMixin:
 
     def _draw_native_splines(self, p):
         """Zeichnet native B-Splines (aus DXF Import) - diese erzeugen saubere Extrusions-Flächen."""
-        native_splines = getattr(self.sketch, 'native_splines', [])
-        if not native_splines:
+        paths = self._geometry_layers().native_splines
+        if not paths:
             return
 
-        for spline in native_splines:
-            if spline.construction:
-                continue
-
-            # Spline als Linien-Approximation für Anzeige
-            try:
-                lines = spline.to_lines(segments=50)
-                if not lines:
-                    continue
-
-                col = DesignTokens.COLOR_GEO_CONSTRUCTION if spline.construction else DesignTokens.COLOR_GEO_BODY
-                width = 2
-
-                spline_path = QPainterPath()
-                first = lines[0]
-                spline_path.moveTo(self.world_to_screen(first.start))
-                for l in lines:
-                    spline_path.lineTo(self.world_to_screen(l.end))
-
-                p.setPen(QPen(col, width))
-                p.setBrush(Qt.NoBrush)
-                p.drawPath(spline_path)
+        p.save()
+        p.setTransform(self._view_transform(), True)
+        p.setPen(cosmetic(QPen(DesignTokens.COLOR_GEO_BODY, 2)))
+        p.setBrush(Qt.NoBrush)
+        for spline_path in paths:
+            p.drawPath(spline_path)
+        p.restore()
 
-            except Exception as e:
-                from loguru import logger
-                logger.debug(f"Native Spline Rendering fehlgeschlagen: {e}")
+    def _constraint_anchors(self):
+        """Welt-Anker der Constraint-Symbole, gecacht pro Sketch-Revision."""
+        key = self._render_cache_key()
+        cached = getattr(self, '_constraint_anchor_cache', None)
+        if key is None or cached is None or cached[0] != key:
+            cached = (key, build_constraint_anchors(self.sketch.constraints))
+            self._constraint_anchor_cache = cached
+        return cached[1]
+
+    def _draw_constraint_icon(self, p, c, pos, rect_dx, rect_dy, text_dx, text_dy, color, symbol, selected_ids):
+        """Symbol-Box eines Constraints an einer Bildschirm-Position."""
+        icon_rect = QRectF(int(pos.x()) + rect_dx, int(pos.y()) + rect_dy, 20, 14)
+        self.constraint_icon_rects.append((c, icon_rect))
+        # Highlight wenn selektiert
+        bg_color = QColor(0, 120, 212, 200) if id(c) in selected_ids else QColor(30, 30, 30, 180)
+        # Hintergrund-Box für bessere Lesbarkeit
+        p.setPen(Qt.NoPen)
+        p.setBrush(QBrush(bg_color))
+        p.drawRoundedRect(icon_rect, 3, 3)
+        p.setPen(QPen(color))
+        p.drawText(int(pos.x()) + text_dx, int(pos.y()) + text_dy, symbol)
 
     def _draw_constraints(self, p):
         """Zeichnet Constraint-Icons an den betroffenen Elementen (Fusion360-Style)"""
-        from loguru import logger
-
         p.setFont(QFont("Segoe UI", 8, QFont.Bold))
+        fm = QFontMetrics(p.font())
 
         # Speichere Bounding-Boxes für Constraint-Klick-Erkennung
         if not hasattr(self, 'constraint_icon_rects'):
             self.constraint_icon_rects = []
         self.constraint_icon_rects.clear()
 
-        # Performance Optimization 1.4: Aggressive Viewport Culling für Constraint-Icons
+        xf = self._view_transform()
+        scale = self.view_scale
+        selected_ids = {id(c) for c in getattr(self, 'selected_constraints', ())}
         line_constraint_count = {}
 
         # Viewport mit Padding für Icons (Icons können leicht außerhalb sein)
         viewport_rect = QRectF(0, 0, self.width(), self.height()).adjusted(-50, -50, 50, 50)
 
-        # Pre-filter: Nur Constraints mit Entities im Viewport
-        visible_constraints = []
-
-        def _entity_visible(entity):
-            if hasattr(entity, 'start') and hasattr(entity, 'end'):  # Line
-                p_mid = self.world_to_screen(entity.midpoint)
-                return viewport_rect.contains(p_mid)
+        def _probe_visible(probe):
+            pos = xf.map(probe[0])
+            if viewport_rect.contains(pos):
+                return True
+            r_screen = probe[1] * scale
+            if r_screen <= 0:
+                return False
+            bounds = QRectF(pos.x() - r_screen, pos.y() - r_screen, 2 * r_screen, 2 * r_screen)
+            return viewport_rect.intersects(bounds)
 
-            if hasattr(entity, 'center'):  # Circle/Arc
-                p_center = self.world_to_screen(entity.center)
-                if viewport_rect.contains(p_center):
-                    return True
-                r_screen = getattr(entity, 'radius', 0) * self.view_scale
-                bounds = QRectF(p_center.x() - r_screen, p_center.y() - r_screen, 2 * r_screen, 2 * r_screen)
-                return viewport_rect.intersects(bounds)
+        def _line_offset(line_id):
+            count = line_constraint_count.get(line_id, 0)
+            line_constraint_count[line_id] = count + 1
+            return count * 15
 
-            # Point2D / QPointF
-            if hasattr(entity, 'x') and hasattr(entity, 'y'):
-                p_pt = self.world_to_screen(entity)
-                return viewport_rect.contains(p_pt)
+        # Anker kommen gecacht pro Revision; pro Frame nur Transformation + Culling
+        for c, probes, anchors, extra in self._constraint_anchors():
+            if not any(_probe_visible(probe) for probe in probes):
+                continue
+            try:
+                if c.type == ConstraintType.HORIZONTAL:
+                    line_id, anchor = anchors[0]
+                    offset = _line_offset(line_id)
+                    self._draw_constraint_icon(p, c, xf.map(anchor), -10, -18 - offset, -5, -7 - offset,
+                                               self.CONSTRAINT_COLOR, "H", selected_ids)
+
+                elif c.type == ConstraintType.VERTICAL:
+                    line_id, anchor = anchors[0]
+                    offset = _line_offset(line_id)
+                    self._draw_constraint_icon(p, c, xf.map(anchor), 5, -5 - offset, 10, 6 - offset,
+                                               self.CONSTRAINT_COLOR, "V", selected_ids)
+
+                elif c.type in (ConstraintType.PARALLEL, ConstraintType.PERPENDICULAR, ConstraintType.EQUAL_LENGTH):
+                    if c.type == ConstraintType.PARALLEL:
+                        color, symbol, text_dx = QColor(100, 180, 255), "∥", -5
+                    elif c.type == ConstraintType.PERPENDICULAR:
+                        color, symbol, text_dx = QColor(255, 180, 100), "⊥", -5
+                    else:
+                        color, symbol, text_dx = QColor(200, 100, 255), "=", -4
+                    # Symbol an beiden Linien
+                    for line_id, anchor in anchors:
+                        offset = _line_offset(line_id)
+                        self._draw_constraint_icon(p, c, xf.map(anchor), -10, -18 - offset, text_dx, -7 - offset,
+                                                   color, symbol, selected_ids)
 
-            return False
+                elif c.type == ConstraintType.TANGENT:
+                    # Symbol am Berührpunkt (Gold/Orange)
+                    self._draw_constraint_icon(p, c, xf.map(anchors[0][1]), -10, -18, -4, -7,
+                                               QColor(255, 200, 50), "T", selected_ids)
 
-        for c in self.sketch.constraints:
-            if not c.entities:
-                continue
+                elif c.type == ConstraintType.LENGTH:
+                    s_start = xf.map(anchors[0][1])
+                    s_end = xf.map(anchors[1][1])
+                    mid = (s_start + s_end) / 2
+
+                    # Normalenvektor (senkrecht zur Linie), Text 30px daneben
+                    dx = s_end.x() - s_start.x()
+                    dy = s_end.y() - s_start.y()
+                    length_screen = math.hypot(dx, dy)
+
+                    text_pos = mid
+                    if length_screen > 0:
+                        offset_dist = 30
+                        nx = -dy / length_screen
+                        ny = dx / length_screen
+                        text_pos = QPointF(mid.x() + nx * offset_dist, mid.y() + ny * offset_dist)
+
+                        # Eine dünne Hilfslinie zeichnen (Dimension Line Style)
+                        p.setPen(QPen(QColor(100, 100, 100, 100), 1, Qt.DashLine))
+                        p.drawLine(mid, text_pos)
+
+                    if c.formula:
+                        text = f"{c.formula} = {c.value:.1f}"
+                    else:
+                        text = f"{c.value:.1f}"
 
-            is_visible = any(_entity_visible(ent) for ent in c.entities)
-            if is_visible:
-                visible_constraints.append(c)
+                    rect = fm.boundingRect(text)
+                    box_w = rect.width() + 10
+                    box_h = rect.height() + 4
 
-        # Jetzt nur visible Constraints zeichnen (50-80% Reduktion bei großen Sketches!)
-        for c in visible_constraints:
-            try:
-                if c.type == ConstraintType.HORIZONTAL and c.entities:
-                    line = c.entities[0]
-                    mid = self.world_to_screen(QPointF(line.midpoint.x, line.midpoint.y))
-                    offset = line_constraint_count.get(line.id, 0) * 15
-                    line_constraint_count[line.id] = line_constraint_count.get(line.id, 0) + 1
-                    # Bounding-Box speichern
-                    icon_rect = QRectF(int(mid.x())-10, int(mid.y())-18-offset, 20, 14)
-                    self.constraint_icon_rects.append((c, icon_rect))
-                    # Highlight wenn selektiert
-                    is_selected = hasattr(self, 'selected_constraints') and c in self.selected_constraints
-                    bg_color = QColor(0, 120, 212, 200) if is_selected else QColor(30, 30, 30, 180)
-                    # Hintergrund-Box für bessere Lesbarkeit
-                    p.setPen(Qt.NoPen)
-                    p.setBrush(QBrush(bg_color))
-                    p.drawRoundedRect(icon_rect, 3, 3)
-                    p.setPen(QPen(self.CONSTRAINT_COLOR))
-                    p.drawText(int(mid.x())-5, int(mid.y())-7-offset, "H")
-
-                elif c.type == ConstraintType.VERTICAL and c.entities:
-                    line = c.entities[0]
-                    mid = self.world_to_screen(QPointF(line.midpoint.x, line.midpoint.y))
-                    offset = line_constraint_count.get(line.id, 0) * 15
-                    line_constraint_count[line.id] = line_constraint_count.get(line.id, 0) + 1
-                    icon_rect = QRectF(int(mid.x())+5, int(mid.y())-5-offset, 20, 14)
+                    icon_rect = QRectF(int(text_pos.x() - box_w/2), int(text_pos.y() - box_h/2), box_w, box_h)
                     self.constraint_icon_rects.append((c, icon_rect))
-                    is_selected = hasattr(self, 'selected_constraints') and c in self.selected_constraints
-                    bg_color = QColor(0, 120, 212, 200) if is_selected else QColor(30, 30, 30, 180)
+                    bg_color = QColor(0, 120, 212, 200) if id(c) in selected_ids else QColor(30, 30, 30, 200)
+
                     p.setPen(Qt.NoPen)
                     p.setBrush(QBrush(bg_color))
                     p.drawRoundedRect(icon_rect, 3, 3)
-                    p.setPen(QPen(self.CONSTRAINT_COLOR))
-                    p.drawText(int(mid.x())+10, int(mid.y())+6-offset, "V")
-                    
-                elif c.type == ConstraintType.PARALLEL and len(c.entities) >= 2:
-                    # Symbol an beiden Linien
-                    for line in c.entities[:2]:
-                        mid = self.world_to_screen(QPointF(line.midpoint.x, line.midpoint.y))
-                        offset = line_constraint_count.get(line.id, 0) * 15
-                        line_constraint_count[line.id] = line_constraint_count.get(line.id, 0) + 1
-                        icon_rect = QRectF(int(mid.x())-10, int(mid.y())-18-offset, 20, 14)
-                        self.constraint_icon_rects.append((c, icon_rect))
-                        is_selected = hasattr(self, 'selected_constraints') and c in self.selected_constraints
-                        bg_color = QColor(0, 120, 212, 200) if is_selected else QColor(30, 30, 30, 180)
-                        p.setPen(Qt.NoPen)
-                        p.setBrush(QBrush(bg_color))
-                        p.drawRoundedRect(icon_rect, 3, 3)
-                        p.setPen(QPen(QColor(100, 180, 255)))
-                        p.drawText(int(mid.x())-5, int(mid.y())-7-offset, "∥")
-
-                elif c.type == ConstraintType.PERPENDICULAR and len(c.entities) >= 2:
-                    for line in c.entities[:2]:
-                        mid = self.world_to_screen(QPointF(line.midpoint.x, line.midpoint.y))
-                        offset = line_constraint_count.get(line.id, 0) * 15
-                        line_constraint_count[line.id] = line_constraint_count.get(line.id, 0) + 1
-                        icon_rect = QRectF(int(mid.x())-10, int(mid.y())-18-offset, 20, 14)
-                        self.constraint_icon_rects.append((c, icon_rect))
-                        is_selected = hasattr(self, 'selected_constraints') and c in self.selected_constraints
-                        bg_color = QColor(0, 120, 212, 200) if is_selected else QColor(30, 30, 30, 180)
-                        p.setPen(Qt.NoPen)
-                        p.setBrush(QBrush(bg_color))
-                        p.drawRoundedRect(icon_rect, 3, 3)
-                        p.setPen(QPen(QColor(255, 180, 100)))
-                        p.drawText(int(mid.x())-5, int(mid.y())-7-offset, "⊥")
-
-                elif c.type == ConstraintType.EQUAL_LENGTH and len(c.entities) >= 2:
-                    for line in c.entities[:2]:
-                        mid = self.world_to_screen(QPointF(line.midpoint.x, line.midpoint.y))
-                        offset = line_constraint_count.get(line.id, 0) * 15
-                        line_constraint_count[line.id] = line_constraint_count.get(line.id, 0) + 1
-                        icon_rect = QRectF(int(mid.x())-10, int(mid.y())-18-offset, 20, 14)
-                        self.constraint_icon_rects.append((c, icon_rect))
-                        is_selected = hasattr(self, 'selected_constraints') and c in self.selected_constraints
-                        bg_color = QColor(0, 120, 212, 200) if is_selected else QColor(30, 30, 30, 180)
-                        p.setPen(Qt.NoPen)
-                        p.setBrush(QBrush(bg_color))
-                        p.drawRoundedRect(icon_rect, 3, 3)
-                        p.setPen(QPen(QColor(200, 100, 255)))
-                        p.drawText(int(mid.x())-4, int(mid.y())-7-offset, "=")
-
-                elif c.type == ConstraintType.TANGENT and len(c.entities) >= 2:
-                    # TANGENT: Symbol am Berührpunkt zwischen Line und Circle/Arc
-                    e1, e2 = c.entities[0], c.entities[1]
-
-                    # Finde die Linie und den Kreis/Arc
-                    line_entity = None
-                    circle_entity = None
-                    for e in [e1, e2]:
-                        if hasattr(e, 'start') and hasattr(e, 'end'):  # Line
-                            line_entity = e
-                        elif hasattr(e, 'center') and hasattr(e, 'radius'):  # Circle/Arc
-                            circle_entity = e
-
-                    if line_entity and circle_entity:
-                        # Berechne Tangent-Punkt (nächster Punkt auf Linie zum Kreismittelpunkt)
-                        cx, cy = circle_entity.center.x, circle_entity.center.y
-                        x1, y1 = line_entity.start.x, line_entity.start.y
-                        x2, y2 = line_entity.end.x, line_entity.end.y
-                        dx, dy = x2 - x1, y2 - y1
-                        line_len_sq = dx*dx + dy*dy
-                        if line_len_sq > 1e-10:
-                            t = max(0, min(1, ((cx - x1)*dx + (cy - y1)*dy) / line_len_sq))
-                            tangent_x = x1 + t * dx
-                            tangent_y = y1 + t * dy
-                        else:
-                            tangent_x, tangent_y = x1, y1
-                        mid = self.world_to_screen(QPointF(tangent_x, tangent_y))
-                    elif circle_entity:
-                        # Zwei Kreise: Symbol am Berührpunkt
-                        mid = self.world_to_screen(circle_entity.center)
+
+                    p.setPen(QPen(self.DIM_COLOR))
+                    p.drawText(int(text_pos.x() - rect.width()/2),
+                               int(text_pos.y() + rect.height()/2 - 3), text)
+
+                elif c.type == ConstraintType.RADIUS:
+                    radius, display_value = extra
+                    r_screen = radius * scale
+                    center = xf.map(anchors[0][1])
+
+                    # Bemaßung immer unter festem Winkel (45° nach rechts oben)
+                    angle_rad = math.radians(-45)
+                    dir_x = math.cos(angle_rad)
+                    dir_y = math.sin(angle_rad)
+
+                    # Punkt auf dem Kreisring und Text-Position 40px weiter draußen
+                    p_rim = QPointF(center.x() + dir_x * r_screen, center.y() + dir_y * r_screen)
+                    p_text = QPointF(p_rim.x() + dir_x * 40, p_rim.y() + dir_y * 40)
+
+                    p.setPen(QPen(self.DIM_COLOR, 1, Qt.DashLine))
+                    p.drawLine(center, p_text)
+                    p.setBrush(QBrush(self.DIM_COLOR))
+                    p.drawEllipse(p_rim, 2, 2)
+
+                    if c.formula:
+                        text = f"R {c.formula} = {display_value:.1f}"
                     else:
-                        continue
+                        text = f"R{display_value:.1f}"
+                    rect = fm.boundingRect(text)
 
-                    icon_rect = QRectF(int(mid.x())-10, int(mid.y())-18, 20, 14)
+                    icon_rect = QRectF(int(p_text.x() - rect.width()/2 - 4),
+                                       int(p_text.y() - rect.height()/2 - 2),
+                                       rect.width()+8, rect.height()+4)
                     self.constraint_icon_rects.append((c, icon_rect))
-                    is_selected = hasattr(self, 'selected_constraints') and c in self.selected_constraints
-                    bg_color = QColor(0, 120, 212, 200) if is_selected else QColor(30, 30, 30, 180)
+                    bg_color = QColor(0, 120, 212, 200) if id(c) in selected_ids else QColor(30, 30, 30, 200)
+
                     p.setPen(Qt.NoPen)
                     p.setBrush(QBrush(bg_color))
                     p.drawRoundedRect(icon_rect, 3, 3)
-                    p.setPen(QPen(QColor(255, 200, 50)))  # Gold/Orange für Tangent
-                    p.drawText(int(mid.x())-4, int(mid.y())-7, "T")
-
-                elif c.type == ConstraintType.LENGTH:
-                    if c.value and c.entities:
-                        line = c.entities[0]
-
-                        # 1. Bildschirm-Koordinaten berechnen
-                        s_start = self.world_to_screen(QPointF(line.start.x, line.start.y))
-                        s_end = self.world_to_screen(QPointF(line.end.x, line.end.y))
-
-                        # 2. Mittelpunkt auf dem Bildschirm
-                        mid = (s_start + s_end) / 2
-
-                        # 3. Normalenvektor berechnen (Senkrecht zur Linie)
-                        dx = s_end.x() - s_start.x()
-                        dy = s_end.y() - s_start.y()
-                        length_screen = math.hypot(dx, dy)
-
-                        text_pos = mid
 
-                        if length_screen > 0:
-                            # Einheitsvektor der Normalen (-dy, dx) ist 90° rotiert
-                            # Wir nutzen einen Offset von 30 Pixeln
-                            offset_dist = 30
+                    p.setPen(QPen(self.DIM_COLOR))
+                    p.drawText(int(p_text.x() - rect.width()/2),
+                               int(p_text.y() + rect.height()/2 - 2), text)
 
-                            # Einfache Heuristik: Wir schieben immer in eine bestimmte relative Richtung,
-                            # damit es bei Rechtecken meistens "außen" landet (hängt von der Zeichenrichtung ab)
-                            nx = -dy / length_screen
-                            ny = dx / length_screen
-
-                            text_pos = QPointF(mid.x() + nx * offset_dist, mid.y() + ny * offset_dist)
-
-                            # Eine dünne Hilfslinie zeichnen (Dimension Line Style)
-                            p.setPen(QPen(QColor(100, 100, 100, 100), 1, Qt.DashLine))
-                            p.drawLine(mid, text_pos)
-
-                        if c.formula:
-                            text = f"{c.formula} = {c.value:.1f}"
-                        else:
-                            text = f"{c.value:.1f}"
-
-                        # Box zeichnen
-                        fm = QFontMetrics(p.font())
-                        rect = fm.boundingRect(text)
-                        box_w = rect.width() + 10
-                        box_h = rect.height() + 4
-
-                        icon_rect = QRectF(int(text_pos.x() - box_w/2), int(text_pos.y() - box_h/2), box_w, box_h)
-                        self.constraint_icon_rects.append((c, icon_rect))
-                        is_selected = hasattr(self, 'selected_constraints') and c in self.selected_constraints
-                        bg_color = QColor(0, 120, 212, 200) if is_selected else QColor(30, 30, 30, 200)
-
-                        p.setPen(Qt.NoPen)
-                        p.setBrush(QBrush(bg_color))
-                        # Zentrierte Box am neuen Ort
-                        p.drawRoundedRect(icon_rect, 3, 3)
-
-                        p.setPen(QPen(self.DIM_COLOR))
-                        # Text zentrieren
-                        p.drawText(int(text_pos.x() - rect.width()/2),
-                                   int(text_pos.y() + rect.height()/2 - 3), text)
-                    
-                elif c.type == ConstraintType.RADIUS:
-                    # Debug: Check why RADIUS constraints might not be drawn
-                    if c.value is None or c.value == 0:
-                        logger.warning(f"[Constraints] RADIUS constraint has no value: {c}")
-                    if not c.entities:
-                        logger.warning(f"[Constraints] RADIUS constraint has no entities: {c}")
-
-                    if c.entities:
-                        circle = c.entities[0]
-                        display_value = c.value if (c.value is not None and c.value != 0) else getattr(circle, 'radius', None)
-                        if display_value is None:
-                            continue
-                        r_screen = circle.radius * self.view_scale
-
-                        # Mittelpunkt im Screen-Space
-                        center = self.world_to_screen(QPointF(circle.center.x, circle.center.y))
-
-                        # Wir zeichnen die Bemaßung immer in einem festen Winkel (z.B. 45° nach rechts oben)
-                        # Das sieht meistens am saubersten aus.
-                        angle_deg = -45
-                        angle_rad = math.radians(angle_deg)
-
-                        # Richtung berechnen
-                        dir_x = math.cos(angle_rad)
-                        dir_y = math.sin(angle_rad)
-
-                        # Punkt auf dem Kreisring
-                        rim_x = center.x() + dir_x * r_screen
-                        rim_y = center.y() + dir_y * r_screen
-                        p_rim = QPointF(rim_x, rim_y)
-
-                        # Punkt für den Text (etwas weiter draußen)
-                        offset = 40  # Länge der Linie nach außen
-                        text_x = rim_x + dir_x * offset
-                        text_y = rim_y + dir_y * offset
-                        p_text = QPointF(text_x, text_y)
-
-                        # 1. Linie vom Zentrum zum Text
-                        p.setPen(QPen(self.DIM_COLOR, 1, Qt.DashLine))
-                        p.drawLine(center, p_text)
-
-                        # 2. Optional: Kleiner Punkt oder Pfeil am Kreisring
-                        p.setBrush(QBrush(self.DIM_COLOR))
-                        p.drawEllipse(p_rim, 2, 2)
-
-                        # 3. Text Box
-                        if c.formula:
-                            text = f"R {c.formula} = {display_value:.1f}"
-                        else:
-                            text = f"R{display_value:.1f}"
-                        fm = QFontMetrics(p.font())
-                        rect = fm.boundingRect(text)
-
-                        icon_rect = QRectF(int(p_text.x() - rect.width()/2 - 4),
-                                           int(p_text.y() - rect.height()/2 - 2),
-                                           rect.width()+8, rect.height()+4)
-                        self.constraint_icon_rects.append((c, icon_rect))
-                        is_selected = hasattr(self, 'selected_constraints') and c in self.selected_constraints
-                        bg_color = QColor(0, 120, 212, 200) if is_selected else QColor(30, 30, 30, 200)
-
-                        # Hintergrund für Text
-                        p.setPen(Qt.NoPen)
-                        p.setBrush(QBrush(bg_color))
-                        p.drawRoundedRect(icon_rect, 3, 3)
-
-                        # Text selbst
-                        p.setPen(QPen(self.DIM_COLOR))
-                        p.drawText(int(p_text.x() - rect.width()/2),
-                                   int(p_text.y() + rect.height()/2 - 2), text)
-                    
-                elif c.type == ConstraintType.CONCENTRIC and len(c.entities) >= 2:
+                elif c.type == ConstraintType.CONCENTRIC:
                     # Symbol am Mittelpunkt
-                    for circ in c.entities[:2]:
-                        if hasattr(circ, 'center'):
-                            pos = self.world_to_screen(QPointF(circ.center.x, circ.center.y))
-                            p.setPen(QPen(QColor(255, 200, 100), 2))
-                            p.setBrush(Qt.NoBrush)
-                            p.drawEllipse(int(pos.x())-6, int(pos.y())-6, 12, 12)
-                            p.drawEllipse(int(pos.x())-3, int(pos.y())-3, 6, 6)
-                            
+                    p.setPen(QPen(QColor(255, 200, 100), 2))
+                    p.setBrush(Qt.NoBrush)
+                    for _line_id, anchor in anchors:
+                        pos = xf.map(anchor)
+                        p.drawEllipse(int(pos.x())-6, int(pos.y())-6, 12, 12)
+                        p.drawEllipse(int(pos.x())-3, int(pos.y())-3, 6, 6)
+
             except Exception:
                 pass  # Constraint-Zeichenfehler ignorieren
 
@@ -0,0 +1,389 @@
+"""
+MashCad - Snap Point Table
+==========================
+
+Vorberechnete Snap-Punkte für den SmartSnapper.
+
+Problem: `SmartSnapper.snap` hat bei jeder Mausbewegung für alle nahen
+Entities neue Point2D-Objekte (Endpunkte, Mitten, Quadranten) erzeugt und
+paarweise Schnittpunkte berechnet - O(k²), ab `MAX_INTERSECTION_ENTITIES`
+nahen Entities gab es gar keine Schnittpunkt-Snaps mehr.
+
+Lösung:
+- Feste Snap-Punkte (Endpunkt, Mitte, Zentrum, Quadrant, echter Schnitt)
+  liegen pro Entity bzw. pro Entity-Paar in einer Tabelle
+- Beim ersten Aufbau findet ein Sweep-Line-Pass (Sweep-and-Prune über die
+  AABBs) alle Kandidaten-Paare, danach werden pro Sketch-Revision nur
+  geänderte Entities neu berechnet (Nachbarn via Spatial-Index)
+- Alle Punkte liegen in einem KD-Tree, Kanten als NumPy-Arrays
+- Eine Abfrage ist ein KD-Tree Radius-Lookup plus vektorisierte Projektion
+  auf Linien und Kreise
+
+Verwendung:
+    table = SnapPointTable(snapper._calculate_intersections)
+    table.sync(sketch)
+    for dist, x, y, snap_type, target in table.query_points(mx, my, radius): ...
+    for dist, x, y, entity in table.query_edges(mx, my, radius): ...
+"""
+
+import math
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+try:
+    from gui.sketch_tools import SnapType
+except ImportError:
+    from sketch_tools import SnapType
+
+from sketcher.geometry import Arc2D, Circle2D, Line2D
+from sketcher.spatial_index import KINDS_CURVES, SketchSpatialIndex, entity_bounds
+
+
+# Ab diesem Anteil geänderter Entities ist ein kompletter Sweep billiger
+FULL_REBUILD_FRACTION = 0.25
+_QUADRANT_DIRS = ((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0))
+
+SnapPoint = Tuple[float, float, SnapType, object]
+
+
+def _snap_entities(sketch) -> List:
+    """Entities mit Snap-Punkten (wie der Snapper: keine Standalone-Punkte)."""
+    return [
+        *sketch.lines, *sketch.circles, *sketch.arcs,
+        *(getattr(sketch, 'ellipses', None) or ()),
+        *(getattr(sketch, 'splines', None) or ()),
+    ]
+
+
+def sketch_key(sketch) -> Hashable:
+    """Revision + Entity-Anzahlen: ändert sich bei jeder gemeldeten Geometrie-Änderung."""
+    return (
+        id(sketch), getattr(sketch, 'revision', None),
+        len(sketch.lines), len(sketch.circles), len(sketch.arcs),
+        len(getattr(sketch, 'ellipses', None) or ()),
+        len(getattr(sketch, 'splines', None) or ()),
+    )
+
+
+def _xy(pt) -> Optional[Tuple[float, float]]:
+    if isinstance(pt, (tuple, list)) and len(pt) >= 2:
+        return float(pt[0]), float(pt[1])
+    if hasattr(pt, 'x') and hasattr(pt, 'y') and not callable(pt.x):
+        return float(pt.x), float(pt.y)
+    return None
+
+
+def entity_snap_points(entity) -> List[SnapPoint]:
+    """Feste Snap-Punkte einer Entity (Reihenfolge wie im SmartSnapper)."""
+    points: List[SnapPoint] = []
+    if hasattr(entity, 'start') and hasattr(entity, 'end'):
+        if not getattr(entity, "_suppress_endpoint_markers", False):
+            sx, sy = float(entity.start.x), float(entity.start.y)
+            ex, ey = float(entity.end.x), float(entity.end.y)
+            points.append((sx, sy, SnapType.ENDPOINT, entity))
+            points.append((ex, ey, SnapType.ENDPOINT, entity))
+            points.append(((sx + ex) / 2, (sy + ey) / 2, SnapType.MIDPOINT, entity))
+
+    elif hasattr(entity, 'center'):
+        cx, cy = float(entity.center.x), float(entity.center.y)
+        points.append((cx, cy, SnapType.CENTER, entity))
+        if hasattr(entity, 'radius'):
+            r = float(entity.radius)
+            for dx, dy in _QUADRANT_DIRS:
+                points.append((cx + r * dx, cy + r * dy, SnapType.QUADRANT, entity))
+
+    elif hasattr(entity, 'control_points'):
+        for attr in ('start_point', 'end_point'):
+            if hasattr(entity, attr):
+                xy = _xy(getattr(entity, attr))
+                if xy is not None:
+                    points.append((xy[0], xy[1], SnapType.ENDPOINT, entity))
+        for cp in entity.control_points:
+            xy = _xy(cp)
+            if xy is not None:
+                points.append((xy[0], xy[1], SnapType.ENDPOINT, entity))
+    return points
+
+
+def _intersectable(entity) -> bool:
+    # Ellipsen-Proxy-Segmente: Snapper überspringt sie (hoher Aufwand, wenig Nutzen)
+    return isinstance(entity, (Line2D, Circle2D, Arc2D)) and not getattr(entity, "_ellipse_segment", False)
+
+
+def _signature(entity, points: List[SnapPoint]) -> Tuple:
+    """Alles, was Snap-Punkte oder Schnitte einer Entity beeinflusst."""
+    sig = tuple((x, y) for x, y, _t, _e in points)
+    if isinstance(entity, Line2D):
+        return sig + ((entity.start.x, entity.start.y, entity.end.x, entity.end.y),)
+    if isinstance(entity, Arc2D):
+        return sig + ((entity.radius, entity.start_angle, entity.end_angle),)
+    if isinstance(entity, Circle2D):
+        return sig + ((entity.radius,),)
+    return sig
+
+
+class _Entry:
+    __slots__ = ("entity", "points", "signature", "bounds", "order")
+
+    def __init__(self, entity, points, signature, bounds, order):
+        self.entity = entity
+        self.points = points
+        self.signature = signature
+        self.bounds = bounds
+        self.order = order
+
+
+def sweep_pairs(items: List[Tuple[int, Tuple[float, float, float, float]]]) -> List[Tuple[int, int]]:
+    """
+    Sweep-and-Prune: alle Paare mit überlappenden AABBs.
+
+    Args:
+        items: (key, (x0, y0, x1, y1))
+    """
+    items = sorted(items, key=lambda item: item[1][0])
+    active: List[Tuple[int, Tuple[float, float, float, float]]] = []
+    pairs = []
+    for key, b in items:
+        x0 = b[0]
+        active = [a for a in active if a[1][2] >= x0]
+        for other_key, ob in active:
+            if ob[1] <= b[3] and ob[3] >= b[1]:
+                pairs.append((other_key, key))
+        active.append((key, b))
+    return pairs
+
+
+class SnapPointTable:
+    """
+    Snap-Punkt-Tabelle eines Sketches mit KD-Tree und Kanten-Arrays.
+
+    Args:
+        intersect: Schnittpunkt-Funktion (e1, e2) -> Liste von Point2D oder
+            (Point2D, is_virtual, entities) - wie `SmartSnapper._calculate_intersections`
+    """
+
+    def __init__(self, intersect: Callable):
+        self._intersect = intersect
+        self._entries: Dict[int, _Entry] = {}
+        self._pairs: Dict[Tuple[int, int], List[SnapPoint]] = {}
+        self._partners: Dict[int, Set[int]] = {}
+        self._key: Optional[Hashable] = None
+        self._arrays_valid = False
+
+        self._xy = np.empty((0, 2))
+        self._payload: List[SnapPoint] = []
+        self._tree = None
+        self._seg_a = np.empty((0, 2))
+        self._seg_b = np.empty((0, 2))
+        self._seg_entities: List = []
+        self._circ_c = np.empty((0, 2))
+        self._circ_r = np.empty(0)
+        self._circ_entities: List = []
+
+    @property
+    def point_count(self) -> int:
+        self._ensure_arrays()
+        return len(self._payload)
+
+    def invalidate(self) -> None:
+        """Erzwingt beim nächsten sync() einen Abgleich (z.B. nach direktem Drag)."""
+        self._key = None
+
+    # --- Aufbau ---
+
+    def sync(self, sketch) -> bool:
+        """
+        Gleicht die Tabelle mit dem Sketch ab.
+
+        Returns:
+            True wenn sich etwas geändert hat
+        """
+        key = sketch_key(sketch)
+        if key == self._key:
+            return False
+        self._key = key
+
+        entities = _snap_entities(sketch)
+        alive: Dict[int, _Entry] = {}
+        changed: List[int] = []
+        for order, entity in enumerate(entities):
+            ekey = id(entity)
+            if ekey in alive:
+                continue
+            points = entity_snap_points(entity)
+            signature = _signature(entity, points)
+            entry = self._entries.get(ekey)
+            if entry is not None and entry.entity is entity and entry.signature == signature:
+                entry.order = order
+                alive[ekey] = entry
+                continue
+            alive[ekey] = _Entry(entity, points, signature, entity_bounds(entity), order)
+            changed.append(ekey)
+
+        removed = [ekey for ekey in self._entries if ekey not in alive]
+        if not changed and not removed:
+            self._entries = alive
+            self._arrays_valid = False  # Reihenfolge kann sich geändert haben
+            return False
+
+        full = not self._entries or len(changed) > FULL_REBUILD_FRACTION * max(len(alive), 1)
+        self._entries = alive
+        if full:
+            self._rebuild_pairs()
+        else:
+            for ekey in removed + changed:
+                self._drop_pairs(ekey)
+            index = getattr(sketch, 'spatial_index', None)
+            for ekey in changed:
+                self._pair_with_neighbours(ekey, index)
+
+        self._arrays_valid = False
+        return True
+
+    def _add_pair(self, key_a: int, key_b: int) -> None:
+        a, b = self._entries[key_a], self._entries[key_b]
+        pair = (key_a, key_b) if a.order <= b.order else (key_b, key_a)
+        if pair in self._pairs:
+            return
+        points: List[SnapPoint] = []
+        for p in self._intersect(self._entries[pair[0]].entity, self._entries[pair[1]].entity) or ():
+            target = None
+            if isinstance(p, tuple) and len(p) >= 2 and isinstance(p[1], bool):
+                if p[1]:
+                    continue  # Virtuelle Schnitte sind nicht lokal - bleiben im Snapper
+                target = {"virtual": False, "entities": p[2] if len(p) > 2 else None}
+                p = p[0]
+            if p is None:
+                continue
+            points.append((float(p.x), float(p.y), SnapType.INTERSECTION, target))
+        if not points:
+            return
+        self._pairs[pair] = points
+        self._partners.setdefault(pair[0], set()).add(pair[1])
+        self._partners.setdefault(pair[1], set()).add(pair[0])
+
+    def _drop_pairs(self, ekey: int) -> None:
+        for other in self._partners.pop(ekey, ()):
+            self._pairs.pop((ekey, other), None)
+            self._pairs.pop((other, ekey), None)
+            partners = self._partners.get(other)
+            if partners is not None:
+                partners.discard(ekey)
+
+    def _rebuild_pairs(self) -> None:
+        self._pairs.clear()
+        self._partners.clear()
+        items = [
+            (ekey, entry.bounds) for ekey, entry in self._entries.items()
+            if entry.bounds is not None and _intersectable(entry.entity)
+        ]
+        for key_a, key_b in sweep_pairs(items):
+            self._add_pair(key_a, key_b)
+
+    def _pair_with_neighbours(self, ekey: int, index) -> None:
+        entry = self._entries[ekey]
+        if entry.bounds is None or not _intersectable(entry.entity):
+            return
+        x0, y0, x1, y1 = entry.bounds
+        if isinstance(index, SketchSpatialIndex):
+            neighbours = index.query_bounds(x0, y0, x1, y1, kinds=KINDS_CURVES)
+        else:
+            neighbours = [e.entity for e in self._entries.values()
+                          if e.bounds is not None and e.bounds[0] <= x1 and e.bounds[2] >= x0
+                          and e.bounds[1] <= y1 and e.bounds[3] >= y0]
+        for other in neighbours:
+            okey = id(other)
+            if okey == ekey or okey not in self._entries or not _intersectable(other):
+                continue
+            self._add_pair(ekey, okey)
+
+    def _ensure_arrays(self) -> None:
+        if self._arrays_valid:
+            return
+        entries = sorted(self._entries.values(), key=lambda e: e.order)
+
+        # Snap-Punkte in Entity-Reihenfolge, Schnittpunkte danach (wie im Snapper)
+        payload = [p for entry in entries for p in entry.points]
+        for pair in sorted(self._pairs, key=lambda k: (self._entries[k[0]].order, self._entries[k[1]].order)):
+            payload.extend(self._pairs[pair])
+        self._payload = [p for p in payload if math.isfinite(p[0]) and math.isfinite(p[1])]
+        self._xy = np.array([(p[0], p[1]) for p in self._payload], dtype=float).reshape(-1, 2)
+        self._tree = cKDTree(self._xy) if HAS_SCIPY and len(self._payload) else None
+
+        lines = [e.entity for e in entries if hasattr(e.entity, 'start') and hasattr(e.entity, 'end')]
+        curves = [e.entity for e in entries
+                  if not (hasattr(e.entity, 'start') and hasattr(e.entity, 'end'))
+                  and hasattr(e.entity, 'center') and hasattr(e.entity, 'radius')]
+        self._seg_entities = lines
+        self._seg_a = np.array([(l.start.x, l.start.y) for l in lines], dtype=float).reshape(-1, 2)
+        self._seg_b = np.array([(l.end.x, l.end.y) for l in lines], dtype=float).reshape(-1, 2)
+        self._circ_entities = curves
+        self._circ_c = np.array([(c.center.x, c.center.y) for c in curves], dtype=float).reshape(-1, 2)
+        self._circ_r = np.array([float(c.radius) for c in curves], dtype=float)
+        self._arrays_valid = True
+
+    # --- Abfragen ---
+
+    def query_points(self, x: float, y: float, radius: float) -> List[Tuple[float, float, float, SnapType, object]]:
+        """Feste Snap-Punkte mit Distanz < radius als (dist, x, y, snap_type, target)."""
+        self._ensure_arrays()
+        if not self._payload:
+            return []
+        if self._tree is not None:
+            idx = self._tree.query_ball_point((x, y), radius)
+        else:
+            d = np.hypot(self._xy[:, 0] - x, self._xy[:, 1] - y)
+            idx = np.flatnonzero(d < radius)
+
+        hits = []
+        for i in sorted(idx):
+            px, py, snap_type, target = self._payload[i]
+            dist = math.hypot(px - x, py - y)
+            if dist < radius:
+                hits.append((dist, px, py, snap_type, target))
+        return hits
+
+    def query_edges(self, x: float, y: float, radius: float) -> List[Tuple[float, float, float, object]]:
+        """Nächste Kantenpunkte (Linien, Kreise/Bögen als Vollkreis) als (dist, x, y, entity)."""
+        self._ensure_arrays()
+        hits = []
+
+        if len(self._seg_entities):
+            a, b = self._seg_a, self._seg_b
+            near = np.flatnonzero(
+                (np.minimum(a[:, 0], b[:, 0]) - radius <= x) & (np.maximum(a[:, 0], b[:, 0]) + radius >= x)
+                & (np.minimum(a[:, 1], b[:, 1]) - radius <= y) & (np.maximum(a[:, 1], b[:, 1]) + radius >= y)
+            )
+            if len(near):
+                a, ab = a[near], b[near] - a[near]
+                len2 = np.einsum("ij,ij->i", ab, ab)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    t = np.where(len2 > 0, ((x - a[:, 0]) * ab[:, 0] + (y - a[:, 1]) * ab[:, 1]) / len2, 0.0)
+                t = np.clip(t, 0.0, 1.0)
+                proj = a + t[:, None] * ab
+                dist = np.hypot(proj[:, 0] - x, proj[:, 1] - y)
+                for k in np.flatnonzero(dist < radius):
+                    hits.append((float(dist[k]), float(proj[k, 0]), float(proj[k, 1]), self._seg_entities[near[k]]))
+
+        if len(self._circ_entities):
+            d = np.column_stack((x - self._circ_c[:, 0], y - self._circ_c[:, 1]))
+            norm = np.hypot(d[:, 0], d[:, 1])
+            near = np.flatnonzero(np.abs(norm - np.abs(self._circ_r)) < radius)
+            for k in near:
+                cx, cy = self._circ_c[k]
+                r = self._circ_r[k]
+                if norm[k] < 1e-9:
+                    px, py = cx + r, cy
+                else:
+                    px, py = cx + d[k, 0] * r / norm[k], cy + d[k, 1] * r / norm[k]
+                dist = math.hypot(px - x, py - y)
+                if dist < radius:
+                    hits.append((dist, float(px), float(py), self._circ_entities[k]))
+        return hits
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import List, Tuple, Optional
 from PySide6.QtCore import QPointF, QRectF
 from loguru import logger
+import numpy as np
 
 # --- PATH FIX START ---
 # Wir fügen das Parent-Verzeichnis (Root) zum Pfad hinzu, 
@@ -20,12 +21,15 @@ try:
     # Wir importieren es 'as geometry', damit der restliche Code (geometry.func()) funktioniert
     import sketcher.geometry as geometry 
     from sketcher.geometry import Point2D, Line2D, Circle2D, Arc2D
+    from sketcher.spatial_index import KINDS_CURVES
     
     # Import aus dem Nachbar-Modul im gleichen Ordner (gui) oder via Root
     try:
         from gui.sketch_tools import SketchTool, SnapType
+        from gui.sketch_snap_table import SnapPointTable, sketch_key
     except ImportError:
         from sketch_tools import SketchTool, SnapType
+        from sketch_snap_table import SnapPointTable, sketch_key
 
 except ImportError as e:
     logger.error(f"CRITICAL IMPORT ERROR in Snapper: {e}")
@@ -34,11 +38,13 @@ except ImportError as e:
         import geometry
         from sketch_tools import SketchTool, SnapType
         from sketcher import Point2D, Line2D, Circle2D, Arc2D
+        from sketcher.spatial_index import KINDS_CURVES
     except ImportError:
         # Notfall-Dummy, damit die IDE nicht komplett rot leuchtet
         class Point2D: pass
         class SketchTool: pass
         class SnapType: pass
+        KINDS_CURVES = None
 
 @dataclass
 class SnapResult:
@@ -92,8 +98,10 @@ class SmartSnapper:
         self.sketch = sketch_editor.sketch
 
         # Performance Optimization 1.6: Intersection Cache (60-80% Reduktion bei großen Sketches!)
-        self._intersection_cache = {}  # {(entity1_id, entity2_id): [Point2D, ...]}
         self._cache_version = 0
+        self._scene_diag_cache = (None, 0.0)
+        # Feste Snap-Punkte + echte Schnitte, pro Sketch-Revision inkrementell
+        self._snap_table = SnapPointTable(self._calculate_intersections)
         self._sticky_snap: Optional[SnapResult] = None
         self._is_dense_context = False
 
@@ -111,7 +119,20 @@ class SmartSnapper:
     def _scene_world_diag(self) -> float:
         """
         Conservative diagonal of the current 2D sketch extent in world units.
+
+        Cached per sketch revision - snap() calls this on every mouse move.
         """
+        try:
+            key = (sketch_key(self.sketch), len(self.sketch.points), self._cache_version)
+        except Exception:
+            key = None
+        if key is not None and key == self._scene_diag_cache[0]:
+            return self._scene_diag_cache[1]
+        diag = self._compute_scene_world_diag()
+        self._scene_diag_cache = (key, diag)
+        return diag
+
+    def _compute_scene_world_diag(self) -> float:
         min_x = float("inf")
         min_y = float("inf")
         max_x = float("-inf")
@@ -171,12 +192,12 @@ class SmartSnapper:
 
     def invalidate_intersection_cache(self):
         """
-        Performance Optimization 1.6: Invalidiert Intersection-Cache.
+        Performance Optimization 1.6: Invalidiert Snap-Tabelle und Szenen-Extent.
         Aufruf bei Geometrie-Änderungen (neue Linien, Move, etc.)
         """
-        self._intersection_cache.clear()
         self._cache_version += 1
         self._sticky_snap = None
+        self._snap_table.invalidate()
 
     def _is_drawing_tool_active(self) -> bool:
         tool = getattr(self.editor, "current_tool", None)
@@ -605,6 +626,8 @@ class SmartSnapper:
         return self._clamp01(confidence)
 
     def snap(self, mouse_screen_pos: QPointF) -> SnapResult:
+        # Undo/Redo ersetzt den Sketch des Editors
+        self.sketch = getattr(self.editor, 'sketch', None) or self.sketch
         mouse_world = self.editor.screen_to_world(mouse_screen_pos)
         snap_radius = self._compute_snap_radius_world()
         
@@ -617,7 +640,7 @@ class SmartSnapper:
             query_rect = QRectF(mouse_world.x() - snap_radius*5, 
                                 mouse_world.y() - snap_radius*5, 
                                 snap_radius * 10, snap_radius * 10)
-            entities = self.editor.spatial_index.query(query_rect)
+            entities = self.editor.spatial_index.query(query_rect, kinds=KINDS_CURVES)
         else:
             entities = self.sketch.lines + self.sketch.circles + self.sketch.arcs + getattr(self.sketch, 'splines', [])
         self._is_dense_context = len(entities) >= self.DENSE_ENTITY_THRESHOLD
@@ -633,100 +656,27 @@ class SmartSnapper:
                 candidates=candidates,
             )
 
-        # 1. Standard Punkte (Endpunkte, Mitte, Zentrum)
-        for entity in entities:
-            # LINIE
-            if hasattr(entity, 'start') and hasattr(entity, 'end'):
-                suppress_point_snaps = bool(getattr(entity, "_suppress_endpoint_markers", False))
-                if not suppress_point_snaps:
-                    self._check_point(entity.start, mouse_world, snap_radius, SnapType.ENDPOINT, entity, candidates)
-                    self._check_point(entity.end, mouse_world, snap_radius, SnapType.ENDPOINT, entity, candidates)
-                    mid = Point2D((entity.start.x + entity.end.x)/2, (entity.start.y + entity.end.y)/2)
-                    self._check_point(mid, mouse_world, snap_radius, SnapType.MIDPOINT, entity, candidates)
-                
-                # Nearest Point on Line (Edge)
-                closest = self._closest_point_on_segment(entity.start, entity.end, mouse_world)
-                self._check_point(closest, mouse_world, snap_radius, SnapType.EDGE, entity, candidates)
-
-            # KREIS / BOGEN
-            elif hasattr(entity, 'center'):
-                self._check_point(entity.center, mouse_world, snap_radius, SnapType.CENTER, entity, candidates)
-                
-                # Quadranten (0, 90, 180, 270 Grad)
-                if hasattr(entity, 'radius'):
-                    for angle in [0, 90, 180, 270]:
-                        qx = entity.center.x + entity.radius * math.cos(math.radians(angle))
-                        qy = entity.center.y + entity.radius * math.sin(math.radians(angle))
-                        self._check_point(Point2D(qx, qy), mouse_world, snap_radius, SnapType.QUADRANT, entity, candidates)
-                    
-                    # Nearest Point on Circle Edge
-                    closest_edge = self._closest_point_on_circle(entity, mouse_world)
-                    self._check_point(closest_edge, mouse_world, snap_radius, SnapType.EDGE, entity, candidates)
-
-            # SPLINE (Neu: Snap to Control Points)
-            elif hasattr(entity, 'control_points'):
-                 # Endpunkte (falls Start/End properties existieren)
-                 if hasattr(entity, 'start_point'):
-                     self._check_point(entity.start_point, mouse_world, snap_radius, SnapType.ENDPOINT, entity, candidates)
-                 if hasattr(entity, 'end_point'):
-                     self._check_point(entity.end_point, mouse_world, snap_radius, SnapType.ENDPOINT, entity, candidates)
-                 
-                 # Control Points als "Endpoint" behandeln
-                 for pt in entity.control_points:
-                     # pt ist meist (x, y) Tuple oder Point2D
-                     if isinstance(pt, (tuple, list)) and len(pt) >= 2:
-                         p_obj = Point2D(pt[0], pt[1])
-                         self._check_point(p_obj, mouse_world, snap_radius, SnapType.ENDPOINT, entity, candidates)
-                     elif hasattr(pt, 'x') and hasattr(pt, 'y'):
-                         self._check_point(pt, mouse_world, snap_radius, SnapType.ENDPOINT, entity, candidates)
-
-        # 2. SCHNITTPUNKTE (Intersection)
-        # Performance Optimization 1.6: Mit Cache (60-80% Reduktion!)
-        # Das ist der teure Teil, daher nur berechnen, wenn wir grob in der Nähe sind
-        if len(entities) > self.MAX_INTERSECTION_ENTITIES:
-            entities = []
-        for i, ent1 in enumerate(entities):
-            if self._skip_intersection_for_entity(ent1):
-                continue
-            for ent2 in entities[i+1:]:
-                if self._skip_intersection_for_entity(ent2):
-                    continue
-                # Cache-Key (sortiert für Symmetrie)
-                e1_id = id(ent1)
-                e2_id = id(ent2)
-                cache_key = (min(e1_id, e2_id), max(e1_id, e2_id))
-
-                # Cache-Lookup
-                if cache_key in self._intersection_cache:
-                    intersects = self._intersection_cache[cache_key]
-                else:
-                    # Berechne und cache
-                    intersects = self._calculate_intersections(ent1, ent2)
-                    self._intersection_cache[cache_key] = intersects
-
-                for p in intersects:
-                    snap_type = SnapType.INTERSECTION
-                    target_entity = None
-                    point_obj = p
-
-                    # Line/Line liefert Meta-Infos fuer virtuelle Schnitte.
-                    if isinstance(p, tuple) and len(p) >= 2 and isinstance(p[1], bool):
-                        point_obj = p[0]
-                        is_virtual = bool(p[1])
-                        meta_entities = p[2] if len(p) > 2 else None
-                        snap_type = SnapType.VIRTUAL_INTERSECTION if is_virtual else SnapType.INTERSECTION
-                        if is_virtual and point_obj is not None:
-                            nearest_virtual_dist = min(
-                                nearest_virtual_dist,
-                                self._distance_world(point_obj, mouse_world),
-                            )
-                        if meta_entities is not None:
-                            target_entity = {
-                                "virtual": is_virtual,
-                                "entities": meta_entities,
-                            }
-
-                    self._check_point(point_obj, mouse_world, snap_radius, snap_type, target_entity, candidates)
+        # 1. Feste Snap-Punkte (Endpunkte, Mitte, Zentrum, Quadranten, echte Schnitte)
+        # kommen aus der vorberechneten Tabelle: ein KD-Tree Lookup statt O(k²)
+        table = self._snap_table
+        table.sync(self.sketch)
+        mx, my = mouse_world.x(), mouse_world.y()
+        for dist, px, py, snap_type, target in table.query_points(mx, my, snap_radius):
+            res = SnapResult(QPointF(px, py), snap_type, target)
+            candidates.append((dist, self._priority_for_snap_type(snap_type), res))
+
+        # Nearest Point on Edge (Linien, Kreise, Bögen) - vektorisiert
+        for dist, px, py, entity in table.query_edges(mx, my, snap_radius):
+            res = SnapResult(QPointF(px, py), SnapType.EDGE, entity)
+            candidates.append((dist, self._priority_for_snap_type(SnapType.EDGE), res))
+
+        # 2. VIRTUELLE SCHNITTPUNKTE (Verlängerung von Linien)
+        # Nicht lokal begrenzt, daher nur für Linien in der Nähe - vektorisiert
+        lines = [e for e in entities if isinstance(e, Line2D) and not self._skip_intersection_for_entity(e)]
+        if len(lines) <= self.MAX_INTERSECTION_ENTITIES:
+            nearest_virtual_dist = self._collect_virtual_intersections(
+                lines, mouse_world, snap_radius, candidates
+            )
 
         # 3. ORIGIN (Achsenursprung 0,0)
         origin = Point2D(0, 0)
@@ -889,6 +839,58 @@ class SmartSnapper:
 
         return []
 
+    def _collect_virtual_intersections(self, lines, mouse_world, snap_radius, candidates) -> float:
+        """
+        Virtuelle Linie-Linie-Schnitte (außerhalb mindestens eines Segments).
+
+        Gleiche Formel wie `geometry.line_line_intersection`, aber für alle
+        Paare auf einmal in NumPy.
+
+        Returns:
+            Distanz zum nächsten virtuellen Schnittpunkt (für Diagnose)
+        """
+        if len(lines) < 2:
+            return float("inf")
+
+        seg = np.array([(l.start.x, l.start.y, l.end.x, l.end.y) for l in lines], dtype=float)
+        i, j = np.triu_indices(len(lines), k=1)
+        x1, y1, x2, y2 = seg[i, 0], seg[i, 1], seg[i, 2], seg[i, 3]
+        x3, y3, x4, y4 = seg[j, 0], seg[j, 1], seg[j, 2], seg[j, 3]
+
+        denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+        keep = np.abs(denom) >= 1e-10
+        if not np.any(keep):
+            return float("inf")
+        i, j = i[keep], j[keep]
+        x1, y1, x2, y2, x3, y3, x4, y4 = (v[keep] for v in (x1, y1, x2, y2, x3, y3, x4, y4))
+        t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom[keep]
+        px = x1 + t * (x2 - x1)
+        py = y1 + t * (y2 - y1)
+
+        def _param(ax, ay, bx, by):
+            dx, dy = bx - ax, by - ay
+            d2 = dx * dx + dy * dy
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(d2 < 1e-12, np.inf, ((px - ax) * dx + (py - ay) * dy) / d2)
+
+        seg_tol = 1e-6
+        t1 = _param(x1, y1, x2, y2)
+        t2 = _param(x3, y3, x4, y4)
+        on_both = (t1 >= -seg_tol) & (t1 <= 1.0 + seg_tol) & (t2 >= -seg_tol) & (t2 <= 1.0 + seg_tol)
+        virtual = ~on_both
+        if not np.any(virtual):
+            return float("inf")
+
+        dist = np.hypot(px - mouse_world.x(), py - mouse_world.y())
+        dist_v = np.where(virtual, dist, np.inf)
+        nearest = float(dist_v.min())
+        priority = self._priority_for_snap_type(SnapType.VIRTUAL_INTERSECTION)
+        for k in np.flatnonzero(dist_v < snap_radius):
+            target = {"virtual": True, "entities": (lines[i[k]], lines[j[k]])}
+            res = SnapResult(QPointF(float(px[k]), float(py[k])), SnapType.VIRTUAL_INTERSECTION, target)
+            candidates.append((float(dist[k]), priority, res))
+        return nearest
+
     @staticmethod
     def _skip_intersection_for_entity(entity) -> bool:
         """
@@ -316,6 +316,13 @@ class BodyRenderingMixin:
                     'color': col_rgb,
                     'requested_visible': bool(visible),
                 }
+                # LOD-Pyramide im Hintergrund vorbereiten, damit die erste Kamera-Interaktion nicht wartet
+                if (
+                    getattr(self, "_lod_enabled", False)
+                    and hasattr(self, "_lod_pyramids")
+                    and int(getattr(mesh_obj, "n_points", 0)) >= getattr(self, "_lod_min_points", 0)
+                ):
+                    self._lod_pyramids.request(bid, mesh_obj)
                 pending_ref = getattr(self, "_pending_body_refs", {}).pop(bid, None)
                 if pending_ref is not None:
                     self.bodies[bid]["body"] = pending_ref
@@ -432,6 +439,28 @@ class BodyRenderingMixin:
         except Exception as e:
             logger.error(f"Add body error: {e}")
 
+    def _sync_thread_overlay(self, bid, body, visible=True):
+        """
+        Kosmetische Gewinde als Helix-Streifen über dem Body-Mesh.
+
+        Eigener Actor (body_{bid}_t) neben Mesh/Edges, nicht pickbar. Ohne
+        kosmetische Gewinde wird ein vorhandenes Overlay entfernt.
+        """
+        name = f"body_{bid}_t"
+        try:
+            lines = getattr(body, 'vtk_cosmetic_lines', None)
+            if lines is None:
+                if name in self.plotter.renderer.actors:
+                    self.plotter.remove_actor(name)
+                return
+            actor = self.plotter.add_mesh(
+                lines, color=(0.85, 0.69, 0.29), line_width=1.5, name=name,
+                pickable=False, lighting=False, reset_camera=False,
+            )
+            actor.SetVisibility(visible)
+        except Exception as e:
+            logger.debug(f"[body_mixin] Gewinde-Overlay für {bid} fehlgeschlagen: {e}")
+
     def set_body_visibility(self, body_id, visible):
         """Setzt die Sichtbarkeit eines Körpers"""
         if body_id in self.bodies:
@@ -449,6 +478,9 @@ class BodyRenderingMixin:
                 for name in actors:
                     if name in self.plotter.renderer.actors:
                         self.plotter.renderer.actors[name].SetVisibility(visible)
+            overlay = self.plotter.renderer.actors.get(f"body_{body_id}_t")
+            if overlay is not None:
+                overlay.SetVisibility(visible)
             request_render(self.plotter)
         except Exception as e:
             logger.error(f"Set visibility error: {e}")
@@ -483,10 +515,16 @@ class BodyRenderingMixin:
                     except Exception as e:
                         logger.debug(f"[body_mixin] Fehler beim Entfernen Body-Actor {n}: {e}")
                 del self._body_actors[only_body_id]
+            try:
+                self.plotter.remove_actor(f"body_{only_body_id}_t")
+            except Exception as e:
+                logger.debug(f"[body_mixin] Fehler beim Entfernen Gewinde-Overlay: {e}")
             if only_body_id in self.bodies:
                 del self.bodies[only_body_id]
-            if hasattr(self, '_lod_applied_quality'):
-                self._lod_applied_quality.pop(only_body_id, None)
+            if hasattr(self, '_lod_applied_level'):
+                self._lod_applied_level.pop(only_body_id, None)
+            if hasattr(self, '_lod_pyramids'):
+                self._lod_pyramids.discard(only_body_id)
             if hasattr(self, '_frustum_culled_body_ids'):
                 self._frustum_culled_body_ids.discard(only_body_id)
             if hasattr(self, '_pending_body_refs'):
@@ -503,10 +541,16 @@ class BodyRenderingMixin:
                         ActorPool.clear_hash(name)  # PERFORMANCE: Clear hash tracking
                     except Exception as e:
                         logger.debug(f"[body_mixin] Fehler beim Entfernen des Actors: {e}")
+                try:
+                    self.plotter.remove_actor(f"body_{bid}_t")
+                except Exception as e:
+                    logger.debug(f"[body_mixin] Fehler beim Entfernen Gewinde-Overlay: {e}")
             self._body_actors.clear()
             self.bodies.clear()
-            if hasattr(self, '_lod_applied_quality'):
-                self._lod_applied_quality.clear()
+            if hasattr(self, '_lod_applied_level'):
+                self._lod_applied_level.clear()
+            if hasattr(self, '_lod_pyramids'):
+                self._lod_pyramids.clear()
             if hasattr(self, '_frustum_culled_body_ids'):
                 self._frustum_culled_body_ids.clear()
             if hasattr(self, '_pending_body_refs'):
@@ -0,0 +1,221 @@
+"""
+MashCad - Screen-Space Edge Picker
+==================================
+
+Kanten-Picking direkt im Bildraum statt über einen 3D-Oberflächenpunkt.
+
+Problem: `pick_edge` hat per vtkCellPicker einen Punkt auf der Oberfläche
+gesucht und dann in Python über alle Kanten die Distanz zum Kanten-Zentrum
+verglichen - O(E) pro Mausbewegung, lange Kanten sind schlecht treffbar und
+Silhouetten-Kanten ohne Fläche dahinter gar nicht.
+
+Lösung:
+- Alle Polyline-Segmente werden einmal pro Kamera-Änderung vektorisiert
+  in Pixel projiziert (Segmente durch die Near-Plane werden geclippt)
+- Die Segmente liegen in einem 2D-Grid (CSR), jede Zelle kennt alle
+  Segmente, deren um die Pick-Toleranz erweiterte BBox sie überdeckt
+- Ein Pick prüft nur die Segmente der Cursor-Zelle mit vektorisierter
+  Punkt-Segment-Distanz; bei gleich nahen Kanten gewinnt die vordere
+
+Verwendung:
+    picker = ScreenEdgePicker()
+    picker.set_edges([(edge.id, edge.points) for edge in edges])
+    picker.update_projection(view_proj, width, height, key=camera_mtime)
+    edge_id = picker.pick(x, y)   # Qt-Koordinaten, -1 wenn nichts
+"""
+
+from typing import Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+
+
+EDGE_PICK_TOLERANCE_PX = 8.0
+GRID_CELL_PX = 32.0
+_NEAR_W = 1e-6  # Clip-Space w ab dem ein Punkt als "vor der Kamera" gilt
+
+
+class ScreenEdgePicker:
+    """
+    Bildraum-Index über alle Kanten-Segmente eines Bodies.
+
+    Args:
+        tolerance_px: Maximale Distanz Cursor -> Segment in Pixeln
+        cell_px: Kantenlänge einer Grid-Zelle in Pixeln
+    """
+
+    def __init__(self, tolerance_px: float = EDGE_PICK_TOLERANCE_PX, cell_px: float = GRID_CELL_PX):
+        self.tolerance_px = float(tolerance_px)
+        self.cell_px = float(cell_px)
+
+        # Welt-Segmente (statisch bis set_edges)
+        self._seg_a = np.empty((0, 3))
+        self._seg_b = np.empty((0, 3))
+        self._seg_edge = np.empty(0, dtype=np.int64)
+
+        # Bildraum-Zustand (pro Kamera)
+        self._key: Optional[Hashable] = None
+        self._size: Tuple[int, int] = (0, 0)
+        self._grid_w = 0
+        self._grid_offsets = np.zeros(1, dtype=np.int64)
+        self._grid_indices = np.empty(0, dtype=np.int64)
+        self._a2 = np.empty((0, 2))
+        self._b2 = np.empty((0, 2))
+        self._za = np.empty(0)
+        self._zb = np.empty(0)
+        self._visible = np.empty(0, dtype=np.int64)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._seg_edge)
+
+    def set_edges(self, edges: Iterable[Tuple[int, np.ndarray]]) -> None:
+        """Setzt die Kanten als (edge_id, Polyline-Punkte Nx3) und verwirft den Bildraum-Index."""
+        starts, ends, ids = [], [], []
+        for edge_id, points in edges:
+            if points is None or len(points) < 2:
+                continue
+            points = np.asarray(points, dtype=float)
+            starts.append(points[:-1])
+            ends.append(points[1:])
+            ids.append(np.full(len(points) - 1, edge_id, dtype=np.int64))
+
+        if ids:
+            self._seg_a = np.vstack(starts)
+            self._seg_b = np.vstack(ends)
+            self._seg_edge = np.concatenate(ids)
+        else:
+            self._seg_a = np.empty((0, 3))
+            self._seg_b = np.empty((0, 3))
+            self._seg_edge = np.empty(0, dtype=np.int64)
+        self._key = None
+
+    def invalidate(self) -> None:
+        """Erzwingt eine neue Projektion beim nächsten update_projection()."""
+        self._key = None
+
+    def update_projection(
+        self,
+        view_proj: np.ndarray,
+        width: int,
+        height: int,
+        key: Optional[Hashable] = None
+    ) -> bool:
+        """
+        Projiziert alle Segmente und baut das Grid neu auf.
+
+        Args:
+            view_proj: 4x4 Welt -> Clip-Space Matrix (VTK composite projection)
+            width, height: Viewport-Größe in Pixeln (Qt-Koordinaten)
+            key: Kamera-Kennung; bei gleichem Key und gleicher Größe no-op
+
+        Returns:
+            True wenn neu projiziert wurde
+        """
+        if key is not None and key == self._key and (width, height) == self._size:
+            return False
+
+        self._key = key
+        self._size = (int(width), int(height))
+        m = np.asarray(view_proj, dtype=float)
+
+        ca = self._seg_a @ m[:3, :3].T + m[:3, 3]
+        cb = self._seg_b @ m[:3, :3].T + m[:3, 3]
+        wa = self._seg_a @ m[3, :3] + m[3, 3]
+        wb = self._seg_b @ m[3, :3] + m[3, 3]
+
+        # Segmente hinter der Kamera verwerfen, durch die Near-Plane clippen
+        front_a = wa > _NEAR_W
+        front_b = wb > _NEAR_W
+        keep = front_a | front_b
+        clip_a = keep & ~front_a
+        clip_b = keep & ~front_b
+        if np.any(clip_a | clip_b):
+            t = np.zeros(len(wa))
+            denom = wb - wa
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t[clip_a] = (_NEAR_W - wa[clip_a]) / denom[clip_a]
+                t[clip_b] = (_NEAR_W - wa[clip_b]) / denom[clip_b]
+            ca_clip = ca + t[:, None] * (cb - ca)
+            wa_clip = wa + t * (wb - wa)
+            ca = np.where(clip_a[:, None], ca_clip, ca)
+            wa = np.where(clip_a, wa_clip, wa)
+            cb = np.where(clip_b[:, None], ca_clip, cb)
+            wb = np.where(clip_b, wa_clip, wb)
+
+        idx = np.flatnonzero(keep)
+        ndc_a = ca[idx] / wa[idx, None]
+        ndc_b = cb[idx] / wb[idx, None]
+
+        w, h = self._size
+        a2 = np.column_stack(((ndc_a[:, 0] + 1.0) * 0.5 * w, (1.0 - ndc_a[:, 1]) * 0.5 * h))
+        b2 = np.column_stack(((ndc_b[:, 0] + 1.0) * 0.5 * w, (1.0 - ndc_b[:, 1]) * 0.5 * h))
+
+        # Komplett außerhalb des Viewports liegende Segmente verwerfen
+        tol = self.tolerance_px
+        lo = np.minimum(a2, b2) - tol
+        hi = np.maximum(a2, b2) + tol
+        on_screen = (hi[:, 0] >= 0) & (lo[:, 0] <= w) & (hi[:, 1] >= 0) & (lo[:, 1] <= h)
+        idx, a2, b2, lo, hi = idx[on_screen], a2[on_screen], b2[on_screen], lo[on_screen], hi[on_screen]
+
+        self._visible = idx
+        self._a2, self._b2 = a2, b2
+        self._za, self._zb = ndc_a[on_screen, 2], ndc_b[on_screen, 2]
+        self._build_grid(lo, hi)
+        return True
+
+    def _build_grid(self, lo: np.ndarray, hi: np.ndarray) -> None:
+        w, h = self._size
+        cs = self.cell_px
+        gw = max(1, int(np.ceil(w / cs)))
+        gh = max(1, int(np.ceil(h / cs)))
+        self._grid_w = gw
+
+        if len(lo) == 0:
+            self._grid_offsets = np.zeros(gw * gh + 1, dtype=np.int64)
+            self._grid_indices = np.empty(0, dtype=np.int64)
+            return
+
+        x0 = np.clip(np.floor(lo[:, 0] / cs).astype(np.int64), 0, gw - 1)
+        x1 = np.clip(np.floor(hi[:, 0] / cs).astype(np.int64), 0, gw - 1)
+        y0 = np.clip(np.floor(lo[:, 1] / cs).astype(np.int64), 0, gh - 1)
+        y1 = np.clip(np.floor(hi[:, 1] / cs).astype(np.int64), 0, gh - 1)
+        nx = x1 - x0 + 1
+        counts = nx * (y1 - y0 + 1)
+
+        seg = np.repeat(np.arange(len(lo)), counts)
+        local = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = (y0[seg] + local // nx[seg]) * gw + x0[seg] + local % nx[seg]
+
+        order = np.argsort(cells, kind="stable")
+        self._grid_indices = seg[order]
+        self._grid_offsets = np.concatenate(([0], np.cumsum(np.bincount(cells, minlength=gw * gh))))
+
+    def pick(self, x: float, y: float) -> int:
+        """Nächste Kante zum Cursor (Qt-Pixel) innerhalb der Toleranz, sonst -1."""
+        w, h = self._size
+        if len(self._grid_indices) == 0 or not (0 <= x < w and 0 <= y < h):
+            return -1
+
+        cell = int(y // self.cell_px) * self._grid_w + int(x // self.cell_px)
+        cand = self._grid_indices[self._grid_offsets[cell]:self._grid_offsets[cell + 1]]
+        if len(cand) == 0:
+            return -1
+
+        a = self._a2[cand]
+        ab = self._b2[cand] - a
+        ap = np.array([x, y]) - a
+        len2 = np.einsum("ij,ij->i", ab, ab)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(len2 > 1e-12, np.einsum("ij,ij->i", ap, ab) / len2, 0.0)
+        t = np.clip(t, 0.0, 1.0)
+        dist = np.linalg.norm(ap - t[:, None] * ab, axis=1)
+
+        hits = np.flatnonzero(dist <= self.tolerance_px)
+        if len(hits) == 0:
+            return -1
+
+        # Innerhalb eines Pixels zur besten Distanz gewinnt die vorderste Kante
+        near = hits[dist[hits] <= dist[hits].min() + 1.0]
+        depth = self._za[cand[near]] + t[near] * (self._zb[cand[near]] - self._za[cand[near]])
+        best = cand[near[int(np.argmin(depth))]]
+        return int(self._seg_edge[self._visible[best]])
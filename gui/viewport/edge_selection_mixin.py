@@ -1,6 +1,6 @@
 """
 MashCad - Edge Selection Mixin V8.0 (Performance Optimized)
-Phase 7.1: Batch Rendering + Edge Filtering + Spatial Index
+Phase 7.1: Batch Rendering + Edge Filtering + Screen-Space Picking
 
 Performance-Probleme in V7:
 - 1 Actor pro Kante → 174 Kanten = 174 Actors (LANGSAM)
@@ -8,9 +8,10 @@ Performance-Probleme in V7:
 - Picking iteriert über alle Kanten
 
 Lösungen in V8:
-- Batch Rendering: Alle normalen Kanten in EINEM Actor
+- Batch Rendering: Alle Kanten in EINEM Overlay-Actor, Hover/Selektion
+  ändern nur ein Zustands-Skalar pro Kante (Lookup-Table)
 - Edge Filterung: Nur relevante Kanten für Fillet/Chamfer
-- Spatial Index: Schnelles Picking via BoundingBox
+- Screen-Space Picking: Segment-Grid im Bildraum (gui/viewport/edge_picker.py)
 
 TNP v5.0 Integration:
 - Capture SelectionContext bei jeder Edge-Selektion
@@ -34,6 +35,7 @@ except ImportError:
     HAS_PYVISTA = False
 
 from gui.viewport.render_queue import request_render  # Phase 4: Performance
+from gui.viewport.edge_picker import ScreenEdgePicker
 
 
 # ==================== Datenstrukturen ====================
@@ -62,6 +64,21 @@ EDGE_COLORS = {
     "failed": "#FF0000",      # Rot
 }
 
+# Zustands-Skalar pro Kante im Overlay (Index in die Lookup-Table)
+EDGE_STATE_NORMAL = 0
+EDGE_STATE_SELECTED = 1
+EDGE_STATE_HOVER = 2
+EDGE_STATE_LOOP = 3  # Loop-Vorschau beim Hover über eine Fläche
+
+EDGE_STATE_COLORS = (
+    EDGE_COLORS["normal"],
+    EDGE_COLORS["selected"],
+    EDGE_COLORS["hover"],
+    EDGE_COLORS["hover"],
+)
+
+EDGE_OVERLAY_ACTOR = "batch_edges_overlay"
+
 class EdgeSelectionMixin:
     """
     Mixin für PyVistaViewport zur interaktiven Kantenauswahl.
@@ -90,9 +107,12 @@ class EdgeSelectionMixin:
         self._line_width_normal = 4.0
         self._line_width_hover = 7.0
 
-        # V8: Batch Rendering State
-        self._batch_mesh_normal: Optional[object] = None  # PolyData für alle normalen Kanten
-        self._batch_mesh_selected: Optional[object] = None  # PolyData für selektierte Kanten
+        # Overlay: EIN PolyData für alle Kanten, Zustand nur als Cell-Skalar
+        self._edge_overlay_mesh: Optional[object] = None
+        self._edge_overlay_cells: Dict[int, int] = {}  # edge.id -> Zelle im Overlay
+
+        # Picking im Bildraum (Segment-Grid, neu projiziert nur bei Kamera-Änderung)
+        self._edge_picker = ScreenEdgePicker()
         self._edge_filter_mode: str = "all"  # "all", "convex", "concave"
 
         # TNP v5.0: SelectionContext storage (edge_id -> SelectionContext)
@@ -562,6 +582,7 @@ class EdgeSelectionMixin:
         """
         self._selectable_edges.clear()
         self._edge_counter = 0
+        self._edge_overlay_mesh = None
 
         if not self._get_body_by_id: return
         body = self._get_body_by_id(body_id)
@@ -619,6 +640,8 @@ class EdgeSelectionMixin:
         except Exception as e:
             logger.error(f"Extraction Error: {e}")
 
+        self._edge_picker.set_edges((e.id, e.points) for e in self._selectable_edges)
+
     def _compute_edge_convexity(self, solid) -> Dict[int, bool]:
         """
         V8: Berechnet für jede Kante ob sie konvex (Außenkante) oder konkav (Innenkante) ist.
@@ -752,118 +775,99 @@ class EdgeSelectionMixin:
 
     def _draw_edges_modern(self):
         """
-        V8: Batch-Rendering für bessere Performance.
+        Zeichnet alle Kanten als EIN Overlay-Actor.
 
-        Statt 174 einzelne Actors werden nur 3 erstellt:
-        - batch_edges_normal: Alle nicht-selektierten Kanten (1 Actor)
-        - batch_edges_selected: Alle selektierten Kanten (1 Actor)
-        - edge_hover: Die aktuell gehoverte Kante (1 Actor)
+        Die Geometrie (eine Polyline-Zelle pro Kante) wird nur beim ersten
+        Aufruf nach dem Laden der Kanten aufgebaut. Hover und Selektion
+        schreiben danach nur das Zustands-Array (normal/selected/hover/loop),
+        das über eine Lookup-Table eingefärbt wird - kein Merge, kein neuer Actor.
         """
-        # Sammle Kanten nach Status
-        normal_meshes = []
-        selected_meshes = []
-        hover_mesh = None
-
-        for edge in self._selectable_edges:
-            if edge.line_mesh is None:
-                continue
-
-            is_sel = edge.id in self._selected_edge_ids
-            is_hov = edge.id == self._hovered_edge_id or edge.id in self._hovered_loop_ids
-
-            if is_hov:
-                # Hover hat höchste Priorität - separater Actor
-                if hover_mesh is None:
-                    hover_mesh = edge.line_mesh.copy()
-                else:
-                    hover_mesh = hover_mesh.merge(edge.line_mesh)
-            elif is_sel:
-                selected_meshes.append(edge.line_mesh)
-            else:
-                normal_meshes.append(edge.line_mesh)
-
-        # 1. Normale Kanten (Batch)
-        self._update_batch_actor(
-            "batch_edges_normal",
-            normal_meshes,
-            EDGE_COLORS["normal"],
-            self._line_width_normal,
-            priority=1
-        )
+        if self._edge_overlay_mesh is None or EDGE_OVERLAY_ACTOR not in self.plotter.renderer.actors:
+            self._build_edge_overlay()
+        else:
+            self._update_edge_states()
 
-        # 2. Selektierte Kanten (Batch)
-        self._update_batch_actor(
-            "batch_edges_selected",
-            selected_meshes,
-            EDGE_COLORS["selected"],
-            self._line_width_hover,
-            priority=5
-        )
+    def _compute_edge_states(self) -> np.ndarray:
+        """Zustand pro Overlay-Zelle aus Selektion und Hover (Hover hat Vorrang)."""
+        states = np.full(len(self._edge_overlay_cells), EDGE_STATE_NORMAL, dtype=np.uint8)
+        cells = self._edge_overlay_cells
 
-        # 3. Hover Kante (Einzeln für schnelles Update)
-        if hover_mesh is not None:
-            try:
-                self.plotter.remove_actor("edge_hover")
-            except Exception as e:
-                logger.debug(f"[edge_selection_mixin] Fehler beim Entfernen des Hover-Actors: {e}")
+        def _mark(edge_ids, state):
+            idx = [cells[eid] for eid in edge_ids if eid in cells]
+            if idx:
+                states[idx] = state
 
-            self.plotter.add_mesh(
-                hover_mesh,
-                color=EDGE_COLORS["hover"],
-                opacity=1.0,
-                line_width=self._line_width_hover,
-                render_lines_as_tubes=True,  # AKTIVIERT für schöne durchgezogene Linien
-                lighting=False,
-                name="edge_hover",
-                pickable=False
-            )
-            self._set_actor_on_top("edge_hover", 10)
-        else:
-            try:
-                self.plotter.remove_actor("edge_hover")
-            except Exception as e:
-                logger.debug(f"[edge_selection_mixin] Fehler beim Entfernen des Hover-Actors: {e}")
+        _mark(self._selected_edge_ids, EDGE_STATE_SELECTED)
+        _mark(self._hovered_loop_ids, EDGE_STATE_LOOP)
+        _mark((self._hovered_edge_id,), EDGE_STATE_HOVER)
+        return states
 
-    def _update_batch_actor(self, name: str, meshes: List, color: str, width: float, priority: int):
-        """Erstellt oder aktualisiert einen Batch-Actor für mehrere Kanten."""
-        # Entferne alten Actor
+    def _build_edge_overlay(self):
+        """Baut das statische Overlay-PolyData mit edge_id und edge_state als Cell-Daten."""
         try:
-            self.plotter.remove_actor(name)
+            self.plotter.remove_actor(EDGE_OVERLAY_ACTOR)
         except Exception as e:
-            logger.debug(f"[edge_selection_mixin] Fehler beim Entfernen des Actors: {e}")
+            logger.debug(f"[edge_selection_mixin] Fehler beim Entfernen des Overlay-Actors: {e}")
 
-        if not meshes:
+        self._edge_overlay_mesh = None
+        self._edge_overlay_cells = {}
+        edges = [e for e in self._selectable_edges if e.points is not None and len(e.points) >= 2]
+        if not edges:
             return
 
-        # Merge alle Meshes in eines
-        try:
-            if len(meshes) == 1:
-                batch_mesh = meshes[0]
-            else:
-                batch_mesh = meshes[0].copy()
-                for m in meshes[1:]:
-                    batch_mesh = batch_mesh.merge(m)
+        counts = np.array([len(e.points) for e in edges], dtype=np.int64)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        # VTK-Lines-Layout: [n, i0, ..., i(n-1)] pro Polyline
+        lines = np.empty(int(counts.sum()) + len(edges), dtype=np.int64)
+        heads = starts + np.arange(len(edges))
+        lines[heads] = counts
+        body_mask = np.ones(len(lines), dtype=bool)
+        body_mask[heads] = False
+        lines[body_mask] = np.arange(int(counts.sum()))
+
+        mesh = pv.PolyData(np.vstack([e.points for e in edges]).astype(float), lines=lines)
+        mesh.cell_data["edge_id"] = np.array([e.id for e in edges], dtype=np.int64)
+        self._edge_overlay_cells = {e.id: cell for cell, e in enumerate(edges)}
+        mesh.cell_data["edge_state"] = self._compute_edge_states()
 
-            # RENDERING: Tubes für durchgezogene, schöne Kanten
-            # Achtung: render_lines_as_tubes=True erzeugt 3D-Geometrie pro Kante
-            # Bei sehr vielen Kanten (>1000) kann das langsam werden, aber für Fillet/Chamfer ist es OK
+        try:
             self.plotter.add_mesh(
-                batch_mesh,
-                color=color,
+                mesh,
+                scalars="edge_state",
+                cmap=list(EDGE_STATE_COLORS),
+                clim=[0, len(EDGE_STATE_COLORS) - 1],
+                n_colors=len(EDGE_STATE_COLORS),
+                show_scalar_bar=False,
                 opacity=1.0,
-                line_width=width,
-                render_lines_as_tubes=True,  # AKTIVIERT für schöne durchgezogene Linien
+                line_width=self._line_width_normal,
+                render_lines_as_tubes=True,
                 lighting=False,
-                name=name,
+                name=EDGE_OVERLAY_ACTOR,
                 pickable=False  # Picking via BBox, nicht via VTK
             )
-            self._set_actor_on_top(name, priority)
-
-            if name not in self._edge_actors:
-                self._edge_actors.append(name)
-
+            self._set_actor_on_top(EDGE_OVERLAY_ACTOR, 5)
+            if EDGE_OVERLAY_ACTOR not in self._edge_actors:
+                self._edge_actors.append(EDGE_OVERLAY_ACTOR)
+            self._edge_overlay_mesh = mesh
         except Exception as e:
-            logger.debug(f"Batch actor creation failed: {e}")
+            logger.debug(f"Edge overlay creation failed: {e}")
+
+    def _update_edge_states(self) -> bool:
+        """Schreibt geänderte Kanten-Zustände in-place ins Overlay. True wenn etwas geändert wurde."""
+        mesh = self._edge_overlay_mesh
+        if mesh is None:
+            return False
+
+        states = self._compute_edge_states()
+        current = mesh.cell_data["edge_state"]
+        changed = np.flatnonzero(current != states)
+        if len(changed) == 0:
+            return False
+
+        current[changed] = states[changed]
+        mesh.GetCellData().GetArray("edge_state").Modified()
+        mesh.Modified()
+        return True
 
     def _set_actor_on_top(self, name, priority=1):
         try:
@@ -885,12 +889,8 @@ class EdgeSelectionMixin:
                 logger.debug(f"[edge_selection_mixin] Fehler beim Entfernen des Edge-Actors: {e}")
         self._edge_actors.clear()
 
-        # Explizit die Batch-Namen entfernen
-        for name in ["batch_edges_normal", "batch_edges_selected", "edge_hover"]:
-            try:
-                self.plotter.remove_actor(name)
-            except Exception as e:
-                logger.debug(f"[edge_selection_mixin] Fehler beim Entfernen des Batch-Actors: {e}")
+        self._edge_overlay_mesh = None
+        self._edge_overlay_cells = {}
 
     def set_edge_filter_mode(self, mode: str):
         """
@@ -918,54 +918,27 @@ class EdgeSelectionMixin:
 
     def pick_edge(self, x, y) -> int:
         """
-        V8: Schnelles Edge-Picking via Raycasting + BBox-Test.
-        Kein VTK Actor-Picking mehr nötig.
+        Edge-Picking im Bildraum: nächstes Kanten-Segment zum Cursor.
+
+        Die Segmente werden nur neu projiziert, wenn sich Kamera oder
+        Viewport-Größe geändert haben; trifft auch Silhouetten-Kanten.
         """
         if not self._selectable_edges:
             return -1
 
-        # Raycast um 3D-Position zu bekommen
         try:
-            # Nutze VTK Cell Picker für 3D-Position
-            import vtk
-            picker = vtk.vtkCellPicker()
-            picker.SetTolerance(0.005)
-            picker.Pick(x, self.plotter.interactor.height() - y, 0, self.plotter.renderer)
-
-            pick_pos = picker.GetPickPosition()
-            if pick_pos == (0, 0, 0):
-                return -1
-
-            pick_pos = np.array(pick_pos)
-
-            # Finde nächste Kante via Distanz zum Zentrum
-            best_edge_id = -1
-            best_dist = float('inf')
-            PICK_TOLERANCE = 5.0  # mm
-
-            for edge in self._selectable_edges:
-                # Schneller BBox-Check zuerst
-                if edge.bbox:
-                    xmin, xmax, ymin, ymax, zmin, zmax = edge.bbox
-                    margin = PICK_TOLERANCE
-                    if (pick_pos[0] < xmin - margin or pick_pos[0] > xmax + margin or
-                        pick_pos[1] < ymin - margin or pick_pos[1] > ymax + margin or
-                        pick_pos[2] < zmin - margin or pick_pos[2] > zmax + margin):
-                        continue  # Außerhalb BBox, skip
-
-                # Distanz zum Zentrum
-                center = np.array(edge.center)
-                dist = np.linalg.norm(pick_pos - center)
-
-                # Bonus für kürzere Kanten (präziseres Picking)
-                if edge.length > 0:
-                    dist = dist / (1 + edge.length * 0.01)
-
-                if dist < best_dist and dist < PICK_TOLERANCE * 2:
-                    best_dist = dist
-                    best_edge_id = edge.id
-
-            return best_edge_id
+            renderer = self.plotter.renderer
+            camera = renderer.GetActiveCamera()
+            interactor = self.plotter.interactor
+            width, height = int(interactor.width()), int(interactor.height())
+            aspect = width / height if height > 0 else 1.0
+            key = (camera.GetMTime(), width, height)
+
+            matrix = camera.GetCompositeProjectionTransformMatrix(aspect, -1, 1)
+            view_proj = np.array([[matrix.GetElement(i, j) for j in range(4)] for i in range(4)])
+            self._edge_picker.update_projection(view_proj, width, height, key=key)
+
+            return self._edge_picker.pick(x, y)
 
         except Exception as e:
             logger.debug(f"Edge picking failed: {e}")
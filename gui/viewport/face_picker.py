@@ -0,0 +1,343 @@
+"""
+MashCad - BVH Face Picking
+==========================
+
+Ray-Picking von Body-Flächen in NumPy statt per vtkCellPicker.
+
+Problem: Hover über Body-Flächen hat bei jeder Mausbewegung einen neuen
+vtkCellPicker gegen den kompletten Renderer geschossen und das Ergebnis
+danach über die Actor-Liste auf einen Body zurückgemappt - bei Szenen mit
+vielen Bodies dominiert das die Hover-Latenz.
+
+Lösung:
+- Pro Body ein Dreiecks-BVH aus dem gecachten Mesh (inkl. face_id)
+- Szenen-BVH über die Body-Bounds; Bodies werden nach Eintrittsdistanz
+  getestet, sobald ein Treffer näher ist als die nächste Box: Abbruch
+- Das BVH ist ein implizit balancierter Baum über Morton-sortierte
+  Primitive (Blätter = feste Blockgröße), Aufbau und Traversierung sind
+  pro Ebene vektorisiert
+- Neuaufbau nur, wenn sich das Mesh-Objekt eines Bodies ändert
+
+Verwendung:
+    service = FacePickingService()
+    hit = service.pick_ray(origin, direction, bodies, visible_ids)
+    if hit: hit.body_id, hit.face_id, hit.position, hit.normal
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+BVH_LEAF_SIZE = 8
+_EPS = 1e-12
+
+
+@dataclass
+class FaceHit:
+    """Ergebnis eines Face-Picks."""
+    body_id: str
+    cell_id: int
+    face_id: Optional[int]
+    position: Tuple[float, float, float]
+    normal: Tuple[float, float, float]
+    distance: float
+
+
+def _morton_order(centers: np.ndarray) -> np.ndarray:
+    """Sortierreihenfolge entlang einer 3D-Morton-Kurve (10 Bit pro Achse)."""
+    lo = centers.min(axis=0)
+    extent = np.maximum(centers.max(axis=0) - lo, _EPS)
+    q = np.clip(((centers - lo) / extent * 1023.0).astype(np.uint32), 0, 1023)
+
+    def _spread(v):
+        v = (v | (v << 16)) & 0x030000FF
+        v = (v | (v << 8)) & 0x0300F00F
+        v = (v | (v << 4)) & 0x030C30C3
+        v = (v | (v << 2)) & 0x09249249
+        return v
+
+    codes = (_spread(q[:, 0]) << 2) | (_spread(q[:, 1]) << 1) | _spread(q[:, 2])
+    return np.argsort(codes, kind="stable")
+
+
+def _ray_box(origin, inv_dir, lo, hi) -> Tuple[np.ndarray, np.ndarray]:
+    """Slab-Test gegen viele AABBs. Returns (hit_mask, t_enter)."""
+    with np.errstate(invalid="ignore"):
+        t0 = (lo - origin) * inv_dir
+        t1 = (hi - origin) * inv_dir
+    t_near = np.nanmax(np.minimum(t0, t1), axis=1)
+    t_far = np.nanmin(np.maximum(t0, t1), axis=1)
+    return (t_far >= np.maximum(t_near, 0.0)), np.maximum(t_near, 0.0)
+
+
+class AabbTree:
+    """
+    Implizites BVH über Achsen-parallele Boxen.
+
+    Blätter sind Blöcke von leaf_size Morton-sortierten Primitiven, jede
+    höhere Ebene fasst zwei benachbarte Knoten zusammen.
+    """
+
+    def __init__(self, lo: np.ndarray, hi: np.ndarray, leaf_size: int = BVH_LEAF_SIZE):
+        lo = np.asarray(lo, dtype=float).reshape(-1, 3)
+        hi = np.asarray(hi, dtype=float).reshape(-1, 3)
+        self.leaf_size = max(1, int(leaf_size))
+        self.size = len(lo)
+        self.order = _morton_order((lo + hi) * 0.5) if self.size else np.empty(0, dtype=np.int64)
+
+        n_leaves = -(-self.size // self.leaf_size)
+        pad = n_leaves * self.leaf_size - self.size
+        lo_sorted = np.vstack([lo[self.order], np.full((pad, 3), np.inf)])
+        hi_sorted = np.vstack([hi[self.order], np.full((pad, 3), -np.inf)])
+        level_lo = lo_sorted.reshape(n_leaves, self.leaf_size, 3).min(axis=1)
+        level_hi = hi_sorted.reshape(n_leaves, self.leaf_size, 3).max(axis=1)
+
+        # levels[0] = Blätter, levels[-1] = Wurzel
+        self.levels: List[Tuple[np.ndarray, np.ndarray]] = [(level_lo, level_hi)]
+        while len(level_lo) > 1:
+            if len(level_lo) % 2:
+                level_lo = np.vstack([level_lo, np.full((1, 3), np.inf)])
+                level_hi = np.vstack([level_hi, np.full((1, 3), -np.inf)])
+            level_lo = np.minimum(level_lo[0::2], level_lo[1::2])
+            level_hi = np.maximum(level_hi[0::2], level_hi[1::2])
+            self.levels.append((level_lo, level_hi))
+
+    def query_ray(self, origin: np.ndarray, direction: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Primitive, deren Blatt vom Strahl getroffen wird.
+
+        Returns:
+            (primitive_indices, t_enter des jeweiligen Blattes)
+        """
+        if self.size == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        with np.errstate(divide="ignore"):
+            inv_dir = 1.0 / np.where(np.abs(direction) < _EPS, 0.0, direction)
+
+        nodes = np.zeros(1, dtype=np.int64)
+        t_enter = np.zeros(1)
+        for depth in range(len(self.levels) - 1, -1, -1):
+            level_lo, level_hi = self.levels[depth]
+            if depth < len(self.levels) - 1:
+                nodes = np.concatenate((2 * nodes, 2 * nodes + 1))
+                nodes = nodes[nodes < len(level_lo)]
+            hit, t_enter = _ray_box(origin, inv_dir, level_lo[nodes], level_hi[nodes])
+            nodes, t_enter = nodes[hit], t_enter[hit]
+            if len(nodes) == 0:
+                return np.empty(0, dtype=np.int64), np.empty(0)
+
+        slots = (nodes[:, None] * self.leaf_size + np.arange(self.leaf_size)).ravel()
+        leaf_t = np.repeat(t_enter, self.leaf_size)
+        valid = slots < self.size
+        return self.order[slots[valid]], leaf_t[valid]
+
+
+class TriangleBVH:
+    """BVH über die Dreiecke eines Meshes mit vektorisiertem Möller-Trumbore."""
+
+    def __init__(self, points: np.ndarray, triangles: np.ndarray, leaf_size: int = BVH_LEAF_SIZE):
+        points = np.asarray(points, dtype=float)
+        self.triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        self.v0 = points[self.triangles[:, 0]]
+        self.e1 = points[self.triangles[:, 1]] - self.v0
+        self.e2 = points[self.triangles[:, 2]] - self.v0
+        corners = points[self.triangles]
+        self.tree = AabbTree(corners.min(axis=1), corners.max(axis=1), leaf_size)
+        self.bounds = (
+            (points.min(axis=0), points.max(axis=0)) if len(points)
+            else (np.zeros(3), np.zeros(3))
+        )
+
+    def intersect(self, origin: np.ndarray, direction: np.ndarray) -> Optional[Tuple[int, float]]:
+        """Nächstes getroffenes Dreieck als (Index, t) oder None."""
+        cand, _ = self.tree.query_ray(origin, direction)
+        if len(cand) == 0:
+            return None
+
+        e1, e2 = self.e1[cand], self.e2[cand]
+        pvec = np.cross(direction, e2)
+        det = np.einsum("ij,ij->i", e1, pvec)
+        ok = np.abs(det) > _EPS
+        inv_det = np.where(ok, 1.0 / np.where(ok, det, 1.0), 0.0)
+        tvec = origin - self.v0[cand]
+        u = np.einsum("ij,ij->i", tvec, pvec) * inv_det
+        qvec = np.cross(tvec, e1)
+        v = (qvec @ direction) * inv_det
+        t = np.einsum("ij,ij->i", e2, qvec) * inv_det
+
+        tol = 1e-9
+        hit = ok & (u >= -tol) & (v >= -tol) & (u + v <= 1.0 + tol) & (t > 0.0)
+        if not np.any(hit):
+            return None
+        idx = np.flatnonzero(hit)
+        best = idx[np.argmin(t[idx])]
+        return int(cand[best]), float(t[best])
+
+    def normal(self, tri: int) -> np.ndarray:
+        n = np.cross(self.e1[tri], self.e2[tri])
+        length = np.linalg.norm(n)
+        return n / length if length > _EPS else n
+
+
+class _BodyEntry:
+    __slots__ = ("mesh", "bvh", "cell_ids", "face_ids")
+
+    def __init__(self, mesh, bvh: TriangleBVH, cell_ids: np.ndarray, face_ids: Optional[np.ndarray]):
+        self.mesh = mesh
+        self.bvh = bvh
+        self.cell_ids = cell_ids
+        self.face_ids = face_ids
+
+
+def _triangles_from_mesh(mesh) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(points, triangles, cell_id pro Dreieck) aus einem PolyData."""
+    points = np.asarray(mesh.points, dtype=float)
+    faces = np.asarray(mesh.faces, dtype=np.int64)
+    if len(faces) == 0:
+        return points, np.empty((0, 3), dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    if len(faces) % 4 == 0 and np.all(faces[0::4] == 3):
+        return points, faces.reshape(-1, 4)[:, 1:], np.arange(len(faces) // 4)
+
+    # Polygone per Fächer triangulieren, Zell-Zuordnung behalten
+    triangles, cell_ids = [], []
+    offset, cell = 0, 0
+    while offset < len(faces):
+        n = int(faces[offset])
+        poly = faces[offset + 1:offset + 1 + n]
+        for k in range(1, n - 1):
+            triangles.append((poly[0], poly[k], poly[k + 1]))
+            cell_ids.append(cell)
+        offset += n + 1
+        cell += 1
+    return points, np.array(triangles, dtype=np.int64).reshape(-1, 3), np.array(cell_ids, dtype=np.int64)
+
+
+class FacePickingService:
+    """
+    Face-Picking über alle Bodies einer Szene.
+
+    Per-Body-BVHs werden lazy beim ersten Pick gebaut und an das
+    Mesh-Objekt gebunden (`is`-Vergleich); ein neues Mesh löst einen
+    Neuaufbau nur für diesen Body aus.
+    """
+
+    def __init__(self, leaf_size: int = BVH_LEAF_SIZE):
+        self.leaf_size = leaf_size
+        self._entries: Dict[str, _BodyEntry] = {}
+        self._scene_key: Optional[Tuple] = None
+        self._scene_ids: List[str] = []
+        self._scene_tree: Optional[AabbTree] = None
+
+    def _entry(self, body_id: str, mesh) -> Optional[_BodyEntry]:
+        entry = self._entries.get(body_id)
+        if entry is not None and entry.mesh is mesh:
+            return entry
+
+        points, triangles, cell_ids = _triangles_from_mesh(mesh)
+        if len(triangles) == 0:
+            self._entries.pop(body_id, None)
+            return None
+
+        face_ids = None
+        cell_data = getattr(mesh, "cell_data", None)
+        if cell_data is not None and "face_id" in cell_data:
+            face_ids = np.asarray(cell_data["face_id"])
+
+        entry = _BodyEntry(mesh, TriangleBVH(points, triangles, self.leaf_size), cell_ids, face_ids)
+        self._entries[body_id] = entry
+        return entry
+
+    def sync(self, meshes: Dict[str, object]) -> None:
+        """Gleicht die Body-BVHs und das Szenen-BVH mit {body_id: mesh} ab."""
+        for body_id in list(self._entries):
+            if body_id not in meshes:
+                del self._entries[body_id]
+
+        entries = {bid: self._entry(bid, mesh) for bid, mesh in meshes.items() if mesh is not None}
+        ids = sorted(bid for bid, entry in entries.items() if entry is not None)
+        key = tuple((bid, id(self._entries[bid].mesh)) for bid in ids)
+        if key == self._scene_key:
+            return
+
+        self._scene_key = key
+        self._scene_ids = ids
+        if ids:
+            lo = np.array([self._entries[bid].bvh.bounds[0] for bid in ids])
+            hi = np.array([self._entries[bid].bvh.bounds[1] for bid in ids])
+            self._scene_tree = AabbTree(lo, hi, leaf_size=1)
+        else:
+            self._scene_tree = None
+
+    def discard(self, body_id: str) -> None:
+        self._entries.pop(body_id, None)
+        self._scene_key = None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._scene_key = None
+        self._scene_ids = []
+        self._scene_tree = None
+
+    def pick_ray(
+        self,
+        origin,
+        direction,
+        meshes: Dict[str, object],
+        visible_ids: Optional[Iterable[str]] = None
+    ) -> Optional[FaceHit]:
+        """
+        Schießt einen Strahl durch die Szene.
+
+        Args:
+            origin, direction: Strahl in Weltkoordinaten
+            meshes: {body_id: mesh} aller Bodies
+            visible_ids: Nur diese Bodies berücksichtigen (None = alle)
+        """
+        self.sync(meshes)
+        if self._scene_tree is None:
+            return None
+
+        origin = np.asarray(origin, dtype=float)
+        direction = np.asarray(direction, dtype=float)
+        norm = np.linalg.norm(direction)
+        if norm < _EPS:
+            return None
+        direction = direction / norm
+
+        body_idx, t_enter = self._scene_tree.query_ray(origin, direction)
+        visible = set(visible_ids) if visible_ids is not None else None
+
+        best = None
+        for k in np.argsort(t_enter, kind="stable"):
+            if best is not None and t_enter[k] > best[2]:
+                break
+            body_id = self._scene_ids[body_idx[k]]
+            if visible is not None and body_id not in visible:
+                continue
+            entry = self._entries[body_id]
+            result = entry.bvh.intersect(origin, direction)
+            if result is not None and (best is None or result[1] < best[2]):
+                best = (body_id, result[0], result[1])
+
+        if best is None:
+            return None
+
+        body_id, tri, t = best
+        entry = self._entries[body_id]
+        cell_id = int(entry.cell_ids[tri])
+        face_id = None
+        if entry.face_ids is not None and cell_id < len(entry.face_ids):
+            face_id = int(entry.face_ids[cell_id])
+        position = origin + t * direction
+        return FaceHit(
+            body_id=body_id,
+            cell_id=cell_id,
+            face_id=face_id,
+            position=tuple(float(c) for c in position),
+            normal=tuple(float(c) for c in entry.bvh.normal(tri)),
+            distance=t,
+        )
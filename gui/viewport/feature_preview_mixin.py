@@ -404,6 +404,84 @@ class FeaturePreviewMixin:
         except Exception as e:
             logger.debug(f"Clear Chamfer Preview Error: {e}")
 
+    # ========================================================================
+    # Pattern Live Preview
+    # ========================================================================
+
+    def show_pattern_preview(self, body_id: str, matrices):
+        """
+        Zeigt die Pattern-Instanzen eines Bodies.
+
+        Das Body-Mesh wird einmal in einen Mapper geladen (Cache pro Mesh),
+        jede Instanz ist nur ein Actor mit eigener UserMatrix. Parameter-
+        Änderungen setzen daher nur Matrizen, es wird nichts tesselliert.
+
+        Args:
+            body_id: ID des Ziel-Bodies
+            matrices: (N, 4, 4) Platzierungen, [0] = Original (wird übersprungen)
+        """
+        if not HAS_PYVISTA:
+            return
+
+        try:
+            import vtk
+
+            mesh = self.get_body_mesh(body_id) if hasattr(self, 'get_body_mesh') else None
+            if mesh is None:
+                self.clear_pattern_preview()
+                return
+
+            source = getattr(self, '_pattern_preview_source', None)
+            if source is None or source[0] is not mesh:
+                self.clear_pattern_preview()
+                mapper = vtk.vtkPolyDataMapper()
+                mapper.SetInputData(mesh)
+                mapper.ScalarVisibilityOff()
+                self._pattern_preview_source = (mesh, mapper)
+            mapper = self._pattern_preview_source[1]
+
+            actors = getattr(self, '_pattern_preview_actors', None)
+            if actors is None:
+                actors = self._pattern_preview_actors = []
+            renderer = self.plotter.renderer
+            placements = list(matrices)[1:]
+
+            while len(actors) > len(placements):
+                renderer.RemoveActor(actors.pop())
+            while len(actors) < len(placements):
+                actor = vtk.vtkActor()
+                actor.SetMapper(mapper)
+                actor.PickableOff()
+                prop = actor.GetProperty()
+                prop.SetColor(0.4, 0.67, 1.0)
+                prop.SetOpacity(0.35)
+                renderer.AddActor(actor)
+                actors.append(actor)
+
+            for actor, matrix in zip(actors, placements):
+                vtk_matrix = vtk.vtkMatrix4x4()
+                vtk_matrix.DeepCopy(np.asarray(matrix, dtype=float).ravel())
+                actor.SetUserMatrix(vtk_matrix)
+
+            request_render(self.plotter)
+            logger.debug(f"Pattern Preview: {len(placements)} Instanzen")
+
+        except Exception as e:
+            logger.debug(f"Pattern Preview Error: {e}")
+
+    def clear_pattern_preview(self):
+        """Entfernt die Pattern-Preview."""
+        try:
+            actors = getattr(self, '_pattern_preview_actors', None) or []
+            for actor in actors:
+                self.plotter.renderer.RemoveActor(actor)
+            self._pattern_preview_actors = []
+            self._pattern_preview_source = None
+            if actors:
+                request_render(self.plotter)
+        except Exception as e:
+            logger.debug(f"Clear Pattern Preview Error: {e}")
+
     # ========================================================================
     # Cleanup
     # ========================================================================
@@ -413,4 +491,5 @@ class FeaturePreviewMixin:
         self._clear_shell_preview()
         self._clear_fillet_preview()
         self._clear_chamfer_preview()
+        self.clear_pattern_preview()
 
@@ -0,0 +1,227 @@
+"""
+MashCad - Viewport LOD-Pyramide
+===============================
+
+Vorberechnete Detailstufen pro Body für die Kamera-Interaktion.
+
+Problem: Das bisherige LOD-System hat bei jedem Interaktions-Start und
+-Ende `CADTessellator.tessellate_with_face_ids` für jeden sichtbaren Body
+auf dem Main-Thread aufgerufen - schwere Assemblies ruckeln, bevor sich
+der erste Frame bewegt.
+
+Lösung:
+- Pyramide aus dem Full-Quality-Mesh per Quadric-Decimation (kein OCP)
+- face_id (und alle anderen Cell-Daten) werden über die nächstgelegene
+  Original-Zelle übertragen, Face-Picking bleibt gültig
+- Aufbau in einem Hintergrund-Thread, gecacht zusammen mit dem Mesh
+- Während der Interaktion ist der Actor-Swap ein reiner Pointer-Swap;
+  die Stufe richtet sich nach der projizierten Bildschirmgröße
+
+Verwendung:
+    cache = LodPyramidCache()
+    cache.request(body_id, mesh)            # beim Hinzufügen des Bodies
+    pyramid = cache.get(body_id, mesh)      # None solange nicht fertig
+    level = pyramid.select_level(radius_px, cells_per_px2)
+    mapper.SetInputData(pyramid.levels[level])
+"""
+
+import math
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+try:
+    import pyvista as pv
+    HAS_PYVISTA = True
+except ImportError:
+    HAS_PYVISTA = False
+
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+
+# Zielanteil der Zellen pro Stufe (Stufe 0 = Original)
+LOD_RATIOS: Tuple[float, ...] = (0.5, 0.25, 0.1)
+# Kleinere Stufen bringen keinen messbaren Gewinn mehr
+LOD_MIN_CELLS = 500
+
+
+class LodPyramid:
+    """Detailstufen eines Meshes, levels[0] ist das Full-Quality-Mesh."""
+
+    def __init__(self, levels: List['pv.PolyData']):
+        self.levels = levels
+        self.cell_counts = [int(level.n_cells) for level in levels]
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def select_level(self, radius_px: float, cells_per_px2: float) -> int:
+        """
+        Gröbste Stufe, die für die projizierte Größe noch genug Zellen hat.
+
+        Args:
+            radius_px: Projizierter Radius der Bounding-Sphere in Pixeln
+            cells_per_px2: Zell-Budget pro Pixel der projizierten Kreisfläche
+        """
+        if not math.isfinite(radius_px):
+            return 0
+        budget = cells_per_px2 * math.pi * max(radius_px, 0.0) ** 2
+        level = 0
+        for idx, count in enumerate(self.cell_counts):
+            if count >= budget:
+                level = idx
+        return level
+
+
+def _snapshot(mesh) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+    """Kopiert Geometrie und Cell-Daten, damit der Worker keine geteilten VTK-Objekte liest."""
+    cell_data = {
+        name: np.array(mesh.cell_data[name])
+        for name in mesh.cell_data.keys()
+        if name != "Normals"
+    }
+    return np.array(mesh.points), np.array(mesh.faces), cell_data
+
+
+def _decimate_levels(
+    points: np.ndarray,
+    faces: np.ndarray,
+    cell_data: Dict[str, np.ndarray],
+    ratios: Sequence[float],
+    min_cells: int
+) -> List['pv.PolyData']:
+    """Baut die groben Stufen (ohne Stufe 0) aus einer Mesh-Kopie."""
+    source = pv.PolyData(points, faces)
+    n_cells = source.n_cells
+    # Split-Vertices (Normalen an Kanten) wieder verschmelzen, sonst reißt die Decimation auf
+    work = pv.PolyData(points, faces).clean()
+
+    centers = np.asarray(source.cell_centers().points)
+    tree = cKDTree(centers) if HAS_SCIPY else None
+
+    levels = []
+    for ratio in ratios:
+        if n_cells * ratio < min_cells:
+            break
+
+        lod = work.decimate(1.0 - ratio, volume_preservation=True)
+        if lod.n_cells == 0 or lod.n_cells >= n_cells:
+            continue
+
+        # Cell-Daten der nächstgelegenen Original-Zelle übernehmen
+        lod_centers = np.asarray(lod.cell_centers().points)
+        if tree is not None:
+            _, nearest = tree.query(lod_centers)
+        else:
+            nearest = source.find_closest_cell(lod_centers)
+        for name, values in cell_data.items():
+            lod.cell_data[name] = values[nearest]
+
+        lod = lod.compute_normals(
+            cell_normals=False,
+            point_normals=True,
+            split_vertices=True,
+            feature_angle=30.0,
+            consistent_normals=True,
+        )
+        levels.append(lod)
+
+    return levels
+
+
+def build_lod_pyramid(
+    mesh: 'pv.PolyData',
+    ratios: Sequence[float] = LOD_RATIOS,
+    min_cells: int = LOD_MIN_CELLS
+) -> LodPyramid:
+    """Baut die LOD-Pyramide synchron (für Tests und kleine Meshes)."""
+    return LodPyramid([mesh] + _decimate_levels(*_snapshot(mesh), ratios, min_cells))
+
+
+class LodPyramidCache:
+    """
+    Pyramiden pro Body, gebaut in einem Hintergrund-Thread.
+
+    Ein Eintrag gilt nur für genau das Mesh-Objekt, aus dem er gebaut wurde;
+    ein neues Mesh (Rebuild, Feature-Änderung) stößt automatisch einen
+    Neuaufbau an.
+    """
+
+    def __init__(self, ratios: Sequence[float] = LOD_RATIOS, min_cells: int = LOD_MIN_CELLS):
+        self.ratios = tuple(ratios)
+        self.min_cells = min_cells
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._entries: Dict[str, Tuple[object, Future]] = {}
+        self._ready: Dict[str, LodPyramid] = {}
+        self._lock = threading.Lock()
+
+    def request(self, body_id: str, mesh) -> Optional[Future]:
+        """Plant den Aufbau für dieses Mesh ein (no-op wenn schon vorhanden)."""
+        if not HAS_PYVISTA or mesh is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(body_id)
+            if entry is not None and entry[0] is mesh:
+                return entry[1]
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lod-pyramid")
+
+            # Snapshot auf dem aufrufenden Thread, der Worker arbeitet nur auf Kopien
+            snapshot = _snapshot(mesh)
+            future = self._executor.submit(_decimate_levels, *snapshot, self.ratios, self.min_cells)
+            self._entries[body_id] = (mesh, future)
+            return future
+
+    def get(self, body_id: str, mesh) -> Optional[LodPyramid]:
+        """
+        Fertige Pyramide für dieses Mesh oder None.
+
+        Fehlt der Eintrag oder gehört er zu einem alten Mesh, wird der Aufbau
+        eingeplant - blockiert wird nie.
+        """
+        pyramid = self._ready.get(body_id)
+        if pyramid is not None and pyramid.levels[0] is mesh:
+            return pyramid
+
+        future = self.request(body_id, mesh)
+        if future is None or not future.done():
+            return None
+
+        try:
+            levels = future.result()
+        except Exception as e:
+            logger.debug(f"[LOD] Pyramide für {body_id} fehlgeschlagen: {e}")
+            return None
+
+        pyramid = LodPyramid([mesh] + levels)
+        with self._lock:
+            entry = self._entries.get(body_id)
+            if entry is not None and entry[0] is mesh:
+                self._ready[body_id] = pyramid
+        return pyramid
+
+    def discard(self, body_id: str) -> None:
+        """Verwirft den Eintrag eines Bodies (z.B. beim Entfernen)."""
+        with self._lock:
+            entry = self._entries.pop(body_id, None)
+            self._ready.pop(body_id, None)
+        if entry is not None:
+            entry[1].cancel()
+
+    def clear(self) -> None:
+        """Verwirft alle Einträge."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._ready.clear()
+        for _mesh, future in entries:
+            future.cancel()
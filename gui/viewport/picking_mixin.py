@@ -11,12 +11,16 @@ TNP v5.0 Integration:
 - Capture SelectionContext bei jeder Shape-Selektion
 - Speichert view_direction, selection_point, adjacent_shapes
 - Ermöglicht Semantic Matching für bessere Resolution-Rate
+
+Hover/Plane-Picking auf Body-Flächen läuft über FacePickingService
+(BVH in NumPy, gui/viewport/face_picker.py) statt vtkCellPicker.
 """
 
 import numpy as np
 from typing import Optional, List, Tuple, Any
 from loguru import logger
 from config.tolerances import Tolerances  # Phase 5: Zentralisierte Toleranzen
+from gui.viewport.face_picker import FaceHit, FacePickingService
 
 try:
     import vtk
@@ -441,46 +445,63 @@ class PickingMixin:
         
         return tuple(near_pt), tuple(direction)
 
+    def _get_face_picking_service(self) -> FacePickingService:
+        service = getattr(self, "_face_picking_service", None)
+        if service is None:
+            service = FacePickingService()
+            self._face_picking_service = service
+        return service
+
+    def _visible_body_ids(self) -> List[str]:
+        """Bodies, deren Mesh-Actor aktuell sichtbar ist."""
+        actors = self.plotter.renderer.actors
+        visible = []
+        for bid, actor_names in (getattr(self, "_body_actors", {}) or {}).items():
+            actor = actors.get(actor_names[0]) if actor_names else None
+            if actor is not None and actor.GetVisibility():
+                visible.append(bid)
+        return visible
+
+    def _pick_body_hit(self, x, y) -> Optional[FaceHit]:
+        """
+        Body-Fläche unter dem Cursor per BVH-Raycast.
+
+        Die BVHs hängen am gecachten Body-Mesh (inkl. face_id) und werden nur
+        neu gebaut, wenn sich das Mesh eines Bodies ändert.
+        """
+        if not self.bodies:
+            return None
+        ray_origin, ray_dir = self.get_ray_from_click(x, y)
+        meshes = {bid: data.get("mesh") for bid, data in self.bodies.items()}
+        return self._get_face_picking_service().pick_ray(
+            ray_origin, ray_dir, meshes, visible_ids=self._visible_body_ids()
+        )
+
     def _hover_body_face(self, x, y):
         """Hebt Body-Flächen beim Hover hervor"""
         if not self.bodies or not HAS_VTK:
             return
             
         try:
-            cell_picker = vtk.vtkCellPicker()
-            cell_picker.SetTolerance(Tolerances.PICKER_TOLERANCE_COARSE)
-            height = self.plotter.interactor.height()
-            
-            picked = cell_picker.Pick(x, height - y, 0, self.plotter.renderer)
-            cell_id = cell_picker.GetCellId()
-            
-            if picked and cell_id != -1:
-                actor = cell_picker.GetActor()
-                if actor is None or not actor.GetVisibility():
-                    if self.hovered_body_face is not None:
-                        self.hovered_body_face = None
-                        self._clear_body_face_highlight()
-                    return
-
-                body_id = self._resolve_body_id_for_actor(actor)
-
-                if body_id is not None:
-                    normal = cell_picker.GetPickNormal()
-                    pos = cell_picker.GetPickPosition()
-                    
-                    new_hover = (body_id, cell_id, tuple(normal), tuple(pos))
-                    if self.hovered_body_face != new_hover:
-                        self.hovered_body_face = new_hover
-                        if (
-                            getattr(self, 'hole_mode', False)
-                            or getattr(self, 'thread_mode', False)
-                            or getattr(self, 'draft_mode', False)
-                            or getattr(self, 'texture_face_mode', False)
-                        ) and hasattr(self, '_draw_full_face_hover'):
-                            self._draw_full_face_hover(body_id, tuple(normal), tuple(normal), cell_id=cell_id)
-                        else:
-                            self._draw_body_face_highlight(pos, normal)
-                    return
+            hit = self._pick_body_hit(x, y)
+
+            if hit is not None:
+                body_id, cell_id = hit.body_id, hit.cell_id
+                normal, pos = hit.normal, hit.position
+
+                new_hover = (body_id, cell_id, tuple(normal), tuple(pos))
+                if self.hovered_body_face != new_hover:
+                    self.hovered_body_face = new_hover
+                    if (
+                        getattr(self, 'hole_mode', False)
+                        or getattr(self, 'thread_mode', False)
+                        or getattr(self, 'draft_mode', False)
+                        or getattr(self, 'texture_face_mode', False)
+                    ) and hasattr(self, '_draw_full_face_hover'):
+                        self._draw_full_face_hover(body_id, tuple(normal), tuple(normal), cell_id=cell_id)
+                    else:
+                        self._draw_body_face_highlight(pos, normal)
+                return
             
             if self.hovered_body_face is not None:
                 self.hovered_body_face = None
@@ -494,33 +515,26 @@ class PickingMixin:
         if not HAS_VTK:
             return False
             
-        cell_picker = vtk.vtkCellPicker()
-        cell_picker.SetTolerance(Tolerances.PICKER_TOLERANCE)
-        cell_picker.Pick(x, self.plotter.interactor.height() - y, 0, self.plotter.renderer)
-        
-        if cell_picker.GetCellId() != -1:
-            # Find body ID
-            actor = cell_picker.GetActor()
-            body_id = self._resolve_body_id_for_actor(actor)
-            
-            if body_id is not None:
-                normal = list(cell_picker.GetPickNormal())
-                pos = cell_picker.GetPickPosition()
-                
-                # Bereinigung: Fast-Nullen und Fast-Einsen glätten
-                for i in range(3):
-                    if abs(normal[i]) < 0.001:
-                        normal[i] = 0.0
-                    if abs(normal[i] - 1.0) < 0.001:
-                        normal[i] = 1.0
-                    if abs(normal[i] + 1.0) < 0.001:
-                        normal[i] = -1.0
-                
-                self._last_picked_face_center = tuple(pos)
-                self._last_picked_face_normal = tuple(normal)
-                self.custom_plane_clicked.emit(tuple(pos), tuple(normal))
-                self._draw_plane_hover_highlight(pos, normal)
-                return True
+        hit = self._pick_body_hit(x, y)
+
+        if hit is not None:
+            normal = list(hit.normal)
+            pos = hit.position
+
+            # Bereinigung: Fast-Nullen und Fast-Einsen glätten
+            for i in range(3):
+                if abs(normal[i]) < 0.001:
+                    normal[i] = 0.0
+                if abs(normal[i] - 1.0) < 0.001:
+                    normal[i] = 1.0
+                if abs(normal[i] + 1.0) < 0.001:
+                    normal[i] = -1.0
+
+            self._last_picked_face_center = tuple(pos)
+            self._last_picked_face_normal = tuple(normal)
+            self.custom_plane_clicked.emit(tuple(pos), tuple(normal))
+            self._draw_plane_hover_highlight(pos, normal)
+            return True
         return False
 
     def _handle_selection_click(self, x, y, is_multi):
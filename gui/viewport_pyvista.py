@@ -210,6 +210,7 @@ from gui.viewport.section_view_mixin import SectionViewMixin, SectionClipCache
 from gui.viewport.selection_mixin import SelectionMixin  # Paket B: Unified Selection API
 from gui.viewport.feature_preview_mixin import FeaturePreviewMixin  # Live Preview für Shell, Fillet, Chamfer
 from gui.viewport.render_queue import request_render  # Phase 4: Performance
+from gui.viewport.lod_pyramid import LodPyramidCache
 from config.tolerances import Tolerances  # Phase 5: Zentralisierte Toleranzen
 from config.feature_flags import is_enabled  # Performance Plan Phase 3
 from gui.design_tokens import DesignTokens  # NEU: Single Source of Truth
@@ -546,11 +547,12 @@ class PyVistaViewport(QWidget, SelectionMixin, ExtrudeMixin, PickingMixin, BodyR
         self._hover_pick_cache_ttl = 0.008  # 8ms cache validity (~120 FPS worth)
 
         # Phase 1: Viewport LOD system (coarse during camera interaction)
+        # Stufen kommen aus einer vorberechneten Decimation-Pyramide (kein OCP-Retessellieren)
         self._lod_enabled = bool(is_enabled("viewport_lod_system"))
-        self._lod_quality_high = float(Tolerances.TESSELLATION_QUALITY)
-        self._lod_quality_interaction = float(Tolerances.TESSELLATION_PREVIEW)
         self._lod_min_points = 2500
-        self._lod_applied_quality = {}  # body_id -> tessellation quality
+        self._lod_cells_per_px2 = 0.5  # Zell-Budget pro Pixel der projizierten Fläche
+        self._lod_applied_level = {}  # body_id -> Pyramiden-Stufe (0 = Full Quality)
+        self._lod_pyramids = LodPyramidCache()
         self._lod_restore_timer = QTimer(self)
         self._lod_restore_timer.setSingleShot(True)
         self._lod_restore_timer.setInterval(100)
@@ -648,67 +650,71 @@ class PyVistaViewport(QWidget, SelectionMixin, ExtrudeMixin, PickingMixin, BodyR
         """
         Apply viewport LOD by swapping actor input meshes.
 
-        - During camera interaction: preview quality for large bodies
-        - After interaction: full quality
+        - During camera interaction: coarsest pyramid level that still fits
+          the projected screen size (large bodies only)
+        - After interaction: full quality (level 0, the body's own mesh)
+
+        Pyramids are built in the background; a body whose pyramid is not
+        ready yet simply stays at full quality. Never tessellates.
         """
         if not HAS_PYVISTA or not hasattr(self, "plotter"):
             return
 
-        from modeling.cad_tessellator import CADTessellator
-
-        target_quality = (
-            self._lod_quality_interaction
-            if interaction_active
-            else self._lod_quality_high
-        )
-
         updated = 0
         for body_id in list(self._body_actors.keys()):
             body_data = self.bodies.get(body_id) or {}
             source_mesh = body_data.get("mesh")
             if source_mesh is None:
                 continue
-            current_quality = self._lod_applied_quality.get(body_id)
-            source_points = int(getattr(source_mesh, "n_points", 0))
-            if source_points < self._lod_min_points:
-                is_interaction_lod = (
-                    current_quality is not None
-                    and abs(current_quality - self._lod_quality_interaction) < 1e-12
-                )
-                # Allow restoring full quality even if current interaction mesh is small.
-                if not (not interaction_active and is_interaction_lod):
+            current_level = self._lod_applied_level.get(body_id, 0)
+            if interaction_active:
+                if int(getattr(source_mesh, "n_points", 0)) < self._lod_min_points:
                     continue
-            if not self._is_body_actor_visible(body_id):
-                continue
-
-            if current_quality is not None and abs(current_quality - target_quality) < 1e-12:
-                continue
-
-            body_ref = body_data.get("body_ref") or body_data.get("body")
-            solid = getattr(body_ref, "_build123d_solid", None) if body_ref else None
-            if solid is None:
-                continue
+                if not self._is_body_actor_visible(body_id):
+                    continue
+                pyramid = self._lod_pyramids.get(body_id, source_mesh)
+                if pyramid is None:
+                    continue
+                radius_px = self._estimate_body_radius_px(source_mesh)
+                target_level = pyramid.select_level(radius_px, self._lod_cells_per_px2)
+                target_mesh = pyramid.levels[target_level]
+            else:
+                target_level = 0
+                target_mesh = source_mesh
 
-            mesh, edge_mesh, _face_info = CADTessellator.tessellate_with_face_ids(
-                solid,
-                quality=target_quality,
-            )
-            if mesh is None:
+            if target_level == current_level:
                 continue
 
-            if not self._apply_lod_mesh_to_actor(body_id, mesh, edge_mesh):
+            # Kanten bleiben unverändert (edge_mesh=None)
+            if not self._apply_lod_mesh_to_actor(body_id, target_mesh, None):
                 continue
 
-            self.bodies[body_id]["mesh"] = mesh
-            self._lod_applied_quality[body_id] = target_quality
+            self._lod_applied_level[body_id] = target_level
             updated += 1
 
         if updated > 0:
             request_render(self.plotter, immediate=interaction_active)
-            logger.debug(
-                f"[LOD] Updated {updated} bodies at quality={target_quality:.4f} "
-                f"(interaction={interaction_active})"
-            )
+            logger.debug(f"[LOD] Updated {updated} bodies (interaction={interaction_active})")
+
+    def _estimate_body_radius_px(self, mesh) -> float:
+        """Projected bounding-sphere radius of a mesh in pixels (inf if unknown)."""
+        camera = getattr(self.plotter, "camera", None)
+        try:
+            xmin, xmax, ymin, ymax, zmin, zmax = [float(v) for v in mesh.bounds]
+            cam_pos = np.array(camera.GetPosition(), dtype=float)
+            forward = np.array(camera.GetFocalPoint(), dtype=float) - cam_pos
+            near_clip = float(camera.GetClippingRange()[0])
+        except Exception:
+            return float("inf")
+
+        forward_norm = np.linalg.norm(forward)
+        if forward_norm < 1e-12:
+            return float("inf")
+
+        center = np.array([(xmin + xmax) * 0.5, (ymin + ymax) * 0.5, (zmin + zmax) * 0.5])
+        radius = 0.5 * float(np.linalg.norm([xmax - xmin, ymax - ymin, zmax - zmin]))
+        depth = float(np.dot(center - cam_pos, forward / forward_norm))
+        return self._estimate_projected_radius_px(radius, depth, camera, max(near_clip, 1e-6))
 
     def _apply_lod_mesh_to_actor(self, body_id: str, mesh, edge_mesh) -> bool:
         """Swap actor mapper input for LOD without recreating actors."""
@@ -5521,10 +5527,11 @@ class PyVistaViewport(QWidget, SelectionMixin, ExtrudeMixin, PickingMixin, BodyR
                         visible=requested_visible,
                         inactive_component=inactive_component
                     )
+                    self._sync_thread_overlay(body_id, body, requested_visible)
                     if body_id in self.bodies:
                         self.bodies[body_id]['body'] = body
                         self.bodies[body_id]['body_ref'] = body
-                    self._lod_applied_quality[body_id] = self._lod_quality_high
+                    self._lod_applied_level[body_id] = 0
                     if hasattr(self, 'plotter'):
                         from gui.viewport.render_queue import request_render
                         request_render(self.plotter, immediate=True)
@@ -5557,11 +5564,12 @@ class PyVistaViewport(QWidget, SelectionMixin, ExtrudeMixin, PickingMixin, BodyR
             visible=requested_visible,
             inactive_component=inactive_component
         )
+        self._sync_thread_overlay(body.id, body, requested_visible)
 
         if body.id in self.bodies:
             self.bodies[body.id]['body'] = body
             self.bodies[body.id]['body_ref'] = body
-            self._lod_applied_quality[body.id] = self._lod_quality_high
+            self._lod_applied_level[body.id] = 0
 
         return True
 
@@ -5570,7 +5578,7 @@ class PyVistaViewport(QWidget, SelectionMixin, ExtrudeMixin, PickingMixin, BodyR
         if body_id in self.bodies:
             self.bodies[body_id]['body'] = body_obj
             self.bodies[body_id]['body_ref'] = body_obj
-            self._lod_applied_quality.setdefault(body_id, self._lod_quality_high)
+            self._lod_applied_level.setdefault(body_id, 0)
             self._pending_body_refs.pop(body_id, None)
         else:
             # Async update path: Body may be added after this call.
@@ -142,14 +142,16 @@ class STLExportWorker(MainThreadWorkerMixin, QThread):
         """Tessellate a single body (may include texture application)."""
         import pyvista as pv
         from modeling.cad_tessellator import CADTessellator
+        from modeling.export_kernel import export_solid
 
         mesh_to_add = None
 
         try:
             # Phase 6: Performance - Use export cache
-            if hasattr(body, '_build123d_solid') and body._build123d_solid:
+            solid = export_solid(body) if hasattr(body, '_build123d_solid') else None
+            if solid:
                 verts, faces = CADTessellator.tessellate_for_export(
-                    body._build123d_solid,
+                    solid,
                     linear_deflection=self.linear_deflection,
                     angular_tolerance=self.angular_tolerance
                 )
@@ -211,12 +213,13 @@ class STEPExportWorker(MainThreadWorkerMixin, QThread):
                 return
 
             from build123d import Compound, export_step
+            from modeling.export_kernel import export_solid
 
             self.progress.emit(20, "Erstelle Compound...")
 
             solids = []
             for item in self.solids:
-                solid = getattr(item, "_build123d_solid", item)
+                solid = export_solid(item) if hasattr(item, "_build123d_solid") else item
                 if solid is not None:
                     solids.append(solid)
 
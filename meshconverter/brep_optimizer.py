@@ -64,6 +64,8 @@ except ImportError:
     HAS_OCP = False
     logger.warning("OCP nicht verfügbar für BREP Optimizer")
 
+from meshconverter.mesh_topology import csr_from_pairs
+
 
 class SurfaceType(Enum):
     """Klassifizierung von Surface-Typen."""
@@ -774,8 +776,9 @@ class BRepOptimizer:
         edges_map = EdgeMap()
         TopExp.MapShapes_s(shape, TopAbs_EDGE, edges_map)
 
-        # Für jede Edge: finde anliegende Faces
-        edge_to_faces: Dict[int, List[int]] = {}
+        # Für jede Edge: (edge_idx, face_idx) Paare sammeln
+        pair_edges: List[int] = []
+        pair_faces: List[int] = []
 
         for i in range(1, faces_map.Extent() + 1):
             face = TopoDS.Face_s(faces_map.FindKey(i))
@@ -788,21 +791,23 @@ class BRepOptimizer:
                 edge_idx = edges_map.FindIndex(edge)
 
                 if edge_idx > 0:
-                    if edge_idx not in edge_to_faces:
-                        edge_to_faces[edge_idx] = []
-                    if face_idx not in edge_to_faces[edge_idx]:
-                        edge_to_faces[edge_idx].append(face_idx)
+                    pair_edges.append(edge_idx)
+                    pair_faces.append(face_idx)
 
                 exp.Next()
 
-        # Baue Nachbarschaft aus gemeinsamen Edges
-        for edge_idx, face_indices in edge_to_faces.items():
-            if len(face_indices) == 2:
-                f1, f2 = face_indices
-                if f2 not in face_infos[f1].neighbors:
-                    face_infos[f1].neighbors.append(f2)
-                if f1 not in face_infos[f2].neighbors:
-                    face_infos[f2].neighbors.append(f1)
+        # Edge -> Faces als CSR (doppelte Einträge, z.B. Seam-Edges, entfernt)
+        edge_offsets, edge_faces = csr_from_pairs(pair_edges, pair_faces, edges_map.Extent() + 1)
+        valence = np.diff(edge_offsets)
+
+        # Baue Nachbarschaft aus gemeinsamen Edges (genau 2 Faces)
+        starts = edge_offsets[:-1][valence == 2]
+        f1s, f2s = edge_faces[starts], edge_faces[starts + 1]
+        nb_offsets, nb_indices = csr_from_pairs(
+            np.concatenate((f1s, f2s)), np.concatenate((f2s, f1s)), len(face_infos)
+        )
+        for face_idx, fi in enumerate(face_infos):
+            fi.neighbors = nb_indices[nb_offsets[face_idx]:nb_offsets[face_idx + 1]].tolist()
 
     def _find_clusters(self, face_infos: List[FaceInfo]) -> List[FaceCluster]:
         """Findet Cluster von Faces mit gleicher Geometrie."""
@@ -11,6 +11,7 @@ import numpy as np
 from typing import Optional, List, Dict, Tuple
 from loguru import logger
 from modeling.ocp_thread_guard import ensure_ocp_main_thread
+from modeling.shape_validation import ValidationTier, check_shape
 
 try:
     import pyvista as pv
@@ -30,7 +31,6 @@ try:
     from OCP.TopoDS import TopoDS_Edge, TopoDS_Wire, TopoDS_Face, TopoDS, TopoDS_Shell, TopoDS_Solid
     from OCP.ShapeFix import ShapeFix_Solid, ShapeFix_Shell
     from OCP.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
-    from OCP.BRepCheck import BRepCheck_Analyzer
     from OCP.TopAbs import TopAbs_REVERSED, TopAbs_FACE
     from OCP.TopExp import TopExp_Explorer
     HAS_OCP = True
@@ -450,8 +450,7 @@ class DirectMeshConverter:
                 solid = solid_builder.Solid()
 
                 # Validierung
-                analyzer = BRepCheck_Analyzer(solid)
-                is_valid = analyzer.IsValid()
+                is_valid = check_shape(solid, ValidationTier.FULL, cache=False)
 
                 stats['solid_created'] = True
                 stats['is_valid'] = is_valid
@@ -480,8 +479,7 @@ class DirectMeshConverter:
                     fixed_solid = fixer.Solid()
 
                     if not fixed_solid.IsNull():
-                        analyzer2 = BRepCheck_Analyzer(fixed_solid)
-                        if analyzer2.IsValid():
+                        if check_shape(fixed_solid, ValidationTier.FULL, cache=False):
                             logger.debug("Solid nach Reparatur gültig")
                             stats['is_valid'] = True
                             return ConversionResult(
@@ -57,8 +57,6 @@ except ImportError:
     HAS_BUILD123D = False
 
 try:
-    from scipy.sparse import lil_matrix
-    from scipy.sparse.csgraph import connected_components
     from sklearn.cluster import AgglomerativeClustering
     HAS_SCIPY = True
 except ImportError:
@@ -70,10 +68,12 @@ try:
     from meshconverter.mesh_converter_v10 import (
         ConversionStatus, ConversionResult, MeshLoader, LoadStatus
     )
+    from meshconverter.mesh_topology import MeshTopology
 except ImportError:
     from mesh_converter_v10 import (
         ConversionStatus, ConversionResult, MeshLoader, LoadStatus
     )
+    from mesh_topology import MeshTopology
 
 
 @dataclass
@@ -163,7 +163,7 @@ class FilletAwareConverter:
             mesh = mesh.compute_normals(cell_normals=True, point_normals=False)
 
         cell_normals = mesh.cell_data['Normals']
-        edge_to_faces = self._build_edge_face_map(mesh)
+        topology = MeshTopology.from_polydata(mesh)
 
         # Compute areas
         mesh_with_areas = mesh.compute_cell_sizes()
@@ -204,7 +204,7 @@ class FilletAwareConverter:
 
         # === PHASE 3: Segment feature faces ===
         logger.info("Phase 3: Segmenting feature regions...")
-        feature_regions = self._segment_faces(mesh, feature_face_ids, edge_to_faces, cell_normals, 30.0)
+        feature_regions = self._segment_faces(mesh, feature_face_ids, topology, cell_normals, 30.0)
         logger.info(f"  → {len(feature_regions)} feature regions")
 
         # === PHASE 4: Classify features as fillets or chamfers ===
@@ -288,17 +288,6 @@ class FilletAwareConverter:
         logger.info(f"=== Result: {result.status.name} ===")
         return result
 
-    def _build_edge_face_map(self, mesh: 'pv.PolyData') -> dict:
-        """Build edge to face adjacency map."""
-        edge_to_faces = defaultdict(list)
-        for face_id in range(mesh.n_cells):
-            cell = mesh.get_cell(face_id)
-            pts = cell.point_ids
-            for i in range(len(pts)):
-                edge = tuple(sorted([pts[i], pts[(i + 1) % len(pts)]]))
-                edge_to_faces[edge].append(face_id)
-        return edge_to_faces
-
     def _cluster_by_normal(self, cell_normals: np.ndarray, threshold_deg: float) -> dict:
         """Cluster faces by normal similarity."""
         if not HAS_SCIPY:
@@ -316,43 +305,19 @@ class FilletAwareConverter:
             clusters[label].add(face_id)
         return clusters
 
-    def _segment_faces(self, mesh, face_ids: Set[int], edge_to_faces: dict,
+    def _segment_faces(self, mesh, face_ids: Set[int], topology: MeshTopology,
                        cell_normals: np.ndarray, angle_threshold: float) -> List[Set[int]]:
         """Segment faces into connected regions."""
-        if not HAS_SCIPY:
-            return [face_ids]
-
         if not face_ids:
             return []
 
-        face_list = list(face_ids)
-        face_to_idx = {f: i for i, f in enumerate(face_list)}
-        n = len(face_list)
-        adjacency = lil_matrix((n, n), dtype=np.int8)
-        angle_rad = np.radians(angle_threshold)
-
-        for edge, faces in edge_to_faces.items():
-            if len(faces) != 2:
-                continue
-            f1, f2 = faces
-            if f1 not in face_ids or f2 not in face_ids:
-                continue
-
-            n1, n2 = cell_normals[f1], cell_normals[f2]
-            dot = np.clip(np.dot(n1, n2), -1, 1)
-            if np.arccos(dot) <= angle_rad:
-                i1, i2 = face_to_idx[f1], face_to_idx[f2]
-                adjacency[i1, i2] = 1
-                adjacency[i2, i1] = 1
-
-        n_components, labels = connected_components(adjacency.tocsr(), directed=False, return_labels=True)
-
-        regions = []
-        for label_id in range(n_components):
-            indices = np.where(labels == label_id)[0]
-            region = {face_list[i] for i in indices}
-            regions.append(region)
-        return regions
+        # Only cross edges whose dihedral angle is below the threshold
+        smooth = topology.dihedral_angles(cell_normals) <= np.radians(angle_threshold)
+        components = topology.connected_components(
+            np.fromiter(face_ids, dtype=np.int64, count=len(face_ids)),
+            pair_mask=smooth
+        )
+        return [set(comp.tolist()) for comp in components]
 
     def _fit_plane(self, mesh, face_ids: Set[int]) -> Optional[dict]:
         """Fit plane to face region using SVD."""
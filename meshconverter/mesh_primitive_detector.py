@@ -13,7 +13,8 @@ import numpy as np
 from typing import List, Tuple, Optional, Dict
 from dataclasses import dataclass
 from loguru import logger
-from collections import defaultdict
+
+from meshconverter.mesh_topology import MeshTopology
 
 try:
     import pyvista as pv
@@ -133,8 +134,8 @@ class MeshPrimitiveDetector:
         faces_arr = mesh.faces.reshape(-1, 4)[:, 1:4]
         n_faces = len(faces_arr)
 
-        # Adjazenz: Faces die Vertices teilen
-        face_adj = self._build_face_adjacency(faces_arr)
+        # Adjazenz: Faces die Vertices teilen (CSR)
+        adj_offsets, adj_indices = MeshTopology(faces_arr, n_points=mesh.n_points).vertex_adjacency()
 
         for start_face in range(n_faces):
             if start_face in visited:
@@ -151,7 +152,7 @@ class MeshPrimitiveDetector:
                 current_normal = face_normals[current]
 
                 # Prüfe Nachbarn
-                for neighbor in face_adj.get(current, []):
+                for neighbor in adj_indices[adj_offsets[current]:adj_offsets[current + 1]].tolist():
                     if neighbor in visited:
                         continue
 
@@ -172,22 +173,6 @@ class MeshPrimitiveDetector:
 
         return regions
 
-    def _build_face_adjacency(self, faces_arr: np.ndarray) -> Dict[int, List[int]]:
-        """Baut Adjazenz-Graph basierend auf geteilten Vertices."""
-        vertex_to_faces = defaultdict(list)
-        for i, face in enumerate(faces_arr):
-            for v in face:
-                vertex_to_faces[v].append(i)
-
-        adj = defaultdict(set)
-        for face_list in vertex_to_faces.values():
-            for i in range(len(face_list)):
-                for j in range(i + 1, len(face_list)):
-                    adj[face_list[i]].add(face_list[j])
-                    adj[face_list[j]].add(face_list[i])
-
-        return {k: list(v) for k, v in adj.items()}
-
     def _try_fit_cylinder(
         self,
         mesh: 'pv.PolyData',
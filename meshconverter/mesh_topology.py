@@ -0,0 +1,376 @@
+"""
+MashCad - Mesh Topology
+=======================
+
+Gemeinsame NumPy-Topologie für Dreiecksnetze (Half-Edge + CSR).
+
+Ersetzt die Dict-of-Sets Adjazenzen, die bisher in jeder Pipeline-Stufe
+einzeln in Python-Schleifen aufgebaut wurden:
+- Kanten-Keys über sortierte Vertex-Paare + np.unique
+- Face-Nachbarschaft als CSR (offsets, indices)
+- Connected Components, Boundary-Loops und Dihedral-Winkel vektorisiert
+
+Verwendung:
+    from meshconverter.mesh_topology import MeshTopology
+
+    topo = MeshTopology.from_polydata(mesh)
+    components = topo.connected_components(cell_ids)
+    loops = topo.boundary_loops(cell_ids)
+"""
+
+import numpy as np
+from typing import List, Optional, Tuple
+from loguru import logger
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components as _scipy_components
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+
+def csr_from_pairs(rows: np.ndarray, cols: np.ndarray, n_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Baut CSR-Nachbarschaft (offsets, indices) aus (row, col) Paaren.
+
+    Doppelte Paare werden entfernt, Nachbarn pro Zeile sind aufsteigend sortiert.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    if rows.size:
+        n_cols = int(max(cols.max() + 1, n_rows))
+        keys = np.unique(rows * n_cols + cols)
+        rows, cols = keys // n_cols, keys % n_cols
+    offsets = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=offsets[1:])
+    return offsets, cols
+
+
+def component_labels(n_nodes: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Connected-Component Labels (0..k-1) für einen ungerichteten Graphen.
+
+    Mit scipy über csgraph, sonst über vektorisierte Label-Propagation
+    mit Pointer-Jumping.
+    """
+    if n_nodes == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+
+    if HAS_SCIPY:
+        graph = csr_matrix((np.ones(len(a), dtype=np.int8), (a, b)), shape=(n_nodes, n_nodes))
+        _, labels = _scipy_components(graph, directed=False, return_labels=True)
+        return labels.astype(np.int64)
+
+    labels = np.arange(n_nodes, dtype=np.int64)
+    while True:
+        la, lb = labels[a], labels[b]
+        low = np.minimum(la, lb)
+        updated = labels.copy()
+        np.minimum.at(updated, la, low)
+        np.minimum.at(updated, lb, low)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    return np.unique(labels, return_inverse=True)[1].astype(np.int64)
+
+
+def group_by_label(ids: np.ndarray, labels: np.ndarray) -> List[np.ndarray]:
+    """
+    Gruppiert ids nach Label.
+
+    Gruppen sind intern aufsteigend sortiert und nach ihrem kleinsten
+    Element geordnet (entspricht der früheren BFS-Entdeckungsreihenfolge).
+    """
+    if len(ids) == 0:
+        return []
+    order = np.lexsort((ids, labels))
+    sorted_labels = labels[order]
+    splits = np.flatnonzero(np.diff(sorted_labels)) + 1
+    groups = np.split(ids[order], splits)
+    groups.sort(key=lambda g: g[0])
+    return groups
+
+
+def order_edge_loops(edges: np.ndarray, closed_only: bool = False) -> List[np.ndarray]:
+    """
+    Ordnet ungerichtete Kanten zu Vertex-Ketten bzw. geschlossenen Loops.
+
+    Jede Kante wird genau einmal verwendet. Offene Ketten werden in beide
+    Richtungen verlängert. Geschlossene Loops enthalten den Startvertex
+    nur einmal.
+
+    Args:
+        edges: (N, 2) Vertex-Indizes
+        closed_only: Nur geschlossene Loops zurückgeben
+
+    Returns:
+        Liste von Vertex-Index-Arrays, in Reihenfolge der ersten Kante
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    n_edges = len(edges)
+    if n_edges == 0:
+        return []
+
+    verts, inverse = np.unique(edges.ravel(), return_inverse=True)
+    local = inverse.reshape(-1, 2)
+
+    rows = local.T.ravel()
+    edge_ids = np.tile(np.arange(n_edges, dtype=np.int64), 2)
+    order = np.argsort(rows, kind='stable')
+    incident = edge_ids[order].tolist()
+    offsets = np.zeros(len(verts) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=len(verts)), out=offsets[1:])
+    offsets = offsets.tolist()
+
+    cursor = offsets[:-1]
+    used = [False] * n_edges
+    ends = local.tolist()
+
+    def walk(start: int, current: int, path: list) -> bool:
+        while current != start:
+            path.append(current)
+            nxt = -1
+            p, end = cursor[current], offsets[current + 1]
+            while p < end:
+                e = incident[p]
+                p += 1
+                if not used[e]:
+                    nxt = e
+                    break
+            cursor[current] = p
+            if nxt < 0:
+                return False
+            used[nxt] = True
+            u, v = ends[nxt]
+            current = v if u == current else u
+        return True
+
+    loops = []
+    for first in range(n_edges):
+        if used[first]:
+            continue
+        used[first] = True
+        a, b = ends[first]
+        forward = [a]
+        closed = walk(a, b, forward)
+
+        if not closed:
+            if closed_only:
+                continue
+            backward: list = []
+            walk(-1, a, backward)
+            forward = backward[:0:-1] + forward if len(backward) > 1 else forward
+
+        loops.append(verts[np.asarray(forward, dtype=np.int64)])
+
+    return loops
+
+
+class MeshTopology:
+    """
+    Half-Edge/CSR Topologie eines Dreiecksnetzes.
+
+    Half-Edge ``3*f + k`` läuft von ``triangles[f, k]`` nach
+    ``triangles[f, (k+1) % 3]``. Alle Strukturen sind NumPy-Arrays und
+    werden einmal pro Mesh gebaut.
+
+    Attributes:
+        triangles: (F, 3) Vertex-Indizes
+        edges: (E, 2) eindeutige Kanten (sortierte Vertex-Paare)
+        he_edge: (3F,) Kanten-Index jeder Half-Edge
+        edge_valence: (E,) Anzahl anliegender Faces pro Kante
+        face_pairs: (M, 2) Face-Paare über manifold Kanten (genau 2 Faces)
+        face_pair_edges: (M,) Kanten-Index zu jedem Face-Paar
+        adj_offsets / adj_indices: CSR Face-Nachbarschaft über face_pairs
+    """
+
+    def __init__(self, triangles: np.ndarray, n_points: Optional[int] = None):
+        tri = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        self.triangles = tri
+        self.n_faces = len(tri)
+        if n_points is None:
+            n_points = int(tri.max()) + 1 if tri.size else 0
+        self.n_points = int(n_points)
+
+        self.he_origin = tri.ravel()
+        self.he_target = tri[:, [1, 2, 0]].ravel()
+
+        # Kanten-Keys: sortiertes Vertex-Paar als int64 kodiert
+        lo = np.minimum(self.he_origin, self.he_target)
+        hi = np.maximum(self.he_origin, self.he_target)
+        stride = max(self.n_points, 1)
+        keys, self.he_edge, self.edge_valence = np.unique(
+            lo * stride + hi, return_inverse=True, return_counts=True
+        )
+        self.he_edge = self.he_edge.astype(np.int64).ravel()
+        self.edges = np.column_stack((keys // stride, keys % stride))
+        self.n_edges = len(self.edges)
+
+        # Kante -> Faces (CSR)
+        self.edge_face_offsets = np.zeros(self.n_edges + 1, dtype=np.int64)
+        np.cumsum(self.edge_valence, out=self.edge_face_offsets[1:])
+        self.edge_faces = np.argsort(self.he_edge, kind='stable') // 3
+
+        # Face-Nachbarschaft nur über manifold Kanten (wie bisher)
+        self.face_pair_edges = np.flatnonzero(self.edge_valence == 2)
+        starts = self.edge_face_offsets[self.face_pair_edges]
+        self.face_pairs = np.column_stack((self.edge_faces[starts], self.edge_faces[starts + 1]))
+
+        self.adj_offsets, self.adj_indices = csr_from_pairs(
+            np.concatenate((self.face_pairs[:, 0], self.face_pairs[:, 1])),
+            np.concatenate((self.face_pairs[:, 1], self.face_pairs[:, 0])),
+            self.n_faces,
+        )
+
+        self._vertex_adjacency: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_polydata(cls, mesh: 'pv.PolyData') -> 'MeshTopology':
+        """Baut die Topologie aus einem reinen PyVista-Dreiecksnetz."""
+        faces = np.asarray(mesh.faces)
+        if faces.size % 4 != 0 or not np.all(faces[0::4] == 3):
+            raise ValueError("MeshTopology erwartet ein reines Dreiecksnetz")
+        return cls(faces.reshape(-1, 4)[:, 1:4], n_points=mesh.n_points)
+
+    # ------------------------------------------------------------------
+    # Nachbarschaft
+    # ------------------------------------------------------------------
+
+    def neighbors(self, face: int) -> np.ndarray:
+        """Kanten-Nachbarn eines Faces."""
+        return self.adj_indices[self.adj_offsets[face]:self.adj_offsets[face + 1]]
+
+    def vertex_adjacency(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        CSR Face-Nachbarschaft über geteilte Vertices (offsets, indices).
+
+        Mit scipy als Inzidenz-Produkt F×V · V×F, sonst Rückfall auf die
+        Kanten-Nachbarschaft.
+        """
+        if self._vertex_adjacency is not None:
+            return self._vertex_adjacency
+
+        if not HAS_SCIPY:
+            logger.debug("scipy nicht verfügbar - Vertex-Adjazenz fällt auf Kanten-Adjazenz zurück")
+            self._vertex_adjacency = (self.adj_offsets, self.adj_indices)
+            return self._vertex_adjacency
+
+        incidence = csr_matrix(
+            (np.ones(3 * self.n_faces, dtype=np.int32),
+             (np.repeat(np.arange(self.n_faces), 3), self.triangles.ravel())),
+            shape=(self.n_faces, self.n_points),
+        )
+        shared = (incidence @ incidence.T).tocoo()
+        off_diag = shared.row != shared.col
+        self._vertex_adjacency = csr_from_pairs(shared.row[off_diag], shared.col[off_diag], self.n_faces)
+        return self._vertex_adjacency
+
+    # ------------------------------------------------------------------
+    # Komponenten
+    # ------------------------------------------------------------------
+
+    def connected_components(
+        self,
+        cell_ids: Optional[np.ndarray] = None,
+        pair_mask: Optional[np.ndarray] = None
+    ) -> List[np.ndarray]:
+        """
+        Kanten-zusammenhängende Komponenten einer Face-Teilmenge.
+
+        Args:
+            cell_ids: Teilmenge der Faces (default: alle)
+            pair_mask: Optionale Maske über face_pairs (z.B. Winkel-Filter)
+
+        Returns:
+            Liste von aufsteigend sortierten Face-Index-Arrays
+        """
+        if cell_ids is None:
+            ids = np.arange(self.n_faces, dtype=np.int64)
+        else:
+            ids = np.unique(np.asarray(cell_ids, dtype=np.int64))
+        if ids.size == 0:
+            return []
+
+        local = np.full(self.n_faces, -1, dtype=np.int64)
+        local[ids] = np.arange(len(ids))
+
+        pairs = self.face_pairs if pair_mask is None else self.face_pairs[pair_mask]
+        a = local[pairs[:, 0]]
+        b = local[pairs[:, 1]]
+        keep = (a >= 0) & (b >= 0)
+
+        labels = component_labels(len(ids), a[keep], b[keep])
+        return group_by_label(ids, labels)
+
+    def label_components(self, labels: np.ndarray) -> List[np.ndarray]:
+        """
+        Zerlegt eine Face-Labelung in einem Durchlauf in Komponenten.
+
+        Zwei Faces gehören zusammen, wenn sie eine manifold Kante teilen und
+        dasselbe Label tragen. Label 0 gilt als unzugeordnet.
+
+        Returns:
+            Liste sortierter Face-Index-Arrays, geordnet nach (Label, kleinster Face-Index)
+        """
+        labels = np.asarray(labels)
+        la = labels[self.face_pairs[:, 0]]
+        lb = labels[self.face_pairs[:, 1]]
+        same = (la == lb) & (la != 0)
+
+        components = component_labels(self.n_faces, self.face_pairs[same, 0], self.face_pairs[same, 1])
+        ids = np.flatnonzero(labels != 0)
+        groups = group_by_label(ids, components[ids])
+        groups.sort(key=lambda g: labels[g[0]])
+        return groups
+
+    # ------------------------------------------------------------------
+    # Rand
+    # ------------------------------------------------------------------
+
+    def _half_edges_of(self, cell_ids: Optional[np.ndarray]) -> np.ndarray:
+        if cell_ids is None:
+            return np.arange(3 * self.n_faces, dtype=np.int64)
+        cells = np.unique(np.asarray(cell_ids, dtype=np.int64))
+        return (cells[:, None] * 3 + np.arange(3)).ravel()
+
+    def boundary_edges(self, cell_ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Rand-Kanten einer Face-Teilmenge als gerichtete Vertex-Paare.
+
+        Eine Kante ist Rand, wenn sie innerhalb der Teilmenge nur von einem
+        Face verwendet wird. Die Richtung folgt dem Umlaufsinn des Faces.
+        """
+        he = self._half_edges_of(cell_ids)
+        # Zählung nur über die Kanten der Teilmenge (nicht über alle n_edges)
+        _, inverse, counts = np.unique(self.he_edge[he], return_inverse=True, return_counts=True)
+        boundary = he[counts[inverse.ravel()] == 1]
+        return np.column_stack((self.he_origin[boundary], self.he_target[boundary]))
+
+    def boundary_loops(self, cell_ids: Optional[np.ndarray] = None) -> List[np.ndarray]:
+        """Geordnete Rand-Loops (Vertex-Indizes) einer Face-Teilmenge."""
+        return order_edge_loops(self.boundary_edges(cell_ids))
+
+    # ------------------------------------------------------------------
+    # Geometrie
+    # ------------------------------------------------------------------
+
+    def face_areas(self, points: np.ndarray) -> np.ndarray:
+        """Dreiecksflächen für alle Faces."""
+        p = np.asarray(points, dtype=float)[self.triangles]
+        return 0.5 * np.linalg.norm(np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0]), axis=1)
+
+    def dihedral_angles(self, face_normals: np.ndarray) -> np.ndarray:
+        """
+        Winkel zwischen den Normalen der Face-Paare (Radiant).
+
+        Returns:
+            (M,) Winkel pro Eintrag in face_pairs
+        """
+        n = np.asarray(face_normals, dtype=float)
+        dots = np.einsum('ij,ij->i', n[self.face_pairs[:, 0]], n[self.face_pairs[:, 1]])
+        return np.arccos(np.clip(dots, -1.0, 1.0))
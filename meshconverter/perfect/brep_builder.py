@@ -35,7 +35,6 @@ try:
     from OCP.TopExp import TopExp_Explorer
     from OCP.TopAbs import TopAbs_FACE
     from OCP.ShapeFix import ShapeFix_Shape
-    from OCP.BRepCheck import BRepCheck_Analyzer
     from OCP.BRepAdaptor import BRepAdaptor_Surface
     from OCP.GeomAbs import GeomAbs_Cylinder, GeomAbs_Sphere, GeomAbs_Cone, GeomAbs_Torus
     HAS_OCP = True
@@ -43,6 +42,8 @@ except ImportError:
     HAS_OCP = False
     logger.warning("OCP nicht verfügbar")
 
+from modeling.shape_validation import ValidationTier, check_shape
+
 from .primitive_detector import DetectedPrimitive, PrimitiveType
 
 
@@ -512,10 +513,9 @@ class BREPBuilder:
 
         result = sewing.SewedShape()
 
-        # Validierung
+        # Validierung (nur Log: geschlossene Shells reichen als Diagnose)
         if HAS_OCP:
-            analyzer = BRepCheck_Analyzer(result)
-            if analyzer.IsValid():
+            if check_shape(result, ValidationTier.TOPOLOGY, cache=False):
                 logger.info("  Validierung: OK")
             else:
                 logger.warning("  Validierung: FAILED (bekannte Limitation)")
@@ -13,11 +13,13 @@ Date: 2026-02-10
 """
 
 import numpy as np
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional
 from dataclasses import dataclass
 from loguru import logger
 from enum import Enum, auto
 
+from meshconverter.mesh_topology import MeshTopology
+
 try:
     import pyvista as pv
     HAS_PYVISTA = True
@@ -137,30 +139,23 @@ class FeatureDetector:
         faces_arr = mesh.faces.reshape(-1, 4)[:, 1:4]
         n_faces = len(faces_arr)
 
-        # Face-Adjazenz für Winkel-Berechnung
-        face_adj = self._build_face_adjacency(faces_arr)
-
-        features = []
-
-        for face_idx in range(n_faces):
-            # Prüfe Winkel zu allen Nachbarn
-            neighbors = face_adj.get(face_idx, [])
-
-            if len(neighbors) < 2:
-                continue
-
-            current_normal = face_normals[face_idx]
-            angles = []
+        # Face-Adjazenz (geteilte Vertices, CSR) für Winkel-Berechnung
+        face_adj = MeshTopology(faces_arr, n_points=mesh.n_points).vertex_adjacency()
+        adj_offsets, adj_indices = face_adj
 
-            for neighbor_idx in neighbors:
-                neighbor_normal = face_normals[neighbor_idx]
-                angle = np.arccos(np.clip(np.dot(current_normal, neighbor_normal), -1, 1))
-                angles.append(angle)
+        # Mittlerer Winkel zu allen Nachbarn, vektorisiert über alle Faces
+        counts = np.diff(adj_offsets)
+        rows = np.repeat(np.arange(n_faces), counts)
+        normals = np.asarray(face_normals)
+        dots = np.einsum('ij,ij->i', normals[rows], normals[adj_indices])
+        angle_sums = np.bincount(rows, weights=np.arccos(np.clip(dots, -1, 1)), minlength=n_faces)
+        avg_angles = angle_sums / np.maximum(counts, 1)
 
-            if not angles:
-                continue
+        features = []
 
-            avg_angle = np.mean(angles)
+        # Mindestens 2 Nachbarn
+        for face_idx in np.flatnonzero(counts >= 2).tolist():
+            avg_angle = avg_angles[face_idx]
 
             # Fillet: flacher Winkel
             if avg_angle < self.fillet_angle:
@@ -204,7 +199,7 @@ class FeatureDetector:
         face_normals = mesh.cell_data['Normals']
 
         faces_arr = mesh.faces.reshape(-1, 4)[:, 1:4]
-        face_adj = self._build_face_adjacency(faces_arr)
+        face_adj = MeshTopology(faces_arr, n_points=mesh.n_points).vertex_adjacency()
 
         holes = []
         visited = set()
@@ -242,32 +237,15 @@ class FeatureDetector:
 
         return holes
 
-    def _build_face_adjacency(self, faces_arr: np.ndarray) -> Dict[int, List[int]]:
-        """Baut Adjazenz-Graph."""
-        from collections import defaultdict
-
-        vertex_to_faces = defaultdict(list)
-        for i, face in enumerate(faces_arr):
-            for v in face:
-                vertex_to_faces[v].append(i)
-
-        adj = defaultdict(set)
-        for face_list in vertex_to_faces.values():
-            for i in range(len(face_list)):
-                for j in range(i + 1, len(face_list)):
-                    adj[face_list[i]].add(face_list[j])
-                    adj[face_list[j]].add(face_list[i])
-
-        return {k: list(v) for k, v in adj.items()}
-
     def _get_connected_faces(
         self,
         mesh: 'pv.PolyData',
         start_face: int,
-        face_adj: Dict,
+        face_adj: Tuple[np.ndarray, np.ndarray],
         max_size: int = 100
     ) -> List[int]:
-        """Holt alle verbundenen Faces ab start_face."""
+        """Holt alle verbundenen Faces ab start_face (face_adj: CSR offsets, indices)."""
+        adj_offsets, adj_indices = face_adj
         visited = {start_face}
         queue = [start_face]
         result = []
@@ -276,7 +254,7 @@ class FeatureDetector:
             current = queue.pop(0)
             result.append(current)
 
-            for neighbor in face_adj.get(current, []):
+            for neighbor in adj_indices[adj_offsets[current]:adj_offsets[current + 1]].tolist():
                 if neighbor not in visited:
                     visited.add(neighbor)
                     queue.append(neighbor)
@@ -15,11 +15,13 @@ Date: 2026-02-10
 """
 
 import numpy as np
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional
 from dataclasses import dataclass
 from loguru import logger
 from enum import Enum, auto
 
+from meshconverter.mesh_topology import MeshTopology
+
 try:
     import pyvista as pv
     HAS_PYVISTA = True
@@ -169,8 +171,8 @@ class PrimitiveDetector:
         faces_arr = mesh.faces.reshape(-1, 4)[:, 1:4]
         n_faces = len(faces_arr)
 
-        # Adjazenz-Graph bauen
-        face_adj = self._build_face_adjacency(faces_arr)
+        # Adjazenz: Faces die Vertices teilen (CSR)
+        adj_offsets, adj_indices = MeshTopology(faces_arr, n_points=mesh.n_points).vertex_adjacency()
 
         visited = set()
         regions = []
@@ -188,7 +190,7 @@ class PrimitiveDetector:
                 current = queue.pop(0)
                 current_normal = face_normals[current]
 
-                for neighbor in face_adj.get(current, []):
+                for neighbor in adj_indices[adj_offsets[current]:adj_offsets[current + 1]].tolist():
                     if neighbor in visited:
                         continue
 
@@ -208,24 +210,6 @@ class PrimitiveDetector:
 
         return regions
 
-    def _build_face_adjacency(self, faces_arr: np.ndarray) -> Dict[int, List[int]]:
-        """Baut Adjazenz-Graph basierend auf geteilten Vertices."""
-        from collections import defaultdict
-
-        vertex_to_faces = defaultdict(list)
-        for i, face in enumerate(faces_arr):
-            for v in face:
-                vertex_to_faces[v].append(i)
-
-        adj = defaultdict(set)
-        for face_list in vertex_to_faces.values():
-            for i in range(len(face_list)):
-                for j in range(i + 1, len(face_list)):
-                    adj[face_list[i]].add(face_list[j])
-                    adj[face_list[j]].add(face_list[i])
-
-        return {k: list(v) for k, v in adj.items()}
-
     def _analyze_region(
         self,
         mesh: 'pv.PolyData',
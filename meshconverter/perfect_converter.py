@@ -30,7 +30,6 @@ except ImportError:
 
 try:
     from OCP.TopoDS import TopoDS_Shape
-    from OCP.BRepCheck import BRepCheck_Analyzer
     HAS_OCP = True
 except ImportError:
     HAS_OCP = False
@@ -48,6 +47,7 @@ from meshconverter.base import (
     ConversionPhase
 )
 from modeling.ocp_thread_guard import ensure_ocp_main_thread
+from modeling.shape_validation import ValidationTier, check_shape
 from meshconverter.perfect.primitive_detector import (
     PrimitiveDetector,
     DetectedPrimitive,
@@ -226,8 +226,7 @@ class PerfectConverter(AsyncMeshConverter):
                 )
 
             # Validierung
-            analyzer = BRepCheck_Analyzer(shape)
-            is_valid = analyzer.IsValid()
+            is_valid = check_shape(shape, ValidationTier.FULL, cache=False)
 
             # Face-Count
             face_count = self._count_faces(shape)
@@ -45,7 +45,6 @@ try:
     from OCP.TopoDS import TopoDS_Edge, TopoDS_Wire, TopoDS_Face, TopoDS, TopoDS_Shell, TopoDS_Solid
     from OCP.ShapeFix import ShapeFix_Solid, ShapeFix_Shell
     from OCP.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
-    from OCP.BRepCheck import BRepCheck_Analyzer
     from OCP.TopAbs import TopAbs_REVERSED, TopAbs_FACE, TopAbs_SHELL, TopAbs_COMPOUND
     from OCP.TopExp import TopExp_Explorer
     HAS_OCP = True
@@ -68,6 +67,7 @@ from meshconverter.base import (
     ProgressUpdate
 )
 from modeling.ocp_thread_guard import ensure_ocp_main_thread
+from modeling.shape_validation import ValidationTier, check_shape
 
 
 class SimpleConverter(AsyncMeshConverter):
@@ -327,9 +327,8 @@ class SimpleConverter(AsyncMeshConverter):
             unify.Build()
             shape = unify.Shape()
 
-        # Validierung
-        analyzer = BRepCheck_Analyzer(shape)
-        if not analyzer.IsValid():
+        # Validierung (nur Log, Status hängt am Shape-Typ)
+        if not check_shape(shape, ValidationTier.TOPOLOGY, cache=False):
             logger.warning("Shape ist nicht valid!")
 
         # Ergebnis: Prüfe ob wir ein gültiges BREP haben (Solid oder Shell)
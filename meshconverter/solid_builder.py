@@ -14,7 +14,6 @@ try:
     from OCP.BRepBuilderAPI import BRepBuilderAPI_Sewing, BRepBuilderAPI_MakeSolid
     from OCP.ShapeFix import ShapeFix_Solid, ShapeFix_Shell, ShapeFix_Shape
     from OCP.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
-    from OCP.BRepCheck import BRepCheck_Analyzer
     from OCP.TopoDS import TopoDS, TopoDS_Face, TopoDS_Shell, TopoDS_Solid, TopoDS_Shape
     from OCP.TopAbs import TopAbs_SHELL, TopAbs_SOLID, TopAbs_COMPOUND, TopAbs_FACE
     from OCP.TopExp import TopExp_Explorer
@@ -25,6 +24,7 @@ except ImportError:
     logger.warning("OCP/build123d nicht verfügbar")
 
 from meshconverter.mesh_converter_v10 import ConversionResult, ConversionStatus
+from modeling.shape_validation import ValidationTier, check_shape
 
 
 class SolidBuilder:
@@ -414,8 +414,7 @@ class SolidBuilder:
             (is_valid: bool, message: str)
         """
         try:
-            analyzer = BRepCheck_Analyzer(shape)
-            is_valid = analyzer.IsValid()
+            is_valid = check_shape(shape, ValidationTier.FULL, cache=False)
 
             if is_valid:
                 return True, "OK"
@@ -3,9 +3,15 @@ MashCad - Surface Segmenter
 ===========================
 
 Segmentiert Mesh in homogene Regionen basierend auf Normalen-Ähnlichkeit.
-Verwendet hierarchisches Clustering und Connected Components.
+Standard ist Region-Growing über den Face-Nachbarschaftsgraphen
+(Priority-Queue, deterministisch, volle Auflösung); hierarchisches
+Clustering bleibt für kleine Meshes wählbar.
+Nachbarschaft, Komponenten und Ränder kommen aus der gemeinsamen
+MeshTopology (CSR/Half-Edge).
 """
 
+import heapq
+
 import numpy as np
 from typing import List, Optional, Dict, Set
 from loguru import logger
@@ -25,6 +31,7 @@ except ImportError:
     logger.warning("scipy nicht verfügbar - Clustering eingeschränkt")
 
 from meshconverter.mesh_converter_v10 import Region
+from meshconverter.mesh_topology import MeshTopology
 
 
 class SurfaceSegmenter:
@@ -32,26 +39,43 @@ class SurfaceSegmenter:
     Segmentiert Mesh in homogene Regionen.
 
     Algorithmus:
-    1. Normalen-basiertes Clustering (hierarchisch)
+    1. Normalen-basiertes Clustering (Region-Growing oder hierarchisch)
     2. Connected Components pro Cluster
     3. Boundary-Extraktion pro Region
     """
 
+    METHODS = ("region_growing", "hierarchical")
+
+    # linkage() braucht O(n²) Speicher - darüber wird immer Region-Growing verwendet
+    HIERARCHICAL_MAX_CELLS = 10000
+
     def __init__(
         self,
         angle_tolerance: float = 5.0,   # Grad
         min_region_faces: int = 1,      # Minimum Faces pro Region (1 für kleine Meshes)
-        max_regions: int = 1000         # Maximum Regionen (Performance)
+        max_regions: int = 1000,        # Maximum Regionen (Performance)
+        method: str = "region_growing",
+        curvature_threshold: Optional[float] = None  # Grad, default = angle_tolerance
     ):
         """
         Args:
             angle_tolerance: Maximale Winkelabweichung für gleiche Region (Grad)
             min_region_faces: Minimum Faces um als Region zu gelten
             max_regions: Maximum Regionen (verhindert Over-Segmentierung)
+            method: "region_growing" (Standard) oder "hierarchical"
+            curvature_threshold: Maximaler Knickwinkel über eine gemeinsame
+                Kante, über den eine Region noch wachsen darf (Grad)
         """
+        if method not in self.METHODS:
+            raise ValueError(f"Unbekannte Segmentierungs-Methode: {method}")
+
         self.angle_tol = np.radians(angle_tolerance)
         self.min_faces = min_region_faces
         self.max_regions = max_regions
+        self.method = method
+        self.curvature_tol = np.radians(
+            angle_tolerance if curvature_threshold is None else curvature_threshold
+        )
 
     def segment(self, mesh: 'pv.PolyData', merge_coplanar: bool = True) -> List[Region]:
         """
@@ -82,18 +106,29 @@ class SurfaceSegmenter:
         norms[norms < 1e-10] = 1.0
         normals_normalized = normals / norms
 
+        # Topologie einmal pro Mesh
+        topology = MeshTopology.from_polydata(mesh)
+
         # Clustering
-        if HAS_SCIPY and n_cells >= 10:
+        use_hierarchical = (
+            self.method == "hierarchical"
+            and HAS_SCIPY
+            and 10 <= n_cells <= self.HIERARCHICAL_MAX_CELLS
+        )
+        if use_hierarchical:
             labels = self._cluster_hierarchical(normals_normalized)
         else:
-            labels = self._cluster_simple(normals_normalized)
+            if self.method == "hierarchical" and n_cells > self.HIERARCHICAL_MAX_CELLS:
+                logger.debug(f"  {n_cells} Faces - Region-Growing statt hierarchischem Clustering")
+            cell_areas = topology.face_areas(mesh.points)
+            labels = self._cluster_region_growing(topology, normals_normalized, cell_areas)
 
         # Connected Components pro Label
-        regions = self._extract_regions(mesh, normals_normalized, labels)
+        regions = self._extract_regions(mesh, topology, normals_normalized, labels)
 
         # Region-Merging: Koplanare adjazente Regionen zusammenfassen
         if merge_coplanar and len(regions) > 6:
-            regions = self._merge_coplanar_regions(mesh, regions, normals_normalized)
+            regions = self._merge_coplanar_regions(mesh, topology, regions, normals_normalized)
 
         # Nach Fläche sortieren (größte zuerst)
         regions.sort(key=lambda r: r.area, reverse=True)
@@ -109,6 +144,7 @@ class SurfaceSegmenter:
     def _merge_coplanar_regions(
         self,
         mesh: 'pv.PolyData',
+        topology: MeshTopology,
         regions: List[Region],
         normals: np.ndarray
     ) -> List[Region]:
@@ -126,24 +162,21 @@ class SurfaceSegmenter:
 
         logger.debug(f"  Region-Merging: {len(regions)} Regionen...")
 
-        # Adjazenz-Map: cell_id -> region_idx
-        cell_to_region = {}
+        # Adjazenz-Map: cell_id -> region_idx (-1 = keine Region)
+        cell_to_region = np.full(topology.n_faces, -1, dtype=np.int64)
         for idx, region in enumerate(regions):
-            for cell_id in region.cell_ids:
-                cell_to_region[cell_id] = idx
+            cell_to_region[region.cell_ids] = idx
 
-        # Cell-Adjazenz
-        cell_adjacency = self._build_adjacency(mesh)
+        # Region-Adjazenz über die Face-Paare der Topologie
+        ra = cell_to_region[topology.face_pairs[:, 0]]
+        rb = cell_to_region[topology.face_pairs[:, 1]]
+        crossing = (ra >= 0) & (rb >= 0) & (ra != rb)
+        region_pairs = np.unique(np.sort(np.column_stack((ra[crossing], rb[crossing])), axis=1), axis=0)
 
-        # Region-Adjazenz finden
         region_adjacency: Dict[int, Set[int]] = {i: set() for i in range(len(regions))}
-
-        for cell_id, region_idx in cell_to_region.items():
-            for neighbor_cell in cell_adjacency.get(cell_id, []):
-                neighbor_region = cell_to_region.get(neighbor_cell)
-                if neighbor_region is not None and neighbor_region != region_idx:
-                    region_adjacency[region_idx].add(neighbor_region)
-                    region_adjacency[neighbor_region].add(region_idx)
+        for r1, r2 in region_pairs.tolist():
+            region_adjacency[r1].add(r2)
+            region_adjacency[r2].add(r1)
 
         # Union-Find für Merging
         parent = list(range(len(regions)))
@@ -251,14 +284,10 @@ class SurfaceSegmenter:
             # Durchschnittliche Normal (gewichtet nach Fläche)
             avg_normal = weighted_normal / (np.linalg.norm(weighted_normal) + 1e-10)
 
-            # Neues Mesh für Region
-            region_mesh = mesh.extract_cells(all_cell_ids)
-            centroid = np.mean(region_mesh.points, axis=0)
+            centroid = self._region_centroid(topology, mesh.points, all_cell_ids)
 
-            # Boundary neu extrahieren und auf Original-Mesh-Vertices snappen
-            boundary_points = self._extract_boundary(region_mesh, avg_normal)
-            if boundary_points is not None:
-                boundary_points = self._snap_to_mesh_vertices(boundary_points, mesh.points)
+            # Boundary direkt auf Original-Mesh-Vertices
+            boundary_points = self._extract_boundary(topology, mesh.points, all_cell_ids)
 
             merged_regions.append(Region(
                 region_id=new_region_id,
@@ -277,24 +306,16 @@ class SurfaceSegmenter:
         """
         Hierarchisches Clustering basierend auf Normalen-Ähnlichkeit.
 
+        Nur für kleine Meshes (<= HIERARCHICAL_MAX_CELLS), da linkage()
+        eine vollständige Distanzmatrix aufbaut.
+
         Returns:
             Cluster-Labels für jede Cell
         """
-        n_cells = len(normals)
-
-        # Sampling für große Meshes (Performance)
-        if n_cells > 10000:
-            sample_size = 5000
-            sample_idx = np.random.choice(n_cells, sample_size, replace=False)
-            sample_normals = normals[sample_idx]
-        else:
-            sample_idx = np.arange(n_cells)
-            sample_normals = normals
-
         try:
             # Hierarchisches Clustering mit Cosinus-Distanz
             # Cosinus-Distanz = 1 - cos(angle) (für Normalen die 180° verschieden sein können)
-            Z = linkage(sample_normals, method='average', metric='cosine')
+            Z = linkage(normals, method='average', metric='cosine')
 
             # Threshold: Bei angle_tol = 5°, cos(5°) ≈ 0.996, dist ≈ 0.004
             # Aber wir müssen bedenken: Cosine distance = 1 - cos(angle)
@@ -310,56 +331,121 @@ class SurfaceSegmenter:
             logger.warning(f"Hierarchisches Clustering fehlgeschlagen: {e}")
             return self._cluster_simple(normals)
 
-        # Labels auf alle Cells übertragen (wenn gesampelt)
-        if len(sample_idx) < n_cells:
-            all_labels = self._propagate_labels(normals, sample_idx, sample_normals, labels)
-        else:
-            all_labels = labels
-
-        return all_labels
+        return labels
 
-    def _propagate_labels(
+    def _cluster_region_growing(
         self,
-        all_normals: np.ndarray,
-        sample_idx: np.ndarray,
-        sample_normals: np.ndarray,
-        sample_labels: np.ndarray
+        topology: MeshTopology,
+        normals: np.ndarray,
+        cell_areas: np.ndarray
     ) -> np.ndarray:
         """
-        Propagiert Labels von Samples auf alle Cells.
-        """
-        n_cells = len(all_normals)
-        all_labels = np.zeros(n_cells, dtype=int)
+        Region-Growing über den Face-Nachbarschaftsgraphen.
 
-        # Sample-Labels setzen
-        all_labels[sample_idx] = sample_labels
+        - Kanten mit Knickwinkel > curvature_tol werden vorab aus dem
+          Graphen entfernt (NumPy), Regionen wachsen nie über sie hinweg.
+        - Seeds kommen aus dem Gauß-Map-Bucketing: dominante Orientierungen
+          (größte Fläche pro Bucket) zuerst, innerhalb davon die flachsten Faces.
+        - Pro Region arbeitet eine Priority-Queue (Abweichung zur flächengewichteten
+          Region-Normale, Face-Index als Tie-Break) - das Ergebnis ist
+          deterministisch, Laufzeit O(n log n).
 
-        # Cluster-Zentren berechnen
-        cluster_centers = {}
-        for label in np.unique(sample_labels):
-            mask = sample_labels == label
-            cluster_centers[label] = np.mean(sample_normals[mask], axis=0)
-
-        # Nicht-Sample-Cells dem nächsten Cluster zuordnen
-        non_sample_mask = np.ones(n_cells, dtype=bool)
-        non_sample_mask[sample_idx] = False
-        non_sample_idx = np.where(non_sample_mask)[0]
+        Returns:
+            Region-Labels (1..k) für jede Cell
+        """
+        n_cells = len(normals)
+        labels = np.zeros(n_cells, dtype=np.int64)
+        if n_cells == 0:
+            return labels
+
+        # Glatte Kanten als gerichtete CSR-Nachbarschaft
+        pairs = topology.face_pairs
+        dihedral = topology.dihedral_angles(normals)
+        smooth = dihedral <= self.curvature_tol
+        rows = np.concatenate((pairs[smooth, 0], pairs[smooth, 1]))
+        cols = np.concatenate((pairs[smooth, 1], pairs[smooth, 0]))
+        order = np.argsort(rows, kind='stable')
+        offsets = np.zeros(n_cells + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_cells), out=offsets[1:])
+
+        # Diskrete Krümmung: mittlerer Knickwinkel zu den Kanten-Nachbarn
+        ends = pairs.ravel()
+        counts = np.bincount(ends, minlength=n_cells)
+        curvature = np.bincount(ends, weights=np.repeat(dihedral, 2), minlength=n_cells)
+        curvature = curvature / np.maximum(counts, 1)
+
+        # Seed-Reihenfolge: Bucket-Fläche absteigend, Krümmung, Face-Index
+        buckets = self._gauss_map_buckets(normals, self.angle_tol)
+        bucket_area = np.bincount(buckets, weights=cell_areas)
+        seeds = np.lexsort((np.arange(n_cells), curvature, -bucket_area[buckets]))
+
+        # Python-Listen für die innere Schleife (schneller als NumPy-Skalarzugriffe)
+        offsets_l = offsets.tolist()
+        neighbors_l = cols[order].tolist()
+        normals_l = normals.tolist()
+        areas_l = np.maximum(cell_areas, 1e-12).tolist()
+        labels_l = [0] * n_cells
+        cos_tol = float(np.cos(self.angle_tol))
+
+        label = 0
+        for seed in seeds.tolist():
+            if labels_l[seed]:
+                continue
+            label += 1
+
+            sx = sy = sz = 0.0
+            mx, my, mz = normals_l[seed]
+            heap = [(0.0, seed)]
+            while heap:
+                _, f = heapq.heappop(heap)
+                if labels_l[f]:
+                    continue
+                nx, ny, nz = normals_l[f]
+                if f != seed and nx * mx + ny * my + nz * mz < cos_tol:
+                    continue  # Region-Normale hat sich weggedreht
+
+                labels_l[f] = label
+                a = areas_l[f]
+                sx += nx * a
+                sy += ny * a
+                sz += nz * a
+                length = (sx * sx + sy * sy + sz * sz) ** 0.5
+                if length > 1e-12:
+                    mx, my, mz = sx / length, sy / length, sz / length
+
+                for g in neighbors_l[offsets_l[f]:offsets_l[f + 1]]:
+                    if labels_l[g]:
+                        continue
+                    gx, gy, gz = normals_l[g]
+                    dot = gx * mx + gy * my + gz * mz
+                    if dot >= cos_tol:
+                        heapq.heappush(heap, (1.0 - dot, g))
+
+        labels[:] = labels_l
+        logger.debug(f"  Region-Growing: {label} Regionen")
+        return labels
 
-        for idx in non_sample_idx:
-            normal = all_normals[idx]
-            best_label = 1
-            best_similarity = -1
+    @staticmethod
+    def _gauss_map_buckets(normals: np.ndarray, bin_angle: float) -> np.ndarray:
+        """
+        Diskretisiert Normalen auf einem Kugelkoordinaten-Grid (Gauß-Map).
 
-            for label, center in cluster_centers.items():
-                # Cosinus-Ähnlichkeit (absolute, da Normalen-Richtung egal)
-                similarity = abs(np.dot(normal, center))
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_label = label
+        Returns:
+            Bucket-Index (0..b-1) pro Normale, nach erstem Auftreten nummeriert
+        """
+        n_theta = max(1, int(np.ceil(np.pi / max(bin_angle, 1e-6))))
+        n_phi = 2 * n_theta
 
-            all_labels[idx] = best_label
+        theta = np.arccos(np.clip(normals[:, 2], -1.0, 1.0))  # [0, π]
+        phi = np.arctan2(normals[:, 1], normals[:, 0])       # [-π, π]
+        theta_bin = np.minimum((theta / np.pi * n_theta).astype(np.int64), n_theta)
+        phi_bin = np.minimum(((phi + np.pi) / (2 * np.pi) * n_phi).astype(np.int64), n_phi)
 
-        return all_labels
+        keys = theta_bin * (n_phi + 1) + phi_bin
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype=np.int64)
+        rank[np.argsort(first, kind='stable')] = np.arange(len(first))
+        return rank[inverse.ravel()]
 
     def _cluster_simple(self, normals: np.ndarray) -> np.ndarray:
         """
@@ -367,386 +453,92 @@ class SurfaceSegmenter:
 
         Diskretisiert Normalen auf Einheitskugel-Grid.
         """
-        n_cells = len(normals)
-        grid_size = 20  # 20x20 Grid auf Hemisphäre
-
-        labels = np.zeros(n_cells, dtype=int)
-        label_map = {}
-        next_label = 1
-
-        for i, n in enumerate(normals):
-            # Normalisieren
-            n = n / (np.linalg.norm(n) + 1e-10)
-
-            # Zu Kugelkoordinaten
-            theta = np.arccos(np.clip(n[2], -1, 1))  # [0, π]
-            phi = np.arctan2(n[1], n[0])             # [-π, π]
-
-            # Quantisieren
-            theta_bin = int(theta / np.pi * grid_size)
-            phi_bin = int((phi + np.pi) / (2 * np.pi) * grid_size)
-
-            key = (theta_bin, phi_bin)
-
-            if key not in label_map:
-                label_map[key] = next_label
-                next_label += 1
-
-            labels[i] = label_map[key]
+        norms = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = normals / (norms + 1e-10)
 
-        return labels
+        grid_size = 20  # 20x20 Grid auf Hemisphäre
+        return self._gauss_map_buckets(normals, np.pi / grid_size) + 1
 
     def _extract_regions(
         self,
         mesh: 'pv.PolyData',
+        topology: MeshTopology,
         normals: np.ndarray,
         labels: np.ndarray
     ) -> List[Region]:
         """
         Extrahiert Region-Objekte aus Cluster-Labels.
 
-        Findet Connected Components pro Label.
+        Findet Connected Components pro Label (alle Labels in einem Durchlauf).
         """
         regions = []
         region_id = 0
 
-        # Adjazenz-Liste aufbauen (Cell-zu-Cell Verbindungen)
-        adjacency = self._build_adjacency(mesh)
-
-        unique_labels = np.unique(labels)
-        logger.debug(f"  Labels: {len(unique_labels)} unique, min={unique_labels.min()}, max={unique_labels.max()}")
+        points = np.asarray(mesh.points)
+        cell_areas = topology.face_areas(points)
 
-        for label in unique_labels:
-            if label == 0:
-                continue  # Label 0 = unzugeordnet
+        # Connected Components aller Labels in einem Durchlauf
+        components = topology.label_components(labels)
+        logger.debug(f"  {len(np.unique(labels))} Labels → {len(components)} connected components")
 
-            cell_ids = np.where(labels == label)[0]
-            logger.debug(f"  Label {label}: {len(cell_ids)} cells")
-
-            if len(cell_ids) < self.min_faces:
-                logger.debug(f"    → übersprungen (< {self.min_faces} faces)")
+        for comp_ids_array in components:
+            if len(comp_ids_array) < self.min_faces:
                 continue
 
-            # Connected Components finden
-            components = self._find_connected_components(cell_ids, adjacency)
-            logger.debug(f"    → {len(components)} connected components")
-
-            for comp_ids in components:
-                if len(comp_ids) < self.min_faces:
-                    continue
-
-                comp_ids_array = np.array(list(comp_ids))
-
-                # Region-Properties berechnen
-                region_normals = normals[comp_ids_array]
-                avg_normal = np.mean(region_normals, axis=0)
-                avg_normal = avg_normal / (np.linalg.norm(avg_normal) + 1e-10)
-
-                # Mesh für diese Region
-                region_mesh = mesh.extract_cells(comp_ids_array)
-                centroid = np.mean(region_mesh.points, axis=0)
-                area = region_mesh.area
-
-                # Boundary extrahieren und auf Original-Mesh-Vertices snappen
-                boundary_points = self._extract_boundary(region_mesh, avg_normal)
-                if boundary_points is not None:
-                    boundary_points = self._snap_to_mesh_vertices(boundary_points, mesh.points)
-
-                regions.append(Region(
-                    region_id=region_id,
-                    cell_ids=comp_ids_array,
-                    normal=avg_normal,
-                    centroid=centroid,
-                    area=area,
-                    boundary_points=boundary_points
-                ))
-                region_id += 1
+            # Region-Properties berechnen
+            region_normals = normals[comp_ids_array]
+            avg_normal = np.mean(region_normals, axis=0)
+            avg_normal = avg_normal / (np.linalg.norm(avg_normal) + 1e-10)
 
-        return regions
-
-    def _build_adjacency(self, mesh: 'pv.PolyData') -> Dict[int, Set[int]]:
-        """
-        Baut Adjazenz-Liste für Cells auf.
+            centroid = self._region_centroid(topology, points, comp_ids_array)
+            area = float(cell_areas[comp_ids_array].sum())
 
-        Zwei Cells sind adjazent, wenn sie eine gemeinsame Kante haben.
-        """
-        adjacency: Dict[int, Set[int]] = {i: set() for i in range(mesh.n_cells)}
+            # Boundary direkt auf Original-Mesh-Vertices
+            boundary_points = self._extract_boundary(topology, points, comp_ids_array)
 
-        # Edge-zu-Cells Mapping
-        edge_to_cells: Dict[tuple, List[int]] = {}
-
-        faces = mesh.faces.reshape(-1, 4)[:, 1:4]  # Nur Triangle-Indices
-
-        for cell_id, face in enumerate(faces):
-            # Alle 3 Kanten des Dreiecks
-            edges = [
-                (min(face[0], face[1]), max(face[0], face[1])),
-                (min(face[1], face[2]), max(face[1], face[2])),
-                (min(face[2], face[0]), max(face[2], face[0])),
-            ]
-
-            for edge in edges:
-                if edge not in edge_to_cells:
-                    edge_to_cells[edge] = []
-                edge_to_cells[edge].append(cell_id)
-
-        # Adjazenz aus gemeinsamen Kanten
-        for cells in edge_to_cells.values():
-            if len(cells) == 2:
-                c1, c2 = cells
-                adjacency[c1].add(c2)
-                adjacency[c2].add(c1)
-
-        return adjacency
-
-    def _find_connected_components(
-        self,
-        cell_ids: np.ndarray,
-        adjacency: Dict[int, Set[int]]
-    ) -> List[Set[int]]:
-        """
-        Findet Connected Components in einer Menge von Cells.
-        """
-        cell_set = set(cell_ids)
-        visited = set()
-        components = []
-
-        for start_cell in cell_ids:
-            if start_cell in visited:
-                continue
-
-            # BFS von start_cell
-            component = set()
-            queue = [start_cell]
-
-            while queue:
-                cell = queue.pop(0)
-                if cell in visited:
-                    continue
-                if cell not in cell_set:
-                    continue
-
-                visited.add(cell)
-                component.add(cell)
-
-                # Nachbarn hinzufügen
-                for neighbor in adjacency.get(cell, []):
-                    if neighbor not in visited and neighbor in cell_set:
-                        queue.append(neighbor)
+            regions.append(Region(
+                region_id=region_id,
+                cell_ids=comp_ids_array,
+                normal=avg_normal,
+                centroid=centroid,
+                area=area,
+                boundary_points=boundary_points
+            ))
+            region_id += 1
 
-            if component:
-                components.append(component)
+        return regions
 
-        return components
+    @staticmethod
+    def _region_centroid(topology: MeshTopology, points: np.ndarray, cell_ids: np.ndarray) -> np.ndarray:
+        """Mittelwert der (eindeutigen) Vertices einer Region."""
+        vertex_ids = np.unique(topology.triangles[cell_ids])
+        return np.mean(points[vertex_ids], axis=0)
 
     def _extract_boundary(
         self,
-        region_mesh: 'pv.PolyData',
-        normal: np.ndarray
+        topology: MeshTopology,
+        points: np.ndarray,
+        cell_ids: np.ndarray
     ) -> Optional[np.ndarray]:
         """
         Extrahiert geordnete Boundary-Punkte einer Region.
 
         Verwendet die tatsächlichen Mesh-Kanten (boundary edges), nicht ConvexHull.
+        Bei Regionen mit Löchern wird der äußere Loop (größte Ausdehnung)
+        gewählt. Die Punkte sind exakt Original-Mesh-Vertices, damit
+        benachbarte Regionen geteilte Kanten identisch sehen.
         """
-        try:
-            # Boundary Edges extrahieren - das sind die tatsächlichen Außenkanten
-            edges = region_mesh.extract_feature_edges(
-                boundary_edges=True,
-                feature_edges=False,
-                manifold_edges=False,
-                non_manifold_edges=False
-            )
-
-            if edges.n_points < 3:
-                # Für sehr kleine Regionen (1-2 Dreiecke):
-                # Nimm alle einzigartigen Punkte der Region
-                return self._get_unique_boundary_from_faces(region_mesh)
-
-            # Punkte entlang Boundary ordnen
-            points = edges.points
-            ordered = self._order_boundary_points_by_edges(edges)
-
-            if ordered is not None and len(ordered) >= 3:
-                return ordered
-
-            # Fallback auf nearest-neighbor ordering
-            return self._order_boundary_points(points)
-
-        except Exception as e:
-            logger.debug(f"Boundary-Extraktion fehlgeschlagen: {e}")
-            return self._get_unique_boundary_from_faces(region_mesh)
-
-    def _snap_to_mesh_vertices(
-        self,
-        boundary_points: np.ndarray,
-        mesh_vertices: np.ndarray
-    ) -> np.ndarray:
-        """
-        Snappt Boundary-Punkte auf die nächsten Original-Mesh-Vertices.
-
-        Dies stellt sicher, dass benachbarte Regionen exakt dieselben
-        Vertex-Koordinaten für geteilte Kanten verwenden.
-
-        Args:
-            boundary_points: Zu snappende Boundary-Punkte (N, 3)
-            mesh_vertices: Original-Mesh-Vertices (M, 3)
-
-        Returns:
-            Gesnappte Boundary-Punkte (N, 3)
-        """
-        snapped = np.zeros_like(boundary_points)
-
-        for i, pt in enumerate(boundary_points):
-            # Finde nächsten Mesh-Vertex
-            distances = np.linalg.norm(mesh_vertices - pt, axis=1)
-            nearest_idx = np.argmin(distances)
-            snapped[i] = mesh_vertices[nearest_idx]
-
-        return snapped
-
-    def _get_unique_boundary_from_faces(self, region_mesh: 'pv.PolyData') -> Optional[np.ndarray]:
-        """
-        Extrahiert Boundary-Punkte direkt aus den Mesh-Faces.
-        Für kleine Regionen (1-2 Dreiecke).
-        """
-        try:
-            if region_mesh.n_cells == 0:
-                return None
-
-            # Sammle alle Kanten und zähle wie oft sie vorkommen
-            edge_count = {}
-            faces = region_mesh.faces.reshape(-1, 4)[:, 1:4]  # Triangle indices
-
-            for face in faces:
-                for i in range(3):
-                    v1, v2 = face[i], face[(i+1) % 3]
-                    edge_key = (min(v1, v2), max(v1, v2))
-                    edge_count[edge_key] = edge_count.get(edge_key, 0) + 1
-
-            # Boundary edges sind die, die nur einmal vorkommen
-            boundary_edges = [edge for edge, count in edge_count.items() if count == 1]
-
-            if not boundary_edges:
-                # Keine Boundary - Region ist geschlossen
-                return None
-
-            # Ordne die Boundary-Punkte
-            return self._order_edges_to_loop(boundary_edges, region_mesh.points)
-
-        except Exception as e:
-            logger.debug(f"Face-basierte Boundary-Extraktion fehlgeschlagen: {e}")
-            return None
-
-    def _order_edges_to_loop(self, edges: list, points: np.ndarray) -> Optional[np.ndarray]:
-        """
-        Ordnet Kanten zu einem geschlossenen Loop.
-        """
-        if not edges:
-            return None
-
-        # Baue Adjazenz-Map
-        adjacency = {}
-        for v1, v2 in edges:
-            if v1 not in adjacency:
-                adjacency[v1] = []
-            if v2 not in adjacency:
-                adjacency[v2] = []
-            adjacency[v1].append(v2)
-            adjacency[v2].append(v1)
-
-        # Starte beim ersten Vertex
-        start = edges[0][0]
-        ordered_vertices = [start]
-        visited = {start}
-        current = start
-
-        while True:
-            # Finde nächsten unbesuchten Nachbarn
-            next_vertex = None
-            for neighbor in adjacency.get(current, []):
-                if neighbor not in visited:
-                    next_vertex = neighbor
-                    break
-
-            if next_vertex is None:
-                break
-
-            ordered_vertices.append(next_vertex)
-            visited.add(next_vertex)
-            current = next_vertex
-
-        if len(ordered_vertices) < 3:
-            return None
-
-        return points[ordered_vertices]
-
-    def _order_boundary_points_by_edges(self, edges_mesh: 'pv.PolyData') -> Optional[np.ndarray]:
-        """
-        Ordnet Boundary-Punkte basierend auf der Edge-Konnektivität.
-        """
-        try:
-            if edges_mesh.n_cells == 0:
-                return None
-
-            # Extrahiere Edges als Linien
-            lines = edges_mesh.lines
-            if lines is None or len(lines) == 0:
-                return None
-
-            # Parse line connectivity (Format: [n, p1, p2, n, p3, p4, ...])
-            edges = []
-            i = 0
-            while i < len(lines):
-                n = lines[i]
-                if n == 2:  # Linie mit 2 Punkten
-                    v1, v2 = lines[i+1], lines[i+2]
-                    edges.append((v1, v2))
-                i += n + 1
-
-            if not edges:
-                return None
-
-            return self._order_edges_to_loop(edges, edges_mesh.points)
-
-        except Exception as e:
-            logger.debug(f"Edge-basierte Ordering fehlgeschlagen: {e}")
+        loops = [loop for loop in topology.boundary_loops(cell_ids) if len(loop) >= 3]
+        if not loops:
+            # Keine Boundary - Region ist geschlossen
             return None
 
-    def _order_boundary_points(self, points: np.ndarray) -> np.ndarray:
-        """
-        Ordnet Boundary-Punkte entlang der Kante.
-
-        Verwendet Nearest-Neighbor-Heuristik.
-        """
-        if len(points) < 3:
-            return points
-
-        n = len(points)
-        ordered_indices = [0]
-        remaining = set(range(1, n))
-
-        while remaining:
-            current = ordered_indices[-1]
-            current_pt = points[current]
-
-            # Nächsten Punkt finden
-            min_dist = float('inf')
-            nearest = None
-
-            for idx in remaining:
-                dist = np.linalg.norm(points[idx] - current_pt)
-                if dist < min_dist:
-                    min_dist = dist
-                    nearest = idx
-
-            if nearest is not None:
-                ordered_indices.append(nearest)
-                remaining.remove(nearest)
-            else:
-                break
+        def extent(loop: np.ndarray) -> float:
+            pts = points[loop]
+            return float(np.linalg.norm(pts.max(axis=0) - pts.min(axis=0)))
 
-        return points[ordered_indices]
+        outer = max(loops, key=extent)
+        return points[outer]
 
     def _boundary_via_convex_hull(
         self,
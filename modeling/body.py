@@ -78,6 +78,7 @@ from modeling.mesh_converter import MeshToBREPConverter
 from modeling.result_types import OperationResult, BooleanResult, ResultStatus
 from modeling.geometry_validator import GeometryValidator, ValidationResult, ValidationLevel
 from modeling.geometry_healer import GeometryHealer, HealingResult, HealingStrategy
+from modeling.shape_validation import ValidationTier, check_shape, forget_shape
 from modeling.nurbs import NURBSCurve, NURBSSurface, ContinuityMode, CurveType
 from modeling.step_io import STEPWriter, STEPReader, STEPSchema, export_step as step_export
 from modeling.feature_dependency import FeatureDependencyGraph, get_dependency_graph
@@ -269,6 +270,7 @@ class Body(BodyRebuildMixin, BodyResolveMixin, BodyExtrudeMixin, BodyComputeMixi
         # Kosmetische Gewinde-Linien (Helix-Visualisierung ohne echte Geometrie)
         self._cosmetic_lines_cache = None   # pv.PolyData (Helix-Linien)
         self._cosmetic_lines_valid = False
+        self._threaded_solid_cache = None   # (Basis-Solid, Solid mit echten Gewinden)
 
         # Legacy Visualisierungs-Daten (Nur als Fallback)
         self._mesh_vertices: List[Tuple[float, float, float]] = []
@@ -279,6 +281,8 @@ class Body(BodyRebuildMixin, BodyResolveMixin, BodyExtrudeMixin, BodyComputeMixi
         self._last_operation_error_details = {}
         self._pending_tnp_failure = None
         self._async_tessellation_generation = 0
+        # Shape-Validierungen des letzten Rebuilds (Prüfungen/Cache-Treffer/ms pro Stufe)
+        self._last_validation_stats = {}
 
     @classmethod
     def _get_tessellation_manager(cls):
@@ -391,62 +395,36 @@ class Body(BodyRebuildMixin, BodyResolveMixin, BodyExtrudeMixin, BodyComputeMixi
             self._regenerate_cosmetic_lines()
         return self._cosmetic_lines_cache
 
+    def _cosmetic_threads(self) -> List[ThreadFeature]:
+        """ThreadFeatures, die im BREP fehlen (nur als Annotation vorhanden)."""
+        if not is_enabled("cosmetic_threads"):
+            return []
+        return [f for f in self.features
+                if isinstance(f, ThreadFeature) and f.cosmetic and not f.suppressed]
+
     def _regenerate_cosmetic_lines(self):
         """Erzeugt Helix-Linien für alle kosmetischen ThreadFeatures."""
         self._cosmetic_lines_valid = True
-        cosmetic_threads = [f for f in self.features
-                            if isinstance(f, ThreadFeature) and f.cosmetic]
+        cosmetic_threads = self._cosmetic_threads()
         if not cosmetic_threads:
             self._cosmetic_lines_cache = None
             return
 
         try:
-            import numpy as np
-            import pyvista as pv
-            from build123d import Helix
-
-            all_points = []
-            all_lines = []
-            offset = 0
+            from modeling.thread_tools import cosmetic_thread_lines
 
+            threads = []
             for feat in cosmetic_threads:
-                r = feat.diameter / 2.0
-                H = 0.8660254 * feat.pitch
-                groove_depth = 0.625 * H
-
-                # Zwei Helix-Linien: Innen- und Außenradius des Gewindes
-                for radius in [r - groove_depth, r]:
-                    helix = Helix(
-                        pitch=feat.pitch,
-                        height=feat.depth,
-                        radius=radius,
-                        center=tuple(feat.position),
-                        direction=tuple(feat.direction)
-                    )
-                    # Sample Punkte entlang der Helix
-                    n_samples = max(20, int(feat.depth / feat.pitch * 12))
-                    pts = []
-                    for j in range(n_samples + 1):
-                        t = j / n_samples
-                        pt = helix.position_at(t)
-                        pts.append([pt.X, pt.Y, pt.Z])
-
-                    pts_arr = np.array(pts)
-                    n_pts = len(pts_arr)
-                    all_points.append(pts_arr)
-
-                    # Polyline: [n_pts, idx0, idx1, ..., idx_n-1]
-                    line = [n_pts] + list(range(offset, offset + n_pts))
-                    all_lines.extend(line)
-                    offset += n_pts
-
-            if all_points:
-                points = np.vstack(all_points)
-                self._cosmetic_lines_cache = pv.PolyData(points, lines=all_lines)
+                try:
+                    pos, direction = self._resolve_thread_axis(feat, self._build123d_solid)
+                except Exception:
+                    pos, direction = feat.position, feat.direction
+                threads.append((pos, direction, feat.diameter, feat.pitch, feat.depth))
+
+            self._cosmetic_lines_cache = cosmetic_thread_lines(threads)
+            if self._cosmetic_lines_cache is not None:
                 logger.debug(f"[COSMETIC] {len(cosmetic_threads)} thread(s) → "
-                             f"{points.shape[0]} pts helix lines")
-            else:
-                self._cosmetic_lines_cache = None
+                             f"{self._cosmetic_lines_cache.n_points} pts helix lines")
         except Exception as e:
             logger.warning(f"Cosmetic thread lines failed: {e}")
             self._cosmetic_lines_cache = None
@@ -454,32 +432,48 @@ class Body(BodyRebuildMixin, BodyResolveMixin, BodyExtrudeMixin, BodyComputeMixi
     def _get_solid_with_threads(self):
         """Berechnet echte Gewinde auf einer Kopie des Solids (für Export).
 
-        Iteriert über alle kosmetischen ThreadFeatures und wendet
-        _compute_thread() auf eine Kopie an. Original bleibt unverändert.
+        Die gecachten Werkzeuge aller kosmetischen ThreadFeatures werden pro
+        Operation (Cut/Join) gesammelt und in einem Multi-Tool-Boolean
+        verschnitten. Das Ergebnis bleibt bis zur nächsten Solid-Änderung
+        gecacht. Original bleibt unverändert.
         """
         if self._build123d_solid is None:
             return None
 
-        cosmetic_threads = [f for f in self.features
-                            if isinstance(f, ThreadFeature) and f.cosmetic]
+        cosmetic_threads = self._cosmetic_threads()
         if not cosmetic_threads:
             return self._build123d_solid
 
+        base = self._build123d_solid
+        cached = self._threaded_solid_cache
+        if cached is not None and cached[0] is base:
+            return cached[1]
+
         logger.info(f"[EXPORT] Computing {len(cosmetic_threads)} real thread(s) for export...")
-        current = self._build123d_solid
+        tools_by_op = {}
         for feat in cosmetic_threads:
             try:
-                current = self._compute_thread(feat, current)
-                logger.debug(f"[EXPORT] Thread {feat.name} applied")
+                tool, operation = self._thread_tool(feat, base)
+                tools_by_op.setdefault(operation, []).append(tool)
             except Exception as e:
                 logger.warning(f"[EXPORT] Thread {feat.name} failed: {e}")
 
+        current = base
+        for operation, tools in tools_by_op.items():
+            try:
+                current = self._compute_thread_helix(current, tools, operation)
+                logger.debug(f"[EXPORT] {len(tools)} thread(s) applied ({operation})")
+            except Exception as e:
+                logger.warning(f"[EXPORT] Threads ({operation}) failed: {e}")
+
+        self._threaded_solid_cache = (base, current)
         return current
 
     def invalidate_mesh(self):
         """Invalidiert Mesh-Cache - nächster Zugriff regeneriert automatisch"""
         self._mesh_cache_valid = False
         self._cosmetic_lines_valid = False
+        self._threaded_solid_cache = None
 
         # WICHTIG: Auch Face-Info-Cache löschen!
         # Sonst bleiben alte Face-IDs bestehen die nach Boolean ungültig sind
@@ -954,7 +948,8 @@ class Body(BodyRebuildMixin, BodyResolveMixin, BodyExtrudeMixin, BodyComputeMixi
             if result is None:
                 raise ValueError("Operation returned None")
             
-            if hasattr(result, 'is_valid') and not result.is_valid():
+            # Faces + geschlossene Shells; Booleans sind bereits lokal geprüft
+            if hasattr(result, 'is_valid') and not check_shape(result, ValidationTier.SUBSHAPES):
                 raise ValueError("Result geometry is invalid")
 
             tnp_notice = self._consume_tnp_failure(feature)
@@ -1107,6 +1102,8 @@ class Body(BodyRebuildMixin, BodyResolveMixin, BodyExtrudeMixin, BodyComputeMixi
             feature: Das Feature das die Boolean-Operation ausgelöst hat
             operation_name: Name der Operation (Join/Cut/Intersect)
         """
+        self._record_boolean_timings(bool_result, feature, operation_name)
+
         boolean_history = getattr(bool_result, 'history', None)
         if boolean_history is None:
             return
@@ -1129,6 +1126,27 @@ class Body(BodyRebuildMixin, BodyResolveMixin, BodyExtrudeMixin, BodyComputeMixi
                 if is_enabled("tnp_debug_logging"):
                     logger.debug(f"TNP v4.0 History-Registrierung fehlgeschlagen: {tnp_e}")
 
+    def _record_boolean_timings(self, bool_result: BooleanResult, feature, operation_name: str = ""):
+        """
+        Hängt die Stufen-Zeiten des Booleans transient an das Feature.
+
+        feature._boolean_timings (wie _geometry_delta nur zur Laufzeit) macht
+        langsame Stufen im Rebuild sichtbar; ab BooleanEngineV4.SLOW_BOOLEAN_MS
+        wird die teuerste Stufe geloggt.
+        """
+        timings = getattr(bool_result, 'stage_timings', None)
+        if not timings or feature is None:
+            return
+        feature._boolean_timings = dict(timings)
+
+        total = timings.get("total", 0.0)
+        slowest = bool_result.slowest_stage()
+        if slowest and total >= BooleanEngineV4.SLOW_BOOLEAN_MS:
+            logger.info(
+                f"Boolean {operation_name} ({getattr(feature, 'name', '?')}): {total:.0f}ms, "
+                f"langsamste Stufe '{slowest[0]}' {slowest[1]:.0f}ms"
+            )
+
     def _register_fillet_chamfer_history(self, result_solid, history, feature, operation_type: str = "FILLET"):
         """
         Registriert Fillet/Chamfer History für TNP v4.0.
@@ -1244,11 +1262,9 @@ class Body(BodyRebuildMixin, BodyResolveMixin, BodyExtrudeMixin, BodyComputeMixi
         """Repariert einen TopoDS_Shape mit OCP ShapeFix."""
         try:
             from OCP.ShapeFix import ShapeFix_Shape, ShapeFix_Solid
-            from OCP.BRepCheck import BRepCheck_Analyzer
 
             # Prüfe ob Shape valide ist
-            analyzer = BRepCheck_Analyzer(shape)
-            if analyzer.IsValid():
+            if check_shape(shape, ValidationTier.FULL):
                 return shape
 
             logger.debug("Shape invalid, starte Reparatur...")
@@ -1263,12 +1279,13 @@ class Body(BodyRebuildMixin, BodyResolveMixin, BodyExtrudeMixin, BodyComputeMixi
             # Die Standardwerte sind bereits True für die meisten Modi.
             # Wir verlassen uns auf die Defaults.
 
-            if fixer.Perform():
+            performed = fixer.Perform()
+            forget_shape(shape)  # ShapeFix ändert Toleranzen/Pcurves in-place
+            if performed:
                 fixed_shape = fixer.Shape()
 
-                # Validiere repariertes Shape
-                analyzer2 = BRepCheck_Analyzer(fixed_shape)
-                if analyzer2.IsValid():
+                # Validiere repariertes Shape (ungecacht: frisch repariert)
+                if check_shape(fixed_shape, ValidationTier.FULL, cache=False):
                     logger.debug("âœ“ Shape repariert")
                     return fixed_shape
                 else:
@@ -1381,7 +1398,7 @@ class Body(BodyRebuildMixin, BodyResolveMixin, BodyExtrudeMixin, BodyComputeMixi
         self._check_free_bounds_before_export()
 
         try:
-            export_stl(self._build123d_solid, filename)
+            export_stl(self._get_solid_with_threads(), filename)
             return True
         except Exception as e:
             logger.error(f"STL-Export fehlgeschlagen: {e}")
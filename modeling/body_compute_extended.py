@@ -986,8 +986,71 @@ class BodyComputeExtendedMixin:
         1. BRepFeat_MakeCylindricalHole (für simple holes - saubere Topologie)
         2. Boolean Cut mit Zylinder (für counterbore, countersink, oder Fallback)
         """
-        from build123d import Cylinder, Vector, Align
-        import math
+        pos, d = self._resolve_hole_axis(feature, current_solid)
+        depth = feature.depth if feature.depth > 0 else 1000.0
+
+        logger.debug(f"Hole: type={feature.hole_type}, D={feature.diameter}mm, depth={depth}mm at {pos}")
+
+        # === METHODE 1: BRepFeat_MakeCylindricalHole (nur für simple holes) ===
+        brepfeat_reason = ""
+        if feature.hole_type == "simple":
+            try:
+                from modeling.brepfeat_operations import brepfeat_cylindrical_hole
+
+                result = brepfeat_cylindrical_hole(
+                    base_solid=current_solid,
+                    position=(pos.X, pos.Y, pos.Z),
+                    direction=(d.X, d.Y, d.Z),
+                    diameter=feature.diameter,
+                    depth=feature.depth  # 0 = through all
+                )
+
+                if result is not None:
+                    logger.debug(f"Hole via BRepFeat: D={feature.diameter}mm")
+                    return result
+                else:
+                    brepfeat_reason = "BRepFeat_MakeCylindricalHole lieferte kein Resultat"
+                    logger.debug("BRepFeat_MakeCylindricalHole fehlgeschlagen, Fallback auf Boolean")
+            except Exception as e:
+                brepfeat_reason = f"BRepFeat Fehler: {e}"
+                logger.debug(f"BRepFeat Hole: {e}, Fallback auf Boolean")
+
+        # === METHODE 2: Boolean Cut (für counterbore, countersink, oder Fallback) ===
+        hole_shape = self._build_hole_tool(feature, pos, d)
+
+        # Boolean Cut: Bohrung vom Körper abziehen via BooleanEngineV4 (TNP-safe)
+        # Zuerst Tool-Shapes registrieren (damit sie ShapeIDs haben)
+        if self._document and hasattr(self._document, '_shape_naming_service'):
+            # Wir registrieren das Tool als temporäres Feature oder unter der Hole-ID
+            # Da das Hole-Feature das Tool "besitzt", ist es okay, die Faces des Tools
+            # unter der Feature-ID zu registrieren.
+            self._register_base_feature_shapes(feature, hole_shape)
+
+        # Boolean ausführen
+        from modeling.boolean_engine_v4 import BooleanEngineV4
+        bool_result = BooleanEngineV4.execute_boolean_on_shapes(
+            current_solid, hole_shape, "Cut"
+        )
+
+        if bool_result.is_success:
+            result = bool_result.value
+            self._register_boolean_history(bool_result, feature, operation_name="Hole_Cut")
+            logger.debug(f"Hole {feature.hole_type} D={feature.diameter}mm erfolgreich (BooleanV4)")
+            return result
+        else:
+            logger.warning(f"Hole Boolean fehlgeschlagen: {bool_result.message}")
+            if brepfeat_reason:
+                 raise ValueError(f"Hole fehlgeschlagen. BRepFeat: {brepfeat_reason}. Boolean: {bool_result.message}")
+            raise ValueError(f"Hole Boolean fehlgeschlagen: {bool_result.message}")
+
+    def _resolve_hole_axis(self, feature: 'HoleFeature', current_solid, resolve_faces: bool = True):
+        """
+        Validiert die Hole-Parameter und liefert (Position, normierte Richtung).
+
+        resolve_faces=False nutzt nur position/direction des Features (Pattern-Seed:
+        das Seed-Hole ist bereits angewendet, seine Ziel-Face existiert nicht mehr).
+        """
+        from build123d import Vector
 
         if current_solid is None:
             raise ValueError("Hole: Kein gültiges Eingabe-Solid vorhanden")
@@ -1013,9 +1076,9 @@ class BodyComputeExtendedMixin:
                 )
 
         # TNP v4.0: Face-Referenzen auflösen/aktualisieren
-        target_faces = self._resolve_feature_faces(feature, current_solid)
+        target_faces = self._resolve_feature_faces(feature, current_solid) if resolve_faces else []
         has_face_refs = bool(feature.face_shape_ids or feature.face_indices or feature.face_selectors)
-        if has_face_refs and not target_faces:
+        if resolve_faces and has_face_refs and not target_faces:
             raise ValueError(
                 "Hole: Ziel-Face konnte via TNP v4.0 nicht aufgelöst werden "
                 f"(ShapeIDs={len(feature.face_shape_ids or [])}, "
@@ -1041,38 +1104,14 @@ class BodyComputeExtendedMixin:
             raise ValueError("Hole: Ungültige Bohrungsrichtung (Nullvektor)")
 
         d = d.normalized()
-        radius = feature.diameter / 2.0
-
-        # Tiefe: 0 = through all (verwende große Tiefe)
-        depth = feature.depth if feature.depth > 0 else 1000.0
-
-        logger.debug(f"Hole: type={feature.hole_type}, D={feature.diameter}mm, depth={depth}mm at {pos}")
+        return pos, d
 
-        # === METHODE 1: BRepFeat_MakeCylindricalHole (nur für simple holes) ===
-        brepfeat_reason = ""
-        if feature.hole_type == "simple":
-            try:
-                from modeling.brepfeat_operations import brepfeat_cylindrical_hole
-
-                result = brepfeat_cylindrical_hole(
-                    base_solid=current_solid,
-                    position=(pos.X, pos.Y, pos.Z),
-                    direction=(d.X, d.Y, d.Z),
-                    diameter=feature.diameter,
-                    depth=feature.depth  # 0 = through all
-                )
-
-                if result is not None:
-                    logger.debug(f"Hole via BRepFeat: D={feature.diameter}mm")
-                    return result
-                else:
-                    brepfeat_reason = "BRepFeat_MakeCylindricalHole lieferte kein Resultat"
-                    logger.debug("BRepFeat_MakeCylindricalHole fehlgeschlagen, Fallback auf Boolean")
-            except Exception as e:
-                brepfeat_reason = f"BRepFeat Fehler: {e}"
-                logger.debug(f"BRepFeat Hole: {e}, Fallback auf Boolean")
+    def _build_hole_tool(self, feature: 'HoleFeature', pos, d):
+        """Baut den Tool-Körper einer Bohrung (Zylinder + Counterbore/Countersink)."""
+        from build123d import Cylinder, Align
 
-        # === METHODE 2: Boolean Cut (für counterbore, countersink, oder Fallback) ===
+        radius = feature.diameter / 2.0
+        depth = feature.depth if feature.depth > 0 else 1000.0
 
         # Hauptbohrung als Zylinder erstellen
         hole_cyl = Cylinder(radius, depth,
@@ -1105,31 +1144,62 @@ class BodyComputeExtendedMixin:
             if cs_shape is None:
                 raise ValueError("Hole: Countersink-Geometrie konnte nicht positioniert werden")
             hole_shape = hole_shape.fuse(cs_shape)
+        return hole_shape
 
-        # Boolean Cut: Bohrung vom Körper abziehen via BooleanEngineV4 (TNP-safe)
-        # Zuerst Tool-Shapes registrieren (damit sie ShapeIDs haben)
-        if self._document and hasattr(self._document, '_shape_naming_service'):
-            # Wir registrieren das Tool als temporäres Feature oder unter der Hole-ID
-            # Da das Hole-Feature das Tool "besitzt", ist es okay, die Faces des Tools
-            # unter der Feature-ID zu registrieren.
-            self._register_base_feature_shapes(feature, hole_shape)
+    def _pattern_seed_tool(self, feature: 'PatternFeature', current_solid, feature_index: int):
+        """
+        Seed des Patterns: (Tool-Shape, Boolean-Operation).
 
-        # Boolean ausführen
-        from modeling.boolean_engine_v4 import BooleanEngineV4
-        bool_result = BooleanEngineV4.execute_boolean_on_shapes(
-            current_solid, hole_shape, "Cut"
-        )
+        Ohne feature_id wird der ganze Body gemustert (GUI-Body-Pattern), sonst
+        das Tool des referenzierten Features (Bohrung oder Extrusion) einmal gebaut.
+        """
+        from modeling.features import ExtrudeFeature, HoleFeature
 
-        if bool_result.is_success:
-            result = bool_result.value
-            self._register_boolean_history(bool_result, feature, operation_name="Hole_Cut")
-            logger.debug(f"Hole {feature.hole_type} D={feature.diameter}mm erfolgreich (BooleanV4)")
-            return result
-        else:
-            logger.warning(f"Hole Boolean fehlgeschlagen: {bool_result.message}")
-            if brepfeat_reason:
-                 raise ValueError(f"Hole fehlgeschlagen. BRepFeat: {brepfeat_reason}. Boolean: {bool_result.message}")
-            raise ValueError(f"Hole Boolean fehlgeschlagen: {bool_result.message}")
+        if not feature.feature_id:
+            return current_solid, "Join"
+
+        seed = next((f for f in self.features[:feature_index] if f.id == feature.feature_id), None)
+        if seed is None:
+            raise ValueError(f"Pattern: Seed-Feature '{feature.feature_id}' nicht vor dem Pattern gefunden")
+
+        if isinstance(seed, HoleFeature):
+            # Position (0, 0, 0) ist gültig - Faces nur ohne Position/Richtung auflösen
+            explicit_axis = seed.position is not None and any(seed.direction)
+            pos, d = self._resolve_hole_axis(seed, current_solid, resolve_faces=not explicit_axis)
+            return self._build_hole_tool(seed, pos, d), "Cut"
+
+        if isinstance(seed, ExtrudeFeature):
+            operation = seed.operation if seed.operation in ("Join", "Cut", "Intersect") else "Join"
+            tool = self._compute_extrude_part(seed)
+            if tool is None:
+                raise ValueError(f"Pattern: Extrude-Seed '{seed.name}' lieferte kein Tool")
+            return tool, operation
+
+        raise ValueError(f"Pattern: Seed-Typ {type(seed).__name__} wird nicht unterstützt")
+
+    def _compute_pattern(self, feature: 'PatternFeature', current_solid, feature_index: int):
+        """
+        Instanziertes Pattern: Seed-Tool einmal bauen, N-1 Platzierungen
+        (gleiche TShape) als Compound mit einem Boolean anwenden.
+        """
+        from modeling.pattern_engine import apply_pattern, pattern_matrices
+
+        if current_solid is None:
+            raise ValueError("Pattern: Kein gültiges Eingabe-Solid vorhanden")
+
+        matrices = pattern_matrices(feature)
+        tool, operation = self._pattern_seed_tool(feature, current_solid, feature_index)
+
+        bool_result, placed = apply_pattern(current_solid, tool, operation, matrices[1:])
+        if not bool_result.is_success:
+            raise ValueError(f"Pattern {operation} fehlgeschlagen: {bool_result.message}")
+
+        if self._document and hasattr(self._document, '_shape_naming_service'):
+            from build123d import Shape
+            self._register_base_feature_shapes(feature, Shape(placed))
+        self._register_boolean_history(bool_result, feature, operation_name=f"Pattern_{operation}")
+        logger.debug(f"Pattern {feature.pattern_type}: {len(matrices)} Instanzen erfolgreich")
+        return bool_result.value
 
     def _position_cylinder(self, cyl_solid, position, direction, depth):
         """Positioniert einen Zylinder an position entlang direction."""
@@ -1153,11 +1223,14 @@ class BodyComputeExtendedMixin:
 
             # Rotation berechnen: Z-Achse -> direction
             z_axis = np.array([0, 0, 1.0])
-            if abs(np.dot(z_axis, d_norm)) > 0.999:
+            if np.dot(z_axis, d_norm) > 0.999:
                 # Parallel zu Z - keine Rotation noetig
                 rotated = cyl_solid
             else:
                 rot_axis = np.cross(z_axis, d_norm)
+                if np.linalg.norm(rot_axis) < 1e-6:
+                    # Antiparallel zu Z: 180° um X
+                    rot_axis = np.array([1.0, 0.0, 0.0])
                 rot_axis = rot_axis / (np.linalg.norm(rot_axis) + 1e-12)
                 angle = np.arccos(np.clip(np.dot(z_axis, d_norm), -1, 1))
 
@@ -1374,20 +1447,15 @@ class BodyComputeExtendedMixin:
             logger.debug(f"Split (below) erfolgreich")
             return body_below
 
-    def _compute_thread(self, feature: 'ThreadFeature', current_solid):
+    def _resolve_thread_axis(self, feature: 'ThreadFeature', current_solid):
         """
-        Erzeugt ein echtes helikales Gewinde via Helix-Sweep + Boolean.
+        Gewindeachse (Position, Richtung) eines ThreadFeatures.
 
-        Strategy:
-        1. ISO 60° Gewindeprofil als Draht erstellen
-        2. Helix-Pfad mit Pitch und Tiefe
-        3. Sweep Profil entlang Helix -> Thread-Solid
-        4. Boolean Cut (extern) oder Fuse (intern)
+        Mit Face-Referenz (TNP v4.0) kommt die Achse aus der Zylinderfläche,
+        sonst aus den Feature-Parametern.
         """
         import numpy as np
 
-        shape = current_solid.wrapped if hasattr(current_solid, 'wrapped') else current_solid
-
         # TNP v4.0: Face-Referenz auflösen (ShapeID -> Index -> Selector).
         target_faces = self._resolve_feature_faces(feature, current_solid)
         has_face_refs = bool(
@@ -1435,102 +1503,69 @@ class BodyComputeExtendedMixin:
             raise ValueError("Thread: Ungültige Gewinderichtung (Nullvektor)")
         direction = direction / (np.linalg.norm(direction) + 1e-12)
 
-        r = max(feature.diameter / 2.0, 1e-6)
-        pitch = feature.pitch
-        depth = feature.depth
-        if pitch <= 1e-9:
-            raise ValueError("Thread: Pitch muss > 0 sein")
-        if depth <= 0:
-            raise ValueError("Thread: Depth muss > 0 sein")
-        n_turns = depth / pitch
+        return pos, direction
 
-        # Thread groove depth (ISO 60° metric: H = 0.8660 * P, groove = 5/8 * H)
-        H = 0.8660254 * pitch
-        groove_depth = 0.625 * H
+    def _thread_tool(self, feature: 'ThreadFeature', current_solid):
+        """
+        Platziertes Gewinde-Werkzeug und Boolean-Operation für ein ThreadFeature.
 
-        return self._compute_thread_helix(
-            shape, pos, direction, r, pitch, depth, n_turns,
-            groove_depth, feature.thread_type, feature.tolerance_offset,
-            feature=feature
-        )
+        Der Sweep kommt aus dem ThreadToolCache (kanonisch an Ursprung/+Z) und
+        wird per Location auf die Gewindeachse gesetzt. tolerance_offset geht
+        (wie bisher) nicht in die Geometrie ein.
+        """
+        from modeling.thread_tools import ThreadToolCache, place_thread_tool
 
-    def _compute_thread_helix(self, shape, pos, direction, r, pitch, depth, n_turns,
-                               groove_depth, thread_type, tolerance_offset, feature=None):
-        """Echtes Gewinde via Helix + Sweep mit korrekter Profil-Orientierung.
+        pos, direction = self._resolve_thread_axis(feature, current_solid)
+        if feature.pitch <= 1e-9:
+            raise ValueError("Thread: Pitch muss > 0 sein")
+        if feature.depth <= 0:
+            raise ValueError("Thread: Depth muss > 0 sein")
 
-        Das Profil wird senkrecht zum Helix-Tangenten am Startpunkt platziert
-        (nicht auf Plane.XZ!). Dadurch entsteht saubere Geometrie mit wenigen
-        Faces/Edges -> schnelle Tessellation ohne Lag.
-        """
-        import numpy as np
-        from build123d import (Helix, Solid, Polyline, BuildSketch, BuildLine,
-                               Plane, make_face, sweep, Vector)
-        from modeling.boolean_engine_v4 import BooleanEngineV4
+        tool = ThreadToolCache.get(feature.diameter, feature.pitch, feature.depth, feature.thread_type)
+        # Auch Innengewinde schneiden: das Werkzeug liegt in der Bohrungswand
+        # (Helix-Radius r + Rille/2), Join würde nichts verändern
+        return place_thread_tool(tool, pos, direction), "Cut"
 
-        logger.debug(f"[THREAD] Helix sweep: r={r:.2f}, pitch={pitch}, depth={depth}, "
-                     f"type={thread_type}, groove={groove_depth:.3f}")
+    def _compute_thread(self, feature: 'ThreadFeature', current_solid):
+        """
+        Erzeugt ein echtes helikales Gewinde via Helix-Sweep + Boolean.
 
-        # Helix-Radius: Mitte der Gewinderille
-        if thread_type == "external":
-            helix_r = r - groove_depth / 2
-        else:
-            helix_r = r + groove_depth / 2
-
-        # 1. Helix-Pfad via build123d
-        helix = Helix(
-            pitch=pitch,
-            height=depth,
-            radius=helix_r,
-            center=tuple(pos),
-            direction=tuple(direction)
-        )
+        Strategy:
+        1. Kanonischen Sweep aus dem ThreadToolCache holen
+        2. Per Location auf die aufgelöste Gewindeachse setzen
+        3. Boolean Cut für beide Gewindetypen via execute_boolean_multi
+        """
+        tool, operation = self._thread_tool(feature, current_solid)
+        return self._compute_thread_helix(current_solid, [tool], operation, feature=feature)
 
-        # 2. ISO 60° Dreiecksprofil senkrecht zum Helix-Tangenten am Startpunkt
-        half_w = pitch * 0.3
-
-        # Profil-Plane senkrecht zur Helix-Tangente am Startpunkt
-        start_pt = helix.position_at(0)
-        tangent = helix.tangent_at(0)
-        profile_plane = Plane(origin=start_pt, z_dir=tangent)
-
-        with BuildSketch(profile_plane) as profile_sk:
-            with BuildLine():
-                Polyline(
-                    (-groove_depth / 2, -half_w),
-                    (groove_depth / 2, 0),
-                    (-groove_depth / 2, half_w),
-                    close=True
-                )
-            make_face()
+    def _compute_thread_helix(self, current_solid, tools, operation, feature=None):
+        """Verschneidet platzierte Gewinde-Werkzeuge mit dem Solid.
 
-        # 3. Sweep Profil entlang Helix
-        thread_solid = sweep(profile_sk.sketch, path=helix)
-        thread_ocp = thread_solid.wrapped if hasattr(thread_solid, 'wrapped') else thread_solid
+        Läuft über den Multi-Tool-Boolean: die Pre-Checks gelten pro TShape
+        (Location ignoriert), gleiche Gewinde werden also nur einmal geprüft.
+        """
+        from build123d import Solid
+        from modeling.boolean_engine_v4 import BooleanEngineV4
 
-        # 4. Boolean Operation via BooleanEngineV4 (TNP-safe)
-        bool_op_type = "Cut" if thread_type == "external" else "Fuse"
+        logger.debug(f"[THREAD] {operation} mit {len(tools)} Werkzeug(en)")
 
         # Tool-Shapes registrieren (optional, aber gut für Debugging/Picking)
         if feature and self._document and hasattr(self._document, '_shape_naming_service'):
             try:
-                self._register_base_feature_shapes(feature, thread_solid)
+                for tool in tools:
+                    self._register_base_feature_shapes(feature, tool)
             except Exception:
                 pass
 
-        current_solid_b123d = Solid(shape)
-
-        bool_result = BooleanEngineV4.execute_boolean_on_shapes(
-            current_solid_b123d, thread_solid, bool_op_type
-        )
+        shape = current_solid.wrapped if hasattr(current_solid, 'wrapped') else current_solid
+        bool_result = BooleanEngineV4.execute_boolean_multi(Solid(shape), tools, operation)
 
         if bool_result.is_success:
-            result = bool_result.value
             if feature:
-                self._register_boolean_history(bool_result, feature, operation_name=f"Thread_{bool_op_type}")
-            logger.debug(f"[THREAD] Helix sweep completed successfully (BooleanV4)")
-            return result
-        else:
-            raise RuntimeError(f"Thread boolean via V4 failed: {bool_result.message}")
+                self._register_boolean_history(bool_result, feature, operation_name=f"Thread_{operation}")
+            logger.debug(f"[THREAD] Boolean {operation} erfolgreich (BooleanV4)")
+            return bool_result.value
+        raise RuntimeError(f"Thread boolean via V4 failed: {bool_result.message}")
 
     def _compute_adaptive_edge_tolerance(self, solid) -> float:
         """
@@ -2272,31 +2307,52 @@ class BodyComputeExtendedMixin:
 
     # Transform
     def _apply_transform_feature(self, solid, feature):
-        """Applies transform feature to solid."""
+        """
+        Applies transform feature to solid.
+
+        Move/Rotate setzen nur die Location (TShape bleibt geteilt), der
+        Tessellator platziert dann das gecachte Mesh. Mirror/Scale erzeugen
+        neue Geometrie und werden beim Tessellator als Ableitung registriert.
+        """
         try:
-            from OCP.gp import gp_Trsf, gp_Vec, gp_Quaternion
+            from OCP.gp import gp_Trsf, gp_Vec, gp_Pnt, gp_Ax1, gp_Ax2, gp_Dir
             from OCP.BRepBuilderAPI import BRepBuilderAPI_Transform
             from build123d import Solid
+            from modeling.cad_tessellator import CADTessellator
+
+            mode = getattr(feature, "mode", "move")
+            data = getattr(feature, "data", None) or {}
+            axis_map = {"X": (1.0, 0.0, 0.0), "Y": (0.0, 1.0, 0.0), "Z": (0.0, 0.0, 1.0)}
+            plane_normals = {"XY": (0.0, 0.0, 1.0), "XZ": (0.0, 1.0, 0.0), "YZ": (1.0, 0.0, 0.0)}
 
             trsf = gp_Trsf()
-            
-            # Translation
-            if hasattr(feature, 'translation') and feature.translation:
-                t = feature.translation
-                trsf.SetTranslation(gp_Vec(t[0], t[1], t[2]))
-            
-            # Rotation
-            if hasattr(feature, 'rotation') and feature.rotation:
-                r = feature.rotation
-                # Rotation in degrees around axis
-                # This is simplified - full implementation would handle axis
-                pass
-            
+            center = gp_Pnt(*[float(v) for v in data.get("center", (0.0, 0.0, 0.0))])
+
+            if mode == "move":
+                t = data.get("translation", getattr(feature, "translation", None)) or (0.0, 0.0, 0.0)
+                trsf.SetTranslation(gp_Vec(float(t[0]), float(t[1]), float(t[2])))
+            elif mode == "rotate":
+                axis = data.get("axis", "Z")
+                direction = axis_map.get(str(axis).upper(), (0.0, 0.0, 1.0)) if isinstance(axis, str) else axis
+                trsf.SetRotation(gp_Ax1(center, gp_Dir(*[float(v) for v in direction])),
+                                 math.radians(float(data.get("angle", 0.0))))
+            elif mode == "scale":
+                trsf.SetScale(center, float(data.get("factor", 1.0)))
+            elif mode == "mirror":
+                normal = plane_normals.get(str(data.get("plane", "XY")).upper(), (0.0, 0.0, 1.0))
+                trsf.SetMirror(gp_Ax2(center, gp_Dir(*normal)))
+            else:
+                logger.warning(f"Unbekannter Transform-Modus: {mode}")
+                return solid
+
             ocp_solid = solid.wrapped if hasattr(solid, 'wrapped') else solid
             transform = BRepBuilderAPI_Transform(ocp_solid, trsf)
-            
+
             if transform.IsDone():
-                return Solid(transform.Shape())
+                result = Solid(transform.Shape())
+                if mode in ("scale", "mirror") and hasattr(solid, 'wrapped'):
+                    CADTessellator.register_transformed(solid, result, trsf)
+                return result
         except Exception as e:
             logger.error(f"Transform feature failed: {e}")
         return solid
@@ -38,12 +38,13 @@ class BodyRebuildMixin:
             ExtrudeFeature, PushPullFeature, TransformFeature, RevolveFeature,
             LoftFeature, SweepFeature, ShellFeature, HollowFeature,
             LatticeFeature, NSidedPatchFeature, HoleFeature, DraftFeature,
-            SplitFeature, ThreadFeature, SurfaceTextureFeature
+            SplitFeature, ThreadFeature, SurfaceTextureFeature, PatternFeature
         )
         from modeling.boolean_engine_v4 import BooleanEngineV4
         from modeling.ocp_helpers import OCPFilletHelper, OCPChamferHelper
         from modeling.geometry_validator import GeometryValidator, ValidationLevel
         from modeling.geometry_healer import GeometryHealer
+        from modeling.shape_validation import validation_stats, validation_stats_since
 
         max_index = rebuild_up_to if rebuild_up_to is not None else len(self.features)
         strict_self_heal = is_enabled("self_heal_strict")
@@ -237,6 +238,7 @@ class BodyRebuildMixin:
         last_valid_feature_index = start_index - 1 if current_solid is not None else -1
 
         logger.info(f"Rebuilding Body '{self.name}' (Features {start_index}-{max_index-1}/{len(self.features)})...")
+        validation_before = validation_stats()
 
         # Reset Cache (Phase 2: Lazy-Loading)
         self.invalidate_mesh()
@@ -301,6 +303,7 @@ class BodyRebuildMixin:
             status = "OK"
             self._last_operation_error = ""
             self._last_operation_error_details = {}
+            feature._boolean_timings = None  # Transient, gefüllt von _register_boolean_history
 
             # ================= PRIMITIVE (Base Feature) =================
             if isinstance(feature, PrimitiveFeature):
@@ -809,6 +812,21 @@ class BodyRebuildMixin:
                         new_solid = current_solid
                         status = "ERROR"
 
+            # ================= PATTERN =================
+            elif isinstance(feature, PatternFeature):
+                if current_solid:
+                    def op_pattern():
+                        return self._compute_pattern(feature, current_solid, i)
+
+                    new_solid, status = self._safe_operation(
+                        f"Pattern_{i}",
+                        op_pattern,
+                        feature=feature,
+                    )
+                    if new_solid is None:
+                        new_solid = current_solid
+                        status = "ERROR"
+
             # ================= THREAD =================
             elif isinstance(feature, ThreadFeature):
                 if current_solid:
@@ -1008,6 +1026,14 @@ class BodyRebuildMixin:
         if use_incremental:
             self._dependency_graph.clear_dirty()
 
+        self._last_validation_stats = validation_stats_since(validation_before)
+        checks = sum(tier["calls"] for tier in self._last_validation_stats.values())
+        if checks:
+            cached = sum(tier["cached"] for tier in self._last_validation_stats.values())
+            check_ms = sum(tier["ms"] for tier in self._last_validation_stats.values())
+            logger.debug(f"Shape-Validierung '{self.name}': {checks} Prüfungen "
+                         f"({cached} aus Cache), {check_ms:.1f} ms")
+
         pre_finalize_snapshot = {
             "solid": self._build123d_solid,
             "shape": self.shape,
@@ -12,11 +12,23 @@ Production-ready Boolean operations with:
 PERFORMANCE (Phase 3):
 - VolumeCache: Cached volume calculations (avoid redundant GProp calls)
 
+PERFORMANCE (gestufte Checks):
+- Günstige Stufen zuerst: AABB → OBB → memoisierte Self-Intersection/Argument-Analyse
+- PrecheckCache: Prüf-Urteile pro Operand (ShapeKey: TShape + Toleranz-Zustand)
+- BRepCheck-Gültigkeit über modeling.shape_validation (gecacht pro ShapeKey + Stufe)
+- Post-Check nur auf History-Modified/Generated-Faces, Voll-Check als Fallback
+- BooleanResult.stage_timings: ms pro Stufe für Rebuild-Reports
+- BooleanResultCache: Ergebnis + History pro (Target-, Tool-Fingerprint, Op, Toleranz)
+
 Author: Claude (Architecture Refactoring Phase 1)
 Date: 2026-01-22
 """
 
-from typing import Optional, Tuple, Any, Dict
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional, Tuple, Any, Callable, Dict, List
 from loguru import logger
 
 try:
@@ -26,17 +38,31 @@ try:
     from OCP.BRepGProp import BRepGProp
     from OCP.TopExp import TopExp_Explorer
     from OCP.TopAbs import TopAbs_FACE
-    from OCP.BRepCheck import BRepCheck_Analyzer
     from OCP.TopTools import TopTools_ListOfShape  # ✅ FIX: Correct type for SetArguments()
     from OCP.ShapeFix import ShapeFix_Shape  # Post-Boolean Auto-Healing
+    from OCP.Bnd import Bnd_Box, Bnd_OBB
+    from OCP.BRepBndLib import BRepBndLib
+    from OCP.BRep import BRep_Builder, BRep_Tool
+    from OCP.TopAbs import TopAbs_EDGE, TopAbs_SHELL
+    from OCP.BRepTools import BRepTools_History
+    from OCP.BRepBuilderAPI import BRepBuilderAPI_Copy
+    from OCP.TopExp import TopExp
+    from OCP.TopTools import TopTools_IndexedMapOfShape
+    from OCP.TopLoc import TopLoc_Location
+    from OCP.TopoDS import TopoDS_Compound
     HAS_OCP = True
 except ImportError:
     HAS_OCP = False
 
-from config.feature_flags import is_enabled
+from config.feature_flags import get_setting, is_enabled
 
 from modeling.result_types import BooleanResult, ResultStatus
 from modeling.body_transaction import BodyTransaction, BooleanOperationError
+from modeling.shape_fingerprint import shape_fingerprint, tolerance_state
+from modeling.shape_validation import (
+    ValidationTier, check_faces, check_shape, forget_shape, known_self_intersection_free,
+    mark_valid, shape_key,
+)
 from config.tolerances import Tolerances  # Phase 5: Zentralisierte Toleranzen
 
 
@@ -120,6 +146,303 @@ class VolumeCache:
         cls._bbox_cache.clear()
 
 
+class PrecheckCache:
+    """
+    PERFORMANCE: Memo für Pre-Check-Urteile pro Operand.
+
+    BOPAlgo_CheckerSI, BOPAlgo_ArgumentAnalyzer und OBB-Berechnung kosten
+    auf großen Bodies hunderte ms. Ketten von Booleans, Pattern-Tools und
+    per Location platzierte Instanzen sehen diese Checks immer wieder für
+    dieselben Shapes.
+
+    Schlüssel sind ShapeKeys (modeling.shape_validation): TShape-Identität +
+    Toleranz-/Flag-Zustand. Ein inhaltsbasierter Fingerprint würde
+    geometrisch gleiche Shapes mit anderen Toleranzen/Pcurves gleichsetzen.
+    Der Cache wird NICHT pro Operation geleert (anders als VolumeCache),
+    die Schlüssel halten ihre Shapes am Leben. LRU-begrenzt.
+    """
+
+    MAX_ENTRIES = 1024
+
+    _verdicts: "OrderedDict[Tuple, Any]" = OrderedDict()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def lookup(cls, key: Optional[Tuple], compute: Callable[[], Any]) -> Any:
+        """
+        Gibt das gespeicherte Urteil für key zurück oder berechnet es.
+
+        key=None (Fingerprint nicht berechenbar) → immer berechnen, nie speichern.
+        """
+        if key is None:
+            return compute()
+        if key in cls._verdicts:
+            cls._verdicts.move_to_end(key)
+            cls.hits += 1
+            return cls._verdicts[key]
+        cls.misses += 1
+        verdict = compute()
+        cls.store(key, verdict)
+        return verdict
+
+    @classmethod
+    def store(cls, key: Optional[Tuple], verdict: Any) -> None:
+        """Setzt ein Urteil direkt (z.B. für lokal validierte Boolean-Ergebnisse)."""
+        if key is None:
+            return
+        cls._verdicts[key] = verdict
+        cls._verdicts.move_to_end(key)
+        while len(cls._verdicts) > cls.MAX_ENTRIES:
+            cls._verdicts.popitem(last=False)
+
+    @classmethod
+    def clear(cls):
+        cls._verdicts.clear()
+        cls.hits = 0
+        cls.misses = 0
+
+
+def _shape_map(shape: Any, kind: Any) -> Any:
+    shape_map = TopTools_IndexedMapOfShape()
+    TopExp.MapShapes_s(shape, kind, shape_map)
+    return shape_map
+
+
+@dataclass
+class _MemoEntry:
+    """Ein gespeichertes Boolean-Ergebnis inkl. index-basierter History."""
+    result_shape: Any
+    records: List[Tuple]           # (Rolle, Typ, Quell-Index, Modified, Generated, Removed)
+    extents: Dict[Tuple, int]      # (Rolle, Typ) -> Anzahl Sub-Shapes beim Speichern
+    nbytes: int
+    cost_ms: float
+
+    def history_for(self, target: Any, tool: Any, result_shape: Any) -> Optional[Any]:
+        """
+        History von den aktuellen Operanden auf result_shape (Kopie des
+        gespeicherten Ergebnisses, gleiche Sub-Shape-Reihenfolge).
+
+        Wird über die Sub-Shape-Indizes übertragen; auch nicht veränderte
+        Sub-Shapes erscheinen als Modified, da die Kopie eigene TShapes hat.
+        None wenn die Topologie nicht passt.
+        """
+        source_maps = {}
+        for role, shape in (("target", target), ("tool", tool)):
+            for kind in BooleanResultCache.HISTORY_KINDS:
+                shape_map = _shape_map(shape, kind)
+                if shape_map.Extent() != self.extents[(role, kind)]:
+                    return None
+                source_maps[(role, kind)] = shape_map
+        result_maps = {kind: _shape_map(result_shape, kind) for kind in BooleanResultCache.HISTORY_KINDS}
+
+        history = BRepTools_History()
+        for role, kind, index, modified, generated, removed in self.records:
+            source = source_maps[(role, kind)].FindKey(index)
+            for out_kind, out_index in modified:
+                history.AddModified(source, result_maps[out_kind].FindKey(out_index))
+            for out_kind, out_index in generated:
+                history.AddGenerated(source, result_maps[out_kind].FindKey(out_index))
+            if removed:
+                history.Remove(source)
+        return history
+
+
+class BooleanResultCache:
+    """
+    PERFORMANCE: Memo für komplette Boolean-Ergebnisse.
+
+    Parameter hin- und herziehen, Undo/Redo und Suppress-Toggles führen
+    identische Booleans auf inhaltsgleichen Operanden erneut aus.
+    Schlüssel: (Target-Fingerprint, Tool-Fingerprint, Operation, Fuzzy-Toleranz,
+    Toleranz-Zustand Target, Toleranz-Zustand Tool). Der Fingerprint allein
+    sieht keine Toleranzen und SameParameter-Flags.
+
+    Gespeichert werden Ergebnis-Shape und eine index-basierte Kopie der
+    Modified/Generated-History. Jeder Treffer
+    liefert eine eigene Kopie des Ergebnisses (spätere Fixes/Healing am
+    Body dürfen das Memo nicht verändern), baut die History darauf neu auf
+    und prüft sie wie ein frisches Ergebnis. Das TNP-Update läuft ohne
+    OCP-Boolean.
+
+    Verdrängung LRU nach geschätzten Bytes. Budget über das Runtime-Setting
+    "boolean_result_cache_mb" (0 = Memo aus).
+    """
+
+    HISTORY_KINDS = (TopAbs_EDGE, TopAbs_FACE) if HAS_OCP else ()
+
+    # Grobe Schätzung des Speicherbedarfs pro Sub-Shape (Geometrie + Topologie)
+    FACE_BYTES = 2048
+    EDGE_BYTES = 768
+    VERTEX_BYTES = 128
+    RECORD_BYTES = 96
+
+    _entries: "OrderedDict[Tuple, _MemoEntry]" = OrderedDict()
+    _bytes = 0
+    hits = 0
+    misses = 0
+    evictions = 0
+    saved_ms = 0.0
+
+    @staticmethod
+    def budget_bytes() -> int:
+        return int(float(get_setting("boolean_result_cache_mb", 0) or 0) * 1024 * 1024)
+
+    @staticmethod
+    def make_key(target: Any, tool: Any, operation: str, fuzzy_tolerance: float) -> Optional[Tuple]:
+        """Memo-Schlüssel, None wenn das Memo aus ist oder ein Fingerprint fehlt."""
+        if BooleanResultCache.budget_bytes() <= 0:
+            return None
+        fp1 = shape_fingerprint(target)
+        fp2 = shape_fingerprint(tool)
+        if fp1 is None or fp2 is None:
+            return None
+        state1 = tolerance_state(target)
+        state2 = tolerance_state(tool)
+        if state1 is None or state2 is None:
+            return None
+        return (fp1, fp2, operation, fuzzy_tolerance, state1, state2)
+
+    @classmethod
+    def lookup(cls, key: Optional[Tuple]) -> Optional[_MemoEntry]:
+        if key is None:
+            return None
+        entry = cls._entries.get(key)
+        if entry is None:
+            cls.misses += 1
+            return None
+        cls._entries.move_to_end(key)
+        cls.hits += 1
+        return entry
+
+    @classmethod
+    def store(cls, key: Optional[Tuple], target: Any, tool: Any,
+              result: BooleanResult, cost_ms: float) -> None:
+        """Speichert ein erfolgreiches Ergebnis (nur mit History, sonst kein TNP-Replay)."""
+        budget = cls.budget_bytes()
+        if key is None or budget <= 0 or result.history is None or result.value is None:
+            return
+        result_shape = result.value.wrapped
+        try:
+            records, extents, result_counts = cls._index_history(result.history, target, tool, result_shape)
+        except Exception as e:
+            logger.debug(f"Boolean-Memo: History nicht indexierbar: {e}")
+            return
+
+        n_faces = key[0][0] + key[1][0] + result_counts[TopAbs_FACE]
+        n_edges = key[0][1] + key[1][1] + result_counts[TopAbs_EDGE]
+        n_vertices = key[0][2] + key[1][2] + result_counts[TopAbs_EDGE]  # ~ Vertices ≤ Edges
+        nbytes = (n_faces * cls.FACE_BYTES + n_edges * cls.EDGE_BYTES
+                  + n_vertices * cls.VERTEX_BYTES + len(records) * cls.RECORD_BYTES)
+        if nbytes > budget:
+            return
+
+        old = cls._entries.pop(key, None)
+        if old is not None:
+            cls._bytes -= old.nbytes
+        cls._entries[key] = _MemoEntry(
+            result_shape=result_shape,
+            records=records,
+            extents=extents,
+            nbytes=nbytes,
+            cost_ms=cost_ms,
+        )
+        cls._bytes += nbytes
+        while cls._bytes > budget and cls._entries:
+            _, evicted = cls._entries.popitem(last=False)
+            cls._bytes -= evicted.nbytes
+            cls.evictions += 1
+
+    @classmethod
+    def _index_history(cls, history: Any, target: Any, tool: Any,
+                       result_shape: Any) -> Tuple[List[Tuple], Dict[Tuple, int], Dict[Any, int]]:
+        """History als (Rolle, Typ, Index) → Ergebnis-Indizes, unabhängig von TShape-Objekten."""
+        result_maps = {kind: _shape_map(result_shape, kind) for kind in cls.HISTORY_KINDS}
+
+        def indices(shapes):
+            found = []
+            if shapes.Size() == 0:
+                return ()  # Iteration über OCP-Listen ist in Python teuer
+            for shape in shapes:
+                result_map = result_maps.get(shape.ShapeType())
+                index = result_map.FindIndex(shape) if result_map is not None else 0
+                if index > 0:
+                    found.append((shape.ShapeType(), index))
+            return tuple(found)
+
+        records = []
+        extents = {}
+        for role, source in (("target", target), ("tool", tool)):
+            for kind in cls.HISTORY_KINDS:
+                source_map = _shape_map(source, kind)
+                extents[(role, kind)] = source_map.Extent()
+                for index in range(1, source_map.Extent() + 1):
+                    shape = source_map.FindKey(index)
+                    modified = indices(history.Modified(shape))
+                    generated = indices(history.Generated(shape))
+                    removed = history.IsRemoved(shape)
+                    if not modified and not removed:
+                        kept = result_maps[kind].FindIndex(shape)
+                        if kept > 0:
+                            modified = ((kind, kept),)
+                    if modified or generated or removed:
+                        records.append((role, kind, index, modified, generated, removed))
+
+        return records, extents, {kind: m.Extent() for kind, m in result_maps.items()}
+
+    @classmethod
+    def record_hit(cls, entry: _MemoEntry, spent_ms: float) -> None:
+        cls.saved_ms += max(entry.cost_ms - spent_ms, 0.0)
+
+    @classmethod
+    def stats(cls) -> Dict[str, float]:
+        """Treffer/Fehlschläge/Bytes/gesparte Zeit (für PerformanceBenchmark)."""
+        lookups = cls.hits + cls.misses
+        return {
+            "entries": len(cls._entries),
+            "bytes": cls._bytes,
+            "budget_bytes": cls.budget_bytes(),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": cls.hits / lookups if lookups else 0.0,
+            "evictions": cls.evictions,
+            "saved_ms": cls.saved_ms,
+        }
+
+    @classmethod
+    def clear(cls):
+        cls._entries.clear()
+        cls._bytes = 0
+        cls.hits = 0
+        cls.misses = 0
+        cls.evictions = 0
+        cls.saved_ms = 0.0
+
+
+class _StageTimer:
+    """Sammelt ms pro Pipeline-Stufe (mehrfach betretene Stufen summieren sich)."""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + (time.perf_counter() - t0) * 1000.0
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._start) * 1000.0
+
+    def attach(self, result: BooleanResult) -> BooleanResult:
+        self.timings["total"] = self.elapsed_ms()
+        result.stage_timings = dict(self.timings)
+        return result
+
+
 class BooleanEngineV4:
     """
     Professional Boolean engine with production-grade defaults.
@@ -135,6 +458,9 @@ class BooleanEngineV4:
     PRODUCTION_FUZZY_TOLERANCE = Tolerances.KERNEL_FUZZY
     MIN_VOLUME_CHANGE = Tolerances.KERNEL_MIN_VOLUME_CHANGE
 
+    # Ab dieser Gesamtdauer meldet der Rebuild die teuerste Stufe
+    SLOW_BOOLEAN_MS = 250.0
+
     @staticmethod
     def _fix_shape(shape: Any) -> Any:
         """
@@ -147,8 +473,7 @@ class BooleanEngineV4:
             Reparierter Shape (oder Original wenn bereits valid)
         """
         try:
-            analyzer = BRepCheck_Analyzer(shape)
-            if analyzer.IsValid():
+            if check_shape(shape, ValidationTier.FULL):
                 return shape
 
             logger.debug("Shape invalid, starte Reparatur...")
@@ -157,10 +482,11 @@ class BooleanEngineV4:
             fixer.SetMaxTolerance(Tolerances.MESH_EXPORT)
             fixer.SetMinTolerance(Tolerances.KERNEL_PRECISION / 10)
 
-            if fixer.Perform():
+            performed = fixer.Perform()
+            forget_shape(shape)  # ShapeFix ändert Toleranzen/Pcurves in-place
+            if performed:
                 fixed = fixer.Shape()
-                analyzer2 = BRepCheck_Analyzer(fixed)
-                if analyzer2.IsValid():
+                if check_shape(fixed, ValidationTier.FULL, cache=False):
                     logger.debug("✓ Shape repariert")
                     return fixed
                 else:
@@ -329,10 +655,12 @@ class BooleanEngineV4:
         Keine Body-Dependency, keine Transaction, kein invalidate_mesh().
         Ideal für den Rebuild-Loop der mit Zwischen-Solids arbeitet.
 
-        Führt alle Pre-/Post-Checks durch:
-        - Self-Intersection Check
-        - Argument Analysis
-        - Post-Boolean Validation + Auto-Healing
+        Führt alle Pre-/Post-Checks gestuft durch (günstigste zuerst):
+        - AABB/OBB-Test (Cut/Intersect ohne Berührung → sofort Fehler)
+        - Self-Intersection Check (memoisiert pro Operand-Fingerprint)
+        - Argument Analysis (memoisiert pro Fingerprint-Paar)
+        - Post-Boolean Validation nur auf Modified/Generated-Faces,
+          Voll-Check + Auto-Healing als Fallback
         - Tolerance Monitoring
         - TNP v4.1: History-basierte ShapeID-Aktualisierung
 
@@ -345,7 +673,7 @@ class BooleanEngineV4:
             feature_id: Optional Feature ID für TNP-Update
 
         Returns:
-            BooleanResult mit Build123d Solid als value und History
+            BooleanResult mit Build123d Solid als value, History und stage_timings
         """
         if not HAS_OCP:
             return BooleanResult(
@@ -359,6 +687,26 @@ class BooleanEngineV4:
         if fuzzy_tolerance is None:
             fuzzy_tolerance = BooleanEngineV4.PRODUCTION_FUZZY_TOLERANCE
 
+        timer = _StageTimer()
+        return timer.attach(BooleanEngineV4._run_on_shapes(
+            solid1, solid2, operation, fuzzy_tolerance, naming_service, feature_id, timer
+        ))
+
+    @staticmethod
+    def _run_on_shapes(
+        solid1: Any,
+        solid2: Any,
+        operation: str,
+        fuzzy_tolerance: float,
+        naming_service: Any,
+        feature_id: Optional[str],
+        timer: _StageTimer
+    ) -> BooleanResult:
+        """
+        Pipeline von execute_boolean_on_shapes(), günstigste Stufen zuerst.
+
+        Jede Stufe wird in timer gemessen (→ BooleanResult.stage_timings).
+        """
         op_type = operation.lower()
 
         try:
@@ -381,9 +729,22 @@ class BooleanEngineV4:
             shape1 = solid1.wrapped if hasattr(solid1, 'wrapped') else solid1
             shape2 = solid2.wrapped if hasattr(solid2, 'wrapped') else solid2
 
-            # 3. Fix shapes before boolean
-            shape1 = BooleanEngineV4._fix_shape(shape1)
-            shape2 = BooleanEngineV4._fix_shape(shape2)
+            # 2b. Ergebnis-Memo: inhaltsgleiche Operanden → kein OCP-Boolean
+            with timer.stage("memo_lookup"):
+                memo_key = BooleanResultCache.make_key(shape1, shape2, operation, fuzzy_tolerance)
+                cached = BooleanResultCache.lookup(memo_key)
+            if cached is not None:
+                memo_result = BooleanEngineV4._result_from_memo(
+                    cached, shape1, shape2, operation, naming_service, feature_id, timer
+                )
+                if memo_result is not None:
+                    return memo_result
+            raw1, raw2 = shape1, shape2
+
+            # 3. Fix shapes before boolean (Validität memoisiert pro Fingerprint)
+            with timer.stage("fix"):
+                shape1 = BooleanEngineV4._fix_shape(shape1)
+                shape2 = BooleanEngineV4._fix_shape(shape2)
 
             if shape1 is None or shape2 is None:
                 return BooleanResult(
@@ -392,15 +753,16 @@ class BooleanEngineV4:
                     operation_type=op_type
                 )
 
-            # 4. Pre-Boolean Checks
-            si_error = BooleanEngineV4._check_self_intersection(shape1, "Body")
-            if si_error:
-                return BooleanResult(
-                    status=ResultStatus.ERROR,
-                    message=si_error,
-                    operation_type=op_type
-                )
-            si_error = BooleanEngineV4._check_self_intersection(shape2, "Tool")
+            # 4a. Günstigste Stufe: AABB/OBB - Cut/Intersect ohne Berührung ist nie erfolgreich
+            with timer.stage("precheck_bbox"):
+                disjoint = BooleanEngineV4._shapes_disjoint(shape1, shape2, operation, fuzzy_tolerance)
+            if disjoint and operation != "Join":
+                return BooleanEngineV4._disjoint_result(operation)
+
+            # 4b. Pre-Boolean Checks (memoisiert pro Operand-Fingerprint)
+            with timer.stage("precheck_self_intersection"):
+                si_error = (BooleanEngineV4._check_self_intersection(shape1, "Body")
+                            or BooleanEngineV4._check_self_intersection(shape2, "Tool"))
             if si_error:
                 return BooleanResult(
                     status=ResultStatus.ERROR,
@@ -408,130 +770,495 @@ class BooleanEngineV4:
                     operation_type=op_type
                 )
 
-            arg_warning = BooleanEngineV4._analyze_boolean_arguments(shape1, shape2, fuzzy_tolerance)
+            with timer.stage("precheck_arguments"):
+                arg_warning = BooleanEngineV4._analyze_boolean_arguments(shape1, shape2, fuzzy_tolerance)
             if arg_warning:
                 logger.warning(f"Boolean Argument Analyse: {arg_warning}")
 
             # 5. Execute OCP Boolean
             logger.debug(f"Executing OCP Boolean {operation}...")
             result_shape, history, op = BooleanEngineV4._execute_ocp_boolean(
-                shape1, shape2, operation, fuzzy_tolerance
+                shape1, shape2, operation, fuzzy_tolerance, timer
             )
 
-            if result_shape is None:
-                if operation == "Intersect":
-                    return BooleanResult(
-                        status=ResultStatus.EMPTY,
-                        message="Intersect produzierte kein Ergebnis (keine Überlappung)",
-                        operation_type=op_type
-                    )
+            result = BooleanEngineV4._finalize_boolean(
+                shape1, shape2, result_shape, history, op,
+                operation, naming_service, feature_id, timer
+            )
+            # Nur speichern wenn die Operanden ungeändert in den Boolean gingen
+            if result.is_success and shape1 is raw1 and shape2 is raw2:
+                with timer.stage("memo_store"):
+                    BooleanResultCache.store(memo_key, shape1, shape2, result, timer.elapsed_ms())
+            return result
+
+        except Exception as e:
+            logger.error(f"❌ Boolean {operation} unexpected error: {e}")
+            import traceback
+            traceback.print_exc()
+            return BooleanResult(
+                status=ResultStatus.ERROR,
+                message=f"Unexpected error: {type(e).__name__}: {e}",
+                operation_type=op_type
+            )
+
+    @staticmethod
+    def execute_boolean_multi(
+        target: Any,
+        tools: List[Any],
+        operation: str,
+        fuzzy_tolerance: Optional[float] = None,
+        naming_service: Any = None,
+        feature_id: Optional[str] = None
+    ) -> BooleanResult:
+        """
+        Ein Boolean mit beliebig vielen Tools (shape-level API).
+
+        Statt N × execute_boolean_on_shapes() (N × Pre-Checks, Glue-Erkennung,
+        BRepCheck und History) laufen alle Tools durch EINEN
+        BRepAlgoAPI_Cut/Fuse/Common mit SetRunParallel:
+        - Pre-Checks einmal für das Target, pro Tool-TShape nur einmal
+          (instanzierte Tools teilen sich die TShape)
+        - Tools werden per Bounding-Box in unabhängige Gruppen zerlegt:
+          isolierte Tools landen gemeinsam in einem Compound, nur sich
+          überlappende Tools bleiben einzelne Argumente
+        - Cut/Intersect: Tools außerhalb der Target-BBox werden übersprungen
+        - Eine gemeinsame History für das TNP-Update
+
+        Args:
+            target: Body-Solid (Build123d Solid oder OCP TopoDS_Shape)
+            tools: Tool-Solids
+            operation: "Join", "Cut", or "Intersect" (Intersect = Schnitt mit
+                       der Vereinigung aller Tools)
+            fuzzy_tolerance: Override default tolerance
+            naming_service: Optional ShapeNamingService für TNP-Update
+            feature_id: Optional Feature ID für TNP-Update
+
+        Returns:
+            BooleanResult mit Build123d Solid als value, History und stage_timings
+        """
+        op_type = operation.lower()
+        if not HAS_OCP:
+            return BooleanResult(
+                status=ResultStatus.ERROR,
+                message="OpenCASCADE not available",
+                operation_type=op_type
+            )
+
+        VolumeCache.clear()
+
+        if fuzzy_tolerance is None:
+            fuzzy_tolerance = BooleanEngineV4.PRODUCTION_FUZZY_TOLERANCE
+
+        timer = _StageTimer()
+        return timer.attach(BooleanEngineV4._run_multi(
+            target, tools, operation, fuzzy_tolerance, naming_service, feature_id, timer
+        ))
+
+    @staticmethod
+    def _run_multi(
+        target: Any,
+        tools: List[Any],
+        operation: str,
+        fuzzy_tolerance: float,
+        naming_service: Any,
+        feature_id: Optional[str],
+        timer: _StageTimer
+    ) -> BooleanResult:
+        """Pipeline von execute_boolean_multi() (Stufen werden in timer gemessen)."""
+        op_type = operation.lower()
+
+        try:
+            if target is None or not tools or any(t is None for t in tools):
                 return BooleanResult(
                     status=ResultStatus.ERROR,
-                    message=f"Boolean {operation} failed: OpenCASCADE returned None",
+                    message=f"Boolean {operation}: Target oder Tools fehlen",
                     operation_type=op_type
                 )
 
-            # 6. Post-Boolean Validation + Healing
-            result_shape = BooleanEngineV4._validate_and_heal_result(result_shape, operation)
-            BooleanEngineV4._check_tolerances(result_shape, operation)
+            if operation not in ["Join", "Cut", "Intersect"]:
+                return BooleanResult(
+                    status=ResultStatus.ERROR,
+                    message=f"Unknown operation: {operation}",
+                    operation_type=op_type
+                )
+
+            raw1 = target.wrapped if hasattr(target, 'wrapped') else target
+            raw_tools = [tool.wrapped if hasattr(tool, 'wrapped') else tool for tool in tools]
+
+            # Ergebnis-Memo: Tools als ein Compound (Instanzen inkl. Location)
+            with timer.stage("memo_lookup"):
+                raw_compound = BooleanEngineV4._make_compound(raw_tools)
+                memo_key = BooleanResultCache.make_key(raw1, raw_compound, operation, fuzzy_tolerance)
+                cached = BooleanResultCache.lookup(memo_key)
+            if cached is not None:
+                memo_result = BooleanEngineV4._result_from_memo(
+                    cached, raw1, raw_compound, operation, naming_service, feature_id, timer
+                )
+                if memo_result is not None:
+                    return memo_result
 
-            # 7. Validate result shape
-            if not BooleanEngineV4._is_valid_shape(result_shape):
+            with timer.stage("fix"):
+                shape1 = BooleanEngineV4._fix_shape(raw1)
+            if shape1 is None:
                 return BooleanResult(
                     status=ResultStatus.ERROR,
-                    message=f"Boolean {operation} produced invalid geometry",
+                    message="Shape-Reparatur fehlgeschlagen",
                     operation_type=op_type
                 )
+            with timer.stage("precheck_self_intersection"):
+                si_error = BooleanEngineV4._check_self_intersection(shape1, "Body")
+            if si_error:
+                return BooleanResult(status=ResultStatus.ERROR, message=si_error, operation_type=op_type)
+
+            # Pre-Checks pro TShape (Location ignoriert) nur einmal
+            checked: Dict[int, List[Tuple[Any, Any]]] = {}
+            tool_shapes = []
+            for shape in raw_tools:
+                key = shape.Located(TopLoc_Location())
+                bucket = checked.setdefault(hash(key), [])
+                verdict = next((v for k, v in bucket if k.IsEqual(key)), None)
+                if verdict is None:
+                    with timer.stage("fix"):
+                        fixed = BooleanEngineV4._fix_shape(key)
+                    with timer.stage("precheck_self_intersection"):
+                        verdict = BooleanEngineV4._check_self_intersection(fixed, "Tool") or fixed
+                    bucket.append((key, verdict))
+                if isinstance(verdict, str):
+                    return BooleanResult(status=ResultStatus.ERROR, message=verdict, operation_type=op_type)
+                tool_shapes.append(verdict.Moved(shape.Location()))
+
+            with timer.stage("precheck_bbox"):
+                tool_args, n_groups, n_skipped = BooleanEngineV4._partition_tools(
+                    shape1, tool_shapes, operation, fuzzy_tolerance
+                )
+            if not tool_args:
+                return BooleanResult(
+                    status=ResultStatus.ERROR,
+                    message=f"Boolean {operation} produced no change (kein Tool berührt das Target)",
+                    operation_type=op_type
+                )
+            logger.debug(
+                f"Boolean {operation} multi: {len(tool_shapes)} Tools → {len(tool_args)} Argumente "
+                f"({n_groups} Gruppen, {n_skipped} übersprungen)"
+            )
 
-            # 8. Verify geometry actually changed
-            if not BooleanEngineV4._verify_geometry_changed(shape1, result_shape, operation):
+            result_shape, history, op = BooleanEngineV4._execute_ocp_boolean(
+                shape1, tool_args, operation, fuzzy_tolerance, timer
+            )
+            result = BooleanEngineV4._finalize_boolean(
+                shape1, BooleanEngineV4._make_compound(tool_args), result_shape, history, op,
+                operation, naming_service, feature_id, timer
+            )
+            unchanged = shape1 is raw1 and all(
+                fixed.IsPartner(raw) for fixed, raw in zip(tool_shapes, raw_tools)
+            )
+            if result.is_success and unchanged:
+                with timer.stage("memo_store"):
+                    BooleanResultCache.store(memo_key, raw1, raw_compound, result, timer.elapsed_ms())
+            return result
+
+        except Exception as e:
+            logger.error(f"❌ Boolean {operation} multi unexpected error: {e}")
+            import traceback
+            traceback.print_exc()
+            return BooleanResult(
+                status=ResultStatus.ERROR,
+                message=f"Unexpected error: {type(e).__name__}: {e}",
+                operation_type=op_type
+            )
+
+    @staticmethod
+    def _make_compound(shapes: List[Any]) -> Any:
+        """Compound aus Shapes (teilt TShapes, kopiert keine Geometrie)."""
+        compound = TopoDS_Compound()
+        builder = BRep_Builder()
+        builder.MakeCompound(compound)
+        for shape in shapes:
+            builder.Add(compound, shape)
+        return compound
+
+    @staticmethod
+    def _partition_tools(
+        target: Any,
+        tools: List[Any],
+        operation: str,
+        fuzzy_tolerance: float
+    ) -> Tuple[List[Any], int, int]:
+        """
+        Zerlegt Tools per Bounding-Box in unabhängige Gruppen.
+
+        Tools innerhalb eines Compound-Arguments werden vom Boolean nicht
+        gegeneinander verschnitten. Daher: alle isolierten Tools (BBox berührt
+        kein anderes Tool) → ein Compound, Tools mit Überlappung → einzelne
+        Argumente. Bei Cut/Intersect entfallen Tools außerhalb der Target-BBox.
+
+        Returns:
+            (Tool-Argumente, Anzahl Gruppen, Anzahl übersprungener Tools)
+        """
+        def bbox(shape):
+            box = Bnd_Box()
+            BRepBndLib.Add_s(shape, box)
+            box.Enlarge(fuzzy_tolerance)
+            return box.Get()
+
+        boxes = [bbox(t) for t in tools]
+        skipped = 0
+        if operation in ("Cut", "Intersect"):
+            tx0, ty0, tz0, tx1, ty1, tz1 = bbox(target)
+            keep = [
+                i for i, (x0, y0, z0, x1, y1, z1) in enumerate(boxes)
+                if x0 <= tx1 and tx0 <= x1 and y0 <= ty1 and ty0 <= y1 and z0 <= tz1 and tz0 <= z1
+            ]
+            skipped = len(tools) - len(keep)
+            tools = [tools[i] for i in keep]
+            boxes = [boxes[i] for i in keep]
+
+        # Sweep über X + Union-Find für überlappende BBoxen
+        parent = list(range(len(tools)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        order = sorted(range(len(tools)), key=lambda i: boxes[i][0])
+        active: List[int] = []
+        for i in order:
+            x0, y0, z0, x1, y1, z1 = boxes[i]
+            active = [j for j in active if boxes[j][3] >= x0]
+            for j in active:
+                bx0, by0, bz0, bx1, by1, bz1 = boxes[j]
+                if y0 <= by1 and by0 <= y1 and z0 <= bz1 and bz0 <= z1:
+                    parent[find(i)] = find(j)
+            active.append(i)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(tools)):
+            groups.setdefault(find(i), []).append(i)
+
+        isolated = [tools[g[0]] for g in groups.values() if len(g) == 1]
+        args = [tools[i] for g in groups.values() if len(g) > 1 for i in g]
+        if len(isolated) == 1:
+            args.append(isolated[0])
+        elif isolated:
+            args.append(BooleanEngineV4._make_compound(isolated))
+        return args, len(groups), skipped
+
+    @staticmethod
+    def _finalize_boolean(
+        shape1: Any,
+        shape2: Any,
+        result_shape: Any,
+        history: Any,
+        op: Any,
+        operation: str,
+        naming_service: Any = None,
+        feature_id: Optional[str] = None,
+        timer: Optional[_StageTimer] = None
+    ) -> BooleanResult:
+        """
+        Post-Boolean-Pipeline: Validierung, Healing, Wrap, TNP-Update.
+
+        Gemeinsam für execute_boolean_on_shapes() und execute_boolean_multi().
+        shape2 ist das Tool bzw. ein Compound aller Tools (nur für Detail-History).
+
+        Validierung gestuft: zuerst nur die Faces, die laut History verändert
+        oder neu erzeugt wurden. Nur wenn das nicht geht (keine History) oder
+        dort Fehler auftauchen, läuft der Voll-Check mit Auto-Healing.
+        """
+        op_type = operation.lower()
+        timer = timer or _StageTimer()
+
+        if result_shape is None:
+            if operation == "Intersect":
+                return BooleanResult(
+                    status=ResultStatus.EMPTY,
+                    message="Intersect produzierte kein Ergebnis (keine Überlappung)",
+                    operation_type=op_type
+                )
+            return BooleanResult(
+                status=ResultStatus.ERROR,
+                message=f"Boolean {operation} failed: OpenCASCADE returned None",
+                operation_type=op_type
+            )
+
+        # 6. Post-Boolean Validation: lokal (History), sonst Voll-Check + Healing
+        with timer.stage("validate"):
+            locally_valid = BooleanEngineV4._validate_changed_faces(result_shape, history, (shape1, shape2))
+            if not locally_valid:
+                result_shape = BooleanEngineV4._validate_and_heal_result(result_shape, operation)
+        with timer.stage("tolerances"):
+            BooleanEngineV4._check_tolerances(result_shape, operation)
+
+        # 7. Validate result shape (nur nötig wenn der lokale Check nicht gereicht hat)
+        if not locally_valid:
+            with timer.stage("validate"):
+                is_valid = BooleanEngineV4._is_valid_shape(result_shape)
+            if not is_valid:
                 return BooleanResult(
                     status=ResultStatus.ERROR,
-                    message=f"Boolean {operation} produced no change",
+                    message=f"Boolean {operation} produced invalid geometry",
                     operation_type=op_type
                 )
 
-            # 9. Wrap to Build123d Solid
-            from build123d import Solid, Shape
-            try:
-                result_solid = Solid(result_shape)
-            except Exception:
-                try:
-                    result_solid = Shape(result_shape)
-                except Exception as wrap_err:
-                    return BooleanResult(
-                        status=ResultStatus.ERROR,
-                        message=f"Wrap zu Build123d fehlgeschlagen: {wrap_err}",
-                        operation_type=op_type
-                    )
+        # 8. Verify geometry actually changed
+        with timer.stage("verify_change"):
+            changed = BooleanEngineV4._verify_geometry_changed(shape1, result_shape, operation)
+        if not changed:
+            return BooleanResult(
+                status=ResultStatus.ERROR,
+                message=f"Boolean {operation} produced no change",
+                operation_type=op_type
+            )
 
-            # 10. Validate wrapped result
-            if hasattr(result_solid, 'is_valid') and not result_solid.is_valid():
-                try:
-                    result_solid = result_solid.fix()
-                except Exception:
-                    pass
+        # 9. Wrap to Build123d Solid
+        from build123d import Solid, Shape
+        try:
+            result_solid = Solid(result_shape)
+        except Exception:
+            try:
+                result_solid = Shape(result_shape)
+            except Exception as wrap_err:
+                return BooleanResult(
+                    status=ResultStatus.ERROR,
+                    message=f"Wrap zu Build123d fehlgeschlagen: {wrap_err}",
+                    operation_type=op_type
+                )
 
-            # Check volume
+        # 10. Validate wrapped result (lokal valid → Operanden valid, keine neuen Fehler)
+        if locally_valid:
+            with timer.stage("validate"):
+                BooleanEngineV4._remember_valid_result(result_solid)
+        elif hasattr(result_solid, 'is_valid') and not result_solid.is_valid():
             try:
-                wrapped_vol = result_solid.volume
-                if wrapped_vol < 0.001:
-                    return BooleanResult(
-                        status=ResultStatus.ERROR,
-                        message=f"{operation} erzeugte leeres Ergebnis (Vol={wrapped_vol:.4f}mm³)",
-                        operation_type=op_type
-                    )
+                result_solid = result_solid.fix()
             except Exception:
                 pass
 
-            # TNP v4.1: History-basierte ShapeID-Aktualisierung
-            if naming_service is not None and history is not None and feature_id:
-                try:
-                    updated = naming_service.update_shape_ids_from_history(
-                        source_solid=shape1,
-                        result_solid=result_shape,
-                        occt_history=history,
-                        feature_id=feature_id,
-                        operation_type=f"boolean_{op_type}"
-                    )
-                    if is_enabled("tnp_debug_logging") and updated > 0:
-                        logger.success(f"  TNP: {updated} ShapeIDs nach {operation} aktualisiert")
-                except Exception as tnp_err:
-                    logger.warning(f"  TNP-Update fehlgeschlagen: {tnp_err}")
+        # Check volume
+        try:
+            wrapped_vol = (VolumeCache.get_volume(result_shape) if locally_valid
+                           else result_solid.volume)
+            if wrapped_vol < 0.001:
+                return BooleanResult(
+                    status=ResultStatus.ERROR,
+                    message=f"{operation} erzeugte leeres Ergebnis (Vol={wrapped_vol:.4f}mm³)",
+                    operation_type=op_type
+                )
+        except Exception:
+            pass
 
-            logger.success(f"✅ Boolean {operation} successful")
-            
-            # High-Priority TODO 2026: Extract detailed history for TNP
-            history_details = {}
-            if is_enabled("detailed_boolean_history"):
-                try:
+        # TNP v4.1: History-basierte ShapeID-Aktualisierung
+        BooleanEngineV4._update_naming(naming_service, shape1, result_shape, history,
+                                       feature_id, operation, timer)
+
+        logger.success(f"✅ Boolean {operation} successful")
+        
+        # High-Priority TODO 2026: Extract detailed history for TNP
+        history_details = {}
+        if is_enabled("detailed_boolean_history"):
+            try:
+                with timer.stage("history"):
                     history_details = BooleanEngineV4.extract_detailed_history(
                         bool_op=op,
                         source_shape=shape1,
                         tool_shape=shape2,
                         result_shape=result_shape
                     )
-                except Exception as hist_err:
-                    logger.debug(f"Detailed history extraction failed: {hist_err}")
+            except Exception as hist_err:
+                logger.debug(f"Detailed history extraction failed: {hist_err}")
 
-            return BooleanResult(
-                status=ResultStatus.SUCCESS,
-                value=result_solid,
-                message=f"Boolean {operation} completed successfully",
-                operation_type=op_type,
-                history=history,
-                history_details=history_details
-            )
+        return BooleanResult(
+            status=ResultStatus.SUCCESS,
+            value=result_solid,
+            message=f"Boolean {operation} completed successfully",
+            operation_type=op_type,
+            history=history,
+            history_details=history_details
+        )
 
-        except Exception as e:
-            logger.error(f"❌ Boolean {operation} unexpected error: {e}")
-            import traceback
-            traceback.print_exc()
-            return BooleanResult(
-                status=ResultStatus.ERROR,
-                message=f"Unexpected error: {type(e).__name__}: {e}",
-                operation_type=op_type
-            )
+    @staticmethod
+    def _update_naming(
+        naming_service: Any,
+        shape1: Any,
+        result_shape: Any,
+        history: Any,
+        feature_id: Optional[str],
+        operation: str,
+        timer: _StageTimer
+    ) -> None:
+        """TNP v4.1: ShapeIDs per OCCT-History auf das Ergebnis übertragen."""
+        if naming_service is None or history is None or not feature_id:
+            return
+        with timer.stage("tnp"):
+            try:
+                updated = naming_service.update_shape_ids_from_history(
+                    source_solid=shape1,
+                    result_solid=result_shape,
+                    occt_history=history,
+                    feature_id=feature_id,
+                    operation_type=f"boolean_{operation.lower()}"
+                )
+                if is_enabled("tnp_debug_logging") and updated > 0:
+                    logger.success(f"  TNP: {updated} ShapeIDs nach {operation} aktualisiert")
+            except Exception as tnp_err:
+                logger.warning(f"  TNP-Update fehlgeschlagen: {tnp_err}")
+
+    @staticmethod
+    def _result_from_memo(
+        entry: _MemoEntry,
+        shape1: Any,
+        shape2: Any,
+        operation: str,
+        naming_service: Any,
+        feature_id: Optional[str],
+        timer: _StageTimer
+    ) -> Optional[BooleanResult]:
+        """
+        BooleanResult aus einem Memo-Treffer, ohne OCP-Boolean.
+
+        Das Ergebnis wird kopiert (eigene TShapes pro Treffer), die History
+        auf Operanden und Kopie übertragen und die Kopie wie ein frisches
+        Ergebnis geprüft. Danach TNP-Update wie nach einem echten Boolean.
+        None → wie ein Cache-Miss behandeln.
+        """
+        with timer.stage("memo_replay"):
+            result_shape = BRepBuilderAPI_Copy(entry.result_shape).Shape()
+            history = entry.history_for(shape1, shape2, result_shape)
+        if history is None:
+            logger.debug(f"Boolean-Memo: History nicht übertragbar, {operation} läuft neu")
+            return None
+
+        # Kopie hat eigene TShapes → alle Faces gelten als geändert und werden geprüft
+        with timer.stage("validate"):
+            locally_valid = BooleanEngineV4._validate_changed_faces(result_shape, history, (shape1, shape2))
+        if not locally_valid:
+            logger.debug(f"Boolean-Memo: Ergebnis nicht valide, {operation} läuft neu")
+            return None
+
+        from build123d import Solid, Shape
+        try:
+            result_solid = Solid(result_shape)
+        except Exception:
+            result_solid = Shape(result_shape)
+        with timer.stage("validate"):
+            BooleanEngineV4._remember_valid_result(result_solid)
+
+        BooleanEngineV4._update_naming(naming_service, shape1, result_shape, history,
+                                       feature_id, operation, timer)
+        BooleanResultCache.record_hit(entry, timer.elapsed_ms())
+        logger.success(f"✅ Boolean {operation} successful (Memo)")
+
+        # Detail-History referenziert Hashes des gespeicherten Ergebnisses, nicht der Kopie
+        return BooleanResult(
+            status=ResultStatus.SUCCESS,
+            value=result_solid,
+            message=f"Boolean {operation} completed successfully (memo)",
+            operation_type=operation.lower(),
+            history=history,
+            history_details={}
+        )
 
     @staticmethod
     def execute_boolean(
@@ -640,6 +1367,82 @@ class BooleanEngineV4:
 
         return None
 
+    @staticmethod
+    def _aabb_relation(shape1: Any, shape2: Any, tol: float) -> str:
+        """
+        Lage zweier achsparalleler Bounding-Boxen zueinander.
+
+        Returns:
+            "disjoint"    - in mindestens einer Achse Abstand > tol
+            "overlapping" - Überlappung > tol in allen 3 Achsen
+            "touching"    - sonst (BBoxen berühren sich nur)
+        """
+        b1 = VolumeCache.get_bbox(shape1)
+        b2 = VolumeCache.get_bbox(shape2)
+        overlapping = True
+        for axis in range(3):
+            lo1, hi1, lo2, hi2 = b1[axis], b1[axis + 3], b2[axis], b2[axis + 3]
+            if lo1 > hi2 + tol or lo2 > hi1 + tol:
+                return "disjoint"
+            if not ((lo1 + tol) < hi2 and (lo2 + tol) < hi1):
+                overlapping = False
+        return "overlapping" if overlapping else "touching"
+
+    @staticmethod
+    def _shapes_disjoint(shape1: Any, shape2: Any, operation: str, fuzzy_tolerance: float) -> bool:
+        """
+        Günstigste Pre-Check-Stufe: Können sich die Operanden überhaupt berühren?
+
+        1. AABB (VolumeCache, Mikrosekunden)
+        2. Nur Cut/Intersect bei AABB-Überlappung: orientierte Bounding-Boxen.
+           Fängt gedrehte/schlanke Tools ab, deren AABB den Body schneidet,
+           die aber am Body vorbeigehen. Bei Join wäre das Ergebnis ohnehin nötig.
+
+        Returns:
+            True wenn die Shapes sicher mehr als fuzzy_tolerance auseinander liegen
+        """
+        if BooleanEngineV4._aabb_relation(shape1, shape2, fuzzy_tolerance) == "disjoint":
+            return True
+        if operation == "Join":
+            return False
+        obb1 = BooleanEngineV4._oriented_box(shape1, fuzzy_tolerance)
+        obb2 = BooleanEngineV4._oriented_box(shape2, fuzzy_tolerance)
+        if obb1 is None or obb2 is None:
+            return False
+        return obb1.IsOut(obb2)
+
+    @staticmethod
+    def _oriented_box(shape: Any, tol: float) -> Optional[Any]:
+        """Um tol vergrößerte Bnd_OBB, memoisiert pro Shape (None wenn nicht berechenbar)."""
+        def compute():
+            try:
+                obb = Bnd_OBB()
+                BRepBndLib.AddOBB_s(shape, obb, False, False, True)
+                if obb.IsVoid():
+                    return None
+                obb.Enlarge(tol)
+                return obb
+            except Exception as e:
+                logger.debug(f"OBB-Berechnung fehlgeschlagen: {e}")
+                return None
+
+        key = shape_key(shape)
+        return PrecheckCache.lookup(("obb", key, tol) if key is not None else None, compute)
+
+    @staticmethod
+    def _disjoint_result(operation: str) -> BooleanResult:
+        """Ergebnis für Cut/Intersect mit Operanden ohne Berührung (ohne OCP-Boolean)."""
+        logger.warning(f"⚠️ {operation} übersprungen: Tool berührt den Body nicht (Bounding-Box-Test)")
+        if operation == "Intersect":
+            message = "Intersect erzeugte leeres Ergebnis (keine Überlappung)"
+        else:
+            message = f"Boolean {operation} produced no change (Tool berührt den Body nicht)"
+        return BooleanResult(
+            status=ResultStatus.ERROR,
+            message=message,
+            operation_type=operation.lower()
+        )
+
     @staticmethod
     def _detect_glue_mode(shape1: Any, shape2: Any, fuzzy_tolerance: float) -> Optional[Any]:
         """
@@ -649,19 +1452,23 @@ class BooleanEngineV4:
         anliegenden/zusammenfallenden Faces verwendet werden - NICHT bei
         echten Intersections (wo Shapes sich durchdringen).
 
-        Erkennung:
-        1. BRepExtrema_DistShapeShape: Shapes berühren sich (Distanz ~0)?
-        2. BBox-Overlap-Check: Durchdringen sich die Shapes (echte Intersection)?
-           - Wenn BBoxen sich in allen 3 Achsen überlappen → echte Intersection → KEIN Glue
-           - Wenn BBoxen nur berühren (touch) → coinciding Faces → GlueShift OK
+        Erkennung (günstigste Stufe zuerst):
+        1. BBox-Check:
+           - BBoxen getrennt → keine Berührung → KEIN Glue
+           - BBoxen überlappen in allen 3 Achsen → echte Intersection → KEIN Glue
+           - BBoxen berühren sich nur → weiter mit 2.
+        2. BRepExtrema_DistShapeShape: Distanz ~0 mit Face-Kontakt → GlueShift
 
         Returns:
             BOPAlgo_GlueShift wenn coinciding Faces erkannt, None sonst
         """
         try:
             from OCP.BRepExtrema import BRepExtrema_DistShapeShape
-            from OCP.Bnd import Bnd_Box
-            from OCP.BRepBndLib import BRepBndLib
+
+            relation = BooleanEngineV4._aabb_relation(shape1, shape2, fuzzy_tolerance)
+            if relation != "touching":
+                logger.debug(f"Kein GlueShift: BBoxen {relation}")
+                return None
 
             dist_calc = BRepExtrema_DistShapeShape(shape1, shape2)
             if not dist_calc.IsDone():
@@ -674,29 +1481,6 @@ class BooleanEngineV4:
                 n_solutions = dist_calc.NbSolution()
                 # Viele Kontaktpunkte = Face-Kontakt (nicht nur Kante/Punkt)
                 if n_solutions >= 4:
-                    # Zusätzlicher Check: Durchdringen sich die Shapes?
-                    # BBox-Overlap in allen 3 Achsen = echte Intersection → KEIN Glue
-                    bbox1 = Bnd_Box()
-                    bbox2 = Bnd_Box()
-                    BRepBndLib.Add_s(shape1, bbox1)
-                    BRepBndLib.Add_s(shape2, bbox2)
-
-                    xmin1, ymin1, zmin1, xmax1, ymax1, zmax1 = bbox1.Get()
-                    xmin2, ymin2, zmin2, xmax2, ymax2, zmax2 = bbox2.Get()
-
-                    tol = fuzzy_tolerance
-                    # Overlap = min > max + tolerance in jeder Achse
-                    x_overlap = (xmin1 + tol) < xmax2 and (xmin2 + tol) < xmax1
-                    y_overlap = (ymin1 + tol) < ymax2 and (ymin2 + tol) < ymax1
-                    z_overlap = (zmin1 + tol) < zmax2 and (zmin2 + tol) < zmax1
-
-                    if x_overlap and y_overlap and z_overlap:
-                        logger.debug(
-                            f"Kein GlueShift: BBoxen überlappen in allen 3 Achsen "
-                            f"(echte Intersection, {n_solutions} Kontaktpunkte)"
-                        )
-                        return None
-
                     logger.info(
                         f"GlueShift erkannt: {n_solutions} Kontaktpunkte bei "
                         f"Distanz={min_dist:.6f}mm, BBoxen berühren sich nur → "
@@ -715,7 +1499,8 @@ class BooleanEngineV4:
         shape1: Any,
         shape2: Any,
         operation: str,
-        fuzzy_tolerance: float
+        fuzzy_tolerance: float,
+        timer: Optional[_StageTimer] = None
     ) -> Tuple[Optional[Any], Optional[Any], Optional[Any]]:
         """
         Execute OpenCASCADE Boolean operation with robust settings.
@@ -726,15 +1511,18 @@ class BooleanEngineV4:
 
         Args:
             shape1: OCP TopoDS_Shape (target)
-            shape2: OCP TopoDS_Shape (tool)
+            shape2: OCP TopoDS_Shape (tool) oder Liste von Tools (ein Multi-Tool-Boolean)
             operation: "Join", "Cut", or "Intersect"
             fuzzy_tolerance: Fuzzy value for robustness
+            timer: Optional _StageTimer (Stufen "glue_detection" und "boolean")
 
         Returns:
             (result_shape, history, bool_op) or (None, None, None) on failure
         """
+        timer = timer or _StageTimer()
         try:
-            logger.debug(f"OCP Boolean {operation}: shape1 type={type(shape1).__name__}, shape2 type={type(shape2).__name__}")
+            tools = list(shape2) if isinstance(shape2, (list, tuple)) else [shape2]
+            logger.debug(f"OCP Boolean {operation}: shape1 type={type(shape1).__name__}, {len(tools)} Tool(s)")
             logger.debug(f"  Fuzzy tolerance: {fuzzy_tolerance}")
 
             if operation.lower() in ["join", "fuse"]:
@@ -751,7 +1539,8 @@ class BooleanEngineV4:
             args_list.Append(shape1)
 
             tools_list = TopTools_ListOfShape()
-            tools_list.Append(shape2)
+            for tool in tools:
+                tools_list.Append(tool)
 
             op.SetArguments(args_list)
             op.SetTools(tools_list)
@@ -760,11 +1549,14 @@ class BooleanEngineV4:
             op.SetRunParallel(True)
 
             # Intelligente Glue-Erkennung: coinciding Faces → GlueShift (~90% schneller)
-            glue_mode = BooleanEngineV4._detect_glue_mode(shape1, shape2, fuzzy_tolerance)
+            with timer.stage("glue_detection"):
+                glue_mode = (BooleanEngineV4._detect_glue_mode(shape1, tools[0], fuzzy_tolerance)
+                             if len(tools) == 1 else None)
             if glue_mode is not None:
                 op.SetGlue(glue_mode)
 
-            op.Build()
+            with timer.stage("boolean"):
+                op.Build()
             logger.debug("  Boolean operation built with Phase 3 settings")
 
             is_done = op.IsDone()
@@ -824,15 +1616,7 @@ class BooleanEngineV4:
         Returns:
             True if shape is valid
         """
-        if shape is None:
-            return False
-
-        try:
-            analyzer = BRepCheck_Analyzer(shape)
-            return analyzer.IsValid()
-        except Exception as e:
-            logger.debug(f"[boolean_engine_v4.py] Fehler: {e}")
-            return False
+        return check_shape(shape, ValidationTier.FULL)
 
     @staticmethod
     def _verify_geometry_changed(
@@ -931,6 +1715,8 @@ class BooleanEngineV4:
 
         Self-Intersections verursachen Boolean-Crashes oder kaputte Ergebnisse.
         Dieser Pre-Check erkennt das Problem VOR der Boolean-Operation.
+        Das Urteil wird pro Shape memoisiert (PrecheckCache, ShapeKey). Shapes,
+        die der Validation-Service als selbstschnittfrei kennt, werden nicht geprüft.
 
         Args:
             shape: OCP TopoDS_Shape
@@ -939,6 +1725,36 @@ class BooleanEngineV4:
         Returns:
             Fehlermeldung wenn Self-Intersection gefunden, None wenn OK
         """
+        key = shape_key(shape)
+        if key is not None and known_self_intersection_free(key):
+            logger.debug(f"  {name} Self-Intersection Check: per Konstruktion OK")
+            return None
+        has_errors = PrecheckCache.lookup(
+            ("self_intersection", key) if key is not None else None,
+            lambda: BooleanEngineV4._run_checker_si(shape)
+        )
+
+        if has_errors:
+            logger.warning(f"⚠️ {name} hat Self-Intersection(s)!")
+            return (
+                f"{name} hat Self-Intersections.\n"
+                f"→ Boolean-Operation kann fehlschlagen oder kaputte Geometrie erzeugen.\n"
+                f"→ Geometrie prüfen und reparieren."
+            )
+
+        if has_errors is not None:
+            logger.debug(f"  {name} Self-Intersection Check: OK")
+        return None
+
+    @staticmethod
+    def _run_checker_si(shape: Any) -> Optional[bool]:
+        """
+        BOPAlgo_CheckerSI ohne Memo.
+
+        Returns:
+            True bei Self-Intersection, False wenn OK, None wenn der Check
+            nicht verfügbar ist oder fehlschlägt (nicht blockieren)
+        """
         try:
             from OCP.BOPAlgo import BOPAlgo_CheckerSI
 
@@ -948,17 +1764,7 @@ class BooleanEngineV4:
             checker.SetArguments(args)
             checker.SetNonDestructive(True)  # Shape nicht modifizieren
             checker.Perform()
-
-            if checker.HasErrors():
-                logger.warning(f"⚠️ {name} hat Self-Intersection(s)!")
-                return (
-                    f"{name} hat Self-Intersections.\n"
-                    f"→ Boolean-Operation kann fehlschlagen oder kaputte Geometrie erzeugen.\n"
-                    f"→ Geometrie prüfen und reparieren."
-                )
-
-            logger.debug(f"  {name} Self-Intersection Check: OK")
-            return None
+            return bool(checker.HasErrors())
 
         except AttributeError:
             # BOPAlgo_CheckerSI nicht verfügbar in dieser OCP-Version
@@ -976,6 +1782,7 @@ class BooleanEngineV4:
 
         Erkennt: überlappende Faces, zu kleine Shapes, inkonsistente Toleranzen.
         Gibt klare Fehlermeldung statt kryptischem Boolean-Crash.
+        Das Urteil wird pro (Shape1, Shape2, Toleranz) memoisiert.
 
         Args:
             shape1: Body shape
@@ -985,6 +1792,29 @@ class BooleanEngineV4:
         Returns:
             Fehlermeldung wenn Probleme gefunden, None wenn OK
         """
+        key1 = shape_key(shape1)
+        key2 = shape_key(shape2)
+        key = (("arguments", key1, key2, fuzzy_tolerance)
+               if key1 is not None and key2 is not None else None)
+        has_faulty = PrecheckCache.lookup(
+            key, lambda: BooleanEngineV4._run_argument_analyzer(shape1, shape2, fuzzy_tolerance)
+        )
+
+        if has_faulty:
+            logger.warning("⚠️ Boolean-Input Analyse: Probleme erkannt!")
+            return (
+                f"Boolean-Inputs haben Kompatibilitätsprobleme.\n"
+                f"→ Geometrien können nicht sauber verschnitten werden.\n"
+                f"→ Shapes vereinfachen oder Positionierung prüfen."
+            )
+
+        if has_faulty is not None:
+            logger.debug("  Boolean Argument Analysis: OK")
+        return None
+
+    @staticmethod
+    def _run_argument_analyzer(shape1: Any, shape2: Any, fuzzy_tolerance: float) -> Optional[bool]:
+        """BOPAlgo_ArgumentAnalyzer ohne Memo (True = Probleme, None = nicht prüfbar)."""
         try:
             from OCP.BOPAlgo import BOPAlgo_ArgumentAnalyzer
 
@@ -993,17 +1823,7 @@ class BooleanEngineV4:
             analyzer.SetShape2(shape2)
             analyzer.SetFuzzyValue(fuzzy_tolerance)
             analyzer.Perform()
-
-            if analyzer.HasFaulty():
-                logger.warning("⚠️ Boolean-Input Analyse: Probleme erkannt!")
-                return (
-                    f"Boolean-Inputs haben Kompatibilitätsprobleme.\n"
-                    f"→ Geometrien können nicht sauber verschnitten werden.\n"
-                    f"→ Shapes vereinfachen oder Positionierung prüfen."
-                )
-
-            logger.debug("  Boolean Argument Analysis: OK")
-            return None
+            return bool(analyzer.HasFaulty())
 
         except AttributeError:
             logger.debug("BOPAlgo_ArgumentAnalyzer nicht verfügbar, überspringe")
@@ -1012,6 +1832,65 @@ class BooleanEngineV4:
             logger.debug(f"Boolean Argument Analysis fehlgeschlagen: {e}")
             return None
 
+    @staticmethod
+    def _validate_changed_faces(result_shape: Any, history: Any, inputs: Tuple[Any, ...]) -> bool:
+        """
+        Günstige Post-Check-Stufe: BRepCheck nur auf Faces, die laut History
+        verändert (Modified) oder neu erzeugt (Generated) wurden.
+
+        Unveränderte Faces stammen aus den bereits geprüften Operanden.
+        Zusätzlich müssen alle Shells geschlossen sein (kantenbasiert, billig).
+
+        Returns:
+            True wenn die lokale Prüfung reicht; False wenn keine History
+            vorliegt oder ein Fehler gefunden wurde (→ Voll-Check)
+        """
+        if history is None or result_shape is None:
+            return False
+        try:
+            changed = TopTools_IndexedMapOfShape()
+            for source in inputs:
+                explorer = TopExp_Explorer(source, TopAbs_FACE)
+                while explorer.More():
+                    face = explorer.Current()
+                    for produced in (history.Modified(face), history.Generated(face)):
+                        if produced.Size() == 0:
+                            continue  # Iteration über OCP-Listen ist in Python teuer
+                        for shape in produced:
+                            if shape.ShapeType() == TopAbs_FACE:
+                                changed.Add(shape)
+                    explorer.Next()
+
+            if not check_faces(changed.FindKey(i) for i in range(1, changed.Extent() + 1)):
+                logger.debug("  Lokaler Post-Check: ungültige Face → Voll-Check")
+                return False
+
+            shells = TopTools_IndexedMapOfShape()
+            TopExp.MapShapes_s(result_shape, TopAbs_SHELL, shells)
+            for i in range(1, shells.Extent() + 1):
+                if not BRep_Tool.IsClosed_s(shells.FindKey(i)):
+                    logger.debug("  Lokaler Post-Check: offene Shell → Voll-Check")
+                    return False
+
+            logger.debug(f"  Lokaler Post-Check: {changed.Extent()} geänderte Faces valid")
+            return True
+
+        except Exception as e:
+            logger.debug(f"Lokaler Post-Check fehlgeschlagen: {e}")
+            return False
+
+    @staticmethod
+    def _remember_valid_result(result_solid: Any) -> None:
+        """
+        Merkt sich ein lokal validiertes Ergebnis auf SUBSHAPES-Stufe.
+
+        Geänderte/neue Faces sind geprüft, unveränderte stammen aus den
+        Operanden (vor dem Boolean per _fix_shape geprüft), alle Shells sind
+        geschlossen - das ist genau SUBSHAPES. Für FULL und CheckerSI ist
+        das keine Aussage über das ganze Shape; die laufen bei Bedarf selbst.
+        """
+        mark_valid(result_solid, ValidationTier.SUBSHAPES)
+
     @staticmethod
     def _validate_and_heal_result(result_shape: Any, operation: str) -> Any:
         """
@@ -1031,9 +1910,7 @@ class BooleanEngineV4:
             BooleanOperationError wenn Shape irreparabel kaputt
         """
         try:
-            analyzer = BRepCheck_Analyzer(result_shape)
-
-            if analyzer.IsValid():
+            if check_shape(result_shape, ValidationTier.FULL):
                 logger.debug(f"  Post-Boolean Validation: Shape ist valid")
                 return result_shape
 
@@ -1043,10 +1920,10 @@ class BooleanEngineV4:
             fixer = ShapeFix_Shape(result_shape)
             fixer.Perform()
             healed_shape = fixer.Shape()
+            forget_shape(result_shape)
 
-            # Nochmal prüfen
-            analyzer2 = BRepCheck_Analyzer(healed_shape)
-            if analyzer2.IsValid():
+            # Nochmal prüfen (ungecacht: frisch repariert)
+            if check_shape(healed_shape, ValidationTier.FULL, cache=False):
                 logger.success(f"✅ ShapeFix hat Boolean-Ergebnis repariert")
                 return healed_shape
             else:
@@ -19,7 +19,6 @@ from loguru import logger
 
 # OCP imports
 from OCP.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
-from OCP.BRepCheck import BRepCheck_Analyzer
 from OCP.TopAbs import TopAbs_FACE, TopAbs_EDGE, TopAbs_WIRE, TopAbs_SHELL, TopAbs_SOLID
 from OCP.TopExp import TopExp, TopExp_Explorer
 from OCP.TopTools import TopTools_IndexedMapOfShape, TopTools_ListOfShape
@@ -36,6 +35,7 @@ from OCP.BRepPrimAPI import BRepPrimAPI_MakeCylinder
 
 from modeling.result_types import OperationResult, ResultStatus
 from modeling.brep_face_analyzer import AnalysisResult, DetectedFeature, FeatureType
+from modeling.shape_validation import ValidationTier, check_shape, forget_shape
 
 try:
     from build123d import Solid
@@ -183,16 +183,15 @@ class CylinderSurfaceFitter:
                 return OperationResult.error("Surface Fitting: Rebuild fehlgeschlagen")
 
             # Validierung
-            analyzer = BRepCheck_Analyzer(result_shape)
-            if not analyzer.IsValid():
+            if not check_shape(result_shape, ValidationTier.FULL):
                 logger.warning("Surface Fitting: Shape ungueltig, versuche Reparatur...")
                 fixer = ShapeFix_Shape(result_shape)
                 fixer.SetPrecision(self.LINEAR_TOLERANCE)
                 fixer.Perform()
+                forget_shape(result_shape)
                 result_shape = fixer.Shape()
 
-                analyzer2 = BRepCheck_Analyzer(result_shape)
-                if not analyzer2.IsValid():
+                if not check_shape(result_shape, ValidationTier.FULL, cache=False):
                     return OperationResult.error("Surface Fitting: Shape konnte nicht repariert werden")
 
             # Face-Count nachher
@@ -674,19 +673,17 @@ class BRepFaceMerger:
         """
         try:
             # BRepCheck Analyzer
-            analyzer = BRepCheck_Analyzer(shape)
-
-            if not analyzer.IsValid():
+            if not check_shape(shape, ValidationTier.FULL):
                 # Versuche zu reparieren
                 logger.warning("Shape nach Merge ungueltig, versuche Reparatur...")
 
                 fixer = ShapeFix_Shape(shape)
                 fixer.SetPrecision(self.LINEAR_TOLERANCE)
                 fixer.Perform()
+                forget_shape(shape)
                 fixed = fixer.Shape()
 
-                analyzer2 = BRepCheck_Analyzer(fixed)
-                if not analyzer2.IsValid():
+                if not check_shape(fixed, ValidationTier.FULL, cache=False):
                     return OperationResult.error(
                         "Shape nach Merge ungueltig und konnte nicht repariert werden"
                     )
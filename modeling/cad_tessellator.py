@@ -6,6 +6,9 @@ FIX: Echte B-Rep Kanten statt Tessellations-Kanten
 FIX: Transform invalidiert jetzt auch ocp_tessellate Cache
 VERSION: 4 - Cache wird bei Version-Änderung geleert
 Phase 5: Zentralisierte Toleranzen
+PERFORMANCE: Location-invarianter Cache - Meshes werden im lokalen Frame
+(TopLoc_Location entfernt) gecacht und bei Move/Rotate/Mirror per 4x4-Matrix
+in NumPy platziert statt neu tesselliert.
 """
 import numpy as np
 import pyvista as pv
@@ -19,6 +22,7 @@ from config.tolerances import Tolerances  # Phase 5: Zentralisierte Toleranzen
 from config.feature_flags import is_enabled
 from collections import OrderedDict  # PERFORMANCE: O(1) LRU operations
 from modeling.ocp_thread_guard import ensure_ocp_main_thread
+from modeling.shape_fingerprint import shape_fingerprint
 from modeling.topology_indexing import iter_faces_with_indices
 
 # VERSION für Cache-Invalidierung - ERHÖHEN bei Änderungen!
@@ -43,11 +47,48 @@ try:
     from OCP.TopAbs import TopAbs_EDGE
     from OCP.BRepAdaptor import BRepAdaptor_Curve
     from OCP.GCPnts import GCPnts_TangentialDeflection
+    from OCP.TopLoc import TopLoc_Location
     HAS_OCP = True
 except ImportError:
     pass
 
 
+def _trsf_matrix(trsf) -> np.ndarray:
+    """gp_Trsf → 4x4-Matrix (inkl. Skalierung)."""
+    matrix = np.eye(4)
+    for row in range(3):
+        for col in range(4):
+            matrix[row, col] = trsf.Value(row + 1, col + 1)
+    return matrix
+
+
+def _transform_polydata(poly: pv.PolyData, matrix: np.ndarray) -> pv.PolyData:
+    """
+    Platziert ein gecachtes Mesh per 4x4-Matrix (flache Kopie, Cache bleibt unverändert).
+
+    Normalen werden mit der inversen Transponierten transformiert. Bei
+    Spiegelungen (det < 0) wird die Dreiecks-Orientierung umgedreht, damit
+    die Faces nach außen zeigen.
+    """
+    linear = matrix[:3, :3]
+    placed = poly.copy(deep=False)
+    # Eigenes vtkPoints-Objekt - der points-Setter würde die geteilten Daten überschreiben
+    placed.SetPoints(pv.vtk_points(
+        (np.asarray(poly.points, dtype=np.float64) @ linear.T + matrix[:3, 3]).astype(np.float32)))
+
+    if "Normals" in poly.point_data:
+        normals = np.asarray(poly.point_data["Normals"], dtype=np.float64) @ np.linalg.inv(linear)
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        placed.point_data["Normals"] = (normals / np.where(lengths > 0, lengths, 1.0)).astype(np.float32)
+
+    faces = np.asarray(poly.faces)
+    if np.linalg.det(linear) < 0 and faces.size and faces.size % 4 == 0:
+        tris = faces.reshape(-1, 4)
+        if np.all(tris[:, 0] == 3):
+            placed.faces = tris[:, [0, 1, 3, 2]].ravel()
+    return placed
+
+
 class CADTessellator:
     """
     Singleton-ähnlicher Manager für Tessellierung.
@@ -79,6 +120,15 @@ class CADTessellator:
     _export_cache_access_order = OrderedDict()
     MAX_EXPORT_CACHE_ENTRIES = 50  # Kleinerer Cache da Export-Meshes meist größer sind
 
+    # PERFORMANCE: Face-ID-Cache für die Body-Anzeige (lokaler Frame)
+    _face_id_cache = {}  # { "localhash_quality_faceids_version": (mesh, edges, face_info) }
+    _face_id_cache_access_order = OrderedDict()
+    MAX_FACE_ID_CACHE_ENTRIES = 50
+
+    # Gespiegelte/skalierte Kopien: { lokaler Key: (lokaler Key der Quelle, 4x4 Quelle → Kopie) }
+    _derived_sources = OrderedDict()
+    MAX_DERIVED_SOURCES = 256
+
     @staticmethod
     def clear_cache():
         """
@@ -95,6 +145,9 @@ class CADTessellator:
             CADTessellator._cache_access_order.clear()
             CADTessellator._edge_cache_access_order.clear()  # PERFORMANCE: Phase 4
             CADTessellator._export_cache_access_order.clear()  # PERFORMANCE: Phase 6
+            CADTessellator._face_id_cache.clear()
+            CADTessellator._face_id_cache_access_order.clear()
+            CADTessellator._derived_sources.clear()
             CADTessellator._cache_cleared = True
         logger.info(f"CADTessellator Cache komplett geleert (Version {_TESSELLATOR_VERSION})")
 
@@ -106,7 +159,8 @@ class CADTessellator:
         werden automatisch nicht mehr getroffen. Diese Methode triggert nur
         LRU-Eviction wenn der Cache zu groß wird.
         """
-        if len(CADTessellator._mesh_cache) > CADTessellator.MAX_CACHE_ENTRIES:
+        if (len(CADTessellator._mesh_cache) > CADTessellator.MAX_CACHE_ENTRIES or
+                len(CADTessellator._face_id_cache) > CADTessellator.MAX_FACE_ID_CACHE_ENTRIES):
             CADTessellator._evict_lru()
 
     @staticmethod
@@ -125,7 +179,13 @@ class CADTessellator:
             old_edge_key, _ = CADTessellator._edge_cache_access_order.popitem(last=False)
             CADTessellator._edge_cache.pop(old_edge_key, None)
 
-        logger.debug(f"LRU-Eviction: Mesh={len(CADTessellator._mesh_cache)}, Edge={len(CADTessellator._edge_cache)}")
+        face_id_target = CADTessellator.MAX_FACE_ID_CACHE_ENTRIES * 3 // 4
+        while len(CADTessellator._face_id_cache) > face_id_target and CADTessellator._face_id_cache_access_order:
+            old_key, _ = CADTessellator._face_id_cache_access_order.popitem(last=False)
+            CADTessellator._face_id_cache.pop(old_key, None)
+
+        logger.debug(f"LRU-Eviction: Mesh={len(CADTessellator._mesh_cache)}, Edge={len(CADTessellator._edge_cache)}, "
+                     f"FaceIDs={len(CADTessellator._face_id_cache)}")
 
     @staticmethod
     def clear_cache_for_shape(shape_id: int):
@@ -398,6 +458,98 @@ class CADTessellator:
         else:
             CADTessellator._topology_cache.clear()
 
+    @staticmethod
+    def _local_frame(solid):
+        """
+        Zerlegt ein Solid in (lokales Solid ohne TopLoc_Location, lokaler
+        Geometrie-Key, Platzierung als 4x4-Matrix oder None bei Identität).
+
+        Move/Rotate setzen nur die Location, die TShape bleibt geteilt →
+        gleicher lokaler Key, das gecachte Mesh wird nur platziert.
+        Ohne Fingerprint: weltbasierter Hash ohne Platzierung (altes Verhalten).
+        """
+        ocp_shape = solid.wrapped
+        location = ocp_shape.Location()
+        if location.IsIdentity():
+            local_solid, placement = solid, None
+        else:
+            from build123d import Compound, Solid
+            from OCP.TopAbs import TopAbs_SOLID
+
+            local_shape = ocp_shape.Located(TopLoc_Location())
+            local_solid = Solid(local_shape) if local_shape.ShapeType() == TopAbs_SOLID else Compound(local_shape)
+            placement = _trsf_matrix(location.Transformation())
+
+        fp = shape_fingerprint(local_solid.wrapped)
+        if fp is None:
+            return solid, CADTessellator._get_geometry_hash(solid), None
+        return local_solid, hash(fp), placement
+
+    @staticmethod
+    def _lookup_local(cache, access_order, make_key, local_key):
+        """
+        Sucht einen Eintrag für den lokalen Key, sonst über eine registrierte
+        Quelle (Spiegelung/Skalierung). Aufrufer hält _cache_lock.
+
+        Returns:
+            (Eintrag oder None, 4x4 Quelle → lokaler Frame oder None)
+        """
+        key = make_key(local_key)
+        if key in cache:
+            access_order.move_to_end(key)
+            return cache[key], None
+
+        derived = CADTessellator._derived_sources.get(local_key)
+        if derived is not None:
+            source_key = make_key(derived[0])
+            if source_key in cache:
+                access_order.move_to_end(source_key)
+                return cache[source_key], derived[1]
+        return None, None
+
+    @staticmethod
+    def _combine(placement, derived):
+        """Gesamtmatrix Cache-Frame → Welt (None = Identität)."""
+        if derived is None:
+            return placement
+        return derived if placement is None else placement @ derived
+
+    @staticmethod
+    def _place(poly, matrix):
+        if poly is None or matrix is None:
+            return poly
+        return _transform_polydata(poly, matrix)
+
+    @staticmethod
+    def register_transformed(source, result, trsf) -> None:
+        """
+        Meldet result = trsf · source für Transforms, die neue Geometrie
+        erzeugen (Spiegeln, Skalieren). Die Tessellierung platziert dann das
+        gecachte Mesh der Quelle, statt result neu zu tessellieren.
+
+        Rigide Transforms brauchen das nicht - sie teilen die TShape.
+        """
+        try:
+            _, source_key, source_placement = CADTessellator._local_frame(source)
+            _, result_key, result_placement = CADTessellator._local_frame(result)
+        except Exception as e:
+            logger.debug(f"Transform-Registrierung fehlgeschlagen: {e}")
+            return
+        if source_key == result_key:
+            return
+
+        matrix = _trsf_matrix(trsf)
+        if source_placement is not None:
+            matrix = matrix @ source_placement
+        if result_placement is not None:
+            matrix = np.linalg.inv(result_placement) @ matrix
+
+        with CADTessellator._cache_lock:
+            CADTessellator._derived_sources[result_key] = (source_key, matrix)
+            CADTessellator._derived_sources.move_to_end(result_key)
+            while len(CADTessellator._derived_sources) > CADTessellator.MAX_DERIVED_SOURCES:
+                CADTessellator._derived_sources.popitem(last=False)
+
     @staticmethod
     def _compute_adaptive_deflection(solid) -> float:
         """
@@ -445,6 +597,8 @@ class CADTessellator:
         Phase 4.3: Optimiert mit Topology-Caching.
         Phase 5: Verwendet zentralisierte Toleranzen.
         OCP Feature Audit: Adaptive Tessellation (proportional zur Modellgröße).
+        PERFORMANCE: Cache-Key ohne TopLoc_Location - verschobene/gedrehte
+        Bodies bekommen das gecachte Mesh per Matrix platziert.
 
         Args:
             solid: Build123d Solid
@@ -456,102 +610,69 @@ class CADTessellator:
 
         ensure_ocp_main_thread("tessellate solid")
 
+        # PERFORMANCE: Tesselliert wird im lokalen Frame, die Location nur angewendet
+        local_solid, shape_hash, placement = CADTessellator._local_frame(solid)
+
         # OCP Feature Audit: Adaptive Deflection basierend auf Modellgröße
         if quality is None:
             if is_enabled("adaptive_tessellation"):
-                quality = CADTessellator._compute_adaptive_deflection(solid)
+                quality = CADTessellator._compute_adaptive_deflection(local_solid)
             else:
                 quality = Tolerances.TESSELLATION_QUALITY
         if angular_tolerance is None:
             angular_tolerance = Tolerances.TESSELLATION_ANGULAR
 
-        # Phase 4.3: Cached Geometry-Hash (O(1) bei Cache-Hit statt O(n))
-        shape_hash = CADTessellator._get_geometry_hash(solid)
-
         # PERFORMANCE Phase 4: Separate Cache-Keys für Mesh und Edges
         # Mesh: Quality-abhängig (verschiedene LODs)
         # Edges: Quality-UNABHÄNGIG (B-Rep Kanten sind geometrisch identisch)
-        mesh_key = f"{shape_hash}_{quality}_{angular_tolerance}_v{_TESSELLATOR_VERSION}"
-        edge_key = f"{shape_hash}_edges_v{_TESSELLATOR_VERSION}"  # NO quality!
+        def make_mesh_key(key):
+            return f"{key}_{quality:.6g}_{angular_tolerance}_v{_TESSELLATOR_VERSION}"
 
-        # Phase 9: Thread-safe Cache-Zugriff
-        with CADTessellator._cache_lock:
-            mesh_cached = mesh_key in CADTessellator._mesh_cache
-            edge_cached = edge_key in CADTessellator._edge_cache
-
-            if mesh_cached and edge_cached:
-                logger.debug(f"Tessellator: FULL Cache HIT (mesh+edge)")
-                CADTessellator._cache_access_order.move_to_end(mesh_key)
-                CADTessellator._edge_cache_access_order.move_to_end(edge_key)
-                return CADTessellator._mesh_cache[mesh_key], CADTessellator._edge_cache[edge_key]
-
-            if mesh_cached:
-                logger.debug(f"Tessellator: PARTIAL Cache HIT (mesh only, edge miss)")
-                CADTessellator._cache_access_order.move_to_end(mesh_key)
-            elif edge_cached:
-                logger.debug(f"Tessellator: PARTIAL Cache HIT (edge only, mesh miss)")
-                CADTessellator._edge_cache_access_order.move_to_end(edge_key)
-            else:
-                logger.debug(f"Tessellator: FULL Cache MISS")
+        def make_edge_key(key):
+            return f"{key}_edges_v{_TESSELLATOR_VERSION}"  # NO quality!
 
-            # PERFORMANCE Phase 4: Get edge from cache if available
-            edge_mesh_from_cache = CADTessellator._edge_cache.get(edge_key) if edge_cached else None
+        mesh_key = make_mesh_key(shape_hash)
+        edge_key = make_edge_key(shape_hash)
 
-        mesh = None
-        edge_mesh = edge_mesh_from_cache
+        # Phase 9: Thread-safe Cache-Zugriff
+        with CADTessellator._cache_lock:
+            mesh, mesh_derived = CADTessellator._lookup_local(
+                CADTessellator._mesh_cache, CADTessellator._cache_access_order, make_mesh_key, shape_hash)
+            edge_mesh, edge_derived = CADTessellator._lookup_local(
+                CADTessellator._edge_cache, CADTessellator._edge_cache_access_order, make_edge_key, shape_hash)
+
+        if mesh is not None and edge_mesh is not None:
+            logger.debug(f"Tessellator: FULL Cache HIT (mesh+edge)")
+            return (CADTessellator._place(mesh, CADTessellator._combine(placement, mesh_derived)),
+                    CADTessellator._place(edge_mesh, CADTessellator._combine(placement, edge_derived)))
+        if mesh is not None:
+            logger.debug(f"Tessellator: PARTIAL Cache HIT (mesh only, edge miss)")
+        elif edge_mesh is not None:
+            logger.debug(f"Tessellator: PARTIAL Cache HIT (edge only, mesh miss)")
+        else:
+            logger.debug(f"Tessellator: FULL Cache MISS")
 
         try:
-            if HAS_OCP_TESSELLATE:
-                # OCP Tessellation aufrufen
-                result = ocp_tessellate(
-                    solid.wrapped,
-                    mesh_key,  # FIX: war cache_key
-                    deviation=quality,
-                    quality=quality,
-                    angular_tolerance=angular_tolerance,
-                    compute_faces=True,
-                    compute_edges=True,
-                    debug=False
-                )
-                
-                # --- A. FACES (Trianguliert) ---
-                if "vertices" in result and "triangles" in result:
-                    verts = np.array(result["vertices"], dtype=np.float32).reshape(-1, 3)
-                    tris = np.array(result["triangles"], dtype=np.int32).reshape(-1, 3)
-                    normals = result.get("normals")
-
-                    # PyVista Cell Array: [3, v1, v2, v3, 3, v4...]
-                    padding = np.full((tris.shape[0], 1), 3, dtype=np.int32)
-                    faces_combined = np.hstack((padding, tris)).flatten()
-
-                    mesh = pv.PolyData(verts, faces_combined)
-                    
-                    if normals is not None:
-                        try:
-                            normals = np.array(normals, dtype=np.float32).reshape(-1, 3)
-                            if len(normals) == len(verts):
-                                mesh.point_data["Normals"] = normals
-                        except Exception as e:
-                            logger.debug(f"Normal-Zuweisung fehlgeschlagen: {e}")
-
-            # --- FALLBACK für Mesh --- 
             if mesh is None:
-                mesh_data = solid.tessellate(tolerance=quality)
-                verts = np.array([(v.X, v.Y, v.Z) for v in mesh_data[0]], dtype=np.float32)
-                tris = np.array(mesh_data[1], dtype=np.int32)
-                padding = np.full((tris.shape[0], 1), 3, dtype=np.int32)
-                faces_combined = np.hstack((padding, tris)).flatten()
-                mesh = pv.PolyData(verts, faces_combined)
+                mesh = CADTessellator._tessellate_faces(local_solid, mesh_key, quality, angular_tolerance)
+                mesh_derived = None
+                # PERFORMANCE Phase 4: Cache mesh separately
+                # Phase 9: Thread-safe Cache-Write
+                with CADTessellator._cache_lock:
+                    CADTessellator._mesh_cache[mesh_key] = mesh
+                    CADTessellator._cache_access_order[mesh_key] = True
 
             # --- B. EDGES - Echte B-Rep Kanten! ---
             # PERFORMANCE Phase 4: Only extract edges if not already cached
             if edge_mesh is None:  # Not from cache
+                edge_derived = None
                 # Priorität 1: Echte B-Rep Kanten extrahieren
-                edge_mesh = CADTessellator.extract_brep_edges(solid, deflection=quality * 10)
+                edge_mesh = CADTessellator.extract_brep_edges(local_solid, deflection=quality * 10)
 
                 # Fallback: Feature Edges (nur wenn B-Rep Extraktion fehlschlägt)
                 if edge_mesh is None and mesh is not None:
-                    edge_mesh = mesh.extract_feature_edges(feature_angle=30, boundary_edges=True)
+                    local_mesh = CADTessellator._place(mesh, mesh_derived)
+                    edge_mesh = local_mesh.extract_feature_edges(feature_angle=30, boundary_edges=True)
                     logger.debug(f"Fallback zu Feature-Edges: {edge_mesh.n_lines} Linien")
 
                 # PERFORMANCE Phase 4: Cache edges separately (quality-independent!)
@@ -561,24 +682,66 @@ class CADTessellator:
                         CADTessellator._edge_cache_access_order[edge_key] = True
                     logger.debug(f"Edge cached: {edge_mesh.n_lines} Linien")
 
-            # PERFORMANCE Phase 4: Cache mesh separately
-            # Phase 9: Thread-safe Cache-Write
             with CADTessellator._cache_lock:
-                if mesh is not None:
-                    CADTessellator._mesh_cache[mesh_key] = mesh
-                    CADTessellator._cache_access_order[mesh_key] = True
-
                 # LRU-Eviction prüfen
                 if (len(CADTessellator._mesh_cache) > CADTessellator.MAX_CACHE_ENTRIES or
                     len(CADTessellator._edge_cache) > CADTessellator.MAX_EDGE_CACHE_ENTRIES):
                     CADTessellator._evict_lru()
 
-            return mesh, edge_mesh
+            return (CADTessellator._place(mesh, CADTessellator._combine(placement, mesh_derived)),
+                    CADTessellator._place(edge_mesh, CADTessellator._combine(placement, edge_derived)))
 
         except Exception as e:
             logger.error(f"Tessellation critical error: {e}")
             return None, None
-    
+
+    @staticmethod
+    def _tessellate_faces(solid, cache_key, quality, angular_tolerance) -> pv.PolyData:
+        """Face-Mesh via ocp_tessellate, Fallback build123d-Tessellierung."""
+        mesh = None
+        if HAS_OCP_TESSELLATE:
+            # OCP Tessellation aufrufen
+            result = ocp_tessellate(
+                solid.wrapped,
+                cache_key,
+                deviation=quality,
+                quality=quality,
+                angular_tolerance=angular_tolerance,
+                compute_faces=True,
+                compute_edges=True,
+                debug=False
+            )
+
+            # --- A. FACES (Trianguliert) ---
+            if "vertices" in result and "triangles" in result:
+                verts = np.array(result["vertices"], dtype=np.float32).reshape(-1, 3)
+                tris = np.array(result["triangles"], dtype=np.int32).reshape(-1, 3)
+                normals = result.get("normals")
+
+                # PyVista Cell Array: [3, v1, v2, v3, 3, v4...]
+                padding = np.full((tris.shape[0], 1), 3, dtype=np.int32)
+                faces_combined = np.hstack((padding, tris)).flatten()
+
+                mesh = pv.PolyData(verts, faces_combined)
+
+                if normals is not None:
+                    try:
+                        normals = np.array(normals, dtype=np.float32).reshape(-1, 3)
+                        if len(normals) == len(verts):
+                            mesh.point_data["Normals"] = normals
+                    except Exception as e:
+                        logger.debug(f"Normal-Zuweisung fehlgeschlagen: {e}")
+
+        # --- FALLBACK für Mesh ---
+        if mesh is None:
+            mesh_data = solid.tessellate(tolerance=quality)
+            verts = np.array([(v.X, v.Y, v.Z) for v in mesh_data[0]], dtype=np.float32)
+            tris = np.array(mesh_data[1], dtype=np.int32)
+            padding = np.full((tris.shape[0], 1), 3, dtype=np.int32)
+            faces_combined = np.hstack((padding, tris)).flatten()
+            mesh = pv.PolyData(verts, faces_combined)
+        return mesh
+
     @staticmethod
     def count_brep_faces(solid) -> int:
         """Zählt die echten B-Rep Faces (nicht Tessellations-Dreiecke)"""
@@ -603,18 +766,89 @@ class CADTessellator:
             - mesh: PyVista PolyData mit cell_data["face_id"]
             - edge_mesh: Kanten-Mesh
             - face_info: Dict {face_id: {"normal": (x,y,z), "center": (x,y,z)}}
+
+        PERFORMANCE: Ergebnisse werden im lokalen Frame gecacht. Move/Rotate
+        (nur Location geändert) und registrierte Spiegelungen platzieren das
+        gecachte Mesh per Matrix, ohne BRepMesh und ohne Knoten-Schleife.
         """
         if not HAS_OCP or solid is None:
             return None, None, {}
 
         ensure_ocp_main_thread("tessellate solid with face IDs")
 
+        try:
+            local_solid, shape_hash, placement = CADTessellator._local_frame(solid)
+        except Exception as e:
+            logger.error(f"tessellate_with_face_ids failed: {e}")
+            return None, None, {}
+
         if quality is None:
             if is_enabled("adaptive_tessellation"):
-                quality = CADTessellator._compute_adaptive_deflection(solid)
+                quality = CADTessellator._compute_adaptive_deflection(local_solid)
             else:
                 quality = Tolerances.TESSELLATION_QUALITY
 
+        def make_key(key):
+            return f"{key}_{quality:.6g}_faceids_v{_TESSELLATOR_VERSION}"
+
+        with CADTessellator._cache_lock:
+            cached, derived = CADTessellator._lookup_local(
+                CADTessellator._face_id_cache, CADTessellator._face_id_cache_access_order, make_key, shape_hash)
+
+        if cached is None:
+            cached = CADTessellator._compute_face_ids(local_solid, quality)
+            derived = None
+            if cached[0] is None:
+                return cached
+            with CADTessellator._cache_lock:
+                CADTessellator._face_id_cache[make_key(shape_hash)] = cached
+                CADTessellator._face_id_cache_access_order[make_key(shape_hash)] = True
+                if len(CADTessellator._face_id_cache) > CADTessellator.MAX_FACE_ID_CACHE_ENTRIES:
+                    CADTessellator._evict_lru()
+        else:
+            logger.debug(f"Tessellator: Face-ID Cache HIT ({'platziert' if placement is not None or derived is not None else 'lokal'})")
+
+        # Flache Kopien: Aufrufer dürfen Arrays/Infos ergänzen, ohne den Cache zu verändern
+        mesh, edge_mesh, face_info = cached
+        matrix = CADTessellator._combine(placement, derived)
+        if matrix is None:
+            return (mesh.copy(deep=False),
+                    edge_mesh.copy(deep=False) if edge_mesh is not None else None,
+                    {face_id: dict(info) for face_id, info in face_info.items()})
+        return (_transform_polydata(mesh, matrix),
+                CADTessellator._place(edge_mesh, matrix),
+                CADTessellator._place_face_info(face_info, matrix, solid))
+
+    @staticmethod
+    def _place_face_info(face_info: dict, matrix: np.ndarray, solid) -> dict:
+        """Transformiert Normalen/Zentren; positionsabhängige Face-Hashes werden neu berechnet."""
+        linear = matrix[:3, :3]
+        normal_matrix = np.linalg.inv(linear).T
+        placed = {}
+        for face_id, info in face_info.items():
+            entry = dict(info)
+            normal = normal_matrix @ np.asarray(info["normal"], dtype=np.float64)
+            length = np.linalg.norm(normal)
+            if length > 0:
+                normal = normal / length
+            entry["normal"] = tuple(float(v) for v in normal)
+            entry["center"] = tuple(float(v) for v in linear @ np.asarray(info["center"], dtype=np.float64) + matrix[:3, 3])
+            placed[face_id] = entry
+
+        if any("hash" in info for info in placed.values()):
+            try:
+                from modeling.face_hash import compute_face_hash
+                for face_id, b3d_face in iter_faces_with_indices(solid):
+                    if "hash" in placed.get(face_id, {}):
+                        face = b3d_face.wrapped if hasattr(b3d_face, "wrapped") else b3d_face
+                        placed[face_id]["hash"] = compute_face_hash(face)
+            except ImportError:
+                pass
+        return placed
+
+    @staticmethod
+    def _compute_face_ids(solid, quality) -> Tuple[Optional[pv.PolyData], Optional[pv.PolyData], dict]:
+        """Tesselliert Face für Face (ohne Cache), siehe tessellate_with_face_ids()."""
         try:
             from OCP.BRepMesh import BRepMesh_IncrementalMesh
             from OCP.TopLoc import TopLoc_Location
@@ -373,6 +373,7 @@ class Document:
         Returns:
             True bei Erfolg
         """
+        from modeling.export_kernel import export_solid
         from modeling.step_io import STEPWriter, STEPSchema
 
         # Schema konvertieren
@@ -386,9 +387,9 @@ class Document:
             return False
 
         if len(export_bodies) == 1:
-            # Einzelner Body
+            # Einzelner Body (mit echten Gewinden)
             result = STEPWriter.export_solid(
-                export_bodies[0]._build123d_solid,
+                export_solid(export_bodies[0]),
                 filename,
                 application_name="MashCad",
                 schema=schema_enum
@@ -27,7 +27,6 @@ from modeling.result_types import (
 HAS_OCP = False
 try:
     from OCP.BRepFilletAPI import BRepFilletAPI_MakeFillet, BRepFilletAPI_MakeChamfer
-    from OCP.BRepCheck import BRepCheck_Analyzer
     from OCP.TopExp import TopExp_Explorer
     from OCP.TopAbs import TopAbs_FACE, TopAbs_EDGE
     from OCP.ShapeFix import ShapeFix_Shape
@@ -837,9 +836,9 @@ def _validate_solid(solid) -> bool:
         return False
 
     try:
-        shape = solid.wrapped if hasattr(solid, 'wrapped') else solid
-        analyzer = BRepCheck_Analyzer(shape)
-        return analyzer.IsValid()
+        from modeling.shape_validation import ValidationTier, check_shape
+        # Fillet/Chamfer-Defekte zeigen sich an Faces/Edges oder offenen Shells
+        return check_shape(solid, ValidationTier.SUBSHAPES)
     except Exception as e:
         logger.debug(f"[edge_operations.py] Fehler: {e}")
         # Fallback: Prüfe ob es Faces hat
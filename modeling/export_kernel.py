@@ -36,6 +36,19 @@ import numpy as np
 from modeling.ocp_thread_guard import ensure_ocp_main_thread
 
 
+def export_solid(body: Any) -> Optional[Any]:
+    """
+    Solid eines Bodies für den Export - mit echten Gewinden.
+
+    Kosmetische Gewinde fehlen im BREP und werden hier erst berechnet
+    (Body._get_solid_with_threads, gecacht bis zur nächsten Änderung).
+    """
+    with_threads = getattr(type(body), '_get_solid_with_threads', None)
+    if with_threads is not None:
+        return with_threads(body)
+    return getattr(body, '_build123d_solid', None)
+
+
 class ExportFormat(Enum):
     """Unterstützte Export-Formate."""
     STL = "stl"
@@ -157,7 +170,7 @@ class ExportCandidate:
         if self.solid is not None:
             return self.solid
         if self.body is not None:
-            return getattr(self.body, '_build123d_solid', None)
+            return export_solid(self.body)
         return None
     
     def get_mesh(self) -> Optional[Any]:
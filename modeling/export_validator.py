@@ -332,9 +332,9 @@ class ExportValidator:
         result.checks_performed.append(ValidationCheckType.MANIFOLD)
         
         try:
-            from OCP.BRepCheck import BRepCheck_Analyzer
             from OCP.TopAbs import TopAbs_SOLID
             from OCP.TopExp import TopExp_Explorer
+            from modeling.shape_validation import ValidationTier, check_shape
             
             # Prüfe ob Shape ein Solid ist
             explorer = TopExp_Explorer(shape, TopAbs_SOLID)
@@ -347,16 +347,12 @@ class ExportValidator:
                 ))
                 return
             
-            # BRepCheck Analyzer
-            analyzer = BRepCheck_Analyzer(shape)
-            
-            if not analyzer.IsValid():
-                status = analyzer.Result()
-                # Status-Werte analysieren
+            # BRepCheck pro Face + geschlossene Shells (gecacht, meist schon vom Rebuild geprüft)
+            if not check_shape(shape, ValidationTier.SUBSHAPES):
                 result.add_issue(ValidationIssue(
                     severity=ValidationSeverity.WARNING,
                     check_type=ValidationCheckType.MANIFOLD,
-                    message=f"BRep-Validierung meldet Probleme (Status: {status})",
+                    message="BRep-Validierung meldet Probleme",
                     suggestion="Versuchen Sie Geometry-Healing oder reparieren Sie das Modell"
                 ))
             
@@ -805,18 +801,19 @@ class ExportValidator:
         if 'shape_fix' in strategies:
             try:
                 from OCP.ShapeFix import ShapeFix_Shape
-                from OCP.BRepCheck import BRepCheck_Analyzer
                 from config.tolerances import Tolerances
+                from modeling.shape_validation import ValidationTier, check_shape, forget_shape
                 
                 fixer = ShapeFix_Shape(repaired_shape)
                 fixer.SetPrecision(Tolerances.KERNEL_FUZZY)
                 fixer.SetMaxTolerance(Tolerances.MESH_EXPORT)
                 fixer.SetMinTolerance(Tolerances.KERNEL_PRECISION / 10)
                 
-                if fixer.Perform():
+                performed = fixer.Perform()
+                forget_shape(repaired_shape)
+                if performed:
                     fixed = fixer.Shape()
-                    analyzer = BRepCheck_Analyzer(fixed)
-                    if analyzer.IsValid():
+                    if check_shape(fixed, ValidationTier.FULL, cache=False):
                         repaired_shape = fixed
                         all_changes.append("ShapeFix_Shape angewendet")
                         applied_strategies.append('shape_fix')
@@ -953,22 +950,8 @@ class ExportValidator:
         """Prüft auf Selbstüberschneidungen (optional, sehr aufwändig)."""
         result.checks_performed.append(ValidationCheckType.SELF_INTERSECTION)
         
-        try:
-            from OCP.BRepCheck import BRepCheck_Analyzer
-            
-            analyzer = BRepCheck_Analyzer(shape)
-            
-            # Self-Intersection Check ist komplex und rechenintensiv
-            # Vereinfachte Prüfung hier
-            
-            if not analyzer.IsValid():
-                # Könnte Selbstüberschneidungen enthalten
-                pass
-            
-        except ImportError:
-            logger.warning("OCP BRepCheck nicht verfügbar")
-        except Exception as e:
-            logger.warning(f"Self-Intersection-Check fehlgeschlagen: {e}")
+        # Self-Intersection Check ist komplex und rechenintensiv - noch keine
+        # eigene Prüfung, BRep-Gültigkeit deckt der Manifold-Check ab.
     
     @staticmethod
     def get_quick_report(solid: Any) -> str:
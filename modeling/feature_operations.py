@@ -338,7 +338,8 @@ def safe_operation(
         if result is None:
             raise ValueError("Operation returned None")
         
-        if hasattr(result, 'is_valid') and not result.is_valid():
+        from modeling.shape_validation import ValidationTier, check_shape
+        if hasattr(result, 'is_valid') and not check_shape(result, ValidationTier.SUBSHAPES):
             raise ValueError("Result geometry is invalid")
 
         # Consume any pending TNP failure
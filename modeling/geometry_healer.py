@@ -149,9 +149,11 @@ class GeometryHealer:
                     # Strategie hat zwar Änderungen gemacht, aber Ergebnis ist noch ungültig
                     logger.warning(f"⚠️ {strat.name} hat Änderungen gemacht, aber Solid noch ungültig")
                     solid = healed  # Trotzdem weitermachen mit verbessertem Solid
+                    validation = new_validation
 
             # Keine Strategie war vollständig erfolgreich
-            final_validation = GeometryValidator.validate_solid(solid, ValidationLevel.NORMAL)
+            # (Urteil für das aktuelle Solid liegt bereits vor, kein erneutes Validieren)
+            final_validation = validation
 
             if final_validation.is_valid:
                 return solid, HealingResult.healed(
@@ -213,11 +213,9 @@ class GeometryValidator:
         # === Level FULL: BRepCheck Analyzer ===
 
         try:
-            from OCP.BRepCheck import BRepCheck_Analyzer
+            from modeling.shape_validation import ValidationTier, check_shape
 
-            analyzer = BRepCheck_Analyzer(ocp_shape)
-
-            if not analyzer.IsValid():
+            if not check_shape(ocp_shape, ValidationTier.FULL):
                 issues.append("BRepCheck: Shape ist nicht valide")
 
                 # Detaillierte Fehler extrahieren (wenn möglich)
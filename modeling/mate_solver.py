@@ -7,9 +7,15 @@ AS-003: Mate-Solver Base Kernel for Sprint 3.
 Provides iterative constraint solving for assembly mates.
 Resolves mate constraints between components and computes transforms.
 
+The solver runs Levenberg-Marquardt on the stacked mate residuals with
+analytic Jacobians (6 unknowns per movable component: position and
+Euler angles). The mate graph is split into independent clusters via
+the MateManager component index; each cluster is solved on its own
+sparse normal equations.
+
 Classes:
  - SolveResult: Dataclass containing solver results
- - MateSolver: Iterative constraint solver for assembly mates
+ - MateSolver: Levenberg-Marquardt constraint solver for assembly mates
 
 Supported Mate Types:
  - COINCIDENT: Point A = Point B
@@ -26,6 +32,15 @@ from typing import Dict, List, Optional, Tuple, Any, Set
 from enum import Enum
 from loguru import logger
 
+import numpy as np
+
+try:
+    import scipy.sparse as sp
+    from scipy.sparse.linalg import spsolve
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
 from modeling.mate_system import (
     Mate,
     MateType,
@@ -76,27 +91,12 @@ class GeometricEntity:
         transform: ComponentTransform
     ) -> Tuple[float, float, float]:
         """Apply full transform (rotation + translation + scale) to a point."""
-        rx, ry, rz = [math.radians(a) for a in transform.rotation]
-        sx, sy, sz = transform.scale, transform.scale, transform.scale
-        px, py, pz = point
+        scale = transform.scale
         tx, ty, tz = transform.position
-        
-        # Rotation matrices (XYZ Euler angles)
-        # Rotation around X
-        cx, sx_rot = math.cos(rx), math.sin(rx)
-        # Rotation around Y
-        cy, sy_rot = math.cos(ry), math.sin(ry)
-        # Rotation around Z
-        cz, sz_rot = math.cos(rz), math.sin(rz)
-        
-        # Combined rotation matrix (Rz * Ry * Rx)
-        # Apply to point
-        x = (cy * cz) * px + (cy * sz_rot) * py + (-sy_rot) * pz
-        y = (sx_rot * sy_rot * cz - cx * sz_rot) * px + (sx_rot * sy_rot * sz_rot + cx * cz) * py + (sx_rot * cy) * pz
-        z = (cx * sy_rot * cz + sx_rot * sz_rot) * px + (cx * sy_rot * sz_rot - sx_rot * cz) * py + (cx * cy) * pz
+        x, y, z = _rotate(point, transform.rotation)
         
         # Apply scale and translation
-        return (x * sx + tx, y * sy + ty, z * sz + tz)
+        return (x * scale + tx, y * scale + ty, z * scale + tz)
     
     def _apply_rotation(
         self, 
@@ -104,18 +104,7 @@ class GeometricEntity:
         transform: ComponentTransform
     ) -> Tuple[float, float, float]:
         """Apply only rotation to a direction vector."""
-        rx, ry, rz = [math.radians(a) for a in transform.rotation]
-        vx, vy, vz = vec
-        
-        # Rotation matrices
-        cx, sx_rot = math.cos(rx), math.sin(rx)
-        cy, sy_rot = math.cos(ry), math.sin(rz)
-        cz, sz_rot = math.cos(rz), math.sin(rz)
-        
-        # Combined rotation (Rz * Ry * Rx)
-        x = (cy * cz) * vx + (cy * sz_rot) * vy + (-sy_rot) * vz
-        y = (sx_rot * sy_rot * cz - cx * sz_rot) * vx + (sx_rot * sy_rot * sz_rot + cx * cz) * vy + (sx_rot * cy) * vz
-        z = (cx * sy_rot * cz + sx_rot * sz_rot) * vx + (cx * sy_rot * sz_rot - sx_rot * cz) * vy + (cx * cy) * vz
+        x, y, z = _rotate(vec, transform.rotation)
         
         # Normalize
         length = math.sqrt(x*x + y*y + z*z)
@@ -124,6 +113,57 @@ class GeometricEntity:
         return (x, y, z)
 
 
+def _rotate(
+    vec: Tuple[float, float, float],
+    rotation_deg: Tuple[float, float, float]
+) -> Tuple[float, float, float]:
+    """Rotate a vector by (Rz * Ry * Rx)^T, see rotation_matrices()."""
+    rx, ry, rz = [math.radians(a) for a in rotation_deg]
+    vx, vy, vz = vec
+    cx, sx = math.cos(rx), math.sin(rx)
+    cy, sy = math.cos(ry), math.sin(ry)
+    cz, sz = math.cos(rz), math.sin(rz)
+    return (
+        (cy * cz) * vx + (cy * sz) * vy + (-sy) * vz,
+        (sx * sy * cz - cx * sz) * vx + (sx * sy * sz + cx * cz) * vy + (sx * cy) * vz,
+        (cx * sy * cz + sx * sz) * vx + (cx * sy * sz - sx * cz) * vy + (cx * cy) * vz,
+    )
+
+
+def _axis_rotations(angles: np.ndarray, axis: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rotation matrices about one axis and their derivatives (per radian)."""
+    i, j = (axis + 1) % 3, (axis + 2) % 3
+    c, s = np.cos(angles), np.sin(angles)
+    rot = np.zeros((len(angles), 3, 3))
+    d_rot = np.zeros((len(angles), 3, 3))
+    rot[:, axis, axis] = 1.0
+    rot[:, i, i] = rot[:, j, j] = c
+    rot[:, i, j], rot[:, j, i] = -s, s
+    d_rot[:, i, i] = d_rot[:, j, j] = -s
+    d_rot[:, i, j], d_rot[:, j, i] = -c, c
+    return rot, d_rot
+
+
+def rotation_matrices(rotations_deg: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized component rotation matrices (Rz * Ry * Rx)^T.
+    
+    Args:
+        rotations_deg: (m, 3) Euler angles in degrees (ComponentTransform.rotation)
+    
+    Returns:
+        (m, 3, 3) matrices and their (m, 3, 3, 3) derivatives d/d(angle_k)
+        per degree, indexed [component, k, row, col]
+    """
+    angles = np.radians(np.asarray(rotations_deg, dtype=float).reshape(-1, 3))
+    rx, drx = _axis_rotations(angles[:, 0], 0)
+    ry, dry = _axis_rotations(angles[:, 1], 1)
+    rz, drz = _axis_rotations(angles[:, 2], 2)
+    rzy = rz @ ry
+    derivatives = np.stack([rzy @ drx, rz @ dry @ rx, drz @ ry @ rx], axis=1)
+    return (rzy @ rx).transpose(0, 2, 1), derivatives.transpose(0, 1, 3, 2) * (math.pi / 180.0)
+
+
 @dataclass
 class SolveResult:
     """
@@ -172,18 +212,226 @@ class SolverConfig:
     """Configuration for the mate solver."""
     max_iterations: int = 100
     tolerance: float = 1e-6
-    learning_rate: float = 0.1
-    damping: float = 0.5
+    learning_rate: float = 0.1   # legacy gradient-descent setting (unused by LM)
+    damping: float = 0.5         # legacy gradient-descent setting (unused by LM)
     min_step: float = 1e-8
     angular_tolerance: float = 1e-4  # radians
+    lm_lambda: float = 1e-3      # initial Levenberg-Marquardt damping
+
+
+# Residual rows per mate type (see _MateCluster._type_residuals)
+_RESIDUAL_ROWS = {
+    MateType.COINCIDENT: 3,
+    MateType.PARALLEL: 3,
+    MateType.PERPENDICULAR: 1,
+    MateType.DISTANCE: 1,
+    MateType.ANGLE: 1,
+    MateType.ALIGN: 6,
+}
+
+
+def _skew(v: np.ndarray) -> np.ndarray:
+    """(n, 3) vectors -> (n, 3, 3) cross-product matrices [v]x."""
+    out = np.zeros(v.shape[:-1] + (3, 3))
+    out[..., 0, 1], out[..., 0, 2] = -v[..., 2], v[..., 1]
+    out[..., 1, 0], out[..., 1, 2] = v[..., 2], -v[..., 0]
+    out[..., 2, 0], out[..., 2, 1] = -v[..., 1], v[..., 0]
+    return out
+
+
+class _MateCluster:
+    """
+    Stacked residuals and analytic Jacobian of one independent mate cluster.
+    
+    Unknowns are (tx, ty, tz, rx, ry, rz) per movable component; fixed
+    components referenced by the cluster mates enter as constants. Mates
+    are grouped by type so that residuals and Jacobian blocks are
+    evaluated vectorized per type.
+    """
+    
+    def __init__(
+        self,
+        movable: List[str],
+        mates: List[Mate],
+        transforms: Dict[str, ComponentTransform],
+        entity_for,
+    ):
+        self.movable = list(movable)
+        self.component_ids = list(movable)
+        index = {cid: k for k, cid in enumerate(self.component_ids)}
+        points, directions, ref_components = [], [], []
+        groups: Dict[MateType, Tuple[List[int], List[int], List[float]]] = {}
+        
+        for mate in mates:
+            if mate.mate_type not in _RESIDUAL_ROWS or not mate.reference1 or not mate.reference2:
+                continue
+            sides = []
+            for ref in (mate.reference1, mate.reference2):
+                if ref.component_id not in index:
+                    index[ref.component_id] = len(self.component_ids)
+                    self.component_ids.append(ref.component_id)
+                entity = entity_for(ref)
+                sides.append(len(points))
+                points.append(entity.point)
+                directions.append(entity.direction)
+                ref_components.append(index[ref.component_id])
+            a_list, b_list, params = groups.setdefault(mate.mate_type, ([], [], []))
+            a_list.append(sides[0])
+            b_list.append(sides[1])
+            params.append(float(mate.parameters.get(
+                "distance" if mate.mate_type == MateType.DISTANCE else "angle", 0.0)))
+        
+        self.ref_points = np.asarray(points, dtype=float).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+        lengths = np.linalg.norm(directions, axis=1, keepdims=True)
+        self.ref_directions = directions / np.where(lengths > 1e-10, lengths, 1.0)
+        self.ref_components = np.asarray(ref_components, dtype=int)
+        self.groups = [
+            (mate_type, np.asarray(a), np.asarray(b), np.asarray(params))
+            for mate_type, (a, b, params) in groups.items()
+        ]
+        self.n_rows = sum(_RESIDUAL_ROWS[t] * len(a) for t, a, _, _ in self.groups)
+        self.n_unknowns = 6 * len(self.movable)
+        
+        states = [transforms[cid] for cid in self.component_ids]
+        self.positions = np.array([t.position for t in states], dtype=float).reshape(-1, 3)
+        self.rotations = np.array([t.rotation for t in states], dtype=float).reshape(-1, 3)
+        self.scales = np.array([t.scale for t in states], dtype=float)
+    
+    @property
+    def x0(self) -> np.ndarray:
+        """Current unknown vector of the movable components."""
+        return np.hstack([self.positions[:len(self.movable)], self.rotations[:len(self.movable)]]).ravel()
+    
+    def unpack(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Unknown vector -> (positions, rotations) of all cluster components."""
+        n = len(self.movable)
+        state = x.reshape(n, 6)
+        positions, rotations = self.positions.copy(), self.rotations.copy()
+        positions[:n], rotations[:n] = state[:, :3], state[:, 3:]
+        return positions, rotations
+    
+    def evaluate(self, x: np.ndarray, jacobian: bool = True):
+        """
+        Residual vector r(x) and (optionally) its Jacobian dr/dx.
+        
+        Returns:
+            (r, J) with J as scipy CSR matrix (dense ndarray without scipy),
+            or (r, None) if jacobian is False
+        """
+        positions, rotations = self.unpack(x)
+        rot, d_rot = rotation_matrices(rotations)
+        comp = self.ref_components
+        rot_ref, scale_ref = rot[comp], self.scales[comp]
+        p = np.einsum("rij,rj->ri", rot_ref, self.ref_points) * scale_ref[:, None] + positions[comp]
+        d = np.einsum("rij,rj->ri", rot_ref, self.ref_directions)
+        if jacobian:
+            p_theta = np.einsum("rkij,rj->rik", d_rot[comp], self.ref_points) * scale_ref[:, None, None]
+            d_theta = np.einsum("rkij,rj->rik", d_rot[comp], self.ref_directions)
+        
+        residuals, rows, cols, values = [], [], [], []
+        offset = 0
+        n_movable = len(self.movable)
+        for mate_type, a, b, params in self.groups:
+            r, partials = self._type_residuals(mate_type, p[a], d[a], p[b], d[b], params, jacobian)
+            n, q = r.shape
+            residuals.append(r.ravel())
+            if jacobian:
+                row_ids = offset + np.arange(n * q).reshape(n, q)
+                for side, j_p, j_d in ((a, partials[0], partials[1]), (b, partials[2], partials[3])):
+                    side_comp = comp[side]
+                    mask = side_comp < n_movable
+                    if not mask.any():
+                        continue
+                    block_theta = np.zeros((n, q, 3))
+                    if j_p is not None:
+                        block_theta += j_p @ p_theta[side]
+                    if j_d is not None:
+                        block_theta += j_d @ d_theta[side]
+                    block_t = j_p if j_p is not None else np.zeros((n, q, 3))
+                    block = np.concatenate([block_t, block_theta], axis=2)[mask]
+                    col_ids = 6 * side_comp[mask][:, None, None] + np.arange(6)
+                    rows.append(np.broadcast_to(row_ids[mask][:, :, None], block.shape).ravel())
+                    cols.append(np.broadcast_to(col_ids, block.shape).ravel())
+                    values.append(block.ravel())
+            offset += n * q
+        
+        r = np.concatenate(residuals) if residuals else np.zeros(0)
+        if not jacobian:
+            return r, None
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=int)
+        cols = np.concatenate(cols) if cols else np.zeros(0, dtype=int)
+        values = np.concatenate(values) if values else np.zeros(0)
+        shape = (self.n_rows, self.n_unknowns)
+        if HAS_SCIPY:
+            return r, sp.csr_matrix((values, (rows, cols)), shape=shape)
+        dense = np.zeros(shape)
+        np.add.at(dense, (rows, cols), values)
+        return r, dense
+    
+    @staticmethod
+    def _type_residuals(mate_type, p1, d1, p2, d2, params, jacobian):
+        """
+        Residual rows of one mate type and partials w.r.t. (p1, d1, p2, d2).
+        
+        Each partial is an (n, q, 3) array or None when it vanishes.
+        """
+        n = len(p1)
+        eye = np.broadcast_to(np.eye(3), (n, 3, 3))
+        
+        if mate_type == MateType.COINCIDENT:
+            r = p1 - p2
+            return r, (eye, None, -eye, None) if jacobian else None
+        
+        if mate_type == MateType.PARALLEL:
+            r = np.cross(d1, d2)
+            return r, (None, -_skew(d2), None, _skew(d1)) if jacobian else None
+        
+        if mate_type == MateType.PERPENDICULAR:
+            r = np.einsum("ni,ni->n", d1, d2)[:, None]
+            return r, (None, d2[:, None, :], None, d1[:, None, :]) if jacobian else None
+        
+        if mate_type == MateType.DISTANCE:
+            v = p1 - p2
+            length = np.linalg.norm(v, axis=1)
+            r = (length - params)[:, None]
+            if not jacobian:
+                return r, None
+            # Coincident points: any unit direction separates them
+            unit = np.where(length[:, None] > 1e-12, v / np.maximum(length, 1e-12)[:, None], (1.0, 0.0, 0.0))
+            return r, (unit[:, None, :], None, -unit[:, None, :], None)
+        
+        if mate_type == MateType.ANGLE:
+            dot = np.clip(np.einsum("ni,ni->n", d1, d2), -1.0, 1.0)
+            r = (np.degrees(np.arccos(dot)) - params)[:, None]
+            if not jacobian:
+                return r, None
+            slope = -(180.0 / math.pi) / np.sqrt(np.maximum(1.0 - dot * dot, 1e-12))
+            return r, (None, (slope[:, None] * d2)[:, None, :], None, (slope[:, None] * d1)[:, None, :])
+        
+        # ALIGN: directions parallel and p2 on the axis through p1 along d1
+        v = p1 - p2
+        along = np.einsum("ni,ni->n", v, d1)
+        r = np.hstack([np.cross(d1, d2), v - along[:, None] * d1])
+        if not jacobian:
+            return r, None
+        project = eye - np.einsum("ni,nj->nij", d1, d1)
+        d_off = -(np.einsum("ni,nj->nij", d1, v) + along[:, None, None] * eye)
+        zeros = np.zeros((n, 3, 3))
+        return r, (
+            np.concatenate([zeros, project], axis=1),
+            np.concatenate([-_skew(d2), d_off], axis=1),
+            np.concatenate([zeros, -project], axis=1),
+            np.concatenate([_skew(d1), zeros], axis=1),
+        )
 
 
 class MateSolver:
     """
-    Iterative constraint solver for assembly mates.
+    Levenberg-Marquardt constraint solver for assembly mates.
     
-    Uses gradient descent to minimize constraint error and find
-    component transforms that satisfy all mate constraints.
+    Minimizes the stacked mate residuals with analytic Jacobians and
+    solves each independent cluster of the mate graph separately.
     
     Usage:
         solver = MateSolver()
@@ -201,6 +449,7 @@ class MateSolver:
         """
         self.config = config or SolverConfig()
         self._component_entities: Dict[str, GeometricEntity] = {}
+        self.last_stats: Dict[str, Any] = {}
         logger.debug(f"[MATE_SOLVER] Initialized with config: max_iter={self.config.max_iterations}")
     
     def solve(
@@ -267,54 +516,93 @@ class MateSolver:
                 final_error=error
             )
         
-        # Iterative solving
-        best_transforms = transforms.copy()
-        best_error = self._compute_total_error(transforms, mates, components)
-        
-        for iteration in range(self.config.max_iterations):
-            # Compute gradients and update transforms
-            gradients = self._compute_gradients(transforms, mates, components, movable)
-            
-            # Apply gradient descent step
-            new_transforms = self._apply_gradients(
-                transforms, gradients, movable
+        # Independent clusters over the mate graph, solved one by one
+        clusters = MateManager.from_mates(mates).get_component_clusters(fixed_components)
+        iterations = 0
+        unknowns = 0
+        for cluster_components, cluster_mates in clusters:
+            cluster = _MateCluster(
+                cluster_components, cluster_mates, transforms,
+                lambda ref: self._get_reference_entity(ref, components),
             )
-            
-            # Compute new error
-            new_error = self._compute_total_error(new_transforms, mates, components)
-            
-            # Check for convergence
-            if new_error < self.config.tolerance:
-                logger.info(f"[MATE_SOLVER] Converged at iteration {iteration + 1}, error={new_error:.2e}")
-                return self._build_success_result(
-                    new_transforms, mates, components, iteration + 1, new_error
-                )
-            
-            # Keep best solution
-            if new_error < best_error:
-                best_transforms = new_transforms.copy()
-                best_error = new_error
-            
-            # Check for minimal progress
-            improvement = abs(transforms[movable[0]].position[0] - new_transforms[movable[0]].position[0]) if movable else 0
-            if improvement < self.config.min_step and new_error < self.config.tolerance * 100:
-                # Close enough
-                break
-            
-            transforms = new_transforms
+            cluster_iterations = self._solve_cluster(cluster, transforms)
+            iterations = max(iterations, cluster_iterations)
+            unknowns += cluster.n_unknowns
         
-        # Return best result found
-        final_error = self._compute_total_error(best_transforms, mates, components)
+        final_error = self._compute_total_error(transforms, mates, components)
         success = final_error < self.config.tolerance
+        self.last_stats = {
+            "clusters": len(clusters),
+            "unknowns": unknowns,
+            "iterations": iterations,
+        }
         
         result = self._build_result(
-            best_transforms, mates, components, 
-            self.config.max_iterations, final_error, success
+            transforms, mates, components, 
+            iterations, final_error, success
         )
         
-        logger.info(f"[MATE_SOLVER] Finished: success={success}, error={final_error:.2e}")
+        logger.info(
+            f"[MATE_SOLVER] Finished: success={success}, error={final_error:.2e}, "
+            f"clusters={len(clusters)}, iterations={iterations}"
+        )
         return result
     
+    def _solve_cluster(
+        self,
+        cluster: _MateCluster,
+        transforms: Dict[str, ComponentTransform]
+    ) -> int:
+        """
+        Levenberg-Marquardt on one cluster; writes the result into transforms.
+        
+        Steps solve (J^T J + lambda I) dx = -J^T r (sparse with scipy).
+        Accepted steps shrink lambda, rejected steps grow it.
+        
+        Returns:
+            Number of iterations (step trials) used
+        """
+        if cluster.n_unknowns == 0 or cluster.n_rows == 0:
+            return 0
+        
+        x = cluster.x0
+        r, jac = cluster.evaluate(x)
+        cost = float(r @ r)
+        lam = self.config.lm_lambda
+        identity = sp.identity(cluster.n_unknowns, format="csr") if HAS_SCIPY else np.eye(cluster.n_unknowns)
+        iterations = 0
+        normal = gradient = None
+        
+        while iterations < self.config.max_iterations and math.sqrt(cost) >= self.config.tolerance:
+            iterations += 1
+            if normal is None:
+                normal, gradient = jac.T @ jac, jac.T @ r
+            if HAS_SCIPY:
+                step = spsolve((normal + lam * identity).tocsc(), -gradient)
+            else:
+                step = np.linalg.solve(normal + lam * identity, -gradient)
+            if not np.all(np.isfinite(step)) or np.linalg.norm(step) < self.config.min_step:
+                break
+            
+            r_new, jac_new = cluster.evaluate(x + step)
+            cost_new = float(r_new @ r_new)
+            if cost_new < cost:
+                x, r, jac, cost = x + step, r_new, jac_new, cost_new
+                lam = max(lam / 3.0, 1e-12)
+                normal = None
+            else:
+                lam *= 4.0
+                if lam > 1e12:
+                    break
+        
+        positions, rotations = cluster.unpack(x)
+        for k, cid in enumerate(cluster.movable):
+            t = transforms[cid].copy()
+            t.position = tuple(float(v) for v in positions[k])
+            t.rotation = tuple(float(v) for v in rotations[k])
+            transforms[cid] = t
+        return iterations
+    
     def _detect_conflicts(
         self, 
         mates: List[Mate], 
@@ -483,10 +771,13 @@ class MateSolver:
         dx = e1.point[0] - e2.point[0]
         dy = e1.point[1] - e2.point[1]
         dz = e1.point[2] - e2.point[2]
-        # Use average direction
-        ax = (e1.direction[0] + e2.direction[0]) / 2
-        ay = (e1.direction[1] + e2.direction[1]) / 2
-        az = (e1.direction[2] + e2.direction[2]) / 2
+        # Use average direction (second axis flipped if anti-parallel,
+        # otherwise the average vanishes)
+        d1, d2 = e1.direction, e2.direction
+        sign = -1.0 if d1[0]*d2[0] + d1[1]*d2[1] + d1[2]*d2[2] < 0 else 1.0
+        ax = (d1[0] + sign * d2[0]) / 2
+        ay = (d1[1] + sign * d2[1]) / 2
+        az = (d1[2] + sign * d2[2]) / 2
         length = math.sqrt(ax*ax + ay*ay + az*az)
         if length > 1e-10:
             ax, ay, az = ax/length, ay/length, az/length
@@ -545,127 +836,6 @@ class MateSolver:
         
         return entity
     
-    def _compute_gradients(
-        self,
-        transforms: Dict[str, ComponentTransform],
-        mates: List[Mate],
-        components: Dict[str, Component],
-        movable: List[str]
-    ) -> Dict[str, Tuple[Tuple[float, float, float], Tuple[float, float, float]]]:
-        """
-        Compute gradients for each movable component.
-        
-        Returns dict of component_id -> (position_gradient, rotation_gradient)
-        """
-        gradients: Dict[str, Tuple[Tuple[float, float, float], Tuple[float, float, float]]] = {}
-        
-        for comp_id in movable:
-            pos_grad = [0.0, 0.0, 0.0]
-            rot_grad = [0.0, 0.0, 0.0]
-            
-            for mate in mates:
-                if not mate.involves_component(comp_id):
-                    continue
-                
-                # Numerical gradient computation
-                delta = 0.001
-                
-                # Position gradients
-                for i in range(3):
-                    # Positive delta
-                    t_pos = transforms[comp_id].copy()
-                    pos = list(t_pos.position)
-                    pos[i] += delta
-                    t_pos.position = tuple(pos)
-                    transforms_pos = {**transforms, comp_id: t_pos}
-                    err_pos = self._compute_total_error(transforms_pos, mates, components)
-                    
-                    # Negative delta
-                    t_neg = transforms[comp_id].copy()
-                    pos = list(t_neg.position)
-                    pos[i] -= delta
-                    t_neg.position = tuple(pos)
-                    transforms_neg = {**transforms, comp_id: t_neg}
-                    err_neg = self._compute_total_error(transforms_neg, mates, components)
-                    
-                    pos_grad[i] += (err_pos - err_neg) / (2 * delta)
-                
-                # Rotation gradients
-                for i in range(3):
-                    # Positive delta
-                    t_pos = transforms[comp_id].copy()
-                    rot = list(t_pos.rotation)
-                    rot[i] += delta * 10  # Scale for degrees
-                    t_pos.rotation = tuple(rot)
-                    transforms_pos = {**transforms, comp_id: t_pos}
-                    err_pos = self._compute_total_error(transforms_pos, mates, components)
-                    
-                    # Negative delta
-                    t_neg = transforms[comp_id].copy()
-                    rot = list(t_neg.rotation)
-                    rot[i] -= delta * 10
-                    t_neg.rotation = tuple(rot)
-                    transforms_neg = {**transforms, comp_id: t_neg}
-                    err_neg = self._compute_total_error(transforms_neg, mates, components)
-                    
-                    rot_grad[i] += (err_pos - err_neg) / (2 * delta * 10)
-            
-            gradients[comp_id] = (
-                tuple(pos_grad),
-                tuple(rot_grad)
-            )
-        
-        return gradients
-    
-    def _apply_gradients(
-        self,
-        transforms: Dict[str, ComponentTransform],
-        gradients: Dict[str, Tuple[Tuple[float, float, float], Tuple[float, float, float]]],
-        movable: List[str]
-    ) -> Dict[str, ComponentTransform]:
-        """Apply gradient descent step to transforms."""
-        new_transforms = {}
-        
-        for comp_id in transforms:
-            if comp_id not in movable:
-                new_transforms[comp_id] = transforms[comp_id].copy()
-                continue
-            
-            pos_grad, rot_grad = gradients.get(comp_id, ((0, 0, 0), (0, 0, 0)))
-            t = transforms[comp_id].copy()
-            
-            # Apply gradient descent with damping
-            lr = self.config.learning_rate
-            damping = self.config.damping
-            
-            new_pos = tuple(
-                t.position[i] - lr * pos_grad[i] * damping
-                for i in range(3)
-            )
-            new_rot = tuple(
-                t.rotation[i] - lr * rot_grad[i] * damping
-                for i in range(3)
-            )
-            
-            t.position = new_pos
-            t.rotation = new_rot
-            new_transforms[comp_id] = t
-        
-        return new_transforms
-    
-    def _build_success_result(
-        self,
-        transforms: Dict[str, ComponentTransform],
-        mates: List[Mate],
-        components: Dict[str, Component],
-        iterations: int,
-        final_error: float
-    ) -> SolveResult:
-        """Build a successful solve result."""
-        return self._build_result(
-            transforms, mates, components, iterations, final_error, True
-        )
-    
     def _build_result(
         self,
         transforms: Dict[str, ComponentTransform],
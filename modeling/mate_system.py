@@ -10,7 +10,7 @@ Defines mate types, references, and the mate manager for assembly constraints.
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any
 import uuid
 import logging
 
@@ -423,6 +423,73 @@ class MateManager:
         
         logger.info(f"Loaded {len(manager._mates)} mates from data")
         return manager
+
+    @classmethod
+    def from_mates(cls, mates: Iterable[Mate]) -> "MateManager":
+        """
+        Build a manager (and its component index) over existing mates.
+        
+        Unlike create_mate(), no validation or conflict check is run;
+        the mates are indexed as given.
+        
+        Args:
+            mates: Mates to index
+            
+        Returns:
+            A new MateManager instance
+        """
+        manager = cls()
+        for mate in mates:
+            manager._mates[mate.mate_id] = mate
+            if mate.reference1:
+                manager._add_to_component_index(mate.mate_id, mate.reference1.component_id)
+            if mate.reference2:
+                manager._add_to_component_index(mate.mate_id, mate.reference2.component_id)
+        return manager
+    
+    def get_component_clusters(
+        self,
+        fixed_components: Optional[Set[str]] = None
+    ) -> List[Tuple[List[str], List[Mate]]]:
+        """
+        Split the mate graph into independently solvable clusters.
+        
+        Components are connected through the component index. Fixed
+        components act as ground: they belong to no cluster and do not
+        connect the clusters mated against them.
+        
+        Args:
+            fixed_components: Component IDs that are not moved
+            
+        Returns:
+            List of (movable component IDs, mates touching them), in
+            mate insertion order
+        """
+        fixed = fixed_components or set()
+        order = {mate_id: k for k, mate_id in enumerate(self._mates)}
+        seen: Set[str] = set()
+        clusters: List[Tuple[List[str], List[Mate]]] = []
+        
+        for start in self._component_index:
+            if start in fixed or start in seen:
+                continue
+            seen.add(start)
+            members, mate_ids, stack = [], set(), [start]
+            while stack:
+                component_id = stack.pop()
+                members.append(component_id)
+                for mate_id in self._component_index.get(component_id, []):
+                    if mate_id in mate_ids:
+                        continue
+                    mate_ids.add(mate_id)
+                    other = self._mates[mate_id].get_other_component(component_id)
+                    if other and other not in fixed and other not in seen:
+                        seen.add(other)
+                        stack.append(other)
+            mates = [self._mates[m] for m in sorted(mate_ids, key=order.__getitem__)]
+            clusters.append((members, mates))
+        
+        return clusters
     
     # Private helper methods
     # ======================
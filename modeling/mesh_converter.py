@@ -5,6 +5,7 @@ from loguru import logger
 import traceback
 
 from config.feature_flags import is_enabled
+from modeling.shape_validation import ValidationTier, check_shape
 
 # --- OPTIONAL DEPENDENCIES ---
 try:
@@ -30,7 +31,6 @@ except ImportError:
 
 from OCP.gp import gp_Pnt
 from OCP.BRepBuilderAPI import BRepBuilderAPI_Sewing, BRepBuilderAPI_MakePolygon, BRepBuilderAPI_MakeFace, BRepBuilderAPI_MakeSolid
-from OCP.BRepCheck import BRepCheck_Analyzer
 from OCP.ShapeFix import ShapeFix_Shape
 from OCP.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
 from build123d import Solid, Shape
@@ -105,8 +105,7 @@ class MeshToBREPConverter:
 
             # Tier 3: Post-Sewing Validation + Auto-Healing
             if is_enabled("mesh_converter_adaptive_tolerance"):
-                analyzer = BRepCheck_Analyzer(sewed_shape)
-                if not analyzer.IsValid():
+                if not check_shape(sewed_shape, ValidationTier.FULL, cache=False):
                     logger.warning("Sewing: Shape ungültig, versuche Reparatur...")
                     try:
                         fixer = ShapeFix_Shape(sewed_shape)
@@ -114,8 +113,7 @@ class MeshToBREPConverter:
                         fixer.SetMaxTolerance(tolerance * 10)
                         fixer.Perform()
                         sewed_shape = fixer.Shape()
-                        analyzer2 = BRepCheck_Analyzer(sewed_shape)
-                        if analyzer2.IsValid():
+                        if check_shape(sewed_shape, ValidationTier.FULL, cache=False):
                             logger.info("Sewing: Shape nach Reparatur valide")
                         else:
                             logger.warning("Sewing: Shape nach Reparatur weiterhin ungültig")
@@ -51,16 +51,18 @@ class MeshRepair:
             from OCP.BRepCheck import BRepCheck_Analyzer
             from OCP.TopExp import TopExp_Explorer
             from OCP.TopAbs import TopAbs_FACE, TopAbs_EDGE, TopAbs_SHELL, TopAbs_SOLID
+            from modeling.shape_validation import ValidationTier, check_shape
 
             shape = solid.wrapped if hasattr(solid, 'wrapped') else solid
 
-            analyzer = BRepCheck_Analyzer(shape, True)
-
-            if analyzer.IsValid():
+            if check_shape(shape, ValidationTier.FULL):
                 result.success = True
                 result.message = "Geometrie ist gültig. Keine Probleme gefunden."
                 return result
 
+            # Ungültig: eigener Analyzer für die Ergebnisse pro Sub-Shape
+            analyzer = BRepCheck_Analyzer(shape, True)
+
             # Count issues by type
             for shape_type, label in [
                 (TopAbs_FACE, "Face"), (TopAbs_EDGE, "Edge"),
@@ -110,10 +112,11 @@ class MeshRepair:
             from OCP.ShapeFix import ShapeFix_Shape, ShapeFix_Solid
             from OCP.BRepBuilderAPI import BRepBuilderAPI_Sewing
             from OCP.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
-            from OCP.BRepCheck import BRepCheck_Analyzer
             from build123d import Solid
+            from modeling.shape_validation import ValidationTier, check_shape, forget_shape
 
             shape = solid.wrapped if hasattr(solid, 'wrapped') else solid
+            original = shape
 
             # Step 1: ShapeFix_Shape (general healing)
             logger.info("Repair Step 1: ShapeFix_Shape...")
@@ -162,9 +165,9 @@ class MeshRepair:
                 except Exception as e:
                     logger.debug(f"UnifySameDomain skipped: {e}")
 
-            # Validate result
-            checker = BRepCheck_Analyzer(shape, True)
-            is_valid = checker.IsValid()
+            # Validate result (ungecacht: frisch repariert)
+            forget_shape(original)
+            is_valid = check_shape(shape, ValidationTier.FULL, cache=False)
 
             try:
                 repaired = Solid(shape)
@@ -5,8 +5,8 @@ MashCad - NURBS & B-Spline Infrastruktur
 Phase 8: CAD-Kernel Erweiterungen
 
 Native NURBS-Kurven und -Flächen mit:
-- De Boor Algorithmus für Evaluation
-- Ableitungen und Krümmungsberechnung
+- De Boor Algorithmus für Evaluation (vektorisiert über Parameter-Arrays)
+- Analytische Ableitungen und Krümmungsberechnung
 - OCP/Build123d Integration
 - Kontinuitäts-Modi (G0/G1/G2)
 
@@ -27,7 +27,9 @@ Author: Claude (Phase 8 CAD-Kernel)
 Date: 2026-01-23
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from math import comb
 from typing import List, Tuple, Optional, Any, Union
 from enum import Enum, auto
 import numpy as np
@@ -60,6 +62,145 @@ class ContinuityMode(Enum):
     G3 = 3  # Torsion
 
 
+class BSplineBasis:
+    """
+    Vektorisierte B-Spline Basisfunktionen für einen Knotenvektor.
+
+    Nicht-rekursiver De Boor Ansatz (NURBS Book A2.1-A2.3), ausgewertet
+    für ganze Parameter-Arrays auf einmal. Knoten-Span-Lookups werden
+    pro Parameter-Array gecached, weil Krümmungskämme und Vorschau-Raster
+    immer wieder dieselben Parameter abfragen.
+    """
+
+    _SPAN_CACHE_SIZE = 16
+
+    def __init__(self, knots: List[float], degree: int, num_ctrl: int):
+        self.knots = np.asarray(knots, dtype=float)
+        self.degree = int(degree)
+        self.num_ctrl = int(num_ctrl)
+        self.u_min = float(self.knots[self.degree])
+        self.u_max = float(self.knots[self.num_ctrl])
+        self._span_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+    def clamp(self, u: np.ndarray) -> np.ndarray:
+        """Begrenzt Parameter auf den gültigen Knotenbereich."""
+        return np.clip(np.asarray(u, dtype=float), self.u_min, self.u_max)
+
+    def find_spans(self, u: np.ndarray) -> np.ndarray:
+        """
+        Knoten-Span Index für jedes u (knots[span] <= u < knots[span+1]).
+
+        Am Bereichsende wird der letzte nicht-degenerierte Span verwendet.
+        """
+        key = u.tobytes()
+        spans = self._span_cache.get(key)
+        if spans is not None:
+            self._span_cache.move_to_end(key)
+            return spans
+
+        spans = np.where(
+            u >= self.u_max,
+            np.searchsorted(self.knots, u, side='left') - 1,
+            np.searchsorted(self.knots, u, side='right') - 1,
+        )
+        spans = np.clip(spans, self.degree, self.num_ctrl - 1)
+        spans.setflags(write=False)
+
+        self._span_cache[key] = spans
+        if len(self._span_cache) > self._SPAN_CACHE_SIZE:
+            self._span_cache.popitem(last=False)
+        return spans
+
+    def derivatives(self, u: np.ndarray, spans: np.ndarray, order: int) -> np.ndarray:
+        """
+        Basisfunktionen und Ableitungen bis ``order`` (NURBS Book A2.3).
+
+        Returns:
+            Array (m, order+1, degree+1): ders[:, k, r] = N^(k)_{span-p+r}(u)
+        """
+        p = self.degree
+        k = self.knots
+        m = u.shape[0]
+
+        # Dreieckstabelle: obere Hälfte Basisfunktionen, untere Knotendifferenzen
+        ndu = np.empty((m, p + 1, p + 1))
+        ndu[:, 0, 0] = 1.0
+        left = np.empty((m, p + 1))
+        right = np.empty((m, p + 1))
+
+        for j in range(1, p + 1):
+            left[:, j] = u - k[spans + 1 - j]
+            right[:, j] = k[spans + j] - u
+            saved = np.zeros(m)
+            for r in range(j):
+                ndu[:, j, r] = right[:, r + 1] + left[:, j - r]
+                temp = ndu[:, r, j - 1] / ndu[:, j, r]
+                ndu[:, r, j] = saved + right[:, r + 1] * temp
+                saved = left[:, j - r] * temp
+            ndu[:, j, j] = saved
+
+        ders = np.zeros((m, order + 1, p + 1))
+        ders[:, 0, :] = ndu[:, :, p]
+
+        # Ableitungen höher als der Grad sind identisch null
+        n_eff = min(order, p)
+        if n_eff == 0:
+            return ders
+
+        a = np.empty((m, 2, n_eff + 1))
+        for r in range(p + 1):
+            s1, s2 = 0, 1
+            a[:, 0, 0] = 1.0
+            for kk in range(1, n_eff + 1):
+                d = np.zeros(m)
+                rk = r - kk
+                pk = p - kk
+                if r >= kk:
+                    a[:, s2, 0] = a[:, s1, 0] / ndu[:, pk + 1, rk]
+                    d += a[:, s2, 0] * ndu[:, rk, pk]
+                j1 = 1 if rk >= -1 else -rk
+                j2 = kk - 1 if r - 1 <= pk else p - r
+                for j in range(j1, j2 + 1):
+                    a[:, s2, j] = (a[:, s1, j] - a[:, s1, j - 1]) / ndu[:, pk + 1, rk + j]
+                    d += a[:, s2, j] * ndu[:, rk + j, pk]
+                if r <= pk:
+                    a[:, s2, kk] = -a[:, s1, kk - 1] / ndu[:, pk + 1, r]
+                    d += a[:, s2, kk] * ndu[:, r, pk]
+                ders[:, kk, r] = d
+                s1, s2 = s2, s1
+
+        factor = p
+        for kk in range(1, n_eff + 1):
+            ders[:, kk, :] *= factor
+            factor *= p - kk
+
+        return ders
+
+    def control_indices(self, spans: np.ndarray) -> np.ndarray:
+        """Indizes der p+1 aktiven Kontrollpunkte pro Span: (m, degree+1)."""
+        return spans[:, None] - self.degree + np.arange(self.degree + 1)
+
+
+def _basis_for(owner: Any, attr: str, knots: List[float], degree: int, num_ctrl: int) -> BSplineBasis:
+    """
+    Liefert die gecachte BSplineBasis eines Objekts.
+
+    Die Dataclass-Felder sind mutable Listen, deshalb wird die Basis neu
+    aufgebaut sobald sich Knoten, Grad oder Kontrollpunkt-Anzahl ändern.
+    """
+    signature = (tuple(knots), degree, num_ctrl)
+    cached = owner.__dict__.get(attr)
+    if cached is None or cached[0] != signature:
+        cached = (signature, BSplineBasis(knots, degree, num_ctrl))
+        owner.__dict__[attr] = cached
+    return cached[1]
+
+
+def _safe_weight(w: np.ndarray) -> np.ndarray:
+    """Schützt die rationale Division gegen degenerierte Gewichtssummen."""
+    return np.where(np.abs(w) < 1e-10, 1.0, w)
+
+
 @dataclass
 class NURBSCurve:
     """
@@ -131,45 +272,80 @@ class NURBSCurve:
 
         return knots
 
-    def _basis_function(self, i: int, p: int, u: float) -> float:
-        """
-        Berechnet B-Spline Basisfunktion N_i,p(u) rekursiv.
-
-        Cox-de Boor Rekursionsformel.
-        """
-        if p == 0:
-            # Basis-Fall
-            if self.knots[i] <= u < self.knots[i + 1]:
-                return 1.0
-            # Sonderfall für u = 1.0 am Ende
-            elif u == self.knots[i + 1] == 1.0 and self.knots[i] < 1.0:
-                return 1.0
-            return 0.0
+    def _basis(self) -> BSplineBasis:
+        """Gecachte vektorisierte Basis für den aktuellen Knotenvektor."""
+        return _basis_for(self, '_basis_cache', self.knots, self.degree, len(self.control_points))
 
-        # Rekursion
-        result = 0.0
+    def _homogeneous_points(self) -> np.ndarray:
+        """Kontrollpunkte in homogenen Koordinaten (w*x, w*y, w*z, w)."""
+        w = np.asarray(self.weights, dtype=float)
+        P = np.asarray(self.control_points, dtype=float).reshape(-1, 3)
+        return np.column_stack((P * w[:, None], w))
 
-        # Erster Term
-        denom1 = self.knots[i + p] - self.knots[i]
-        if denom1 != 0:
-            result += (u - self.knots[i]) / denom1 * self._basis_function(i, p - 1, u)
+    def _basis_functions_at(self, u: float) -> np.ndarray:
+        """Berechnet alle Basisfunktionen an u."""
+        basis = self._basis()
+        uu = basis.clamp(np.atleast_1d(u))
+        spans = basis.find_spans(uu)
+        N = np.zeros(len(self.control_points))
+        N[basis.control_indices(spans)[0]] = basis.derivatives(uu, spans, 0)[0, 0]
+        return N
 
-        # Zweiter Term
-        denom2 = self.knots[i + p + 1] - self.knots[i + 1]
-        if denom2 != 0:
-            result += (self.knots[i + p + 1] - u) / denom2 * self._basis_function(i + 1, p - 1, u)
+    def derivatives_array(self, u, order: int = 0) -> np.ndarray:
+        """
+        Batch-Auswertung von Punkt und Ableitungen für viele Parameter.
 
-        return result
+        Rationale Ableitungen nach NURBS Book A4.2 auf Basis der
+        homogenen B-Spline Ableitungen.
 
-    def _basis_functions_at(self, u: float) -> np.ndarray:
-        """Berechnet alle Basisfunktionen an u."""
-        n = len(self.control_points)
-        N = np.zeros(n)
+        Args:
+            u: Parameter (Skalar oder Array beliebiger Form)
+            order: Höchste Ableitungsordnung (0 = nur Punkte)
 
-        for i in range(n):
-            N[i] = self._basis_function(i, self.degree, u)
+        Returns:
+            Array (*u.shape, order+1, 3): [..., k, :] = C^(k)(u)
+        """
+        basis = self._basis()
+        uu = basis.clamp(u)
+        shape = uu.shape
+        uu = uu.ravel()
+
+        spans = basis.find_spans(uu)
+        ders = basis.derivatives(uu, spans, order)
+        Pw = self._homogeneous_points()[basis.control_indices(spans)]
+        Aw = np.einsum('mkr,mrc->mkc', ders, Pw)
+
+        A = Aw[..., :3]
+        W = Aw[..., 3]
+        w0 = _safe_weight(W[:, 0])[:, None]
+
+        CK = np.empty_like(A)
+        for k in range(order + 1):
+            v = A[:, k].copy()
+            for i in range(1, k + 1):
+                v -= comb(k, i) * W[:, i, None] * CK[:, k - i]
+            CK[:, k] = v / w0
+
+        return CK.reshape(shape + (order + 1, 3))
+
+    def evaluate_array(self, u) -> np.ndarray:
+        """
+        Evaluiert die Kurve an vielen Parametern auf einmal.
 
-        return N
+        Returns:
+            Array (*u.shape, 3)
+        """
+        return self.derivatives_array(u, 0)[..., 0, :]
+
+    def curvature_array(self, u) -> np.ndarray:
+        """Krümmung κ = |C' × C''| / |C'|³ für ein Parameter-Array."""
+        CK = self.derivatives_array(u, 2)
+        d1 = CK[..., 1, :]
+        d2 = CK[..., 2, :]
+        numerator = np.linalg.norm(np.cross(d1, d2), axis=-1)
+        denominator = np.linalg.norm(d1, axis=-1) ** 3
+        safe = denominator >= 1e-10
+        return np.where(safe, numerator / np.where(safe, denominator, 1.0), 0.0)
 
     def evaluate(self, u: float) -> Tuple[float, float, float]:
         """
@@ -183,28 +359,7 @@ class NURBSCurve:
         Returns:
             Punkt (x, y, z) auf der Kurve
         """
-        u = max(0.0, min(1.0, u))  # Clamp to [0, 1]
-
-        n = len(self.control_points)
-        P = np.array(self.control_points)
-        w = np.array(self.weights)
-
-        # Basisfunktionen berechnen
-        N = self._basis_functions_at(u)
-
-        # Gewichtete Summe (NURBS Formel)
-        numerator = np.zeros(3)
-        denominator = 0.0
-
-        for i in range(n):
-            numerator += N[i] * w[i] * P[i]
-            denominator += N[i] * w[i]
-
-        if abs(denominator) < 1e-10:
-            # Fallback: Ungewichteter Durchschnitt
-            return tuple(numerator / max(sum(N), 1e-10))
-
-        result = numerator / denominator
+        result = self.evaluate_array(float(u))
         return (float(result[0]), float(result[1]), float(result[2]))
 
     def evaluate_points(self, num_points: int = 50) -> List[Tuple[float, float, float]]:
@@ -217,17 +372,18 @@ class NURBSCurve:
         Returns:
             Liste von Punkten auf der Kurve
         """
-        points = []
-        for i in range(num_points):
-            u = i / (num_points - 1) if num_points > 1 else 0.0
-            points.append(self.evaluate(u))
-        return points
+        basis = self._basis()
+        if num_points > 1:
+            us = np.linspace(basis.u_min, basis.u_max, num_points)
+        else:
+            us = np.full(max(num_points, 0), basis.u_min)
+        return [tuple(p) for p in self.evaluate_array(us).tolist()]
 
     def derivative(self, u: float, order: int = 1) -> Tuple[float, float, float]:
         """
         Berechnet n-te Ableitung an u.
 
-        Verwendet numerische Differentiation für Robustheit.
+        Analytisch über die Basisfunktions-Ableitungen (beliebige Ordnung).
 
         Args:
             u: Parameter
@@ -236,26 +392,7 @@ class NURBSCurve:
         Returns:
             Ableitungsvektor (dx, dy, dz)
         """
-        h = 1e-6  # Schrittweite
-
-        if order == 1:
-            # Zentrale Differenz für erste Ableitung
-            p_plus = np.array(self.evaluate(min(u + h, 1.0)))
-            p_minus = np.array(self.evaluate(max(u - h, 0.0)))
-            deriv = (p_plus - p_minus) / (2 * h)
-
-        elif order == 2:
-            # Zentrale Differenz für zweite Ableitung
-            p_plus = np.array(self.evaluate(min(u + h, 1.0)))
-            p_center = np.array(self.evaluate(u))
-            p_minus = np.array(self.evaluate(max(u - h, 0.0)))
-            deriv = (p_plus - 2 * p_center + p_minus) / (h * h)
-
-        else:
-            # Höhere Ableitungen rekursiv
-            deriv = np.zeros(3)
-            logger.warning(f"Ableitung Ordnung {order} nicht implementiert")
-
+        deriv = self.derivatives_array(float(u), order)[order]
         return (float(deriv[0]), float(deriv[1]), float(deriv[2]))
 
     def tangent(self, u: float) -> Tuple[float, float, float]:
@@ -283,8 +420,9 @@ class NURBSCurve:
         Returns:
             Einheitsvektor in Normalenrichtung
         """
-        d1 = np.array(self.derivative(u, 1))
-        d2 = np.array(self.derivative(u, 2))
+        CK = self.derivatives_array(float(u), 2)
+        d1 = CK[1]
+        d2 = CK[2]
 
         # Formel: N = (d1 × (d2 × d1)) / |d1 × (d2 × d1)|
         cross1 = np.cross(d2, d1)
@@ -313,17 +451,7 @@ class NURBSCurve:
         Returns:
             Krümmung (1/Radius)
         """
-        d1 = np.array(self.derivative(u, 1))
-        d2 = np.array(self.derivative(u, 2))
-
-        cross = np.cross(d1, d2)
-        numerator = np.linalg.norm(cross)
-        denominator = np.linalg.norm(d1) ** 3
-
-        if denominator < 1e-10:
-            return 0.0
-
-        return numerator / denominator
+        return float(self.curvature_array(float(u)))
 
     def curvature_radius(self, u: float) -> float:
         """
@@ -341,21 +469,25 @@ class NURBSCurve:
         """
         Berechnet Bogenlänge zwischen u_start und u_end.
 
-        Verwendet numerische Integration (Simpson).
+        Verwendet numerische Integration (Simpson) über |C'(u)|,
+        alle Stützstellen in einem Batch ausgewertet.
 
         Returns:
             Bogenlänge in Einheiten der Kontrollpunkte
         """
-        total = 0.0
-        prev_point = np.array(self.evaluate(u_start))
+        basis = self._basis()
+        a, b = basis.clamp(np.array([u_start, u_end]))
+        if a == b:
+            return 0.0
 
-        for i in range(1, num_samples + 1):
-            u = u_start + (u_end - u_start) * i / num_samples
-            point = np.array(self.evaluate(u))
-            total += np.linalg.norm(point - prev_point)
-            prev_point = point
+        intervals = max(2, num_samples + (num_samples % 2))
+        us = np.linspace(a, b, intervals + 1)
+        speed = np.linalg.norm(self.derivatives_array(us, 1)[:, 1], axis=-1)
 
-        return total
+        weights = np.ones(intervals + 1)
+        weights[1:-1:2] = 4.0
+        weights[2:-1:2] = 2.0
+        return float(abs(b - a) / (3.0 * intervals) * np.dot(weights, speed))
 
     def to_ocp(self):
         """
@@ -593,45 +725,124 @@ class NURBSSurface:
         if not self.knots_v:
             self.knots_v = NURBSCurve._create_clamped_uniform_knots(nv, self.degree_v)
 
-    def _basis_function_u(self, i: int, p: int, u: float) -> float:
-        """B-Spline Basisfunktion in U-Richtung."""
-        if p == 0:
-            if self.knots_u[i] <= u < self.knots_u[i + 1]:
-                return 1.0
-            elif u == self.knots_u[i + 1] == 1.0 and self.knots_u[i] < 1.0:
-                return 1.0
-            return 0.0
+    def _basis_u(self) -> BSplineBasis:
+        """Gecachte vektorisierte Basis in U-Richtung."""
+        return _basis_for(self, '_basis_u_cache', self.knots_u, self.degree_u, len(self.control_points))
 
-        result = 0.0
-        denom1 = self.knots_u[i + p] - self.knots_u[i]
-        if denom1 != 0:
-            result += (u - self.knots_u[i]) / denom1 * self._basis_function_u(i, p - 1, u)
+    def _basis_v(self) -> BSplineBasis:
+        """Gecachte vektorisierte Basis in V-Richtung."""
+        return _basis_for(self, '_basis_v_cache', self.knots_v, self.degree_v, len(self.control_points[0]))
 
-        denom2 = self.knots_u[i + p + 1] - self.knots_u[i + 1]
-        if denom2 != 0:
-            result += (self.knots_u[i + p + 1] - u) / denom2 * self._basis_function_u(i + 1, p - 1, u)
+    def _homogeneous_points(self) -> np.ndarray:
+        """Kontrollpunkt-Grid in homogenen Koordinaten: (nu, nv, 4)."""
+        w = np.asarray(self.weights, dtype=float)
+        P = np.asarray(self.control_points, dtype=float)
+        return np.concatenate((P * w[..., None], w[..., None]), axis=-1)
 
-        return result
+    def derivatives_array(self, u, v, order: int = 0) -> np.ndarray:
+        """
+        Batch-Auswertung von Punkt und partiellen Ableitungen.
 
-    def _basis_function_v(self, j: int, q: int, v: float) -> float:
-        """B-Spline Basisfunktion in V-Richtung."""
-        if q == 0:
-            if self.knots_v[j] <= v < self.knots_v[j + 1]:
-                return 1.0
-            elif v == self.knots_v[j + 1] == 1.0 and self.knots_v[j] < 1.0:
-                return 1.0
-            return 0.0
+        Rationale Ableitungen nach NURBS Book A4.4. u und v werden
+        gegeneinander gebroadcastet.
 
-        result = 0.0
-        denom1 = self.knots_v[j + q] - self.knots_v[j]
-        if denom1 != 0:
-            result += (v - self.knots_v[j]) / denom1 * self._basis_function_v(j, q - 1, v)
+        Args:
+            u: Parameter in U-Richtung (Skalar oder Array)
+            v: Parameter in V-Richtung (Skalar oder Array)
+            order: Höchste Gesamtordnung k+l
 
-        denom2 = self.knots_v[j + q + 1] - self.knots_v[j + 1]
-        if denom2 != 0:
-            result += (self.knots_v[j + q + 1] - v) / denom2 * self._basis_function_v(j + 1, q - 1, v)
+        Returns:
+            Array (*shape, order+1, order+1, 3): [..., k, l, :] = ∂^(k+l)S / ∂u^k ∂v^l
+            (nur Einträge mit k+l <= order sind belegt)
+        """
+        basis_u = self._basis_u()
+        basis_v = self._basis_v()
+        uu, vv = np.broadcast_arrays(basis_u.clamp(u), basis_v.clamp(v))
+        shape = uu.shape
+        uu = np.ascontiguousarray(uu).ravel()
+        vv = np.ascontiguousarray(vv).ravel()
+
+        spans_u = basis_u.find_spans(uu)
+        spans_v = basis_v.find_spans(vv)
+        Nu = basis_u.derivatives(uu, spans_u, order)
+        Nv = basis_v.derivatives(vv, spans_v, order)
+
+        idx_u = basis_u.control_indices(spans_u)
+        idx_v = basis_v.control_indices(spans_v)
+        Pw = self._homogeneous_points()[idx_u[:, :, None], idx_v[:, None, :]]
+        Aw = np.einsum('mki,mlj,mijc->mklc', Nu, Nv, Pw)
+
+        A = Aw[..., :3]
+        W = Aw[..., 3]
+        w0 = _safe_weight(W[:, 0, 0])[:, None]
+
+        SKL = np.zeros_like(A)
+        for k in range(order + 1):
+            for l in range(order - k + 1):
+                val = A[:, k, l].copy()
+                for j in range(1, l + 1):
+                    val -= comb(l, j) * W[:, 0, j, None] * SKL[:, k, l - j]
+                for i in range(1, k + 1):
+                    val -= comb(k, i) * W[:, i, 0, None] * SKL[:, k - i, l]
+                    mixed = np.zeros_like(val)
+                    for j in range(1, l + 1):
+                        mixed += comb(l, j) * W[:, i, j, None] * SKL[:, k - i, l - j]
+                    val -= comb(k, i) * mixed
+                SKL[:, k, l] = val / w0
+
+        return SKL.reshape(shape + (order + 1, order + 1, 3))
+
+    def evaluate_array(self, u, v) -> np.ndarray:
+        """
+        Evaluiert die Fläche an vielen (u, v) Paaren auf einmal.
 
-        return result
+        Returns:
+            Array (*shape, 3)
+        """
+        return self.derivatives_array(u, v, 0)[..., 0, 0, :]
+
+    def normal_array(self, u, v) -> np.ndarray:
+        """Einheits-Normalen ∂S/∂u × ∂S/∂v für viele (u, v) Paare."""
+        SKL = self.derivatives_array(u, v, 1)
+        n = np.cross(SKL[..., 1, 0, :], SKL[..., 0, 1, :])
+        return self._normalize_normals(n)
+
+    @staticmethod
+    def _normalize_normals(n: np.ndarray) -> np.ndarray:
+        length = np.linalg.norm(n, axis=-1, keepdims=True)
+        degenerate = length[..., 0] < 1e-10
+        n = n / np.where(length < 1e-10, 1.0, length)
+        n[degenerate] = (0.0, 0.0, 1.0)  # Fallback
+        return n
+
+    def _fundamental_forms(self, u, v):
+        """Erste und zweite Fundamentalform (E, F, G, L, M, N) als Arrays."""
+        SKL = self.derivatives_array(u, v, 2)
+        du = SKL[..., 1, 0, :]
+        dv = SKL[..., 0, 1, :]
+        n = self._normalize_normals(np.cross(du, dv))
+
+        E = np.einsum('...c,...c->...', du, du)
+        F = np.einsum('...c,...c->...', du, dv)
+        G = np.einsum('...c,...c->...', dv, dv)
+        L = np.einsum('...c,...c->...', SKL[..., 2, 0, :], n)
+        M = np.einsum('...c,...c->...', SKL[..., 1, 1, :], n)
+        N = np.einsum('...c,...c->...', SKL[..., 0, 2, :], n)
+        return E, F, G, L, M, N
+
+    def gaussian_curvature_array(self, u, v) -> np.ndarray:
+        """Gauß-Krümmung K = (LN - M²) / (EG - F²) für viele (u, v) Paare."""
+        E, F, G, L, M, N = self._fundamental_forms(u, v)
+        denom = E * G - F * F
+        safe = np.abs(denom) >= 1e-10
+        return np.where(safe, (L * N - M * M) / np.where(safe, denom, 1.0), 0.0)
+
+    def mean_curvature_array(self, u, v) -> np.ndarray:
+        """Mittlere Krümmung H = (EN - 2FM + GL) / 2(EG - F²) für viele (u, v) Paare."""
+        E, F, G, L, M, N = self._fundamental_forms(u, v)
+        denom = 2 * (E * G - F * F)
+        safe = np.abs(denom) >= 1e-10
+        return np.where(safe, (E * N - 2 * F * M + G * L) / np.where(safe, denom, 1.0), 0.0)
 
     def evaluate(self, u: float, v: float) -> Tuple[float, float, float]:
         """
@@ -644,46 +855,17 @@ class NURBSSurface:
         Returns:
             Punkt (x, y, z) auf der Fläche
         """
-        u = max(0.0, min(1.0, u))
-        v = max(0.0, min(1.0, v))
-
-        nu = len(self.control_points)
-        nv = len(self.control_points[0])
-
-        numerator = np.zeros(3)
-        denominator = 0.0
-
-        for i in range(nu):
-            Ni = self._basis_function_u(i, self.degree_u, u)
-
-            for j in range(nv):
-                Nj = self._basis_function_v(j, self.degree_v, v)
-                w = self.weights[i][j]
-                P = np.array(self.control_points[i][j])
-
-                numerator += Ni * Nj * w * P
-                denominator += Ni * Nj * w
-
-        if abs(denominator) < 1e-10:
-            return (0.0, 0.0, 0.0)
-
-        result = numerator / denominator
+        result = self.evaluate_array(float(u), float(v))
         return (float(result[0]), float(result[1]), float(result[2]))
 
     def partial_derivative_u(self, u: float, v: float) -> Tuple[float, float, float]:
         """Berechnet partielle Ableitung nach u."""
-        h = 1e-6
-        p_plus = np.array(self.evaluate(min(u + h, 1.0), v))
-        p_minus = np.array(self.evaluate(max(u - h, 0.0), v))
-        deriv = (p_plus - p_minus) / (2 * h)
+        deriv = self.derivatives_array(float(u), float(v), 1)[1, 0]
         return (float(deriv[0]), float(deriv[1]), float(deriv[2]))
 
     def partial_derivative_v(self, u: float, v: float) -> Tuple[float, float, float]:
         """Berechnet partielle Ableitung nach v."""
-        h = 1e-6
-        p_plus = np.array(self.evaluate(u, min(v + h, 1.0)))
-        p_minus = np.array(self.evaluate(u, max(v - h, 0.0)))
-        deriv = (p_plus - p_minus) / (2 * h)
+        deriv = self.derivatives_array(float(u), float(v), 1)[0, 1]
         return (float(deriv[0]), float(deriv[1]), float(deriv[2]))
 
     def normal(self, u: float, v: float) -> Tuple[float, float, float]:
@@ -695,16 +877,7 @@ class NURBSSurface:
         Returns:
             Einheits-Normalenvektor
         """
-        du = np.array(self.partial_derivative_u(u, v))
-        dv = np.array(self.partial_derivative_v(u, v))
-
-        n = np.cross(du, dv)
-        length = np.linalg.norm(n)
-
-        if length < 1e-10:
-            return (0.0, 0.0, 1.0)  # Fallback
-
-        n = n / length
+        n = self.normal_array(float(u), float(v))
         return (float(n[0]), float(n[1]), float(n[2]))
 
     def gaussian_curvature(self, u: float, v: float) -> float:
@@ -718,43 +891,7 @@ class NURBSSurface:
         Returns:
             Gauß-Krümmung K
         """
-        # Erste Fundamentalform
-        du = np.array(self.partial_derivative_u(u, v))
-        dv = np.array(self.partial_derivative_v(u, v))
-
-        E = np.dot(du, du)
-        F = np.dot(du, dv)
-        G = np.dot(dv, dv)
-
-        # Zweite Fundamentalform
-        h = 1e-5
-        n = np.array(self.normal(u, v))
-
-        # Zweite partielle Ableitungen (numerisch)
-        duu = (np.array(self.evaluate(min(u + h, 1), v)) -
-               2 * np.array(self.evaluate(u, v)) +
-               np.array(self.evaluate(max(u - h, 0), v))) / (h * h)
-
-        dvv = (np.array(self.evaluate(u, min(v + h, 1))) -
-               2 * np.array(self.evaluate(u, v)) +
-               np.array(self.evaluate(u, max(v - h, 0)))) / (h * h)
-
-        duv = (np.array(self.evaluate(min(u + h, 1), min(v + h, 1))) -
-               np.array(self.evaluate(min(u + h, 1), max(v - h, 0))) -
-               np.array(self.evaluate(max(u - h, 0), min(v + h, 1))) +
-               np.array(self.evaluate(max(u - h, 0), max(v - h, 0)))) / (4 * h * h)
-
-        L = np.dot(duu, n)
-        M = np.dot(duv, n)
-        N = np.dot(dvv, n)
-
-        # Gauß-Krümmung
-        denom = E * G - F * F
-        if abs(denom) < 1e-10:
-            return 0.0
-
-        K = (L * N - M * M) / denom
-        return K
+        return float(self.gaussian_curvature_array(float(u), float(v)))
 
     def mean_curvature(self, u: float, v: float) -> float:
         """
@@ -765,42 +902,7 @@ class NURBSSurface:
         Returns:
             Mittlere Krümmung H
         """
-        # Erste Fundamentalform
-        du = np.array(self.partial_derivative_u(u, v))
-        dv = np.array(self.partial_derivative_v(u, v))
-
-        E = np.dot(du, du)
-        F = np.dot(du, dv)
-        G = np.dot(dv, dv)
-
-        # Zweite Fundamentalform (wie oben)
-        h = 1e-5
-        n = np.array(self.normal(u, v))
-
-        duu = (np.array(self.evaluate(min(u + h, 1), v)) -
-               2 * np.array(self.evaluate(u, v)) +
-               np.array(self.evaluate(max(u - h, 0), v))) / (h * h)
-
-        dvv = (np.array(self.evaluate(u, min(v + h, 1))) -
-               2 * np.array(self.evaluate(u, v)) +
-               np.array(self.evaluate(u, max(v - h, 0)))) / (h * h)
-
-        duv = (np.array(self.evaluate(min(u + h, 1), min(v + h, 1))) -
-               np.array(self.evaluate(min(u + h, 1), max(v - h, 0))) -
-               np.array(self.evaluate(max(u - h, 0), min(v + h, 1))) +
-               np.array(self.evaluate(max(u - h, 0), max(v - h, 0)))) / (4 * h * h)
-
-        L = np.dot(duu, n)
-        M = np.dot(duv, n)
-        N = np.dot(dvv, n)
-
-        # Mittlere Krümmung
-        denom = 2 * (E * G - F * F)
-        if abs(denom) < 1e-10:
-            return 0.0
-
-        H = (E * N - 2 * F * M + G * L) / denom
-        return H
+        return float(self.mean_curvature_array(float(u), float(v)))
 
     def principal_curvatures(self, u: float, v: float) -> Tuple[float, float]:
         """
@@ -372,9 +372,8 @@ class OCPChamferHelper:
                 result_shape = chamfer_op.Shape()
                 if result_shape is not None and not result_shape.IsNull():
                     # Validate partial result before accepting
-                    from OCP.BRepCheck import BRepCheck_Analyzer
-                    analyzer = BRepCheck_Analyzer(result_shape)
-                    if not analyzer.IsValid():
+                    from modeling.shape_validation import ValidationTier, check_shape
+                    if not check_shape(result_shape, ValidationTier.FULL):
                         logger.warning(f"[CHAMFER] Partial result failed BRepCheck validation")
                         raise ValueError(f"Chamfer OCP-Build fehlgeschlagen: partial result is invalid")
                     # Partial success - we got a valid shape despite the exception
@@ -394,9 +393,8 @@ class OCPChamferHelper:
                 result_shape = chamfer_op.Shape()
                 if result_shape is not None and not result_shape.IsNull():
                     # Validate partial result before accepting
-                    from OCP.BRepCheck import BRepCheck_Analyzer
-                    analyzer = BRepCheck_Analyzer(result_shape)
-                    if not analyzer.IsValid():
+                    from modeling.shape_validation import ValidationTier, check_shape
+                    if not check_shape(result_shape, ValidationTier.FULL):
                         logger.warning(f"[CHAMFER] Partial result failed BRepCheck validation")
                         raise ValueError("Chamfer OCP-Operation fehlgeschlagen: partial result is invalid")
                     # Partial success - we got a valid shape despite IsDone() = False
@@ -0,0 +1,179 @@
+"""
+MashCad - Instanced Pattern Engine
+==================================
+
+Berechnet PatternFeatures als Instanzen eines einzigen Seed-Tools.
+
+Problem: Ein 20×20-Bohrungsmuster als 400 einzelne Features bedeutet 400
+Tool-Körper und 400 Booleans, jeder gegen ein immer komplexeres Solid.
+
+Lösung:
+- Das Tool des Seed-Features wird genau einmal gebaut
+- Die Platzierungen sind reine Transformationen (4×4-Matrizen / gp_Trsf)
+- Alle Instanzen teilen sich per TopoDS_Shape.Moved() dieselbe TShape und
+  gehen in einen einzigen Multi-Tool-Boolean gegen den Body
+- Die Viewport-Preview nutzt dieselben Matrizen (ein Mesh, N Actor-Transforms)
+
+Verwendung:
+    matrices = pattern_matrices(feature)              # (N, 4, 4), [0] = Identität
+    result = apply_pattern(current_solid, tool_shape, "Cut", matrices[1:])
+"""
+
+import math
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+try:
+    from OCP.BRep import BRep_Builder
+    from OCP.BRepBuilderAPI import BRepBuilderAPI_Transform
+    from OCP.gp import gp_Ax2, gp_Dir, gp_Pnt, gp_Trsf
+    from OCP.TopLoc import TopLoc_Location
+    from OCP.TopoDS import TopoDS_Compound
+    HAS_OCP = True
+except ImportError:
+    HAS_OCP = False
+
+
+MIRROR_PLANE_NORMALS = {
+    "XY": (0.0, 0.0, 1.0),
+    "XZ": (0.0, 1.0, 0.0),
+    "YZ": (1.0, 0.0, 0.0),
+}
+
+
+def _unit(vector: Sequence[float], name: str) -> np.ndarray:
+    v = np.asarray(vector, dtype=float)
+    norm = np.linalg.norm(v)
+    if norm < 1e-12:
+        raise ValueError(f"Pattern: {name} ist ein Nullvektor")
+    return v / norm
+
+
+def _rotation_matrix(axis: np.ndarray, angle: float) -> np.ndarray:
+    """Rodrigues-Rotation um eine normierte Achse."""
+    x, y, z = axis
+    k = np.array([[0.0, -z, y], [z, 0.0, -x], [-y, x, 0.0]])
+    return np.eye(3) + math.sin(angle) * k + (1.0 - math.cos(angle)) * (k @ k)
+
+
+def pattern_matrices(feature) -> np.ndarray:
+    """
+    Platzierungen eines PatternFeatures als (N, 4, 4)-Matrizen.
+
+    Index 0 ist immer die Identität (das Original/Seed), N entspricht
+    feature.get_total_instances().
+    """
+    ok, message = feature.validate()
+    if not ok:
+        raise ValueError(f"Pattern: {message}")
+
+    if feature.pattern_type == "Linear":
+        d1 = _unit(feature.direction_1, "direction_1")
+        rows = int(feature.count_2) if feature.count_2 else 1
+        d2 = _unit(feature.direction_2, "direction_2") if rows > 1 else np.zeros(3)
+        i, j = np.meshgrid(np.arange(int(feature.count)), np.arange(rows), indexing="xy")
+        offsets = (i.reshape(-1, 1) * d1 + j.reshape(-1, 1) * d2) * float(feature.spacing)
+        matrices = np.tile(np.eye(4), (len(offsets), 1, 1))
+        matrices[:, :3, 3] = offsets
+        return matrices
+
+    if feature.pattern_type == "Circular":
+        count = int(feature.count)
+        axis = _unit(feature.axis_direction, "axis_direction")
+        origin = np.asarray(feature.axis_origin, dtype=float)
+        total = float(feature.angle)
+        # Vollkreis: letzte Kopie darf nicht auf dem Original landen
+        step = total / count if total >= 360.0 - 1e-9 else total / (count - 1)
+        matrices = np.tile(np.eye(4), (count, 1, 1))
+        for k in range(1, count):
+            rot = _rotation_matrix(axis, math.radians(step * k))
+            matrices[k, :3, :3] = rot
+            matrices[k, :3, 3] = origin - rot @ origin
+        return matrices
+
+    # Mirror
+    normal = MIRROR_PLANE_NORMALS.get(str(feature.mirror_plane).upper(), feature.mirror_normal)
+    n = _unit(normal, "mirror_normal")
+    origin = np.asarray(feature.mirror_origin, dtype=float)
+    mirror = np.eye(4)
+    mirror[:3, :3] -= 2.0 * np.outer(n, n)
+    mirror[:3, 3] = 2.0 * float(np.dot(n, origin)) * n
+    return np.stack((np.eye(4), mirror))
+
+
+def matrix_to_trsf(matrix: np.ndarray) -> 'gp_Trsf':
+    """4×4-Matrix (starr oder Spiegelung) → gp_Trsf."""
+    trsf = gp_Trsf()
+    rot = matrix[:3, :3]
+    if np.linalg.det(rot) < 0:
+        # Spiegelung an Ebene durch Fixpunkt: Normale = Eigenvektor zu -1
+        eigvals, eigvecs = np.linalg.eigh(rot)
+        n = eigvecs[:, int(np.argmin(eigvals))]
+        origin = 0.5 * matrix[:3, 3]
+        trsf.SetMirror(gp_Ax2(gp_Pnt(*origin), gp_Dir(*n)))
+        return trsf
+    trsf.SetValues(*(float(v) for v in matrix[:3, :].reshape(-1)))
+    return trsf
+
+
+def _is_rigid(matrix: np.ndarray) -> bool:
+    return np.linalg.det(matrix[:3, :3]) > 0
+
+
+def instances(tool_shape: Any, matrices: Sequence[np.ndarray]) -> List[Any]:
+    """
+    N Instanzen von tool_shape.
+
+    Starre Platzierungen werden als TopLoc_Location angehängt (gleiche TShape,
+    keine Geometrie-Kopie). Spiegelungen sind als Location nicht erlaubt und
+    werden einzeln kopiert.
+    """
+    shape = tool_shape.wrapped if hasattr(tool_shape, 'wrapped') else tool_shape
+    placed = []
+    for matrix in matrices:
+        trsf = matrix_to_trsf(matrix)
+        if _is_rigid(matrix):
+            placed.append(shape.Moved(TopLoc_Location(trsf)))
+        else:
+            placed.append(BRepBuilderAPI_Transform(shape, trsf, True).Shape())
+    return placed
+
+
+def _compound(shapes: Sequence[Any]) -> 'TopoDS_Compound':
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for shape in shapes:
+        builder.Add(compound, shape)
+    return compound
+
+
+def instanced_compound(tool_shape: Any, matrices: Sequence[np.ndarray]) -> 'TopoDS_Compound':
+    """Compound aller Instanzen (z.B. für TNP-Registrierung der Tool-Faces)."""
+    return _compound(instances(tool_shape, matrices))
+
+
+def apply_pattern(current_solid: Any, tool_shape: Any, operation: str,
+                  matrices: Sequence[np.ndarray]) -> Tuple[Any, Any]:
+    """
+    Wendet alle Instanzen (ohne Original) mit einem Multi-Tool-Boolean an.
+
+    Überlappende Instanzen trennt BooleanEngineV4.execute_boolean_multi()
+    selbst per Bounding-Box-Gruppierung.
+
+    Returns:
+        (BooleanResult, Compound aller Instanzen)
+    """
+    from modeling.boolean_engine_v4 import BooleanEngineV4
+
+    if not HAS_OCP:
+        raise RuntimeError("Pattern: OpenCASCADE nicht verfügbar")
+    if not len(matrices):
+        raise ValueError("Pattern: Keine Instanzen zu platzieren")
+
+    placed = instances(tool_shape, matrices)
+    logger.debug(f"Pattern: {len(placed)} Instanzen in einem {operation}")
+    result = BooleanEngineV4.execute_boolean_multi(current_solid, placed, operation)
+    return result, _compound(placed)
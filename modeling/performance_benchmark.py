@@ -29,6 +29,7 @@ Branch: feature/v1-roadmap-execution
 """
 
 import json
+import math
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
@@ -605,6 +606,357 @@ class PerformanceBenchmark:
             error_message=error_message
         )
     
+    def _create_pin_grid(self, n_tools: int, spacing: float = 5.0) -> tuple:
+        """Create a plate and n_tools through-pins on a grid (shared TShape)."""
+        from build123d import Align, Box, Cylinder
+
+        side = max(1, int(n_tools ** 0.5 + 0.999))
+        plate = Box(side * spacing, side * spacing, 5.0, align=(Align.MIN, Align.MIN, Align.MIN))
+        pin = Cylinder(1.0, 20.0)
+        tools = [
+            pin.moved(Location((spacing * (k % side + 0.5), spacing * (k // side + 0.5), 2.5)))
+            for k in range(n_tools)
+        ]
+        return plate, tools
+
+    def benchmark_boolean_multi(
+        self,
+        tool_counts: tuple = (10, 100, 500),
+        include_sequential: bool = True,
+    ) -> Dict[int, Dict[str, float]]:
+        """
+        Compare BooleanEngineV4.execute_boolean_multi with the sequential loop.
+
+        For each tool count a plate is cut by a grid of pins, once with one
+        execute_boolean_on_shapes() per tool and once with a single
+        execute_boolean_multi() call.
+
+        Args:
+            tool_counts: Tool counts to measure
+            include_sequential: False skips the (slow) sequential loop
+
+        Returns:
+            {n_tools: {"sequential_ms", "multi_ms", "speedup"}}
+        """
+        from modeling.boolean_engine_v4 import BooleanEngineV4
+
+        results: Dict[int, Dict[str, float]] = {}
+        for n_tools in tool_counts:
+            plate, tools = self._create_pin_grid(n_tools)
+            row: Dict[str, float] = {}
+
+            with BenchmarkTimer(f"boolean_multi_{n_tools}") as timer:
+                multi = BooleanEngineV4.execute_boolean_multi(plate, tools, "Cut")
+            if not multi.is_success:
+                raise RuntimeError(f"Multi boolean failed: {multi.message}")
+            row["multi_ms"] = timer.duration_ms
+
+            if include_sequential:
+                with BenchmarkTimer(f"boolean_sequential_{n_tools}") as timer:
+                    current = plate
+                    for tool in tools:
+                        step = BooleanEngineV4.execute_boolean_on_shapes(current, tool, "Cut")
+                        if not step.is_success:
+                            raise RuntimeError(f"Sequential boolean failed: {step.message}")
+                        current = step.value
+                row["sequential_ms"] = timer.duration_ms
+                row["speedup"] = row["sequential_ms"] / max(row["multi_ms"], 1e-9)
+
+            logger.info(f"Boolean multi ({n_tools} tools): {row}")
+            results[n_tools] = row
+        return results
+    
+    def benchmark_boolean_memo(self, n_tools: int = 16, cycles: int = 4) -> Dict[str, Any]:
+        """
+        Measure the boolean result memo on a parameter drag / undo-redo cycle.
+
+        A pin grid plate is cut by a probe pin that alternates between two
+        positions. Every step rebuilds plate and probe as new objects (like a
+        rebuild does), so warm steps exercise the history replay path.
+
+        Args:
+            n_tools: Pins pre-cut into the plate (makes the boolean non-trivial)
+            cycles: Number of A/B round trips after the cold pass
+
+        Returns:
+            {"cold_ms", "warm_ms", "speedup", "stats"} - times are per boolean,
+            stats is BooleanResultCache.stats()
+        """
+        from build123d import Cylinder
+        from modeling.boolean_engine_v4 import BooleanEngineV4, BooleanResultCache
+
+        plate, tools = self._create_pin_grid(n_tools)
+        body = BooleanEngineV4.execute_boolean_multi(plate, tools, "Cut").value
+        if body is None:
+            raise RuntimeError("Memo benchmark: pin grid boolean failed")
+        positions = [(0.0, 0.0, 2.5), (2.5, 2.5, 2.5)]
+
+        def step(position):
+            target = body.moved(Location((0, 0, 0)))
+            probe = Cylinder(1.5, 20.0).moved(Location(position))
+            with BenchmarkTimer("boolean_memo_step") as timer:
+                result = BooleanEngineV4.execute_boolean_on_shapes(target, probe, "Cut")
+            if not result.is_success:
+                raise RuntimeError(f"Memo benchmark boolean failed: {result.message}")
+            return timer.duration_ms
+
+        BooleanResultCache.clear()
+        cold = [step(position) for position in positions]
+        warm = [step(position) for _ in range(cycles) for position in positions]
+
+        row = {
+            "cold_ms": sum(cold) / len(cold),
+            "warm_ms": sum(warm) / len(warm),
+            "stats": BooleanResultCache.stats(),
+        }
+        row["speedup"] = row["cold_ms"] / max(row["warm_ms"], 1e-9)
+        logger.info(f"Boolean memo: {row}")
+        return row
+
+    def benchmark_transform_tessellation(self, quality: float = 0.01, moves: int = 4) -> Dict[str, Any]:
+        """
+        Measure display tessellation of a body that is moved/rotated repeatedly.
+
+        The first tessellation is cold; every following step applies a
+        TransformFeature (move or rotate) and tessellates the result, which
+        should only place the cached local-frame mesh.
+
+        Args:
+            quality: Linear deflection (smaller = more triangles)
+            moves: Number of transform steps after the cold pass
+
+        Returns:
+            {"cold_ms", "warm_ms", "speedup", "triangles"} - warm_ms is per step
+        """
+        from build123d import Cylinder, Sphere
+        from modeling import Body, TransformFeature
+        from modeling.cad_tessellator import CADTessellator
+
+        solid = Sphere(20.0) - Cylinder(5.0, 60.0)
+        body = Body("transform_benchmark")
+
+        CADTessellator.clear_cache()
+        with BenchmarkTimer("tessellate_cold") as timer:
+            mesh, _, _ = CADTessellator.tessellate_with_face_ids(solid, quality=quality)
+        cold_ms = timer.duration_ms
+
+        warm = []
+        for i in range(moves):
+            feature = (TransformFeature(mode="move", data={"translation": [10.0, 5.0, 0.0]}) if i % 2 == 0
+                       else TransformFeature(mode="rotate", data={"axis": "Z", "angle": 30.0}))
+            solid = body._apply_transform_feature(solid, feature)
+            with BenchmarkTimer("tessellate_moved") as timer:
+                CADTessellator.tessellate_with_face_ids(solid, quality=quality)
+            warm.append(timer.duration_ms)
+
+        row = {
+            "cold_ms": cold_ms,
+            "warm_ms": sum(warm) / len(warm),
+            "triangles": mesh.n_cells if mesh is not None else 0,
+        }
+        row["speedup"] = row["cold_ms"] / max(row["warm_ms"], 1e-9)
+        logger.info(f"Transform tessellation: {row}")
+        return row
+
+    def benchmark_sketch_regions(self, holes: int = 1000, pitch: float = 10.0) -> Dict[str, Any]:
+        """
+        Measure sketch region detection on a perforated plate.
+
+        The plate is a rectangle with `holes` circles on a square grid. After
+        the cold pass one circle is resized, which should only rebuild that
+        circle's region and the plate ring around it.
+
+        Args:
+            holes: Number of circular holes
+            pitch: Grid spacing of the holes in mm
+
+        Returns:
+            {"cold_ms", "edit_ms", "unchanged_ms", "regions", "regions_rebuilt", "speedup"}
+        """
+        from sketcher import Sketch
+        from sketcher.regions import SketchRegionIndex
+
+        side = math.ceil(math.sqrt(holes))
+        sketch = Sketch("perforated_plate")
+        sketch.add_rectangle(0.0, 0.0, side * pitch, side * pitch)
+        for k in range(holes):
+            sketch.add_circle(pitch * (k % side + 0.5), pitch * (k // side + 0.5), pitch * 0.3)
+
+        index = SketchRegionIndex()
+        with BenchmarkTimer("regions_cold") as timer:
+            regions = index.update(sketch)
+        cold_ms = timer.duration_ms
+
+        with BenchmarkTimer("regions_unchanged") as timer:
+            index.update(sketch)
+        unchanged_ms = timer.duration_ms
+
+        sketch.circles[holes // 2].radius = pitch * 0.2
+        with BenchmarkTimer("regions_edit") as timer:
+            index.update(sketch)
+        edit_ms = timer.duration_ms
+
+        row = {
+            "cold_ms": cold_ms,
+            "edit_ms": edit_ms,
+            "unchanged_ms": unchanged_ms,
+            "regions": len(regions),
+            "regions_rebuilt": index.last_stats["regions_rebuilt"],
+        }
+        row["speedup"] = row["cold_ms"] / max(row["edit_ms"], 1e-9)
+        logger.info(f"Sketch regions: {row}")
+        return row
+
+    def benchmark_mate_solver(self, components: int = 200, pitch: float = 10.0) -> Dict[str, Any]:
+        """
+        Measure the assembly mate solver on a chain and a grid assembly.
+
+        Chain: components in a slack row, DISTANCE + PARALLEL to the next
+        one, every 20th component fixed (independent clusters in between).
+        Grid: components on a 10-column grid, DISTANCE to the right and
+        lower neighbour, PARALLEL to the right one, first component fixed.
+        Start positions and rotations are perturbed (seeded).
+
+        Args:
+            components: Number of components per assembly
+            pitch: Nominal spacing in mm
+
+        Returns:
+            {"chain": row, "grid": row} with row = {"ms", "iterations",
+            "clusters", "unknowns", "final_error", "success"}
+        """
+        import numpy as np
+        from modeling.component_core import Component, ComponentTransform
+        from modeling.mate_solver import MateSolver
+        from modeling.mate_system import Mate, MateReference, MateType
+
+        rng = np.random.default_rng(0)
+        columns = 10
+
+        def assembly(layout: str):
+            comps, mates = {}, []
+            if layout == "chain":
+                fixed = {f"c{k}" for k in range(0, components, 20)}
+            else:
+                fixed = {"c0"}
+            for k in range(components):
+                if layout == "chain":
+                    # Slack chain: anchors closer than the link length allows
+                    nominal = (k * pitch * 0.8, 0.0, 0.0)
+                else:
+                    nominal = ((k % columns) * pitch, (k // columns) * pitch, 0.0)
+                noise = f"c{k}" not in fixed
+                position = tuple(float(v) for v in np.add(nominal, rng.normal(0.0, 1.0, 3) * noise))
+                rotation = tuple(float(v) for v in rng.normal(0.0, 5.0, 3) * noise)
+                comps[f"c{k}"] = Component(
+                    component_id=f"c{k}", name=f"c{k}",
+                    transform=ComponentTransform(position=position, rotation=rotation),
+                )
+
+            def link(a: int, b: int, parallel: bool):
+                ref1 = MateReference(f"c{a}", "vertex", "origin")
+                ref2 = MateReference(f"c{b}", "vertex", "origin")
+                mates.append(Mate(mate_type=MateType.DISTANCE, reference1=ref1,
+                                  reference2=ref2, parameters={"distance": pitch}))
+                if parallel:
+                    mates.append(Mate(mate_type=MateType.PARALLEL,
+                                      reference1=MateReference(f"c{a}", "face", "top"),
+                                      reference2=MateReference(f"c{b}", "face", "top")))
+
+            if layout == "chain":
+                for k in range(components - 1):
+                    link(k, k + 1, True)
+            else:
+                for k in range(components):
+                    if k % columns < columns - 1 and k + 1 < components:
+                        link(k, k + 1, True)
+                    if k + columns < components:
+                        link(k, k + columns, False)
+            return comps, mates, fixed
+
+        rows = {}
+        for layout in ("chain", "grid"):
+            comps, mates, fixed = assembly(layout)
+            solver = MateSolver()
+            with BenchmarkTimer(f"mate_solver_{layout}") as timer:
+                result = solver.solve(comps, mates, fixed_components=fixed)
+            rows[layout] = {
+                "ms": timer.duration_ms,
+                "iterations": result.iterations,
+                "clusters": solver.last_stats["clusters"],
+                "unknowns": solver.last_stats["unknowns"],
+                "final_error": result.final_error,
+                "success": result.success,
+            }
+        logger.info(f"Mate solver: {rows}")
+        return rows
+
+    def benchmark_threads(self, threads: int = 12, pitch: float = 15.0) -> Dict[str, Any]:
+        """
+        Measure cosmetic vs. geometric threads on a plate.
+
+        The plate carries `threads` identical M8 threads on a row. The
+        cosmetic rebuild leaves the BREP untouched; the export solid cuts all
+        cached, location-placed tools in one multi-tool boolean. The geometric
+        rebuild (cosmetic=False) applies one thread per feature.
+
+        Args:
+            threads: Number of identical threads
+            pitch: Spacing of the threads in mm
+
+        Returns:
+            {"cosmetic_rebuild_ms", "export_ms", "export_cached_ms",
+             "geometric_rebuild_ms", "sweeps", "tool_hits", "volume_removed"}
+        """
+        from modeling import Body, PrimitiveFeature, ThreadFeature
+        from modeling.thread_tools import ThreadToolCache
+
+        ThreadToolCache.clear()
+        body = Body("thread_plate")
+        body.add_feature(PrimitiveFeature(
+            primitive_type="box", length=threads * pitch, width=pitch, height=20.0,
+        ), rebuild=False)
+        features = []
+        for k in range(threads):
+            feature = ThreadFeature(
+                thread_type="external", diameter=8.0, pitch=1.25, depth=12.0,
+                position=((k + 0.5) * pitch, pitch / 2.0, 2.0), direction=(0.0, 0.0, 1.0),
+            )
+            features.append(feature)
+            body.add_feature(feature, rebuild=False)
+
+        with BenchmarkTimer("threads_cosmetic_rebuild") as timer:
+            body._rebuild()
+        cosmetic_ms = timer.duration_ms
+        base_volume = body._build123d_solid.volume
+
+        with BenchmarkTimer("threads_export") as timer:
+            threaded = body._get_solid_with_threads()
+        export_ms = timer.duration_ms
+
+        with BenchmarkTimer("threads_export_cached") as timer:
+            body._get_solid_with_threads()
+        export_cached_ms = timer.duration_ms
+
+        for feature in features:
+            feature.cosmetic = False
+        with BenchmarkTimer("threads_geometric_rebuild") as timer:
+            body._rebuild()
+        geometric_ms = timer.duration_ms
+
+        stats = ThreadToolCache.stats()
+        row = {
+            "cosmetic_rebuild_ms": cosmetic_ms,
+            "export_ms": export_ms,
+            "export_cached_ms": export_cached_ms,
+            "geometric_rebuild_ms": geometric_ms,
+            "sweeps": stats["misses"],
+            "tool_hits": stats["hits"],
+            "volume_removed": base_volume - threaded.volume,
+        }
+        logger.info(f"Threads: {row}")
+        return row
+
     def run_all_benchmarks(self, iterations: int = 3) -> BenchmarkReport:
         """
         Run all benchmarks and generate a report.
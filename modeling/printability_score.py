@@ -460,12 +460,12 @@ def calculate_printability_score(
 def _check_manifold_score(shape: Any, score: PrintabilityScore) -> None:
     """Prüft Manifold-Status und aktualisiert Score."""
     try:
-        from OCP.BRepCheck import BRepCheck_Analyzer
         from OCP.TopAbs import TopAbs_SOLID
         from OCP.TopExp import TopExp_Explorer
         from OCP.TopTools import TopTools_IndexedDataMapOfShapeListOfShape
         from OCP.TopExp import TopExp
         from OCP.TopAbs import TopAbs_EDGE, TopAbs_FACE
+        from modeling.shape_validation import ValidationTier, check_shape
         
         # Prüfe ob Shape ein Solid ist
         explorer = TopExp_Explorer(shape, TopAbs_SOLID)
@@ -479,9 +479,8 @@ def _check_manifold_score(shape: Any, score: PrintabilityScore) -> None:
             ))
             return
         
-        # BRepCheck Analyzer
-        analyzer = BRepCheck_Analyzer(shape)
-        if not analyzer.IsValid():
+        # Geschlossene Shells (Non-Manifold-Edges zählt der Check unten selbst)
+        if not check_shape(shape, ValidationTier.TOPOLOGY):
             score.add_issue(PrintabilityIssue(
                 severity=PrintabilitySeverity.ERROR,
                 category=PrintabilityCategory.MANIFOLD,
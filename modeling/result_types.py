@@ -25,7 +25,7 @@ Usage:
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
 from loguru import logger
 
 
@@ -270,11 +270,28 @@ class BooleanResult(OperationResult):
     operation_type: str = ""  # "fuse", "cut", "intersect"
     history: Any = None  # BRepTools_History (OCP) - für Phase 2 TNP
     history_details: Dict[str, Any] = None  # Detailed history mapping (High-Priority TODO)
+    stage_timings: Dict[str, float] = None  # Stage -> Millisekunden (Pre-Checks, Boolean, Validierung, ...)
     
     def __post_init__(self):
         """Initialize history_details if not set."""
         if self.history_details is None:
             self.history_details = {}
+        if self.stage_timings is None:
+            self.stage_timings = {}
+
+    def slowest_stage(self) -> Optional[Tuple[str, float]]:
+        """(Stage, ms) der teuersten Stufe ohne 'total', None wenn nicht gemessen."""
+        stages = {k: v for k, v in self.stage_timings.items() if k != "total"}
+        if not stages:
+            return None
+        name = max(stages, key=stages.get)
+        return name, stages[name]
+
+    def to_report_dict(self) -> Dict[str, Any]:
+        report = super().to_report_dict()
+        if self.stage_timings:
+            report["stage_timings_ms"] = {k: round(v, 2) for k, v in self.stage_timings.items()}
+        return report
 
     @classmethod
     def from_operation(cls, op_type: str, solid: Any,
@@ -0,0 +1,180 @@
+"""
+MashCad - Shape Fingerprint
+===========================
+
+Inhaltsbasierter Fingerprint für TopoDS_Shapes.
+
+Problem: Teure Prüfungen (BOPAlgo_CheckerSI, BOPAlgo_ArgumentAnalyzer,
+BRepCheck_Analyzer) laufen bei jedem Boolean erneut, obwohl sich der Body
+zwischen zwei Rebuilds oft gar nicht geändert hat. id() oder TShape-Identität
+taugen nicht als Schlüssel: Rebuilds erzeugen neue Objekte für dieselbe
+Geometrie.
+
+Lösung: Fingerprint aus Topologie-Zählern, Massen-Eigenschaften (Volumen,
+Schwerpunkt, Trägheitsmatrix), Bounding-Box und der Reihenfolge der
+Vertex-Positionen. Gleiche Geometrie → gleicher Fingerprint, unabhängig vom
+Python-/TShape-Objekt. Die Vertex-Reihenfolge macht den Fingerprint
+reihenfolgesensitiv: gleicher Fingerprint → in der Praxis gleiche Sub-Shape-Indizes in
+TopExp-Maps (Voraussetzung für das Übertragen von History per Index).
+Pro Shape-Objekt wird der Fingerprint einmal berechnet (Identitäts-Cache).
+
+Verwendung:
+    fp = shape_fingerprint(solid)   # Tuple oder None wenn nicht berechenbar
+    memo[("self_intersection", fp)] = verdict
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+try:
+    from OCP.Bnd import Bnd_Box
+    from OCP.BRepBndLib import BRepBndLib
+    from OCP.BRep import BRep_Tool
+    from OCP.BRepGProp import BRepGProp
+    from OCP.GProp import GProp_GProps
+    from OCP.TopAbs import TopAbs_EDGE, TopAbs_FACE, TopAbs_VERTEX
+    from OCP.TopExp import TopExp
+    from OCP.TopoDS import TopoDS
+    from OCP.TopTools import TopTools_IndexedMapOfShape
+    HAS_OCP = True
+except ImportError:
+    HAS_OCP = False
+
+
+# Rundung: 1e-6 mm für Längen, 9 signifikante Stellen für Integrale
+LENGTH_DIGITS = 6
+INTEGRAL_DIGITS = 9
+
+MAX_IDENTITY_ENTRIES = 512
+
+# hash(shape) -> [(shape, fingerprint)]; Vergleich per IsEqual (TShape + Location + Orientierung)
+_identity_cache: Dict[int, List[Tuple[Any, Tuple]]] = {}
+_identity_size = 0
+
+
+def _sig(value: float) -> float:
+    return float(f"{value:.{INTEGRAL_DIGITS}g}")
+
+
+def _count(shape: Any, kind: Any) -> int:
+    shape_map = TopTools_IndexedMapOfShape()
+    TopExp.MapShapes_s(shape, kind, shape_map)
+    return shape_map.Extent()
+
+
+def _vertex_order(shape: Any) -> Tuple[int, int]:
+    """(Anzahl, Hash der gerundeten Vertex-Positionen in TopExp-Reihenfolge)."""
+    vertex_map = TopTools_IndexedMapOfShape()
+    TopExp.MapShapes_s(shape, TopAbs_VERTEX, vertex_map)
+    coords = []
+    for i in range(1, vertex_map.Extent() + 1):
+        p = BRep_Tool.Pnt_s(TopoDS.Vertex_s(vertex_map.FindKey(i)))
+        coords.append((round(p.X(), LENGTH_DIGITS), round(p.Y(), LENGTH_DIGITS), round(p.Z(), LENGTH_DIGITS)))
+    return vertex_map.Extent(), hash(tuple(coords))
+
+
+def _compute(shape: Any) -> Tuple:
+    volume = GProp_GProps()
+    BRepGProp.VolumeProperties_s(shape, volume)
+
+    com = volume.CentreOfMass()
+    inertia = volume.MatrixOfInertia()
+    box = Bnd_Box()
+    BRepBndLib.Add_s(shape, box)
+
+    n_vertices, vertex_order = _vertex_order(shape)
+
+    return (
+        _count(shape, TopAbs_FACE),
+        _count(shape, TopAbs_EDGE),
+        n_vertices,
+        _sig(volume.Mass()),
+        tuple(round(v, LENGTH_DIGITS) for v in (com.X(), com.Y(), com.Z())),
+        tuple(_sig(inertia.Value(r, c)) for r in (1, 2, 3) for c in range(r, 4)),
+        tuple(round(v, LENGTH_DIGITS) for v in box.Get()),
+        vertex_order,
+    )
+
+
+def shape_fingerprint(shape: Any) -> Optional[Tuple]:
+    """
+    Inhaltsbasierter Fingerprint eines Shapes (Build123d oder OCP).
+
+    Zwei Shapes mit gleichem Fingerprint gelten für Prüf-Memos als gleich.
+    Die Position fließt über Schwerpunkt und Bounding-Box mit ein.
+
+    Returns:
+        Hashbares Tuple, oder None wenn der Shape leer/nicht auswertbar ist
+    """
+    global _identity_size
+
+    if not HAS_OCP or shape is None:
+        return None
+    ocp_shape = shape.wrapped if hasattr(shape, 'wrapped') else shape
+    if ocp_shape is None or ocp_shape.IsNull():
+        return None
+
+    bucket = _identity_cache.get(hash(ocp_shape))
+    if bucket:
+        for known, fp in bucket:
+            if known.IsEqual(ocp_shape):
+                return fp
+
+    try:
+        fp = _compute(ocp_shape)
+    except Exception as e:
+        logger.debug(f"Shape-Fingerprint fehlgeschlagen: {e}")
+        return None
+
+    if _identity_size >= MAX_IDENTITY_ENTRIES:
+        clear_fingerprint_cache()
+    _identity_cache.setdefault(hash(ocp_shape), []).append((ocp_shape, fp))
+    _identity_size += 1
+    return fp
+
+
+def clear_fingerprint_cache() -> None:
+    """Leert den Identitäts-Cache (Fingerprints selbst bleiben gültig)."""
+    global _identity_size
+    _identity_cache.clear()
+    _identity_size = 0
+
+
+def tolerance_state(shape: Any) -> Optional[Tuple]:
+    """
+    Toleranz- und Flag-Zustand eines Shapes (nicht gecacht).
+
+    Der Fingerprint sieht nur Geometrie. BRepCheck-Urteile hängen aber auch
+    an Toleranzen und SameParameter/SameRange - und ShapeFix/BRepLib ändern
+    genau diese in-place. Wer Prüf-Urteile memoisiert, nimmt den Zustand mit
+    in den Schlüssel.
+
+    Returns:
+        (Hash der Toleranzen in TopExp-Reihenfolge, Edges ohne SameParameter,
+        Edges ohne SameRange), oder None wenn nicht auswertbar
+    """
+    if not HAS_OCP or shape is None:
+        return None
+    ocp_shape = shape.wrapped if hasattr(shape, 'wrapped') else shape
+    if ocp_shape is None or ocp_shape.IsNull():
+        return None
+
+    try:
+        tolerances = []
+        not_same_parameter = 0
+        not_same_range = 0
+        for kind, cast in ((TopAbs_FACE, TopoDS.Face_s), (TopAbs_EDGE, TopoDS.Edge_s),
+                           (TopAbs_VERTEX, TopoDS.Vertex_s)):
+            shape_map = TopTools_IndexedMapOfShape()
+            TopExp.MapShapes_s(ocp_shape, kind, shape_map)
+            for i in range(1, shape_map.Extent() + 1):
+                sub = cast(shape_map.FindKey(i))
+                tolerances.append(_sig(BRep_Tool.Tolerance_s(sub)))
+                if kind == TopAbs_EDGE:
+                    not_same_parameter += not BRep_Tool.SameParameter_s(sub)
+                    not_same_range += not BRep_Tool.SameRange_s(sub)
+        return hash(tuple(tolerances)), not_same_parameter, not_same_range
+    except Exception as e:
+        logger.debug(f"Toleranz-Zustand fehlgeschlagen: {e}")
+        return None
@@ -0,0 +1,315 @@
+"""
+MashCad - Shape Validation Service
+==================================
+
+Zentrale, gestufte Gültigkeitsprüfung für TopoDS_Shapes.
+
+Problem: BRepCheck_Analyzer wird an vielen Stellen (Boolean-Engine, Body,
+Export, Printability, Healing, Edge-Operationen) unabhängig voneinander
+aufgerufen. Derselbe Solid wird pro Rebuild + Export mehrfach komplett
+analysiert.
+
+Lösung: Drei Stufen, jede Aufrufstelle fordert nur die Stufe an, die sie
+tatsächlich braucht:
+- TOPOLOGY:  Null-Check, Faces vorhanden, Shells von Solids geschlossen (<1ms)
+- SUBSHAPES: BRepCheck pro Face (inkl. Wires/Edges/Vertices) + TOPOLOGY
+- FULL:      BRepCheck_Analyzer auf dem ganzen Shape
+
+Urteile werden pro (ShapeKey, Stufe) gecacht. Zusätzlich hält der Service
+"selbstschnittfrei"-Urteile, die per Konstruktion feststehen (z.B.
+Gewinde-Werkzeuge) - die Boolean-Engine überspringt dafür BOPAlgo_CheckerSI. Ein gültiges Urteil einer
+höheren Stufe gilt auch für niedrigere Stufen, ein ungültiges Urteil einer
+niedrigeren Stufe auch für höhere. TOPOLOGY ist billiger als der Schlüssel
+und wird nie gecacht.
+
+ShapeKey = TShape-Identität (inkl. Location) + Toleranz-/Flag-Zustand. Ein
+inhaltsbasierter Fingerprint reicht nicht: eine geometrisch gleiche Kopie mit
+SameParameter=False ist ungültig, ein per ShapeFix in-place geheiltes Shape
+gültig. Der Schlüssel hält das Shape am Leben, die TShape-Adresse kann also
+nicht wiederverwendet werden. Pcurves stecken nicht im Zustand - wer ein
+Shape repariert, prüft das Ergebnis mit cache=False und verwirft alte
+Urteile per forget_shape().
+
+Verwendung:
+    from modeling.shape_validation import ValidationTier, check_shape
+
+    if not check_shape(solid, ValidationTier.TOPOLOGY):   # Mindeststufe der Aufrufstelle
+        ...
+
+    fixer.Perform()
+    forget_shape(shape)                                      # in-place geändert
+    ok = check_shape(fixer.Shape(), ValidationTier.FULL, cache=False)
+    before = validation_stats()
+    ...
+    report = validation_stats_since(before)   # Prüfungen/Cache-Treffer/ms pro Stufe
+"""
+
+import time
+from collections import OrderedDict
+from enum import IntEnum
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from loguru import logger
+
+from modeling.shape_fingerprint import tolerance_state
+
+try:
+    from OCP.BRep import BRep_Tool
+    from OCP.BRepCheck import BRepCheck_Analyzer
+    from OCP.TopAbs import TopAbs_FACE, TopAbs_SHELL, TopAbs_SOLID
+    from OCP.TopExp import TopExp_Explorer
+    from OCP.TopoDS import TopoDS_Shape
+    HAS_OCP = True
+except ImportError:
+    HAS_OCP = False
+
+
+class ValidationTier(IntEnum):
+    """Prüfstufen, aufsteigend nach Kosten."""
+    TOPOLOGY = 1   # Zähler + Geschlossenheit
+    SUBSHAPES = 2  # BRepCheck pro Face
+    FULL = 3       # BRepCheck_Analyzer auf dem ganzen Shape
+
+
+MAX_VERDICTS = 1024
+
+# (ShapeKey, tier | _SELF_INTERSECTION_FREE) -> bool
+_verdicts: "OrderedDict[Tuple, bool]" = OrderedDict()
+
+_SELF_INTERSECTION_FREE = "self_intersection_free"
+
+
+class ShapeKey:
+    """
+    Cache-Schlüssel: TShape-Identität (IsSame) + Toleranz-/Flag-Zustand.
+
+    Hält eine Referenz auf das Shape, damit die TShape nicht freigegeben und
+    ihre Adresse nicht für ein anderes Shape wiederverwendet wird.
+    """
+
+    __slots__ = ("shape", "state", "_hash")
+
+    def __init__(self, shape: Any, state: Tuple):
+        self.shape = shape
+        self.state = state
+        self._hash = hash((hash(shape), state))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, ShapeKey) and self.state == other.state
+                and self.shape.IsSame(other.shape))
+
+
+def shape_key(shape: Any) -> Optional[ShapeKey]:
+    """ShapeKey für ein Shape (Build123d oder OCP), None wenn nicht auswertbar."""
+    ocp_shape = _ocp(shape)
+    if ocp_shape is None:
+        return None
+    state = tolerance_state(ocp_shape)
+    if state is None:
+        return None
+    return ShapeKey(ocp_shape, state)
+
+
+def _empty_stats() -> Dict[str, Dict[str, float]]:
+    return {tier.name.lower(): {"calls": 0, "cached": 0, "invalid": 0, "ms": 0.0}
+            for tier in ValidationTier}
+
+
+_stats = _empty_stats()
+
+
+def _ocp(shape: Any) -> Optional[Any]:
+    ocp_shape = shape.wrapped if hasattr(shape, 'wrapped') else shape
+    if not HAS_OCP or not isinstance(ocp_shape, TopoDS_Shape) or ocp_shape.IsNull():
+        return None
+    return ocp_shape
+
+
+def _topology_valid(shape: Any) -> bool:
+    if not TopExp_Explorer(shape, TopAbs_FACE).More():
+        return False
+    solids = TopExp_Explorer(shape, TopAbs_SOLID)
+    while solids.More():
+        shells = TopExp_Explorer(solids.Current(), TopAbs_SHELL)
+        if not shells.More():
+            return False
+        while shells.More():
+            if not BRep_Tool.IsClosed_s(shells.Current()):
+                return False
+            shells.Next()
+        solids.Next()
+    return True
+
+
+def _faces_valid(faces: Iterable[Any]) -> bool:
+    return all(BRepCheck_Analyzer(face).IsValid() for face in faces)
+
+
+def _iter_faces(shape: Any):
+    explorer = TopExp_Explorer(shape, TopAbs_FACE)
+    while explorer.More():
+        yield explorer.Current()
+        explorer.Next()
+
+
+def _run(shape: Any, tier: ValidationTier) -> bool:
+    if tier == ValidationTier.TOPOLOGY:
+        return _topology_valid(shape)
+    if tier == ValidationTier.SUBSHAPES:
+        return _topology_valid(shape) and _faces_valid(_iter_faces(shape))
+    return BRepCheck_Analyzer(shape).IsValid()
+
+
+def _cached_verdict(key: ShapeKey, tier: ValidationTier) -> Optional[bool]:
+    for other in ValidationTier:
+        verdict = _verdicts.get((key, other))
+        if verdict is None:
+            continue
+        if verdict and other >= tier:
+            return True
+        if not verdict and other <= tier:
+            return False
+    return None
+
+
+def _remember(key: ShapeKey, tier: Any, verdict: bool) -> None:
+    _verdicts[(key, tier)] = verdict
+    _verdicts.move_to_end((key, tier))
+    while len(_verdicts) > MAX_VERDICTS:
+        _verdicts.popitem(last=False)
+
+
+def check_shape(shape: Any, tier: ValidationTier = ValidationTier.FULL, cache: bool = True) -> bool:
+    """
+    Prüft ein Shape (Build123d oder OCP) mindestens auf der angegebenen Stufe.
+
+    Args:
+        shape: Zu prüfendes Shape
+        tier: Mindeststufe, die der Aufrufer braucht
+        cache: False für frisch erzeugte Zwischen-Shapes, die nur einmal
+               geprüft werden, und für gerade reparierte Shapes (spart den
+               Schlüssel, liest und schreibt keine Urteile)
+
+    Returns:
+        True wenn gültig. Null-Shapes und Nicht-Shapes sind ungültig.
+    """
+    ocp_shape = _ocp(shape)
+    if ocp_shape is None:
+        return False
+
+    stats = _stats[tier.name.lower()]
+    stats["calls"] += 1
+
+    key = shape_key(ocp_shape) if cache and tier > ValidationTier.TOPOLOGY else None
+    if key is not None:
+        verdict = _cached_verdict(key, tier)
+        if verdict is not None:
+            stats["cached"] += 1
+            return verdict
+
+    start = time.perf_counter()
+    try:
+        verdict = bool(_run(ocp_shape, tier))
+    except Exception as e:
+        logger.debug(f"Shape-Validierung ({tier.name}) fehlgeschlagen: {e}")
+        verdict = False
+    stats["ms"] += (time.perf_counter() - start) * 1000.0
+
+    if not verdict:
+        stats["invalid"] += 1
+    if key is not None:
+        _remember(key, tier, verdict)
+    return verdict
+
+
+def check_faces(faces: Iterable[Any]) -> bool:
+    """
+    SUBSHAPES-Prüfung nur für ausgewählte Faces (z.B. laut History geänderte).
+
+    Wird gezählt, aber nicht gecacht - die Faces gehören zu frischen Ergebnissen.
+    """
+    stats = _stats[ValidationTier.SUBSHAPES.name.lower()]
+    stats["calls"] += 1
+    start = time.perf_counter()
+    try:
+        verdict = _faces_valid(faces)
+    except Exception as e:
+        logger.debug(f"Face-Validierung fehlgeschlagen: {e}")
+        verdict = False
+    stats["ms"] += (time.perf_counter() - start) * 1000.0
+    if not verdict:
+        stats["invalid"] += 1
+    return verdict
+
+
+def mark_valid(shape: Any, tier: ValidationTier = ValidationTier.FULL) -> None:
+    """
+    Hinterlegt ein gültiges Urteil, das für genau dieses Shape belegt ist.
+
+    Nur für Urteile, die das ganze Shape auf der Stufe abdecken (z.B.
+    per Konstruktion) - eine lokale Teilprüfung ist kein FULL-Urteil.
+    """
+    key = shape_key(shape)
+    if key is not None:
+        _remember(key, tier, True)
+
+
+def mark_self_intersection_free(shape: Any) -> None:
+    """
+    Hinterlegt "selbstschnittfrei" für genau dieses Shape (inkl. Location).
+
+    Nur für Shapes, bei denen das per Konstruktion feststeht - ersetzt
+    BOPAlgo_CheckerSI im Boolean-Pre-Check. Akzeptiert auch einen ShapeKey.
+    """
+    key = shape if isinstance(shape, ShapeKey) else shape_key(shape)
+    if key is not None:
+        _remember(key, _SELF_INTERSECTION_FREE, True)
+
+
+def known_self_intersection_free(shape: Any) -> bool:
+    """True wenn für das Shape (oder den ShapeKey) "selbstschnittfrei" hinterlegt ist."""
+    key = shape if isinstance(shape, ShapeKey) else shape_key(shape)
+    if key is None or not _verdicts.get((key, _SELF_INTERSECTION_FREE), False):
+        return False
+    _verdicts.move_to_end((key, _SELF_INTERSECTION_FREE))
+    return True
+
+
+def forget_shape(shape: Any) -> None:
+    """
+    Verwirft alle Urteile zur TShape eines Shapes (jeder Zustand).
+
+    Für Shapes, die gerade in-place repariert wurden (ShapeFix, BRepLib):
+    der Toleranz-Zustand erfasst nicht jede Änderung (z.B. Pcurves).
+    """
+    ocp_shape = _ocp(shape)
+    if ocp_shape is None:
+        return
+    for cached in [k for k in _verdicts if k[0].shape.IsSame(ocp_shape)]:
+        del _verdicts[cached]
+
+
+def validation_stats() -> Dict[str, Dict[str, float]]:
+    """Kumulierte Prüfungen/Cache-Treffer/ungültige Urteile/ms pro Stufe."""
+    return {name: dict(values) for name, values in _stats.items()}
+
+
+def validation_stats_since(snapshot: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Differenz zu einem früheren validation_stats()-Snapshot (z.B. pro Rebuild)."""
+    return {
+        name: {key: value - snapshot.get(name, {}).get(key, 0) for key, value in values.items()}
+        for name, values in _stats.items()
+    }
+
+
+def reset_validation_stats() -> None:
+    global _stats
+    _stats = _empty_stats()
+
+
+def clear_validation_cache() -> None:
+    """Leert die Urteile (Statistik bleibt erhalten)."""
+    _verdicts.clear()
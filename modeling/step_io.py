@@ -211,11 +211,14 @@ class STEPWriter:
             compound = TopoDS_Compound()
             builder.MakeCompound(compound)
 
+            from modeling.export_kernel import export_solid
+
             shapes_added = 0
             for body in bodies:
-                # Shape extrahieren
+                # Shape extrahieren (Bodies mit echten Gewinden)
                 if hasattr(body, '_build123d_solid') and body._build123d_solid is not None:
-                    shape = body._build123d_solid.wrapped if hasattr(body._build123d_solid, 'wrapped') else body._build123d_solid
+                    solid = export_solid(body)
+                    shape = solid.wrapped if hasattr(solid, 'wrapped') else solid
                 elif hasattr(body, 'wrapped'):
                     shape = body.wrapped
                 else:
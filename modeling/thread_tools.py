@@ -0,0 +1,212 @@
+"""
+MashCad - Thread Tools
+======================
+
+Gecachte Gewinde-Werkzeuge und kosmetische Gewinde-Darstellung.
+
+Problem: Jeder Rebuild hat für jedes ThreadFeature eine Helix neu gebaut, das
+ISO-Profil entlang gesweept und boolesch verschnitten. Der Sweep selbst ist
+billig, aber jedes neu platzierte Werkzeug ist für die Boolean-Pre-Checks eine
+unbekannte Geometrie - BOPAlgo_CheckerSI auf einer Gewinde-Helix kostet
+Sekunden. Ein Teil mit einem Dutzend Gewindebohrungen verbrachte fast die
+ganze Rebuild-Zeit mit Gewinden.
+
+Lösung:
+- Kosmetische Gewinde (Default, Feature-Flag "cosmetic_threads") ändern das
+  BREP nicht. Das ThreadFeature bleibt als Annotation an der Zylinderfläche
+  stehen und wird im Viewport als Helix-Streifen gezeichnet
+  (cosmetic_thread_lines, vektorisiert ohne OCP)
+- Echte Geometrie entsteht nur beim Export oder auf Anforderung
+- Werkzeug-Solids werden kanonisch (Ursprung, Achse +Z) einmal gesweept, nach
+  (Durchmesser, Pitch, Tiefe, Typ) gecacht und per Location
+  platziert. Gleiche Gewinde teilen sich die TShape - die Pre-Checks im
+  Multi-Tool-Boolean laufen pro TShape und damit einmal pro Sweep
+
+Verwendung:
+    tool = ThreadToolCache.get(10.0, 1.5, 20.0, "external")
+    placed = place_thread_tool(tool, (0, 0, 0), (0, 0, 1))
+    lines = cosmetic_thread_lines([(pos, direction, 10.0, 1.5, 20.0)])
+"""
+
+import math
+from collections import OrderedDict
+from typing import Any, Iterable, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+# ISO 60° metrisch: H = 0.8660 * P, Rillentiefe = 5/8 * H
+ISO_THREAD_HEIGHT = 0.8660254
+ISO_GROOVE_FACTOR = 0.625
+
+# Halbe Profilbreite relativ zum Pitch (< 0.5 → benachbarte Windungen berühren sich nicht)
+PROFILE_HALF_WIDTH = 0.3
+
+# Stützpunkte pro Windung für die kosmetischen Helix-Streifen
+COSMETIC_SAMPLES_PER_TURN = 12
+
+# Rundung der Cache-Schlüssel (mm)
+KEY_DIGITS = 9
+
+
+def thread_groove_depth(pitch: float) -> float:
+    """Rillentiefe des ISO-60°-Profils für einen Pitch."""
+    return ISO_GROOVE_FACTOR * ISO_THREAD_HEIGHT * pitch
+
+
+def thread_tool_key(diameter: float, pitch: float, depth: float, thread_type: str) -> Tuple:
+    """Cache-Schlüssel eines Gewinde-Werkzeugs (genau die Sweep-Parameter)."""
+    return (
+        round(float(diameter), KEY_DIGITS),
+        round(float(pitch), KEY_DIGITS),
+        round(float(depth), KEY_DIGITS),
+        str(thread_type),
+    )
+
+
+def build_thread_tool(diameter: float, pitch: float, depth: float, thread_type: str) -> Any:
+    """
+    Sweept das ISO-60°-Profil entlang einer Helix um die Z-Achse (Ursprung).
+
+    Das Profil liegt senkrecht zur Helix-Tangente am Startpunkt (nicht auf
+    Plane.XZ) - saubere Geometrie mit wenigen Faces/Edges.
+    """
+    from build123d import BuildLine, BuildSketch, Helix, Plane, Polyline, make_face, sweep
+
+    r = max(diameter / 2.0, 1e-6)
+    groove_depth = thread_groove_depth(pitch)
+
+    # Helix-Radius: Mitte der Gewinderille
+    if thread_type == "external":
+        helix_r = r - groove_depth / 2
+    else:
+        helix_r = r + groove_depth / 2
+
+    helix = Helix(pitch=pitch, height=depth, radius=helix_r, center=(0, 0, 0), direction=(0, 0, 1))
+    half_w = pitch * PROFILE_HALF_WIDTH
+    profile_plane = Plane(origin=helix.position_at(0), z_dir=helix.tangent_at(0))
+
+    with BuildSketch(profile_plane) as profile_sk:
+        with BuildLine():
+            Polyline(
+                (-groove_depth / 2, -half_w),
+                (groove_depth / 2, 0),
+                (-groove_depth / 2, half_w),
+                close=True
+            )
+        make_face()
+
+    tool = sweep(profile_sk.sketch, path=helix)
+
+    # Windungen liegen um pitch > 2 * half_w auseinander, das Profil schneidet
+    # die Achse nicht → selbstschnittfrei per Konstruktion. Urteil für den
+    # (location-freien) Pre-Check hinterlegen statt CheckerSI (Sekunden) laufen zu lassen.
+    if helix_r - groove_depth / 2 > 1e-6:
+        try:
+            from OCP.TopLoc import TopLoc_Location
+            from modeling.shape_validation import mark_self_intersection_free
+
+            mark_self_intersection_free(tool.wrapped.Located(TopLoc_Location()))
+        except Exception as e:
+            logger.debug(f"[THREAD] Pre-Check-Urteil nicht hinterlegt: {e}")
+    return tool
+
+
+class ThreadToolCache:
+    """
+    LRU-Cache kanonischer Gewinde-Werkzeuge (Ursprung, Achse +Z).
+
+    Schlüssel: (Durchmesser, Pitch, Tiefe, Typ). Platziert wird per Location
+    (place_thread_tool), die TShape bleibt geteilt.
+    """
+
+    MAX_ENTRIES = 32
+
+    _tools: "OrderedDict[Tuple, Any]" = OrderedDict()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get(cls, diameter: float, pitch: float, depth: float, thread_type: str) -> Any:
+        """Kanonisches Werkzeug aus dem Cache oder frisch gesweept."""
+        key = thread_tool_key(diameter, pitch, depth, thread_type)
+        tool = cls._tools.get(key)
+        if tool is not None:
+            cls._tools.move_to_end(key)
+            cls.hits += 1
+            return tool
+
+        cls.misses += 1
+        logger.debug(f"[THREAD] Sweep für Werkzeug {key}")
+        tool = build_thread_tool(diameter, pitch, depth, thread_type)
+        cls._tools[key] = tool
+        while len(cls._tools) > cls.MAX_ENTRIES:
+            cls._tools.popitem(last=False)
+        return tool
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {"entries": len(cls._tools), "hits": cls.hits, "misses": cls.misses}
+
+    @classmethod
+    def clear(cls):
+        cls._tools.clear()
+        cls.hits = 0
+        cls.misses = 0
+
+
+def place_thread_tool(tool: Any, position: Sequence[float], direction: Sequence[float]) -> Any:
+    """Platziert ein kanonisches Werkzeug auf der Gewindeachse (teilt die TShape)."""
+    from build123d import Location, Plane
+
+    return tool.moved(Location(Plane(origin=tuple(position), z_dir=tuple(direction))))
+
+
+def _axis_frame(direction: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Zwei Einheitsvektoren senkrecht zur Achse."""
+    helper = np.array([1.0, 0.0, 0.0]) if abs(direction[0]) < 0.9 else np.array([0.0, 1.0, 0.0])
+    u = np.cross(direction, helper)
+    u /= np.linalg.norm(u)
+    return u, np.cross(direction, u)
+
+
+def cosmetic_thread_lines(threads: Iterable[Tuple[Sequence[float], Sequence[float], float, float, float]]):
+    """
+    Helix-Streifen für kosmetische Gewinde (Kern- und Außendurchmesser).
+
+    Args:
+        threads: (position, direction, diameter, pitch, depth) pro Gewinde
+
+    Returns:
+        pv.PolyData mit einer Polyline pro Helix, oder None ohne Gewinde
+    """
+    import pyvista as pv
+
+    all_points, all_lines = [], []
+    offset = 0
+    for position, direction, diameter, pitch, depth in threads:
+        if pitch <= 1e-9 or depth <= 0:
+            continue
+        axis = np.asarray(direction, dtype=float)
+        length = np.linalg.norm(axis)
+        if length < 1e-9:
+            continue
+        axis /= length
+        u, v = _axis_frame(axis)
+
+        turns = depth / pitch
+        n_samples = max(20, int(turns * COSMETIC_SAMPLES_PER_TURN))
+        t = np.linspace(0.0, 1.0, n_samples + 1)
+        phase = 2.0 * math.pi * turns * t
+        ring = np.cos(phase)[:, None] * u + np.sin(phase)[:, None] * v
+        along = np.asarray(position, dtype=float) + (t * depth)[:, None] * axis
+
+        r = diameter / 2.0
+        for radius in (r - thread_groove_depth(pitch), r):
+            all_points.append(along + radius * ring)
+            all_lines.append(np.concatenate([[n_samples + 1], np.arange(offset, offset + n_samples + 1)]))
+            offset += n_samples + 1
+
+    if not all_points:
+        return None
+    return pv.PolyData(np.vstack(all_points), lines=np.concatenate(all_lines))
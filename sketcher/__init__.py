@@ -22,3 +22,5 @@ from .constraints import (
 from .solver import ConstraintSolver, SolverResult
 
 from .sketch import Sketch, SketchState
+
+from .spatial_index import SketchSpatialIndex, KINDS_CURVES, KINDS_LINE, KINDS_POINT
@@ -0,0 +1,178 @@
+"""
+MashCad - Open Contour Analysis
+===============================
+
+Offene Konturen (lose Endpunkte) eines Sketches, einmal pro Revision.
+
+Problem: Der Renderer hat bei jedem Paint alle Endpunkte gegen alle Linien
+und Kreise in Python getestet (O(Endpunkte × Entities)), der
+Build123d-Profil-Detektor hat dieselbe Information separat berechnet.
+
+Lösung:
+- Endpunkte aller Linien/Bögen liegen als NumPy-Array vor
+- Zusammenfallende Endpunkte per KD-Tree (ohne scipy: Raster-Rundung)
+- Nur die verbleibenden Kandidaten werden gegen Kreise und Linien-Inneres
+  (T-Kreuzung) geprüft, Broad-Phase über den Spatial-Index des Sketches
+- Knotengrad-Parität für den Profil-Detektor, vektorisiert pro Toleranz
+
+Verwendung:
+    analysis = sketch.open_contours          # gecacht pro Revision
+    for x, y in analysis.open_ends: ...       # Renderer-Overlay
+    analysis.has_odd_vertices(1e-4)           # Profil-Detektor
+"""
+
+import math
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+from .geometry import Circle2D, Line2D
+from .spatial_index import KIND_CIRCLE, KIND_LINE, SketchSpatialIndex
+
+
+OPEN_END_TOLERANCE = 0.5         # mm für Punkt-auf-Geometrie
+OPEN_END_WELD_TOLERANCE = 0.05   # mm für zusammenfallende Endpunkte
+
+_ON_GEOMETRY_KINDS = frozenset({KIND_LINE, KIND_CIRCLE})
+
+
+def open_contour_key(sketch) -> Hashable:
+    """Revision + Anzahlen der beteiligten Entities."""
+    return (
+        getattr(sketch, 'revision', None),
+        len(sketch.lines), len(sketch.arcs), len(sketch.circles),
+    )
+
+
+def _has_neighbour(points: np.ndarray, radius: float) -> np.ndarray:
+    """Maske: Punkt hat einen weiteren Punkt im Abstand <= radius."""
+    if len(points) < 2:
+        return np.zeros(len(points), dtype=bool)
+    if HAS_SCIPY:
+        dist, _idx = cKDTree(points).query(points, k=2, distance_upper_bound=radius)
+        return np.isfinite(dist[:, 1])
+    keys = np.round(points / (2 * radius)).astype(np.int64)
+    _uniq, inverse, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+    return counts[inverse.reshape(-1)] >= 2
+
+
+def _point_on_line_interior(x: float, y: float, line, tol: float) -> bool:
+    """Punkt auf dem Inneren eines Liniensegments (T-Kreuzung, nicht an den Enden)."""
+    x1, y1 = line.start.x, line.start.y
+    dx, dy = line.end.x - x1, line.end.y - y1
+    length_sq = dx * dx + dy * dy
+    if length_sq < 1e-10:
+        return False
+    t = max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length_sq))
+    return 0.01 < t < 0.99 and math.hypot(x - (x1 + t * dx), y - (y1 + t * dy)) < tol
+
+
+class OpenContourAnalysis:
+    """
+    Endpunkt-Analyse eines Sketches (nur Nicht-Konstruktions-Geometrie).
+
+    Attributes:
+        endpoints: (N, 2) Endpunkte aller Linien und Bögen
+        open_ends: (M, 2) lose Endpunkte für das Renderer-Overlay
+        key: Cache-Key (open_contour_key) zum Zeitpunkt der Analyse
+    """
+
+    def __init__(self, sketch, key: Optional[Hashable] = None):
+        self.key = key
+        lines = [l for l in sketch.lines if not l.construction]
+        arcs = [a for a in sketch.arcs if not a.construction]
+
+        coords = []
+        owners: List = []
+        marker = []
+        for line in lines:
+            show = not getattr(line, '_suppress_endpoint_markers', False)
+            coords.append((line.start.x, line.start.y))
+            coords.append((line.end.x, line.end.y))
+            owners += (line, line)
+            marker += (show, show)
+        endpoints = np.array(coords, dtype=float).reshape(-1, 2)
+
+        if arcs:
+            arc_data = np.array(
+                [(a.center.x, a.center.y, a.radius, a.start_angle, a.end_angle) for a in arcs], dtype=float
+            )
+            cx, cy, r = arc_data[:, 0], arc_data[:, 1], arc_data[:, 2]
+            arc_pts = np.empty((2 * len(arcs), 2))
+            for col, k in ((3, 0), (4, 1)):
+                rad = np.radians(arc_data[:, col])
+                arc_pts[k::2, 0] = cx + r * np.cos(rad)
+                arc_pts[k::2, 1] = cy + r * np.sin(rad)
+            endpoints = np.vstack((endpoints, arc_pts))
+            for arc in arcs:
+                owners += (arc, arc)
+                marker += (True, True)
+
+        self.endpoints = endpoints
+        self._marker = np.array(marker, dtype=bool)
+        self._odd_cache: Dict[float, bool] = {}
+        self.open_ends = self._find_open_ends(sketch, owners)
+
+    def _find_open_ends(self, sketch, owners: List) -> np.ndarray:
+        idx = np.flatnonzero(self._marker)
+        if len(idx) == 0:
+            return np.empty((0, 2))
+        connected = _has_neighbour(self.endpoints[idx], OPEN_END_WELD_TOLERANCE)
+        candidates = idx[~connected]
+        if len(candidates) == 0:
+            return np.empty((0, 2))
+
+        # Ohne Key (ungecacht, z.B. Drag ohne Revision) kann der Index veraltet sein
+        index = getattr(sketch, 'spatial_index', None) if self.key is not None else None
+        if not isinstance(index, SketchSpatialIndex):
+            index = None
+            nearby_all = [*sketch.lines, *sketch.circles]
+
+        tol = OPEN_END_TOLERANCE
+        open_idx = []
+        for i in candidates:
+            x, y = float(self.endpoints[i, 0]), float(self.endpoints[i, 1])
+            nearby = index.query_point(x, y, tol, kinds=_ON_GEOMETRY_KINDS) if index is not None else nearby_all
+            closed = False
+            for entity in nearby:
+                if entity.construction:
+                    continue
+                if isinstance(entity, Circle2D):
+                    closed = abs(math.hypot(x - entity.center.x, y - entity.center.y) - entity.radius) < tol
+                elif isinstance(entity, Line2D) and entity is not owners[i]:
+                    closed = (not getattr(entity, '_suppress_endpoint_markers', False)
+                              and _point_on_line_interior(x, y, entity, tol))
+                if closed:
+                    break
+            if not closed:
+                open_idx.append(i)
+        return self.endpoints[open_idx].reshape(-1, 2)
+
+    @property
+    def has_open_ends(self) -> bool:
+        return len(self.open_ends) > 0
+
+    def has_odd_vertices(self, tolerance: float) -> bool:
+        """
+        True wenn ein Knoten (Endpunkte auf Raster `tolerance`) ungeraden Grad hat.
+
+        Strenger Test des Profil-Detektors: jede geschlossene Kontur hat
+        an jedem Knoten eine gerade Anzahl Kanten-Enden.
+        """
+        tolerance = float(tolerance)
+        cached = self._odd_cache.get(tolerance)
+        if cached is None:
+            if len(self.endpoints) == 0:
+                cached = False
+            else:
+                keys = np.round(self.endpoints / max(tolerance, 1e-9)).astype(np.int64)
+                _uniq, counts = np.unique(keys, axis=0, return_counts=True)
+                cached = bool(np.any(counts % 2))
+            self._odd_cache[tolerance] = cached
+        return cached
@@ -22,6 +22,7 @@ from typing import Optional, List, TYPE_CHECKING
 from loguru import logger
 
 from .base import SketchOperation, OperationResult
+from ..spatial_index import KINDS_LINE, SketchSpatialIndex
 
 if TYPE_CHECKING:
     from sketcher import Sketch, Point2D, Line2D
@@ -112,6 +113,32 @@ class ExtendOperation(SketchOperation):
 
         return None
 
+    def _candidate_lines(self, line: 'Line2D', extend_start: bool) -> List['Line2D']:
+        """
+        Linien, deren BBox der Verlängerungs-Strahl trifft (Spatial-Index).
+
+        Ohne Index (z.B. Mock-Sketch) werden alle Linien geliefert.
+        """
+        index = getattr(self.sketch, 'spatial_index', None)
+        if not isinstance(index, SketchSpatialIndex):
+            return self.sketch.lines
+
+        origin, toward = (line.start, line.end) if extend_start else (line.end, line.start)
+        dx, dy = origin.x - toward.x, origin.y - toward.y
+        length = math.hypot(dx, dy)
+        extent = index.extent()
+        if extent is None or length < 1e-10:
+            return self.sketch.lines
+
+        # Jeder Punkt im Index liegt innerhalb dieser Reichweite vom Ursprung
+        reach = (math.hypot(extent[2] - extent[0], extent[3] - extent[1])
+                 + math.hypot(origin.x - extent[0], origin.y - extent[1]))
+        return index.query_segment(
+            origin.x, origin.y,
+            origin.x + dx / length * reach, origin.y + dy / length * reach,
+            kinds=KINDS_LINE
+        )
+
     def find_extension(self, line: 'Line2D', click_x: float, click_y: float) -> ExtendResult:
         """
         Analysiert welche Verlängerung möglich ist.
@@ -136,7 +163,7 @@ class ExtendOperation(SketchOperation):
         best_inter = None
         best_t = float('-inf') if extend_start else float('inf')
 
-        for other in self.sketch.lines:
+        for other in self._candidate_lines(line, extend_start):
             if other == line:
                 continue
 
@@ -24,6 +24,7 @@ from typing import List, Optional, Tuple, Any, TYPE_CHECKING
 from loguru import logger
 
 from .base import SketchOperation, OperationResult, ResultStatus
+from ..spatial_index import KIND_ARC, KIND_CIRCLE, KIND_LINE, SketchSpatialIndex
 
 if TYPE_CHECKING:
     from sketcher import Sketch, Point2D, Line2D, Circle2D, Arc2D
@@ -39,6 +40,11 @@ TRIM_POINT_MERGE_TOLERANCE = 1e-4
 TRIM_POINT_MERGE_SCALE_FACTOR = 5e-5
 TRIM_POINT_MERGE_TOLERANCE_MAX = 1e-2
 
+# Linien-Schnitte akzeptieren t in [-0.001, 1.001] auf der anderen Linie
+LINE_PARAM_TOLERANCE = 1e-3
+
+_TRIM_KINDS = frozenset({KIND_LINE, KIND_CIRCLE, KIND_ARC})
+
 
 @dataclass
 class TrimSegment:
@@ -110,6 +116,29 @@ class TrimOperation(SketchOperation):
             entities.extend(self.sketch.arcs)
         return entities
 
+    def _get_candidate_entities(self, target) -> List:
+        """
+        Entities in der Nähe des Targets (Spatial-Index statt aller Entities).
+
+        Die Suchbox wird um die maximale Fuzzy-Toleranz bzw. die Parameter-
+        Toleranz der Linien-Schnitte erweitert. Ohne Index: alle Entities.
+        """
+        index = getattr(self.sketch, 'spatial_index', None)
+        bounds = self._entity_bounds(target)
+        if not isinstance(index, SketchSpatialIndex) or bounds is None:
+            return self._get_all_entities()
+        if not all(math.isfinite(v) for v in bounds):
+            return self._get_all_entities()
+
+        pad = FUZZY_INTERSECTION_TOLERANCE_MAX
+        extent = index.extent()
+        if extent is not None:
+            diag = math.hypot(extent[2] - extent[0], extent[3] - extent[1])
+            pad = max(pad, diag * LINE_PARAM_TOLERANCE)
+
+        bx0, by0, bx1, by1 = bounds
+        return index.query_bounds(bx0 - pad, by0 - pad, bx1 + pad, by1 + pad, kinds=_TRIM_KINDS)
+
     @staticmethod
     def _points_equal(p1, p2, tol: float = 1e-5) -> bool:
         return abs(p1.x - p2.x) <= tol and abs(p1.y - p2.y) <= tol
@@ -866,8 +895,8 @@ class TrimOperation(SketchOperation):
         if target is None:
             return TrimResult.no_target()
 
-        # Alle Entities sammeln
-        other_entities = self._get_all_entities()
+        # Nur Entities in der Nähe des Targets (Spatial-Index)
+        other_entities = self._get_candidate_entities(target)
 
         # Schnittpunkte berechnen (inkl. Fuzzy-Fallback)
         cut_points = self._calculate_intersections(target, other_entities)
@@ -0,0 +1,460 @@
+"""
+MashCad - Sketch Region Index
+=============================
+
+Räumlich indizierte, inkrementelle Regionserkennung für
+`GeometryDetector.process_sketch`.
+
+Problem: Jede Sketch-Änderung hat alle Regionen neu aufgebaut - Kreis-Kreis-
+und Kreis-Linie-Schnitte paarweise, Gap-Closing über alle Endpunkt-Paare
+(O(n²)) und die Containment-Hierarchie mit verschachtelten `contains`-Schleifen
+über alle Polygone. Eine Platte mit ein paar hundert Bohrungen brauchte
+Sekunden, bis sie extrudierbar war.
+
+Lösung:
+- Entities werden über ihre (um die Gap-Toleranz erweiterten) AABBs per
+  STRtree zu Clustern verbundener Linienzüge gruppiert. Linien verschiedener
+  Cluster berühren sich nicht, also wird jeder Cluster einzeln polygonisiert
+- Innerhalb eines Clusters liefern STRtree-Queries die Kandidaten für
+  Kreis-Schnitte und für das Schließen kleiner Lücken
+- Containment: Polygone nach Fläche sortiert, ein gebündelter STRtree-Query
+  mit `contains`; direkter Parent ist der kleinste Container
+- Pro Sketch bleibt der letzte Stand liegen: Entity-Signaturen (Dirty-Set),
+  Cluster -> Polygone, Region -> Ring-Polygone. Eine geänderte Entity baut nur
+  ihren Cluster neu und nur die Regionen, deren Polygon oder direkte Kinder
+  sich geändert haben
+
+Verwendung:
+    index = SketchRegionIndex()
+    for region in index.update(sketch):
+        region.poly, region.children
+    index.last_stats   # {'entities', 'dirty', 'clusters_rebuilt', 'regions_rebuilt', ...}
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+try:
+    import shapely
+    from shapely import STRtree
+    from shapely.geometry import LineString, Polygon
+    from shapely.ops import polygonize, unary_union
+    HAS_SHAPELY = True
+except ImportError:
+    HAS_SHAPELY = False
+
+
+WELD_GRID = 0.5         # Punkte näher als 0.5mm werden verschweißt (DXF-Kompatibilität)
+GAP_TOLERANCE = 1.0     # Lücken unter 1mm zwischen Endpunkten werden geschlossen
+CIRCLE_SEGMENTS = 128
+MIN_REGION_AREA = 0.0001
+
+# Verarbeitungsreihenfolge wie bisher: Welding ist reihenfolgeabhängig
+_KIND_ORDER = ("line", "circle", "arc", "spline", "polygon")
+
+
+@dataclass
+class SketchRegion:
+    """Selektierbare Sketch-Region: Polygon minus seine direkten Kinder."""
+    key: tuple
+    poly: Any
+    children: int
+    # Anzeige-Mesh für eine Sketch-Ebene, wird vom GeometryDetector gefüllt
+    _mesh: Any = field(default=None, repr=False)
+    _mesh_plane: Any = field(default=None, repr=False)
+
+    def mesh_for_plane(self, plane_key, build):
+        """Gecachtes Mesh für `plane_key`, sonst `build()` und merken."""
+        if self._mesh is None or self._mesh_plane != plane_key:
+            self._mesh = build()
+            self._mesh_plane = plane_key
+        return self._mesh
+
+
+def entity_signature(kind: str, entity) -> Optional[tuple]:
+    """Hashbarer Geometrie-Schlüssel einer Entity, None wenn sie keine Kontur liefert."""
+    if getattr(entity, 'construction', False):
+        return None
+    if kind == "line":
+        return ("line", entity.start.x, entity.start.y, entity.end.x, entity.end.y)
+    if kind == "circle":
+        return ("circle", entity.center.x, entity.center.y, entity.radius)
+    if kind == "arc":
+        start_angle = getattr(entity, 'start_angle', 0)
+        end_angle = getattr(entity, 'end_angle', 360)
+        # Falls arc_size statt end_angle
+        if hasattr(entity, 'arc_size'):
+            end_angle = start_angle + entity.arc_size
+        # Normalisiere Winkel
+        if end_angle < start_angle:
+            end_angle += 360
+        return ("arc", entity.center.x, entity.center.y, entity.radius, start_angle, end_angle)
+    if kind == "spline":
+        if not hasattr(entity, 'points') or len(entity.points) < 2:
+            return None
+        return ("spline", tuple((p.x, p.y) for p in entity.points))
+    if kind == "polygon":
+        if not hasattr(entity, 'points') or len(entity.points) < 3:
+            return None
+        return ("polygon", tuple((p.x, p.y) for p in entity.points))
+    return None
+
+
+def _signature_bounds(sig: tuple) -> Tuple[float, float, float, float]:
+    kind = sig[0]
+    if kind == "line":
+        _, sx, sy, ex, ey = sig
+        return (min(sx, ex), min(sy, ey), max(sx, ex), max(sy, ey))
+    if kind in ("circle", "arc"):
+        # Arcs als Vollkreis - konservativ
+        cx, cy, r = sig[1], sig[2], abs(sig[3])
+        return (cx - r, cy - r, cx + r, cy + r)
+    pts = np.asarray(sig[1], dtype=np.float64)
+    return (*pts.min(axis=0), *pts.max(axis=0))
+
+
+def _sketch_entries(sketch) -> List[Tuple[tuple, Any]]:
+    """(Signatur, Entity) aller konturbildenden Entities in Verarbeitungsreihenfolge."""
+    entries = []
+    for kind, attr in zip(_KIND_ORDER, ("lines", "circles", "arcs", "splines", "polygons")):
+        for entity in getattr(sketch, attr, None) or ():
+            sig = entity_signature(kind, entity)
+            if sig is not None:
+                entries.append((sig, entity))
+    return entries
+
+
+def _clusters(entries) -> List[list]:
+    """Gruppiert Entities, deren erweiterte AABBs sich berühren (Union-Find über STRtree-Paare)."""
+    if len(entries) == 1:
+        return [entries]
+
+    half = GAP_TOLERANCE * 0.5
+    bounds = np.array([_signature_bounds(sig) for sig, _ in entries], dtype=np.float64)
+    boxes = shapely.box(bounds[:, 0] - half, bounds[:, 1] - half, bounds[:, 2] + half, bounds[:, 3] + half)
+    left, right = STRtree(boxes).query(boxes, predicate="intersects")
+
+    parent = list(range(len(entries)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in zip(left.tolist(), right.tolist()):
+        if i < j:
+            ri, rj = find(i), find(j)
+            if ri != rj:
+                parent[max(ri, rj)] = min(ri, rj)
+
+    groups: Dict[int, list] = {}
+    for i, entry in enumerate(entries):
+        groups.setdefault(find(i), []).append(entry)
+    return list(groups.values())
+
+
+def _candidate_pairs(bounds_a: np.ndarray, bounds_b: np.ndarray):
+    """Index-Paare (i, j) mit überlappenden AABBs zwischen zwei Bounds-Arrays."""
+    if len(bounds_a) == 0 or len(bounds_b) == 0:
+        return []
+    boxes_a = shapely.box(bounds_a[:, 0], bounds_a[:, 1], bounds_a[:, 2], bounds_a[:, 3])
+    boxes_b = shapely.box(bounds_b[:, 0], bounds_b[:, 1], bounds_b[:, 2], bounds_b[:, 3])
+    i, j = STRtree(boxes_b).query(boxes_a, predicate="intersects")
+    return list(zip(i.tolist(), j.tolist()))
+
+
+def _close_gaps(merged):
+    """Verbindet nahe Endpunkte (< GAP_TOLERANCE) greedy in Endpunkt-Reihenfolge."""
+    endpoints = []
+    for geom in merged.geoms:
+        if hasattr(geom, 'coords'):
+            coords = list(geom.coords)
+            if len(coords) >= 2:
+                endpoints.append(coords[0])
+                endpoints.append(coords[-1])
+    if len(endpoints) < 2:
+        return []
+
+    pts = shapely.points(np.asarray(endpoints, dtype=np.float64))
+    left, right = STRtree(pts).query(pts, predicate="dwithin", distance=GAP_TOLERANCE)
+    neighbours: Dict[int, List[int]] = {}
+    for i, j in zip(left.tolist(), right.tolist()):
+        if j > i:
+            neighbours.setdefault(i, []).append(j)
+
+    additional_lines = []
+    used = set()
+    for i in sorted(neighbours):
+        if i in used:
+            continue
+        p1 = endpoints[i]
+        for j in sorted(neighbours[i]):
+            if j in used:
+                continue
+            p2 = endpoints[j]
+            dist = math.hypot(p1[0] - p2[0], p1[1] - p2[1])
+            if 0 < dist < GAP_TOLERANCE:
+                additional_lines.append(LineString([p1, p2]))
+                used.add(i)
+                used.add(j)
+                break
+    return additional_lines
+
+
+def _cluster_polygons(entries) -> List:
+    """Geschlossene Polygone eines Clusters (Welding, Kreis-Schnitte, Gap-Closing, polygonize)."""
+    from .geometry import get_circle_circle_intersection, circle_line_intersection
+
+    lines = []
+    standalone_circles = []
+    welded_points = {}
+
+    def get_welded_pt(x, y):
+        """Verschweißt nahe Punkte zu einem gemeinsamen Punkt"""
+        ix = int(round(x / WELD_GRID))
+        iy = int(round(y / WELD_GRID))
+        key = (ix, iy)
+
+        if key in welded_points:
+            return welded_points[key]
+
+        # Suche in Nachbarzellen
+        for dx in (-2, -1, 0, 1, 2):
+            for dy in (-2, -1, 0, 1, 2):
+                if dx == 0 and dy == 0:
+                    continue
+                neighbor_key = (ix + dx, iy + dy)
+                if neighbor_key in welded_points:
+                    nx, ny = welded_points[neighbor_key]
+                    if (x - nx) ** 2 + (y - ny) ** 2 < WELD_GRID ** 2:
+                        return (nx, ny)
+
+        welded_points[key] = (x, y)
+        return (x, y)
+
+    by_kind: Dict[str, list] = {kind: [] for kind in _KIND_ORDER}
+    for sig, entity in entries:
+        by_kind[sig[0]].append((sig, entity))
+
+    # Lines - mit Welding
+    for sig, _ in by_kind["line"]:
+        p1 = get_welded_pt(sig[1], sig[2])
+        p2 = get_welded_pt(sig[3], sig[4])
+        if p1 != p2:  # Keine Zero-Length Linien
+            lines.append(LineString([p1, p2]))
+
+    # Circles - Schnittpunkte nur für Paare mit überlappenden AABBs
+    circles = [entity for _, entity in by_kind["circle"]]
+    if circles:
+        circle_bounds = np.array([_signature_bounds(sig) for sig, _ in by_kind["circle"]], dtype=np.float64)
+        line_bounds = np.array([_signature_bounds(sig) for sig, _ in by_kind["line"]],
+                               dtype=np.float64).reshape(-1, 4)
+        circle_intersections = {i: [] for i in range(len(circles))}
+
+        for i, j in _candidate_pairs(circle_bounds, circle_bounds):
+            if j <= i:
+                continue
+            c1, c2 = circles[i], circles[j]
+            for pt in get_circle_circle_intersection(c1, c2):
+                circle_intersections[i].append((math.atan2(pt.y - c1.center.y, pt.x - c1.center.x), pt))
+                circle_intersections[j].append((math.atan2(pt.y - c2.center.y, pt.x - c2.center.x), pt))
+
+        sketch_lines = [entity for _, entity in by_kind["line"]]
+        for idx, k in _candidate_pairs(circle_bounds, line_bounds):
+            circle = circles[idx]
+            try:
+                for pt in circle_line_intersection(circle, sketch_lines[k]) or ():
+                    circle_intersections[idx].append(
+                        (math.atan2(pt.y - circle.center.y, pt.x - circle.center.x), pt))
+            except Exception:
+                pass
+
+        for idx, circle in enumerate(circles):
+            cx, cy, r = circle.center.x, circle.center.y, circle.radius
+            intersections = circle_intersections[idx]
+
+            if intersections:
+                # Überlappender Kreis: in Arcs zwischen den Schnittpunkten teilen
+                intersections.sort(key=lambda x: x[0])
+                for seg_idx in range(len(intersections)):
+                    start_angle = intersections[seg_idx][0]
+                    end_angle = intersections[(seg_idx + 1) % len(intersections)][0]
+                    # Handle Wrap-Around
+                    if end_angle <= start_angle:
+                        end_angle += 2 * math.pi
+
+                    sweep = end_angle - start_angle
+                    steps = max(16, int(sweep / 0.1))
+                    arc_pts = [
+                        get_welded_pt(cx + r * math.cos(start_angle + sweep * step / steps),
+                                      cy + r * math.sin(start_angle + sweep * step / steps))
+                        for step in range(steps + 1)
+                    ]
+                    if len(arc_pts) >= 2:
+                        lines.append(LineString(arc_pts))
+            else:
+                # Nicht-überlappender Kreis: Als geschlossenes LineString
+                angles = np.arange(CIRCLE_SEGMENTS + 1) * (2 * math.pi / CIRCLE_SEGMENTS)
+                pts = np.round(np.column_stack((cx + r * np.cos(angles), cy + r * np.sin(angles))), 5)
+                lines.append(LineString(pts))
+                standalone_circles.append(Polygon(pts[:-1]))
+
+    # Arcs - mit Welding für alle Stützpunkte
+    for sig, _ in by_kind["arc"]:
+        _, cx, cy, r, start_angle, end_angle = sig
+        num_segments = max(32, int(abs(end_angle - start_angle) / 3))
+        pts = []
+        for i in range(num_segments + 1):
+            angle = math.radians(start_angle + (end_angle - start_angle) * i / num_segments)
+            pts.append(get_welded_pt(cx + r * math.cos(angle), cy + r * math.sin(angle)))
+        lines.append(LineString(pts))
+
+    # Splines und Polygone - mit Welding
+    for sig, _ in by_kind["spline"]:
+        lines.append(LineString([get_welded_pt(x, y) for x, y in sig[1]]))
+    for sig, _ in by_kind["polygon"]:
+        pts = [get_welded_pt(x, y) for x, y in sig[1]]
+        pts.append(pts[0])  # Schließen
+        lines.append(LineString(pts))
+
+    raw_polys = []
+    try:
+        if lines:
+            # Einzelner freier Kreis ist schon ein einfacher Ring, kein Noding nötig
+            merged = lines[0] if len(lines) == 1 and standalone_circles else unary_union(lines)
+            if hasattr(merged, 'geoms'):
+                additional_lines = _close_gaps(merged)
+                if additional_lines:
+                    logger.debug(f"Gap closing: {len(additional_lines)} kleine Lücken geschlossen")
+                    merged = unary_union([merged] + additional_lines)
+            raw_polys = list(polygonize(getattr(merged, 'geoms', [merged])))
+    except Exception as e:
+        logger.debug(f"Polygonize failed: {e}")
+
+    # Eigenständige Kreise ergänzen, die polygonize nicht geliefert hat
+    if not raw_polys:
+        return standalone_circles
+    for circle in standalone_circles:
+        if not any(abs(poly.area - circle.area) < circle.area * 0.1 for poly in raw_polys):
+            raw_polys.append(circle)
+    return raw_polys
+
+
+def _region_parts(poly, children: Dict[int, List]) -> List:
+    """Polygon minus direkte Kinder (gruppiert nach Cluster), aufgeteilt in Einzel-Polygone."""
+    display_poly = poly
+    if children:
+        # Kinder verschiedener Cluster sind disjunkt - vereinigt wird nur innerhalb eines Clusters
+        parts = []
+        for cluster_children in children.values():
+            merged = unary_union(cluster_children) if len(cluster_children) > 1 else cluster_children[0]
+            parts.extend(shapely.get_parts(merged))
+        display_poly = poly.difference(shapely.multipolygons(parts))
+    if display_poly.is_empty:
+        return []
+    return [part for part in shapely.get_parts(display_poly)
+            if isinstance(part, Polygon) and part.area > MIN_REGION_AREA]
+
+
+class SketchRegionIndex:
+    """Inkrementeller Regions-Stand eines Sketches (siehe Modul-Docstring)."""
+
+    def __init__(self):
+        self._signatures: set = set()
+        # Cluster-Schlüssel (Signaturen in Verarbeitungsreihenfolge) -> (Token, Polygone)
+        self._clusters: Dict[tuple, Tuple[int, List]] = {}
+        # (Polygon-Schlüssel, Kinder-Schlüssel) -> Regionen
+        self._regions: Dict[tuple, List[SketchRegion]] = {}
+        self._next_token = 0
+        self.last_stats: Dict[str, float] = {}
+
+    def update(self, sketch) -> List[SketchRegion]:
+        """Gleicht mit dem Sketch ab und liefert alle Regionen (unveränderte aus dem Cache)."""
+        if not HAS_SHAPELY:
+            return []
+
+        t0 = time.perf_counter()
+        entries = _sketch_entries(sketch)
+        signatures = {sig for sig, _ in entries}
+        dirty = signatures - self._signatures
+        removed = self._signatures - signatures
+
+        # 1. Cluster: nur Cluster mit neuen/geänderten Entities werden polygonisiert
+        clusters: Dict[tuple, Tuple[int, List]] = {}
+        clusters_rebuilt = 0
+        for group in (_clusters(entries) if entries else []):
+            key = tuple(sig for sig, _ in group)
+            if key in clusters:
+                continue
+            cached = self._clusters.get(key)
+            if cached is None:
+                cached = (self._next_token, _cluster_polygons(group))
+                self._next_token += 1
+                clusters_rebuilt += 1
+            clusters[key] = cached
+
+        # 2. Containment: nach Fläche sortiert, direkter Parent = kleinster Container
+        polys = [((token, k), poly) for token, cluster_polys in clusters.values()
+                 for k, poly in enumerate(cluster_polys)]
+        polys.sort(key=lambda item: item[1].area, reverse=True)
+        parent = np.full(len(polys), -1, dtype=np.int64)
+        if len(polys) > 1:
+            geoms = np.array([poly for _, poly in polys], dtype=object)
+            outer, inner = STRtree(geoms).query(geoms)
+            # Container liegen in der Sortierung vorn; nur echte Kandidaten werden präpariert
+            front = outer < inner
+            outer, inner = outer[front], inner[front]
+            shapely.prepare(geoms[np.unique(outer)])
+            inside = shapely.contains(geoms[outer], geoms[inner])
+            np.maximum.at(parent, inner[inside], outer[inside])
+
+        children: Dict[int, List[int]] = {}
+        for child, par in enumerate(parent.tolist()):
+            if par >= 0:
+                children.setdefault(par, []).append(child)
+
+        # 3. Regionen: nur neu, wenn sich Polygon oder direkte Kinder geändert haben
+        regions: Dict[tuple, List[SketchRegion]] = {}
+        result: List[SketchRegion] = []
+        regions_rebuilt = 0
+        for i, (poly_key, poly) in enumerate(polys):
+            child_ids = children.get(i, [])
+            region_key = (poly_key, tuple(sorted(polys[c][0] for c in child_ids)))
+            cached = self._regions.get(region_key)
+            if cached is None:
+                cached = []
+                by_cluster: Dict[int, List] = {}
+                for c in child_ids:
+                    by_cluster.setdefault(polys[c][0][0], []).append(polys[c][1])
+                for part in _region_parts(poly, by_cluster):
+                    shapely.prepare(part)
+                    cached.append(SketchRegion(key=region_key, poly=part, children=len(child_ids)))
+                regions_rebuilt += 1
+            regions[region_key] = cached
+            result.extend(cached)
+
+        self._signatures = signatures
+        self._clusters = clusters
+        self._regions = regions
+        self.last_stats = {
+            "entities": len(entries),
+            "dirty": len(dirty),
+            "removed": len(removed),
+            "clusters": len(clusters),
+            "clusters_rebuilt": clusters_rebuilt,
+            "regions": len(result),
+            "regions_rebuilt": regions_rebuilt,
+            "ms": (time.perf_counter() - t0) * 1000.0,
+        }
+        logger.debug(
+            f"Sketch-Regionen: {len(result)} ({regions_rebuilt} neu), "
+            f"{len(clusters)} Cluster ({clusters_rebuilt} neu), {len(dirty)} geänderte Entities, "
+            f"{self.last_stats['ms']:.1f}ms"
+        )
+        return result
@@ -24,6 +24,11 @@ from .constraints import (
     is_constraint_satisfied
 )
 from .solver import ConstraintSolver, SolverResult
+from .spatial_index import KINDS_LINE, KINDS_POINT, SketchSpatialIndex
+from .open_contours import OpenContourAnalysis, open_contour_key
+
+
+_POINT_OR_LINE = KINDS_POINT | KINDS_LINE
 
 
 class SketchState(Enum):
@@ -87,6 +92,13 @@ class Sketch:
     _cached_profiles: list = field(default_factory=list, repr=False)
     _adjacency: dict = field(default_factory=dict, repr=False) # {(rx,ry): [line, ...]}
     _ellipse_bundles: List[dict] = field(default_factory=list, repr=False)
+    # Render-/Index-Caches: Zähler steigt bei jeder Geometrie-Änderung
+    _revision: int = field(default=0, repr=False, compare=False)
+    # Spatial-Index (lazy): Revision + Besitzer-ID, bei der er zuletzt synchron war
+    _spatial_index: Any = field(default=None, repr=False, compare=False)
+    _spatial_revision: int = field(default=-1, repr=False, compare=False)
+    _spatial_owner: int = field(default=-1, repr=False, compare=False)
+    _open_contours: Any = field(default=None, repr=False, compare=False)
 
     # === TNP v4.1: Sketch-ShapeUUID Verwaltung ===
 
@@ -208,6 +220,7 @@ class Sketch:
         self._point_shape_uuids[point.id] = point_shape_id.uuid
 
         self.points.append(point)
+        self.mark_modified(point)
         return point
     
     def add_line(self, x1: float, y1: float, x2: float, y2: float,
@@ -236,30 +249,34 @@ class Sketch:
         self._line_shape_uuids[line.id] = line_shape_id.uuid
 
         self.lines.append(line)
-        self.invalidate_profiles()
+        self.invalidate_profiles(line)
         return line
     
     def _find_or_create_point(self, x: float, y: float, tolerance: float = 1.0) -> Point2D:
         """Findet einen existierenden Punkt oder erstellt einen neuen."""
+        # Kandidaten aus dem Spatial-Index statt linearer Suche
+        near = self.spatial_index.query_point(x, y, tolerance, kinds=_POINT_OR_LINE)
+
         # Suche in allen Punktquellen
-        for point in self.points:
-            if abs(point.x - x) < tolerance and abs(point.y - y) < tolerance:
+        for point in near:
+            if isinstance(point, Point2D) and abs(point.x - x) < tolerance and abs(point.y - y) < tolerance:
                 return point
-        
+
         # Suche auch in Linien-Endpunkten (falls nicht in points)
-        for line in self.lines:
-            if abs(line.start.x - x) < tolerance and abs(line.start.y - y) < tolerance:
-                if line.start not in self.points:
-                    self.points.append(line.start)
-                return line.start
-            if abs(line.end.x - x) < tolerance and abs(line.end.y - y) < tolerance:
-                if line.end not in self.points:
-                    self.points.append(line.end)
-                return line.end
-        
+        for line in near:
+            if not isinstance(line, Line2D):
+                continue
+            for end in (line.start, line.end):
+                if abs(end.x - x) < tolerance and abs(end.y - y) < tolerance:
+                    if end not in self._spatial_index:
+                        self.points.append(end)
+                        self._index_insert(end)
+                    return end
+
         # Neuen Punkt erstellen
         new_point = Point2D(x, y)
         self.points.append(new_point)
+        self._index_insert(new_point)
         return new_point
     
     def add_line_from_points(self, p1: Point2D, p2: Point2D,
@@ -267,7 +284,7 @@ class Sketch:
         """Fügt eine Linie zwischen existierenden Punkten hinzu"""
         line = Line2D(p1, p2, construction=construction)
         self.lines.append(line)
-        self.invalidate_profiles()
+        self.invalidate_profiles(line)
         return line
     
     def add_circle(self, cx: float, cy: float, radius: float,
@@ -311,6 +328,7 @@ class Sketch:
 
         self.points.append(center)
         self.circles.append(circle)
+        self.mark_modified(center, circle)
         return circle
     
     def add_arc(self, cx: float, cy: float, radius: float,
@@ -359,6 +377,7 @@ class Sketch:
 
         self.points.append(center)
         self.arcs.append(arc)
+        self.mark_modified(center, arc)
         return arc
 
     def add_ellipse(self, cx: float, cy: float, major_radius: float, minor_radius: float,
@@ -1193,7 +1212,7 @@ class Sketch:
             if getattr(result, "status", None) == ConstraintStatus.FULLY_CONSTRAINED and dof > 0:
                 result.status = ConstraintStatus.UNDER_CONSTRAINED
         except Exception as exc:
-            logger.debug(f"Sketch.solve: Statuskorrektur fehlgeschlagen: {exc}")
+            logger.debug(f"Sketch.solve: Statuskorrektur fehlgeschlagen: {exc}")
 
         return result
 
@@ -1726,7 +1745,7 @@ class Sketch:
     def find_point_at(self, x: float, y: float, tolerance: float = 5.0) -> Optional[Point2D]:
         """Findet einen Punkt an einer Position"""
         target = Point2D(x, y)
-        for p in self.points:
+        for p in self.spatial_index.query_point(x, y, tolerance, kinds=KINDS_POINT):
             if p.distance_to(target) < tolerance:
                 return p
         return None
@@ -1734,7 +1753,7 @@ class Sketch:
     def find_line_at(self, x: float, y: float, tolerance: float = 5.0) -> Optional[Line2D]:
         """Findet eine Linie an einer Position"""
         target = Point2D(x, y)
-        for line in self.lines:
+        for line in self.spatial_index.query_point(x, y, tolerance, kinds=KINDS_LINE):
             if line.distance_to_point(target) < tolerance:
                 return line
         return None
@@ -1752,10 +1771,80 @@ class Sketch:
         self._cached_profiles = value
         self._profiles_valid = True
 
-    def invalidate_profiles(self):
+    @property
+    def revision(self) -> int:
+        """Geometrie-Revision; Caches (Renderer, Indizes) vergleichen nur diesen Wert."""
+        return self._revision
+
+    def mark_modified(self, *added):
+        """
+        Erhöht die Revision, ohne den Profil-Cache zu verwerfen.
+
+        Args:
+            added: Neu angelegte Entities - werden direkt in den Spatial-Index
+                übernommen, sonst gleicht der Index beim nächsten Zugriff ab
+        """
+        in_sync = self._spatial_revision == self._revision
+        self._revision += 1
+        if added and in_sync and self._index_insert(*added):
+            # Nur synchron, wenn außer `added` nichts am Index vorbei angelegt wurde
+            if len(self._spatial_index) == self._entity_count():
+                self._spatial_revision = self._revision
+
+    def invalidate_profiles(self, *added):
         """Nach Geometrie-Änderung aufrufen — Profil-Cache wird lazy neu berechnet."""
         self._profiles_valid = False
         self._adjacency.clear()
+        self.mark_modified(*added)
+
+    @property
+    def spatial_index(self) -> SketchSpatialIndex:
+        """Spatial-Index über alle Entities (lazy, bei Revisionswechsel abgeglichen)."""
+        if self._spatial_index is None or self._spatial_owner != id(self):
+            self._spatial_index = SketchSpatialIndex.from_sketch(self)
+            self._spatial_owner = id(self)
+        elif (self._spatial_revision != self._revision
+              or len(self._spatial_index) != self._entity_count()):
+            # Revision oder direkte Listen-Änderung: nur Differenzen einpflegen
+            self._spatial_index.sync(self)
+        self._spatial_revision = self._revision
+        return self._spatial_index
+
+    @property
+    def open_contours(self) -> OpenContourAnalysis:
+        """Lose Endpunkte / Knotengrad-Analyse (pro Revision gecacht)."""
+        key = open_contour_key(self)
+        cached = self._open_contours
+        if cached is None or cached.key != key:
+            cached = self._open_contours = OpenContourAnalysis(self, key)
+        return cached
+
+    def refresh_spatial_index(self) -> SketchSpatialIndex:
+        """Erzwingt den Abgleich nach Koordinaten-Änderungen ohne Revision."""
+        if self._spatial_index is not None and self._spatial_owner == id(self):
+            self._spatial_index.sync(self)
+            self._spatial_revision = self._revision
+        return self.spatial_index
+
+    def update_spatial_index(self, *entities):
+        """Aktualisiert einzelne Entities nach direkter Koordinaten-Änderung (z.B. Drag)."""
+        self._index_insert(*entities, update=True)
+
+    def _entity_count(self) -> int:
+        return (len(self.points) + len(self.lines) + len(self.circles) + len(self.arcs)
+                + len(self.ellipses or ()) + len(self.splines))
+
+    def _index_insert(self, *entities, update: bool = False) -> bool:
+        """Trägt Entities in einen aktuellen Index ein; False wenn keiner existiert."""
+        index = self._spatial_index
+        if index is None or self._spatial_owner != id(self):
+            return False
+        for entity in entities:
+            if update:
+                index.update(entity)
+            else:
+                index.insert(entity)
+        return True
 
     def _build_adjacency(self, tolerance: float = 0.5):
         """Baut Punkt→Linien Adjacency-Map für O(1) Nachbar-Lookup."""
@@ -1998,24 +2087,24 @@ class Sketch:
         return {
             'name': self.name,
             'id': self.id,
-            # Phase E1: Plane-Information serialisieren
-            'plane_origin': self.plane_origin,
-            'plane_normal': self.plane_normal,
-            'plane_x_dir': self.plane_x_dir,
-            'plane_y_dir': self.plane_y_dir,
+            # Phase E1: Plane-Information serialisieren
+            'plane_origin': self.plane_origin,
+            'plane_normal': self.plane_normal,
+            'plane_x_dir': self.plane_x_dir,
+            'plane_y_dir': self.plane_y_dir,
             'points': [(p.x, p.y, p.id, p.fixed, p.construction, p.standalone) for p in self.points],
             'lines': [(l.start.x, l.start.y, l.end.x, l.end.y, l.id, l.construction,
-                       bool(getattr(l, "_suppress_endpoint_markers", False)), l.start.id, l.end.id)
+                       bool(getattr(l, "_suppress_endpoint_markers", False)), l.start.id, l.end.id)
                       for l in self.lines],
             'line_slot_markers': line_slot_data,  # W34: Slot-Marker persistieren
-            'circles': [(c.center.x, c.center.y, c.radius, c.id, c.construction,
-                         c.native_ocp_data, c.center.id)
+            'circles': [(c.center.x, c.center.y, c.radius, c.id, c.construction,
+                         c.native_ocp_data, c.center.id)
                         for c in self.circles],
             'arcs': [(a.center.x, a.center.y, a.radius, a.start_angle, a.sweep_angle,
-                      a.id, a.construction, a.native_ocp_data, a.center.id) for a in self.arcs],
+                      a.id, a.construction, a.native_ocp_data, a.center.id) for a in self.arcs],
             'arc_slot_markers': arc_slot_data,  # W34: Slot-Arc-Marker persistieren
             'ellipses': [(e.center.x, e.center.y, e.radius_x, e.radius_y, e.rotation,
-                         e.id, e.construction, e.native_ocp_data, e.center.id) for e in self.ellipses],
+                         e.id, e.construction, e.native_ocp_data, e.center.id) for e in self.ellipses],
             'splines': splines_data,
             'native_splines': native_splines_data,
             'constraints': constraints_data,
@@ -2028,13 +2117,13 @@ class Sketch:
         sketch = cls(name=data.get('name', 'Sketch'))
         sketch.id = data.get('id', sketch.id)
 
-        # Phase E1: Plane-Information wiederherstellen
-        if 'plane_origin' in data:
-            sketch.plane_origin = data['plane_origin']
-            sketch.plane_normal = data.get('plane_normal', (0, 0, 1))
-            sketch.plane_x_dir = data.get('plane_x_dir', (1, 0, 0))
-            sketch.plane_y_dir = data.get('plane_y_dir', (0, 1, 0))
-
+        # Phase E1: Plane-Information wiederherstellen
+        if 'plane_origin' in data:
+            sketch.plane_origin = data['plane_origin']
+            sketch.plane_normal = data.get('plane_normal', (0, 0, 1))
+            sketch.plane_x_dir = data.get('plane_x_dir', (1, 0, 0))
+            sketch.plane_y_dir = data.get('plane_y_dir', (0, 1, 0))
+
         # Standalone-Punkte wiederherstellen
         for pdata in data.get('points', []):
             x, y = pdata[0], pdata[1]
@@ -2055,16 +2144,16 @@ class Sketch:
             lid = ldata[4] if len(ldata) > 4 else None
             construction = ldata[5] if len(ldata) > 5 else False
             suppress_endpoint_markers = ldata[6] if len(ldata) > 6 else False
-            start_id = ldata[7] if len(ldata) > 7 else None
-            end_id = ldata[8] if len(ldata) > 8 else None
+            start_id = ldata[7] if len(ldata) > 7 else None
+            end_id = ldata[8] if len(ldata) > 8 else None
             line = sketch.add_line(x1, y1, x2, y2, construction=construction)
             if lid:
                 line.id = lid
                 line_id_map[lid] = line
-            if start_id:
-                line.start.id = start_id
-            if end_id:
-                line.end.id = end_id
+            if start_id:
+                line.start.id = start_id
+            if end_id:
+                line.end.id = end_id
             if suppress_endpoint_markers:
                 line._suppress_endpoint_markers = True
                 line._ellipse_segment = True
@@ -2085,15 +2174,15 @@ class Sketch:
             cx, cy, r = cdata[0], cdata[1], cdata[2]
             cid = cdata[3] if len(cdata) > 3 else None
             construction = cdata[4] if len(cdata) > 4 else False
-            native_ocp_data = cdata[5] if len(cdata) > 5 else None
-            center_id = cdata[6] if len(cdata) > 6 else None
+            native_ocp_data = cdata[5] if len(cdata) > 5 else None
+            center_id = cdata[6] if len(cdata) > 6 else None
             circle = sketch.add_circle(cx, cy, r, construction=construction)
             if cid:
                 circle.id = cid
-            if native_ocp_data:
-                circle.native_ocp_data = native_ocp_data
-            if center_id:
-                circle.center.id = center_id
+            if native_ocp_data:
+                circle.native_ocp_data = native_ocp_data
+            if center_id:
+                circle.center.id = center_id
 
         # Bögen wiederherstellen
         arc_id_map = {}  # W34: Für Slot-Arc-Referenzen
@@ -2101,16 +2190,16 @@ class Sketch:
             cx, cy, r, start, sweep = adata[0], adata[1], adata[2], adata[3], adata[4]
             aid = adata[5] if len(adata) > 5 else None
             construction = adata[6] if len(adata) > 6 else False
-            native_ocp_data = adata[7] if len(adata) > 7 else None
-            center_id = adata[8] if len(adata) > 8 else None
+            native_ocp_data = adata[7] if len(adata) > 7 else None
+            center_id = adata[8] if len(adata) > 8 else None
             arc = sketch.add_arc(cx, cy, r, start, start + sweep, construction=construction)
             if aid:
                 arc.id = aid
                 arc_id_map[aid] = arc
-            if native_ocp_data:
-                arc.native_ocp_data = native_ocp_data
-            if center_id:
-                arc.center.id = center_id
+            if native_ocp_data:
+                arc.native_ocp_data = native_ocp_data
+            if center_id:
+                arc.center.id = center_id
         
         # W34: Slot-Marker für Arcs wiederherstellen
         arc_slot_markers = data.get('arc_slot_markers', {})
@@ -2125,15 +2214,15 @@ class Sketch:
             eid = edata[5] if len(edata) > 5 else None
             construction = edata[6] if len(edata) > 6 else False
             native_ocp_data = edata[7] if len(edata) > 7 else None
-            center_id = edata[8] if len(edata) > 8 else None
+            center_id = edata[8] if len(edata) > 8 else None
 
             ellipse = sketch.add_ellipse(cx, cy, rx, ry, rotation, construction=construction)
             if eid:
                 ellipse.id = eid
             if native_ocp_data:
                 ellipse.native_ocp_data = native_ocp_data
-            if center_id:
-                ellipse.center.id = center_id
+            if center_id:
+                ellipse.center.id = center_id
 
         # Splines wiederherstellen
         for sdata in data.get('splines', []):
@@ -2204,14 +2293,14 @@ class Sketch:
                     driving=cdata.get('driving', True),
                 )
                 sketch.constraints.append(constraint)
-
-                # FIX: FIXED-Constraint setzt auch point.fixed = True (wie make_fixed)
-                # Das ist wichtig für die Solver-Logik
-                if ctype == ConstraintType.FIXED and entities:
-                    entity = entities[0]
-                    if hasattr(entity, 'fixed'):
-                        entity.fixed = True
-
+
+                # FIX: FIXED-Constraint setzt auch point.fixed = True (wie make_fixed)
+                # Das ist wichtig für die Solver-Logik
+                if ctype == ConstraintType.FIXED and entities:
+                    entity = entities[0]
+                    if hasattr(entity, 'fixed'):
+                        entity.fixed = True
+
             except (KeyError, Exception) as e:
                 logger.debug(f"Constraint-Wiederherstellung übersprungen: {e}")
 
@@ -0,0 +1,482 @@
+"""
+MashCad - Sketch Spatial Index
+==============================
+
+Dynamischer Spatial-Index (Uniform Hash-Grid) direkt am Sketch-Modell.
+
+Problem: Der Editor hat nach jeder Änderung einen kompletten QuadTree aus
+allen Linien/Kreisen/Ellipsen neu gebaut, `Sketch.find_point_at`,
+`find_line_at`, `_find_or_create_point` sowie Trim/Extend haben linear über
+alle Entities gesucht - große DXF-Importe werden bei jeder Kante langsamer.
+
+Lösung:
+- Grid-Zellen (dict) -> Entities, die Zellgröße richtet sich beim ersten
+  Aufbau nach der typischen Entity-Größe
+- insert/remove/update pro Entity, nur die betroffenen Zellen werden angefasst
+- Sehr große Entities (viele Zellen) liegen in einer Oversize-Liste
+- sync() gleicht den Index mit dem Sketch ab und aktualisiert nur Entities,
+  deren Bounds sich geändert haben (z.B. nach einem Solve)
+- Ergebnisse kommen in Einfüge-Reihenfolge (stabil wie die Sketch-Listen)
+
+Verwendung:
+    index = sketch.spatial_index                  # lazy, immer synchron
+    lines = index.query_bounds(x0, y0, x1, y1, kinds=KINDS_LINE)
+    hits = index.query(qrect)                      # QRectF oder (x0, y0, x1, y1)
+"""
+
+import math
+from itertools import count
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .geometry import Arc2D, BezierSpline, Circle2D, Ellipse2D, Line2D, Point2D
+
+
+Bounds = Tuple[float, float, float, float]
+
+KIND_POINT = "point"
+KIND_LINE = "line"
+KIND_CIRCLE = "circle"
+KIND_ARC = "arc"
+KIND_ELLIPSE = "ellipse"
+KIND_SPLINE = "spline"
+
+KINDS_POINT: FrozenSet[str] = frozenset({KIND_POINT})
+KINDS_LINE: FrozenSet[str] = frozenset({KIND_LINE})
+KINDS_CURVES: FrozenSet[str] = frozenset({KIND_LINE, KIND_CIRCLE, KIND_ARC, KIND_ELLIPSE, KIND_SPLINE})
+
+DEFAULT_CELL_SIZE = 10.0
+MAX_CELLS_PER_ENTITY = 256   # Darüber landet eine Entity in der Oversize-Liste
+MAX_GRID_CELLS = 1 << 22     # Obergrenze für die Auto-Zellgröße
+
+
+def entity_kind(entity) -> Optional[str]:
+    """Kategorie einer Sketch-Entity oder None, wenn sie nicht indiziert wird."""
+    if isinstance(entity, Line2D):
+        return KIND_LINE
+    if isinstance(entity, Arc2D):
+        return KIND_ARC
+    if isinstance(entity, Circle2D):
+        return KIND_CIRCLE
+    if isinstance(entity, Ellipse2D):
+        return KIND_ELLIPSE
+    if isinstance(entity, BezierSpline):
+        return KIND_SPLINE
+    if isinstance(entity, Point2D):
+        return KIND_POINT
+    return None
+
+
+def entity_bounds(entity) -> Optional[Bounds]:
+    """Konservative AABB (x0, y0, x1, y1) einer Entity in Welt-Koordinaten."""
+    try:
+        if isinstance(entity, Line2D):
+            sx, sy, ex, ey = entity.start.x, entity.start.y, entity.end.x, entity.end.y
+            return (min(sx, ex), min(sy, ey), max(sx, ex), max(sy, ey))
+
+        if isinstance(entity, (Circle2D, Arc2D)):
+            # Arcs als Vollkreis - konservativ und unabhängig von Winkel-Updates
+            cx, cy, r = entity.center.x, entity.center.y, abs(entity.radius)
+            return (cx - r, cy - r, cx + r, cy + r)
+
+        if isinstance(entity, Ellipse2D):
+            cx, cy = entity.center.x, entity.center.y
+            r = max(abs(entity.radius_x), abs(entity.radius_y))
+            return (cx - r, cy - r, cx + r, cy + r)
+
+        if isinstance(entity, BezierSpline):
+            # Bézier-Kurve liegt in der konvexen Hülle von Punkten + Handles
+            xs, ys = [], []
+            for cp in entity.control_points:
+                xs.append(cp.point.x)
+                ys.append(cp.point.y)
+                for hx, hy in (cp.handle_in_abs, cp.handle_out_abs):
+                    xs.append(hx)
+                    ys.append(hy)
+            if not xs:
+                return None
+            return (min(xs), min(ys), max(xs), max(ys))
+
+        if isinstance(entity, Point2D):
+            return (entity.x, entity.y, entity.x, entity.y)
+    except (AttributeError, TypeError):
+        return None
+    return None
+
+
+def sketch_entities(sketch) -> Iterable:
+    """Alle indizierbaren Entities eines Sketches in stabiler Reihenfolge."""
+    yield from sketch.points
+    yield from sketch.lines
+    yield from sketch.circles
+    yield from sketch.arcs
+    yield from getattr(sketch, 'ellipses', ()) or ()
+    yield from sketch.splines
+
+
+def _rect_bounds(rect) -> Bounds:
+    """QRectF (duck-typed) oder (x0, y0, x1, y1) -> Bounds."""
+    if hasattr(rect, 'width') and callable(rect.width):
+        x, y = float(rect.x()), float(rect.y())
+        return (x, y, x + float(rect.width()), y + float(rect.height()))
+    x0, y0, x1, y1 = rect
+    return (float(x0), float(y0), float(x1), float(y1))
+
+
+class _Entry:
+    __slots__ = ("entity", "kind", "bounds", "cells", "seq")
+
+    def __init__(self, entity, kind: str, bounds: Bounds, cells: Optional[List[Tuple[int, int]]], seq: int):
+        self.entity = entity
+        self.kind = kind
+        self.bounds = bounds
+        self.cells = cells      # None = Oversize-Liste
+        self.seq = seq
+
+
+class SketchSpatialIndex:
+    """
+    Uniform Hash-Grid über Punkte, Linien, Kreise, Bögen, Ellipsen und Splines.
+
+    Args:
+        cell_size: Kantenlänge einer Grid-Zelle in mm
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], Dict[int, _Entry]] = {}
+        self._entries: Dict[int, _Entry] = {}
+        self._oversized: Dict[int, _Entry] = {}
+        self._seq = count()
+        self._cell_lo: Optional[Tuple[int, int]] = None
+        self._cell_hi: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def from_sketch(cls, sketch) -> 'SketchSpatialIndex':
+        """Baut den Index aus allen Entities; die Zellgröße folgt der Entity-Größe."""
+        entities = list(sketch_entities(sketch))
+        index = cls(cls.suggest_cell_size(entities))
+        for entity in entities:
+            index.insert(entity)
+        return index
+
+    @staticmethod
+    def suggest_cell_size(entities: Iterable) -> float:
+        """Median der Entity-Ausdehnung, begrenzt auf eine sinnvolle Zellanzahl."""
+        extents = []
+        x0 = y0 = math.inf
+        x1 = y1 = -math.inf
+        for entity in entities:
+            b = entity_bounds(entity)
+            if b is None:
+                continue
+            x0, y0 = min(x0, b[0]), min(y0, b[1])
+            x1, y1 = max(x1, b[2]), max(y1, b[3])
+            extent = max(b[2] - b[0], b[3] - b[1])
+            if extent > 0:
+                extents.append(extent)
+
+        if not extents:
+            return DEFAULT_CELL_SIZE
+        extents.sort()
+        size = extents[len(extents) // 2]
+        area = max(x1 - x0, 0.0) * max(y1 - y0, 0.0)
+        return max(size, math.sqrt(area / MAX_GRID_CELLS), 1e-6)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, entity) -> bool:
+        entry = self._entries.get(id(entity))
+        return entry is not None and entry.entity is entity
+
+    def bounds_of(self, entity) -> Optional[Bounds]:
+        """Im Index gespeicherte Bounds einer Entity."""
+        entry = self._entries.get(id(entity))
+        return entry.bounds if entry is not None else None
+
+    # --- Mutation ---
+
+    def _cell_range(self, b: Bounds) -> Tuple[int, int, int, int]:
+        cs = self.cell_size
+        return (
+            math.floor(b[0] / cs), math.floor(b[1] / cs),
+            math.floor(b[2] / cs), math.floor(b[3] / cs),
+        )
+
+    def insert(self, entity, bounds: Optional[Bounds] = None) -> bool:
+        """Fügt eine Entity ein (oder aktualisiert sie, falls schon vorhanden)."""
+        kind = entity_kind(entity)
+        if kind is None:
+            return False
+        if bounds is None:
+            bounds = entity_bounds(entity)
+        if bounds is None or not all(math.isfinite(v) for v in bounds):
+            self.remove(entity)
+            return False
+
+        key = id(entity)
+        old = self._entries.get(key)
+        seq = old.seq if old is not None else next(self._seq)
+        if old is not None:
+            self._unlink(old)
+
+        cx0, cy0, cx1, cy1 = self._cell_range(bounds)
+        n_cells = (cx1 - cx0 + 1) * (cy1 - cy0 + 1)
+        if n_cells > MAX_CELLS_PER_ENTITY:
+            entry = _Entry(entity, kind, bounds, None, seq)
+            self._oversized[key] = entry
+        else:
+            cells = [(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+            entry = _Entry(entity, kind, bounds, cells, seq)
+            for cell in cells:
+                bucket = self._cells.get(cell)
+                if bucket is None:
+                    bucket = self._cells[cell] = {}
+                bucket[key] = entry
+            self._grow_extent(cx0, cy0, cx1, cy1)
+
+        self._entries[key] = entry
+        return True
+
+    def remove(self, entity) -> bool:
+        """Entfernt eine Entity; False wenn sie nicht im Index war."""
+        entry = self._entries.get(id(entity))
+        if entry is None or entry.entity is not entity:
+            return False
+        self._unlink(entry)
+        del self._entries[id(entity)]
+        return True
+
+    def update(self, entity) -> bool:
+        """Aktualisiert die Zellen einer Entity; True wenn sich die Bounds geändert haben."""
+        bounds = entity_bounds(entity)
+        entry = self._entries.get(id(entity))
+        if entry is not None and entry.entity is entity and entry.bounds == bounds:
+            return False
+        self.insert(entity, bounds)
+        return True
+
+    def _unlink(self, entry: _Entry) -> None:
+        key = id(entry.entity)
+        if entry.cells is None:
+            self._oversized.pop(key, None)
+            return
+        for cell in entry.cells:
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del self._cells[cell]
+
+    def _grow_extent(self, cx0: int, cy0: int, cx1: int, cy1: int) -> None:
+        if self._cell_lo is None:
+            self._cell_lo, self._cell_hi = (cx0, cy0), (cx1, cy1)
+            return
+        self._cell_lo = (min(self._cell_lo[0], cx0), min(self._cell_lo[1], cy0))
+        self._cell_hi = (max(self._cell_hi[0], cx1), max(self._cell_hi[1], cy1))
+
+    def sync(self, sketch) -> int:
+        """
+        Gleicht den Index mit dem Sketch ab.
+
+        Nur neue, entfernte und bewegte Entities werden angefasst.
+
+        Returns:
+            Anzahl geänderter Einträge
+        """
+        changed = 0
+        alive = set()
+        for entity in sketch_entities(sketch):
+            key = id(entity)
+            if key in alive:
+                continue
+            alive.add(key)
+            bounds = entity_bounds(entity)
+            entry = self._entries.get(key)
+            if entry is not None and entry.entity is entity and entry.bounds == bounds:
+                continue
+            self.insert(entity, bounds)
+            changed += 1
+
+        for key in [k for k in self._entries if k not in alive]:
+            entry = self._entries.pop(key)
+            self._unlink(entry)
+            changed += 1
+        return changed
+
+    # --- Abfragen ---
+
+    def extent(self) -> Optional[Bounds]:
+        """Welt-Bounds aller belegten Zellen und Oversize-Entities."""
+        boxes = [entry.bounds for entry in self._oversized.values()]
+        if self._cell_lo is not None:
+            cs = self.cell_size
+            boxes.append((
+                self._cell_lo[0] * cs, self._cell_lo[1] * cs,
+                (self._cell_hi[0] + 1) * cs, (self._cell_hi[1] + 1) * cs,
+            ))
+        if not boxes:
+            return None
+        return (
+            min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes),
+        )
+
+    @staticmethod
+    def _finish(found: Dict[int, _Entry], kinds: Optional[FrozenSet[str]]) -> List:
+        entries = found.values() if kinds is None else [e for e in found.values() if e.kind in kinds]
+        return [entry.entity for entry in sorted(entries, key=lambda e: e.seq)]
+
+    def query_bounds(
+        self,
+        x0: float, y0: float, x1: float, y1: float,
+        kinds: Optional[FrozenSet[str]] = None
+    ) -> List:
+        """Alle Entities, deren AABB das Rechteck schneidet (Einfüge-Reihenfolge)."""
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+
+        def overlaps(b: Bounds) -> bool:
+            return b[0] <= x1 and b[2] >= x0 and b[1] <= y1 and b[3] >= y0
+
+        found: Dict[int, _Entry] = {}
+        cx0, cy0, cx1, cy1 = self._cell_range((x0, y0, x1, y1))
+        if self._cell_lo is not None:
+            # Auf belegte Zellen begrenzen
+            cx0, cy0 = max(cx0, self._cell_lo[0]), max(cy0, self._cell_lo[1])
+            cx1, cy1 = min(cx1, self._cell_hi[0]), min(cy1, self._cell_hi[1])
+            n_cells = max(0, cx1 - cx0 + 1) * max(0, cy1 - cy0 + 1)
+
+            if n_cells > len(self._cells):
+                # Großes Rechteck: belegte Zellen durchgehen ist billiger
+                for (cx, cy), bucket in self._cells.items():
+                    if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                        for key, entry in bucket.items():
+                            if key not in found and overlaps(entry.bounds):
+                                found[key] = entry
+            elif n_cells > 0:
+                cells = self._cells
+                for cx in range(cx0, cx1 + 1):
+                    for cy in range(cy0, cy1 + 1):
+                        bucket = cells.get((cx, cy))
+                        if not bucket:
+                            continue
+                        for key, entry in bucket.items():
+                            if key not in found and overlaps(entry.bounds):
+                                found[key] = entry
+
+        for key, entry in self._oversized.items():
+            if overlaps(entry.bounds):
+                found[key] = entry
+        return self._finish(found, kinds)
+
+    def query(self, rect, kinds: Optional[FrozenSet[str]] = None) -> List:
+        """Rechteck-Abfrage mit QRectF (QuadTree-kompatibel) oder (x0, y0, x1, y1)."""
+        return self.query_bounds(*_rect_bounds(rect), kinds=kinds)
+
+    def query_point(self, x: float, y: float, radius: float, kinds: Optional[FrozenSet[str]] = None) -> List:
+        """Kandidaten im Quadrat ±radius um (x, y) (Broad-Phase für Hit-Tests)."""
+        return self.query_bounds(x - radius, y - radius, x + radius, y + radius, kinds=kinds)
+
+    def query_segment(
+        self,
+        x0: float, y0: float, x1: float, y1: float,
+        kinds: Optional[FrozenSet[str]] = None
+    ) -> List:
+        """
+        Alle Entities, deren AABB von der Strecke (x0, y0)-(x1, y1) getroffen wird.
+
+        Die Zellen werden per Grid-Traversal (Amanatides-Woo) abgelaufen,
+        die Strecke wird vorher auf die belegten Zellen geclippt.
+        """
+        found: Dict[int, _Entry] = {}
+        dx, dy = x1 - x0, y1 - y0
+
+        def hits(b: Bounds) -> bool:
+            # Slab-Test Strecke gegen AABB
+            t_lo, t_hi = 0.0, 1.0
+            for o, d, lo, hi in ((x0, dx, b[0], b[2]), (y0, dy, b[1], b[3])):
+                if abs(d) < 1e-15:
+                    if o < lo or o > hi:
+                        return False
+                    continue
+                ta, tb = (lo - o) / d, (hi - o) / d
+                if ta > tb:
+                    ta, tb = tb, ta
+                t_lo, t_hi = max(t_lo, ta), min(t_hi, tb)
+                if t_lo > t_hi:
+                    return False
+            return True
+
+        for key, entry in self._oversized.items():
+            if hits(entry.bounds):
+                found[key] = entry
+
+        if self._cell_lo is None:
+            return self._finish(found, kinds)
+
+        cs = self.cell_size
+        grid = (
+            self._cell_lo[0] * cs, self._cell_lo[1] * cs,
+            (self._cell_hi[0] + 1) * cs, (self._cell_hi[1] + 1) * cs,
+        )
+        # Strecke auf das belegte Grid clippen
+        t_lo, t_hi = 0.0, 1.0
+        for o, d, lo, hi in ((x0, dx, grid[0], grid[2]), (y0, dy, grid[1], grid[3])):
+            if abs(d) < 1e-15:
+                if o < lo or o > hi:
+                    return self._finish(found, kinds)
+                continue
+            ta, tb = (lo - o) / d, (hi - o) / d
+            if ta > tb:
+                ta, tb = tb, ta
+            t_lo, t_hi = max(t_lo, ta), min(t_hi, tb)
+        if t_lo > t_hi:
+            return self._finish(found, kinds)
+
+        sx, sy = x0 + dx * t_lo, y0 + dy * t_lo
+        cx, cy = math.floor(sx / cs), math.floor(sy / cs)
+        end_cx, end_cy = math.floor((x0 + dx * t_hi) / cs), math.floor((y0 + dy * t_hi) / cs)
+        length = t_hi - t_lo
+
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        if abs(dx) > 1e-15:
+            next_x = (cx + (1 if dx > 0 else 0)) * cs
+            t_max_x = (next_x - sx) / (dx * length) if length > 0 else math.inf
+            t_delta_x = cs / abs(dx * length) if length > 0 else math.inf
+        else:
+            t_max_x = t_delta_x = math.inf
+        if abs(dy) > 1e-15:
+            next_y = (cy + (1 if dy > 0 else 0)) * cs
+            t_max_y = (next_y - sy) / (dy * length) if length > 0 else math.inf
+            t_delta_y = cs / abs(dy * length) if length > 0 else math.inf
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        max_steps = abs(end_cx - cx) + abs(end_cy - cy) + 1
+        for _ in range(max_steps):
+            bucket = self._cells.get((cx, cy))
+            if bucket:
+                for key, entry in bucket.items():
+                    if key not in found and hits(entry.bounds):
+                        found[key] = entry
+            if t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                cy += step_y
+                t_max_y += t_delta_y
+
+        return self._finish(found, kinds)
+
+
+__all__ = [
+    "SketchSpatialIndex",
+    "entity_bounds",
+    "entity_kind",
+    "KIND_POINT", "KIND_LINE", "KIND_CIRCLE", "KIND_ARC", "KIND_ELLIPSE", "KIND_SPLINE",
+    "KINDS_POINT", "KINDS_LINE", "KINDS_CURVES",
+]
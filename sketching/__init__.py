@@ -28,6 +28,7 @@ from sketching.core.result_types import (
 
 # Phase 9: Test Runner
 from sketching.test_runner import TestRunner, run_quick_test
+from sketching.core.batch_executor import BatchExecutor
 
 # Phase 4: Design Library
 from sketching.patterns.design_library import DesignLibrary, create_design_library, DESIGN_PATTERNS
@@ -66,6 +67,7 @@ __all__ = [
     # Phase 9
     "TestRunner",
     "run_quick_test",
+    "BatchExecutor",
     # Phase 4
     "DesignLibrary",
     "create_design_library",
@@ -733,29 +733,8 @@ class STLFeatureAnalyzer:
                 # Wir müssen die "Outline" dieser Face-Menge finden
                 boundary_points = []
                 try:
-                    # Create submesh
-                    submesh = mesh.extract_cells(inlier_indices)
-
-                    # Extract boundary edges
-                    edges = submesh.extract_feature_edges(
-                        boundary_edges=True,
-                        non_manifold_edges=False,
-                        manifold_edges=False,
-                        feature_edges=False
-                    )
-
-                    if edges.n_cells > 0:
-                       # Extract loops
-                       lines_cells = edges.lines.reshape(-1, 3)[:, 1:]
-                       points = edges.points
-                       loops = self._extract_edge_loops(lines_cells)
-
-                       if loops:
-                           # Find longest loop (perimeter)
-                           longest_loop = max(loops, key=len)
-
-                           # Get points
-                           boundary_points = [tuple(points[idx]) for idx in longest_loop]
+                    # Boundary loops directly on the parent mesh topology
+                    boundary_points = self._longest_boundary_loop(mesh, inlier_indices)
                 except Exception as e:
                     logger.warning(f"RANSAC Boundary extraction failed: {e}")
 
@@ -880,31 +859,8 @@ class STLFeatureAnalyzer:
                     # Extract boundary loop
                     boundary_points = []
                     try:
-                        # Create submesh
-                        submesh = mesh.extract_cells(matched_indices)
-
-                        # Extract boundary edges
-                        edges = submesh.extract_feature_edges(
-                            boundary_edges=True,
-                            non_manifold_edges=False,
-                            manifold_edges=False,
-                            feature_edges=False
-                        )
-
-                        if edges.n_cells > 0:
-                           # Extract loops
-                           lines_cells = edges.lines.reshape(-1, 3)[:, 1:]
-                           points = edges.points
-                           loops = self._extract_edge_loops(lines_cells)
-
-                           if loops:
-                               # Find longest loop (perimeter)
-                               # Or largest area? Length is easier.
-                               longest_loop = max(loops, key=len)
-
-                               # Get points
-                               boundary_points = [tuple(points[idx]) for idx in longest_loop]
-                               # Ensure closed? Usually loop logic ensures it.
+                        # Boundary loops directly on the parent mesh topology
+                        boundary_points = self._longest_boundary_loop(mesh, matched_indices)
                     except Exception as e:
                         logger.warning(f"Failed to extract boundary: {e}")
 
@@ -1332,53 +1288,30 @@ class STLFeatureAnalyzer:
             logger.warning(f"Ray-casting depth measurement failed: {e}")
             return radius * 2  # Last resort fallback
 
+    def _get_topology(self, mesh):
+        """Shared half-edge/CSR topology of the analysed mesh (built once per mesh)."""
+        from meshconverter.mesh_topology import MeshTopology
+
+        cached = getattr(self, '_topology_cache', None)
+        if cached is None or cached[0] is not mesh:
+            cached = (mesh, MeshTopology.from_polydata(mesh))
+            self._topology_cache = cached
+        return cached[1]
+
+    def _longest_boundary_loop(self, mesh, cell_ids: np.ndarray) -> List[Tuple[float, float, float]]:
+        """Longest closed boundary loop (perimeter) of a face subset as points."""
+        topology = self._get_topology(mesh)
+        loops = self._extract_edge_loops(topology.boundary_edges(cell_ids))
+        if not loops:
+            return []
+        points = np.asarray(mesh.points)
+        return [tuple(p) for p in points[max(loops, key=len)]]
+
     def _extract_edge_loops(self, lines: np.ndarray) -> List[List[int]]:
         """Extract closed loops from lines array."""
         try:
-            from collections import defaultdict
-            adj = defaultdict(list)
-            for i, (u, v) in enumerate(lines):
-                adj[u].append((v, i))
-                adj[v].append((u, i))
-
-            visited_edges = set()
-            loops = []
-
-            for i, (u, v) in enumerate(lines):
-                if i in visited_edges: continue
-
-                path = [u]
-                curr = v
-                path_edges = {i}
-
-                while True:
-                    path.append(curr)
-                    neighbors = adj[curr]
-
-                    # Find unvisited active edge
-                    next_step = None
-                    for n_node, n_edge in neighbors:
-                        if n_edge in path_edges: continue
-
-                        # Stop at junctions? Simple holes have deg=2
-                        # If deg > 2, logic is complex.
-                        # We just pick first valid, assuming simple loops.
-                        next_step = (n_node, n_edge)
-                        break
-
-                    if next_step:
-                        n_node, n_edge = next_step
-                        path_edges.add(n_edge)
-                        curr = n_node
-
-                        if curr == path[0]: # Closed
-                            visited_edges.update(path_edges)
-                            loops.append(path)
-                            break
-                    else:
-                        visited_edges.update(path_edges)
-                        break # Dead end
-            return loops
+            from meshconverter.mesh_topology import order_edge_loops
+            return [loop.tolist() for loop in order_edge_loops(lines, closed_only=True)]
         except Exception as e:
             logger.error(f"Loop extraction error: {e}")
             return []
@@ -0,0 +1,352 @@
+"""
+Batch Executor - Prozess-parallele Part-Generierung
+
+Verteilt Batch-Läufe (Stress-Test, ML-Dataset) auf Worker-Prozesse.
+Jeder Worker hat seinen eigenen OCP/build123d-Zustand und einen eigenen
+SketchAgent; OCP bleibt damit pro Prozess auf dem Main-Thread.
+
+- Parts werden in Shards (zusammenhängende Index-Bereiche) verteilt
+- Seeds hängen nur von (seed, Part-Index) ab - Ergebnisse sind unabhängig
+  von Worker-Anzahl und Shard-Aufteilung reproduzierbar
+- Results werden einzeln zurückgestreamt (on_result Callback)
+- Ein abgestürzter Worker wird neu gestartet, sein Shard ab dem ersten
+  fehlenden Part neu eingeplant; ein Part, das wiederholt abstürzt,
+  wird als Fehler verbucht statt den Batch zu blockieren
+
+Verwendung:
+    executor = BatchExecutor(workers=8, seed=42)
+    batch = executor.run(count=10000, complexity="medium")
+"""
+
+import os
+import queue
+import random
+import time
+import multiprocessing as mp
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Deque, Iterator, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from sketching.core.result_types import BatchResult, PartResult
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+
+def part_seed(base_seed: int, index: int) -> int:
+    """Deterministischer Seed für ein einzelnes Part."""
+    return int(np.random.SeedSequence([base_seed, index]).generate_state(1)[0])
+
+
+def _create_headless_agent(mode: str):
+    """Standard-Factory: Headless SketchAgent ohne Document."""
+    from sketching.core.sketch_agent import SketchAgent
+    return SketchAgent(mode=mode, headless=True)
+
+
+def _memory_mb() -> float:
+    return psutil.Process().memory_info().rss / 1024 / 1024 if HAS_PSUTIL else 0.0
+
+
+def _worker_main(
+    slot_id: int,
+    generation: int,
+    tasks,
+    results,
+    mode: str,
+    base_seed: int,
+    agent_factory: Optional[Callable] = None
+) -> None:
+    """Einstiegspunkt der Worker-Prozesse."""
+    agent = (agent_factory or _create_headless_agent)(mode)
+    start_memory = _memory_mb()
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+
+        shard_id, complexity, indices = task
+        for index in indices:
+            seed = part_seed(base_seed, index)
+            random.seed(seed)
+            start_time = time.time()
+            try:
+                result = agent.generate_part(complexity=complexity)
+            except Exception as e:
+                result = PartResult(
+                    success=False,
+                    solid=None,
+                    operations=[],
+                    duration_ms=(time.time() - start_time) * 1000,
+                    error=str(e)
+                )
+
+            result = result.detached()
+            result.metadata["batch_index"] = index
+            result.metadata["seed"] = seed
+            results.put(("part", slot_id, generation, index, result))
+
+        results.put(("done", slot_id, generation, shard_id, _memory_mb() - start_memory))
+
+
+@dataclass
+class _Shard:
+    shard_id: int
+    indices: List[int]
+
+
+@dataclass
+class _WorkerSlot:
+    slot_id: int
+    generation: int
+    process: object
+    tasks: object
+    shard: Optional[_Shard] = None
+    results: List[PartResult] = field(default_factory=list)
+    first_at: Optional[datetime] = None
+    last_at: Optional[datetime] = None
+    memory_mb: float = 0.0
+    restarts: int = 0
+
+
+class BatchExecutor:
+    """
+    Führt Part-Generierung parallel in Worker-Prozessen aus.
+
+    Args:
+        workers: Anzahl Worker-Prozesse (default: CPU-Anzahl)
+        mode: SketchAgent-Modus der Worker
+        seed: Basis-Seed (None = zufällig, wird im BatchResult gespeichert)
+        shard_size: Maximale Parts pro Shard
+        max_restarts: Abstürze pro Part, bevor es als Fehler verbucht wird
+        agent_factory: Picklebare Factory mode -> Agent mit generate_part()
+    """
+
+    POLL_INTERVAL = 0.5  # Sekunden
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        mode: str = "adaptive",
+        seed: Optional[int] = None,
+        shard_size: int = 25,
+        max_restarts: int = 2,
+        agent_factory: Optional[Callable] = None,
+        start_method: str = "spawn"
+    ):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.mode = mode
+        self.seed = seed
+        self.shard_size = max(1, shard_size)
+        self.max_restarts = max_restarts
+        self.agent_factory = agent_factory
+        self._ctx = mp.get_context(start_method)
+        self._slots: List[_WorkerSlot] = []
+
+    def run(
+        self,
+        count: int,
+        complexity: str = "medium",
+        on_result: Optional[Callable[[int, PartResult], None]] = None
+    ) -> BatchResult:
+        """
+        Generiert count Parts und aggregiert die Teil-Ergebnisse der Worker.
+
+        Args:
+            count: Anzahl der Parts
+            complexity: Komplexität der Parts
+            on_result: Wird für jedes eintreffende Part aufgerufen (index, result)
+
+        Returns:
+            BatchResult (Results nach Index sortiert, ohne OCP-Solids)
+        """
+        started_at = datetime.now()
+        base_seed = self.seed if self.seed is not None else random.SystemRandom().randrange(2 ** 31)
+
+        logger.info(f"[BatchExecutor] {count} Parts auf {self.workers} Worker (seed={base_seed})")
+
+        done = 0
+        for index, result in self.iter_results(count, complexity, base_seed):
+            done += 1
+            if on_result is not None:
+                on_result(index, result)
+            if done % 100 == 0:
+                logger.info(f"[BatchExecutor] {done}/{count} Parts generiert")
+
+        partials = [
+            BatchResult(
+                results=slot.results,
+                duration_ms=0.0,
+                started_at=slot.first_at or started_at,
+                finished_at=slot.last_at or started_at,
+                restarts=slot.restarts,
+                seed=base_seed,
+                memory_mb=slot.memory_mb,
+            )
+            for slot in self._slots
+        ]
+        batch = BatchResult.merge(partials)
+        batch.started_at = started_at
+        batch.finished_at = datetime.now()
+        batch.duration_ms = (batch.finished_at - started_at).total_seconds() * 1000
+
+        logger.info(
+            f"[BatchExecutor] Batch abgeschlossen: {batch.success_rate:.1%} Success, "
+            f"{batch.restarts} Worker-Neustarts"
+        )
+        return batch
+
+    def iter_results(
+        self,
+        count: int,
+        complexity: str,
+        base_seed: int
+    ) -> Iterator[Tuple[int, PartResult]]:
+        """
+        Streamt (index, PartResult) in Eingangsreihenfolge.
+
+        Jeder Index wird genau einmal geliefert, auch wenn Worker abstürzen.
+        """
+        self._slots = []
+        if count <= 0:
+            return
+
+        # Kleine Batches feiner aufteilen, damit alle Worker etwas bekommen
+        shard_size = max(1, min(self.shard_size, -(-count // (self.workers * 4))))
+
+        results_q = self._ctx.Queue()
+        shards: Deque[_Shard] = deque(
+            _Shard(shard_id, list(range(start, min(start + shard_size, count))))
+            for shard_id, start in enumerate(range(0, count, shard_size))
+        )
+        received = set()
+        crash_counts: Counter = Counter()
+
+        def start_worker(slot_id: int, generation: int) -> _WorkerSlot:
+            tasks = self._ctx.Queue()
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(slot_id, generation, tasks, results_q, self.mode, base_seed, self.agent_factory),
+                daemon=True,
+            )
+            process.start()
+            return _WorkerSlot(slot_id, generation, process, tasks)
+
+        def assign(slot: _WorkerSlot) -> None:
+            slot.shard = shards.popleft() if shards else None
+            if slot.shard is not None:
+                slot.tasks.put((slot.shard.shard_id, complexity, slot.shard.indices))
+
+        def handle(msg) -> Optional[Tuple[int, PartResult]]:
+            kind, slot_id, generation = msg[:3]
+            slot = self._slots[slot_id]
+            if kind == "part":
+                index, result = msg[3], msg[4]
+                if index in received:
+                    return None
+                received.add(index)
+                self._record(slot, result)
+                return index, result
+            if kind == "done" and generation == slot.generation:
+                slot.memory_mb = max(slot.memory_mb, msg[4])
+                assign(slot)
+            return None
+
+        def drain() -> List:
+            messages = []
+            while True:
+                try:
+                    messages.append(results_q.get_nowait())
+                except queue.Empty:
+                    return messages
+
+        try:
+            for slot_id in range(min(self.workers, len(shards))):
+                slot = start_worker(slot_id, 0)
+                self._slots.append(slot)
+                assign(slot)
+
+            while len(received) < count:
+                try:
+                    messages = [results_q.get(timeout=self.POLL_INTERVAL)] + drain()
+                except queue.Empty:
+                    messages = []
+
+                for msg in messages:
+                    item = handle(msg)
+                    if item is not None:
+                        yield item
+
+                for slot in self._slots:
+                    if slot.process.is_alive() or (slot.shard is None and not shards):
+                        continue
+
+                    # Letzte Nachrichten des toten Workers einsammeln
+                    for msg in drain():
+                        item = handle(msg)
+                        if item is not None:
+                            yield item
+
+                    exitcode = slot.process.exitcode
+                    shard = slot.shard
+                    remaining = [i for i in shard.indices if i not in received] if shard else []
+                    if remaining:
+                        crashed = remaining[0]
+                        crash_counts[crashed] += 1
+                        logger.warning(
+                            f"[BatchExecutor] Worker {slot.slot_id} abgestürzt (exitcode={exitcode}) "
+                            f"bei Part {crashed} - Neustart"
+                        )
+                        if crash_counts[crashed] > self.max_restarts:
+                            received.add(crashed)
+                            result = self._crash_result(crashed, exitcode, base_seed)
+                            self._record(slot, result)
+                            yield crashed, result
+                            remaining = remaining[1:]
+                        if remaining:
+                            shards.appendleft(_Shard(shard.shard_id, remaining))
+
+                    replacement = start_worker(slot.slot_id, slot.generation + 1)
+                    replacement.results = slot.results
+                    replacement.first_at, replacement.last_at = slot.first_at, slot.last_at
+                    replacement.memory_mb = slot.memory_mb
+                    replacement.restarts = slot.restarts + 1
+                    self._slots[slot.slot_id] = replacement
+                    assign(replacement)
+        finally:
+            self._shutdown()
+
+    def _record(self, slot: _WorkerSlot, result: PartResult) -> None:
+        now = datetime.now()
+        slot.results.append(result)
+        slot.first_at = slot.first_at or now
+        slot.last_at = now
+
+    @staticmethod
+    def _crash_result(index: int, exitcode: Optional[int], base_seed: int) -> PartResult:
+        return PartResult(
+            success=False,
+            solid=None,
+            operations=[],
+            duration_ms=0.0,
+            error=f"Worker-Prozess abgestürzt (exitcode={exitcode})",
+            metadata={"batch_index": index, "seed": part_seed(base_seed, index)}
+        )
+
+    def _shutdown(self) -> None:
+        for slot in self._slots:
+            if slot.process.is_alive():
+                slot.tasks.put(None)
+        for slot in self._slots:
+            slot.process.join(timeout=5)
+            if slot.process.is_alive():
+                slot.process.terminate()
+                slot.process.join()
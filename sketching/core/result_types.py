@@ -23,6 +23,9 @@ class PartResult:
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     sketch_count: int = 0  # Anzahl der erstellten Sketches
+    # Kennzahlen eines Solids, das im Worker-Prozess geblieben ist (siehe detached())
+    solid_volume: Optional[float] = None
+    solid_face_count: Optional[int] = None
 
     def __post_init__(self):
         if not self.metadata:
@@ -32,7 +35,7 @@ class PartResult:
     def volume(self) -> float:
         """Volumen des generierten Solids."""
         if self.solid is None:
-            return 0.0
+            return self.solid_volume or 0.0
         try:
             return self.solid.volume
         except Exception:
@@ -42,12 +45,30 @@ class PartResult:
     def face_count(self) -> int:
         """Anzahl der Faces im Solid."""
         if self.solid is None:
-            return 0
+            return self.solid_face_count or 0
         try:
             return len(list(self.solid.faces()))
         except Exception:
             return 0
 
+    def detached(self) -> 'PartResult':
+        """
+        Kopie ohne OCP-Solid für den Transport zwischen Prozessen.
+
+        Volumen und Face-Anzahl werden vorher berechnet und bleiben abrufbar.
+        """
+        return PartResult(
+            success=self.success,
+            solid=None,
+            operations=list(self.operations),
+            duration_ms=self.duration_ms,
+            error=self.error,
+            metadata=dict(self.metadata),
+            sketch_count=self.sketch_count,
+            solid_volume=self.volume,
+            solid_face_count=self.face_count,
+        )
+
 
 @dataclass
 class AssemblyResult:
@@ -79,6 +100,38 @@ class BatchResult:
     duration_ms: float
     started_at: datetime
     finished_at: datetime
+    worker_count: int = 1
+    restarts: int = 0       # Neu gestartete Worker-Prozesse
+    seed: Optional[int] = None
+    memory_mb: float = 0.0  # Speicherzuwachs der Worker-Prozesse
+
+    @classmethod
+    def merge(cls, partials: List['BatchResult']) -> 'BatchResult':
+        """
+        Fasst Teil-Ergebnisse (z.B. pro Worker) zu einem BatchResult zusammen.
+
+        Results werden nach metadata["batch_index"] sortiert, sofern vorhanden.
+        """
+        if not partials:
+            now = datetime.now()
+            return cls(results=[], duration_ms=0.0, started_at=now, finished_at=now)
+
+        results = [r for partial in partials for r in partial.results]
+        results.sort(key=lambda r: r.metadata.get("batch_index", 0))
+        started_at = min(p.started_at for p in partials)
+        finished_at = max(p.finished_at for p in partials)
+        seeds = {p.seed for p in partials}
+
+        return cls(
+            results=results,
+            duration_ms=(finished_at - started_at).total_seconds() * 1000,
+            started_at=started_at,
+            finished_at=finished_at,
+            worker_count=sum(p.worker_count for p in partials),
+            restarts=sum(p.restarts for p in partials),
+            seed=seeds.pop() if len(seeds) == 1 else None,
+            memory_mb=sum(p.memory_mb for p in partials),
+        )
 
     @property
     def total_count(self) -> int:
@@ -46,6 +46,7 @@ class SketchAgent:
         self.mode = mode  # "random", "adaptive", "guided"
         self.headless = headless
         self.document = document  # ← Document für Sketch/Body Integration
+        self.seed = seed
 
         # Random Seed für Reproduzierbarkeit
         if seed is not None:
@@ -421,20 +422,37 @@ class SketchAgent:
     def run_batch(
         self,
         count: int = 100,
-        complexity: str = "medium"
+        complexity: str = "medium",
+        workers: int = 1,
+        on_result=None
     ) -> BatchResult:
         """
         Führt Batch-Test aus (headless).
 
+        Mit workers > 1 werden die Parts über den BatchExecutor in
+        Worker-Prozessen erzeugt. Die Results enthalten dann kein Solid
+        (bleibt im Worker), Volumen und Face-Anzahl sind aber gesetzt.
+
         Args:
             count: Anzahl der zu generierenden Parts
             complexity: Komplexität der Parts
+            workers: Anzahl Worker-Prozesse (1 = im aktuellen Prozess)
+            on_result: Optionaler Callback (index, PartResult) pro Part
 
         Returns:
             BatchResult mit allen Results
         """
         from datetime import datetime
 
+        if workers > 1:
+            from sketching.core.batch_executor import BatchExecutor
+
+            executor = BatchExecutor(workers=workers, mode=self.mode, seed=self.seed)
+            batch = executor.run(count=count, complexity=complexity, on_result=on_result)
+            self._parts_generated += batch.total_count
+            self._parts_successful += batch.success_count
+            return batch
+
         started_at = datetime.now()
         results = []
 
@@ -443,6 +461,8 @@ class SketchAgent:
         for i in range(count):
             result = self.generate_part(complexity=complexity)
             results.append(result)
+            if on_result is not None:
+                on_result(i, result)
 
             # Stats
             self._parts_generated += 1
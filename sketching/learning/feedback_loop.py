@@ -6,15 +6,23 @@ Adaptive Strategien:
 - Fehlerhafte Parameter werden vermieden
 - Langsame Operationen werden optimiert
 
+Persistenz:
+- Append-only JSONL-Log (ein Record pro Zeile, O(1) I/O pro record())
+- Aggregate pro Operation (Zähler, Dauer, Quantil-Sketch) werden
+  inkrementell gepflegt, Abfragen scannen nicht mehr alle Records
+
 Author: Claude (Sketch Agent)
 Date: 2026-02-11
 """
 
+import bisect
 import json
+import math
+import os
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, defaultdict
 from loguru import logger
 
 
@@ -52,6 +60,58 @@ class OperationRecord:
         )
 
 
+class DurationSketch:
+    """
+    Log-Bucket Quantil-Sketch für Dauern (relative Genauigkeit).
+
+    Werte landen in Buckets mit Grenzen gamma^i; jedes Quantil wird mit
+    relativem Fehler <= relative_accuracy geschätzt, Speicher wächst nur
+    logarithmisch mit dem Wertebereich.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = defaultdict(int)
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float):
+        """Fügt einen Wert hinzu (O(1))."""
+        self.count += 1
+        if value <= 1e-9:
+            self.zero_count += 1
+            return
+        self.buckets[math.ceil(math.log(value) / self._log_gamma)] += 1
+
+    def quantile(self, q: float) -> float:
+        """Geschätztes q-Quantil (0-1), 0.0 wenn leer."""
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # Bucket-Mitte mit gleichem relativen Fehler zu beiden Grenzen
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+def _empty_stats() -> Dict[str, float]:
+    return {
+        "total": 0,
+        "success": 0,
+        "failures": 0,
+        "avg_duration_ms": 0,
+        "total_duration_ms": 0
+    }
+
+
 class FeedbackLoop:
     """
     Sammelt Feedback und lernt daraus.
@@ -65,17 +125,22 @@ class FeedbackLoop:
     def __init__(self, storage_path: str = "sketching/learning/feedback_db.json"):
         """
         Args:
-            storage_path: Pfad zur JSON-Datei für Persistenz
+            storage_path: Pfad der Feedback-DB. Records werden in die
+                gleichnamige .jsonl-Datei angehängt; eine vorhandene
+                JSON-DB im alten Format wird einmalig übernommen.
         """
         self.storage_path = storage_path
+        self.log_path = os.path.splitext(storage_path)[0] + ".jsonl"
         self.records: List[OperationRecord] = []
-        self.stats: Dict[str, Dict] = defaultdict(lambda: {
-            "total": 0,
-            "success": 0,
-            "failures": 0,
-            "avg_duration_ms": 0,
-            "total_duration_ms": 0
-        })
+        self.stats: Dict[str, Dict] = defaultdict(_empty_stats)
+        self.duration_sketches: Dict[str, DurationSketch] = defaultdict(DurationSketch)
+        self._error_counts: Counter = Counter()
+
+        # Dauer-Index für get_slow_operations: sortierter Teil + unsortierter Zuwachs
+        self._by_duration: List[Tuple[float, int]] = []
+        self._by_duration_pending: List[Tuple[float, int]] = []
+
+        self._log_file = None
 
         # Lade gespeicherte Daten
         self._load()
@@ -105,12 +170,8 @@ class FeedbackLoop:
             duration_ms=duration_ms,
             error=error
         )
-        self.records.append(record)
-        self._update_stats(record)
-
-        # Speichere periodisch
-        if len(self.records) % 10 == 0:
-            self.save()
+        self._add(record)
+        self._append_to_log([record])
 
     def get_success_rate(self, operation: str) -> float:
         """
@@ -176,11 +237,7 @@ class FeedbackLoop:
         Returns:
             Dict mit Fehler-Typ → Anzahl
         """
-        error_counts = defaultdict(int)
-        for record in self.records:
-            if record.error:
-                error_counts[record.error] += 1
-        return dict(error_counts)
+        return dict(self._error_counts)
 
     def get_slow_operations(self, threshold_ms: float = 100) -> List[OperationRecord]:
         """
@@ -190,15 +247,55 @@ class FeedbackLoop:
             threshold_ms: Schwellenwert in ms
 
         Returns:
-            Liste der langsamen Operationen
+            Liste der langsamen Operationen (in Aufzeichnungs-Reihenfolge)
+        """
+        index = self._duration_index()
+        start = bisect.bisect_right(index, (threshold_ms, len(self.records)))
+        return [self.records[i] for i in sorted(i for _, i in index[start:])]
+
+    def count_slow_operations(self, threshold_ms: float = 100) -> int:
+        """Anzahl der Operationen über threshold_ms (ohne Records zu kopieren)."""
+        index = self._duration_index()
+        return len(index) - bisect.bisect_right(index, (threshold_ms, len(self.records)))
+
+    def get_duration_percentiles(
+        self,
+        operation: str,
+        quantiles: Tuple[float, ...] = (0.5, 0.9, 0.99)
+    ) -> Dict[str, float]:
+        """
+        Dauer-Perzentile einer Operation aus dem Quantil-Sketch.
+
+        Returns:
+            Dict z.B. {"p50": 12.1, "p90": 40.3, "p99": 95.0} (ms)
         """
-        return [
-            r for r in self.records
-            if r.duration_ms > threshold_ms
-        ]
+        if operation not in self.duration_sketches:
+            return {}
+        sketch = self.duration_sketches[operation]
+        return {f"p{round(q * 100)}": sketch.quantile(q) for q in quantiles}
+
+    def _duration_index(self) -> List[Tuple[float, int]]:
+        """Sortierter (duration_ms, record_idx) Index, Zuwachs wird bei Bedarf eingemischt."""
+        if self._by_duration_pending:
+            # Timsort erkennt die beiden sortierten Läufe -> linearer Merge
+            self._by_duration_pending.sort()
+            self._by_duration.extend(self._by_duration_pending)
+            self._by_duration.sort()
+            self._by_duration_pending = []
+        return self._by_duration
+
+    def _add(self, record: OperationRecord):
+        """Nimmt Record in den Speicher und alle Aggregate auf."""
+        self._by_duration_pending.append((record.duration_ms, len(self.records)))
+        self.records.append(record)
+        self._update_stats(record)
 
     def _update_stats(self, record: OperationRecord):
         """Aktualisiert Statistiken nach neuem Record."""
+        self.duration_sketches[record.operation].add(record.duration_ms)
+        if record.error:
+            self._error_counts[record.error] += 1
+
         stats = self.stats[record.operation]
 
         stats["total"] += 1
@@ -265,58 +362,91 @@ class FeedbackLoop:
         return result
 
     def save(self):
-        """Speichert Feedback-DB in JSON-Datei."""
+        """
+        Schreibt gepufferte Records auf die Platte.
+
+        Records werden bereits in record() an das JSONL-Log angehängt;
+        save() erzwingt nur das Flushen.
+        """
         try:
-            import os
-            os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
+            if self._log_file is not None:
+                self._log_file.flush()
+                os.fsync(self._log_file.fileno())
+        except Exception as e:
+            logger.error(f"[FeedbackLoop] Speichern fehlgeschlagen: {e}")
 
-            data = {
-                "records": [r.to_dict() for r in self.records],
-                "stats": dict(self.stats)
-            }
+    def close(self):
+        """Schließt das JSONL-Log."""
+        if self._log_file is not None:
+            self.save()
+            self._log_file.close()
+            self._log_file = None
 
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+    def _append_to_log(self, records: List[OperationRecord]):
+        """Hängt Records als JSON-Zeilen an das Log an."""
+        try:
+            if self._log_file is None:
+                directory = os.path.dirname(self.log_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._log_file = open(self.log_path, 'a', encoding='utf-8')
 
-            logger.debug(f"[FeedbackLoop] Gespeichert: {len(self.records)} Records")
+            self._log_file.write("".join(json.dumps(r.to_dict()) + "\n" for r in records))
+            self._log_file.flush()
 
         except Exception as e:
-            logger.error(f"[FeedbackLoop] Speichern fehlgeschlagen: {e}")
+            logger.error(f"[FeedbackLoop] Anhängen fehlgeschlagen: {e}")
 
     def _load(self):
-        """Lädt Feedback-DB aus JSON-Datei."""
+        """Lädt das JSONL-Log und baut die Aggregate auf."""
         try:
-            import os
-            if not os.path.exists(self.storage_path):
+            if not os.path.exists(self.log_path):
+                self._migrate_legacy_db()
                 return
 
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
-
-            self.records = [
-                OperationRecord.from_dict(r) for r in data.get("records", [])
-            ]
-            self.stats = defaultdict(lambda: {
-                "total": 0,
-                "success": 0,
-                "failures": 0,
-                "avg_duration_ms": 0,
-                "total_duration_ms": 0
-            })
-            self.stats.update(data.get("stats", {}))
-
+            skipped = 0
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        self._add(OperationRecord.from_dict(json.loads(line)))
+                    except (ValueError, KeyError):
+                        # z.B. abgebrochene letzte Zeile nach Absturz
+                        skipped += 1
+
+            if skipped:
+                logger.warning(f"[FeedbackLoop] {skipped} defekte Zeilen übersprungen")
             logger.debug(f"[FeedbackLoop] Geladen: {len(self.records)} Records")
 
         except Exception as e:
             logger.warning(f"[FeedbackLoop] Laden fehlgeschlagen: {e}")
 
+    def _migrate_legacy_db(self):
+        """Übernimmt Records aus der alten JSON-DB (einmalig) in das JSONL-Log."""
+        if self.storage_path == self.log_path or not os.path.exists(self.storage_path):
+            return
+
+        with open(self.storage_path, 'r') as f:
+            data = json.load(f)
+
+        records = [OperationRecord.from_dict(r) for r in data.get("records", [])]
+        for record in records:
+            self._add(record)
+        if records:
+            self._append_to_log(records)
+            logger.info(f"[FeedbackLoop] {len(records)} Records aus {self.storage_path} übernommen")
+
     def get_summary(self) -> Dict[str, Any]:
         """Zusammenfassung der Feedback-Daten."""
         return {
             "total_records": len(self.records),
             "operations": list(self.stats.keys()),
             "error_analysis": self.analyze_errors(),
-            "slow_operations": len(self.get_slow_operations())
+            "slow_operations": self.count_slow_operations(),
+            "duration_percentiles": {
+                op: self.get_duration_percentiles(op) for op in self.stats
+            }
         }
 
 
@@ -328,7 +458,7 @@ def create_feedback_loop(
     Factory-Funktion zum Erstellen eines FeedbackLoop.
 
     Args:
-        storage_path: Pfad zur JSON-Datei
+        storage_path: Pfad der Feedback-DB (Records in der .jsonl daneben)
 
     Returns:
         FeedbackLoop Instanz
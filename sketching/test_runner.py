@@ -41,18 +41,21 @@ class TestRunner:
     - Memory-Usage
     """
 
-    def __init__(self, agent: Optional[SketchAgent] = None):
+    def __init__(self, agent: Optional[SketchAgent] = None, workers: int = 1):
         """
         Args:
             agent: SketchAgent Instanz (wird erstellt wenn None)
+            workers: Worker-Prozesse für Stress-Test und ML-Dataset (1 = seriell)
         """
         self.agent = agent or SketchAgent(mode="adaptive", headless=True)
+        self.workers = workers
         self.results: List[PartResult] = []
 
     def run_stress_test(
         self,
         count: int = 100,
-        complexity: str = "medium"
+        complexity: str = "medium",
+        workers: Optional[int] = None
     ) -> StressTestResult:
         """
         Stress-Test mit N zufälligen Parts.
@@ -60,20 +63,25 @@ class TestRunner:
         Args:
             count: Anzahl der zu generierenden Parts
             complexity: Komplexität der Parts
+            workers: Überschreibt self.workers für diesen Lauf
 
         Returns:
             StressTestResult mit allen Metriken
         """
-        logger.info(f"[TestRunner] Stress-Test: {count} Parts")
+        workers = workers or self.workers
+        logger.info(f"[TestRunner] Stress-Test: {count} Parts ({workers} Worker)")
 
         start_time = time.time()
         start_memory = psutil.Process().memory_info().rss / 1024 / 1024 if HAS_PSUTIL else 0
 
         # Batch ausführen
-        batch = self.agent.run_batch(count=count, complexity=complexity)
+        batch = self.agent.run_batch(count=count, complexity=complexity, workers=workers)
 
         end_memory = psutil.Process().memory_info().rss / 1024 / 1024 if HAS_PSUTIL else 0
         memory_mb = end_memory - start_memory if HAS_PSUTIL else 0
+        if batch.worker_count > 1:
+            # Parts leben in den Worker-Prozessen
+            memory_mb = batch.memory_mb
 
         # Fehler-Analyse
         error_analysis = self._analyze_errors(batch.results)
@@ -136,49 +144,63 @@ class TestRunner:
     def generate_ml_dataset(
         self,
         count: int = 100,
-        output_dir: str = "ml_data"
+        output_dir: str = "ml_data",
+        workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Generiert ML-Trainingsdaten.
 
         Format:
-        - JSON Files (Metadaten, Tags)
+        - parts.jsonl: Eine Zeile pro Part, wird während des Laufs geschrieben
+        - dataset_metadata.json: Gesamt-Metadaten am Ende
         - STEP Files können separat exportiert werden
 
         Args:
             count: Anzahl der zu generierenden Parts
             output_dir: Ausgabeverzeichnis
+            workers: Worker-Prozesse (überschreibt self.workers)
 
         Returns:
             DatasetInfo mit Statistiken
         """
-        logger.info(f"[TestRunner] ML-Dataset: {count} Parts -> {output_dir}")
+        workers = workers or self.workers
+        logger.info(f"[TestRunner] ML-Dataset: {count} Parts -> {output_dir} ({workers} Worker)")
 
         os.makedirs(output_dir, exist_ok=True)
 
         metadata_file = os.path.join(output_dir, "dataset_metadata.json")
+        parts_file = os.path.join(output_dir, "parts.jsonl")
         parts_data = []
 
         start_time = time.time()
 
-        for i in range(count):
-            result = self.agent.generate_part(complexity="medium")
-
-            part_metadata = {
-                "id": f"part_{i:04d}",
-                "success": result.success,
-                "operations": result.operations,
-                "duration_ms": result.duration_ms,
-                "face_count": result.face_count if result.success else 0,
-                "volume": result.volume if result.success else 0,
-                "metadata": result.metadata,
-                "error": result.error
-            }
-
-            parts_data.append(part_metadata)
-
-            if (i + 1) % 10 == 0:
-                logger.info(f"[TestRunner] {i + 1}/{count} Parts generiert")
+        with open(parts_file, 'w') as stream:
+            def write_part(i: int, result: PartResult) -> None:
+                part_metadata = {
+                    "id": f"part_{i:04d}",
+                    "success": result.success,
+                    "operations": result.operations,
+                    "duration_ms": result.duration_ms,
+                    "face_count": result.face_count if result.success else 0,
+                    "volume": result.volume if result.success else 0,
+                    "metadata": result.metadata,
+                    "error": result.error
+                }
+                parts_data.append(part_metadata)
+
+                # Inkrementell schreiben - ein abgebrochener Lauf behält alle fertigen Parts
+                stream.write(json.dumps(part_metadata) + "\n")
+                stream.flush()
+
+            if workers > 1:
+                self.agent.run_batch(count=count, complexity="medium", workers=workers, on_result=write_part)
+                parts_data.sort(key=lambda p: p["metadata"].get("batch_index", 0))
+            else:
+                for i in range(count):
+                    write_part(i, self.agent.generate_part(complexity="medium"))
+
+                    if (i + 1) % 10 == 0:
+                        logger.info(f"[TestRunner] {i + 1}/{count} Parts generiert")
 
         # Metadata speichern
         dataset_metadata = {
@@ -198,6 +220,7 @@ class TestRunner:
             "count": count,
             "output_dir": output_dir,
             "metadata_file": metadata_file,
+            "parts_file": parts_file,
             "success_rate": dataset_metadata["successful_parts"] / count,
             "duration_ms": duration_ms
         }
@@ -98,6 +98,7 @@ FEATURE_FLAG_DEFAULTS = {
     
     # Live Preview
     "preview_debounce_ms": 150,
+    "boolean_result_cache_mb": 128,
     
     # Normal Map Preview
     "normal_map_preview": False,
@@ -105,6 +106,7 @@ FEATURE_FLAG_DEFAULTS = {
     # Advanced
     "detailed_boolean_history": True,
     "helix_fitting_enabled": True,
+    "cosmetic_threads": True,
 }
 
 
@@ -168,6 +170,8 @@ def _global_singleton_isolation():
     - BREPCache (modeling.brep_cache)
     - BREPPersistence (modeling.brep_persistence)
     - GeometryDriftDetector (modeling.geometry_drift_detector)
+    - BooleanResultCache / PrecheckCache (modeling.boolean_engine_v4)
+    - Shape-Validierungs-Urteile (modeling.shape_validation)
     """
     # Pre-Test: Reset all global singletons
     try:
@@ -189,6 +193,19 @@ def _global_singleton_isolation():
     except ImportError:
         pass
     
+    try:
+        from modeling.boolean_engine_v4 import BooleanResultCache, PrecheckCache
+        BooleanResultCache.clear()
+        PrecheckCache.clear()
+    except ImportError:
+        pass
+    
+    try:
+        from modeling.shape_validation import clear_validation_cache
+        clear_validation_cache()
+    except ImportError:
+        pass
+    
     yield
     
     # Post-Test: Reset all global singletons (cleanup)
@@ -210,4 +227,17 @@ def _global_singleton_isolation():
         detector.clear_all_cache()
     except ImportError:
         pass
+    
+    try:
+        from modeling.boolean_engine_v4 import BooleanResultCache, PrecheckCache
+        BooleanResultCache.clear()
+        PrecheckCache.clear()
+    except ImportError:
+        pass
+    
+    try:
+        from modeling.shape_validation import clear_validation_cache
+        clear_validation_cache()
+    except ImportError:
+        pass
 
@@ -0,0 +1,125 @@
+"""
+Tests für den prozess-parallelen BatchExecutor.
+
+Die Worker verwenden einen leichten Fake-Agent, damit die Tests ohne
+OCP-Aufwand und schnell laufen; die Seeds kommen trotzdem vom Executor.
+"fork" statt "spawn" spart den Re-Import des sketching-Pakets pro Worker.
+"""
+
+import os
+import random
+from datetime import datetime, timedelta
+from functools import partial
+
+import multiprocessing as mp
+
+import pytest
+
+from sketching.core.batch_executor import BatchExecutor, part_seed
+from sketching.core.result_types import BatchResult, PartResult
+
+
+START_METHOD = "fork" if "fork" in mp.get_all_start_methods() else "spawn"
+
+
+class _FakeAgent:
+    def __init__(self, crash_marker=None):
+        self.crash_marker = crash_marker
+
+    def generate_part(self, complexity="medium"):
+        # Erster Aufruf mit Marker simuliert einen harten Absturz (einmalig)
+        if self.crash_marker and not os.path.exists(self.crash_marker):
+            open(self.crash_marker, "w").close()
+            os._exit(3)
+
+        value = random.random()
+        return PartResult(
+            success=value > 0.2,
+            solid=None,
+            operations=[complexity],
+            duration_ms=value,
+            error=None if value > 0.2 else "fake failure",
+        )
+
+
+def _fake_factory(mode, crash_marker=None):
+    return _FakeAgent(crash_marker)
+
+
+def _always_crash_factory(mode):
+    os._exit(7)
+
+
+def _executor(**kwargs):
+    kwargs.setdefault("agent_factory", _fake_factory)
+    return BatchExecutor(start_method=START_METHOD, **kwargs)
+
+
+def _durations(batch):
+    return [r.duration_ms for r in batch.results]
+
+
+class TestBatchExecutor:
+    def test_results_are_complete_ordered_and_seed_deterministic(self):
+        streamed = []
+        parallel = _executor(workers=3, seed=7, shard_size=4).run(
+            count=20, complexity="simple", on_result=lambda i, r: streamed.append(i)
+        )
+        serial = _executor(workers=1, seed=7, shard_size=20).run(
+            count=20, complexity="simple"
+        )
+
+        assert sorted(streamed) == list(range(20))
+        assert [r.metadata["batch_index"] for r in parallel.results] == list(range(20))
+        assert _durations(parallel) == _durations(serial)
+        assert parallel.results[5].metadata["seed"] == part_seed(7, 5)
+        assert parallel.worker_count == 3
+        assert parallel.seed == 7
+
+    def test_crashed_worker_is_restarted_without_losing_parts(self, tmp_path):
+        factory = partial(_fake_factory, crash_marker=str(tmp_path / "crashed"))
+
+        batch = _executor(workers=2, seed=3, shard_size=3, agent_factory=factory).run(count=9)
+        reference = _executor(workers=1, seed=3).run(count=9)
+
+        assert batch.restarts >= 1
+        assert batch.total_count == 9
+        assert _durations(batch) == _durations(reference)
+
+    def test_repeatedly_crashing_parts_are_reported_as_failures(self):
+        batch = _executor(workers=1, seed=1, max_restarts=0, agent_factory=_always_crash_factory).run(count=2)
+
+        assert batch.total_count == 2
+        assert batch.success_count == 0
+        assert all("abgestürzt" in r.error for r in batch.results)
+
+
+class TestBatchResultMerge:
+    def test_merge_sorts_by_index_and_sums_workers(self):
+        t0 = datetime(2026, 1, 1)
+
+        def part(index):
+            return PartResult(success=True, solid=None, operations=[], duration_ms=1.0,
+                              metadata={"batch_index": index})
+
+        a = BatchResult([part(2), part(0)], 0.0, t0, t0 + timedelta(seconds=2), restarts=1, seed=5)
+        b = BatchResult([part(1)], 0.0, t0 + timedelta(seconds=1), t0 + timedelta(seconds=3), seed=5)
+
+        merged = BatchResult.merge([a, b])
+
+        assert [r.metadata["batch_index"] for r in merged.results] == [0, 1, 2]
+        assert merged.worker_count == 2
+        assert merged.restarts == 1
+        assert merged.seed == 5
+        assert merged.duration_ms == pytest.approx(3000.0)
+
+    def test_detached_part_keeps_solid_metrics(self):
+        build123d = pytest.importorskip("build123d")
+        solid = build123d.Box(10, 20, 30)
+        result = PartResult(success=True, solid=solid, operations=["box"], duration_ms=1.0)
+
+        detached = result.detached()
+
+        assert detached.solid is None
+        assert detached.volume == pytest.approx(6000.0)
+        assert detached.face_count == 6
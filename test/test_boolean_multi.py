@@ -0,0 +1,94 @@
+"""
+Tests für BooleanEngineV4.execute_boolean_multi (ein Boolean, viele Tools).
+"""
+
+import math
+
+import pytest
+from build123d import Box, Cylinder, Location, Align
+
+from modeling.boolean_engine_v4 import BooleanEngineV4
+
+
+def _plate(size=50.0, height=5.0):
+    return Box(size, size, height, align=(Align.MIN, Align.MIN, Align.MIN))
+
+
+def _pins(positions, radius=1.0, height=20.0):
+    pin = Cylinder(radius, height, align=(Align.CENTER, Align.CENTER, Align.CENTER))
+    return [pin.moved(Location((x, y, 2.5))) for x, y in positions]
+
+
+def test_multi_cut_matches_sequential_loop():
+    plate = _plate()
+    tools = _pins([(5 + 10 * i, 5 + 10 * j) for i in range(4) for j in range(3)])
+
+    multi = BooleanEngineV4.execute_boolean_multi(plate, tools, "Cut")
+
+    sequential = plate
+    for tool in tools:
+        sequential = BooleanEngineV4.execute_boolean_on_shapes(sequential, tool, "Cut").value
+
+    assert multi.is_success, multi.message
+    assert multi.value.volume == pytest.approx(sequential.volume, rel=1e-9)
+    assert multi.value.volume == pytest.approx(50 * 50 * 5 - 12 * math.pi * 5, rel=1e-6)
+    assert multi.history is not None
+
+
+def test_overlapping_tools_are_cut_as_separate_arguments():
+    plate = _plate()
+    tools = _pins([(20.0, 20.0), (21.0, 20.0), (40.0, 40.0)])
+
+    args, n_groups, n_skipped = BooleanEngineV4._partition_tools(plate.wrapped, [t.wrapped for t in tools], "Cut", 1e-4)
+    result = BooleanEngineV4.execute_boolean_multi(plate, tools, "Cut")
+
+    assert (len(args), n_groups, n_skipped) == (3, 2, 0)
+    assert result.is_success, result.message
+    two_overlapping = 2 * math.pi - 2 * (math.acos(0.5) - 0.5 * math.sqrt(0.75))
+    assert result.value.volume == pytest.approx(50 * 50 * 5 - (two_overlapping + math.pi) * 5, rel=1e-6)
+
+
+def test_isolated_tools_are_packed_and_far_tools_skipped():
+    plate = _plate()
+    tools = [t.wrapped for t in _pins([(5.0, 5.0), (25.0, 25.0), (45.0, 45.0), (500.0, 500.0)])]
+
+    args, n_groups, n_skipped = BooleanEngineV4._partition_tools(plate.wrapped, tools, "Cut", 1e-4)
+
+    assert (len(args), n_groups, n_skipped) == (1, 3, 1)
+
+
+def test_join_keeps_tools_outside_target():
+    plate = _plate(size=10.0)
+    tools = [Box(2, 2, 2).moved(Location((30.0, 0.0, 0.0))), Box(2, 2, 2).moved(Location((5.0, 5.0, 6.0)))]
+
+    result = BooleanEngineV4.execute_boolean_multi(plate, tools, "Join")
+
+    assert result.is_success, result.message
+    assert result.value.volume == pytest.approx(10 * 10 * 5 + 8 + 8, rel=1e-6)
+
+
+def test_cut_without_touching_tools_is_an_error():
+    result = BooleanEngineV4.execute_boolean_multi(_plate(), _pins([(500.0, 500.0)]), "Cut")
+
+    assert not result.is_success
+    assert "no change" in result.message
+
+
+def test_naming_service_updated_once_with_merged_history():
+    class _Naming:
+        def __init__(self):
+            self.calls = []
+
+        def update_shape_ids_from_history(self, **kwargs):
+            self.calls.append(kwargs)
+            return 0
+
+    naming = _Naming()
+    tools = _pins([(5.0 + 10 * i, 5.0) for i in range(5)])
+
+    result = BooleanEngineV4.execute_boolean_multi(_plate(), tools, "Cut", naming_service=naming, feature_id="f1")
+
+    assert result.is_success
+    assert len(naming.calls) == 1
+    assert naming.calls[0]["occt_history"] is result.history
+    assert naming.calls[0]["operation_type"] == "boolean_cut"
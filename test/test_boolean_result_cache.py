@@ -0,0 +1,163 @@
+"""
+Tests für BooleanResultCache (Boolean-Ergebnis-Memo mit History-Replay).
+"""
+
+import pytest
+from build123d import Align, Box, Cylinder, Location
+
+from config.feature_flags import set_setting
+from modeling.boolean_engine_v4 import BooleanEngineV4, BooleanResultCache
+
+
+def _plate():
+    return Box(100, 100, 10, align=(Align.MIN, Align.MIN, Align.MIN))
+
+
+def _pin(x, y=20.0):
+    return Cylinder(2.0, 30).moved(Location((x, y, 5)))
+
+
+class _Naming:
+    def __init__(self):
+        self.calls = []
+
+    def update_shape_ids_from_history(self, **kwargs):
+        self.calls.append(kwargs)
+        return 0
+
+
+def _forbid_ocp_boolean(monkeypatch):
+    def _fail(*args, **kwargs):
+        raise AssertionError("OCP-Boolean darf bei Memo-Treffer nicht laufen")
+    monkeypatch.setattr(BooleanEngineV4, "_execute_ocp_boolean", staticmethod(_fail))
+
+
+def test_repeated_boolean_is_served_from_memo(monkeypatch):
+    plate, pin = _plate(), _pin(20)
+    first = BooleanEngineV4.execute_boolean_on_shapes(plate, pin, "Cut")
+    assert first.is_success, first.message
+
+    _forbid_ocp_boolean(monkeypatch)
+    again = BooleanEngineV4.execute_boolean_on_shapes(plate, pin, "Cut")
+
+    assert again.is_success, again.message
+    assert again.value.volume == pytest.approx(first.value.volume, rel=1e-9)
+    assert {"memo_lookup", "memo_replay", "validate"} <= set(again.stage_timings)
+
+
+def test_each_hit_returns_its_own_copy(monkeypatch):
+    plate, pin = _plate(), _pin(20)
+    first = BooleanEngineV4.execute_boolean_on_shapes(plate, pin, "Cut")
+    assert first.is_success, first.message
+
+    _forbid_ocp_boolean(monkeypatch)
+    a = BooleanEngineV4.execute_boolean_on_shapes(plate, pin, "Cut")
+    b = BooleanEngineV4.execute_boolean_on_shapes(plate, pin, "Cut")
+
+    assert a.is_success and b.is_success
+    assert not a.value.wrapped.IsPartner(first.value.wrapped)
+    assert not a.value.wrapped.IsPartner(b.value.wrapped)
+    assert a.history is not b.history
+
+
+def test_broken_parameter_flags_are_a_miss():
+    from OCP.BRep import BRep_Builder
+    from OCP.BRepBuilderAPI import BRepBuilderAPI_Copy
+    from OCP.TopAbs import TopAbs_EDGE
+    from OCP.TopExp import TopExp_Explorer
+    from OCP.TopoDS import TopoDS
+
+    BooleanEngineV4.execute_boolean_on_shapes(_plate(), _pin(20), "Cut")
+
+    # Gleicher Fingerprint, aber SameParameter=False auf allen Edges
+    broken = BRepBuilderAPI_Copy(_plate().wrapped).Shape()
+    explorer = TopExp_Explorer(broken, TopAbs_EDGE)
+    while explorer.More():
+        BRep_Builder().SameParameter(TopoDS.Edge_s(explorer.Current()), False)
+        explorer.Next()
+    BooleanEngineV4.execute_boolean_on_shapes(broken, _pin(20).wrapped, "Cut")
+
+    assert BooleanResultCache.stats()["hits"] == 0
+
+
+def test_equal_operands_replay_history_onto_new_objects(monkeypatch):
+    from OCP.TopAbs import TopAbs_FACE
+    from OCP.TopExp import TopExp
+    from OCP.TopTools import TopTools_IndexedMapOfShape
+
+    first = BooleanEngineV4.execute_boolean_on_shapes(_plate(), _pin(20), "Cut")
+    assert first.is_success, first.message
+
+    _forbid_ocp_boolean(monkeypatch)
+    naming = _Naming()
+    plate = _plate()
+    replay = BooleanEngineV4.execute_boolean_on_shapes(plate, _pin(20), "Cut",
+                                                       naming_service=naming, feature_id="f1")
+
+    assert replay.is_success, replay.message
+    assert replay.value.volume == pytest.approx(first.value.volume, rel=1e-9)
+    assert len(naming.calls) == 1
+    assert naming.calls[0]["occt_history"] is replay.history
+    assert naming.calls[0]["source_solid"] is plate.wrapped
+
+    faces = TopTools_IndexedMapOfShape()
+    TopExp.MapShapes_s(plate.wrapped, TopAbs_FACE, faces)
+    for i in range(1, faces.Extent() + 1):
+        assert replay.history.Modified(faces.FindKey(i)).Size() == 1
+
+
+def test_different_tool_position_is_a_miss():
+    BooleanEngineV4.execute_boolean_on_shapes(_plate(), _pin(20), "Cut")
+    other = BooleanEngineV4.execute_boolean_on_shapes(_plate(), _pin(60), "Cut")
+
+    assert other.is_success
+    assert "memo" not in other.message
+    assert BooleanResultCache.stats()["misses"] == 2
+
+
+def test_multi_tool_boolean_is_memoized(monkeypatch):
+    tools = [_pin(10 + 10 * i) for i in range(4)]
+    first = BooleanEngineV4.execute_boolean_multi(_plate(), tools, "Cut")
+    assert first.is_success, first.message
+
+    _forbid_ocp_boolean(monkeypatch)
+    again = BooleanEngineV4.execute_boolean_multi(_plate(), [_pin(10 + 10 * i) for i in range(4)], "Cut")
+
+    assert again.is_success, again.message
+    assert again.value.volume == pytest.approx(first.value.volume, rel=1e-9)
+
+
+def test_stats_report_hits_and_saved_time():
+    plate, pin = _plate(), _pin(20)
+    BooleanEngineV4.execute_boolean_on_shapes(plate, pin, "Cut")
+    BooleanEngineV4.execute_boolean_on_shapes(plate, pin, "Cut")
+
+    stats = BooleanResultCache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == pytest.approx(0.5)
+    assert stats["saved_ms"] > 0
+    assert 0 < stats["bytes"] <= stats["budget_bytes"]
+
+
+def test_byte_budget_evicts_least_recently_used():
+    BooleanEngineV4.execute_boolean_on_shapes(_plate(), _pin(20), "Cut")
+    entry_bytes = BooleanResultCache.stats()["bytes"]
+    set_setting("boolean_result_cache_mb", 1.5 * entry_bytes / (1024 * 1024))
+
+    BooleanEngineV4.execute_boolean_on_shapes(_plate(), _pin(60), "Cut")
+
+    stats = BooleanResultCache.stats()
+    assert stats["entries"] == 1
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= stats["budget_bytes"]
+
+
+def test_zero_budget_disables_memo():
+    set_setting("boolean_result_cache_mb", 0)
+    plate, pin = _plate(), _pin(20)
+    BooleanEngineV4.execute_boolean_on_shapes(plate, pin, "Cut")
+    again = BooleanEngineV4.execute_boolean_on_shapes(plate, pin, "Cut")
+
+    assert again.is_success
+    assert "memo" not in again.message
+    assert BooleanResultCache.stats()["entries"] == 0
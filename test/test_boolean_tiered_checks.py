@@ -0,0 +1,144 @@
+"""
+Tests für die gestuften Pre-/Post-Checks in BooleanEngineV4
+(AABB/OBB zuerst, Memo pro Shape, lokaler Post-Check, stage_timings).
+"""
+
+import pytest
+from build123d import Align, Axis, Box, Cylinder, Location
+
+from modeling import Body, HoleFeature, PatternFeature, PrimitiveFeature
+from modeling.boolean_engine_v4 import BooleanEngineV4, PrecheckCache, VolumeCache
+from modeling.shape_validation import (
+    ValidationTier, check_shape, clear_validation_cache, validation_stats, validation_stats_since,
+)
+
+
+def _plate():
+    return Box(100, 100, 10, align=(Align.MIN, Align.MIN, Align.MIN))
+
+
+def _pin(x, y, radius=2.0):
+    return Cylinder(radius, 30).moved(Location((x, y, 5)))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    PrecheckCache.clear()
+    VolumeCache.clear()  # BBoxen sind per id() gecacht
+    yield
+    PrecheckCache.clear()
+
+
+def _count_calls(monkeypatch, name):
+    calls = []
+    original = getattr(BooleanEngineV4, name)
+    monkeypatch.setattr(BooleanEngineV4, name,
+                        staticmethod(lambda *a, **k: calls.append(a) or original(*a, **k)))
+    return calls
+
+
+def test_disjoint_cut_returns_before_ocp_boolean(monkeypatch):
+    def _fail(*args, **kwargs):
+        raise AssertionError("OCP-Boolean darf nicht laufen")
+    monkeypatch.setattr(BooleanEngineV4, "_execute_ocp_boolean", staticmethod(_fail))
+
+    result = BooleanEngineV4.execute_boolean_on_shapes(_plate(), _pin(500, 500), "Cut")
+
+    assert not result.is_success
+    assert "no change" in result.message
+    assert {"precheck_bbox", "total"} <= set(result.stage_timings)
+
+
+def test_oriented_box_rejects_rotated_tool_with_overlapping_aabb():
+    plate = _plate().wrapped
+    # Diagonaler Stab entlang x + y = -20: AABB schneidet die Platte, der Stab nicht
+    rod = Box(140, 1, 1).rotate(Axis.Z, -45).moved(Location((-10, -10, 5))).wrapped
+
+    assert BooleanEngineV4._aabb_relation(plate, rod, 1e-4) != "disjoint"
+    assert BooleanEngineV4._shapes_disjoint(plate, rod, "Cut", 1e-4)
+    assert not BooleanEngineV4._shapes_disjoint(plate, rod, "Join", 1e-4)
+
+
+def test_self_intersection_verdict_is_memoized_per_shape(monkeypatch):
+    calls = _count_calls(monkeypatch, "_run_checker_si")
+    plate = _plate().wrapped
+
+    assert BooleanEngineV4._check_self_intersection(plate, "Body") is None
+    assert BooleanEngineV4._check_self_intersection(plate, "Body") is None
+    assert len(calls) == 1
+    assert PrecheckCache.hits >= 1
+
+    # Geometrisch gleicher, aber eigenständiger Shape: eigenes Urteil
+    assert BooleanEngineV4._check_self_intersection(_plate().wrapped, "Body") is None
+    assert len(calls) == 2
+
+
+def test_chained_cut_does_not_promote_local_check_to_full_verdict(monkeypatch):
+    si_calls = _count_calls(monkeypatch, "_run_checker_si")
+    clear_validation_cache()
+
+    first = BooleanEngineV4.execute_boolean_on_shapes(_plate(), _pin(20, 20), "Cut")
+    assert first.is_success, first.message
+    assert len(si_calls) == 2  # Body + Tool
+
+    # Nur geänderte Faces geprüft: SUBSHAPES gemerkt, FULL/CheckerSI nicht
+    before = validation_stats()
+    check_shape(first.value.wrapped, ValidationTier.SUBSHAPES)
+    assert validation_stats_since(before)["subshapes"]["cached"] == 1
+
+    second = BooleanEngineV4.execute_boolean_on_shapes(first.value, _pin(60, 60), "Cut")
+    assert second.is_success, second.message
+    assert len(si_calls) == 4  # Ergebnis des ersten Cuts + neues Tool
+
+
+def test_successful_cut_validates_only_changed_faces(monkeypatch):
+    full_checks = _count_calls(monkeypatch, "_validate_and_heal_result")
+    _count_calls(monkeypatch, "_is_valid_shape")
+
+    result = BooleanEngineV4.execute_boolean_on_shapes(_plate(), _pin(50, 50), "Cut")
+
+    assert result.is_success, result.message
+    assert full_checks == []
+    assert result.value.volume == pytest.approx(100 * 100 * 10 - 3.141592653589793 * 4 * 10, rel=1e-6)
+    assert {"fix", "precheck_self_intersection", "boolean", "validate", "total"} <= set(result.stage_timings)
+    assert result.slowest_stage()[0] != "total"
+
+
+def test_missing_history_falls_back_to_full_check():
+    assert BooleanEngineV4._validate_changed_faces(_plate().wrapped, None, ()) is False
+
+
+@pytest.mark.parametrize("offset, expect_distance_query", [
+    ((10.0, 0.0, 0.0), True),      # anliegende Faces → Distanz prüfen
+    ((5.0, 5.0, 5.0), False),      # echte Durchdringung
+    ((50.0, 0.0, 0.0), False),     # getrennt
+])
+def test_glue_detection_runs_distance_query_only_for_touching_boxes(monkeypatch, offset, expect_distance_query):
+    import OCP.BRepExtrema as extrema
+
+    queries = []
+    original = extrema.BRepExtrema_DistShapeShape
+    monkeypatch.setattr(extrema, "BRepExtrema_DistShapeShape",
+                        lambda *a: queries.append(a) or original(*a))
+
+    a = Box(10, 10, 10, align=(Align.MIN, Align.MIN, Align.MIN)).wrapped
+    b = Box(10, 10, 10, align=(Align.MIN, Align.MIN, Align.MIN)).moved(Location(offset)).wrapped
+    glue = BooleanEngineV4._detect_glue_mode(a, b, 1e-4)
+
+    assert bool(queries) == expect_distance_query
+    assert (glue is not None) == expect_distance_query
+
+
+def test_body_rebuild_records_boolean_timings_on_feature():
+    body = Body("timings")
+    body.add_feature(PrimitiveFeature(primitive_type="box", length=40.0, width=40.0, height=10.0))
+    hole = HoleFeature(hole_type="simple", diameter=4.0, depth=0.0,
+                       position=(10.0, 10.0, 10.0), direction=(0.0, 0.0, -1.0))
+    body.add_feature(hole)
+    pattern = PatternFeature(pattern_type="Linear", feature_id=hole.id, count=2, spacing=15.0)
+    body.add_feature(pattern)
+
+    assert pattern.status == "SUCCESS", pattern.status_message
+    assert "boolean" in pattern._boolean_timings
+    assert pattern._boolean_timings["total"] >= pattern._boolean_timings["boolean"]
+    assert hole._boolean_timings is None  # BRepFeat, kein Boolean
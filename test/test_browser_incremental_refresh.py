@@ -0,0 +1,134 @@
+"""
+Tests für den inkrementellen Tree-Abgleich im ProjectBrowser.
+
+refresh() verwendet bestehende Items wieder, fasst nur geänderte Zeilen an
+und hält einen Index der Problem-Items für die Navigation.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+os.environ["QT_OPENGL"] = "software"
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from gui.browser import ProjectBrowser
+from modeling.component import Component
+
+
+def _qt_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def _feature(name, status="OK", **details):
+    return SimpleNamespace(name=name, status=status, status_details=details, status_message="")
+
+
+def _browser(n_bodies=3, n_features=4):
+    _qt_app()
+    root = Component(name="Root")
+    for i in range(n_bodies):
+        features = [_feature(f"F{i}.{j}") for j in range(n_features)]
+        root.bodies.append(SimpleNamespace(id=f"b{i}", name=f"Body{i}", features=features, rollback_index=None))
+    doc = SimpleNamespace(
+        name="Doc", root_component=root, _active_component=root, planes=[],
+        get_all_bodies=lambda: root.bodies, get_all_sketches=lambda: [],
+    )
+    browser = ProjectBrowser()
+    browser.set_document(doc)
+    return browser, root
+
+
+def _feature_items(browser):
+    items = []
+    for item in browser.tree._get_all_items():
+        data = item.data(0, Qt.UserRole)
+        if data and data[0] == 'feature':
+            items.append(item)
+    return items
+
+
+def test_refresh_reuses_unchanged_items_and_selection():
+    browser, root = _browser()
+    before = _feature_items(browser)
+    before[5].setSelected(True)
+
+    browser.refresh()
+
+    after = _feature_items(browser)
+    assert all(a is b for a, b in zip(before, after)) and len(after) == len(before)
+    assert browser.tree.selectedItems() == [before[5]]
+
+
+def test_refresh_updates_only_changed_rows():
+    browser, root = _browser()
+    feature = root.bodies[1].features[2]
+    item = _feature_items(browser)[6]
+    assert item.data(0, Qt.UserRole)[1] is feature
+
+    feature.status = "ERROR"
+    feature.status_details = {"status_class": "CRITICAL", "severity": "critical"}
+    feature.name = "Broken"
+    browser.refresh()
+
+    assert _feature_items(browser)[6] is item
+    assert item.text(0) == "↳ Broken"
+    assert item.foreground(0).color().name() == "#ff0000"
+
+
+def test_insert_remove_and_reorder_rows():
+    browser, root = _browser()
+    body_items = {id(b): None for b in root.bodies}
+    for item in browser.tree._get_all_items():
+        data = item.data(0, Qt.UserRole)
+        if data and data[0] == 'body':
+            body_items[id(data[1])] = item
+    kept = body_items[id(root.bodies[0])]
+
+    root.bodies[0].features.insert(1, _feature("New"))
+    removed = root.bodies.pop(2)
+    root.bodies.reverse()
+    browser.refresh()
+
+    names = [item.data(0, Qt.UserRole)[1].name for item in browser.tree._get_all_items()
+             if item.data(0, Qt.UserRole) and item.data(0, Qt.UserRole)[0] == 'body']
+    assert names == ["Body1", "Body0"]
+    assert kept.childCount() == 5 and kept.child(1).text(0) == "↳ New"
+    assert all(item.data(0, Qt.UserRole)[2] is not removed for item in _feature_items(browser))
+    assert len(_feature_items(browser)) == 9
+
+
+def test_problem_navigation_uses_index_in_tree_order():
+    browser, root = _browser()
+    problems = [root.bodies[0].features[3], root.bodies[2].features[1]]
+    for f in problems:
+        f.status = "ERROR"
+    browser.refresh()
+    tree = browser.tree
+    assert [i.data(0, Qt.UserRole)[1] for i in tree._problem_items] == problems
+
+    # Start auf einem Nicht-Problem-Item zwischen den beiden Problemen
+    tree.setCurrentItem(_feature_items(browser)[5])
+    tree.navigate_to_next_problem()
+    assert tree.currentItem().data(0, Qt.UserRole)[1] is problems[1]
+    tree.navigate_to_next_problem()  # Wrap-around
+    assert tree.currentItem().data(0, Qt.UserRole)[1] is problems[0]
+    tree.navigate_to_prev_problem()  # Wrap-around rückwärts
+    assert tree.currentItem().data(0, Qt.UserRole)[1] is problems[1]
+
+
+def test_problem_index_follows_status_changes():
+    browser, root = _browser()
+    assert browser.tree._problem_items == []
+
+    root.bodies[1].features[0].status = "WARNING"
+    browser.refresh()
+    browser.tree.select_all_problem_items()
+
+    selected = browser.tree.selectedItems()
+    assert len(selected) == 1 and selected[0].data(0, Qt.UserRole)[1] is root.bodies[1].features[0]
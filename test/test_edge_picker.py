@@ -0,0 +1,126 @@
+"""
+Tests für gui.viewport.edge_picker (Kanten-Picking im Bildraum).
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from gui.viewport.edge_picker import ScreenEdgePicker
+
+W, H = 800, 600
+
+
+def _ortho() -> np.ndarray:
+    """Welt x in [0, W], y in [0, H] -> NDC (y nach oben), z als Tiefe."""
+    m = np.eye(4)
+    m[0, 0], m[0, 3] = 2.0 / W, -1.0
+    m[1, 1], m[1, 3] = 2.0 / H, -1.0
+    m[2, 2] = 0.01
+    return m
+
+
+def _picker(edges) -> ScreenEdgePicker:
+    picker = ScreenEdgePicker()
+    picker.set_edges(edges)
+    picker.update_projection(_ortho(), W, H, key=1)
+    return picker
+
+
+class TestScreenEdgePicker:
+    def test_picks_nearest_segment_not_nearest_center(self):
+        # Lange Kante: Zentrum weit weg vom Cursor, Segment aber direkt darunter
+        long_edge = np.array([[0.0, 300.0, 0.0], [800.0, 300.0, 0.0]])
+        short_edge = np.array([[90.0, 280.0, 0.0], [110.0, 280.0, 0.0]])
+        picker = _picker([(7, long_edge), (3, short_edge)])
+
+        # Qt-y = H - Welt-y
+        assert picker.pick(700, H - 302) == 7
+        assert picker.pick(100, H - 283) == 3
+        assert picker.pick(400, H - 100) == -1
+
+    def test_polyline_segments_and_tolerance(self):
+        arc = np.array([[100.0, 100.0, 0.0], [200.0, 200.0, 0.0], [300.0, 100.0, 0.0]])
+        picker = _picker([(1, arc)])
+
+        assert picker.segment_count == 2
+        assert picker.pick(250, H - 150) == 1
+        assert picker.pick(200, H - 215) == -1
+
+    def test_front_edge_wins_on_overlap(self):
+        back = np.array([[100.0, 100.0, 50.0], [300.0, 100.0, 50.0]])
+        front = np.array([[100.0, 100.0, -50.0], [300.0, 100.0, -50.0]])
+        picker = _picker([(1, back), (2, front)])
+
+        assert picker.pick(200, H - 100) == 2
+
+    def test_same_key_skips_reprojection(self):
+        picker = _picker([(1, np.array([[0.0, 0.0, 0.0], [10.0, 10.0, 0.0]]))])
+
+        assert picker.update_projection(_ortho(), W, H, key=1) is False
+        assert picker.update_projection(_ortho(), W, H, key=2) is True
+
+    def test_perspective_camera_and_segments_behind_camera(self):
+        vtk = pytest.importorskip("vtk")
+        camera = vtk.vtkCamera()
+        camera.SetPosition(0.0, 0.0, 10.0)
+        camera.SetFocalPoint(0.0, 0.0, 0.0)
+        camera.SetViewUp(0.0, 1.0, 0.0)
+        matrix = camera.GetCompositeProjectionTransformMatrix(W / H, -1, 1)
+        view_proj = np.array([[matrix.GetElement(i, j) for j in range(4)] for i in range(4)])
+
+        picker = ScreenEdgePicker()
+        picker.set_edges([
+            (1, np.array([[-1.0, 0.0, 0.0], [1.0, 0.0, 0.0]])),
+            # Reicht durch die Kamera nach hinten - wird geclippt, nicht verworfen
+            (2, np.array([[0.0, -1.0, 0.0], [0.0, -1.0, 20.0]])),
+            (3, np.array([[0.0, 3.0, 20.0], [1.0, 3.0, 20.0]])),
+        ])
+        picker.update_projection(view_proj, W, H, key="cam")
+
+        assert picker.pick(W / 2 + 40, H / 2) == 1
+        # Bei Tiefe 10 liegt die Kante bei y = 412 px und läuft nach unten aus dem Bild
+        assert picker.pick(W / 2, 450) == 2
+        assert picker.pick(W / 2, 380) == -1
+        assert picker.pick(W / 2, 10) == -1
+
+    def test_hover_on_ten_thousand_edges_is_fast(self):
+        rng = np.random.default_rng(0)
+        starts = rng.uniform([0, 0, 0], [W, H, 1], size=(10000, 3))
+        edges = [(i, np.vstack([p, p + rng.uniform(-20, 20, 3)])) for i, p in enumerate(starts)]
+        picker = _picker(edges)
+
+        cursor = rng.uniform([0, 0], [W, H], size=(200, 2))
+        t0 = time.perf_counter()
+        for x, y in cursor:
+            picker.pick(x, y)
+        per_pick_ms = (time.perf_counter() - t0) * 1000 / len(cursor)
+
+        assert per_pick_ms < 1.0
+
+
+def test_mixin_pick_edge_uses_screen_space_picker():
+    vtk = pytest.importorskip("vtk")
+    from types import SimpleNamespace
+
+    from gui.viewport.edge_selection_mixin import EdgeSelectionMixin, SelectableEdge
+
+    camera = vtk.vtkCamera()
+    camera.SetPosition(0.0, 0.0, 10.0)
+    camera.SetFocalPoint(0.0, 0.0, 0.0)
+    mixin = EdgeSelectionMixin()
+    mixin._init_edge_selection()
+    mixin.plotter = SimpleNamespace(
+        renderer=SimpleNamespace(GetActiveCamera=lambda: camera),
+        interactor=SimpleNamespace(width=lambda: W, height=lambda: H),
+    )
+    points = np.array([[-1.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+    mixin._selectable_edges = [SelectableEdge(
+        id=4, topology_index=4, body_id="b1", build123d_edge=None,
+        center=(0.0, 0.0, 0.0), line_mesh=None, points=points,
+    )]
+    mixin._edge_picker.set_edges([(4, points)])
+
+    assert mixin.pick_edge(W / 2 + 50, H / 2 + 3) == 4
+    assert mixin.pick_edge(W / 2, 50) == -1
@@ -0,0 +1,100 @@
+"""
+Tests für das Kanten-Overlay im EdgeSelectionMixin (ein Actor, Zustand als Cell-Skalar).
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyvista")
+
+from gui.viewport.edge_selection_mixin import (
+    EDGE_OVERLAY_ACTOR,
+    EDGE_STATE_HOVER,
+    EDGE_STATE_LOOP,
+    EDGE_STATE_NORMAL,
+    EDGE_STATE_SELECTED,
+    EdgeSelectionMixin,
+    SelectableEdge,
+)
+
+
+class _FakePlotter:
+    def __init__(self):
+        self.renderer = SimpleNamespace(actors={})
+        self.add_calls = []
+
+    def add_mesh(self, mesh, **kwargs):
+        self.add_calls.append((mesh, kwargs))
+        self.renderer.actors[kwargs["name"]] = SimpleNamespace(GetMapper=lambda: SimpleNamespace(
+            SetResolveCoincidentTopologyToPolygonOffset=lambda: None,
+            SetRelativeCoincidentTopologyPolygonOffsetParameters=lambda *_args: None,
+        ))
+
+    def remove_actor(self, name):
+        self.renderer.actors.pop(name, None)
+
+
+def _make_mixin(n_edges=4):
+    mixin = EdgeSelectionMixin()
+    mixin._init_edge_selection()
+    mixin.plotter = _FakePlotter()
+    for i in range(n_edges):
+        points = np.array([[i, 0.0, 0.0], [i, 1.0, 0.0], [i, 2.0, 1.0]])[: 2 + i % 2]
+        mixin._selectable_edges.append(SelectableEdge(
+            id=i,
+            topology_index=i,
+            body_id="b1",
+            build123d_edge=None,
+            center=tuple(points.mean(axis=0)),
+            line_mesh=None,
+            points=points,
+        ))
+    return mixin
+
+
+def test_overlay_has_one_polyline_cell_per_edge():
+    mixin = _make_mixin()
+
+    mixin._draw_edges_modern()
+
+    assert len(mixin.plotter.add_calls) == 1
+    mesh, kwargs = mixin.plotter.add_calls[0]
+    assert kwargs["name"] == EDGE_OVERLAY_ACTOR
+    assert kwargs["scalars"] == "edge_state"
+    assert mesh.n_cells == 4
+    assert mesh.n_points == 10
+    assert mesh.cell_data["edge_id"].tolist() == [0, 1, 2, 3]
+    assert np.allclose(mesh.get_cell(1).points, mixin._selectable_edges[1].points)
+    assert mesh.cell_data["edge_state"].tolist() == [EDGE_STATE_NORMAL] * 4
+
+
+def test_hover_and_selection_only_update_state_scalars():
+    mixin = _make_mixin()
+    mixin._draw_edges_modern()
+    mesh = mixin._edge_overlay_mesh
+
+    mixin._selected_edge_ids = {1, 2}
+    mixin._hovered_edge_id = 2
+    mixin._hovered_loop_ids = {3}
+    mixin._draw_edges_modern()
+
+    assert len(mixin.plotter.add_calls) == 1
+    assert mixin._edge_overlay_mesh is mesh
+    assert mesh.cell_data["edge_state"].tolist() == [
+        EDGE_STATE_NORMAL, EDGE_STATE_SELECTED, EDGE_STATE_HOVER, EDGE_STATE_LOOP,
+    ]
+    assert mixin._update_edge_states() is False
+
+
+def test_clear_drops_overlay_and_rebuilds_on_next_draw():
+    mixin = _make_mixin()
+    mixin._draw_edges_modern()
+
+    mixin._clear_edge_actors()
+    assert EDGE_OVERLAY_ACTOR not in mixin.plotter.renderer.actors
+    assert mixin._edge_overlay_mesh is None
+
+    mixin._draw_edges_modern()
+    assert len(mixin.plotter.add_calls) == 2
@@ -0,0 +1,149 @@
+"""
+Tests für gui.viewport.face_picker (BVH Face-Picking in NumPy).
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pv = pytest.importorskip("pyvista")
+
+from gui.viewport.face_picker import AabbTree, FacePickingService, TriangleBVH
+
+
+def _box(center, size=1.0, face_id_offset=0) -> "pv.PolyData":
+    mesh = pv.Cube(center=center, x_length=size, y_length=size, z_length=size).triangulate()
+    mesh.cell_data["face_id"] = np.arange(mesh.n_cells) // 2 + face_id_offset
+    return mesh
+
+
+def _brute_force(points, triangles, origin, direction):
+    best = None
+    for idx, (a, b, c) in enumerate(points[triangles]):
+        e1, e2 = b - a, c - a
+        p = np.cross(direction, e2)
+        det = np.dot(e1, p)
+        if abs(det) < 1e-12:
+            continue
+        tv = origin - a
+        u = np.dot(tv, p) / det
+        q = np.cross(tv, e1)
+        v = np.dot(direction, q) / det
+        t = np.dot(e2, q) / det
+        if u >= 0 and v >= 0 and u + v <= 1 and t > 0 and (best is None or t < best[1]):
+            best = (idx, t)
+    return best
+
+
+class TestTriangleBVH:
+    def test_matches_brute_force_on_random_rays(self):
+        sphere = pv.Sphere(radius=2.0, theta_resolution=24, phi_resolution=24)
+        points = np.asarray(sphere.points)
+        triangles = np.asarray(sphere.faces).reshape(-1, 4)[:, 1:]
+        bvh = TriangleBVH(points, triangles)
+        rng = np.random.default_rng(3)
+
+        for _ in range(50):
+            origin = rng.normal(size=3) * 6.0
+            direction = rng.normal(size=3) * 0.3 - origin
+            direction /= np.linalg.norm(direction)
+
+            expected = _brute_force(points, triangles, origin, direction)
+            result = bvh.intersect(origin, direction)
+
+            if expected is None:
+                assert result is None
+            else:
+                assert result is not None
+                assert result[1] == pytest.approx(expected[1])
+
+    def test_aabb_tree_returns_only_boxes_on_ray(self):
+        lo = np.array([[i * 2.0, 0.0, 0.0] for i in range(10)])
+        tree = AabbTree(lo, lo + 1.0, leaf_size=1)
+
+        hits, t_enter = tree.query_ray(np.array([-5.0, 0.5, 0.5]), np.array([1.0, 0.0, 0.0]))
+
+        assert sorted(hits.tolist()) == list(range(10))
+        # Lücke zwischen Box 2 (x 4..5) und Box 3 (x 6..7)
+        hits, _ = tree.query_ray(np.array([5.5, 0.5, -5.0]), np.array([0.0, 0.0, 1.0]))
+        assert hits.tolist() == []
+        hits, _ = tree.query_ray(np.array([5.5, 0.5, -5.0]), np.array([-0.1, 0.0, 1.0]))
+        assert hits.tolist() == [2]
+
+
+class TestFacePickingService:
+    def test_nearest_body_and_face_id(self):
+        service = FacePickingService()
+        meshes = {"near": _box((0, 0, 0)), "far": _box((0, 0, -5), face_id_offset=100)}
+
+        hit = service.pick_ray((0.1, 0.2, 10.0), (0, 0, -1), meshes)
+
+        assert hit.body_id == "near"
+        assert hit.position == pytest.approx((0.1, 0.2, 0.5))
+        assert hit.normal == pytest.approx((0.0, 0.0, 1.0))
+        expected_face = int(meshes["near"].cell_data["face_id"][hit.cell_id])
+        assert hit.face_id == expected_face
+
+        hidden_near = service.pick_ray((0.1, 0.2, 10.0), (0, 0, -1), meshes, visible_ids={"far"})
+        assert hidden_near.body_id == "far"
+        assert hidden_near.face_id >= 100
+
+        assert service.pick_ray((5.0, 5.0, 10.0), (0, 0, -1), meshes) is None
+
+    def test_bvh_is_rebuilt_only_when_mesh_changes(self):
+        service = FacePickingService()
+        meshes = {"a": _box((0, 0, 0)), "b": _box((3, 0, 0))}
+        service.pick_ray((0, 0, 10), (0, 0, -1), meshes)
+        bvh_a, bvh_b = service._entries["a"].bvh, service._entries["b"].bvh
+
+        meshes["b"] = _box((3, 0, 2))
+        service.pick_ray((0, 0, 10), (0, 0, -1), meshes)
+
+        assert service._entries["a"].bvh is bvh_a
+        assert service._entries["b"].bvh is not bvh_b
+        assert service.pick_ray((3, 0, 10), (0, 0, -1), meshes).position[2] == pytest.approx(2.5)
+
+        del meshes["b"]
+        service.pick_ray((0, 0, 10), (0, 0, -1), meshes)
+        assert "b" not in service._entries
+
+    def test_polygon_cells_map_back_to_cell_ids(self):
+        plane = pv.Plane(i_resolution=2, j_resolution=2)  # 4 Quads
+        plane.cell_data["face_id"] = np.array([10, 11, 12, 13])
+        service = FacePickingService()
+
+        hit = service.pick_ray((0.25, 0.25, 1.0), (0, 0, -1), {"p": plane})
+
+        centers = np.asarray(plane.cell_centers().points)
+        assert hit.cell_id == int(np.argmin(np.linalg.norm(centers[:, :2] - (0.25, 0.25), axis=1)))
+        assert hit.face_id == 10 + hit.cell_id
+
+
+def test_hover_body_face_uses_bvh_hit(monkeypatch):
+    import gui.viewport.picking_mixin as picking_mod
+    from gui.viewport.picking_mixin import PickingMixin
+
+    monkeypatch.setattr(picking_mod, "HAS_VTK", True, raising=False)
+    highlights = []
+    host = SimpleNamespace(
+        bodies={"B1": {"mesh": _box((0, 0, 0))}},
+        _body_actors={"B1": ("body_B1_m",)},
+        plotter=SimpleNamespace(renderer=SimpleNamespace(
+            actors={"body_B1_m": SimpleNamespace(GetVisibility=lambda: True)},
+        )),
+        hovered_body_face=None,
+        get_ray_from_click=lambda _x, _y: ((0.0, 0.0, 10.0), (0.0, 0.0, -1.0)),
+        _draw_body_face_highlight=lambda pos, normal: highlights.append((pos, normal)),
+        _clear_body_face_highlight=lambda: None,
+    )
+    for name in ("_get_face_picking_service", "_visible_body_ids", "_pick_body_hit", "_hover_body_face"):
+        setattr(host, name, getattr(PickingMixin, name).__get__(host, object))
+
+    host._hover_body_face(100, 100)
+
+    body_id, cell_id, normal, pos = host.hovered_body_face
+    assert body_id == "B1"
+    assert normal == pytest.approx((0.0, 0.0, 1.0))
+    assert pos == pytest.approx((0.0, 0.0, 0.5))
+    assert len(highlights) == 1
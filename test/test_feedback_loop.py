@@ -0,0 +1,128 @@
+"""
+Tests für die append-only Persistenz und Aggregate des FeedbackLoop.
+"""
+
+import json
+
+import pytest
+
+from sketching.learning.feedback_loop import DurationSketch, FeedbackLoop
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "feedback_db.json")
+
+
+def _fill(loop: FeedbackLoop):
+    loop.record("extrude", {"distance": 10}, True, 50.0)
+    loop.record("extrude", {"distance": 90}, False, 250.0, error="Extrusion failed")
+    loop.record("fillet", {"radius": 2}, False, 120.0, error="Fillet failed")
+    loop.record("fillet", {"radius": 1}, True, 100.0)
+    loop.record("extrude", {"distance": 20}, False, 10.0, error="Extrusion failed")
+
+
+class TestFeedbackLoopStorage:
+    def test_record_appends_one_line_per_record(self, db_path):
+        loop = FeedbackLoop(storage_path=db_path)
+        _fill(loop)
+
+        with open(loop.log_path) as f:
+            lines = f.readlines()
+
+        assert loop.log_path.endswith("feedback_db.jsonl")
+        assert len(lines) == 5
+        assert json.loads(lines[1])["error"] == "Extrusion failed"
+
+    def test_reload_rebuilds_aggregates(self, db_path):
+        loop = FeedbackLoop(storage_path=db_path)
+        _fill(loop)
+        loop.close()
+
+        reloaded = FeedbackLoop(storage_path=db_path)
+
+        assert len(reloaded.records) == 5
+        assert reloaded.stats["extrude"]["total"] == 3
+        assert reloaded.get_success_rate("fillet") == pytest.approx(0.5)
+        assert reloaded.analyze_errors() == loop.analyze_errors()
+
+    def test_truncated_last_line_is_skipped(self, db_path):
+        loop = FeedbackLoop(storage_path=db_path)
+        _fill(loop)
+        loop.close()
+        with open(loop.log_path, "a") as f:
+            f.write('{"operation": "extr')
+
+        assert len(FeedbackLoop(storage_path=db_path).records) == 5
+
+    def test_legacy_json_db_is_migrated_once(self, db_path):
+        legacy = {
+            "records": [
+                {"operation": "shell", "parameters": {}, "success": True,
+                 "duration_ms": 5.0, "error": None, "timestamp": 1.0}
+            ],
+            "stats": {}
+        }
+        with open(db_path, "w") as f:
+            json.dump(legacy, f)
+
+        first = FeedbackLoop(storage_path=db_path)
+        first.record("shell", {}, False, 7.0, error="boom")
+        first.close()
+        second = FeedbackLoop(storage_path=db_path)
+
+        assert [r.duration_ms for r in second.records] == [5.0, 7.0]
+
+
+class TestFeedbackLoopQueries:
+    def test_errors_and_slow_operations(self, db_path):
+        loop = FeedbackLoop(storage_path=db_path)
+        _fill(loop)
+
+        assert loop.analyze_errors() == {"Extrusion failed": 2, "Fillet failed": 1}
+        slow = loop.get_slow_operations(threshold_ms=100)
+        assert [r.duration_ms for r in slow] == [250.0, 120.0]
+        assert loop.count_slow_operations(threshold_ms=50) == 3
+
+        # Neue Records nach einer Abfrage landen ebenfalls im Index
+        loop.record("revolve", {}, True, 500.0)
+        assert [r.operation for r in loop.get_slow_operations(100)] == ["extrude", "fillet", "revolve"]
+
+    def test_suggest_parameters_uses_aggregates(self, db_path):
+        loop = FeedbackLoop(storage_path=db_path)
+        _fill(loop)
+
+        # extrude: 1/3 Erfolg -> konservativ
+        assert loop.suggest_parameters("extrude")["distance"] == pytest.approx(10)
+
+    def test_summary_contains_percentiles(self, db_path):
+        loop = FeedbackLoop(storage_path=db_path)
+        _fill(loop)
+
+        summary = loop.get_summary()
+
+        assert summary["total_records"] == 5
+        assert summary["slow_operations"] == 2
+        assert summary["duration_percentiles"]["fillet"]["p50"] == pytest.approx(100.0, rel=0.02)
+
+
+class TestDurationSketch:
+    def test_quantiles_within_relative_accuracy(self):
+        sketch = DurationSketch(relative_accuracy=0.01)
+        values = [float(v) for v in range(1, 1001)]
+        for v in values:
+            sketch.add(v)
+
+        for q in (0.5, 0.9, 0.99):
+            expected = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+
+    def test_zero_and_empty(self):
+        sketch = DurationSketch()
+        assert sketch.quantile(0.5) == 0.0
+
+        sketch.add(0.0)
+        sketch.add(0.0)
+        sketch.add(10.0)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(10.0, rel=0.011)
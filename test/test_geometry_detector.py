@@ -0,0 +1,153 @@
+"""
+Tests für GeometryDetector: exakte Body-Faces über face_id (CSR-Gruppierung,
+lazy Sub-Meshes, Picking per einzelnem Ray-Cast auf das Body-Mesh).
+"""
+
+import numpy as np
+import pytest
+from build123d import Box, Cylinder
+
+from gui.geometry_detector import GeometryDetector
+from modeling.cad_tessellator import CADTessellator
+
+
+@pytest.fixture(scope="module")
+def tessellated():
+    part = Box(40, 30, 10) - Cylinder(4, 20)
+    mesh, _, face_info = CADTessellator.tessellate_with_face_ids(part, quality=0.2)
+    return mesh, face_info
+
+
+def _detector(mesh, face_info=None):
+    detector = GeometryDetector()
+    detector.process_body_mesh("body", mesh.copy(), face_info=face_info)
+    return detector
+
+
+def test_one_selection_face_per_brep_face_with_masked_centers(tessellated):
+    mesh, face_info = tessellated
+    detector = _detector(mesh, face_info)
+
+    face_ids = np.asarray(mesh.cell_data["face_id"])
+    centers = mesh.cell_centers().points
+    assert sorted(f.ocp_face_id for f in detector.selection_faces) == sorted(face_info)
+    for face in detector.selection_faces:
+        mask = face_ids == face.ocp_face_id
+        assert face.plane_origin == pytest.approx(centers[mask].mean(axis=0))
+        assert face.sample_point == pytest.approx(centers[np.flatnonzero(mask)[0]])
+        assert face.plane_normal == pytest.approx(face_info[face.ocp_face_id]["normal"])
+
+
+def test_sub_meshes_are_built_lazily_once(tessellated):
+    mesh, face_info = tessellated
+    detector = _detector(mesh, face_info)
+    face = detector.selection_faces[0]
+
+    assert face._display_mesh is None
+    sub_mesh = face.display_mesh
+    assert sub_mesh.n_cells == int(np.sum(mesh.cell_data["face_id"] == face.ocp_face_id))
+    assert face.display_mesh is sub_mesh
+    assert all(f._display_mesh is None for f in detector.selection_faces[1:])
+
+
+def test_mesh_normal_fallback_without_face_info(tessellated):
+    mesh, _ = tessellated
+    detector = _detector(mesh)
+
+    top = max(detector.selection_faces, key=lambda f: f.plane_origin[2])
+    assert top.plane_normal == pytest.approx((0.0, 0.0, 1.0), abs=1e-6)
+    assert np.linalg.norm(top.plane_normal) == pytest.approx(1.0)
+
+
+def test_pick_hits_nearest_face_with_one_ray_cast(tessellated, monkeypatch):
+    mesh, face_info = tessellated
+    detector = _detector(mesh, face_info)
+    monkeypatch.setattr(type(mesh), "ray_trace", lambda *a, **k: pytest.fail("kein Ray-Trace pro Face"))
+
+    hit = detector.pick((10.0, 10.0, 50.0), (0.0, 0.0, -1.0))
+    face = next(f for f in detector.selection_faces if f.id == hit)
+
+    assert face.plane_normal == pytest.approx((0.0, 0.0, 1.0), abs=1e-6)
+    assert face._display_mesh is None
+    assert detector.pick((0.0, 0.0, 50.0), (0.0, 0.0, -1.0)) != hit  # Bohrung → Zylinderwand oder Unterseite
+    assert detector.pick((10.0, 10.0, 50.0), (0.0, 0.0, -1.0), GeometryDetector.SelectionFilter.SKETCH) == -1
+
+
+def _perforated_plate(holes=16, pitch=10.0):
+    from sketcher import Sketch
+
+    side = int(np.ceil(np.sqrt(holes)))
+    sketch = Sketch("plate")
+    sketch.add_rectangle(0.0, 0.0, side * pitch, side * pitch)
+    for k in range(holes):
+        sketch.add_circle(pitch * (k % side + 0.5), pitch * (k // side + 0.5), 3.0)
+    return sketch
+
+
+def _process(detector, sketch):
+    detector.process_sketch(sketch, (0.0, 0.0, 0.0), (0.0, 0.0, 1.0), (1.0, 0.0, 0.0))
+    return detector._sketch_regions[sketch.id].last_stats
+
+
+def test_sketch_nested_regions_ring_and_core():
+    from sketcher import Sketch
+
+    sketch = Sketch("nested")
+    sketch.add_rectangle(-50.0, -50.0, 100.0, 100.0)
+    sketch.add_circle(0.0, 0.0, 30.0)
+    sketch.add_circle(0.0, 0.0, 10.0)
+    detector = GeometryDetector()
+    _process(detector, sketch)
+
+    areas = sorted(f.shapely_poly.area for f in detector.selection_faces)
+    core, ring = np.pi * 10.0 ** 2, np.pi * (30.0 ** 2 - 10.0 ** 2)
+    assert areas == pytest.approx(sorted([core, ring, 100.0 ** 2 - np.pi * 30.0 ** 2]), rel=1e-3)
+
+
+def test_sketch_overlapping_circles_split_into_lens():
+    from sketcher import Sketch
+
+    sketch = Sketch("overlap")
+    sketch.add_circle(0.0, 0.0, 10.0)
+    sketch.add_circle(12.0, 0.0, 10.0)
+    detector = GeometryDetector()
+    _process(detector, sketch)
+
+    lens, lune_a, lune_b = sorted(f.shapely_poly.area for f in detector.selection_faces)
+    assert lune_a == pytest.approx(lune_b, rel=1e-3)
+    assert lens + lune_a == pytest.approx(np.pi * 100.0, rel=1e-2)
+
+
+def test_sketch_edit_rebuilds_only_touched_regions():
+    sketch = _perforated_plate()
+    detector = GeometryDetector()
+    first = _process(detector, sketch)
+    before = {id(f.shapely_poly) for f in detector.selection_faces}
+
+    assert first["regions"] == 17
+    assert _process(detector, sketch)["regions_rebuilt"] == 0
+
+    sketch.circles[5].radius = 2.0
+    stats = _process(detector, sketch)
+    after = {id(f.shapely_poly) for f in detector.selection_faces}
+
+    assert (stats["dirty"], stats["clusters_rebuilt"], stats["regions_rebuilt"]) == (1, 1, 2)
+    assert len(before & after) == 15  # Platte und geänderte Bohrung sind neu
+    plate = max(detector.selection_faces, key=lambda f: f.shapely_poly.area)
+    assert plate.shapely_poly.area == pytest.approx(1600.0 - 15 * np.pi * 9.0 - np.pi * 4.0, rel=1e-3)
+
+
+def test_sketch_meshes_are_lazy_and_survive_refresh():
+    sketch = _perforated_plate(holes=4)
+    detector = GeometryDetector()
+    _process(detector, sketch)
+    face = next(f for f in detector.selection_faces if f.pick_priority == 10)
+
+    assert face._display_mesh is None
+    mesh = face.display_mesh
+    assert mesh.area == pytest.approx(face.shapely_poly.area, rel=1e-3)
+
+    detector.clear()
+    _process(detector, sketch)
+    again = next(f for f in detector.selection_faces if f.shapely_poly is face.shapely_poly)
+    assert again.display_mesh is mesh
@@ -0,0 +1,85 @@
+"""
+Tests für gui.viewport.lod_pyramid (vorberechnete LOD-Stufen).
+"""
+
+import numpy as np
+import pytest
+
+pv = pytest.importorskip("pyvista")
+
+from gui.viewport.lod_pyramid import LodPyramid, LodPyramidCache, build_lod_pyramid
+
+
+def _box_mesh_with_face_ids() -> "pv.PolyData":
+    """Feingeteilter Würfel mit face_id pro Seite und Split-Vertices an den Kanten."""
+    sides = []
+    for face_id, (center, normal) in enumerate([
+        ((0.5, 0, 0), (1, 0, 0)), ((-0.5, 0, 0), (-1, 0, 0)),
+        ((0, 0.5, 0), (0, 1, 0)), ((0, -0.5, 0), (0, -1, 0)),
+        ((0, 0, 0.5), (0, 0, 1)), ((0, 0, -0.5), (0, 0, -1)),
+    ]):
+        side = pv.Plane(center=center, direction=normal, i_resolution=30, j_resolution=30).triangulate()
+        side.cell_data["face_id"] = np.full(side.n_cells, face_id, dtype=np.int32)
+        sides.append(side)
+    return pv.merge(sides, merge_points=False)
+
+
+class TestBuildLodPyramid:
+    def test_levels_are_coarser_and_keep_face_ids(self):
+        mesh = _box_mesh_with_face_ids()
+
+        pyramid = build_lod_pyramid(mesh)
+
+        assert pyramid.levels[0] is mesh
+        assert len(pyramid) > 1
+        assert pyramid.cell_counts == sorted(pyramid.cell_counts, reverse=True)
+        for level in pyramid.levels[1:]:
+            assert set(np.unique(level.cell_data["face_id"])) == set(range(6))
+            assert "Normals" in level.point_data
+
+    def test_face_ids_follow_geometry(self):
+        mesh = _box_mesh_with_face_ids()
+
+        coarse = build_lod_pyramid(mesh).levels[-1]
+
+        # +X Seite hat face_id 0
+        centers = np.asarray(coarse.cell_centers().points)
+        on_plus_x = centers[:, 0] > 0.49
+        assert np.all(coarse.cell_data["face_id"][on_plus_x] == 0)
+
+    def test_small_mesh_has_only_full_level(self):
+        mesh = pv.Sphere(theta_resolution=8, phi_resolution=8)
+
+        assert len(build_lod_pyramid(mesh)) == 1
+
+
+class TestSelectLevel:
+    def test_picks_coarsest_level_within_budget(self):
+        pyramid = LodPyramid([pv.PolyData()] * 3)
+        pyramid.cell_counts = [10000, 5000, 1000]
+
+        assert pyramid.select_level(10.0, 0.5) == 2
+        assert pyramid.select_level(50.0, 0.5) == 1
+        assert pyramid.select_level(500.0, 0.5) == 0
+        assert pyramid.select_level(float("inf"), 0.5) == 0
+
+
+class TestLodPyramidCache:
+    def test_get_builds_in_background_and_follows_mesh(self):
+        cache = LodPyramidCache()
+        mesh = _box_mesh_with_face_ids()
+
+        cache.request("b1", mesh).result(timeout=30)
+        pyramid = cache.get("b1", mesh)
+
+        assert pyramid is not None
+        assert cache.get("b1", mesh) is pyramid
+
+        # Neues Mesh-Objekt -> alter Eintrag ungültig, Neuaufbau eingeplant
+        rebuilt = mesh.copy()
+        future = cache.request("b1", rebuilt)
+        future.result(timeout=30)
+        assert cache.get("b1", rebuilt).levels[0] is rebuilt
+
+        cache.discard("b1")
+        cache.clear()
@@ -0,0 +1,102 @@
+"""
+Tests für gui.log_panel (Ring-Buffer-Model, gebündelter Flush, Proxy-Filter).
+"""
+
+import os
+import sys
+import threading
+
+os.environ["QT_OPENGL"] = "software"
+
+from PySide6.QtWidgets import QApplication
+
+from gui.log_panel import MAX_LOG_ENTRIES, LogPanel
+
+
+def _panel():
+    if QApplication.instance() is None:
+        QApplication(sys.argv)
+    return LogPanel()
+
+
+def test_messages_are_batched_until_flush():
+    panel = _panel()
+    inserts = []
+    panel.model.rowsInserted.connect(lambda *args: inserts.append(args))
+
+    for i in range(50):
+        panel.add_message("info", f"step {i}")
+    panel.add_message("debug", "spam")
+    panel.add_message("info", "Cache hit")
+
+    assert panel.model.rowCount() == 0
+    assert panel.model.flush() == 50
+    assert len(inserts) == 1
+    assert panel._counter.text() == "50/50"
+
+
+def test_ring_buffer_evicts_oldest_and_keeps_counters():
+    panel = _panel()
+    for i in range(MAX_LOG_ENTRIES):
+        panel.add_message("error" if i < 10 else "info", f"m{i}")
+    panel.flush()
+    for i in range(25):
+        panel.add_message("warning", f"w{i}")
+    panel.flush()
+
+    model = panel.model
+    assert model.rowCount() == MAX_LOG_ENTRIES
+    assert model.entry(0).message == "m25"
+    assert model.level_count("error") == 0
+    assert model.level_count("warning") == 25
+    assert model.level_count("info") == MAX_LOG_ENTRIES - 25
+
+
+def test_level_filter_and_search_use_proxy():
+    panel = _panel()
+    panel.add_message("info", "Extrude ok")
+    panel.add_message("error", "Fillet failed")
+    panel.add_message("critical", "Boolean failed")
+    panel.flush()
+
+    panel._toggle_filter("error")
+    assert panel.proxy.rowCount() == 1
+    assert panel._counter.text() == "1/3"
+
+    panel._toggle_filter("error")
+    panel._search.setText("FAILED")
+    assert panel.proxy.rowCount() == 2
+    assert panel._counter.text() == "2/3"
+
+
+def test_add_message_from_worker_thread_flushes_on_gui_thread():
+    panel = _panel()
+    workers = [
+        threading.Thread(target=lambda n=n: [panel.add_message("info", f"{n}-{i}") for i in range(20)])
+        for n in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    app = QApplication.instance()
+    for _ in range(50):
+        app.processEvents()
+        if panel.model.rowCount() == 80:
+            break
+        threading.Event().wait(0.01)
+
+    assert panel.model.rowCount() == 80
+
+
+def test_clear_log_resets_model_and_counter():
+    panel = _panel()
+    panel.add_message("success", "done")
+    panel.flush()
+
+    panel.clear_log()
+
+    assert panel.model.rowCount() == 0
+    assert panel.model.level_count("success") == 0
+    assert panel._counter.text() == "0/0"
@@ -11,6 +11,7 @@ Tests cover:
 
 import pytest
 import math
+import numpy as np
 from typing import Dict, List, Set
 
 from modeling.mate_solver import (
@@ -20,12 +21,14 @@ from modeling.mate_solver import (
     SolveStatus,
     GeometricEntity,
     solve_assembly,
+    _MateCluster,
 )
 from modeling.mate_system import (
     MateType,
     MateStatus,
     MateReference,
     Mate,
+    MateManager,
 )
 from modeling.component_core import Component, ComponentTransform
 
@@ -570,6 +573,131 @@ class TestSolverConfig:
         assert config.learning_rate == 0.5
 
 
+def _rotated_components(count: int, seed: int = 1) -> Dict[str, Component]:
+    rng = np.random.default_rng(seed)
+    return {
+        f"c{k}": Component(
+            component_id=f"c{k}",
+            name=f"c{k}",
+            transform=ComponentTransform(
+                position=tuple(float(v) for v in rng.normal(0.0, 5.0, 3)),
+                rotation=tuple(float(v) for v in rng.uniform(-60.0, 60.0, 3)),
+            ),
+        )
+        for k in range(count)
+    }
+
+
+def _mate(mate_type: MateType, c1: str, t1: str, c2: str, t2: str, **params) -> Mate:
+    return Mate(
+        mate_type=mate_type,
+        reference1=MateReference(c1, t1, "r1"),
+        reference2=MateReference(c2, t2, "r2"),
+        parameters=params,
+    )
+
+
+MATE_CASES = [
+    (MateType.COINCIDENT, {}),
+    (MateType.PARALLEL, {}),
+    (MateType.PERPENDICULAR, {}),
+    (MateType.DISTANCE, {"distance": 3.0}),
+    (MateType.ANGLE, {"angle": 30.0}),
+    (MateType.ALIGN, {}),
+]
+
+
+class TestLevenbergMarquardt:
+    """Tests for the LM solver with analytic Jacobians and cluster split."""
+    
+    @pytest.mark.parametrize("mate_type,params", MATE_CASES)
+    def test_analytic_jacobian_matches_finite_differences(self, mate_type, params):
+        """Analytic Jacobian equals central differences for every mate type."""
+        components = _rotated_components(3)
+        mates = [
+            _mate(mate_type, "c1", "edge", "c2", "face", **params),
+            _mate(mate_type, "c0", "face", "c1", "vertex", **params),
+        ]
+        solver = MateSolver()
+        cluster = _MateCluster(
+            ["c1", "c2"], mates,
+            {cid: comp.transform for cid, comp in components.items()},
+            lambda ref: solver._get_reference_entity(ref, components),
+        )
+        x = cluster.x0
+        _, jac = cluster.evaluate(x)
+        jac = jac.toarray() if hasattr(jac, "toarray") else jac
+        
+        h = 1e-6
+        numeric = np.zeros_like(jac)
+        for k in range(len(x)):
+            step = np.zeros_like(x)
+            step[k] = h
+            numeric[:, k] = (cluster.evaluate(x + step, False)[0] - cluster.evaluate(x - step, False)[0]) / (2 * h)
+        
+        assert jac.shape == (cluster.n_rows, 12)
+        assert np.allclose(jac, numeric, atol=1e-6)
+    
+    @pytest.mark.parametrize("mate_type,params", MATE_CASES)
+    def test_rotated_components_converge(self, mate_type, params):
+        """LM drives the mate error of rotated components to the tolerance."""
+        components = _rotated_components(3)
+        mates = [
+            _mate(mate_type, "c1", "edge", "c2", "face", **params),
+            _mate(mate_type, "c0", "face", "c1", "vertex", **params),
+        ]
+        
+        result = MateSolver().solve(components, mates, fixed_components={"c0"})
+        
+        assert result.success
+        assert result.final_error < 1e-6
+        assert result.iterations <= 20
+        assert result.component_transforms["c0"] == components["c0"].transform
+    
+    def test_coincident_solve_reaches_fixed_point(self, solver: MateSolver, basic_components: Dict[str, Component]):
+        """A single coincident mate is solved exactly, not just approached."""
+        mate = _mate(MateType.COINCIDENT, "comp-1", "face", "comp-2", "face")
+        
+        result = solver.solve(basic_components, [mate], fixed_components={"comp-1"})
+        
+        assert result.status == SolveStatus.SUCCESS
+        assert result.component_transforms["comp-2"].position == pytest.approx((0.0, 0.0, 0.0), abs=1e-6)
+    
+    def test_fixed_components_split_clusters(self):
+        """Fixed components ground the mate graph into independent clusters."""
+        mates = [
+            _mate(MateType.COINCIDENT, "a", "vertex", "ground", "vertex"),
+            _mate(MateType.COINCIDENT, "a", "vertex", "b", "vertex"),
+            _mate(MateType.COINCIDENT, "ground", "vertex", "c", "vertex"),
+            _mate(MateType.PARALLEL, "d", "face", "e", "face"),
+        ]
+        manager = MateManager.from_mates(mates)
+        
+        clusters = manager.get_component_clusters({"ground"})
+        
+        assert sorted(sorted(ids) for ids, _ in clusters) == [["a", "b"], ["c"], ["d", "e"]]
+        by_member = {ids[0]: cluster_mates for ids, cluster_mates in clusters}
+        assert [m.mate_id for m in by_member["a"]] == [mates[0].mate_id, mates[1].mate_id]
+        assert len(manager.get_component_clusters()) == 2
+    
+    def test_solve_reports_clusters(self):
+        """Each cluster is solved separately; iterations is the cluster maximum."""
+        components = _rotated_components(5)
+        mates = [
+            _mate(MateType.DISTANCE, "c0", "vertex", "c1", "vertex", distance=4.0),
+            _mate(MateType.COINCIDENT, "c0", "vertex", "c2", "vertex"),
+            _mate(MateType.PARALLEL, "c3", "face", "c4", "face"),
+        ]
+        solver = MateSolver()
+        
+        result = solver.solve(components, mates, fixed_components={"c0", "c3"})
+        
+        assert result.success
+        assert solver.last_stats["clusters"] == 3
+        assert solver.last_stats["unknowns"] == 18
+        assert result.iterations == solver.last_stats["iterations"]
+
+
 # Run tests
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,173 @@
+"""
+Tests für meshconverter.mesh_topology (CSR/Half-Edge Mesh-Topologie).
+"""
+
+import numpy as np
+import pytest
+
+from meshconverter.mesh_topology import (
+    MeshTopology,
+    component_labels,
+    csr_from_pairs,
+    order_edge_loops,
+)
+
+
+def _grid_triangles(nx: int, ny: int) -> np.ndarray:
+    """Dreiecksgitter mit nx*ny Quads (2 Dreiecke pro Quad)."""
+    tris = []
+    for j in range(ny):
+        for i in range(nx):
+            v0 = j * (nx + 1) + i
+            v1 = v0 + 1
+            v2 = v0 + nx + 1
+            v3 = v2 + 1
+            tris.append((v0, v1, v3))
+            tris.append((v0, v3, v2))
+    return np.array(tris)
+
+
+def _grid_points(nx: int, ny: int) -> np.ndarray:
+    xs, ys = np.meshgrid(np.arange(nx + 1, dtype=float), np.arange(ny + 1, dtype=float))
+    return np.column_stack((xs.ravel(), ys.ravel(), np.zeros(xs.size)))
+
+
+class TestMeshTopology:
+    def test_edges_and_valence(self):
+        topo = MeshTopology(_grid_triangles(2, 1))
+
+        # 2 Quads -> 4 Dreiecke, 6 Vertices, 9 Kanten
+        assert topo.n_faces == 4
+        assert topo.n_edges == 9
+        assert sorted(np.bincount(topo.edge_valence).tolist()) == [0, 3, 6]
+        assert np.all(topo.edges[:, 0] < topo.edges[:, 1])
+
+    def test_face_neighbors_csr(self):
+        topo = MeshTopology(_grid_triangles(2, 1))
+
+        # Quad-Diagonale v0-v3: Dreieck 0 grenzt an 1 und an Dreieck 3 des Nachbar-Quads
+        assert topo.neighbors(0).tolist() == [1, 3]
+        assert topo.neighbors(1).tolist() == [0]
+        assert topo.neighbors(3).tolist() == [0, 2]
+        assert len(topo.face_pairs) == 3
+
+    def test_connected_components_of_subset(self):
+        topo = MeshTopology(_grid_triangles(4, 1))
+
+        components = topo.connected_components([7, 0, 1, 4, 5])
+
+        assert [c.tolist() for c in components] == [[0, 1], [4, 5, 7]]
+
+    def test_connected_components_with_pair_mask(self):
+        topo = MeshTopology(_grid_triangles(2, 1))
+        mask = np.ones(len(topo.face_pairs), dtype=bool)
+        mask[(np.sort(topo.face_pairs, axis=1) == [0, 3]).all(axis=1)] = False
+
+        components = topo.connected_components(pair_mask=mask)
+
+        assert [c.tolist() for c in components] == [[0, 1], [2, 3]]
+
+    def test_boundary_loop_of_grid(self):
+        topo = MeshTopology(_grid_triangles(3, 3))
+
+        loops = topo.boundary_loops()
+
+        assert len(loops) == 1
+        assert len(loops[0]) == 12
+        assert set(loops[0].tolist()) == {0, 1, 2, 3, 4, 7, 8, 11, 12, 13, 14, 15}
+
+    def test_boundary_loops_with_hole(self):
+        tris = _grid_triangles(3, 3)
+        # Mittleres Quad entfernen -> Loch
+        keep = np.ones(len(tris), dtype=bool)
+        keep[[8, 9]] = False
+        topo = MeshTopology(tris)
+
+        loops = topo.boundary_loops(np.flatnonzero(keep))
+
+        assert sorted(len(loop) for loop in loops) == [4, 12]
+
+    def test_closed_mesh_has_no_boundary(self):
+        tetra = np.array([(0, 2, 1), (0, 1, 3), (1, 2, 3), (0, 3, 2)])
+        topo = MeshTopology(tetra)
+
+        assert len(topo.boundary_edges()) == 0
+        assert len(topo.connected_components()) == 1
+
+    def test_dihedral_angles_and_areas(self):
+        topo = MeshTopology(_grid_triangles(1, 1))
+        normals = np.array([[0.0, 0.0, 1.0], [0.0, 1.0, 0.0]])
+
+        assert topo.dihedral_angles(normals) == pytest.approx([np.pi / 2])
+        assert topo.face_areas(_grid_points(1, 1)) == pytest.approx([0.5, 0.5])
+
+    def test_vertex_adjacency_includes_corner_neighbors(self):
+        topo = MeshTopology(_grid_triangles(2, 2))
+        offsets, indices = topo.vertex_adjacency()
+
+        # Face 0 teilt Vertices mit mehr Faces als nur über Kanten
+        assert len(indices[offsets[0]:offsets[1]]) > len(topo.neighbors(0))
+
+    def test_from_polydata_requires_triangles(self):
+        pv = pytest.importorskip("pyvista")
+
+        with pytest.raises(ValueError):
+            MeshTopology.from_polydata(pv.Plane(i_resolution=2, j_resolution=2))
+
+        topo = MeshTopology.from_polydata(pv.Plane(i_resolution=2, j_resolution=2).triangulate())
+        assert topo.n_faces == 8
+
+    def test_label_components_splits_disconnected_labels(self):
+        topo = MeshTopology(_grid_triangles(4, 1))
+        labels = np.array([1, 1, 2, 2, 1, 1, 0, 0])
+
+        components = topo.label_components(labels)
+
+        assert [c.tolist() for c in components] == [[0, 1], [4, 5], [2, 3]]
+
+
+class TestHelpers:
+    def test_csr_from_pairs_deduplicates(self):
+        offsets, indices = csr_from_pairs([0, 0, 2, 0], [1, 1, 0, 2], 3)
+
+        assert offsets.tolist() == [0, 2, 2, 3]
+        assert indices.tolist() == [1, 2, 0]
+
+    def test_component_labels(self):
+        labels = component_labels(5, [0, 3], [1, 4])
+
+        assert labels[0] == labels[1]
+        assert labels[3] == labels[4]
+        assert len(set(labels.tolist())) == 3
+
+    def test_order_edge_loops_open_chain_and_loop(self):
+        edges = [(10, 11), (11, 12), (9, 10), (20, 21), (21, 22), (22, 20)]
+
+        loops = order_edge_loops(edges)
+
+        assert [loop.tolist() for loop in loops] == [[9, 10, 11, 12], [20, 21, 22]]
+        assert [loop.tolist() for loop in order_edge_loops(edges, closed_only=True)] == [[20, 21, 22]]
+
+
+
+class TestPerfectDetectors:
+    def test_primitive_detector_segments_box_into_faces(self):
+        pv = pytest.importorskip("pyvista")
+        from meshconverter.perfect.primitive_detector import PrimitiveDetector
+
+        box = pv.Box().triangulate().subdivide(2)
+        regions = PrimitiveDetector()._segment_by_normals(box)
+
+        assert len(regions) == 6
+        assert sum(len(faces) for faces, _normal in regions) == box.n_cells
+
+    def test_feature_detector_region_growing_uses_vertex_adjacency(self):
+        from meshconverter.perfect.feature_detector import FeatureDetector
+
+        # Dreiecke 0 und 2 teilen nur einen Vertex → trotzdem verbunden
+        tris = np.array([(0, 1, 2), (1, 3, 2), (2, 3, 4), (5, 6, 7)])
+        adjacency = MeshTopology(tris, n_points=8).vertex_adjacency()
+
+        region = FeatureDetector()._get_connected_faces(None, 0, adjacency)
+
+        assert sorted(region) == [0, 1, 2]
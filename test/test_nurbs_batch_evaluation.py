@@ -0,0 +1,152 @@
+"""
+Tests für die vektorisierte NURBS-Auswertung (BSplineBasis).
+
+Referenz ist OCP (Geom_BSplineCurve / Geom_BSplineSurface D2), damit
+Punkte und analytische Ableitungen unabhängig geprüft werden.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from modeling.nurbs import BSplineBasis, NURBSCurve, NURBSSurface, create_circle_nurbs
+
+
+CURVE_POINTS = [(0, 0, 0), (10, 20, 0), (30, 20, 5), (40, 0, 0), (55, -10, 3), (60, 5, 1)]
+
+
+@pytest.fixture
+def rational_curve() -> NURBSCurve:
+    return NURBSCurve(
+        control_points=CURVE_POINTS,
+        weights=[1.0, 2.0, 0.5, 1.0, 3.0, 1.0],
+        knots=[0, 0, 0, 0, 0.3, 0.3, 1, 1, 1, 1],
+        degree=3,
+    )
+
+
+@pytest.fixture
+def rational_surface() -> NURBSSurface:
+    grid = [[(i, j, math.sin(i) * math.cos(j)) for j in range(5)] for i in range(4)]
+    weights = [[1.0 + 0.1 * i * j for j in range(5)] for i in range(4)]
+    return NURBSSurface(control_points=grid, weights=weights)
+
+
+class TestBSplineBasis:
+    def test_partition_of_unity(self):
+        basis = BSplineBasis([0, 0, 0, 0, 0.25, 0.5, 0.5, 1, 1, 1, 1], 3, 7)
+        u = np.linspace(0.0, 1.0, 101)
+        ders = basis.derivatives(u, basis.find_spans(u), 2)
+
+        assert np.allclose(ders[:, 0].sum(axis=1), 1.0)
+        assert np.allclose(ders[:, 1].sum(axis=1), 0.0, atol=1e-9)
+        assert np.allclose(ders[:, 2].sum(axis=1), 0.0, atol=1e-7)
+
+    def test_spans_at_domain_end_and_repeated_knots(self):
+        basis = BSplineBasis([0, 0, 0, 0.5, 0.5, 1, 1, 1], 2, 5)
+        spans = basis.find_spans(np.array([0.0, 0.5, 0.999, 1.0]))
+
+        assert spans.tolist() == [2, 4, 4, 4]
+
+    def test_span_lookup_is_cached(self):
+        basis = BSplineBasis([0, 0, 1, 1], 1, 2)
+        u = np.linspace(0.0, 1.0, 10)
+
+        assert basis.find_spans(u) is basis.find_spans(u.copy())
+
+
+class TestNURBSCurveBatch:
+    def test_matches_ocp_points_and_derivatives(self, rational_curve):
+        from OCP.gp import gp_Pnt, gp_Vec
+
+        ocp_curve = rational_curve.to_ocp()
+        params = np.array([0.0, 0.2, 0.3, 0.65, 1.0])
+        CK = rational_curve.derivatives_array(params, 2)
+
+        for idx, u in enumerate(params):
+            p, d1, d2 = gp_Pnt(), gp_Vec(), gp_Vec()
+            ocp_curve.D2(float(u), p, d1, d2)
+            assert np.allclose(CK[idx, 0], (p.X(), p.Y(), p.Z()))
+            assert np.allclose(CK[idx, 1], (d1.X(), d1.Y(), d1.Z()))
+            assert np.allclose(CK[idx, 2], (d2.X(), d2.Y(), d2.Z()))
+
+    def test_scalar_methods_agree_with_batch(self, rational_curve):
+        params = np.linspace(0.0, 1.0, 17)
+        points = rational_curve.evaluate_array(params)
+        curvature = rational_curve.curvature_array(params)
+
+        for idx, u in enumerate(params):
+            assert np.allclose(rational_curve.evaluate(u), points[idx])
+            assert rational_curve.curvature(u) == pytest.approx(curvature[idx])
+
+    def test_evaluate_points_uses_batch(self, rational_curve):
+        points = rational_curve.evaluate_points(25)
+
+        assert len(points) == 25
+        assert points[0] == pytest.approx(CURVE_POINTS[0])
+        assert points[-1] == pytest.approx(CURVE_POINTS[-1])
+
+    def test_line_derivatives_and_arc_length(self):
+        line = NURBSCurve(control_points=[(0, 0, 0), (3, 4, 0)], degree=1)
+
+        assert line.derivative(0.0) == pytest.approx((3.0, 4.0, 0.0))
+        assert line.derivative(0.5, 2) == pytest.approx((0.0, 0.0, 0.0))
+        assert line.curvature(0.5) == pytest.approx(0.0)
+        assert line.arc_length() == pytest.approx(5.0)
+
+    def test_parameters_are_clamped_to_domain(self, rational_curve):
+        assert rational_curve.evaluate(-1.0) == pytest.approx(rational_curve.evaluate(0.0))
+        assert rational_curve.evaluate(2.0) == pytest.approx(rational_curve.evaluate(1.0))
+
+    def test_basis_cache_follows_knot_changes(self):
+        curve = create_circle_nurbs(radius=2.0)
+        before = curve.evaluate(0.1)
+
+        curve.knots = [0, 0, 0, 0.2, 0.2, 0.5, 0.5, 0.8, 0.8, 1, 1, 1]
+
+        assert curve.evaluate(0.1) != pytest.approx(before)
+
+
+class TestNURBSSurfaceBatch:
+    def test_matches_ocp_partial_derivatives(self, rational_surface):
+        from OCP.gp import gp_Pnt, gp_Vec
+
+        ocp_surface = rational_surface.to_ocp()
+        params = [(0.0, 0.0), (0.2, 0.7), (0.5, 0.5), (0.9, 0.1), (1.0, 1.0)]
+        u = np.array([p[0] for p in params])
+        v = np.array([p[1] for p in params])
+        SKL = rational_surface.derivatives_array(u, v, 2)
+
+        for idx, (pu, pv) in enumerate(params):
+            p = gp_Pnt()
+            du, dv, duu, dvv, duv = gp_Vec(), gp_Vec(), gp_Vec(), gp_Vec(), gp_Vec()
+            ocp_surface.D2(pu, pv, p, du, dv, duu, dvv, duv)
+            expected = {
+                (0, 0): p, (1, 0): du, (0, 1): dv,
+                (2, 0): duu, (0, 2): dvv, (1, 1): duv,
+            }
+            for (k, l), value in expected.items():
+                assert np.allclose(SKL[idx, k, l], (value.X(), value.Y(), value.Z()))
+
+    def test_grid_broadcasting(self, rational_surface):
+        u = np.linspace(0.0, 1.0, 6)[:, None]
+        v = np.linspace(0.0, 1.0, 4)[None, :]
+
+        points = rational_surface.evaluate_array(u, v)
+        normals = rational_surface.normal_array(u, v)
+
+        assert points.shape == (6, 4, 3)
+        assert np.allclose(np.linalg.norm(normals, axis=-1), 1.0)
+        assert np.allclose(points[2, 3], rational_surface.evaluate(0.4, 1.0))
+
+    def test_plane_has_zero_curvature(self):
+        plane = NURBSSurface(
+            control_points=[[(0, 0, 0), (0, 1, 0)], [(1, 0, 0), (1, 1, 0)]],
+            degree_u=1,
+            degree_v=1,
+        )
+
+        assert plane.normal(0.3, 0.6) == pytest.approx((0.0, 0.0, 1.0))
+        assert plane.gaussian_curvature(0.3, 0.6) == pytest.approx(0.0)
+        assert plane.mean_curvature(0.3, 0.6) == pytest.approx(0.0)
@@ -0,0 +1,134 @@
+"""
+Tests für modeling.pattern_engine (instanziertes Pattern: ein Seed-Tool, ein Boolean).
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from modeling import Body, HoleFeature, PatternFeature, PrimitiveFeature
+from modeling.pattern_engine import instanced_compound, matrix_to_trsf, pattern_matrices
+
+
+def _box_with_hole(length=60.0):
+    body = Body("pattern_body")
+    body.add_feature(PrimitiveFeature(primitive_type="box", length=length, width=length, height=10.0))
+    hole = HoleFeature(hole_type="simple", diameter=4.0, depth=0.0,
+                       position=(10.0, 10.0, 10.0), direction=(0.0, 0.0, -1.0))
+    body.add_feature(hole)
+    return body, hole
+
+
+def test_linear_matrices_cover_grid_with_identity_first():
+    feature = PatternFeature(pattern_type="Linear", count=4, count_2=3, spacing=5.0,
+                             direction_1=(2, 0, 0), direction_2=(0, 1, 0))
+
+    matrices = pattern_matrices(feature)
+
+    assert len(matrices) == feature.get_total_instances() == 12
+    assert np.allclose(matrices[0], np.eye(4))
+    offsets = {tuple(np.round(m[:3, 3], 9)) for m in matrices}
+    assert offsets == {(5.0 * i, 5.0 * j, 0.0) for i in range(4) for j in range(3)}
+
+
+@pytest.mark.parametrize("angle, expected_step", [(360.0, 90.0), (90.0, 30.0)])
+def test_circular_matrices_rotate_about_axis_origin(angle, expected_step):
+    feature = PatternFeature(pattern_type="Circular", count=4, angle=angle,
+                             axis_origin=(10.0, 0.0, 0.0), axis_direction=(0, 0, 1))
+
+    matrices = pattern_matrices(feature)
+
+    point = np.array([20.0, 0.0, 0.0, 1.0])
+    placed = matrices[1] @ point
+    step = math.radians(expected_step)
+    assert np.allclose(placed[:3], (10.0 + 10.0 * math.cos(step), 10.0 * math.sin(step), 0.0))
+    assert np.allclose(matrices[:, :3, :3] @ np.array([0, 0, 1.0]), [0, 0, 1.0])
+
+
+def test_mirror_matrix_maps_to_occt_mirror():
+    feature = PatternFeature(pattern_type="Mirror", mirror_plane="YZ", mirror_origin=(5.0, 0.0, 0.0))
+
+    matrices = pattern_matrices(feature)
+    trsf = matrix_to_trsf(matrices[1])
+
+    assert np.allclose(matrices[1] @ np.array([8.0, 1.0, 2.0, 1.0]), (2.0, 1.0, 2.0, 1.0))
+    from OCP.gp import gp_Pnt
+    p = gp_Pnt(8.0, 1.0, 2.0).Transformed(trsf)
+    assert (round(p.X(), 9), round(p.Y(), 9), round(p.Z(), 9)) == (2.0, 1.0, 2.0)
+
+
+def test_compound_instances_share_one_tshape():
+    from build123d import Box
+    from OCP.TopoDS import TopoDS_Iterator
+
+    tool = Box(2, 2, 2)
+    feature = PatternFeature(pattern_type="Linear", count=5, spacing=10.0)
+    compound = instanced_compound(tool, pattern_matrices(feature)[1:])
+
+    it = TopoDS_Iterator(compound)
+    children = []
+    while it.More():
+        children.append(it.Value())
+        it.Next()
+    assert len(children) == 4
+    assert all(child.IsPartner(tool.wrapped) for child in children)
+
+
+def test_hole_pattern_rebuilds_with_single_boolean(monkeypatch):
+    from modeling.boolean_engine_v4 import BooleanEngineV4
+
+    body, hole = _box_with_hole()
+    calls = []
+    original = BooleanEngineV4.execute_boolean_multi
+    monkeypatch.setattr(BooleanEngineV4, "execute_boolean_multi",
+                        staticmethod(lambda *a, **k: calls.append(a[2]) or original(*a, **k)))
+
+    pattern = PatternFeature(pattern_type="Linear", feature_id=hole.id, count=4, count_2=3, spacing=12.0)
+    body.add_feature(pattern)
+
+    assert pattern.status == "SUCCESS", pattern.status_message
+    assert calls == ["Cut"]
+    expected = 60.0 * 60.0 * 10.0 - 12 * math.pi * 2.0 ** 2 * 10.0
+    assert body._build123d_solid.volume == pytest.approx(expected, rel=1e-6)
+
+
+def test_hole_seed_at_origin_keeps_its_axis(monkeypatch):
+    body = Body("pattern_origin")
+    body.add_feature(PrimitiveFeature(primitive_type="box", length=60.0, width=60.0, height=10.0))
+    hole = HoleFeature(hole_type="simple", diameter=4.0, depth=0.0,
+                       position=(0.0, 0.0, 0.0), direction=(0.0, 0.0, 1.0))
+    body.add_feature(hole)
+    hole.face_indices = [0]  # Ziel-Face des Seeds existiert nach dem Bohren nicht mehr
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("Seed mit Position darf keine Faces auflösen")
+    monkeypatch.setattr(type(body), "_resolve_feature_faces", _fail)
+
+    pattern = PatternFeature(pattern_type="Linear", feature_id=hole.id, count=2, spacing=20.0)
+    tool, operation = body._pattern_seed_tool(pattern, body._build123d_solid, len(body.features))
+
+    assert operation == "Cut"
+    center = tool.center()
+    assert (center.X, center.Y) == (pytest.approx(0.0, abs=1e-6), pytest.approx(0.0, abs=1e-6))
+
+
+def test_body_pattern_without_seed_joins_copies():
+    body = Body("pattern_join")
+    body.add_feature(PrimitiveFeature(primitive_type="box", length=10.0, width=10.0, height=10.0))
+
+    pattern = PatternFeature(pattern_type="Linear", count=3, spacing=20.0)
+    body.add_feature(pattern)
+
+    assert pattern.status == "SUCCESS", pattern.status_message
+    assert body._build123d_solid.volume == pytest.approx(3000.0, rel=1e-6)
+
+
+def test_missing_seed_feature_sets_error():
+    body, _hole = _box_with_hole()
+
+    pattern = PatternFeature(pattern_type="Linear", feature_id="does-not-exist", count=2, spacing=10.0)
+    body.add_feature(pattern)
+
+    assert pattern.status == "ERROR"
+    assert "Seed-Feature" in (pattern.status_message or "")
@@ -366,6 +366,66 @@ class TestPerformanceBenchmark:
         assert result.duration_ms > 0
         assert result.iterations == 1
     
+    def test_benchmark_boolean_multi(self):
+        """Multi-tool boolean benchmark should compare against the sequential loop."""
+        benchmark = PerformanceBenchmark()
+        results = benchmark.benchmark_boolean_multi(tool_counts=(10,))
+        
+        row = results[10]
+        assert row["multi_ms"] > 0
+        assert row["sequential_ms"] > 0
+        assert row["speedup"] == row["sequential_ms"] / row["multi_ms"]
+    
+    def test_benchmark_boolean_memo(self):
+        """Boolean memo benchmark should report cold/warm timings and cache stats."""
+        benchmark = PerformanceBenchmark()
+        row = benchmark.benchmark_boolean_memo(n_tools=4, cycles=2)
+        
+        assert row["stats"]["hits"] == 4
+        assert row["stats"]["saved_ms"] > 0
+        assert row["warm_ms"] < row["cold_ms"]
+    
+    def test_benchmark_transform_tessellation(self):
+        """Moving/rotating a body should place the cached mesh instead of re-tessellating."""
+        benchmark = PerformanceBenchmark()
+        row = benchmark.benchmark_transform_tessellation(quality=0.1, moves=2)
+        
+        assert row["triangles"] > 0
+        assert row["warm_ms"] < row["cold_ms"]
+    
+    def test_benchmark_sketch_regions(self):
+        """Editing one hole of a perforated plate should only rebuild the regions it touches."""
+        benchmark = PerformanceBenchmark()
+        row = benchmark.benchmark_sketch_regions(holes=1000)
+        
+        assert row["regions"] == 1001
+        assert row["regions_rebuilt"] == 2
+        assert row["edit_ms"] < row["cold_ms"]
+        assert row["unchanged_ms"] < row["cold_ms"]
+    
+    def test_benchmark_mate_solver(self):
+        """200-component chain and grid assemblies should converge with LM."""
+        benchmark = PerformanceBenchmark()
+        rows = benchmark.benchmark_mate_solver(components=200)
+        
+        assert rows["chain"]["clusters"] == 10
+        assert rows["grid"]["clusters"] == 1
+        for row in rows.values():
+            assert row["success"]
+            assert row["final_error"] < 1e-6
+            assert row["iterations"] < 50
+
+    def test_benchmark_threads(self):
+        """Identical threads should share one sweep; cosmetic rebuild skips the booleans."""
+        benchmark = PerformanceBenchmark()
+        row = benchmark.benchmark_threads(threads=2)
+
+        assert row["sweeps"] == 1
+        assert row["volume_removed"] > 0
+        assert row["cosmetic_rebuild_ms"] < row["export_ms"]
+        assert row["cosmetic_rebuild_ms"] < row["geometric_rebuild_ms"]
+        assert row["export_cached_ms"] < row["export_ms"]
+
     def test_run_all_benchmarks(self):
         """Benchmark should run all benchmarks and return report."""
         benchmark = PerformanceBenchmark()
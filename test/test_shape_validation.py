@@ -0,0 +1,200 @@
+"""
+Tests für modeling.shape_validation (gestufte, gecachte Shape-Validierung).
+"""
+
+import pytest
+from build123d import Align, Box
+
+from modeling import Body, HoleFeature, PatternFeature, PrimitiveFeature
+from modeling.shape_validation import (
+    ValidationTier, check_faces, check_shape, forget_shape, known_self_intersection_free,
+    mark_self_intersection_free, mark_valid, validation_stats, validation_stats_since,
+)
+
+
+def _box():
+    return Box(10, 10, 10, align=(Align.MIN, Align.MIN, Align.MIN))
+
+
+def _open_solid():
+    """Solid aus einer Shell, der eine Face fehlt."""
+    from OCP.BRep import BRep_Builder
+    from OCP.TopoDS import TopoDS_Shell, TopoDS_Solid
+
+    builder = BRep_Builder()
+    shell = TopoDS_Shell()
+    builder.MakeShell(shell)
+    for face in _box().faces()[:-1]:
+        builder.Add(shell, face.wrapped)
+    solid = TopoDS_Solid()
+    builder.MakeSolid(solid)
+    builder.Add(solid, shell)
+    return solid
+
+
+def _count_analyzer_runs(monkeypatch):
+    import modeling.shape_validation as sv
+
+    runs = []
+    original = sv._run
+    monkeypatch.setattr(sv, "_run", lambda shape, tier: runs.append(tier) or original(shape, tier))
+    return runs
+
+
+@pytest.mark.parametrize("tier", list(ValidationTier))
+def test_valid_box_passes_every_tier(tier):
+    assert check_shape(_box(), tier)
+
+
+def test_open_shell_fails_topology_tier():
+    assert not check_shape(_open_solid(), ValidationTier.TOPOLOGY)
+
+
+def test_null_and_foreign_objects_are_invalid():
+    from OCP.TopoDS import TopoDS_Shape
+
+    assert not check_shape(None)
+    assert not check_shape(TopoDS_Shape())
+    assert not check_shape("kein Shape")
+
+
+def _without_same_parameter(shape):
+    """Geometrisch identische Kopie, alle Edges mit SameParameter=False (ungültig)."""
+    from OCP.BRep import BRep_Builder
+    from OCP.BRepBuilderAPI import BRepBuilderAPI_Copy
+    from OCP.TopAbs import TopAbs_EDGE
+    from OCP.TopExp import TopExp_Explorer
+    from OCP.TopoDS import TopoDS
+
+    copy = BRepBuilderAPI_Copy(shape.wrapped).Shape()
+    builder = BRep_Builder()
+    explorer = TopExp_Explorer(copy, TopAbs_EDGE)
+    while explorer.More():
+        builder.SameParameter(TopoDS.Edge_s(explorer.Current()), False)
+        explorer.Next()
+    return copy
+
+
+def test_verdict_is_cached_per_shape(monkeypatch):
+    runs = _count_analyzer_runs(monkeypatch)
+    box = _box()
+
+    assert check_shape(box, ValidationTier.FULL)
+    assert check_shape(box, ValidationTier.FULL)
+    assert check_shape(box, ValidationTier.SUBSHAPES)  # FULL-Urteil deckt SUBSHAPES ab
+    assert check_shape(_box(), ValidationTier.FULL)    # neues Objekt → eigene Prüfung
+
+    assert runs == [ValidationTier.FULL, ValidationTier.FULL]
+
+
+def test_identical_copy_with_broken_flags_is_not_served_from_cache():
+    from OCP.BRepCheck import BRepCheck_Analyzer
+
+    box = _box()
+    bad = _without_same_parameter(box)
+
+    assert check_shape(box, ValidationTier.FULL)
+    assert not BRepCheck_Analyzer(bad).IsValid()
+    assert not check_shape(bad, ValidationTier.FULL)
+
+
+def test_in_place_healing_invalidates_verdict():
+    from OCP.ShapeFix import ShapeFix_Shape
+
+    bad = _without_same_parameter(_box())
+    assert not check_shape(bad, ValidationTier.FULL)
+
+    ShapeFix_Shape(bad).Perform()  # repariert die Edges in-place
+    assert check_shape(bad, ValidationTier.FULL)
+
+
+def test_forget_shape_drops_verdicts(monkeypatch):
+    runs = _count_analyzer_runs(monkeypatch)
+    box = _box()
+
+    check_shape(box, ValidationTier.FULL)
+    forget_shape(box)
+    check_shape(box, ValidationTier.FULL)
+
+    assert len(runs) == 2
+
+
+def test_self_intersection_free_is_per_shape_and_forgettable():
+    from build123d import Location
+
+    box = _box()
+    mark_self_intersection_free(box)
+
+    assert known_self_intersection_free(box)
+    assert not known_self_intersection_free(_box())
+    assert not known_self_intersection_free(box.moved(Location((5, 0, 0))))
+    assert not known_self_intersection_free(_without_same_parameter(box))
+
+    forget_shape(box)
+    assert not known_self_intersection_free(box)
+
+
+def test_lower_tier_does_not_satisfy_higher_tier(monkeypatch):
+    runs = _count_analyzer_runs(monkeypatch)
+    box = _box()
+
+    check_shape(box, ValidationTier.SUBSHAPES)
+    check_shape(box, ValidationTier.FULL)
+
+    assert runs == [ValidationTier.SUBSHAPES, ValidationTier.FULL]
+
+
+def test_uncached_checks_always_run(monkeypatch):
+    runs = _count_analyzer_runs(monkeypatch)
+    box = _box()
+
+    check_shape(box, ValidationTier.FULL, cache=False)
+    check_shape(box, ValidationTier.FULL, cache=False)
+
+    assert len(runs) == 2
+
+
+def test_mark_valid_skips_analyzer(monkeypatch):
+    runs = _count_analyzer_runs(monkeypatch)
+    box = _box()
+
+    mark_valid(box, ValidationTier.FULL)
+
+    assert check_shape(box, ValidationTier.FULL)
+    assert runs == []
+
+
+def test_check_faces_counts_subshape_tier():
+    before = validation_stats()
+
+    assert check_faces(face.wrapped for face in _box().faces())
+
+    delta = validation_stats_since(before)
+    assert delta["subshapes"]["calls"] == 1
+    assert delta["full"]["calls"] == 0
+
+
+def test_stats_delta_reports_calls_hits_and_time():
+    before = validation_stats()
+    box = _box()
+    check_shape(box)
+    check_shape(box)
+
+    delta = validation_stats_since(before)["full"]
+    assert (delta["calls"], delta["cached"], delta["invalid"]) == (2, 1, 0)
+    assert delta["ms"] > 0
+
+
+def test_body_rebuild_reports_validation_stats():
+    body = Body("validation_stats")
+    body.add_feature(PrimitiveFeature(primitive_type="box", length=40.0, width=40.0, height=10.0))
+    hole = HoleFeature(hole_type="simple", diameter=4.0, depth=0.0,
+                       position=(10.0, 10.0, 10.0), direction=(0.0, 0.0, -1.0))
+    body.add_feature(hole)
+    body.add_feature(PatternFeature(pattern_type="Linear", feature_id=hole.id, count=2, spacing=15.0))
+
+    stats = body._last_validation_stats
+    assert stats["full"]["calls"] > 0
+    # _safe_operation braucht nur SUBSHAPES; das Boolean-Ergebnis ist lokal validiert
+    assert stats["subshapes"]["calls"] > 0
+    assert stats["subshapes"]["cached"] > 0
@@ -0,0 +1,95 @@
+"""
+Tests für sketcher.open_contours (offene Konturen, gecacht pro Sketch-Revision).
+"""
+
+import pytest
+
+from sketcher import Sketch
+from sketcher.open_contours import OpenContourAnalysis
+from sketcher.profile_detector_b3d import Build123dProfileDetector
+
+
+def _ends(sketch):
+    return sorted((round(float(x), 6), round(float(y), 6)) for x, y in sketch.open_contours.open_ends)
+
+
+def test_closed_rectangle_has_no_open_ends():
+    sketch = Sketch()
+    sketch.add_rectangle(0, 0, 20, 10)
+
+    assert _ends(sketch) == []
+    assert not sketch.open_contours.has_odd_vertices(1e-4)
+
+
+def test_open_polyline_reports_both_ends():
+    sketch = Sketch()
+    sketch.add_line(0, 0, 10, 0)
+    sketch.add_line(10, 0, 10, 10)
+
+    assert _ends(sketch) == [(0.0, 0.0), (10.0, 10.0)]
+    assert sketch.open_contours.has_odd_vertices(1e-4)
+
+
+def test_t_junction_and_circle_close_endpoints():
+    sketch = Sketch()
+    sketch.add_line(0, 0, 100, 0)
+    sketch.add_line(50, 0, 50, 40)        # T-Kreuzung unten
+    sketch.add_circle(50, 50, 10)         # oberes Ende liegt auf dem Kreis
+
+    assert _ends(sketch) == [(0.0, 0.0), (100.0, 0.0)]
+
+
+def test_construction_and_suppressed_lines_are_ignored():
+    sketch = Sketch()
+    sketch.add_line(0, 0, 10, 0, construction=True)
+    hidden = sketch.add_line(100, 100, 110, 100)
+    hidden._suppress_endpoint_markers = True
+
+    assert _ends(sketch) == []
+
+
+def test_arc_endpoints_are_analysed():
+    sketch = Sketch()
+    sketch.add_arc(0, 0, 10, 0, 90)
+    sketch.add_line(10, 0, 0, 10)
+
+    assert _ends(sketch) == []
+
+    sketch.add_arc(100, 0, 10, 0, 90)
+    assert len(sketch.open_contours.open_ends) == 2
+
+
+def test_analysis_is_cached_per_revision():
+    sketch = Sketch()
+    sketch.add_line(0, 0, 10, 0)
+    first = sketch.open_contours
+
+    assert sketch.open_contours is first
+
+    sketch.add_line(10, 0, 0, 0)
+    assert sketch.open_contours is not first
+    assert not sketch.open_contours.has_open_ends
+
+
+def test_uncached_analysis_sees_moves_without_revision():
+    sketch = Sketch()
+    base = sketch.add_line(0, 0, 100, 0)
+    sketch.add_line(50, 0, 50, 40)
+    assert len(sketch.open_contours.open_ends) == 3
+
+    base.start.y = base.end.y = 30.0  # Drag ohne Revision
+    assert len(sketch.open_contours.open_ends) == 3
+    assert len(OpenContourAnalysis(sketch).open_ends) == 4
+
+
+@pytest.mark.parametrize("offset, expected", [(0.0, False), (2.0, True)])
+def test_detector_uses_shared_parity_check(offset, expected):
+    sketch = Sketch()
+    sketch.add_line(0, 0, 10, 0)
+    sketch.add_line(10, 0, 10, 10)
+    sketch.add_line(10, 10, 0, 10)
+    sketch.add_line(0, 10, 0, offset)
+
+    detector = Build123dProfileDetector()
+    assert detector._has_open_contours(sketch) is expected
+    assert sketch.open_contours._odd_cache == {float(detector.tolerance): expected}
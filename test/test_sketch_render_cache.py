@@ -0,0 +1,163 @@
+"""
+Tests für gui.sketch_render_cache (Retained-Mode Layer des Sketch-Renderers).
+"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from gui.sketch_editor import SketchEditor
+from gui.sketch_render_cache import (
+    build_constraint_anchors,
+    build_geometry_layers,
+    find_open_ends,
+    render_cache_key,
+    view_transform,
+)
+from sketcher import Sketch
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+@pytest.fixture
+def editor(qt_app):
+    instance = SketchEditor(parent=None)
+    instance.resize(400, 300)
+    instance.view_scale = 4.0
+    instance.view_offset = QPointF(200, 150)
+    yield instance
+    instance.close()
+    instance.deleteLater()
+    QApplication.processEvents()
+
+
+def _paint(editor):
+    image = QImage(editor.size(), QImage.Format_ARGB32)
+    editor.render(image)
+    return image
+
+
+@pytest.mark.parametrize("rotation", [0, 90, 180, 270])
+def test_view_transform_matches_world_to_screen(editor, rotation):
+    editor.view_rotation = rotation
+    xf = view_transform(editor.view_scale, editor.view_offset, rotation)
+
+    for wx, wy in [(0.0, 0.0), (12.5, -3.0), (-7.0, 40.0)]:
+        expected = editor.world_to_screen(QPointF(wx, wy))
+        mapped = xf.map(QPointF(wx, wy))
+        assert mapped.x() == pytest.approx(expected.x())
+        assert mapped.y() == pytest.approx(expected.y())
+
+
+def test_layers_split_by_style_and_collect_markers():
+    sketch = Sketch()
+    sketch.add_line(0, 0, 10, 0)
+    sketch.add_line(0, 0, 0, 10, construction=True)
+    sketch.add_circle(5, 5, 2)
+    sketch.add_arc(0, 0, 5, 0, 90)
+
+    layers = build_geometry_layers(sketch)
+
+    assert not layers.normal.isEmpty()
+    assert not layers.construction.isEmpty()
+    assert layers.fixed.isEmpty()
+    assert layers.endpoints.size() == 4
+    assert layers.arc_endpoints.size() == 2
+    # Welt-Koordinaten: Bounding-Box unabhängig von der View
+    assert layers.construction.boundingRect().height() == pytest.approx(10.0)
+
+
+def test_revision_and_entity_count_change_cache_key():
+    sketch = Sketch()
+    line = sketch.add_line(0, 0, 10, 0)
+    key = render_cache_key(sketch)
+
+    assert render_cache_key(sketch) == key
+
+    line.end.x = 20.0
+    sketch.invalidate_profiles()
+    assert render_cache_key(sketch) != key
+
+    key = render_cache_key(sketch)
+    sketch.lines.append(line)  # direkte Listen-Änderung ohne Revision
+    assert render_cache_key(sketch) != key
+
+
+def test_find_open_ends():
+    sketch = Sketch()
+    # Geschlossenes Dreieck + eine offene Linie mit T-Kreuzung am Start
+    sketch.add_line(0, 0, 10, 0)
+    sketch.add_line(10, 0, 0, 10)
+    sketch.add_line(0, 10, 0, 0)
+    sketch.add_line(5, 0, 5, -8)
+
+    open_ends = find_open_ends(sketch)
+
+    assert [(p.x(), p.y()) for p in open_ends] == [(5.0, -8.0)]
+
+
+def test_constraint_anchors_use_line_midpoints():
+    sketch = Sketch()
+    line = sketch.add_line(0, 0, 10, 0)
+    sketch.add_horizontal(line)
+
+    entries = build_constraint_anchors(sketch.constraints)
+
+    assert len(entries) == 1
+    _c, probes, anchors, _extra = entries[0]
+    assert anchors[0][0] == line.id
+    assert (anchors[0][1].x(), anchors[0][1].y()) == (5.0, 0.0)
+    assert probes[0][1] == 0.0
+
+
+def test_pan_reuses_paths_and_edit_rebuilds(editor):
+    for i in range(200):
+        editor.sketch.add_line(i, 0, i, 10)
+    editor.sketch.add_circle(0, 0, 5)
+
+    _paint(editor)
+    layers = editor._geometry_layer_cache
+    anchors = editor._constraint_anchor_cache
+    open_ends = editor._open_ends_cache
+
+    editor.view_offset = QPointF(250, 120)
+    editor.view_scale = 8.0
+    _paint(editor)
+
+    assert editor._geometry_layer_cache is layers
+    assert editor._constraint_anchor_cache is anchors
+    assert editor._open_ends_cache is open_ends
+
+    editor.sketch.add_line(0, 0, 50, 50)
+    _paint(editor)
+    assert editor._geometry_layer_cache is not layers
+
+
+def test_selection_overlay_does_not_rebuild_layers(editor):
+    line = editor.sketch.add_line(0, 0, 10, 0)
+    circle = editor.sketch.add_circle(0, 0, 3)
+    _paint(editor)
+    layers = editor._geometry_layer_cache
+
+    editor.selected_lines = [line]
+    editor.hovered_entity = circle
+    _paint(editor)
+    assert editor._geometry_layer_cache is layers
+
+    editor.hovered_entity = None
+    editor.selected_lines = []
+    _paint(editor)
+
+    assert editor._geometry_layer_cache is layers
@@ -0,0 +1,124 @@
+"""
+Tests für gui.sketch_snap_table (vorberechnete Snap-Punkte des SmartSnappers).
+"""
+
+import random
+
+from PySide6.QtCore import QPointF
+
+from gui.sketch_snap_table import SnapPointTable, sweep_pairs
+from gui.sketch_snapper import SmartSnapper
+from gui.sketch_tools import SketchTool, SnapType
+from sketcher.sketch import Sketch
+
+
+class _FakeEditor:
+    def __init__(self, sketch, snap_radius=15, view_scale=1.0):
+        self.sketch = sketch
+        self.snap_radius = snap_radius
+        self.view_scale = view_scale
+        self.current_tool = SketchTool.SELECT
+        self.grid_snap = False
+        self.grid_size = 1.0
+        self.spatial_index = None
+
+    def screen_to_world(self, p: QPointF) -> QPointF:
+        return QPointF(p.x(), p.y())
+
+
+def _table(sketch):
+    snapper = SmartSnapper(_FakeEditor(sketch))
+    table = SnapPointTable(snapper._calculate_intersections)
+    table.sync(sketch)
+    return table
+
+
+def test_sweep_pairs_matches_brute_force():
+    rng = random.Random(11)
+    boxes = []
+    for key in range(200):
+        x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+        boxes.append((key, (x, y, x + rng.uniform(0, 10), y + rng.uniform(0, 10))))
+
+    expected = {
+        (a, b) for a, ba in boxes for b, bb in boxes
+        if a < b and ba[0] <= bb[2] and bb[0] <= ba[2] and ba[1] <= bb[3] and bb[1] <= ba[3]
+    }
+    found = {tuple(sorted(pair)) for pair in sweep_pairs(boxes)}
+
+    assert found == expected
+
+
+def test_table_contains_fixed_points_and_real_intersections():
+    sketch = Sketch()
+    sketch.add_line(0, 0, 100, 0)
+    sketch.add_line(50, -50, 50, 50)
+    sketch.add_line(200, 0, 300, 0)  # nur virtueller Schnitt mit der Vertikalen
+    sketch.add_circle(50, 0, 10)
+
+    table = _table(sketch)
+
+    types = [hit[3] for hit in table.query_points(50.0, 0.0, 0.5)]
+    assert types.count(SnapType.INTERSECTION) == 1
+    assert SnapType.CENTER in types
+    assert table.query_points(50.0, 10.0, 0.5)[0][3] == SnapType.QUADRANT
+    assert all(hit[3] != SnapType.INTERSECTION for hit in table.query_points(250.0, 0.0, 60.0))
+
+
+def test_table_updates_only_changed_entities():
+    sketch = Sketch()
+    a = sketch.add_line(0, 0, 100, 0)
+    b = sketch.add_line(50, -50, 50, 50)
+    table = _table(sketch)
+    calls = []
+    table._intersect = lambda e1, e2: calls.append((e1, e2)) or []
+
+    b.start.x = b.end.x = 70.0
+    sketch.invalidate_profiles()
+    table.sync(sketch)
+
+    assert len(calls) == 1
+    assert all(hit[3] != SnapType.INTERSECTION for hit in table.query_points(50.0, 0.0, 1.0))
+    assert {hit[3] for hit in table.query_points(70.0, 50.0, 1.0)} == {SnapType.ENDPOINT}
+    assert any(hit[4] is a for hit in table.query_points(0.0, 0.0, 1.0))
+
+
+def test_edge_projection_for_lines_and_circles():
+    sketch = Sketch()
+    line = sketch.add_line(0, 0, 100, 0)
+    circle = sketch.add_circle(200, 0, 10)
+    table = _table(sketch)
+
+    dist, x, y, entity = table.query_edges(40.0, 2.0, 5.0)[0]
+    assert entity is line and (x, y) == (40.0, 0.0) and dist == 2.0
+
+    dist, x, y, entity = table.query_edges(200.0, 13.0, 5.0)[0]
+    assert entity is circle and abs(y - 10.0) < 1e-12
+
+
+def test_dense_sketch_keeps_intersection_snapping():
+    sketch = Sketch()
+    for i in range(120):
+        sketch.add_line(0.0, i * 0.1, 100.0, i * 0.1)
+    sketch.add_line(50.3, -10.0, 50.3, 80.0)
+    editor = _FakeEditor(sketch)
+    editor.spatial_index = sketch.spatial_index
+    snapper = SmartSnapper(editor)
+
+    result = snapper.snap(QPointF(50.3, 6.02))
+
+    # Mehr nahe Entities als MAX_INTERSECTION_ENTITIES: früher kein Schnitt-Snap
+    assert snapper._is_dense_context
+    assert result.type == SnapType.INTERSECTION
+    assert abs(result.point.y() - 6.0) < 1e-9
+
+
+def test_snapper_follows_editor_sketch_replacement():
+    editor = _FakeEditor(Sketch())
+    snapper = SmartSnapper(editor)
+    assert snapper.snap(QPointF(110.0, 100.0)).type == SnapType.NONE
+
+    editor.sketch = Sketch()
+    editor.sketch.add_line(100, 100, 110, 100)
+
+    assert snapper.snap(QPointF(110.0, 100.5)).type == SnapType.ENDPOINT
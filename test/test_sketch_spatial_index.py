@@ -0,0 +1,137 @@
+"""
+Tests für sketcher.spatial_index (inkrementeller Spatial-Index am Sketch).
+"""
+
+import random
+
+import pytest
+
+from sketcher import Sketch
+from sketcher.operations.extend import ExtendOperation
+from sketcher.operations.trim import TrimOperation
+from sketcher.spatial_index import KINDS_CURVES, KINDS_LINE, SketchSpatialIndex, entity_bounds
+
+
+def _brute_force(sketch, x0, y0, x1, y1):
+    hits = []
+    for entity in (*sketch.points, *sketch.lines, *sketch.circles, *sketch.arcs):
+        b = entity_bounds(entity)
+        if b[0] <= x1 and b[2] >= x0 and b[1] <= y1 and b[3] >= y0:
+            hits.append(id(entity))
+    return sorted(hits)
+
+
+def test_query_matches_brute_force():
+    rng = random.Random(7)
+    sketch = Sketch()
+    for _ in range(300):
+        x, y = rng.uniform(-200, 200), rng.uniform(-200, 200)
+        sketch.add_line(x, y, x + rng.uniform(-30, 30), y + rng.uniform(-30, 30))
+    for _ in range(30):
+        sketch.add_circle(rng.uniform(-200, 200), rng.uniform(-200, 200), rng.uniform(1, 80))
+    sketch.add_arc(0, 0, 500, 0, 45)  # Oversize-Eintrag
+
+    index = sketch.spatial_index
+    for _ in range(50):
+        x, y = rng.uniform(-250, 250), rng.uniform(-250, 250)
+        w, h = rng.uniform(0, 120), rng.uniform(0, 120)
+        found = sorted(id(e) for e in index.query_bounds(x, y, x + w, y + h))
+        assert found == _brute_force(sketch, x, y, x + w, y + h)
+
+
+def test_adds_stay_incremental_and_in_sync():
+    sketch = Sketch()
+    sketch.add_line(0, 0, 10, 0)
+    index = sketch.spatial_index
+
+    line = sketch.add_line(10, 0, 10, 10)
+    circle = sketch.add_circle(50, 50, 5)
+
+    assert sketch._spatial_revision == sketch.revision
+    assert sketch.spatial_index is index
+    assert line in index and circle in index and circle.center in index
+    assert len(index) == len(sketch.points) + len(sketch.lines) + len(sketch.circles)
+
+
+def test_sync_picks_up_moves_deletes_and_direct_appends():
+    sketch = Sketch()
+    line = sketch.add_line(0, 0, 10, 0)
+    other = sketch.add_line(100, 100, 110, 100)
+    index = sketch.spatial_index
+
+    line.end.x = 500.0
+    sketch.invalidate_profiles()
+    assert line in sketch.spatial_index.query_bounds(499, -1, 501, 1)
+
+    sketch.delete_line(other)
+    assert other not in sketch.spatial_index
+
+    circle = sketch.add_circle(0, 0, 1)
+    sketch.circles.remove(circle)  # direkte Listen-Änderung ohne Revision
+    assert circle not in sketch.spatial_index
+    assert sketch.spatial_index is index
+
+
+def test_query_segment_walks_cells():
+    sketch = Sketch()
+    hit = sketch.add_line(50, -5, 50, 5)
+    sketch.add_line(50, 20, 50, 30)
+    sketch.add_line(-50, -5, -50, 5)
+
+    found = sketch.spatial_index.query_segment(0, 0, 1000, 0, kinds=KINDS_LINE)
+
+    assert found == [hit]
+
+
+def test_find_helpers_use_index_and_keep_order():
+    sketch = Sketch()
+    first = sketch.add_line(0, 0, 10, 0)
+    sketch.add_line(0, 0.5, 10, 0.5)
+
+    assert sketch.find_line_at(5, 0.2, tolerance=1.0) is first
+    assert sketch.find_point_at(10.2, 0.1, tolerance=1.0) is first.end
+    assert sketch.find_line_at(500, 500) is None
+
+
+def test_add_line_reuses_existing_points():
+    sketch = Sketch()
+    a = sketch.add_line(0, 0, 10, 0)
+    b = sketch.add_line(10.3, 0.2, 10, 10)
+
+    assert b.start is a.end
+    assert len(sketch.points) == 3
+
+
+def test_curve_query_excludes_points():
+    sketch = Sketch()
+    sketch.add_point(1, 1)
+    circle = sketch.add_circle(1, 1, 2)
+
+    assert sketch.spatial_index.query((0, 0, 2, 2), kinds=KINDS_CURVES) == [circle]
+
+
+def test_trim_and_extend_use_local_candidates():
+    sketch = Sketch()
+    target = sketch.add_line(0, 0, 100, 0)
+    sketch.add_line(50, -10, 50, 10)
+    wall = sketch.add_line(200, -10, 200, 10)
+    for i in range(100):
+        sketch.add_line(1000 + i, 500, 1000 + i, 510)
+
+    trim = TrimOperation(sketch)
+    candidates = trim._get_candidate_entities(target)
+    assert wall not in candidates and len(candidates) == 2
+
+    result = trim.find_segment(target, sketch.points[0])
+    assert result.success
+
+    ext = ExtendOperation(sketch).find_extension(target, 95, 0)
+    assert ext.success and ext.data.new_point.x == pytest.approx(wall.start.x)
+
+
+def test_auto_cell_size_follows_entity_size():
+    sketch = Sketch()
+    for i in range(20):
+        sketch.add_line(i * 10, 0, i * 10 + 2, 0)
+
+    assert SketchSpatialIndex.from_sketch(sketch).cell_size == pytest.approx(2.0)
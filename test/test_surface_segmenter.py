@@ -0,0 +1,69 @@
+"""
+Tests für SurfaceSegmenter (Region-Growing Segmentierung).
+"""
+
+import numpy as np
+import pytest
+
+pv = pytest.importorskip("pyvista")
+
+from meshconverter.surface_segmenter import SurfaceSegmenter
+
+
+def _cell_sets(regions):
+    return sorted(tuple(r.cell_ids.tolist()) for r in regions)
+
+
+class TestRegionGrowing:
+    def test_box_gives_six_planar_regions(self):
+        mesh = pv.Box(level=2).triangulate()
+
+        regions = SurfaceSegmenter().segment(mesh)
+
+        assert len(regions) == 6
+        assert sum(len(r.cell_ids) for r in regions) == mesh.n_cells
+        for region in regions:
+            assert np.isclose(np.abs(region.normal).max(), 1.0)
+            assert region.boundary_points is not None
+
+    def test_matches_hierarchical_on_small_mesh(self):
+        mesh = pv.Cylinder(resolution=32).triangulate()
+
+        grown = SurfaceSegmenter(method="region_growing").segment(mesh.copy())
+        clustered = SurfaceSegmenter(method="hierarchical").segment(mesh.copy())
+
+        assert _cell_sets(grown) == _cell_sets(clustered)
+
+    def test_large_mesh_is_deterministic_at_full_resolution(self):
+        mesh = pv.Sphere(theta_resolution=90, phi_resolution=90).triangulate()
+        assert mesh.n_cells > SurfaceSegmenter.HIERARCHICAL_MAX_CELLS
+
+        first = SurfaceSegmenter(method="hierarchical").segment(mesh.copy(), merge_coplanar=False)
+        second = SurfaceSegmenter(method="hierarchical").segment(mesh.copy(), merge_coplanar=False)
+
+        assert _cell_sets(first) == _cell_sets(second)
+        assert sum(len(r.cell_ids) for r in first) == mesh.n_cells
+
+    def test_curvature_threshold_stops_growth_at_sharp_edges(self):
+        mesh = pv.Box(level=1).triangulate()
+
+        # 100° Normalen-Toleranz würde über die 90°-Kanten wachsen ...
+        loose = SurfaceSegmenter(angle_tolerance=100).segment(mesh.copy(), merge_coplanar=False)
+        # ... eine Knick-Schwelle von 45° hält jede Box-Seite getrennt
+        strict = SurfaceSegmenter(angle_tolerance=100, curvature_threshold=45).segment(
+            mesh.copy(), merge_coplanar=False
+        )
+
+        assert len(loose) < 6
+        assert len(strict) == 6
+
+    def test_gauss_map_buckets_group_parallel_normals(self):
+        normals = np.array([[0, 0, 1], [1, 0, 0], [0, 0, 1], [0, 1, 0], [1, 0, 0]], dtype=float)
+
+        buckets = SurfaceSegmenter._gauss_map_buckets(normals, np.radians(5))
+
+        assert buckets.tolist() == [0, 1, 0, 2, 1]
+
+    def test_unknown_method_raises(self):
+        with pytest.raises(ValueError):
+            SurfaceSegmenter(method="kmeans")
@@ -0,0 +1,118 @@
+"""
+Tests für den location-invarianten Tessellierungs-Cache (CADTessellator):
+Move/Rotate/Mirror platzieren das gecachte Mesh statt neu zu tessellieren.
+"""
+
+import numpy as np
+import pytest
+from build123d import Box, Cylinder
+
+from modeling import Body, TransformFeature
+from modeling.cad_tessellator import CADTessellator
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tessellator():
+    CADTessellator.clear_cache()
+    yield
+    CADTessellator.clear_cache()
+
+
+def _part():
+    return Box(40, 30, 20) - Cylinder(5, 40)
+
+
+def _transform(solid, mode, **data):
+    return Body("transform")._apply_transform_feature(solid, TransformFeature(mode=mode, data=data))
+
+
+def _count_tessellations(monkeypatch):
+    runs = []
+    original = CADTessellator._compute_face_ids
+    monkeypatch.setattr(CADTessellator, "_compute_face_ids",
+                        staticmethod(lambda *a: runs.append(a) or original(*a)))
+    return runs
+
+
+def _outward_ratio(mesh):
+    normals = mesh.compute_normals(cell_normals=True, point_normals=False, split_vertices=False,
+                                   auto_orient_normals=False, consistent_normals=False).cell_data["Normals"]
+    centers = mesh.cell_centers().points
+    return float(np.mean(np.sign(np.sum(normals * (centers - mesh.center), axis=1))))
+
+
+def test_moved_body_reuses_cached_mesh(monkeypatch):
+    runs = _count_tessellations(monkeypatch)
+    part = _part()
+    mesh, edges, info = CADTessellator.tessellate_with_face_ids(part, quality=0.5)
+
+    moved = _transform(part, "move", translation=[100.0, 0.0, 5.0])
+    moved_mesh, moved_edges, moved_info = CADTessellator.tessellate_with_face_ids(moved, quality=0.5)
+
+    assert len(runs) == 1
+    assert np.allclose(moved_mesh.points, mesh.points + [100.0, 0.0, 5.0], atol=1e-4)
+    assert np.allclose(moved_edges.points, edges.points + [100.0, 0.0, 5.0], atol=1e-4)
+    assert np.array_equal(moved_mesh.cell_data["face_id"], mesh.cell_data["face_id"])
+    assert moved_info[0]["center"] == pytest.approx(np.add(info[0]["center"], [100.0, 0.0, 5.0]))
+
+
+def test_placement_does_not_touch_cached_mesh():
+    part = _part()
+    first, _, _ = CADTessellator.tessellate_with_face_ids(part, quality=0.5)
+    before = np.array(first.points)
+
+    CADTessellator.tessellate_with_face_ids(_transform(part, "move", translation=[10.0, 0.0, 0.0]), quality=0.5)
+    again, _, _ = CADTessellator.tessellate_with_face_ids(part, quality=0.5)
+
+    assert np.array_equal(again.points, before)
+
+
+def test_rotated_body_matches_fresh_tessellation(monkeypatch):
+    part = _part()
+    CADTessellator.tessellate_with_face_ids(part, quality=0.5)
+    rotated = _transform(part, "rotate", axis="Z", angle=90.0, center=[5.0, 0.0, 0.0])
+
+    placed, _, placed_info = CADTessellator.tessellate_with_face_ids(rotated, quality=0.5)
+    CADTessellator.clear_cache()
+    fresh, _, fresh_info = CADTessellator.tessellate_with_face_ids(rotated, quality=0.5)
+
+    assert placed.bounds == pytest.approx(fresh.bounds, abs=1e-4)
+    for face_id, info in fresh_info.items():
+        assert placed_info[face_id]["normal"] == pytest.approx(info["normal"], abs=1e-6)
+        assert placed_info[face_id]["center"] == pytest.approx(info["center"], abs=1e-6)
+        assert placed_info[face_id]["hash"] == info["hash"]
+
+
+def test_mirrored_body_reuses_source_mesh_with_flipped_winding(monkeypatch):
+    runs = _count_tessellations(monkeypatch)
+    part = _part()
+    mesh, _, _ = CADTessellator.tessellate_with_face_ids(part, quality=0.5)
+
+    mirrored = _transform(part, "mirror", plane="YZ")
+    assert not mirrored.wrapped.TShape() == part.wrapped.TShape()  # Spiegelung kopiert Geometrie
+    placed, _, _ = CADTessellator.tessellate_with_face_ids(mirrored, quality=0.5)
+
+    assert len(runs) == 1
+    assert np.allclose(placed.points, mesh.points * [-1.0, 1.0, 1.0], atol=1e-4)
+    assert _outward_ratio(placed) == pytest.approx(_outward_ratio(mesh))
+
+
+def test_display_tessellate_is_location_invariant():
+    part = _part()
+    mesh, edges = CADTessellator.tessellate(part, quality=0.5)
+    moved_mesh, moved_edges = CADTessellator.tessellate(_transform(part, "move", translation=[0.0, 50.0, 0.0]),
+                                                        quality=0.5)
+
+    assert len(CADTessellator._mesh_cache) == 1
+    assert np.allclose(moved_mesh.points, mesh.points + [0.0, 50.0, 0.0], atol=1e-4)
+    assert np.allclose(moved_mesh.point_data["Normals"], mesh.point_data["Normals"], atol=1e-5)
+    assert np.allclose(moved_edges.points, edges.points + [0.0, 50.0, 0.0], atol=1e-4)
+
+
+def test_transform_feature_modes():
+    part = Box(10, 20, 30)
+
+    assert _transform(part, "move", translation=[5.0, 0.0, 0.0]).center().X == pytest.approx(5.0)
+    assert _transform(part, "rotate", axis="Z", angle=90.0).bounding_box().size.X == pytest.approx(20.0)
+    assert _transform(part, "scale", factor=2.0).volume == pytest.approx(8 * part.volume)
+    assert _transform(part, "mirror", plane="XY").volume == pytest.approx(part.volume)
@@ -0,0 +1,152 @@
+"""
+Tests für kosmetische Gewinde und den ThreadToolCache (kanonische Werkzeuge,
+Platzierung per Location, Helix-Streifen, echte Gewinde erst beim Export).
+"""
+
+import numpy as np
+import pytest
+
+from modeling import Body, HoleFeature, PrimitiveFeature, ThreadFeature
+from modeling.shape_validation import clear_validation_cache, known_self_intersection_free
+from modeling.thread_tools import (
+    ThreadToolCache,
+    cosmetic_thread_lines,
+    place_thread_tool,
+    thread_groove_depth,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    ThreadToolCache.clear()
+    clear_validation_cache()
+    yield
+    ThreadToolCache.clear()
+    clear_validation_cache()
+
+
+def _threaded_cylinder():
+    body = Body("bolt")
+    body.add_feature(PrimitiveFeature(primitive_type="cylinder", radius=5.0, height=20.0))
+    thread = ThreadFeature(
+        thread_type="external", diameter=10.0, pitch=1.5, depth=12.0,
+        position=(0.0, 0.0, 2.0), direction=(0.0, 0.0, 1.0),
+    )
+    body.add_feature(thread)
+    return body, thread
+
+
+def test_cache_returns_shared_tool_and_placements_share_tshape():
+    tool = ThreadToolCache.get(10.0, 1.5, 12.0, "external")
+
+    assert ThreadToolCache.get(10.0, 1.5, 12.0, "external") is tool
+    assert ThreadToolCache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    a = place_thread_tool(tool, (0.0, 0.0, 0.0), (0.0, 0.0, 1.0))
+    b = place_thread_tool(tool, (30.0, 5.0, 0.0), (1.0, 0.0, 0.0))
+    assert a.wrapped.TShape() == b.wrapped.TShape() == tool.wrapped.TShape()
+    assert b.center().X == pytest.approx(tool.center().Z + 30.0, abs=1e-6)
+    assert b.volume == pytest.approx(tool.volume, rel=1e-9)
+
+
+def test_canonical_tool_is_registered_as_self_intersection_free():
+    from OCP.TopLoc import TopLoc_Location
+
+    tool = ThreadToolCache.get(10.0, 1.5, 12.0, "external")
+    placed = place_thread_tool(tool, (30.0, 5.0, 0.0), (1.0, 0.0, 0.0))
+
+    assert known_self_intersection_free(placed.wrapped.Located(TopLoc_Location()))
+    assert not known_self_intersection_free(placed.wrapped)  # nur location-frei hinterlegt
+
+
+def test_key_distinguishes_type_and_dimensions():
+    base = ThreadToolCache.get(10.0, 1.5, 12.0, "external")
+
+    assert ThreadToolCache.get(10.0, 1.5, 12.0, "internal") is not base
+    assert ThreadToolCache.get(10.0, 1.25, 12.0, "external") is not base
+    assert ThreadToolCache.stats()["entries"] == 3
+
+
+def test_tolerance_offset_shares_the_sweep():
+    body, thread = _threaded_cylinder()
+    loose = ThreadFeature(
+        thread_type="external", diameter=10.0, pitch=1.5, depth=12.0,
+        position=(0.0, 0.0, 2.0), direction=(0.0, 0.0, 1.0), tolerance_offset=-0.042,
+    )
+
+    body._thread_tool(thread, body._build123d_solid)
+    body._thread_tool(loose, body._build123d_solid)
+
+    assert ThreadToolCache.stats()["entries"] == 1
+
+
+def test_cosmetic_lines_lie_on_minor_and_major_radius():
+    position, axis = np.array([1.0, 2.0, 3.0]), np.array([0.0, 1.0, 0.0])
+    lines = cosmetic_thread_lines([(position, axis, 10.0, 1.5, 12.0)])
+
+    rel = lines.points - position
+    radial = np.linalg.norm(rel - np.outer(rel @ axis, axis), axis=1)
+    half = lines.n_points // 2
+    assert lines.n_lines == 2
+    assert radial[:half] == pytest.approx(5.0 - thread_groove_depth(1.5))
+    assert radial[half:] == pytest.approx(5.0)
+    assert (rel @ axis).min() == pytest.approx(0.0)
+    assert (rel @ axis).max() == pytest.approx(12.0)
+    assert cosmetic_thread_lines([]) is None
+
+
+def test_cosmetic_thread_keeps_brep_and_draws_overlay():
+    body, thread = _threaded_cylinder()
+
+    assert thread.status == "COSMETIC"
+    assert body._build123d_solid.volume == pytest.approx(np.pi * 25.0 * 20.0, rel=1e-6)
+    assert body.vtk_cosmetic_lines.n_lines == 2
+
+
+def test_export_solid_has_real_threads_and_is_cached():
+    from modeling.export_kernel import export_solid
+
+    body, _ = _threaded_cylinder()
+    base_volume = body._build123d_solid.volume
+
+    threaded = export_solid(body)
+    assert threaded.volume < base_volume - 1.0
+    assert body._build123d_solid.volume == pytest.approx(base_volume)
+    assert body._get_solid_with_threads() is threaded
+
+    body.invalidate_mesh()
+    assert body._threaded_solid_cache is None
+    assert ThreadToolCache.stats()["misses"] == 1
+
+
+def test_internal_thread_cuts_into_hole_wall():
+    from modeling.export_kernel import export_solid
+
+    body = Body("nut")
+    body.add_feature(PrimitiveFeature(primitive_type="box", length=30.0, width=30.0, height=10.0))
+    body.add_feature(HoleFeature(hole_type="simple", diameter=8.0, depth=0.0,
+                                 position=(15.0, 15.0, 10.0), direction=(0.0, 0.0, -1.0)))
+    body.add_feature(ThreadFeature(
+        thread_type="internal", diameter=8.0, pitch=1.25, depth=8.0,
+        position=(15.0, 15.0, 1.0), direction=(0.0, 0.0, 1.0),
+    ))
+    base_volume = body._build123d_solid.volume
+
+    assert export_solid(body).volume < base_volume - 10.0
+
+
+@pytest.mark.parametrize("n_bodies", [1, 2])
+def test_document_step_export_writes_real_threads(tmp_path, n_bodies):
+    from modeling.document import Document
+    from modeling.step_io import STEPReader
+
+    doc = Document("threads")
+    for _ in range(n_bodies):
+        doc.add_body(_threaded_cylinder()[0])
+    path = tmp_path / "threads.step"
+
+    assert doc.export_step(str(path))
+    imported = STEPReader.import_file(str(path), auto_heal=False)
+    assert imported.success, imported.errors
+    volume = sum(solid.volume for solid in imported.solids)
+    assert volume < n_bodies * (np.pi * 25.0 * 20.0 - 1.0)
@@ -54,6 +54,7 @@ class _FakeActor:
 class _FakeMesh:
     def __init__(self, n_points=5000):
         self.n_points = n_points
+        self.n_cells = 2 * n_points
         self.bounds = (0.0, 1.0, 0.0, 1.0, 0.0, 1.0)
 
 
@@ -103,6 +104,17 @@ class _FakeInteractor:
         return 600
 
 
+class _FakePyramidCache:
+    def __init__(self):
+        self.pyramids = {}
+
+    def get(self, body_id, mesh):
+        pyramid = self.pyramids.get(body_id)
+        if pyramid is None or pyramid.levels[0] is not mesh:
+            return None
+        return pyramid
+
+
 def _make_dummy_viewport():
     renderer = _FakeRenderer(
         {
@@ -115,10 +127,10 @@ def _make_dummy_viewport():
     vp = SimpleNamespace()
     vp.plotter = plotter
     vp._lod_enabled = True
-    vp._lod_quality_high = 0.01
-    vp._lod_quality_interaction = 0.05
     vp._lod_min_points = 2500
-    vp._lod_applied_quality = {}
+    vp._lod_cells_per_px2 = 0.5
+    vp._lod_applied_level = {}
+    vp._lod_pyramids = _FakePyramidCache()
     vp._section_view_enabled = False
     vp._section_plane = "XY"
     vp._section_position = 0.0
@@ -141,6 +153,7 @@ def _make_dummy_viewport():
     vp._get_camera_aspect_ratio = PyVistaViewport._get_camera_aspect_ratio.__get__(vp, object)
     vp._get_viewport_pixel_size = PyVistaViewport._get_viewport_pixel_size.__get__(vp, object)
     vp._estimate_projected_radius_px = PyVistaViewport._estimate_projected_radius_px.__get__(vp, object)
+    vp._estimate_body_radius_px = PyVistaViewport._estimate_body_radius_px.__get__(vp, object)
     vp._is_bounds_in_camera_frustum = PyVistaViewport._is_bounds_in_camera_frustum.__get__(vp, object)
     vp._apply_frustum_culling = PyVistaViewport._apply_frustum_culling.__get__(vp, object)
     vp._apply_lod_mesh_to_actor = PyVistaViewport._apply_lod_mesh_to_actor.__get__(vp, object)
@@ -151,28 +164,51 @@ def _make_dummy_viewport():
     return vp
 
 
-def test_lod_switches_interaction_and_restore_quality(monkeypatch):
+def test_lod_switches_to_pyramid_level_and_restores_full_mesh(monkeypatch):
+    from gui.viewport.lod_pyramid import LodPyramid
+
     vp = _make_dummy_viewport()
     monkeypatch.setattr(viewport_mod, "HAS_PYVISTA", True)
+    monkeypatch.setattr(viewport_mod, "request_render", lambda *_args, **_kwargs: None)
 
-    quality_calls = []
-
-    def _fake_tessellate_with_face_ids(_solid, quality=None):
-        quality_calls.append(quality)
-        mesh = _FakeMesh(n_points=1500 if quality >= 0.05 else 6500)
-        return mesh, _FakeMesh(n_points=300), {}
+    def _no_tessellation(*_args, **_kwargs):
+        raise AssertionError("LOD must not re-tessellate")
 
     from modeling.cad_tessellator import CADTessellator
 
-    monkeypatch.setattr(CADTessellator, "tessellate_with_face_ids", staticmethod(_fake_tessellate_with_face_ids))
-    monkeypatch.setattr(viewport_mod, "request_render", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(CADTessellator, "tessellate_with_face_ids", staticmethod(_no_tessellation))
+
+    source = vp.bodies["b1"]["mesh"]
+    coarse = _FakeMesh(n_points=400)
+    pyramid = LodPyramid([source, coarse])
+    # Body (~43 px Radius) -> Budget ~580 Zellen, Stufe 1 reicht
+    vp._lod_cells_per_px2 = 0.1
+    vp._lod_pyramids.pyramids["b1"] = pyramid
+    mapper = vp.plotter.renderer.actors["body_b1_m"].GetMapper()
+    edge_mapper = vp.plotter.renderer.actors["body_b1_e"].GetMapper()
 
     vp._apply_lod_to_visible_bodies(interaction_active=True)
+
+    assert mapper.input_data is coarse
+    assert vp._lod_applied_level["b1"] == 1
+    assert edge_mapper.input_data is None
+
     vp._apply_lod_to_visible_bodies(interaction_active=False)
 
-    assert quality_calls == [0.05, 0.01]
-    assert vp._lod_applied_quality["b1"] == 0.01
-    assert vp.bodies["b1"]["mesh"].n_points == 6500
+    assert mapper.input_data is source
+    assert vp._lod_applied_level["b1"] == 0
+    assert vp.bodies["b1"]["mesh"] is source
+
+
+def test_lod_keeps_full_mesh_while_pyramid_is_pending(monkeypatch):
+    vp = _make_dummy_viewport()
+    monkeypatch.setattr(viewport_mod, "HAS_PYVISTA", True)
+    monkeypatch.setattr(viewport_mod, "request_render", lambda *_args, **_kwargs: None)
+
+    vp._apply_lod_to_visible_bodies(interaction_active=True)
+
+    assert vp.plotter.renderer.actors["body_b1_m"].GetMapper().input_data is None
+    assert "b1" not in vp._lod_applied_level
 
 
 def test_lod_camera_end_emits_view_and_starts_restore_timer():
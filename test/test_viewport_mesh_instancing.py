@@ -92,7 +92,7 @@ def _make_viewport_stub():
         detector=SimpleNamespace(selection_faces=[]),
         _section_view_enabled=False,
         _pending_body_refs={},
-        _lod_applied_quality={},
+        _lod_applied_level={},
         _frustum_culled_body_ids=set(),
         _apply_frustum_culling=lambda force=False: 0,
     )